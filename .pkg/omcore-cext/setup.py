@@ -43,6 +43,11 @@ st.setup(
             sources=['omcore/dispatch/_methods.cc'],
             extra_compile_args=['-std=c++20'],
         ),
+        st.Extension(
+            name='omcore.io.streambufs._scanning',
+            sources=['omcore/io/streambufs/_scanning.cc'],
+            extra_compile_args=['-std=c++20'],
+        ),
         st.Extension(
             name='omcore.lang._asyncs',
             sources=['omcore/lang/_asyncs.cc'],
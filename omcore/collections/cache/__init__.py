@@ -6,12 +6,25 @@ from .descriptor import (  # noqa
 )
 
 from .impl import (  # noqa
+    EvictionPolicy,
     LFU,
     LRI,
     LRU,
     new_cache,
 )
 
+from .loading import (  # noqa
+    LoadingCache,
+)
+
+from .sharded import (  # noqa
+    new_sharded_cache,
+)
+
+from .tinylfu import (  # noqa
+    WTinyLfu,
+)
+
 from .types import (  # noqa
     Cache,
     Eviction,
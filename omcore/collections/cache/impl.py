@@ -1,12 +1,11 @@
 """
 TODO:
- - dogpile
  - midpoint/arc
- - heapq/etc powered lfu
  - thread scoped?
  - __sizeof__ interop
  - further cythonize hot path?
 """
+import abc
 import collections
 import contextlib
 import functools
@@ -50,6 +49,32 @@ def LFU(cache: 'Cache') -> None:  # noqa
     cache._kill(cache._root.lfu_prev)  # type: ignore  # noqa
 
 
+class EvictionPolicy(lang.Abstract):
+    """
+    An eviction which keeps state of its own, notified of accesses and insertions. Unlike the plain eviction functions
+    above an instance belongs to a single cache and must not be shared - `clone` returns a new, unused instance of the
+    same configuration.
+
+    All methods are called with the cache lock held.
+    """
+
+    @abc.abstractmethod
+    def clone(self) -> EvictionPolicy:
+        raise NotImplementedError
+
+    def record_access(self, cache: CacheImpl, cache_key: ta.Any) -> None:
+        """Called on every lookup and insertion of the given key, whether or not it is present."""
+
+    def on_insert(self, cache: CacheImpl, link: CacheImpl.Link) -> None:
+        """Called after the given link has been inserted."""
+
+    @abc.abstractmethod
+    def __call__(self, cache: CacheImpl) -> None:
+        """Called while the cache is full - must evict at least one link."""
+
+        raise NotImplementedError
+
+
 class CacheImpl(Cache[K, V]):
     """https://google.github.io/guava/releases/16.0/api/docs/com/google/common/cache/CacheBuilder.html"""
 
@@ -159,6 +184,7 @@ class CacheImpl(Cache[K, V]):
         self._lock = lang.default_lock(lock, True)
         self._raise_overweight = raise_overweight
         self._eviction = eviction
+        self._policy = eviction if isinstance(eviction, EvictionPolicy) else None
         self._track_frequency = track_frequency if track_frequency is not None else (eviction is LFU)
 
         if weak_keys and not identity_keys:
@@ -173,6 +199,10 @@ class CacheImpl(Cache[K, V]):
         if self._track_frequency:
             self._root.lfu_next = self._root.lfu_prev = self._root
 
+        # The lfu list is ordered by descending hits, so links of equal hits are contiguous - this maps each hit count
+        # present to the frontmost link having it, allowing a link to be moved up a group in constant time.
+        self._lfu_heads: dict[int, CacheImpl.Link] = {}
+
         weak_dead: collections.deque[CacheImpl.Link] | None
         if weak_keys or weak_values:
             weak_dead = collections.deque()
@@ -206,6 +236,8 @@ class CacheImpl(Cache[K, V]):
         link.lru_next = link.lru_prev = link
 
         if self._track_frequency:
+            self._lfu_unhead(link)
+
             link.lfu_prev.lfu_next = link.lfu_next
             link.lfu_next.lfu_prev = link.lfu_prev
             link.lfu_next = link.lfu_prev = link
@@ -221,6 +253,17 @@ class CacheImpl(Cache[K, V]):
         link.key = link.value = None
         link.unlinked = True
 
+    def _lfu_unhead(self, link: Link) -> None:
+        """If the given link heads its hit count group, passes that on to the next link or drops the group."""
+
+        heads = self._lfu_heads
+        if heads.get(h := link.hits) is link:
+            nxt = link.lfu_next
+            if nxt is not self._root and nxt.hits == h:
+                heads[h] = nxt
+            else:
+                del heads[h]
+
     def _kill(self, link: Link) -> None:
         if link is self._root:
             raise RuntimeError
@@ -321,6 +364,9 @@ class CacheImpl(Cache[K, V]):
         with self._lock():
             self._reap()
 
+            if self._policy is not None:
+                self._policy.record_access(self, id(key) if self._identity_keys else key)
+
             try:
                 link, value = self._get_link(key)
             except KeyError:
@@ -337,11 +383,14 @@ class CacheImpl(Cache[K, V]):
                 link.lru_next = self._root
 
             if self._track_frequency:
-                lfu_pos = link.lfu_prev
-                while lfu_pos is not self._root and lfu_pos.hits <= link.hits:
-                    lfu_pos = lfu_pos.lfu_prev
+                # Move the link to the back of the next higher hit count group - that is, directly in front of what was
+                # the head of its own group.
+                heads = self._lfu_heads
+                lfu_pos = heads[link.hits]
+                if lfu_pos is link:
+                    self._lfu_unhead(link)
 
-                if link.lfu_prev is not lfu_pos:
+                else:
                     link.lfu_prev.lfu_next = link.lfu_next
                     link.lfu_next.lfu_prev = link.lfu_prev
 
@@ -350,6 +399,9 @@ class CacheImpl(Cache[K, V]):
                     link.lfu_prev = lfu_last
                     link.lfu_next = lfu_pos
 
+                if link.hits + 1 not in heads:
+                    heads[link.hits + 1] = link
+
             link.accessed = self._clock()
             link.hits += 1
             self._hits += 1
@@ -386,6 +438,11 @@ class CacheImpl(Cache[K, V]):
         with self._lock():
             self._reap()
 
+            cache_key: ta.Any = id(key) if self._identity_keys else key
+
+            if self._policy is not None:
+                self._policy.record_access(self, cache_key)
+
             if self._max_weight is not None and weight > self._max_weight:
                 if self._raise_overweight:
                     raise OverweightError
@@ -415,11 +472,8 @@ class CacheImpl(Cache[K, V]):
             link.key = make_ref(key, self._weak_keys)
             link.value = make_ref(value, self._weak_values)
 
-            cache_key: ta.Any
             if self._identity_keys:
-                link.cache_key = cache_key = id(key)
-            else:
-                cache_key = key
+                link.cache_key = cache_key
 
             link.weight = weight
             link.written = link.accessed = self._clock()
@@ -442,6 +496,9 @@ class CacheImpl(Cache[K, V]):
                 link.lfu_prev = lfu_last
                 link.lfu_next = self._root
 
+                if 0 not in self._lfu_heads:
+                    self._lfu_heads[0] = link
+
             self._weight += weight
             self._size += 1
             self._max_size_ever = max(self._size, self._max_size_ever)
@@ -449,6 +506,9 @@ class CacheImpl(Cache[K, V]):
 
             self._cache[cache_key] = link
 
+            if self._policy is not None:
+                self._policy.on_insert(self, link)
+
     def __delitem__(self, key: K) -> None:
         with self._lock():
             self._reap()
@@ -0,0 +1,233 @@
+"""
+A loading front for a `Cache`, computing missing values through a loader.
+
+Loads are single-flight: concurrent `get_or_load` callers missing the same key wait on the one in-flight load rather
+than each computing the value, and likewise for `aget_or_load` callers within an event loop. A failed load raises in
+every waiting caller and caches nothing.
+
+With `refresh_after` set, a hit on an entry loaded longer ago than that still returns the cached, stale value
+immediately, but first starts a single background reload of it - in a thread (or the given executor) for
+`get_or_load`, or in a task for `aget_or_load`. A failed refresh is logged and leaves the stale entry in place. This is
+independent of the underlying cache's own expiry, so pairing it with a longer `expire_after_write` serves stale values
+only up to that bound.
+
+Values are stored in the underlying cache wrapped in `LoadingCache.Entry`s, which any weigher given to it will receive.
+"""
+import asyncio
+import concurrent.futures as cf
+import threading
+import time
+import typing as ta
+
+from ...logs import all as logs
+from .impl import new_cache
+from .types import Cache
+
+
+K = ta.TypeVar('K')
+V = ta.TypeVar('V')
+
+Loader: ta.TypeAlias = ta.Callable[[K], V]
+AsyncLoader: ta.TypeAlias = ta.Callable[[K], ta.Awaitable[V]]
+
+
+log = logs.get_module_logger(globals())
+
+
+##
+
+
+class LoadingCache(ta.Generic[K, V]):
+    class Entry(ta.NamedTuple):
+        value: ta.Any
+        loaded: float
+
+    class _Flight:
+        __slots__ = ('event', 'value', 'exc')
+
+        def __init__(self) -> None:
+            self.event = threading.Event()
+            self.value: ta.Any = None
+            self.exc: BaseException | None = None
+
+    def __init__(
+            self,
+            loader: Loader | None = None,
+            *,
+            async_loader: AsyncLoader | None = None,
+            cache: Cache[K, Entry] | None = None,
+            refresh_after: float | None = None,
+            refresh_executor: cf.Executor | None = None,
+            clock: ta.Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__()
+
+        if refresh_after is not None and refresh_after <= 0:
+            raise ValueError(f'refresh_after must be positive: {refresh_after!r}')
+
+        if cache is None:
+            cache = new_cache()
+        if clock is None:
+            clock = time.time
+
+        self._loader = loader
+        self._async_loader = async_loader
+        self._cache = cache
+        self._refresh_after = refresh_after
+        self._refresh_executor = refresh_executor
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._flights: dict[ta.Any, LoadingCache._Flight] = {}
+        self._refreshing: set[ta.Any] = set()
+
+        self._async_flights: dict[ta.Any, asyncio.Future] = {}
+        self._async_refreshing: dict[ta.Any, asyncio.Task] = {}
+
+    @property
+    def cache(self) -> Cache[K, Entry]:
+        return self._cache
+
+    def invalidate(self, key: K) -> None:
+        try:
+            del self._cache[key]
+        except KeyError:
+            pass
+
+    def _get_entry(self, key: K) -> Entry | None:
+        try:
+            return self._cache[key]
+        except KeyError:
+            return None
+
+    def _is_stale(self, e: Entry) -> bool:
+        return self._refresh_after is not None and self._clock() - e.loaded >= self._refresh_after
+
+    def _put(self, key: K, value: V) -> None:
+        self._cache[key] = LoadingCache.Entry(value, self._clock())
+
+    #
+
+    def _refresh(self, key: K, loader: Loader) -> None:
+        try:
+            self._put(key, loader(key))
+        except Exception:  # noqa
+            log.exception('Cache refresh failed: %r', key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _start_refresh(self, key: K, loader: Loader) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        try:
+            if (ex := self._refresh_executor) is not None:
+                ex.submit(self._refresh, key, loader)
+            else:
+                threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+
+        except BaseException:
+            with self._lock:
+                self._refreshing.discard(key)
+            raise
+
+    def get_or_load(self, key: K, loader: Loader | None = None) -> V:
+        if loader is None:
+            if (loader := self._loader) is None:
+                raise TypeError('No loader')
+
+        if (e := self._get_entry(key)) is not None:
+            if self._is_stale(e):
+                self._start_refresh(key, loader)
+            return e.value
+
+        with self._lock:
+            # Re-checked under the lock, as a flight may have landed since the miss above.
+            if (e := self._get_entry(key)) is not None:
+                return e.value
+
+            if (f := self._flights.get(key)) is not None:
+                leader = False
+            else:
+                f = self._flights[key] = LoadingCache._Flight()
+                leader = True
+
+        if not leader:
+            f.event.wait()
+            if f.exc is not None:
+                raise f.exc
+            return f.value
+
+        try:
+            v = loader(key)
+
+        except BaseException as ex:
+            f.exc = ex
+            raise
+
+        else:
+            f.value = v
+            self._put(key, v)
+            return v
+
+        finally:
+            with self._lock:
+                del self._flights[key]
+            f.event.set()
+
+    #
+
+    async def _async_refresh(self, key: K, loader: AsyncLoader) -> None:
+        try:
+            self._put(key, await loader(key))
+        except Exception:  # noqa
+            log.exception('Cache refresh failed: %r', key)
+        finally:
+            self._async_refreshing.pop(key, None)
+
+    async def aget_or_load(self, key: K, loader: AsyncLoader | None = None) -> V:
+        if loader is None:
+            if (loader := self._async_loader) is None:
+                raise TypeError('No async loader')
+
+        while True:
+            if (e := self._get_entry(key)) is not None:
+                if self._is_stale(e) and key not in self._async_refreshing:
+                    self._async_refreshing[key] = asyncio.create_task(self._async_refresh(key, loader))
+                return e.value
+
+            if (fut := self._async_flights.get(key)) is None:
+                break
+
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                # If it was the leader that was cancelled rather than this caller, try again - possibly as the leader.
+                if fut.cancelled():
+                    continue
+                raise
+
+        fut = self._async_flights[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            v = await loader(key)
+
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+
+        except BaseException as ex:
+            fut.set_exception(ex)
+            fut.exception()  # Marks the exception retrieved should there be no waiters to do so.
+            raise
+
+        else:
+            fut.set_result(v)
+            self._put(key, v)
+            return v
+
+        finally:
+            del self._async_flights[key]
@@ -0,0 +1,195 @@
+"""
+A lock-striped variant of `CacheImpl` for use under contention from many threads.
+
+Keys are hashed to one of a fixed number of independent `CacheImpl` shards, each with its own lock and eviction lists,
+so operations on different shards never contend. Size and weight bounds remain global: a shard which is inserted into
+while the cache as a whole is full first evicts from itself by its own policy, and if that is not enough - because the
+shard is empty - evicts from the others after the insert has completed and its own lock has been released.
+
+Consequently eviction order is only that of the configured policy within each shard, and the bounds may be briefly
+exceeded while concurrent inserts race to enforce them. Stats are summed across shards, making `max_size_ever` and
+`max_weight_ever` upper bounds.
+"""
+import itertools
+import typing as ta
+import weakref
+
+from .impl import LRU
+from .impl import CacheImpl
+from .impl import EvictionPolicy
+from .types import Cache
+from .types import Eviction
+
+
+K = ta.TypeVar('K')
+V = ta.TypeVar('V')
+
+
+##
+
+
+class ShardedCacheImpl(Cache[K, V]):
+    class _Shard(CacheImpl):
+        _is_sharded_full: ta.Callable[[], bool]
+
+        @property
+        def _full(self) -> bool:
+            return bool(self._size) and self._is_sharded_full()
+
+    DEFAULT_MAX_SIZE = CacheImpl.DEFAULT_MAX_SIZE
+    DEFAULT_NUM_SHARDS = 16
+
+    def __init__(
+            self,
+            *,
+            num_shards: int = DEFAULT_NUM_SHARDS,
+            max_size: int | None = DEFAULT_MAX_SIZE,
+            max_weight: float | None = None,
+            identity_keys: bool = False,
+            expire_after_access: float | None = None,
+            expire_after_write: float | None = None,
+            removal_listener: ta.Callable[[K | weakref.ref, V | weakref.ref], None] | None = None,
+            clock: ta.Callable[[], float] | None = None,
+            weak_keys: bool = False,
+            weak_values: bool = False,
+            weigher: ta.Callable[[V], float] = lambda _: 1.,
+            raise_overweight: bool = False,
+            eviction: Eviction = LRU,
+            track_frequency: bool | None = None,
+    ) -> None:
+        super().__init__()
+
+        if num_shards < 1:
+            raise ValueError(f'num_shards must be positive: {num_shards!r}')
+        if max_size is not None and max_size < 1:
+            raise ValueError(f'max_size must be positive: {max_size!r}')
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError(f'max_weight must be positive: {max_weight!r}')
+
+        self._max_size = max_size
+        self._max_weight = max_weight
+        self._identity_keys = identity_keys
+
+        shards: list[ShardedCacheImpl._Shard] = []
+        for _ in range(num_shards):
+            shard: ShardedCacheImpl._Shard = ShardedCacheImpl._Shard(
+                # The size bound is enforced globally, but the weight bound is passed through so each shard still
+                # rejects individually overweight values.
+                max_size=None,
+                max_weight=max_weight,
+                identity_keys=identity_keys,
+                expire_after_access=expire_after_access,
+                expire_after_write=expire_after_write,
+                removal_listener=removal_listener,
+                clock=clock,
+                weak_keys=weak_keys,
+                weak_values=weak_values,
+                weigher=weigher,
+                lock=True,
+                raise_overweight=raise_overweight,
+                eviction=eviction.clone() if isinstance(eviction, EvictionPolicy) else eviction,
+                track_frequency=track_frequency,
+            )
+            shard._is_sharded_full = self._is_full  # noqa
+            shards.append(shard)
+
+        self._shards: ta.Sequence[ShardedCacheImpl._Shard] = shards
+        self._num_shards = num_shards
+
+        self._evict_counter = itertools.count()
+
+    @property
+    def num_shards(self) -> int:
+        return self._num_shards
+
+    def _shard(self, key: K) -> _Shard:
+        return self._shards[(id(key) if self._identity_keys else hash(key)) % self._num_shards]
+
+    #
+
+    # Totals are read without taking shard locks, and so are approximate while other threads are writing.
+
+    def _is_full(self) -> bool:
+        if self._max_size is not None and sum(s._size for s in self._shards) >= self._max_size:  # noqa
+            return True
+        if self._max_weight is not None and sum(s._weight for s in self._shards) >= self._max_weight:  # noqa
+            return True
+        return False
+
+    def _is_over(self) -> bool:
+        if self._max_size is not None and sum(s._size for s in self._shards) > self._max_size:  # noqa
+            return True
+        if self._max_weight is not None and sum(s._weight for s in self._shards) > self._max_weight:  # noqa
+            return True
+        return False
+
+    def _evict_others(self, shard: _Shard) -> None:
+        misses = 0
+        while misses < self._num_shards and self._is_over():
+            other = self._shards[next(self._evict_counter) % self._num_shards]
+            if other is shard:
+                misses += 1
+                continue
+
+            with other._lock():  # noqa
+                if not other._size:  # noqa
+                    misses += 1
+                    continue
+
+                other._eviction(other)  # noqa
+                misses = 0
+
+    #
+
+    def reap(self) -> None:
+        for s in self._shards:
+            s.reap()
+
+    def __getitem__(self, key: K) -> V:
+        return self._shard(key)[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        shard = self._shard(key)
+        shard[key] = value
+
+        if self._max_size is not None or self._max_weight is not None:
+            self._evict_others(shard)
+
+    def __delitem__(self, key: K) -> None:
+        del self._shard(key)[key]
+
+    def __contains__(self, key: K) -> bool:  # type: ignore
+        return key in self._shard(key)
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._shards)
+
+    def clear(self) -> None:
+        for s in self._shards:
+            s.clear()
+
+    def __iter__(self) -> ta.Iterator[K]:
+        # Insertion ordered within, but not across, shards.
+        return iter([k for s in self._shards for k in s._list_keys()])  # noqa
+
+    def __reversed__(self) -> ta.Iterator[K]:
+        return iter([k for s in reversed(self._shards) for k in s._list_keys(reverse=True)])  # noqa
+
+    @property
+    def stats(self) -> Cache.Stats:
+        sts = [s.stats for s in self._shards]
+        return Cache.Stats(
+            sum(st.seq for st in sts),
+            sum(st.size for st in sts),
+            sum(st.weight for st in sts),
+            sum(st.hits for st in sts),
+            sum(st.misses for st in sts),
+            sum(st.max_size_ever for st in sts),
+            sum(st.max_weight_ever for st in sts),
+        )
+
+    def shard_stats(self) -> ta.Sequence[Cache.Stats]:
+        return [s.stats for s in self._shards]
+
+
+new_sharded_cache = ShardedCacheImpl
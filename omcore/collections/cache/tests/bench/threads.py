@@ -0,0 +1,62 @@
+"""
+Compares `CacheImpl` against `ShardedCacheImpl` under a mixed read/write load from increasing numbers of threads. Only
+free-threaded builds with the GIL disabled can be expected to show throughput scaling with thread count - under the GIL
+the comparison is of lock overhead and contention alone.
+"""
+import random
+import sys
+import threading
+
+from ..... import lang
+from ...impl import new_cache
+from ...sharded import new_sharded_cache
+
+
+def _run(c, n_threads: int, n_ops: int) -> float:
+    keys = [random.Random(i).randrange(4096) for i in range(n_ops)]
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(n):
+        ks = keys[n::n_threads]
+        barrier.wait()
+        for i, k in enumerate(ks):
+            if i % 4:
+                try:
+                    c[k]
+                except KeyError:
+                    pass
+            else:
+                c[k] = k
+
+    ts = [threading.Thread(target=worker, args=(n,)) for n in range(n_threads)]
+    for t in ts:
+        t.start()
+
+    with lang.Timer() as tmr:
+        barrier.wait()
+        for t in ts:
+            t.join()
+
+    return tmr.elapsed
+
+
+def _main() -> None:
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'python {sys.version.split()[0]}, gil {"enabled" if gil else "disabled"}')
+
+    n_ops = 200_000
+    for n_threads in [1, 2, 4, 8]:
+        for name, fac in [
+            ('single', lambda: new_cache(max_size=1024)),
+            ('sharded', lambda: new_sharded_cache(max_size=1024)),
+        ]:
+            c = fac()
+            el = _run(c, n_threads, n_ops)
+            print(
+                f'{name}, {n_threads} threads: {n_ops / el:_.0f} ops/s '
+                f'(hits {c.stats.hits}, misses {c.stats.misses})',
+            )
+
+
+if __name__ == '__main__':
+    _main()
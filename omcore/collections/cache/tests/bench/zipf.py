@@ -0,0 +1,62 @@
+"""
+Hit rates and throughput of the eviction policies on Zipfian key traces, with and without an interleaved scan of
+one-off keys.
+"""
+import itertools
+import random
+
+from ..... import lang
+from ...impl import LFU
+from ...impl import LRU
+from ...impl import new_cache
+from ...tinylfu import WTinyLfu
+
+
+def _zipf_trace(n_keys: int, n: int, s: float, seed: int = 0) -> list[int]:
+    rnd = random.Random(seed)
+    ws = [1. / (i ** s) for i in range(1, n_keys + 1)]
+    return rnd.choices(range(n_keys), cum_weights=list(itertools.accumulate(ws)), k=n)
+
+
+def _scan_trace(zt: list[int], every: int) -> list[int]:
+    # Replaces every `every`th access with a never repeated key.
+    return [-i if not i % every else k for i, k in enumerate(zt, 1)]
+
+
+def _run(c, trace: list[int]) -> float:
+    for k in trace:
+        try:
+            c[k]
+        except KeyError:
+            c[k] = k
+    return c.stats.hits / len(trace)
+
+
+def _main() -> None:
+    n = 500_000
+    n_keys = 100_000
+
+    for s in [.8, 1., 1.2]:
+        zt = _zipf_trace(n_keys, n, s)
+        for tn, trace in [
+            ('zipf', zt),
+            ('zipf+scan', _scan_trace(zt, 3)),
+        ]:
+            for size in [1_000, 10_000]:
+                for name, eviction in [
+                    ('lru', lambda: LRU),
+                    ('lfu', lambda: LFU),
+                    ('w-tinylfu', WTinyLfu),
+                ]:
+                    c = new_cache(max_size=size, eviction=eviction())
+                    with lang.Timer() as tmr:
+                        hr = _run(c, trace)
+                    print(
+                        f's={s} {tn} size={size} {name}: '
+                        f'hit rate {hr * 100.:.2f}%, '
+                        f'{len(trace) / tmr.elapsed:_.0f} ops/s',
+                    )
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,4 +1,6 @@
+import contextlib
 import gc
+import random
 import threading
 import weakref
 
@@ -171,3 +173,27 @@ def test_lfu():
                 c[i]
     c[2]
     c[6] = 6
+
+
+def test_lfu_order():
+    rnd = random.Random(0)
+    c = impl_.new_cache(max_size=50, eviction=impl_.LFU)
+    for _ in range(5_000):
+        k = int(rnd.paretovariate(1.)) % 100
+        if rnd.random() < .3:
+            c[k] = k
+        else:
+            with contextlib.suppress(KeyError):
+                c[k]  # noqa
+
+        # The lfu list is ordered by descending hits, and each group of equal hits is headed by the tracked link.
+        hs = []
+        link = c._root.lfu_next  # noqa
+        while link is not c._root:  # noqa
+            if not hs or hs[-1] != link.hits:
+                assert c._lfu_heads[link.hits] is link  # noqa
+            hs.append(link.hits)
+            link = link.lfu_next
+        assert hs == sorted(hs, reverse=True)
+        assert len(hs) == len(c)
+        assert set(c._lfu_heads) == set(hs)  # noqa
@@ -0,0 +1,134 @@
+import asyncio
+import concurrent.futures as cf
+import threading
+
+import pytest
+
+from ..loading import LoadingCache
+
+
+def test_single_flight():
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def load(k):
+        calls.append(k)
+        started.set()
+        assert release.wait(10.)
+        return k * 2
+
+    lc: LoadingCache[int, int] = LoadingCache(load)
+
+    with cf.ThreadPoolExecutor(8) as ex:
+        futs = [ex.submit(lc.get_or_load, 3) for _ in range(8)]
+        assert started.wait(10.)
+        release.set()
+        assert [f.result() for f in futs] == [6] * 8
+
+    assert calls == [3]
+    assert lc.get_or_load(3) == 6
+    assert calls == [3]
+
+
+def test_failed_load():
+    n = 0
+
+    def load(k):
+        nonlocal n
+        n += 1
+        raise ValueError(k)
+
+    lc: LoadingCache[int, int] = LoadingCache(load)
+    for _ in range(2):
+        with pytest.raises(ValueError):  # noqa
+            lc.get_or_load(1)
+    assert n == 2
+    assert 1 not in lc.cache
+
+
+def test_refresh_ahead():
+    clock = 0.
+    gen = 0
+
+    def load(k):
+        return (k, gen)
+
+    with cf.ThreadPoolExecutor(1) as ex:
+        lc: LoadingCache[int, tuple] = LoadingCache(
+            load,
+            refresh_after=10.,
+            refresh_executor=ex,
+            clock=lambda: clock,
+        )
+
+        assert lc.get_or_load(1) == (1, 0)
+
+        gen = 1
+        clock = 5.
+        assert lc.get_or_load(1) == (1, 0)
+
+        clock = 15.
+        assert lc.get_or_load(1) == (1, 0)  # stale, refresh started
+
+    assert lc.get_or_load(1) == (1, 1)
+    assert lc.cache[1].loaded == 15.
+
+
+@pytest.mark.asyncs('asyncio')
+async def test_async_single_flight():
+    calls: list[int] = []
+
+    async def load(k):
+        calls.append(k)
+        await asyncio.sleep(.01)
+        return k * 2
+
+    lc: LoadingCache[int, int] = LoadingCache(async_loader=load)
+
+    assert await asyncio.gather(*[lc.aget_or_load(3) for _ in range(8)]) == [6] * 8
+    assert calls == [3]
+
+
+@pytest.mark.asyncs('asyncio')
+async def test_async_leader_cancelled():
+    calls: list[int] = []
+
+    async def load(k):
+        calls.append(k)
+        await asyncio.sleep(.01 if len(calls) > 1 else 10.)
+        return k
+
+    lc: LoadingCache[int, int] = LoadingCache(async_loader=load)
+
+    leader = asyncio.create_task(lc.aget_or_load(1))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(lc.aget_or_load(1))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await follower == 1
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncs('asyncio')
+async def test_async_refresh_ahead():
+    clock = 0.
+    gen = 0
+
+    async def load(k):
+        return (k, gen)
+
+    lc: LoadingCache[int, tuple] = LoadingCache(
+        async_loader=load,
+        refresh_after=10.,
+        clock=lambda: clock,
+    )
+
+    assert await lc.aget_or_load(1) == (1, 0)
+
+    gen = 1
+    clock = 15.
+    assert await lc.aget_or_load(1) == (1, 0)
+    await asyncio.sleep(0)
+    assert await lc.aget_or_load(1) == (1, 1)
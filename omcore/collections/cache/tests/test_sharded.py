@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from .. import impl as impl_
+from .. import sharded as sharded_
+from ..types import OverweightError
+
+
+def test_sharded_cache():
+    c = sharded_.new_sharded_cache(num_shards=4, max_size=None)  # type: ignore
+    for i in range(100):
+        c[i] = str(i)
+    assert len(c) == 100
+    assert sorted(c) == list(range(100))
+    for i in range(100):
+        assert c[i] == str(i)
+        assert i in c
+
+    del c[5]
+    assert 5 not in c
+    with pytest.raises(KeyError):
+        c.__getitem__(5)
+    with pytest.raises(KeyError):
+        c.__getitem__(1000)
+
+    st = c.stats
+    assert st.size == 99
+    assert st.hits == 100
+    assert st.misses == 2
+
+    c.clear()
+    assert len(c) == 0
+
+
+def test_global_size_bound():
+    c = sharded_.new_sharded_cache(num_shards=8, max_size=10)  # type: ignore
+    for i in range(1000):
+        c[i] = i
+        assert len(c) <= 10
+    assert len(c) == 10
+
+    # A single shard's own entries go first, by its own policy.
+    c = sharded_.new_sharded_cache(num_shards=1, max_size=2)  # type: ignore
+    c[0] = 0
+    c[1] = 1
+    c[0]  # noqa
+    c[2] = 2
+    assert sorted(c) == [0, 2]
+
+    # All keys of a one-key-per-shard workload still respect the bound.
+    c = sharded_.new_sharded_cache(num_shards=16, max_size=1)  # type: ignore
+    for i in range(16):
+        c[i] = i
+        assert list(c) == [i]
+
+
+def test_global_weight_bound():
+    c = sharded_.new_sharded_cache(  # type: ignore
+        num_shards=4,
+        max_size=None,
+        max_weight=10.,
+        weigher=lambda v: float(v),
+    )
+    for i in range(100):
+        c[i] = 3
+        assert c.stats.weight <= 10.
+    assert len(c) == 3
+
+    c[1000] = 11
+    assert 1000 not in c
+
+    c = sharded_.new_sharded_cache(max_weight=10., weigher=lambda v: float(v), raise_overweight=True)  # type: ignore
+    with pytest.raises(OverweightError):
+        c[0] = 11
+
+
+def test_lfu_shards():
+    c = sharded_.new_sharded_cache(num_shards=1, max_size=5, eviction=impl_.LFU)  # type: ignore
+    for i in range(5):
+        c[i] = i
+    for _ in range(2):
+        for i in range(5):
+            if i != 2:
+                c[i]  # noqa
+    c[6] = 6
+    assert 2 not in c
+    assert 6 in c
+
+
+def test_threads():
+    c = sharded_.new_sharded_cache(num_shards=8, max_size=64)  # type: ignore
+    errs: list[BaseException] = []
+
+    def run(n):
+        try:
+            for i in range(2_000):
+                k = (i * 7 + n) % 200
+                c[k] = k
+                try:
+                    assert c[k] == k
+                except KeyError:
+                    pass
+        except BaseException as e:  # noqa
+            errs.append(e)
+
+    ts = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+
+    assert not errs
+    assert len(c) <= 64
+    for k in c:
+        assert c[k] == k
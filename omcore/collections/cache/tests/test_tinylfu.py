@@ -0,0 +1,64 @@
+import pytest
+
+from .. import impl as impl_
+from .. import sharded as sharded_
+from .. import tinylfu as tinylfu_
+
+
+def test_sketch():
+    sk = tinylfu_.FrequencySketch(64)
+    for i in range(10):
+        for _ in range(i):
+            sk.increment(hash(i))
+    for i in range(10):
+        assert sk.frequency(hash(i)) >= i
+
+    for _ in range(20):
+        sk.increment(hash('x'))
+    assert sk.frequency(hash('x')) == 15
+
+
+def test_scan_resistance():
+    for eviction, survives in [
+        (impl_.LRU, False),
+        (tinylfu_.WTinyLfu(), True),
+    ]:
+        c = impl_.new_cache(max_size=100, eviction=eviction)
+
+        hot = list(range(50))
+        for _ in range(10):
+            for k in hot:
+                try:
+                    c[k]
+                except KeyError:
+                    c[k] = k
+
+        for k in range(1000, 1500):
+            try:
+                c[k]
+            except KeyError:
+                c[k] = k
+
+        assert len(c) == 100
+        assert all(k in c for k in hot) is survives
+
+
+def test_window_admits_new_keys():
+    c = impl_.new_cache(max_size=100, eviction=tinylfu_.WTinyLfu(window_ratio=.1))
+    for k in range(200):
+        c[k] = k
+    assert len(c) == 100
+    assert 199 in c
+
+
+def test_bad_window_ratio():
+    with pytest.raises(ValueError):  # noqa
+        tinylfu_.WTinyLfu(window_ratio=0.)
+
+
+def test_sharded():
+    c = sharded_.new_sharded_cache(num_shards=4, max_size=40, eviction=tinylfu_.WTinyLfu())
+    for k in range(1000):
+        c[k] = k
+    assert len(c) <= 40
+    assert len({id(s._eviction) for s in c._shards}) == 4  # noqa
@@ -0,0 +1,193 @@
+"""
+A W-TinyLFU eviction policy for `CacheImpl`, after Einziger, Friedman, and Manes - "TinyLFU: A Highly Efficient Cache
+Admission Policy".
+
+Key access frequencies are estimated by a count-min sketch of 4-bit counters which are periodically halved, so the
+estimates favor recent history. New entries are admitted to a small FIFO window. When the cache is full and the window
+is over its share, its oldest entry becomes a candidate for the main region and competes with the main region's least
+recently used entry, the less frequently accessed of the two being evicted. This protects a working set
+of frequently accessed keys from being flushed by scans of one-off keys, while the window keeps recency-driven bursts
+admissible.
+
+Unlike the paper's design the main region is a plain LRU rather than a segmented one, being the cache's own lru list
+less the window.
+"""
+import typing as ta
+
+from .impl import CacheImpl
+from .impl import EvictionPolicy
+
+
+##
+
+
+# Halves each 4-bit counter of a byte, for aging all counters with a single `bytes.translate`.
+_HALVE_COUNTERS = bytes(((b >> 1) & 0x77) for b in range(256))
+
+_SKETCH_SEEDS = (
+    0x9e3779b97f4a7c15,
+    0xc2b2ae3d27d4eb4f,
+    0x165667b19e3779f9,
+    0xd6e8feb86659fd93,
+)
+
+_M64 = (1 << 64) - 1
+
+
+class FrequencySketch:
+    """A count-min sketch of 4 rows of 4-bit saturating counters, two to a byte."""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+
+        cap = 16
+        while cap < capacity:
+            cap <<= 1
+
+        # As in Caffeine, 16 counters per unit of capacity, aged after 10 additions per unit - so counters average a
+        # few increments between agings, and collisions stay rare enough for the minimum to be meaningful.
+        width = cap * 4
+
+        self._width = width
+        self._shift = 64 - width.bit_length() + 1
+        self._table = bytearray(2 * width)  # 4 rows of `width` counters
+        self._sample_size = 10 * cap
+        self._additions = 0
+
+    def _indexes(self, h: int) -> tuple[int, int, int, int]:
+        h &= _M64
+        w = self._width
+        sh = self._shift
+        return (
+            ((h * _SKETCH_SEEDS[0]) & _M64) >> sh,
+            w + (((h * _SKETCH_SEEDS[1]) & _M64) >> sh),
+            2 * w + (((h * _SKETCH_SEEDS[2]) & _M64) >> sh),
+            3 * w + (((h * _SKETCH_SEEDS[3]) & _M64) >> sh),
+        )
+
+    def frequency(self, h: int) -> int:
+        t = self._table
+        i0, i1, i2, i3 = self._indexes(h)
+        return min(
+            (t[i0 >> 1] >> ((i0 & 1) << 2)) & 0xf,
+            (t[i1 >> 1] >> ((i1 & 1) << 2)) & 0xf,
+            (t[i2 >> 1] >> ((i2 & 1) << 2)) & 0xf,
+            (t[i3 >> 1] >> ((i3 & 1) << 2)) & 0xf,
+        )
+
+    def increment(self, h: int) -> None:
+        t = self._table
+        added = False
+        for i in self._indexes(h):
+            b = i >> 1
+            sh = (i & 1) << 2
+            if ((t[b] >> sh) & 0xf) < 15:
+                t[b] += 1 << sh
+                added = True
+
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._table = bytearray(self._table.translate(_HALVE_COUNTERS))
+                self._additions //= 2
+
+
+class WTinyLfu(EvictionPolicy):
+    DEFAULT_WINDOW_RATIO = .01
+
+    def __init__(
+            self,
+            *,
+            window_ratio: float = DEFAULT_WINDOW_RATIO,
+            sketch_capacity: int | None = None,
+    ) -> None:
+        super().__init__()
+
+        if not (0. < window_ratio < 1.):
+            raise ValueError(f'window_ratio must be between 0 and 1: {window_ratio!r}')
+
+        self._window_ratio = window_ratio
+        self._sketch_capacity = sketch_capacity
+
+        self._sketch: FrequencySketch | None = None
+
+        # Links in the window, keyed by seq - a dict rather than a list as links may be killed from under the policy.
+        self._window: dict[int, CacheImpl.Link] = {}
+
+    def clone(self) -> WTinyLfu:
+        return WTinyLfu(
+            window_ratio=self._window_ratio,
+            sketch_capacity=self._sketch_capacity,
+        )
+
+    def _get_sketch(self, cache: CacheImpl) -> FrequencySketch:
+        if (sk := self._sketch) is None:
+            if (cap := self._sketch_capacity) is None:
+                cap = cache._max_size or CacheImpl.DEFAULT_MAX_SIZE  # noqa
+            sk = self._sketch = FrequencySketch(cap)
+        return sk
+
+    def _link_hash(self, cache: CacheImpl, link: CacheImpl.Link) -> int | None:
+        if cache._identity_keys:  # noqa
+            return hash(link.cache_key)
+
+        key = link.key
+        if cache._weak_keys and key is not None:  # noqa
+            key = key()  # type: ignore
+        if key is None:
+            return None
+        return hash(key)
+
+    def _link_frequency(self, cache: CacheImpl, link: CacheImpl.Link) -> int:
+        if (h := self._link_hash(cache, link)) is None:
+            return -1
+        return self._get_sketch(cache).frequency(h)
+
+    #
+
+    def record_access(self, cache: CacheImpl, cache_key: ta.Any) -> None:
+        self._get_sketch(cache).increment(hash(cache_key))
+
+    def _window_max(self, cache: CacheImpl) -> int:
+        return max(1, int(cache._size * self._window_ratio))  # noqa
+
+    def on_insert(self, cache: CacheImpl, link: CacheImpl.Link) -> None:
+        self._window[link.seq] = link
+
+        # Until the cache fills up there is no competition for the main region, so the window's overflow is promoted
+        # unconditionally.
+        if not cache._full:  # noqa
+            while len(self._window) > self._window_max(cache):
+                self._pop_window_candidate()
+
+    def _pop_window_candidate(self) -> CacheImpl.Link | None:
+        w = self._window
+        while w:
+            link = w.pop(next(iter(w)))
+            if not link.unlinked:
+                return link
+        return None
+
+    def _main_victim(self, cache: CacheImpl) -> CacheImpl.Link | None:
+        root = cache._root  # noqa
+        link = root.lru_next
+        while link is not root:
+            if link.seq not in self._window:
+                return link
+            link = link.lru_next
+        return None
+
+    def __call__(self, cache: CacheImpl) -> None:
+        if len(self._window) > self._window_max(cache) and (cand := self._pop_window_candidate()) is not None:
+            # The candidate leaves the window whatever happens - either for the main region or for good.
+            if (victim := self._main_victim(cache)) is None:
+                cache._kill(cand)  # noqa
+            elif self._link_frequency(cache, cand) > self._link_frequency(cache, victim):
+                cache._kill(victim)  # noqa
+            else:
+                cache._kill(cand)  # noqa
+            return
+
+        if (victim := self._main_victim(cache)) is None:
+            victim = self._pop_window_candidate()
+        cache._kill(victim)  # type: ignore  # noqa
@@ -15,6 +15,10 @@ from .building import (  # noqa
     JsonValueBuilder,
 )
 
+from .byteslexing import (  # noqa
+    JsonStreamBytesLexer,
+)
+
 from .errors import (  # noqa
     JsonStreamError,
 )
@@ -43,6 +47,19 @@ from .parsing import (  # noqa
     JsonStreamParser,
 )
 
+from .projecting import (  # noqa
+    AnyKey,
+    AnyIndex,
+
+    JsonStreamPathStep,
+    JsonStreamPath,
+
+    parse_json_stream_path,
+
+    JsonStreamProjection,
+    JsonStreamProjector,
+)
+
 from .rendering import (  # noqa
     StreamJsonRenderer,
 )
@@ -53,6 +70,7 @@ from .tokens import (  # noqa
     VALUE_TOKEN_KINDS,
     ControlTokenKind,
     SpaceTokenKind,
+    SkippedTokenKind,
     TokenKind,
 
     ScalarValue,
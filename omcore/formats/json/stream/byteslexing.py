@@ -0,0 +1,308 @@
+"""
+A bytes-input counterpart to `JsonStreamLexer`, pulling utf-8 encoded input directly from a `ByteStreamBuffer`.
+
+Tokens are lexed straight out of the buffer's contiguous segments - string literals containing no escapes are decoded
+directly from buffer memory without an intermediate `bytes` copy or a call to `json.loads`, and only tokens spanning
+segment boundaries are coalesced. Incomplete trailing tokens are left unconsumed in the buffer until more input arrives.
+
+Unlike `JsonStreamLexer` no grammar extensions are supported - only RFC 8259 whitespace is accepted, and positions are
+reported in bytes rather than characters.
+
+TODO:
+ - max token size
+"""
+import json
+import re
+import typing as ta
+
+from ....io.streambufs.types import ByteStreamBuffer
+from .lexing import JsonStreamLexError
+from .tokens import CONST_IDENT_VALUES
+from .tokens import CONTROL_TOKENS
+from .tokens import NUMBER_PAT
+from .tokens import Position
+from .tokens import ScalarValue
+from .tokens import Token
+from .tokens import TokenKind
+
+
+##
+
+
+_SPACE_BYTES = b' \t\n\r'
+_SPACE_RUN_PAT = re.compile(rb'[ \t\n\r]+')
+
+_CONTROL_TOKEN_KINDS_BY_BYTE: ta.Sequence[TokenKind | None] = [
+    CONTROL_TOKENS.get(chr(b)) if b < 0x80 else None
+    for b in range(256)
+]
+
+_QUOTE_BYTE = ord('"')
+
+# A string literal without escapes or control characters, which may be decoded directly.
+_PLAIN_STRING_PAT = re.compile(rb'"[^"\\\x00-\x1f]*+"')
+
+# Any complete string literal - validated by `json.loads`.
+_STRING_PAT = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"', re.DOTALL)
+
+_NUMBER_START_BYTES = b'-0123456789'
+_NUMBER_RUN_PAT = re.compile(rb'[0-9.eE+\-]+')
+
+_CONST_IDENT_START_BYTES = b'tfnIN'
+_CONST_IDENTS: ta.Sequence[bytes] = [k.encode() for k in CONST_IDENT_VALUES if not k.startswith('-')]
+_MAX_CONST_IDENT_LEN = max(map(len, _CONST_IDENTS))
+
+_NEG_INFINITY = b'-Infinity'
+
+
+##
+
+
+class JsonStreamBytesLexer:
+    def __init__(
+            self,
+            *,
+            include_raw: bool = False,
+    ) -> None:
+        super().__init__()
+
+        self._include_raw = include_raw
+
+        self._ofs = 0
+        self._line = 1
+        self._line_ofs = 0
+
+        # When the buffer head is an incomplete string literal spanning segments, the offset from which to resume
+        # searching for its closing quote.
+        self._str_scan_from = 1
+
+    @property
+    def pos(self) -> Position:
+        return Position(
+            self._ofs,
+            self._line,
+            self._ofs - self._line_ofs,
+        )
+
+    def _tok_pos(self, i: int) -> Position:
+        """The position of a token starting at the given offset from the current position - as in `JsonStreamLexer`,
+        this is the position just past its first byte."""
+
+        o = self._ofs + i + 1
+        return Position(
+            o,
+            self._line,
+            o - self._line_ofs,
+        )
+
+    def _raise(self, msg: str, i: int = 0, src: Exception | None = None) -> ta.NoReturn:
+        raise JsonStreamLexError(msg, self._tok_pos(i)) from src
+
+    def _make_tok(
+            self,
+            kind: TokenKind,
+            value: ScalarValue,
+            mv: memoryview,
+            b: int,
+            e: int,
+    ) -> Token:
+        return Token(
+            kind,
+            value,
+            str(mv[b:e], 'utf-8') if self._include_raw else None,
+            self._tok_pos(b),
+        )
+
+    #
+
+    def _lex_number(
+            self,
+            mv: memoryview,
+            i: int,
+            out: list[Token],
+            *,
+            at_end: bool,
+    ) -> int:
+        n = len(mv)
+        e = i + 1
+        if (m := _NUMBER_RUN_PAT.match(mv, e)) is not None:
+            e = m.end()
+        if e >= n and not at_end:
+            return -1
+
+        if e == i + 1 and mv[i] == 0x2d:  # '-'
+            if n - i < len(_NEG_INFINITY) and not at_end and _NEG_INFINITY.startswith(mv[i:]):
+                return -1
+            if mv[i:i + len(_NEG_INFINITY)] == _NEG_INFINITY:
+                e = i + len(_NEG_INFINITY)
+                out.append(self._make_tok('IDENT', '-Infinity', mv, i, e))
+                return e
+
+        raw = str(mv[i:e], 'ascii')
+        if not NUMBER_PAT.fullmatch(raw):
+            self._raise(f'Invalid number format: {raw}', e - 1)
+
+        nv: int | float
+        if '.' in raw or 'e' in raw or 'E' in raw:
+            nv = float(raw)
+        else:
+            nv = int(raw)
+
+        out.append(self._make_tok('NUMBER', nv, mv, i, e))
+        return e
+
+    def _lex_const(
+            self,
+            mv: memoryview,
+            i: int,
+            out: list[Token],
+            *,
+            at_end: bool,
+    ) -> int:
+        n = len(mv)
+        for ci in _CONST_IDENTS:
+            if mv[i:i + len(ci)] == ci:
+                e = i + len(ci)
+                out.append(self._make_tok('IDENT', ci.decode(), mv, i, e))
+                return e
+
+        if n - i < _MAX_CONST_IDENT_LEN and not at_end:
+            t = bytes(mv[i:])
+            if any(ci.startswith(t) for ci in _CONST_IDENTS):
+                return -1
+
+        raise JsonStreamLexError(f'Invalid literal: {bytes(mv[i:i + _MAX_CONST_IDENT_LEN])!r}', self._tok_pos(i))
+
+    def _lex_contiguous(
+            self,
+            mv: memoryview,
+            out: list[Token],
+            *,
+            at_end: bool,
+    ) -> int:
+        """
+        Lexes as many complete tokens as possible from the given contiguous region, returning the number of bytes
+        consumed. Consumption stops at the start of the first token which may continue past the end of the region unless
+        `at_end` is set, denoting the region is the final input.
+        """
+
+        n = len(mv)
+        i = 0
+
+        try:
+            while i < n:
+                c = mv[i]
+
+                if c in _SPACE_BYTES:
+                    e = _SPACE_RUN_PAT.match(mv, i).end()  # type: ignore[union-attr]
+                    if c == 0x0a or e - i > 1:
+                        sp = bytes(mv[i:e])
+                        if (lc := sp.count(b'\n')):
+                            self._line += lc
+                            self._line_ofs = self._ofs + i + sp.rindex(b'\n') + 1
+                    i = e
+                    continue
+
+                if (ck := _CONTROL_TOKEN_KINDS_BY_BYTE[c]) is not None:
+                    out.append(Token(
+                        ck,
+                        (cs := chr(c)),
+                        cs if self._include_raw else None,
+                        self._tok_pos(i),
+                    ))
+                    i += 1
+                    continue
+
+                if c == _QUOTE_BYTE:
+                    if (m := _PLAIN_STRING_PAT.match(mv, i)) is not None:
+                        e = m.end()
+                        try:
+                            sv = str(mv[i + 1:e - 1], 'utf-8')
+                        except UnicodeDecodeError as ue:
+                            self._raise('Invalid string literal encoding', i, ue)
+
+                    elif (m := _STRING_PAT.match(mv, i)) is not None:
+                        e = m.end()
+                        try:
+                            sv = json.loads(str(mv[i:e], 'utf-8'))
+                        except (UnicodeDecodeError, json.JSONDecodeError) as je:
+                            self._raise(f'Invalid string literal: {bytes(mv[i:e])!r}', i, je)
+
+                    elif at_end:
+                        self._raise('Unterminated string literal', i)
+
+                    else:
+                        break
+
+                    out.append(self._make_tok('STRING', sv, mv, i, e))
+                    i = e
+                    continue
+
+                if c in _NUMBER_START_BYTES:
+                    if (e := self._lex_number(mv, i, out, at_end=at_end)) < 0:
+                        break
+                    i = e
+                    continue
+
+                if c in _CONST_IDENT_START_BYTES:
+                    if (e := self._lex_const(mv, i, out, at_end=at_end)) < 0:
+                        break
+                    i = e
+                    continue
+
+                self._raise(f'Unexpected character: {chr(c)!r}', i)
+
+        finally:
+            self._ofs += i
+
+        return i
+
+    #
+
+    def lex(self, buf: ByteStreamBuffer, *, final: bool = False) -> list[Token]:
+        """
+        Lexes all complete tokens currently in the given buffer, consuming them. If `final` is set the buffer is
+        considered to contain the end of input, and any incomplete trailing token is an error.
+        """
+
+        out: list[Token] = []
+
+        while (bl := len(buf)):
+            mv = buf.peek()
+            ml = len(mv)
+            whole = ml == bl
+
+            i = self._lex_contiguous(mv, out, at_end=final and whole)
+            del mv
+
+            if i:
+                buf.advance(i)
+                self._str_scan_from = 1
+
+            if i == ml:
+                continue
+
+            # The head is now the start of a token which does not fit in the first segment.
+
+            if whole:
+                if final:
+                    self._raise('Unexpected end of input')
+                break
+
+            hl = ml - i
+
+            if buf.peek()[0] == _QUOTE_BYTE:
+                # Coalesce up to the next candidate closing quote, whether or not it turns out to be escaped.
+                if (qi := buf.find(b'"', self._str_scan_from)) < 0:
+                    self._str_scan_from = max(bl - i, 1)
+                    if final:
+                        self._raise('Unterminated string literal')
+                    break
+
+                self._str_scan_from = qi + 1
+                buf.coalesce(qi + 1)
+
+            else:
+                buf.coalesce(min(bl - i, max(hl * 2, 64)))
+
+        return out
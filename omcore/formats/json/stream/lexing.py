@@ -7,6 +7,7 @@ TODO:
 import dataclasses as dc
 import io
 import json
+import re
 import typing as ta
 
 from .... import check
@@ -33,6 +34,34 @@ else:
 ##
 
 
+_SPACE_RUN_PAT = re.compile(r'[ \t\n\r]+')
+_EXTENDED_SPACE_RUN_PAT = re.compile(f'[{re.escape(EXPANDED_SPACE_CHARS)}]+')
+
+# Deliberately ascii-only - anything else, including non-ascii digits, is left to the per-character machine.
+_NUMBER_RUN_PAT = re.compile(r'[0-9.eE+\-]+')
+_EXTENDED_NUMBER_RUN_PAT = re.compile(r'[0-9.eE+\-xXa-fA-F]+')
+
+# Everything following an opening quote up to and including its matching unescaped closing quote.
+_STRING_BODY_PATS: ta.Mapping[str, re.Pattern] = {
+    q: re.compile(rf'[^{q}\\]*+(?:\\.[^{q}\\]*+)*+{q}', re.DOTALL)
+    for q in '"\''
+}
+
+_CONST_IDENTS_BY_FIRST_CHAR: ta.Mapping[str, ta.Sequence[str]] = {
+    c: [v for v in CONST_IDENT_VALUES if v[0] == c]
+    for c in 'tfnIN'
+}
+
+# Runs of characters which may be skipped over without inspection when skipping values.
+_SKIP_STRING_RUN_PATS: ta.Mapping[str, re.Pattern] = {
+    q: re.compile(rf'[^{q}\\]+')
+    for q in '"\''
+}
+
+
+##
+
+
 @dc.dataclass()
 class JsonStreamLexError(JsonStreamError):
     message: str
@@ -41,6 +70,12 @@ class JsonStreamLexError(JsonStreamError):
 
 
 class JsonStreamLexer(GenMachine[str, Token]):
+    """
+    Input may be fed either a character at a time or in arbitrarily sized chunks. When fed chunks, runs of insignificant
+    whitespace, string bodies, and number literals are scanned in bulk within each chunk, with the per-character machine
+    only taking over at chunk boundaries and for anything the bulk scanners do not recognize.
+    """
+
     def __init__(
             self,
             *,
@@ -78,6 +113,22 @@ class JsonStreamLexer(GenMachine[str, Token]):
 
         self._allow_extended_idents = allow_extended_idents
 
+        self._space_run_pat = _EXTENDED_SPACE_RUN_PAT if allow_extended_space else _SPACE_RUN_PAT
+        self._number_run_pat = _EXTENDED_NUMBER_RUN_PAT if allow_extended_number_literals else _NUMBER_RUN_PAT
+
+        self._skip_container_run_pat = re.compile(''.join([
+            r'[^\[\]{}"',
+            "'" if allow_single_quotes else '',
+            '/' if allow_comments else '',
+            ']+',
+        ]))
+        self._skip_scalar_run_pat = re.compile(''.join([
+            r'[^,\]}\s/',
+            re.escape(EXPANDED_SPACE_CHARS) if allow_extended_space else '',
+            ']+',
+        ]))
+        self._skip_count = 0
+
         self._char_in_str: str | None = None
         self._char_in_str_len: int = 0
         self._char_in_str_pos: int = 0
@@ -98,6 +149,20 @@ class JsonStreamLexer(GenMachine[str, Token]):
             self._col,
         )
 
+    def skip_values(self, n: int = 1) -> None:
+        """
+        Requests that the next `n` values be skipped rather than lexed, each producing a single 'SKIPPED' token in place
+        of its tokens. Skipping is done by bracket and quote counting alone, so skipped values are not otherwise
+        validated, nor are comments within them reported. Separating commas are still lexed, and a closing bracket or
+        brace cancels any remaining skips, so the remainder of an array may be skipped by passing a count larger than
+        its length.
+
+        Must only be called between tokens at a point where a value or a separating comma may follow - for example
+        immediately after a 'COLON' token.
+        """
+
+        self._skip_count = n
+
     def _advance_pos(self, c: str) -> str:
         if c and len(c) != 1:
             raise JsonStreamError(c)
@@ -126,6 +191,111 @@ class JsonStreamLexer(GenMachine[str, Token]):
 
         return c
 
+    def _advance_pos_run(self, s: str, b: int, e: int) -> None:
+        self._ofs += e - b
+
+        if (np := s.rfind('\n', b, e)) >= 0:
+            self._line += s.count('\n', b, np + 1)
+            self._col = e - np - 1
+        else:
+            self._col += e - b
+
+    def _str_skip_in(self, pat: re.Pattern) -> bool:
+        """Consumes the longest run matching the given pattern from the current input chunk, if any."""
+
+        if (s := self._char_in_str) is None:
+            return False
+
+        b = self._char_in_str_pos
+        if (m := pat.match(s, b)) is None:
+            return False
+
+        e = m.end()
+        self._advance_pos_run(s, b, e)
+        self._char_in_str_pos = e
+        return True
+
+    def _str_run_in(self, pat: re.Pattern) -> str | None:
+        """Consumes and returns the longest run matching the given pattern from the current input chunk, if any."""
+
+        if (s := self._char_in_str) is None:
+            return None
+
+        b = self._char_in_str_pos
+        if (m := pat.match(s, b)) is None:
+            return None
+
+        e = m.end()
+        self._advance_pos_run(s, b, e)
+        self._char_in_str_pos = e
+        return m.group()
+
+    def _str_string_in(self, q: str) -> ta.Sequence[Token] | None:
+        """
+        Lexes the remainder of a string literal whose opening quote has just been consumed, if it is terminated within
+        the current input chunk.
+        """
+
+        if (s := self._char_in_str) is None:
+            return None
+
+        b = self._char_in_str_pos
+        if (m := _STRING_BODY_PATS[q].match(s, b)) is None:
+            return None
+
+        pos = self.pos
+        e = m.end()
+        self._advance_pos_run(s, b, e)
+        self._char_in_str_pos = e
+
+        return self._make_string_tok(q + m.group(), pos)
+
+    def _str_number_in(self, c: str) -> tuple[ta.Sequence[Token], str] | None:
+        """
+        Lexes the remainder of a number literal whose first character has just been consumed, if it is terminated
+        within the current input chunk. Returns the token and the consumed terminating character.
+        """
+
+        if (s := self._char_in_str) is None:
+            return None
+
+        b = self._char_in_str_pos
+        if (m := self._number_run_pat.match(s, b)) is not None:
+            e = m.end()
+            raw = c + m.group()
+        else:
+            e = b
+            raw = c
+
+        # Non-ascii digits continue the literal in the per-character machine, so leave them to it.
+        if e >= self._char_in_str_len or s[e].isdigit() or raw == '-' or raw == '+':
+            return None
+
+        pos = self.pos
+        self._advance_pos_run(s, b, e)
+        self._char_in_str_pos = e
+
+        # The per-character machine consumes the terminating character before validating the literal, so do the same to
+        # report identical error positions.
+        t = check.not_none(self._str_char_in())
+
+        return (self._make_number_tok(raw, pos), t)
+
+    def _str_const_in(self, c: str) -> ta.Sequence[Token] | None:
+        if (s := self._char_in_str) is None:
+            return None
+
+        b = self._char_in_str_pos
+        for v in _CONST_IDENTS_BY_FIRST_CHAR.get(c, ()):
+            if s.startswith(v[1:], b):
+                pos = self.pos
+                e = b + len(v) - 1
+                self._advance_pos_run(s, b, e)
+                self._char_in_str_pos = e
+                return self._make_tok('IDENT', v, v, pos)
+
+        return None
+
     def _str_char_in(self) -> str | None:
         if (s := self._char_in_str) is None:
             return None
@@ -168,6 +338,9 @@ class JsonStreamLexer(GenMachine[str, Token]):
                 c = peek
                 peek = None
             else:
+                if not self._include_space:
+                    self._str_skip_in(self._space_run_pat)
+
                 if (c := self._str_char_in()) is None:  # type: ignore[assignment]
                     c = self._yield_char_in((yield None))  # noqa
 
@@ -179,14 +352,30 @@ class JsonStreamLexer(GenMachine[str, Token]):
                     yield self._make_tok('SPACE', c, c, self.pos)
                 continue
 
+            if self._skip_count:
+                if c in ']}':
+                    self._skip_count = 0
+                elif c != ',' and not (self._allow_comments and c == '/'):
+                    self._skip_count -= 1
+                    return self._do_skip(c)
+
             if c in CONTROL_TOKENS:
                 yield self._make_tok(CONTROL_TOKENS[c], c, c, self.pos)
                 continue
 
             if c == '"' or (self._allow_single_quotes and c == "'"):
+                if (st := self._str_string_in(c)) is not None:
+                    yield st
+                    continue
+
                 return self._do_string(c)
 
             if c.isdigit() or c == '-' or (self._allow_extended_number_literals and c in '.+'):
+                if (nt := self._str_number_in(c)) is not None:
+                    yield nt[0]
+                    peek = nt[1]
+                    continue
+
                 return self._do_number(c)
 
             if self._allow_comments and c == '/':
@@ -196,10 +385,118 @@ class JsonStreamLexer(GenMachine[str, Token]):
                 return self._do_extended_ident(c)
 
             if c in 'tfnIN':
+                if (ct := self._str_const_in(c)) is not None:
+                    yield ct
+                    continue
+
                 return self._do_const(c)
 
             self._raise(f'Unexpected character: {c}')
 
+    #
+
+    def _skip_char_in(self):
+        try:
+            if (c := self._str_char_in()) is None:
+                c = self._yield_char_in((yield None))  # noqa
+        except GeneratorExit:
+            self._raise('Unexpected end of input')
+
+        return c
+
+    def _skip_string(self, q: str):
+        pat = _SKIP_STRING_RUN_PATS[q]
+        while True:
+            self._str_skip_in(pat)
+            c = yield from self._skip_char_in()
+
+            if c == q:
+                return
+
+            if c == '\\':
+                c = yield from self._skip_char_in()
+
+            if not c:
+                self._raise('Unterminated string literal')
+
+    def _skip_comment(self):
+        oc = yield from self._skip_char_in()
+
+        if oc == '/':
+            while (c := (yield from self._skip_char_in())) and c != '\n':
+                pass
+
+        elif oc == '*':
+            lc = None
+            while (c := (yield from self._skip_char_in())) and not (lc == '*' and c == '/'):
+                lc = c
+
+            if not c:
+                self._raise('Unexpected end of input')
+
+        else:
+            self._raise(f'Unexpected character after comment start: {oc}')
+
+    def _skip_container(self):
+        depth = 1
+        while True:
+            self._str_skip_in(self._skip_container_run_pat)
+            c = yield from self._skip_char_in()
+
+            if not c:
+                self._raise('Unexpected end of input')
+
+            elif c in '[{':
+                depth += 1
+
+            elif c in ']}':
+                if not (depth := depth - 1):
+                    return
+
+            elif c == '"' or (self._allow_single_quotes and c == "'"):
+                yield from self._skip_string(c)
+
+            elif self._allow_comments and c == '/':
+                yield from self._skip_comment()
+
+    def _skip_scalar(self):
+        while True:
+            self._str_skip_in(self._skip_scalar_run_pat)
+            c = yield from self._skip_char_in()
+
+            if (
+                    not c or
+                    c in ',]}' or
+                    c.isspace() or
+                    (self._allow_extended_space and c in EXPANDED_SPACE_CHARS) or
+                    (self._allow_comments and c == '/')
+            ):
+                return c
+
+    def _do_skip(self, c: str):
+        pos = self.pos
+
+        peek: str | None = None
+        if c in '[{':
+            yield from self._skip_container()
+        elif c == '"' or (self._allow_single_quotes and c == "'"):
+            yield from self._skip_string(c)
+        else:
+            peek = yield from self._skip_scalar()
+
+        yield self._make_tok('SKIPPED', None, None, pos)
+        return self._do_main(peek)
+
+    #
+
+    def _make_string_tok(self, raw: str, pos: Position) -> ta.Sequence[Token]:
+        try:
+            sv = self._string_literal_parser(raw)
+        except json.JSONDecodeError as e:
+            self._raise(f'Invalid string literal: {raw!r}', e)
+
+        return self._make_tok('STRING', sv, raw, pos)
+
     def _do_string(self, q: str):
         check.state(self._buf.tell() == 0)
         self._buf.write(q)
@@ -217,6 +514,9 @@ class JsonStreamLexer(GenMachine[str, Token]):
         line = self._line
         col = self._col
 
+        # Whether the previous character was an unescaped backslash, making the current one escaped.
+        esc = False
+
         def restore_state():
             self._char_in_str = char_in_str
             self._char_in_str_len = char_in_str_len
@@ -241,6 +541,10 @@ class JsonStreamLexer(GenMachine[str, Token]):
                         skip_to = sp
 
                     if skip_to != char_in_str_pos:
+                        # The skipped run contains no backslashes, so any pending escape was consumed by its first
+                        # character.
+                        esc = False
+
                         ofs += skip_to - char_in_str_pos
                         if (np := char_in_str.rfind('\n', char_in_str_pos, skip_to)) >= 0:
                             line += char_in_str.count('\n', char_in_str_pos, skip_to)
@@ -292,33 +596,45 @@ class JsonStreamLexer(GenMachine[str, Token]):
                 self._raise(f'Unterminated string literal: {buf.getvalue()}')
 
             buf.write(c)
-            if c == q:
-                # Count consecutive backslashes before this quote
-                backslash_count = 0
-                buf_val = buf.getvalue()
-                check_pos = len(buf_val) - 2  # -2 because we just wrote the quote
-                while check_pos >= 0 and buf_val[check_pos] == '\\':
-                    backslash_count += 1
-                    check_pos -= 1
-
-                # Quote is escaped only if preceded by odd number of backslashes
-                if backslash_count % 2 == 0:
-                    break
+            if c == '\\':
+                esc = not esc
+            elif c == q and not esc:
+                break
+            else:
+                esc = False
 
         restore_state()
 
         #
 
         raw = self._flip_buf()
-        try:
-            sv = self._string_literal_parser(raw)
-        except json.JSONDecodeError as e:
-            self._raise(f'Invalid string literal: {raw!r}', e)
 
-        yield self._make_tok('STRING', sv, raw, pos)
+        yield self._make_string_tok(raw, pos)
 
         return self._do_main()
 
+    def _make_number_tok(self, raw: str, pos: Position) -> ta.Sequence[Token]:
+        if self._allow_extended_number_literals:
+            p = 1 if raw[0] in '+-' else 0
+            if (len(raw) - p) > 1 and raw[p] == '0' and raw[p + 1].isdigit():
+                self._raise('Invalid number literal')
+
+        nv: ta.Any
+
+        if (np := self._number_literal_parser) is not None:
+            nv = np(raw)
+
+        else:
+            if not NUMBER_PAT.fullmatch(raw):
+                self._raise(f'Invalid number format: {raw}')
+
+            if '.' in raw or 'e' in raw or 'E' in raw:
+                nv = float(raw)
+            else:
+                nv = int(raw)
+
+        return self._make_tok('NUMBER', nv, raw, pos)
+
     def _do_number(self, c: str):
         check.state(self._buf.tell() == 0)
         self._buf.write(c)
@@ -326,6 +642,9 @@ class JsonStreamLexer(GenMachine[str, Token]):
         pos = self.pos
 
         while True:
+            if (r := self._str_run_in(self._number_run_pat)) is not None:
+                self._buf.write(r)
+
             try:
                 if (c := self._str_char_in()) is None:  # type: ignore[assignment]
                     c = self._yield_char_in((yield None))  # noqa
@@ -343,11 +662,6 @@ class JsonStreamLexer(GenMachine[str, Token]):
 
         #
 
-        if self._allow_extended_number_literals:
-            p = 1 if raw[0] in '+-' else 0
-            if (len(raw) - p) > 1 and raw[p] == '0' and raw[p + 1].isdigit():
-                self._raise('Invalid number literal')
-
         if raw == '-' or (self._allow_extended_number_literals and raw == '+'):
             for svs in [
                 'Infinity',
@@ -382,21 +696,7 @@ class JsonStreamLexer(GenMachine[str, Token]):
 
         #
 
-        nv: ta.Any
-
-        if (np := self._number_literal_parser) is not None:
-            nv = np(raw)
-
-        else:
-            if not NUMBER_PAT.fullmatch(raw):
-                self._raise(f'Invalid number format: {raw}')
-
-            if '.' in raw or 'e' in raw or 'E' in raw:
-                nv = float(raw)
-            else:
-                nv = int(raw)
-
-        yield self._make_tok('NUMBER', nv, raw, pos)
+        yield self._make_number_tok(raw, pos)
 
         #
 
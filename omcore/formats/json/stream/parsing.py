@@ -84,6 +84,11 @@ class JsonStreamParser(GenMachine[Token, Event]):
         else:
             raise JsonStreamParseError(f'Unexpected value: {v!r}')
 
+    def _emit_skipped(self):
+        # A skipped value advances the parser exactly as any other value would, but emits nothing.
+        _, r = self._emit_event(None)
+        return ((), r)
+
     #
 
     def _do_value(self, *, must_be_present: bool = False):
@@ -115,6 +120,11 @@ class JsonStreamParser(GenMachine[Token, Event]):
             yield y
             return r
 
+        elif tok.kind == 'SKIPPED':
+            y, r = self._emit_skipped()
+            yield y
+            return r
+
         elif tok.kind == 'LBRACE':
             y, r = self._emit_begin_object()
             yield y
@@ -0,0 +1,126 @@
+import typing as ta
+
+from .... import dataclasses as dc
+from ....io.pipelines.bytes.decoders import BufferedBytesToMessageDecoderIoPipelineHandler
+from ....io.pipelines.core import IoPipelineHandlerContext
+from ....io.streambufs.types import ByteStreamBuffer
+from .building import JsonValueBuilder
+from .byteslexing import JsonStreamBytesLexer
+from .events import Event
+from .parsing import JsonStreamParser
+from .projecting import JsonStreamProjection
+from .projecting import JsonStreamProjector
+
+
+##
+
+
+@dc.dataclass(frozen=True)
+class JsonStreamEventIoPipelineMessage:
+    """Boxed as events may be types or `None`, neither of which are valid pipeline messages."""
+
+    event: Event
+
+
+@dc.dataclass(frozen=True)
+class JsonStreamValueIoPipelineMessage:
+    value: ta.Any
+
+
+##
+
+
+class JsonStreamEventDecoderIoPipelineHandler(BufferedBytesToMessageDecoderIoPipelineHandler):
+    """utf-8 bytes-like -> `JsonStreamEventIoPipelineMessage`s."""
+
+    def __init__(
+            self,
+            *,
+            lexer: JsonStreamBytesLexer | None = None,
+            parser: JsonStreamParser | None = None,
+            projection: JsonStreamProjection | None = None,
+
+            max_buffer_size: int | None = None,
+            buffer_chunk_size: int = 64 * 1024,
+    ) -> None:
+        super().__init__(
+            max_buffer_size=max_buffer_size,
+            buffer_chunk_size=buffer_chunk_size,
+        )
+
+        if lexer is None:
+            lexer = JsonStreamBytesLexer()
+        self._lexer = lexer
+
+        if parser is None:
+            parser = JsonStreamParser()
+        self._parser = parser
+
+        # The bytes lexer lexes whole buffers at a time and so cannot skip values on request - unselected events are
+        # filtered after parsing.
+        self._projector = JsonStreamProjector(projection) if projection is not None else None
+
+    def _on_event(self, e: Event, out: list[ta.Any]) -> None:
+        out.append(JsonStreamEventIoPipelineMessage(e))
+
+    def _on_final(self, out: list[ta.Any]) -> None:
+        pass
+
+    def _decode_buffer(
+            self,
+            ctx: IoPipelineHandlerContext,
+            buf: ByteStreamBuffer,
+            out: list[ta.Any],
+            *,
+            final: bool = False,
+    ) -> None:
+        if final and (sb := self._buf) is not None:
+            buf = sb
+
+        pj = self._projector
+        for t in self._lexer.lex(buf, final=final):
+            for e in self._parser(t):
+                if pj is not None:
+                    for pe in pj(e):
+                        self._on_event(pe, out)
+                else:
+                    self._on_event(e, out)
+
+        if final:
+            self._parser.close()
+            self._on_final(out)
+
+
+class JsonStreamValueDecoderIoPipelineHandler(JsonStreamEventDecoderIoPipelineHandler):
+    """utf-8 bytes-like -> `JsonStreamValueIoPipelineMessage`s."""
+
+    def __init__(
+            self,
+            *,
+            lexer: JsonStreamBytesLexer | None = None,
+            parser: JsonStreamParser | None = None,
+            projection: JsonStreamProjection | None = None,
+            builder: JsonValueBuilder | None = None,
+
+            max_buffer_size: int | None = None,
+            buffer_chunk_size: int = 64 * 1024,
+    ) -> None:
+        super().__init__(
+            lexer=lexer,
+            parser=parser,
+            projection=projection,
+
+            max_buffer_size=max_buffer_size,
+            buffer_chunk_size=buffer_chunk_size,
+        )
+
+        if builder is None:
+            builder = JsonValueBuilder()
+        self._builder = builder
+
+    def _on_event(self, e: Event, out: list[ta.Any]) -> None:
+        for v in self._builder(e):
+            out.append(JsonStreamValueIoPipelineMessage(v))
+
+    def _on_final(self, out: list[ta.Any]) -> None:
+        self._builder.close()
@@ -0,0 +1,288 @@
+"""
+Selective projection of JSON event streams down to a set of paths, discarding everything else without building it.
+
+Paths are written in the field, index, and wildcard subset of JMESPath syntax - for example `a.b[0].c`, `a[*].b`,
+`a.*.b`, or `a."b.c"` - and the empty path selects the whole value. Selecting a path selects the entire value at it:
+containers along the way are retained holding only their selected members (so selected array elements are renumbered),
+while scalars found where a container is expected are dropped.
+
+When given a skip callback - normally `JsonStreamLexer.skip_values` - unselected values are skipped in the lexer by
+bracket and quote counting and never reach the parser as tokens. Otherwise their events are simply filtered out.
+"""
+import bisect
+import json
+import re
+import sys
+import typing as ta
+
+from .... import lang
+from .events import BeginArray
+from .events import BeginObject
+from .events import EndArray
+from .events import EndObject
+from .events import Event
+from .events import Key
+
+
+##
+
+
+class AnyKey(lang.Marker):
+    pass
+
+
+class AnyIndex(lang.Marker):
+    pass
+
+
+JsonStreamPathStep: ta.TypeAlias = ta.Union[  # noqa
+    str,
+    int,
+    type[AnyKey],
+    type[AnyIndex],
+]
+
+JsonStreamPath: ta.TypeAlias = tuple[JsonStreamPathStep, ...]
+
+
+_PATH_STEP_PAT = re.compile(r"""
+    (?P<key>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<quoted_key>"(?:[^"\\]|\\.)*")
+    | (?P<any_key>\*)
+    | \[ (?: (?P<index>\d+) | (?P<any_index>\*) ) \]
+""", re.VERBOSE)
+
+
+def parse_json_stream_path(s: str) -> JsonStreamPath:
+    steps: list[JsonStreamPathStep] = []
+
+    i = 0
+    n = len(s)
+    while i < n:
+        dotted = False
+        if steps and s[i] != '[':
+            if s[i] != '.':
+                raise ValueError(f'Invalid path: {s!r}')
+            dotted = True
+            i += 1
+
+        if (m := _PATH_STEP_PAT.match(s, i)) is None:
+            raise ValueError(f'Invalid path: {s!r}')
+
+        g = m.lastgroup
+        if dotted and (g == 'index' or g == 'any_index'):
+            raise ValueError(f'Invalid path: {s!r}')
+
+        if g == 'key':
+            steps.append(m.group(g))
+        elif g == 'quoted_key':
+            steps.append(json.loads(m.group(g)))
+        elif g == 'any_key':
+            steps.append(AnyKey)
+        elif g == 'index':
+            steps.append(int(m.group(g)))
+        else:
+            steps.append(AnyIndex)
+
+        i = m.end()
+
+    return tuple(steps)
+
+
+##
+
+
+class JsonStreamProjection:
+    """An immutable trie of selected paths, each node of which represents the selection at one position in a value."""
+
+    def __init__(self, paths: ta.Iterable[str | JsonStreamPath]) -> None:
+        super().__init__()
+
+        ps = frozenset(
+            parse_json_stream_path(p) if isinstance(p, str) else tuple(p)
+            for p in paths
+        )
+
+        self._is_all = () in ps
+
+        self._keys: dict[str, JsonStreamProjection] = {}
+        self._any_key: JsonStreamProjection | None = None
+        self._indices: dict[int, JsonStreamProjection] = {}
+        self._any_index: JsonStreamProjection | None = None
+        self._sorted_indices: list[int] = []
+
+        if self._is_all:
+            return
+
+        by_step: dict[JsonStreamPathStep, set[JsonStreamPath]] = {}
+        for p in ps:
+            by_step.setdefault(p[0], set()).add(p[1:])
+
+        any_key_ps = by_step.pop(AnyKey, set())
+        any_index_ps = by_step.pop(AnyIndex, set())
+
+        if any_key_ps:
+            self._any_key = JsonStreamProjection(any_key_ps)
+        if any_index_ps:
+            self._any_index = JsonStreamProjection(any_index_ps)
+
+        for s, sps in by_step.items():
+            if isinstance(s, str):
+                self._keys[s] = JsonStreamProjection(sps | any_key_ps)
+            else:
+                self._indices[s] = JsonStreamProjection(sps | any_index_ps)  # type: ignore[index]
+
+        self._sorted_indices = sorted(self._indices)
+
+    @property
+    def is_all(self) -> bool:
+        return self._is_all
+
+    def key_child(self, k: str) -> JsonStreamProjection | None:
+        if self._is_all:
+            return self
+        try:
+            return self._keys[k]
+        except KeyError:
+            return self._any_key
+
+    def index_child(self, i: int) -> JsonStreamProjection | None:
+        if self._is_all:
+            return self
+        try:
+            return self._indices[i]
+        except KeyError:
+            return self._any_index
+
+    def unselected_run(self, i: int) -> int:
+        """
+        Returns the number of consecutive unselected array elements starting at the given index, or `sys.maxsize` if
+        no elements from that index onwards are selected.
+        """
+
+        if self._is_all or self._any_index is not None:
+            return 0
+
+        si = self._sorted_indices
+        if (j := bisect.bisect_left(si, i)) >= len(si):
+            return sys.maxsize
+        return si[j] - i
+
+
+##
+
+
+class JsonStreamProjector:
+    """Events -> Events, retaining only those under paths selected by the given projection."""
+
+    class _Frame:
+        __slots__ = ('proj', 'is_array', 'idx', 'key', 'child')
+
+        def __init__(self, proj: JsonStreamProjection, is_array: bool) -> None:
+            self.proj = proj
+            self.is_array = is_array
+
+            self.idx = 0
+            self.key: Key | None = None
+            self.child: JsonStreamProjection | None = None
+
+    def __init__(
+            self,
+            projection: JsonStreamProjection,
+            *,
+            skip: ta.Callable[[int], None] | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._projection = projection
+        self._skip = skip
+
+        self._stack: list[JsonStreamProjector._Frame] = []
+
+        # Depths within a wholly selected or wholly unselected container being passed through or dropped.
+        self._pass_depth = 0
+        self._drop_depth = 0
+
+    def _skip_elements(self, f: _Frame) -> None:
+        if (skip := self._skip) is not None and (n := f.proj.unselected_run(f.idx)):
+            skip(n)
+            f.idx += n
+
+    def _end_value(self) -> None:
+        if not (stk := self._stack):
+            return
+
+        f = stk[-1]
+        if f.is_array:
+            f.idx += 1
+            self._skip_elements(f)
+        else:
+            f.key = None
+            f.child = None
+
+    def __call__(self, e: Event) -> ta.Sequence[Event]:
+        if self._pass_depth:
+            if e is BeginObject or e is BeginArray:
+                self._pass_depth += 1
+            elif e is EndObject or e is EndArray:
+                self._pass_depth -= 1
+                if not self._pass_depth:
+                    self._end_value()
+            return (e,)
+
+        if self._drop_depth:
+            if e is BeginObject or e is BeginArray:
+                self._drop_depth += 1
+            elif e is EndObject or e is EndArray:
+                self._drop_depth -= 1
+                if not self._drop_depth:
+                    self._end_value()
+            return ()
+
+        if isinstance(e, Key):
+            f = self._stack[-1]
+            if (c := f.proj.key_child(e.key)) is not None:
+                f.key = e
+                f.child = c
+            elif self._skip is not None:
+                self._skip(1)
+            return ()
+
+        if e is EndObject or e is EndArray:
+            self._stack.pop()
+            self._end_value()
+            return (e,)
+
+        k: Key | None = None
+        p: JsonStreamProjection | None
+        if not self._stack:
+            p = self._projection
+        elif (f := self._stack[-1]).is_array:
+            p = f.proj.index_child(f.idx)
+        else:
+            p = f.child
+            k = f.key
+
+        is_container = e is BeginObject or e is BeginArray
+
+        if p is None or not (p.is_all or is_container):
+            if is_container:
+                self._drop_depth = 1
+            else:
+                self._end_value()
+            return ()
+
+        if p.is_all:
+            if is_container:
+                self._pass_depth = 1
+            else:
+                self._end_value()
+
+        else:
+            self._stack.append(nf := JsonStreamProjector._Frame(p, e is BeginArray))
+            if nf.is_array:
+                self._skip_elements(nf)
+
+        if k is not None:
+            return (k, e)
+        return (e,)
@@ -0,0 +1,66 @@
+import json
+
+from ...... import check
+from ...... import lang
+from ......io.streambufs.segmented import SegmentedByteStreamBuffer
+from ....tests.helpers import STRESS_DOC
+from ...building import JsonValueBuilder
+from ...byteslexing import JsonStreamBytesLexer
+from ...parsing import JsonStreamParser
+from ...utils import stream_parse_exactly_one_value
+
+
+def _parse_bytes(chunks: list[bytes]) -> list:
+    buf = SegmentedByteStreamBuffer()
+    lex = JsonStreamBytesLexer()
+    out: list = []
+    with JsonStreamParser() as parse:
+        with JsonValueBuilder() as build:
+            for i, c in enumerate([*chunks, b'']):
+                buf.write(c)
+                for t in lex.lex(buf, final=i == len(chunks)):
+                    for e in parse(t):
+                        out.extend(build(e))
+    return out
+
+
+def _main() -> None:
+    n = 200
+    doc = '[%s]' % (','.join([STRESS_DOC] * n),)  # noqa
+    mb = len(doc.encode()) / (1024 * 1024)
+
+    with lang.Timer() as tmr:
+        x = json.loads(doc)
+    print(f'json.loads: {tmr.elapsed * 1_000.:_.2f} ms, {mb / tmr.elapsed:_.2f} MiB/s')
+
+    for cs in [1, 64, 4 * 1024, 64 * 1024]:
+        chunks = [doc[i:i + cs] for i in range(0, len(doc), cs)]
+
+        with lang.Timer() as tmr:
+            obj = stream_parse_exactly_one_value(chunks)
+        print(f'stream, chunk size {cs}: {tmr.elapsed * 1_000.:_.2f} ms, {mb / tmr.elapsed:_.2f} MiB/s')
+
+        assert obj == x
+
+    for cs in [4 * 1024, 64 * 1024]:
+        chunks = [doc[i:i + cs] for i in range(0, len(doc), cs)]
+
+        with lang.Timer() as tmr:
+            obj = stream_parse_exactly_one_value(chunks, projection=['[*].user.id'])
+        print(f'stream projected, chunk size {cs}: {tmr.elapsed * 1_000.:_.2f} ms, {mb / tmr.elapsed:_.2f} MiB/s')
+
+        assert obj == [{'user': {'id': e['user']['id']}} for e in x]
+
+    bdoc = doc.encode()
+    for cs in [64, 4 * 1024, 64 * 1024]:
+        bchunks = [bdoc[i:i + cs] for i in range(0, len(bdoc), cs)]
+
+        with lang.Timer() as tmr:
+            obj = check.single(_parse_bytes(bchunks))
+        print(f'stream bytes, chunk size {cs}: {tmr.elapsed * 1_000.:_.2f} ms, {mb / tmr.elapsed:_.2f} MiB/s')
+
+        assert obj == x
+
+
+if __name__ == '__main__':
+    _main()
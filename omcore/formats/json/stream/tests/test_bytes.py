@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from .....io.pipelines.core import IoPipeline
+from .....io.pipelines.handlers.queues import InboundQueueIoPipelineHandler
+from .....io.streambufs.segmented import SegmentedByteStreamBuffer
+from ...tests.helpers import TEST_DOCS
+from ...tests.helpers import assert_json_eq
+from ..byteslexing import JsonStreamBytesLexer
+from ..errors import JsonStreamError
+from ..events import BeginArray
+from ..events import EndArray
+from ..lexing import JsonStreamLexer
+from ..pipelines import JsonStreamEventDecoderIoPipelineHandler
+from ..pipelines import JsonStreamEventIoPipelineMessage
+from ..pipelines import JsonStreamValueDecoderIoPipelineHandler
+
+
+def lex_bytes(b, n, **kwargs):
+    buf = SegmentedByteStreamBuffer(**kwargs)
+    lex = JsonStreamBytesLexer()
+    out = []
+    for i in range(0, len(b), n):
+        buf.write(b[i:i + n])
+        out.extend(lex.lex(buf))
+    out.extend(lex.lex(buf, final=True))
+    assert not len(buf)
+    return out
+
+
+@pytest.mark.parametrize('chunk_size', [0, 7])
+def test_bytes_lexer(chunk_size):
+    for s in TEST_DOCS:
+        with JsonStreamLexer() as lex:
+            ref = [*lex(s), *lex('')]
+
+        b = s.encode()
+        for n in [1, 2, 3, 16, len(b) + 1]:
+            ts = lex_bytes(b, n, chunk_size=chunk_size)
+            if s.isascii():
+                assert ts == ref
+            else:
+                assert [(t.kind, t.value) for t in ts] == [(t.kind, t.value) for t in ref]
+
+
+def test_bytes_lexer_strings():
+    for s in [
+        r'"abc"',
+        r'"a\"b"',
+        r'"a\\"',
+        r'"a\\\"b\\"',
+        r'"é\n"',
+        '"é☃"',
+    ]:
+        b = s.encode()
+        for n in range(1, len(b) + 1):
+            assert [t.value for t in lex_bytes(b, n)] == [json.loads(s)]
+
+
+def test_bytes_lexer_errors():
+    for b in [
+        b'"abc',
+        b'[1, tru',
+        b'[1, trux]',
+        b'01',
+        b'"a\nb"',
+        b'"\xff"',
+        b'\x0c[]',
+    ]:
+        for n in [1, 2, len(b)]:
+            with pytest.raises(JsonStreamError):
+                lex_bytes(b, n)
+
+
+def test_pipeline():
+    ndj = b'{"a": [1, 2.5, "x"]}\n{"b": null}\n[true, -Infinity]\n'
+
+    ch = IoPipeline.new([
+        JsonStreamValueDecoderIoPipelineHandler(),
+        ibq := InboundQueueIoPipelineHandler(),
+    ])
+
+    for i in range(0, len(ndj), 5):
+        ch.feed_in(ndj[i:i + 5])
+    ch.feed_final_input()
+
+    vs = [m.value for m in ibq.drain()[:-1]]
+    assert len(vs) == 3
+    for v, l in zip(vs, ndj.splitlines()):
+        assert_json_eq(v, json.loads(l))
+
+    ch = IoPipeline.new([
+        JsonStreamEventDecoderIoPipelineHandler(),
+        ibq := InboundQueueIoPipelineHandler(),
+    ])
+
+    ch.feed_in(b'[1, "a')
+    assert ibq.drain() == [JsonStreamEventIoPipelineMessage(e) for e in [BeginArray, 1]]
+    ch.feed_in(b'b", null]')
+    assert ibq.drain() == [JsonStreamEventIoPipelineMessage(e) for e in ['ab', None, EndArray]]
@@ -0,0 +1,63 @@
+import pytest
+
+from ....json5.literals import parse_number_literal
+from ....json5.literals import parse_string_literal
+from ...tests.helpers import TEST_DOCS
+from ..errors import JsonStreamError
+from ..lexing import JsonStreamLexer
+
+
+EXTRA_DOCS = [
+    '[1, 2.5e10,  -3 , -Infinity, true, false, null]',
+    r'["a\\", "b\"\\", "c\\\"d", "é\n"]',
+    '[1١2, 3]',
+    '["unterminated',
+    '[01]',
+    '[nul]',
+]
+
+EXTENDED_DOCS = [
+    "// hi\n{ /* x */ 'a': 0x1F, b: +.5, c: 'q\\'\"', d: [NaN, -NaN, +Infinity] }\n\n",
+    '　﻿[ 1, 2 ]',
+]
+
+
+def lex_chunked(s, n, **kwargs):
+    out = []
+    try:
+        with JsonStreamLexer(**kwargs) as lex:
+            for i in range(0, len(s), n):
+                out.extend(lex(s[i:i + n]))
+            out.extend(lex(''))
+    except JsonStreamError as e:
+        out.append(e)
+    return out
+
+
+@pytest.mark.parametrize('include_space', [False, True])
+@pytest.mark.parametrize('include_raw', [False, True])
+def test_chunked(include_space, include_raw):
+    for s in [*TEST_DOCS, *EXTRA_DOCS]:
+        kw = dict(include_space=include_space, include_raw=include_raw)
+        ref = lex_chunked(s, 1, **kw)
+        for n in [2, 3, 7, 64, len(s) + 1]:
+            assert lex_chunked(s, n, **kw) == ref
+
+
+def test_chunked_extended():
+    kw = dict(
+        include_raw=True,
+        allow_extended_space=True,
+        allow_comments=True,
+        include_comments=True,
+        allow_single_quotes=True,
+        string_literal_parser=parse_string_literal,
+        allow_extended_number_literals=True,
+        number_literal_parser=parse_number_literal,
+        allow_extended_idents=True,
+    )
+    for s in EXTENDED_DOCS:
+        ref = lex_chunked(s, 1, **kw)
+        assert not any(isinstance(t, JsonStreamError) for t in ref)
+        for n in [2, 3, 7, 64, len(s) + 1]:
+            assert lex_chunked(s, n, **kw) == ref
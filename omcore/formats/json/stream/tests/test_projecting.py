@@ -0,0 +1,122 @@
+import json
+import random
+
+import pytest
+
+from .....io.pipelines.core import IoPipeline
+from .....io.pipelines.handlers.queues import InboundQueueIoPipelineHandler
+from ..lexing import JsonStreamLexer
+from ..pipelines import JsonStreamValueDecoderIoPipelineHandler
+from ..projecting import AnyIndex
+from ..projecting import AnyKey
+from ..projecting import JsonStreamProjection
+from ..projecting import JsonStreamProjector
+from ..projecting import parse_json_stream_path
+from ..utils import JsonStreamValueParser
+from ..utils import make_machinery
+from ..utils import stream_parse_values
+
+
+_DROP = object()
+
+
+def project_value(v, p):
+    if p is None:
+        return _DROP
+    if p.is_all:
+        return v
+    if isinstance(v, dict):
+        return {k: r for k, x in v.items() if (r := project_value(x, p.key_child(k))) is not _DROP}
+    if isinstance(v, list):
+        return [r for i, x in enumerate(v) if (r := project_value(x, p.index_child(i))) is not _DROP]
+    return _DROP
+
+
+def random_value(rnd, d=0):
+    r = rnd.random()
+    if d > 4 or r < .3:
+        return rnd.choice([1, -2.5e3, 's"t\\]', '}{[', True, None, 'x', 0])
+    if r < .65:
+        return {rnd.choice('abcd'): random_value(rnd, d + 1) for _ in range(rnd.randrange(4))}
+    return [random_value(rnd, d + 1) for _ in range(rnd.randrange(5))]
+
+
+def test_parse_path():
+    assert parse_json_stream_path('') == ()
+    assert parse_json_stream_path('a.b[0].c') == ('a', 'b', 0, 'c')
+    assert parse_json_stream_path('a."x.y"[*].*') == ('a', 'x.y', AnyIndex, AnyKey)
+    assert parse_json_stream_path('[1][*]') == (1, AnyIndex)
+
+    for s in ['a..b', 'a.[0]', '.a', 'a[-1]', 'a b', '[x]']:
+        with pytest.raises(ValueError):  # noqa
+            parse_json_stream_path(s)
+
+
+PATHS = [
+    [''],
+    ['a'],
+    ['a.b'],
+    ['a[*].b', 'c'],
+    ['[0]', '[2].a'],
+    ['*.a', 'b.c'],
+    ['a.*', 'a.b.c'],
+    ['[1][*]'],
+    ['d[3]', 'd[0]'],
+    ['*'],
+    ['[*]'],
+]
+
+
+@pytest.mark.parametrize('skip', [True, False])
+def test_projection(skip):
+    rnd = random.Random(0)
+    for _ in range(50):
+        v = random_value(rnd)
+        doc = json.dumps(v, indent=rnd.choice([None, 1]))
+
+        for ps in PATHS:
+            proj = JsonStreamProjection(ps)
+            pv = project_value(v, proj)
+            ex = [] if pv is _DROP else [pv]
+
+            for n in [1, 3, 1000]:
+                m = make_machinery(projection=proj)
+                if not skip:
+                    m = m._replace(project=JsonStreamProjector(proj))
+
+                chunks = [doc[i:i + n] for i in range(0, len(doc), n)]
+                assert list(JsonStreamValueParser.parse_values(m, chunks)) == ex
+
+
+def test_lexer_skip():
+    with JsonStreamLexer(allow_comments=True, allow_single_quotes=True) as lex:
+        ts = []
+        for c in '{"a": [1, {"x": \'}\'} /* ] */, "]"], "b": 2}':
+            for t in lex(c):
+                ts.append(t)
+                if t.kind == 'COLON' and len(ts) == 3:
+                    lex.skip_values()
+        ts.extend(lex(''))
+
+    assert [t.kind for t in ts] == ['LBRACE', 'STRING', 'COLON', 'SKIPPED', 'COMMA', 'STRING', 'COLON', 'NUMBER', 'RBRACE']  # noqa
+
+
+def test_multiple_values():
+    assert list(stream_parse_values(['{"a": 1, "b": 2} {"b": 3} [4]'], projection=['b'])) == [
+        {'b': 2},
+        {'b': 3},
+        [],
+    ]
+
+
+def test_pipeline():
+    ch = IoPipeline.new([
+        JsonStreamValueDecoderIoPipelineHandler(projection=JsonStreamProjection(['[*].a'])),
+        ibq := InboundQueueIoPipelineHandler(),
+    ])
+
+    ch.feed_in(b'[{"a": 1, "b": [2, 3]}, ')
+    ch.feed_in(b'{"b": {}}]')
+    ch.feed_final_input()
+
+    assert [m.value for m in ibq.drain()[:-1]] == [[{'a': 1}, {}]]
@@ -29,12 +29,16 @@ SpaceTokenKind: ta.TypeAlias = ta.Literal['SPACE']
 
 CommentTokenKind: ta.TypeAlias = ta.Literal['COMMENT']
 
+# Stands in for a whole value the lexer was asked to skip - see `JsonStreamLexer.skip_values`.
+SkippedTokenKind: ta.TypeAlias = ta.Literal['SKIPPED']
+
 TokenKind: ta.TypeAlias = ta.Union[  # noqa
     IdentTokenKind,
     ValueTokenKind,
     ControlTokenKind,
     SpaceTokenKind,
     CommentTokenKind,
+    SkippedTokenKind,
 ]
 
 
@@ -32,6 +32,8 @@ from .errors import JsonStreamError
 from .events import Event
 from .lexing import JsonStreamLexer
 from .parsing import JsonStreamParser
+from .projecting import JsonStreamProjection
+from .projecting import JsonStreamProjector
 from .tokens import Token
 
 
@@ -43,6 +45,7 @@ class JsonStreamValueParser(lang.ExitStacked):
         lex: JsonStreamLexer
         parse: JsonStreamParser
         build: JsonValueBuilder
+        project: JsonStreamProjector | None = None
 
     def __init__(self, m: Machinery) -> None:
         super().__init__()
@@ -56,6 +59,15 @@ class JsonStreamValueParser(lang.ExitStacked):
         self._enter_context(self._m.parse)
 
     def feed(self, i: ta.Iterable[str]) -> ta.Iterator[ta.Any]:
+        if (pj := self._m.project) is not None:
+            for c in i:
+                for t in self._m.lex(c):
+                    for e in self._m.parse(t):
+                        for pe in pj(e):
+                            for v in self._m.build(pe):  # noqa
+                                yield v
+            return
+
         for c in i:
             for t in self._m.lex(c):
                 for e in self._m.parse(t):
@@ -120,9 +132,10 @@ class DebugJsonStreamValueParser(JsonStreamValueParser):
                 self._tokens.append(t)
                 for e in self._m.parse(t):
                     self._events.append(e)
-                    for v in self._m.build(e):
-                        self._values.append(v)
-                        yield v
+                    for pe in (self._m.project(e) if self._m.project is not None else (e,)):
+                        for v in self._m.build(pe):
+                            self._values.append(v)
+                            yield v
 
 
 ##
@@ -132,17 +145,31 @@ def make_machinery(
         *,
         include_raw: bool = False,
         yield_object_lists: bool = False,
+        projection: JsonStreamProjection | ta.Iterable[str] | None = None,
 ) -> JsonStreamValueParser.Machinery:
+    lex = JsonStreamLexer(
+        include_raw=include_raw,
+    )
+
+    project: JsonStreamProjector | None = None
+    if projection is not None:
+        if not isinstance(projection, JsonStreamProjection):
+            projection = JsonStreamProjection(projection)
+        project = JsonStreamProjector(
+            projection,
+            skip=lex.skip_values,
+        )
+
     return JsonStreamValueParser.Machinery(
-        JsonStreamLexer(
-            include_raw=include_raw,
-        ),
+        lex,
 
         JsonStreamParser(),
 
         JsonValueBuilder(
             yield_object_lists=yield_object_lists,
         ),
+
+        project,
     )
 
 
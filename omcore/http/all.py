@@ -39,6 +39,7 @@ with _lang.auto_proxy_init(globals()):
 
         async_client,
         manage_async_client,
+        manage_async_client_pool,
 
         async_request,
     )
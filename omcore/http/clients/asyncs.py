@@ -1,6 +1,7 @@
-# ruff: noqa: UP037 UP043 UP045
+# ruff: noqa: UP006 UP007 UP037 UP041 UP043 UP045
 # @om-lite
 import abc
+import asyncio
 import contextlib
 import dataclasses as dc
 import typing as ta
@@ -12,6 +13,7 @@ from .base import BaseHttpClient
 from .base import BaseHttpClientResponse
 from .base import BaseHttpClientResponseT
 from .base import HttpClientContext
+from .base import HttpClientError
 from .base import HttpClientRequest
 from .base import HttpClientResponse
 from .base import StatusHttpClientError
@@ -122,6 +124,57 @@ class AsyncHttpClient(BaseHttpClient, Abstract):
         )) as resp:
             return await async_read_http_client_response(resp)
 
+    async def request_many(
+            self,
+            reqs: ta.Iterable[HttpClientRequest],
+            *,
+            context: ta.Optional[HttpClientContext] = None,
+            check: bool = False,
+            max_concurrency: ta.Optional[int] = None,
+            timeout_s: ta.Optional[float] = None,
+            return_exceptions: bool = False,
+    ) -> ta.List[ta.Union[HttpClientResponse, BaseException]]:
+        """
+        Makes all of `reqs` concurrently, at most `max_concurrency` at once, returning their responses in order. Each is
+        bounded by its own `timeout_s`, or else by the one given, timing out with an `HttpClientError`. Errors are
+        returned in place of responses if `return_exceptions` is set, and otherwise the first is raised once all have
+        completed.
+        """
+
+        sem = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+        async def do(req: HttpClientRequest) -> HttpClientResponse:
+            try:
+                return await asyncio.wait_for(
+                    self.request(req, context=context, check=check),
+                    req.timeout_s if req.timeout_s is not None else timeout_s,
+                )
+            except asyncio.TimeoutError as e:
+                raise HttpClientError from e
+
+        async def one(req: HttpClientRequest) -> HttpClientResponse:
+            if sem is None:
+                return await do(req)
+            async with sem:
+                return await do(req)
+
+        return self._gather_many_results(
+            await asyncio.gather(*[one(req) for req in reqs], return_exceptions=True),
+            return_exceptions=return_exceptions,
+        )
+
+    @staticmethod
+    def _gather_many_results(
+            results: ta.Sequence[ta.Any],
+            *,
+            return_exceptions: bool = False,
+    ) -> ta.List[ta.Union[HttpClientResponse, BaseException]]:
+        if not return_exceptions:
+            for r in results:
+                if isinstance(r, BaseException):
+                    raise r
+        return list(results)
+
     async def stream_request(
             self,
             req: HttpClientRequest,
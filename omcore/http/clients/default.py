@@ -1,5 +1,6 @@
 import abc
 import contextlib
+import contextvars
 import typing as ta
 
 from ... import lang
@@ -16,6 +17,7 @@ with lang.auto_proxy_import(globals()):
     from . import middleware as _middleware  # noqa
     from . import urllib as _urllib  # noqa
     from .pipelines import asyncio as _pipelines_asyncio  # noqa
+    from .pipelines import pools as _pipelines_pools  # noqa
     from .pipelines import sync as _pipelines_sync  # noqa
 
 
@@ -30,11 +32,25 @@ def _default_client() -> HttpClient:
     return _urllib.UrllibHttpClient()
 
 
+_ASYNC_CLIENT_POOL: contextvars.ContextVar[_pipelines_pools.AsyncioIoPipelineHttpConnectionPool | None] = (
+    contextvars.ContextVar(f'{__name__}._ASYNC_CLIENT_POOL', default=None)
+)
+
+
 def _default_async_client() -> AsyncHttpClient:
     # return _httpx.HttpxAsyncHttpClient()
 
+    client: AsyncHttpClient
+    if (pool := _ASYNC_CLIENT_POOL.get()) is not None:
+        client = _pipelines_asyncio.AsyncioIoPipelineAsyncHttpClient(pool=pool)
+    else:
+        # Default clients are made per request, so one's own pool would be closed with it.
+        client = _pipelines_asyncio.AsyncioIoPipelineAsyncHttpClient(
+            _pipelines_asyncio.AsyncioIoPipelineAsyncHttpClient.Config(pool_config=None),
+        )
+
     return _middleware.MiddlewareAsyncHttpClient(
-        _pipelines_asyncio.AsyncioIoPipelineAsyncHttpClient(),
+        client,
         [
             _middleware.RedirectHandlingHttpClientMiddleware(),
         ],
@@ -204,6 +220,21 @@ async def manage_async_client(client: AsyncHttpClient | None = None) -> ta.Async
             yield client
 
 
+@contextlib.asynccontextmanager
+async def manage_async_client_pool() -> ta.AsyncGenerator[_pipelines_pools.AsyncioIoPipelineHttpConnectionPool]:
+    """
+    Shares a connection pool between the default async clients used within, closing it on exit. Without one, each
+    request made through a default client is made on a connection of its own.
+    """
+
+    async with _pipelines_pools.AsyncioIoPipelineHttpConnectionPool() as pool:
+        tok = _ASYNC_CLIENT_POOL.set(pool)
+        try:
+            yield pool
+        finally:
+            _ASYNC_CLIENT_POOL.reset(tok)
+
+
 #
 
 
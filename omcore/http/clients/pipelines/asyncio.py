@@ -1,8 +1,11 @@
-# ruff: noqa: UP006 UP007 UP037 UP045
+# ruff: noqa: UP006 UP007 UP037 UP041 UP045
 # @om-lite
 import asyncio
+import collections
 import dataclasses as dc
+import functools
 import io
+import ssl
 import typing as ta
 
 from ....asyncs.asyncio.timeouts import asyncio_maybe_timeout
@@ -18,6 +21,8 @@ from ...clients.asyncs import AsyncHttpClient
 from ...clients.asyncs import AsyncStreamHttpClientResponse
 from ...clients.base import HttpClientContext
 from ...clients.base import HttpClientRequest
+from ...clients.base import HttpClientResponse
+from ...clients.base import StatusHttpClientError
 from ...pipelines.clients.clients import IoPipelineHttpClientMessages
 from ...pipelines.responses import FullIoPipelineHttpResponse
 from ...pipelines.responses import IoPipelineHttpResponseBodyData
@@ -25,6 +30,9 @@ from ...pipelines.responses import IoPipelineHttpResponseEnd
 from ...pipelines.responses import IoPipelineHttpResponseHead
 from ..base import HttpClientError
 from .base import BaseIoPipelineHttpClient
+from .pools import AsyncioIoPipelineHttpConnection
+from .pools import AsyncioIoPipelineHttpConnectionPool
+from .pools import IoPipelineHttpOrigin
 
 
 ##
@@ -40,6 +48,8 @@ class AsyncioIoPipelineAsyncHttpClient(AsyncHttpClient, BaseIoPipelineHttpClient
     def __init__(
             self,
             config: Config = Config.DEFAULT,
+            *,
+            pool: ta.Optional[AsyncioIoPipelineHttpConnectionPool] = None,
             **pipeline_kwargs: ta.Any,
     ) -> None:
         super().__init__(
@@ -47,6 +57,24 @@ class AsyncioIoPipelineAsyncHttpClient(AsyncHttpClient, BaseIoPipelineHttpClient
             **pipeline_kwargs,
         )
 
+        self._owns_pool = pool is None and config.pool_config is not None
+        if self._owns_pool:
+            pool = AsyncioIoPipelineHttpConnectionPool(config.pool_config)
+        self._pool = pool
+
+    @property
+    def pool(self) -> ta.Optional[AsyncioIoPipelineHttpConnectionPool]:
+        return self._pool
+
+    async def close(self) -> None:
+        """Closes the client's pool, if it owns one."""
+
+        if self._owns_pool and (pool := self._pool) is not None:
+            await pool.close()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
     #
 
     class _DriverResponseReader:
@@ -58,7 +86,19 @@ class AsyncioIoPipelineAsyncHttpClient(AsyncHttpClient, BaseIoPipelineHttpClient
 
             self._drv = drv
 
+            self._done = False
+            self._eof = False
+
+        @property
+        def done(self) -> bool:
+            """Whether the response was read to its end, leaving the connection ready for another."""
+
+            return self._done
+
         async def read1(self, n: int = -1, /) -> Bytes:
+            if self._eof:
+                return b''
+
             while True:
                 out = check.not_none(await self._drv.next())
 
@@ -68,11 +108,15 @@ class AsyncioIoPipelineAsyncHttpClient(AsyncHttpClient, BaseIoPipelineHttpClient
                     if isinstance(msg, IoPipelineHttpResponseBodyData):
                         return ByteStreamBuffers.to_bytes(msg.data)
 
+                    elif isinstance(msg, IoPipelineHttpResponseEnd):
+                        self._done = self._eof = True
+                        return b''
+
                     elif isinstance(msg, (
-                            IoPipelineHttpResponseEnd,
                             IoPipelineMessages.FinalInput,
                             IoPipelineHttpClientMessages.Close,
                     )):
+                        self._eof = True
                         return b''
 
                     else:
@@ -91,115 +135,374 @@ class AsyncioIoPipelineAsyncHttpClient(AsyncHttpClient, BaseIoPipelineHttpClient
 
     #
 
-    async def _stream_request(self, ctx: HttpClientContext, req: HttpClientRequest) -> AsyncStreamHttpClientResponse:
-        try:
-            prepared = self._prepare_request(req)
+    async def _connect(
+            self,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+            ssl_session: ta.Optional[ssl.SSLSession] = None,
+    ) -> AsyncioIoPipelineHttpConnection:
+        reader, writer = await asyncio_maybe_timeout(
+            asyncio.open_connection(
+                prepared.parsed_url.host,
+                prepared.parsed_url.port,
+            ),
+            self._config.connect_timeout_s,
+        )
 
-            reader, writer = await asyncio_maybe_timeout(
-                asyncio.open_connection(
-                    prepared.parsed_url.host,
-                    prepared.parsed_url.port,
+        try:
+            drv = PollAsyncioStreamIoPipelineDriver(
+                self._build_connection_pipeline_spec(
+                    prepared,
+                    ssl_ctx=self._pool.ssl_context if self._pool is not None and prepared.parsed_url.is_ssl else None,
+                    ssl_session=ssl_session,
                 ),
-                self._config.connect_timeout_s,
+                reader,
+                writer,
             )
 
-            try:
-                drv = PollAsyncioStreamIoPipelineDriver(
-                    prepared.pipeline_spec,
-                    reader,
-                    writer,
-                )
+        except BaseException:
+            writer.close()
+            await writer.wait_closed()
 
-                drv.enqueue(IoPipelineHttpClientMessages.Request(
-                    prepared.full_request,
-                    # aggregate=...
-                ))
+            raise
 
-                response: ta.Union[IoPipelineHttpResponseHead, FullIoPipelineHttpResponse, None] = None
+        return AsyncioIoPipelineHttpConnection(prepared.parsed_url.origin, reader, writer, drv)
 
-                while True:
-                    if (out := await drv.next()) is not None:
-                        if isinstance(out, IoPipelineHttpClientMessages.Output):
-                            msg = out.msg
+    async def _acquire_connection(
+            self,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+    ) -> AsyncioIoPipelineHttpConnection:
+        if (pool := self._pool) is None:
+            return await self._connect(prepared)
+
+        return await pool.acquire(
+            prepared.parsed_url.origin,
+            functools.partial(self._connect, prepared),
+        )
 
-                            if isinstance(msg, IoPipelineHttpResponseHead):
-                                check.none(response)
-                                response = msg
+    async def _release_connection(self, conn: AsyncioIoPipelineHttpConnection, *, reuse: bool = False) -> None:
+        if (pool := self._pool) is None:
+            await conn.close()
+        else:
+            await pool.release(conn, reuse=reuse)
 
-                                break
+    def _enqueue_request(
+            self,
+            conn: AsyncioIoPipelineHttpConnection,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+    ) -> None:
+        conn.begin_request()
+        conn.driver.enqueue(IoPipelineHttpClientMessages.Request(
+            prepared.full_request,
+            # aggregate=...
+        ))
 
-                            if isinstance(msg, FullIoPipelineHttpResponse):
-                                check.none(response)
-                                response = msg
+    async def _next_response(
+            self,
+            conn: AsyncioIoPipelineHttpConnection,
+    ) -> ta.Union[IoPipelineHttpResponseHead, FullIoPipelineHttpResponse, None]:
+        drv = conn.driver
 
-                                drv.enqueue(IoPipelineHttpClientMessages.Close())
+        while True:
+            if (out := await drv.next()) is not None:
+                if isinstance(out, IoPipelineHttpClientMessages.Output):
+                    msg = out.msg
 
-                            elif isinstance(msg, (IoPipelineMessages.FinalInput, IoPipelineHttpClientMessages.Close)):
-                                pass
+                    if isinstance(msg, (IoPipelineHttpResponseHead, FullIoPipelineHttpResponse)):
+                        return msg
 
-                            else:
-                                raise TypeError(out)  # noqa
+                    elif isinstance(msg, (IoPipelineMessages.FinalInput, IoPipelineHttpClientMessages.Close)):
+                        pass
 
-                        else:
-                            raise TypeError(out)  # noqa
+                    else:
+                        raise TypeError(out)  # noqa
 
-                    if not drv.pipeline.is_ready:
-                        break
+                else:
+                    raise TypeError(out)  # noqa
 
-                #
+            if not drv.pipeline.is_ready:
+                return None
 
-                response = check.not_none(response)  # type: ignore[assignment]
+    async def _send_request(
+            self,
+            conn: AsyncioIoPipelineHttpConnection,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+    ) -> ta.Union[IoPipelineHttpResponseHead, FullIoPipelineHttpResponse, None]:
+        self._enqueue_request(conn, prepared)
+        return await self._next_response(conn)
 
-                head: IoPipelineHttpResponseHead
+    async def _stream_request(self, ctx: HttpClientContext, req: HttpClientRequest) -> AsyncStreamHttpClientResponse:
+        try:
+            prepared = self._prepare_request(req, keepalive=self._pool is not None)
 
-                response_reader: AsyncBytesReader
+            while True:
+                conn = await self._acquire_connection(prepared)
+                reused = conn.num_requests > 0
 
-                if isinstance(response, FullIoPipelineHttpResponse):
-                    head = check.not_none(response).head
+                try:
+                    try:
+                        response = await self._send_request(conn, prepared)
+                    except OSError:
+                        if not (reused and self._is_idempotent_request(prepared)):
+                            raise
+                        response = None
 
-                    response_reader = AsyncBytesReaders.of_bytes(bytes_like_to_bytes(response.body))
+                    if response is None and reused and self._is_idempotent_request(prepared):
+                        # The server closed the idle connection before seeing the request.
+                        await self._release_connection(conn)
+                        continue
 
-                    await drv.close()
-                    writer.close()
-                    await writer.wait_closed()
+                    response = check.not_none(response)  # type: ignore[assignment]
 
-                    async def close() -> None:
-                        pass
+                    head: IoPipelineHttpResponseHead
 
-                elif isinstance(response, IoPipelineHttpResponseHead):
-                    head = response
+                    response_reader: AsyncBytesReader
 
-                    response_reader = self._DriverResponseReader(drv)
+                    if isinstance(response, FullIoPipelineHttpResponse):
+                        head = check.not_none(response).head
 
-                    async def close() -> None:
-                        try:
-                            await drv.close()
-                        finally:
-                            writer.close()
-                            await writer.wait_closed()
+                        response_reader = AsyncBytesReaders.of_bytes(bytes_like_to_bytes(response.body))
 
-                else:
-                    raise TypeError(response)  # noqa
+                        await self._release_connection(
+                            conn,
+                            reuse=self._pool is not None and self._can_reuse_connection(prepared, head),
+                        )
 
-                #
+                        async def close() -> None:
+                            pass
 
-                return AsyncStreamHttpClientResponse(
-                    status=head.status,
-                    headers=head.headers,
-                    request=req,
-                    underlying=drv,
-                    _stream=response_reader,
-                    _closer=close,
-                )
+                    elif isinstance(response, IoPipelineHttpResponseHead):
+                        head = response
 
-            except BaseException:
-                writer.close()
-                await writer.wait_closed()
+                        response_reader = drr = self._DriverResponseReader(conn.driver)
+                        reusable = self._pool is not None and self._can_reuse_connection(prepared, head)
 
-                raise
+                        async def close() -> None:
+                            await self._release_connection(conn, reuse=reusable and drr.done)
+
+                    else:
+                        raise TypeError(response)  # noqa
+
+                    #
+
+                    return AsyncStreamHttpClientResponse(
+                        status=head.status,
+                        headers=head.headers,
+                        request=req,
+                        underlying=conn.driver,
+                        _stream=response_reader,
+                        _closer=close,
+                    )
+
+                except BaseException:
+                    await self._release_connection(conn)
+
+                    raise
 
         except asyncio.CancelledError:
             raise
 
         except Exception as e:
             raise HttpClientError from e
+
+    ##
+    # many
+
+    class _ManyItem:
+        def __init__(self, req: HttpClientRequest) -> None:
+            self.req = req
+
+            self.prepared: ta.Optional[BaseIoPipelineHttpClient._PreparedRequest] = None
+            self.timeout_s: ta.Optional[float] = None
+            self.attempts = 0
+
+            self.result: ta.Union[HttpClientResponse, BaseException, None] = None
+
+        def fail(self, e: BaseException) -> None:
+            if not isinstance(e, HttpClientError):
+                try:
+                    raise HttpClientError from e
+                except HttpClientError as he:
+                    e = he
+
+            self.result = e
+
+    _MANY_MAX_ATTEMPTS: ta.ClassVar[int] = 3
+
+    def _take_many_batch(self, q: ta.Deque[_ManyItem]) -> ta.List[_ManyItem]:
+        # Only idempotent requests are pipelined - others are sent alone.
+        batch = [q.popleft()]
+        if self._is_idempotent_request(check.not_none(batch[0].prepared)):
+            while (
+                    q and
+                    len(batch) < self._config.max_pipelined_requests and
+                    self._is_idempotent_request(check.not_none(q[0].prepared))
+            ):
+                batch.append(q.popleft())
+        return batch
+
+    async def _read_many_response(
+            self,
+            conn: AsyncioIoPipelineHttpConnection,
+            it: _ManyItem,
+    ) -> ta.Tuple[HttpClientResponse, bool]:
+        prepared = check.not_none(it.prepared)
+
+        response = await self._next_response(conn)
+        if response is None:
+            raise ConnectionError('Connection closed before response')
+
+        if isinstance(response, FullIoPipelineHttpResponse):
+            head = response.head
+            data = bytes_like_to_bytes(response.body)
+            done = True
+
+        else:
+            head = response
+            drr = self._DriverResponseReader(conn.driver)
+            data = await drr.read()
+            done = drr.done
+
+        return (
+            HttpClientResponse(
+                status=head.status,
+                headers=head.headers,
+                request=it.req,
+                underlying=conn.driver,
+                data=data,
+            ),
+            done and self._can_reuse_connection(prepared, head),
+        )
+
+    async def _run_many_on(
+            self,
+            conn: AsyncioIoPipelineHttpConnection,
+            q: ta.Deque[_ManyItem],
+            *,
+            check_status: bool = False,
+    ) -> bool:
+        """Makes queued requests on `conn` until there are none left, returning whether it remains reusable."""
+
+        loop = asyncio.get_running_loop()
+
+        while q:
+            batch = self._take_many_batch(q)
+
+            start = loop.time()
+            for it in batch:
+                it.attempts += 1
+                self._enqueue_request(conn, check.not_none(it.prepared))
+
+            for i, it in enumerate(batch):
+                rem: ta.Optional[float] = None
+                if it.timeout_s is not None:
+                    rem = max(start + it.timeout_s - loop.time(), 0.)
+
+                # Whatever follows on a connection which can't be reused is left unanswered.
+                unanswered = batch[i + 1:]
+
+                try:
+                    resp, reusable = await asyncio_maybe_timeout(self._read_many_response(conn, it), rem)
+
+                except asyncio.TimeoutError as e:
+                    it.fail(e)
+                    reusable = False
+
+                except Exception as e:  # noqa
+                    # Requests are only pipelined if idempotent, and so may be resent on another connection.
+                    if (
+                            self._is_idempotent_request(check.not_none(it.prepared)) and
+                            it.attempts < self._MANY_MAX_ATTEMPTS
+                    ):
+                        unanswered = batch[i:]
+                    else:
+                        it.fail(e)
+                    reusable = False
+
+                else:
+                    if check_status and not resp.is_success:
+                        it.fail(StatusHttpClientError(resp))
+                    else:
+                        it.result = resp
+
+                if not reusable:
+                    for uit in reversed(unanswered):
+                        if uit.attempts < self._MANY_MAX_ATTEMPTS:
+                            q.appendleft(uit)
+                        else:
+                            uit.fail(ConnectionError('Connection closed before response'))
+                    return False
+
+        return True
+
+    async def _request_many_worker(
+            self,
+            q: ta.Deque[_ManyItem],
+            *,
+            check_status: bool = False,
+    ) -> None:
+        while q:
+            try:
+                conn = await self._acquire_connection(check.not_none(q[0].prepared))
+            except Exception as e:  # noqa
+                if q:
+                    q.popleft().fail(e)
+                continue
+
+            reusable = False
+            try:
+                reusable = await self._run_many_on(conn, q, check_status=check_status)
+            finally:
+                await self._release_connection(conn, reuse=reusable)
+
+    async def request_many(
+            self,
+            reqs: ta.Iterable[HttpClientRequest],
+            *,
+            context: ta.Optional[HttpClientContext] = None,
+            check: bool = False,
+            max_concurrency: ta.Optional[int] = None,
+            timeout_s: ta.Optional[float] = None,
+            return_exceptions: bool = False,
+    ) -> ta.List[ta.Union[HttpClientResponse, BaseException]]:
+        """
+        Sends requests to each origin over as few connections as needed, up to `max_concurrency` connections in use at
+        once - each carrying up to `max_pipelined_requests` requests - rather than that many requests. A timeout leaves
+        its connection unusable, so whatever was pipelined behind the request which timed out is resent on another.
+        Connections are kept alive for as long as there are requests for them whether or not the client has a pool,
+        which only keeps them for later.
+        """
+
+        items = [self._ManyItem(req) for req in reqs]
+
+        queues: ta.Dict[IoPipelineHttpOrigin, ta.Deque[AsyncioIoPipelineAsyncHttpClient._ManyItem]] = {}
+        for it in items:
+            try:
+                # Kept alive pooled or not, as a connection carries the requests queued for its origin in turn.
+                it.prepared = prepared = self._prepare_request(it.req, keepalive=True)
+            except Exception as e:  # noqa
+                it.fail(e)
+                continue
+
+            it.timeout_s = it.req.timeout_s if it.req.timeout_s is not None else timeout_s
+            queues.setdefault(prepared.parsed_url.origin, collections.deque()).append(it)
+
+        sem = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+        async def worker(q: ta.Deque[AsyncioIoPipelineAsyncHttpClient._ManyItem]) -> None:
+            if sem is None:
+                await self._request_many_worker(q, check_status=check)
+                return
+            async with sem:
+                await self._request_many_worker(q, check_status=check)
+
+        depth = self._config.max_pipelined_requests
+        await asyncio.gather(*[
+            worker(q)
+            for q in queues.values()
+            for _ in range((len(q) + depth - 1) // depth)
+        ])
+
+        return self._gather_many_results(
+            [it.result for it in items],
+            return_exceptions=return_exceptions,
+        )
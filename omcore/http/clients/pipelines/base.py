@@ -3,6 +3,7 @@
 import dataclasses as dc
 import errno
 import socket
+import ssl
 import typing as ta
 
 from ....io.pipelines.bytes.buffers import OutboundBytesBufferIoPipelineHandler
@@ -15,6 +16,8 @@ from ....lite.abstract import Abstract
 from ...clients.base import BaseHttpClient
 from ...clients.base import HttpClientRequest
 from ...headers import HttpHeaders
+from ...pipelines.bodymodes import IoPipelineHttpBodyMode
+from ...pipelines.bodymodes import IoPipelineHttpBodyModeError
 from ...pipelines.clients.clients import IoPipelineHttpClientHandler
 from ...pipelines.clients.requests import IoPipelineHttpRequestCompressor
 from ...pipelines.clients.requests import IoPipelineHttpRequestEncoder
@@ -23,6 +26,10 @@ from ...pipelines.clients.responses import IoPipelineHttpResponseDechunker
 from ...pipelines.clients.responses import IoPipelineHttpResponseDecoder
 from ...pipelines.clients.responses import IoPipelineHttpResponseDecompressor
 from ...pipelines.requests import FullIoPipelineHttpRequest
+from ...pipelines.responses import IoPipelineHttpResponseHead
+from ...versions import HttpVersions
+from .pools import BaseIoPipelineHttpConnectionPool
+from .pools import IoPipelineHttpOrigin
 
 
 BaseIoPipelineHttpClientConfigT = ta.TypeVar('BaseIoPipelineHttpClientConfigT', bound='BaseIoPipelineHttpClient.Config')
@@ -36,6 +43,16 @@ class BaseIoPipelineHttpClient(BaseHttpClient, Abstract, ta.Generic[BaseIoPipeli
     class Config:
         connect_timeout_s: ta.Optional[float] = 3.
 
+        # Unless None, connections are kept alive between requests in a pool owned by the client - unless it is given
+        # one to share.
+        pool_config: ta.Optional[BaseIoPipelineHttpConnectionPool.Config] = (
+            BaseIoPipelineHttpConnectionPool.Config.DEFAULT
+        )
+
+        # Above 1, idempotent requests made together - as by `request_many` - are pipelined up to this many deep on each
+        # connection.
+        max_pipelined_requests: int = 1
+
     def __init__(
             self,
             config: BaseIoPipelineHttpClientConfigT,
@@ -60,6 +77,10 @@ class BaseIoPipelineHttpClient(BaseHttpClient, Abstract, ta.Generic[BaseIoPipeli
 
         is_ssl: bool = False
 
+        @property
+        def origin(self) -> IoPipelineHttpOrigin:
+            return IoPipelineHttpOrigin(self.host, self.port, is_ssl=self.is_ssl)
+
     @classmethod
     def parse_url(cls, url: str) -> ParsedUrl:
         # Parse URL (very simple - just extract host and path)
@@ -134,7 +155,7 @@ class BaseIoPipelineHttpClient(BaseHttpClient, Abstract, ta.Generic[BaseIoPipeli
                 IoPipelineHttpRequestEncoder(),
                 IoPipelineHttpRequestCompressor(),
 
-                IoPipelineHttpClientHandler(),
+                IoPipelineHttpClientHandler(max_pipelined=self._config.max_pipelined_requests),
 
                 *(innermost_handlers or []),
             ],
@@ -154,11 +175,13 @@ class BaseIoPipelineHttpClient(BaseHttpClient, Abstract, ta.Generic[BaseIoPipeli
     class _PreparedRequest:
         parsed_url: 'BaseIoPipelineHttpClient.ParsedUrl'
         full_request: FullIoPipelineHttpRequest
-        pipeline_spec: IoPipeline.Spec
+        pipeline_kwargs: ta.Mapping[str, ta.Any]
 
     def _prepare_request(
             self,
             req: HttpClientRequest,
+            *,
+            keepalive: bool = False,
             **pipeline_kwargs: ta.Any,
     ) -> _PreparedRequest:
         parsed_url = self.parse_url(req.url)
@@ -182,29 +205,90 @@ class BaseIoPipelineHttpClient(BaseHttpClient, Abstract, ta.Generic[BaseIoPipeli
                 if_present='skip',
             ),
             body=data,
+            connection='keep-alive' if keepalive else 'close',
         )
 
-        pipeline_spec = self._build_pipeline_spec(
+        return self._PreparedRequest(
+            parsed_url,
+            full_request,
+            {
+                **self._pipeline_kwargs,
+                **pipeline_kwargs,
+            },
+        )
+
+    def _build_connection_pipeline_spec(
+            self,
+            prepared: _PreparedRequest,
+            *,
+            ssl_ctx: ta.Optional[ssl.SSLContext] = None,
+            ssl_session: ta.Optional[ssl.SSLSession] = None,
+    ) -> IoPipeline.Spec:
+        return self._build_pipeline_spec(
             **(dict(  # type: ignore[arg-type]
                 with_ssl=True,
                 ssl_kwargs=dict(
+                    ssl_ctx=ssl_ctx,
                     server_side=False,
-                    server_hostname=parsed_url.host,
+                    server_hostname=prepared.parsed_url.host,
+                    ssl_session=ssl_session,
                 ),
-            ) if parsed_url.is_ssl else {}),
+            ) if prepared.parsed_url.is_ssl else {}),
 
-            **{
-                **self._pipeline_kwargs,
-                **pipeline_kwargs,
-            },
+            **prepared.pipeline_kwargs,
         )
 
-        return self._PreparedRequest(
-            parsed_url,
-            full_request,
-            pipeline_spec,
+    #
+
+    _IDEMPOTENT_METHODS: ta.ClassVar[ta.FrozenSet[str]] = frozenset([
+        'GET',
+        'HEAD',
+        'OPTIONS',
+        'PUT',
+        'DELETE',
+        'TRACE',
+    ])
+
+    def _is_idempotent_request(self, prepared: _PreparedRequest) -> bool:
+        """
+        Whether a request may be sent again after a connection failed before any response to it, and so whether it may
+        be pipelined.
+        """
+
+        return prepared.full_request.head.method.upper() in self._IDEMPOTENT_METHODS
+
+    @staticmethod
+    def _connection_tokens(headers: HttpHeaders) -> ta.FrozenSet[str]:
+        return frozenset(
+            t.strip()
+            for v in headers.lower.get('connection', ())
+            for t in v.split(',')
         )
 
+    def _can_reuse_connection(self, prepared: _PreparedRequest, head: IoPipelineHttpResponseHead) -> bool:
+        """Whether the connection may carry another request once the response to this one has been read in full."""
+
+        req_head = prepared.full_request.head
+        if 'close' in self._connection_tokens(req_head.headers):
+            return False
+
+        resp_tokens = self._connection_tokens(head.headers)
+        if 'close' in resp_tokens:
+            return False
+        if head.version < HttpVersions.HTTP_1_1 and 'keep-alive' not in resp_tokens:
+            return False
+
+        # The response decoder ends a response to a HEAD with its head, whatever body its headers describe.
+        if req_head.method.upper() == 'HEAD':
+            return True
+
+        # A body running until eof ends the connection with it.
+        try:
+            bm = IoPipelineHttpBodyMode.select(head.headers, if_length_missing='eof')
+        except IoPipelineHttpBodyModeError:
+            return False
+        return bm.mode != 'eof'
+
     #
 
     def _try_set_nodelay(self, sock: 'socket.socket') -> None:
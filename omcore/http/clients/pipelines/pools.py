@@ -0,0 +1,594 @@
+# ruff: noqa: UP006 UP007 UP037 UP041 UP045
+# @om-lite
+"""
+TODO:
+ - background idle eviction
+ - per-origin config overrides
+"""
+import abc
+import asyncio
+import collections
+import dataclasses as dc
+import select
+import socket
+import ssl
+import threading
+import time
+import typing as ta
+
+from ....asyncs.asyncio.timeouts import asyncio_maybe_timeout
+from ....io.pipelines.drivers.asyncio import PollAsyncioStreamIoPipelineDriver
+from ....io.pipelines.drivers.sync import SyncSocketIoPipelineDriver
+from ....io.pipelines.ssl.handlers import SslIoPipelineHandler
+from ....lite.abstract import Abstract
+from ....lite.check import check
+
+
+IoPipelineHttpConnectionT = ta.TypeVar('IoPipelineHttpConnectionT', bound='BaseIoPipelineHttpConnection')
+IoPipelineHttpConnectionPoolT = ta.TypeVar('IoPipelineHttpConnectionPoolT', bound='IoPipelineHttpConnectionPool')
+AsyncioIoPipelineHttpConnectionPoolT = ta.TypeVar(
+    'AsyncioIoPipelineHttpConnectionPoolT',
+    bound='AsyncioIoPipelineHttpConnectionPool',
+)
+
+
+##
+
+
+@ta.final
+@dc.dataclass(frozen=True)
+class IoPipelineHttpOrigin:
+    host: str
+    port: int
+
+    is_ssl: bool = False
+
+
+#
+
+
+class BaseIoPipelineHttpConnection(Abstract):
+    """A connection and the pipeline driving it, which carries one request at a time."""
+
+    def __init__(self, origin: IoPipelineHttpOrigin) -> None:
+        super().__init__()
+
+        self._origin = origin
+
+        self._num_requests = 0
+        self._idle_since: ta.Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<{self._origin}, num_requests={self._num_requests}>'
+
+    @property
+    def origin(self) -> IoPipelineHttpOrigin:
+        return self._origin
+
+    @property
+    def num_requests(self) -> int:
+        """The number of requests sent so far - so a connection with any was reused from a pool."""
+
+        return self._num_requests
+
+    def begin_request(self) -> None:
+        self._num_requests += 1
+
+    @property
+    @abc.abstractmethod
+    def driver(self) -> ta.Any:
+        raise NotImplementedError
+
+    @property
+    def ssl_session(self) -> ta.Optional[ssl.SSLSession]:
+        if not self._origin.is_ssl or not (drv := self.driver).is_running:
+            return None
+        if (ref := drv.pipeline.find_single_handler_of_type(SslIoPipelineHandler)) is None:
+            return None
+        return ref.handler.ssl_session
+
+    @abc.abstractmethod
+    def is_healthy(self) -> bool:
+        """Whether an idle connection looks fit to carry another request."""
+
+        raise NotImplementedError
+
+
+class IoPipelineHttpConnection(BaseIoPipelineHttpConnection):
+    def __init__(
+            self,
+            origin: IoPipelineHttpOrigin,
+            sock: socket.socket,
+            drv: SyncSocketIoPipelineDriver,
+    ) -> None:
+        super().__init__(origin)
+
+        self._sock = sock
+        self._drv = drv
+
+    @property
+    def sock(self) -> socket.socket:
+        return self._sock
+
+    @property
+    def driver(self) -> SyncSocketIoPipelineDriver:
+        return self._drv
+
+    def is_healthy(self) -> bool:
+        if not self._drv.is_running:
+            return False
+
+        try:
+            rs, _, _ = select.select([self._sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+
+        # Nothing is read from an idle connection, and the server has nothing to say on one - so anything readable is an
+        # eof, a reset, or garbage.
+        return not rs
+
+    def close(self) -> None:
+        try:
+            self._drv.close()
+        finally:
+            self._sock.close()
+
+
+class AsyncioIoPipelineHttpConnection(BaseIoPipelineHttpConnection):
+    def __init__(
+            self,
+            origin: IoPipelineHttpOrigin,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            drv: PollAsyncioStreamIoPipelineDriver,
+    ) -> None:
+        super().__init__(origin)
+
+        self._reader = reader
+        self._writer = writer
+        self._drv = drv
+
+    @property
+    def driver(self) -> PollAsyncioStreamIoPipelineDriver:
+        return self._drv
+
+    def is_healthy(self) -> bool:
+        # The stream buffers what arrives on an idle connection without anything reading it, so an eof or a reset shows
+        # up here.
+        return (
+            self._drv.is_running and
+            not self._writer.transport.is_closing() and
+            not self._reader.at_eof() and
+            self._reader.exception() is None
+        )
+
+    async def close(self) -> None:
+        try:
+            await self._drv.close()
+        finally:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+
+
+##
+
+
+class BaseIoPipelineHttpConnectionPool(Abstract, ta.Generic[IoPipelineHttpConnectionT]):
+    """
+    Keeps connections open between requests, per origin, up to `max_connections_per_origin` in use or idle at once.
+    Idle connections are reused most recently released first, and are closed once there are more than
+    `max_idle_per_origin` of them or they have been idle for `idle_timeout_s` - both checked as connections are acquired
+    and released, or by `evict_idle`.
+
+    New TLS connections are opened with a shared `ssl_context`, offering the session of the origin's last connection for
+    resumption.
+    """
+
+    @dc.dataclass(frozen=True)
+    class Config:
+        DEFAULT: ta.ClassVar['BaseIoPipelineHttpConnectionPool.Config']
+
+        max_connections_per_origin: ta.Optional[int] = 32
+        max_idle_per_origin: int = 8
+
+        idle_timeout_s: ta.Optional[float] = 30.
+
+        # How long to wait for a connection to an origin already at its limit - None waiting indefinitely.
+        acquire_timeout_s: ta.Optional[float] = None
+
+        reuse_ssl_sessions: bool = True
+
+    Config.DEFAULT = Config()
+
+    def __init__(
+            self,
+            config: ta.Optional[Config] = None,
+            *,
+            ssl_context: ta.Optional[ssl.SSLContext] = None,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+
+        if config is None:
+            config = BaseIoPipelineHttpConnectionPool.Config.DEFAULT
+        self._config = config
+
+        check.arg(config.max_connections_per_origin is None or config.max_connections_per_origin > 0)
+        check.arg(config.max_idle_per_origin >= 0)
+
+        self._ssl_context = ssl_context
+        self._clock = clock
+
+        self._origins: ta.Dict[IoPipelineHttpOrigin, BaseIoPipelineHttpConnectionPool._OriginState] = {}
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<open={self.num_open()}, idle={self.num_idle()}>'
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        # Sessions may only be resumed through the context which negotiated them.
+        if (ctx := self._ssl_context) is None:
+            ctx = self._ssl_context = ssl.create_default_context()
+        return ctx
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def num_open(self, origin: ta.Optional[IoPipelineHttpOrigin] = None) -> int:
+        """The number of connections open, in use or idle, to `origin` or to all origins."""
+
+        if origin is not None:
+            return st.num_open if (st := self._origins.get(origin)) is not None else 0
+        return sum(st.num_open for st in self._origins.values())
+
+    def num_idle(self, origin: ta.Optional[IoPipelineHttpOrigin] = None) -> int:
+        if origin is not None:
+            return len(st.idle) if (st := self._origins.get(origin)) is not None else 0
+        return sum(len(st.idle) for st in self._origins.values())
+
+    #
+
+    class _OriginState:
+        def __init__(self) -> None:
+            # Least recently released first.
+            self.idle: ta.Deque[ta.Any] = collections.deque()
+            self.num_open = 0
+
+            self.ssl_session: ta.Optional[ssl.SSLSession] = None
+
+    def _origin_state(self, origin: IoPipelineHttpOrigin) -> _OriginState:
+        try:
+            return self._origins[origin]
+        except KeyError:
+            pass
+
+        st = self._origins[origin] = BaseIoPipelineHttpConnectionPool._OriginState()
+        return st
+
+    def _is_expired(self, conn: IoPipelineHttpConnectionT, now: float) -> bool:
+        return (
+            (t := self._config.idle_timeout_s) is not None and
+            conn._idle_since is not None and  # noqa
+            now - conn._idle_since >= t  # noqa
+        )
+
+    def _pop_idle(self, st: _OriginState) -> ta.Tuple[ta.Optional[IoPipelineHttpConnectionT], ta.List[IoPipelineHttpConnectionT]]:  # noqa
+        """Returns the most recently released idle connection, if any has not expired, and those to close."""
+
+        now = self._clock()
+        dead: ta.List[IoPipelineHttpConnectionT] = []
+        while st.idle:
+            conn = st.idle.pop()
+            if self._is_expired(conn, now):
+                # All those released earlier have expired too.
+                dead.append(conn)
+                dead.extend(st.idle)
+                st.num_open -= len(st.idle) + 1
+                st.idle.clear()
+                break
+
+            conn._idle_since = None  # noqa
+            return conn, dead
+
+        return None, dead
+
+    def _reserve(self, st: _OriginState) -> bool:
+        if (mx := self._config.max_connections_per_origin) is not None and st.num_open >= mx:
+            return False
+        st.num_open += 1
+        return True
+
+    def _remember_ssl_session(self, st: _OriginState, conn: IoPipelineHttpConnectionT) -> None:
+        if not self._config.reuse_ssl_sessions:
+            return
+        try:
+            sess = conn.ssl_session
+        except Exception:  # noqa
+            return
+        if sess is not None:
+            st.ssl_session = sess
+
+    def _put(self, conn: IoPipelineHttpConnectionT, reuse: bool) -> ta.List[IoPipelineHttpConnectionT]:
+        """Takes back a connection in use, returning those to close - including it, unless it is kept idle."""
+
+        st = self._origins[conn.origin]
+        self._remember_ssl_session(st, conn)
+
+        if not reuse or self._closed or not self._config.max_idle_per_origin:
+            st.num_open -= 1
+            return [conn]
+
+        now = self._clock()
+        conn._idle_since = now  # noqa
+        st.idle.append(conn)
+
+        dead: ta.List[IoPipelineHttpConnectionT] = []
+        while st.idle and (len(st.idle) > self._config.max_idle_per_origin or self._is_expired(st.idle[0], now)):
+            dead.append(st.idle.popleft())
+            st.num_open -= 1
+        return dead
+
+    def _discard(self, conn: IoPipelineHttpConnectionT) -> None:
+        self._origins[conn.origin].num_open -= 1
+
+    def _take_expired(self) -> ta.List[IoPipelineHttpConnectionT]:
+        now = self._clock()
+        dead: ta.List[IoPipelineHttpConnectionT] = []
+        for st in self._origins.values():
+            while st.idle and self._is_expired(st.idle[0], now):
+                dead.append(st.idle.popleft())
+                st.num_open -= 1
+        return dead
+
+    def _take_all_idle(self) -> ta.List[IoPipelineHttpConnectionT]:
+        dead: ta.List[IoPipelineHttpConnectionT] = []
+        for st in self._origins.values():
+            dead.extend(st.idle)
+            st.num_open -= len(st.idle)
+            st.idle.clear()
+        return dead
+
+    def _deadline(self) -> ta.Optional[float]:
+        if (t := self._config.acquire_timeout_s) is None:
+            return None
+        return self._clock() + t
+
+    def _remaining(self, deadline: ta.Optional[float]) -> ta.Optional[float]:
+        if deadline is None:
+            return None
+        if (rem := deadline - self._clock()) <= 0:
+            raise TimeoutError('Timed out acquiring connection')
+        return rem
+
+
+##
+
+
+class IoPipelineHttpConnectionPool(BaseIoPipelineHttpConnectionPool[IoPipelineHttpConnection]):
+    """A thread-safe pool of `IoPipelineHttpConnection`s."""
+
+    def __init__(
+            self,
+            config: ta.Optional[BaseIoPipelineHttpConnectionPool.Config] = None,
+            *,
+            ssl_context: ta.Optional[ssl.SSLContext] = None,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            config,
+            ssl_context=ssl_context,
+            clock=clock,
+        )
+
+        self._cond = threading.Condition()
+
+    def _close_conns(self, conns: ta.Iterable[IoPipelineHttpConnection]) -> None:
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:  # noqa
+                pass
+
+    def acquire(
+            self,
+            origin: IoPipelineHttpOrigin,
+            connect: ta.Callable[[ta.Optional[ssl.SSLSession]], IoPipelineHttpConnection],
+    ) -> IoPipelineHttpConnection:
+        """
+        Returns a healthy idle connection to `origin` if there is one, or else one opened by `connect` - given any TLS
+        session to offer - once the origin is below its limit.
+        """
+
+        deadline = self._deadline()
+
+        while True:
+            conn: ta.Optional[IoPipelineHttpConnection] = None
+            dead: ta.List[IoPipelineHttpConnection] = []
+            reserved = False
+
+            with self._cond:
+                while True:
+                    check.state(not self._closed, 'Pool closed')
+
+                    st = self._origin_state(origin)
+                    conn, expired = self._pop_idle(st)
+                    dead.extend(expired)
+
+                    if conn is not None or (reserved := self._reserve(st)):
+                        break
+
+                    self._cond.wait(self._remaining(deadline))
+
+                ssl_session = st.ssl_session
+
+            self._close_conns(dead)
+
+            if conn is not None:
+                if conn.is_healthy():
+                    return conn
+
+                self.release(conn, reuse=False)
+                continue
+
+            check.state(reserved)
+            try:
+                return connect(ssl_session)
+
+            except BaseException:
+                with self._cond:
+                    st.num_open -= 1
+                    self._cond.notify_all()
+                raise
+
+    def release(self, conn: IoPipelineHttpConnection, *, reuse: bool = True) -> None:
+        """Returns a connection from `acquire` - kept idle for reuse if `reuse` is set, otherwise closed."""
+
+        with self._cond:
+            dead = self._put(conn, reuse)
+            self._cond.notify_all()
+
+        self._close_conns(dead)
+
+    def evict_idle(self) -> None:
+        """Closes idle connections which have expired."""
+
+        with self._cond:
+            dead = self._take_expired()
+            self._cond.notify_all()
+
+        self._close_conns(dead)
+
+    def close(self) -> None:
+        """Closes all idle connections, and those in use as they are released. Idempotent."""
+
+        with self._cond:
+            self._closed = True
+            dead = self._take_all_idle()
+            self._cond.notify_all()
+
+        self._close_conns(dead)
+
+    def __enter__(self: IoPipelineHttpConnectionPoolT) -> IoPipelineHttpConnectionPoolT:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncioIoPipelineHttpConnectionPool(BaseIoPipelineHttpConnectionPool[AsyncioIoPipelineHttpConnection]):
+    """A pool of `AsyncioIoPipelineHttpConnection`s, which must all be used from the event loop which opened them."""
+
+    def __init__(
+            self,
+            config: ta.Optional[BaseIoPipelineHttpConnectionPool.Config] = None,
+            *,
+            ssl_context: ta.Optional[ssl.SSLContext] = None,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            config,
+            ssl_context=ssl_context,
+            clock=clock,
+        )
+
+        self._waiters: ta.Deque[asyncio.Future] = collections.deque()
+
+    def _wake_waiters(self) -> None:
+        # Waiters recheck for themselves, possibly for different origins, so all of them are woken.
+        while self._waiters:
+            if not (f := self._waiters.popleft()).done():
+                f.set_result(None)
+
+    async def _close_conns(self, conns: ta.Iterable[AsyncioIoPipelineHttpConnection]) -> None:
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception:  # noqa
+                pass
+
+    async def acquire(
+            self,
+            origin: IoPipelineHttpOrigin,
+            connect: ta.Callable[[ta.Optional[ssl.SSLSession]], ta.Awaitable[AsyncioIoPipelineHttpConnection]],
+    ) -> AsyncioIoPipelineHttpConnection:
+        """
+        Returns a healthy idle connection to `origin` if there is one, or else one opened by `connect` - given any TLS
+        session to offer - once the origin is below its limit.
+        """
+
+        deadline = self._deadline()
+
+        while True:
+            check.state(not self._closed, 'Pool closed')
+
+            st = self._origin_state(origin)
+            conn, dead = self._pop_idle(st)
+            reserved = conn is None and self._reserve(st)
+            ssl_session = st.ssl_session
+
+            if dead:
+                self._wake_waiters()
+                await self._close_conns(dead)
+
+            if conn is not None:
+                if conn.is_healthy():
+                    return conn
+
+                await self.release(conn, reuse=False)
+                continue
+
+            if reserved:
+                try:
+                    return await connect(ssl_session)
+
+                except BaseException:
+                    st.num_open -= 1
+                    self._wake_waiters()
+                    raise
+
+            fut: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await asyncio_maybe_timeout(fut, self._remaining(deadline))
+            except asyncio.TimeoutError:
+                raise TimeoutError('Timed out acquiring connection') from None
+
+    async def release(self, conn: AsyncioIoPipelineHttpConnection, *, reuse: bool = True) -> None:
+        """Returns a connection from `acquire` - kept idle for reuse if `reuse` is set, otherwise closed."""
+
+        dead = self._put(conn, reuse)
+        self._wake_waiters()
+
+        await self._close_conns(dead)
+
+    async def evict_idle(self) -> None:
+        """Closes idle connections which have expired."""
+
+        dead = self._take_expired()
+        self._wake_waiters()
+
+        await self._close_conns(dead)
+
+    async def close(self) -> None:
+        """Closes all idle connections, and those in use as they are released. Idempotent."""
+
+        self._closed = True
+        dead = self._take_all_idle()
+        self._wake_waiters()
+
+        await self._close_conns(dead)
+
+    async def __aenter__(self: AsyncioIoPipelineHttpConnectionPoolT) -> AsyncioIoPipelineHttpConnectionPoolT:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -2,8 +2,10 @@
 # @om-lite
 import collections  # noqa
 import dataclasses as dc
+import functools
 import io
 import socket
+import ssl
 import typing as ta
 
 from ....io.pipelines.core import IoPipelineMessages
@@ -25,6 +27,8 @@ from ...pipelines.responses import IoPipelineHttpResponseEnd
 from ...pipelines.responses import IoPipelineHttpResponseHead
 from ..base import HttpClientError
 from .base import BaseIoPipelineHttpClient
+from .pools import IoPipelineHttpConnection
+from .pools import IoPipelineHttpConnectionPool
 
 
 ##
@@ -40,6 +44,8 @@ class IoPipelineHttpClient(HttpClient, BaseIoPipelineHttpClient['IoPipelineHttpC
     def __init__(
             self,
             config: Config = Config.DEFAULT,
+            *,
+            pool: ta.Optional[IoPipelineHttpConnectionPool] = None,
             **pipeline_kwargs: ta.Any,
     ) -> None:
         super().__init__(
@@ -47,22 +53,48 @@ class IoPipelineHttpClient(HttpClient, BaseIoPipelineHttpClient['IoPipelineHttpC
             **pipeline_kwargs,
         )
 
+        self._owns_pool = pool is None and config.pool_config is not None
+        if self._owns_pool:
+            pool = IoPipelineHttpConnectionPool(config.pool_config)
+        self._pool = pool
+
+    @property
+    def pool(self) -> ta.Optional[IoPipelineHttpConnectionPool]:
+        return self._pool
+
+    def close(self) -> None:
+        """Closes the client's pool, if it owns one."""
+
+        if self._owns_pool and (pool := self._pool) is not None:
+            pool.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     #
 
     class _DriverResponseReader:
         def __init__(
                 self,
                 drv: SyncSocketIoPipelineDriver,
-                sock: 'socket.socket',
         ) -> None:
             super().__init__()
 
             self._drv = drv
-            self._sock = sock
 
             self._done = False
+            self._eof = False
+
+        @property
+        def done(self) -> bool:
+            """Whether the response was read to its end, leaving the connection ready for another."""
+
+            return self._done
 
         def read1(self, n: int = -1, /) -> Bytes:
+            if self._eof:
+                return b''
+
             while True:
                 out = check.not_none(self._drv.next())
 
@@ -72,11 +104,15 @@ class IoPipelineHttpClient(HttpClient, BaseIoPipelineHttpClient['IoPipelineHttpC
                     if isinstance(msg, IoPipelineHttpResponseBodyData):
                         return ByteStreamBuffers.to_bytes(msg.data)
 
+                    elif isinstance(msg, IoPipelineHttpResponseEnd):
+                        self._done = self._eof = True
+                        return b''
+
                     elif isinstance(msg, (
-                            IoPipelineHttpResponseEnd,
                             IoPipelineMessages.FinalInput,
                             IoPipelineHttpClientMessages.Close,
                     )):
+                        self._eof = True
                         return b''
 
                     else:
@@ -95,104 +131,156 @@ class IoPipelineHttpClient(HttpClient, BaseIoPipelineHttpClient['IoPipelineHttpC
 
     #
 
-    def _stream_request(self, ctx: HttpClientContext, req: HttpClientRequest) -> StreamHttpClientResponse:
-        try:
-            prepared = self._prepare_request(req)
+    def _connect(
+            self,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+            ssl_session: ta.Optional[ssl.SSLSession] = None,
+    ) -> IoPipelineHttpConnection:
+        sock = socket.create_connection(
+            (prepared.parsed_url.host, prepared.parsed_url.port),
+            **(dict(timeout=self._config.connect_timeout_s) if self._config.connect_timeout_s is not None else {}),  # type: ignore[arg-type]  # noqa
+        )
 
-            sock = socket.create_connection(
-                (prepared.parsed_url.host, prepared.parsed_url.port),
-                **(dict(timeout=self._config.connect_timeout_s) if self._config.connect_timeout_s is not None else {}),  # type: ignore[arg-type]  # noqa
+        try:
+            self._try_set_nodelay(sock)
+
+            drv = SyncSocketIoPipelineDriver(
+                self._build_connection_pipeline_spec(
+                    prepared,
+                    ssl_ctx=self._pool.ssl_context if self._pool is not None and prepared.parsed_url.is_ssl else None,
+                    ssl_session=ssl_session,
+                ),
+                sock,
             )
 
-            try:
-                self._try_set_nodelay(sock)
+        except BaseException:
+            sock.close()
+
+            raise
+
+        return IoPipelineHttpConnection(prepared.parsed_url.origin, sock, drv)
+
+    def _acquire_connection(self, prepared: BaseIoPipelineHttpClient._PreparedRequest) -> IoPipelineHttpConnection:
+        if (pool := self._pool) is None:
+            return self._connect(prepared)
 
-                drv = SyncSocketIoPipelineDriver(prepared.pipeline_spec, sock)
+        return pool.acquire(
+            prepared.parsed_url.origin,
+            functools.partial(self._connect, prepared),
+        )
 
-                drv.enqueue(IoPipelineHttpClientMessages.Request(
-                    prepared.full_request,
-                    # aggregate=...
-                ))
+    def _release_connection(self, conn: IoPipelineHttpConnection, *, reuse: bool = False) -> None:
+        if (pool := self._pool) is None:
+            conn.close()
+        else:
+            pool.release(conn, reuse=reuse)
 
-                response: ta.Union[IoPipelineHttpResponseHead, FullIoPipelineHttpResponse, None] = None
+    def _send_request(
+            self,
+            conn: IoPipelineHttpConnection,
+            prepared: BaseIoPipelineHttpClient._PreparedRequest,
+    ) -> ta.Union[IoPipelineHttpResponseHead, FullIoPipelineHttpResponse, None]:
+        drv = conn.driver
+
+        conn.begin_request()
+        drv.enqueue(IoPipelineHttpClientMessages.Request(
+            prepared.full_request,
+            # aggregate=...
+        ))
+
+        while True:
+            if (out := drv.next()) is not None:
+                if isinstance(out, IoPipelineHttpClientMessages.Output):
+                    msg = out.msg
 
-                while True:
-                    if (out := drv.next()) is not None:
-                        if isinstance(out, IoPipelineHttpClientMessages.Output):
-                            msg = out.msg
+                    if isinstance(msg, (IoPipelineHttpResponseHead, FullIoPipelineHttpResponse)):
+                        return msg
 
-                            if isinstance(msg, IoPipelineHttpResponseHead):
-                                check.none(response)
-                                response = msg
+                    elif isinstance(msg, (IoPipelineMessages.FinalInput, IoPipelineHttpClientMessages.Close)):
+                        pass
 
-                                break
+                    else:
+                        raise TypeError(out)  # noqa
+
+                else:
+                    raise TypeError(out)  # noqa
 
-                            if isinstance(msg, FullIoPipelineHttpResponse):
-                                check.none(response)
-                                response = msg
+            if not drv.pipeline.is_ready:
+                return None
 
-                                drv.enqueue(IoPipelineHttpClientMessages.Close())
+    def _stream_request(self, ctx: HttpClientContext, req: HttpClientRequest) -> StreamHttpClientResponse:
+        try:
+            prepared = self._prepare_request(req, keepalive=self._pool is not None)
 
-                            elif isinstance(msg, (IoPipelineMessages.FinalInput, IoPipelineHttpClientMessages.Close)):
-                                pass
+            while True:
+                conn = self._acquire_connection(prepared)
+                reused = conn.num_requests > 0
 
-                            else:
-                                raise TypeError(out)  # noqa
+                try:
+                    try:
+                        response = self._send_request(conn, prepared)
+                    except OSError:
+                        if not (reused and self._is_idempotent_request(prepared)):
+                            raise
+                        response = None
 
-                        else:
-                            raise TypeError(out)  # noqa
+                    if response is None and reused and self._is_idempotent_request(prepared):
+                        # The server closed the idle connection before seeing the request.
+                        self._release_connection(conn)
+                        continue
 
-                    if not drv.pipeline.is_ready:
-                        break
+                    response = check.not_none(response)  # type: ignore[assignment]
 
-                #
+                    head: IoPipelineHttpResponseHead
 
-                response = check.not_none(response)  # type: ignore[assignment]
+                    response_reader: BytesReader
 
-                head: IoPipelineHttpResponseHead
+                    if isinstance(response, FullIoPipelineHttpResponse):
+                        head = check.not_none(response).head
 
-                response_reader: BytesReader
+                        response_reader = BytesReaders.of_bytes(bytes_like_to_bytes(response.body))
 
-                if isinstance(response, FullIoPipelineHttpResponse):
-                    head = check.not_none(response).head
+                        if self._pool is not None and self._can_reuse_connection(prepared, head):
+                            self._release_connection(conn, reuse=True)
 
-                    response_reader = BytesReaders.of_bytes(bytes_like_to_bytes(response.body))
+                        else:
+                            drv = conn.driver
+                            drv.enqueue(IoPipelineHttpClientMessages.Close())
+                            while drv.pipeline.is_ready:
+                                drv.next()
 
-                    drv.close()
-                    sock.close()
+                            self._release_connection(conn)
 
-                    def close() -> None:
-                        pass
+                        def close() -> None:
+                            pass
 
-                elif isinstance(response, IoPipelineHttpResponseHead):
-                    head = response
+                    elif isinstance(response, IoPipelineHttpResponseHead):
+                        head = response
 
-                    response_reader = self._DriverResponseReader(drv, sock)
+                        response_reader = drr = self._DriverResponseReader(conn.driver)
+                        reusable = self._pool is not None and self._can_reuse_connection(prepared, head)
 
-                    def close() -> None:
-                        try:
-                            drv.close()
-                        finally:
-                            sock.close()
+                        def close() -> None:
+                            self._release_connection(conn, reuse=reusable and drr.done)
 
-                else:
-                    raise TypeError(response)  # noqa
+                    else:
+                        raise TypeError(response)  # noqa
 
-                #
+                    #
 
-                return StreamHttpClientResponse(
-                    status=head.status,
-                    headers=head.headers,
-                    request=req,
-                    underlying=drv,
-                    _stream=response_reader,
-                    _closer=close,
-                )
+                    return StreamHttpClientResponse(
+                        status=head.status,
+                        headers=head.headers,
+                        request=req,
+                        underlying=conn.driver,
+                        _stream=response_reader,
+                        _closer=close,
+                    )
 
-            except BaseException:
-                sock.close()
+                except BaseException:
+                    self._release_connection(conn)
 
-                raise
+                    raise
 
         except Exception as e:
             raise HttpClientError from e
@@ -0,0 +1,115 @@
+import unittest
+
+from ...base import HttpClientError
+from ...base import HttpClientRequest
+from ...middleware import MiddlewareAsyncHttpClient
+from ..asyncio import AsyncioIoPipelineAsyncHttpClient
+from .test_pools import _num_connections
+from .test_pools import _serve
+
+
+class TestRequestMany(unittest.IsolatedAsyncioTestCase):
+    async def test_pipelined(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient(
+                AsyncioIoPipelineAsyncHttpClient.Config(max_pipelined_requests=4),
+            ) as client:
+                resps = await client.request_many(
+                    [HttpClientRequest(f'{url}/{i}') for i in range(12)],
+                    max_concurrency=1,
+                )
+                self.assertEqual([r.data for r in resps], [f'/{i}'.encode() for i in range(12)])  # type: ignore
+                self.assertEqual(_num_connections(server), 1)
+
+    async def test_pipelined_unpooled(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient(
+                AsyncioIoPipelineAsyncHttpClient.Config(max_pipelined_requests=4, pool_config=None),
+            ) as client:
+                self.assertIsNone(client.pool)
+
+                resps = await client.request_many(
+                    [HttpClientRequest(f'{url}/{i}') for i in range(8)],
+                    max_concurrency=1,
+                )
+                self.assertEqual([r.data for r in resps], [f'/{i}'.encode() for i in range(8)])  # type: ignore
+                self.assertEqual(_num_connections(server), 1)
+
+    async def test_pipelined_head(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient(
+                AsyncioIoPipelineAsyncHttpClient.Config(max_pipelined_requests=2),
+            ) as client:
+                resps = await client.request_many(
+                    [
+                        HttpClientRequest(f'{url}/head', method='HEAD'),
+                        HttpClientRequest(f'{url}/a'),
+                        HttpClientRequest(f'{url}/b'),
+                    ],
+                    max_concurrency=1,
+                )
+                self.assertEqual(
+                    [(r.status, r.data) for r in resps],  # type: ignore
+                    [(200, b''), (200, b'/a'), (200, b'/b')],
+                )
+                self.assertEqual(_num_connections(server), 1)
+
+    async def test_many_origins(self):
+        with _serve() as server0, _serve() as server1:
+            urls = [f'http://127.0.0.1:{s.server_port}' for s in (server0, server1)]
+            async with AsyncioIoPipelineAsyncHttpClient(
+                AsyncioIoPipelineAsyncHttpClient.Config(max_pipelined_requests=2),
+            ) as client:
+                reqs = [HttpClientRequest(f'{urls[i % 2]}/{i}') for i in range(8)]
+                resps = await client.request_many(reqs)
+                self.assertEqual([r.request for r in resps], reqs)  # type: ignore
+                self.assertEqual([r.data for r in resps], [f'/{i}'.encode() for i in range(8)])  # type: ignore
+
+                self.assertLessEqual(_num_connections(server0), 2)
+                self.assertLessEqual(_num_connections(server1), 2)
+
+    async def test_timeout(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient(
+                AsyncioIoPipelineAsyncHttpClient.Config(max_pipelined_requests=4),
+            ) as client:
+                resps = await client.request_many(
+                    [
+                        HttpClientRequest(f'{url}/a'),
+                        HttpClientRequest(f'{url}/slow', timeout_s=.1),
+                        HttpClientRequest(f'{url}/b'),
+                    ],
+                    max_concurrency=1,
+                    return_exceptions=True,
+                )
+
+                self.assertEqual(resps[0].data, b'/a')  # type: ignore
+                self.assertIsInstance(resps[1], HttpClientError)
+                # Pipelined behind the request which timed out, so resent on another connection.
+                self.assertEqual(resps[2].data, b'/b')  # type: ignore
+
+                with self.assertRaises(HttpClientError):
+                    await client.request_many([HttpClientRequest(f'{url}/slow')], timeout_s=.1)
+
+    async def test_generic(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient() as client0:
+                client = MiddlewareAsyncHttpClient(client0, [])
+                resps = await client.request_many(
+                    [
+                        HttpClientRequest(f'{url}/a'),
+                        HttpClientRequest(f'{url}/slow', timeout_s=.1),
+                        HttpClientRequest(f'{url}/b'),
+                    ],
+                    max_concurrency=2,
+                    return_exceptions=True,
+                )
+
+                self.assertEqual(resps[0].data, b'/a')  # type: ignore
+                self.assertIsInstance(resps[1], HttpClientError)
+                self.assertEqual(resps[2].data, b'/b')  # type: ignore
@@ -0,0 +1,304 @@
+import asyncio
+import contextlib
+import gc
+import gzip
+import http.server
+import os.path
+import shutil
+import ssl
+import tempfile
+import threading
+import time
+import typing as ta
+import unittest
+import warnings
+import weakref
+
+from .....io.pipelines.tests.ssl.sslserver import generate_self_signed_cert
+from ... import default
+from ...base import HttpClientRequest
+from ..asyncio import AsyncioIoPipelineAsyncHttpClient
+from ..pools import AsyncioIoPipelineHttpConnectionPool
+from ..pools import BaseIoPipelineHttpConnectionPool
+from ..pools import IoPipelineHttpConnectionPool
+from ..sync import IoPipelineHttpClient
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    server: ta.Any
+
+    def do_GET(self) -> None:  # noqa
+        with self.server.lock:
+            self.server.peers.append(self.client_address)
+            if isinstance(self.connection, ssl.SSLSocket):
+                self.server.session_reused.append(self.connection.session_reused)
+
+        if self.path == '/chunked':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for c in [b'hello ', b'chunked']:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(c), c))
+            self.wfile.write(b'0\r\n\r\n')
+            return
+
+        if self.path.startswith('/slow'):
+            time.sleep(.5)
+
+        body = self.path.encode()
+        self.send_response(200)
+        if self.path.startswith('/gzip'):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:  # noqa
+        with self.server.lock:
+            self.server.peers.append(self.client_address)
+
+        # Describes the body a GET would be answered with, without sending it.
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.path)))
+        self.end_headers()
+
+    def log_message(self, format, *args):  # noqa
+        pass
+
+
+@contextlib.contextmanager
+def _serve(ssl_ctx: ssl.SSLContext | None = None) -> ta.Iterator[ta.Any]:
+    server: ta.Any = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.handle_error = lambda request, client_address: None  # Clients timing out leave broken pipes.
+    server.lock = threading.Lock()
+    server.peers = []
+    server.session_reused = []
+    if ssl_ctx is not None:
+        server.socket = ssl_ctx.wrap_socket(server.socket, server_side=True)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _num_connections(server: ta.Any) -> int:
+    with server.lock:
+        return len(set(server.peers))
+
+
+class TestSyncPool(unittest.TestCase):
+    def test_reuse(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient() as client:
+                for i in range(5):
+                    resp = client.request(HttpClientRequest(f'{url}/{i}'))
+                    self.assertEqual(resp.data, f'/{i}'.encode())
+
+                resp = client.request(HttpClientRequest(f'{url}/chunked'))
+                self.assertEqual(resp.data, b'hello chunked')
+
+                self.assertEqual(_num_connections(server), 1)
+                self.assertEqual(check_pool(client.pool).num_idle(), 1)
+
+            self.assertEqual(check_pool(client.pool).num_open(), 0)
+
+    def test_connection_close(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient() as client:
+                for _ in range(3):
+                    resp = client.request(HttpClientRequest(f'{url}/close'))
+                    self.assertEqual(resp.data, b'/close')
+
+                self.assertEqual(_num_connections(server), 3)
+                self.assertEqual(check_pool(client.pool).num_open(), 0)
+
+    def test_reuse_after_compressed(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient() as client:
+                for p in ['/gzip/a', '/b', '/gzip/c']:
+                    resp = client.request(HttpClientRequest(f'{url}{p}'))
+                    self.assertEqual(resp.data, p.encode())
+
+                self.assertEqual(_num_connections(server), 1)
+
+    def test_unread_response_not_reused(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient() as client:
+                for _ in range(2):
+                    with client.stream_request(HttpClientRequest(f'{url}/chunked')):
+                        pass
+
+                self.assertEqual(_num_connections(server), 2)
+
+    def test_stale_connection_retried(self):
+        with IoPipelineHttpClient() as client:
+            with _serve() as server:
+                url = f'http://127.0.0.1:{server.server_port}'
+                client.request(HttpClientRequest(f'{url}/a'))
+
+            # The server is gone, closing its idle connection.
+            with _serve() as server2:
+                url2 = f'http://127.0.0.1:{server2.server_port}'
+                resp = client.request(HttpClientRequest(f'{url2}/b'))
+                self.assertEqual(resp.data, b'/b')
+
+    def test_max_idle(self):
+        pool = IoPipelineHttpConnectionPool(BaseIoPipelineHttpConnectionPool.Config(max_idle_per_origin=1))
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient(pool=pool) as client:
+                resps = [client.stream_request(HttpClientRequest(f'{url}/{i}')) for i in range(3)]
+                self.assertEqual(pool.num_open(), 3)
+                for resp in resps:
+                    resp.stream.read()
+                    resp.close()
+
+            # A client given a pool leaves it open.
+            self.assertEqual(pool.num_open(), 1)
+            self.assertEqual(pool.num_idle(), 1)
+
+        pool.close()
+        self.assertEqual(pool.num_open(), 0)
+
+    def test_idle_timeout(self):
+        now = [0.]
+        pool = IoPipelineHttpConnectionPool(
+            BaseIoPipelineHttpConnectionPool.Config(idle_timeout_s=10.),
+            clock=lambda: now[0],
+        )
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with IoPipelineHttpClient(pool=pool) as client:
+                client.request(HttpClientRequest(f'{url}/a'))
+                now[0] = 5.
+                client.request(HttpClientRequest(f'{url}/b'))
+                self.assertEqual(_num_connections(server), 1)
+
+                now[0] = 20.
+                pool.evict_idle()
+                self.assertEqual(pool.num_open(), 0)
+
+                client.request(HttpClientRequest(f'{url}/c'))
+                self.assertEqual(_num_connections(server), 2)
+
+        pool.close()
+
+    def test_ssl_session_reuse(self):
+        if shutil.which('openssl') is None:
+            self.skipTest('openssl not found')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cert_pem, key_pem = generate_self_signed_cert(tmp_dir)
+
+            server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            server_ctx.load_cert_chain(cert_pem, key_pem)
+
+            client_ctx = ssl.create_default_context(cafile=os.path.join(tmp_dir, 'cert.pem'))
+            client_ctx.check_hostname = False
+
+            pool = IoPipelineHttpConnectionPool(ssl_context=client_ctx)
+            with _serve(server_ctx) as server:
+                url = f'https://127.0.0.1:{server.server_port}'
+                with IoPipelineHttpClient(pool=pool) as client:
+                    for _ in range(2):
+                        resp = client.request(HttpClientRequest(f'{url}/close'))
+                        self.assertEqual(resp.data, b'/close')
+
+                    self.assertEqual(server.session_reused, [False, True])
+
+            pool.close()
+
+
+def check_pool(pool: ta.Any) -> ta.Any:
+    if pool is None:
+        raise AssertionError('no pool')
+    return pool
+
+
+class TestAsyncioPool(unittest.IsolatedAsyncioTestCase):
+    async def test_reuse(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient() as client:
+                for i in range(5):
+                    resp = await client.request(HttpClientRequest(f'{url}/{i}'))
+                    self.assertEqual(resp.data, f'/{i}'.encode())
+
+                resp = await client.request(HttpClientRequest(f'{url}/chunked'))
+                self.assertEqual(resp.data, b'hello chunked')
+
+                self.assertEqual(_num_connections(server), 1)
+
+            self.assertEqual(check_pool(client.pool).num_open(), 0)
+
+    async def test_concurrent_limit(self):
+        pool = AsyncioIoPipelineHttpConnectionPool(
+            BaseIoPipelineHttpConnectionPool.Config(max_connections_per_origin=2),
+        )
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with AsyncioIoPipelineAsyncHttpClient(pool=pool) as client:
+                resps = await asyncio.gather(*[
+                    client.request(HttpClientRequest(f'{url}/{i}'))
+                    for i in range(8)
+                ])
+                self.assertEqual([r.data for r in resps], [f'/{i}'.encode() for i in range(8)])
+
+                self.assertLessEqual(_num_connections(server), 2)
+
+        await pool.close()
+
+    async def test_default_client_pool(self):
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}'
+            async with default.manage_async_client_pool() as pool:
+                for i in range(3):
+                    resp = await default.async_request(f'{url}/{i}')
+                    self.assertEqual(resp.data, f'/{i}'.encode())
+
+                self.assertEqual(_num_connections(server), 1)
+                self.assertEqual(pool.num_idle(), 1)
+
+            self.assertEqual(pool.num_open(), 0)
+
+            # Unscoped, nothing is kept.
+            await default.async_request(f'{url}/a')
+            await default.async_request(f'{url}/b')
+            self.assertEqual(_num_connections(server), 3)
+
+
+class TestDefaultAsyncClientLoops(unittest.TestCase):
+    def test_loops_released(self):
+        async def run(url: str, scoped: bool) -> weakref.ref:
+            async with contextlib.AsyncExitStack() as es:
+                if scoped:
+                    await es.enter_async_context(default.manage_async_client_pool())
+                resp = await default.async_request(url)
+                self.assertEqual(resp.data, b'/a')
+            return weakref.ref(asyncio.get_running_loop())
+
+        with _serve() as server:
+            url = f'http://127.0.0.1:{server.server_port}/a'
+            with warnings.catch_warnings(record=True) as ws:
+                warnings.simplefilter('always', ResourceWarning)
+
+                loops = [asyncio.run(run(url, i % 2 == 0)) for i in range(4)]
+                gc.collect()
+
+            self.assertEqual([l() for l in loops], [None] * 4)
+            self.assertEqual([w for w in ws if issubclass(w.category, ResourceWarning)], [])
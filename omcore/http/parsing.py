@@ -1,4 +1,4 @@
-# ruff: noqa: UP006 UP007 UP045
+# ruff: noqa: UP006 UP007 UP037 UP045
 """
 Parses a complete HTTP/1.x start-line + header fields + final CRLF from a ``bytes`` object. Does NOT handle message
 bodies, chunked transfer decoding, trailers, or HTTP/2+.
@@ -149,23 +149,52 @@ class ParsedHttpHeaders:
 
     Field names are stored in lowercase. Values are decoded as Latin-1. Multiple values for the same field-name are
     stored individually and combined with ``", "`` on access (except Set-Cookie, which is never combined).
+
+    When parsed with ``lazy_headers`` values are held as offsets into the message and only validated and decoded when
+    their field is first accessed, so a malformed value raises from that access rather than from parsing.
     """
 
     def __init__(self) -> None:
-        # normalized name -> list of individual values
-        self._entries: ta.Dict[str, ta.List[str]] = {}
+        # normalized name -> list of individual values - or, for lazily parsed values not yet accessed, their spans
+        self._entries: ta.Dict[str, ta.List[ta.Any]] = {}
 
         # insertion-ordered unique names
         self._order: ta.List[str] = []
 
+        # names with values still held as spans, and the callable validating and decoding a span - both left None when
+        # eagerly parsed, so the accessors below only pay a single attribute check for laziness
+        self._lazy_names: ta.Optional[ta.Set[str]] = None
+        self._lazy_decoder: ta.Optional[ta.Callable[[ta.Any], str]] = None
+
     def _add(self, name: str, value: str) -> None:
         if name not in self._entries:
             self._entries[name] = []
             self._order.append(name)
         self._entries[name].append(value)
 
+    def _add_lazy(self, name: str, span: ta.Any, decoder: ta.Callable[[ta.Any], str]) -> None:
+        self._lazy_decoder = decoder
+        if (lazy_names := self._lazy_names) is None:
+            lazy_names = self._lazy_names = set()
+        lazy_names.add(name)
+        if (values := self._entries.get(name)) is None:
+            self._entries[name] = [span]
+            self._order.append(name)
+        else:
+            values.append(span)
+
+    def _decode_lazy(self, key: str) -> ta.List[str]:
+        values = self._entries[key]
+        decoder = self._lazy_decoder
+        values[:] = [v if isinstance(v, str) else decoder(v) for v in values]  # type: ignore[misc]
+        self._lazy_names.discard(key)  # type: ignore[union-attr]
+        return values
+
     @property
     def entries(self) -> ta.Mapping[str, ta.Sequence[str]]:
+        if self._lazy_names:
+            for name in list(self._lazy_names):
+                self._decode_lazy(name)
         return self._entries
 
     def __contains__(self, name: ta.Any) -> bool:
@@ -180,14 +209,18 @@ class ParsedHttpHeaders:
 
     def __getitem__(self, name: str) -> str:
         key = name.lower()
-        values = self._entries[key]
-        if key in self._NO_COMBINE_HEADERS:
+        if key in self._NO_COMBINE_HEADERS and key in self._entries:
             raise NoCombineHeaderHttpParseError(name)
-        return ', '.join(values)
+        if self._lazy_names and key in self._lazy_names:
+            return ', '.join(self._decode_lazy(key))
+        return ', '.join(self._entries[key])
 
     def get(self, name: str, default: ta.Optional[str] = None) -> ta.Optional[str]:
         key = name.lower()
-        values = self._entries.get(key)
+        if self._lazy_names and key in self._lazy_names:
+            values = self._decode_lazy(key)
+        else:
+            values = self._entries.get(key)
         if not values:
             return default
 
@@ -199,12 +232,18 @@ class ParsedHttpHeaders:
         return ', '.join(values)
 
     def get_all(self, name: str) -> ta.List[str]:
-        return list(self._entries.get(name.lower(), []))
+        key = name.lower()
+        if self._lazy_names and key in self._lazy_names:
+            return list(self._decode_lazy(key))
+        return list(self._entries.get(key, []))
 
     def items(self) -> ta.List[ta.Tuple[str, str]]:
         result: ta.List[ta.Tuple[str, str]] = []
         for name in self._order:
-            values = self._entries[name]
+            if self._lazy_names and name in self._lazy_names:
+                values = self._decode_lazy(name)
+            else:
+                values = self._entries[name]
             if name in self._NO_COMBINE_HEADERS:
                 for v in values:
                     result.append((name, v))
@@ -303,6 +342,68 @@ class RawParsedHttpHeader:
         return f'{self.__class__.__name__}({self.name!r}, {self.value!r})'
 
 
+class _HttpHeaderSpan(ta.NamedTuple):
+    """Offsets into the message of a lazily parsed field, with its already validated and normalized name."""
+
+    name: str
+    name_start: int
+    name_end: int
+    value_start: int
+    value_end: int
+    line: int
+
+
+class _LazyRawParsedHttpHeaders(ta.Sequence[RawParsedHttpHeader]):
+    """The raw headers of a lazily parsed message, validating all field-values on first access to any."""
+
+    def __init__(
+            self,
+            ctx: '_HttpParseContext',
+            fields: ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]],
+    ) -> None:
+        super().__init__()
+
+        self._ctx = ctx
+        self._fields = fields
+
+        self._headers: ta.Optional[ta.List[RawParsedHttpHeader]] = None
+
+    def _materialize(self) -> ta.List[RawParsedHttpHeader]:
+        if (hs := self._headers) is None:
+            hs = self._headers = [
+                self._ctx.lazy_raw_header(f) if isinstance(f, _HttpHeaderSpan) else f
+                for f in self._fields
+            ]
+        return hs
+
+    @ta.overload
+    def __getitem__(self, i: int) -> RawParsedHttpHeader:
+        ...
+
+    @ta.overload
+    def __getitem__(self, i: slice) -> ta.Sequence[RawParsedHttpHeader]:
+        ...
+
+    def __getitem__(self, i):
+        return self._materialize()[i]
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __iter__(self) -> ta.Iterator[RawParsedHttpHeader]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyRawParsedHttpHeaders):
+            other = other._materialize()  # noqa
+        return self._materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
 @dc.dataclass()
 class ParsedHttpMessage:
     class Kind(enum.Enum):
@@ -327,7 +428,7 @@ class ParsedHttpMessage:
 
     status_line: ta.Optional[StatusLine]
 
-    raw_headers: ta.List[RawParsedHttpHeader]
+    raw_headers: ta.Sequence[RawParsedHttpHeader]
     headers: ParsedHttpHeaders
 
     prepared: PreparedParsedHttpHeaders
@@ -370,6 +471,11 @@ class HttpParser:
         max_header_length: ta.Optional[int] = 8192
         max_content_length_str_len: ta.Optional[int] = 20
 
+        # Defers validating and decoding field-values until accessed. Line structure and field-names are always
+        # checked up front, as are the fields consulted to build the prepared headers. Applies only to messages, not
+        # trailers.
+        lazy_headers: bool = False
+
     def __init__(self, config: Config = Config()) -> None:
         super().__init__()
 
@@ -420,14 +526,28 @@ class HttpParser:
         # 5. Parse header fields
         # Position after start-line CRLF (or LF if bare LF allowed)
         header_start = start_line_end + ctx.line_ending_len(start_line_end)
-        raw_headers = ctx.parse_header_fields(header_start)
-
-        # 6. Build normalized headers
+        raw_headers: ta.Sequence[RawParsedHttpHeader]
         headers = ParsedHttpHeaders()
-        for rh in raw_headers:
-            name_str = rh.name.decode('ascii').lower()
-            value_str = rh.value.decode('latin-1')
-            headers._add(name_str, value_str)  # noqa
+
+        if self._config.lazy_headers:
+            fields = ctx.scan_header_fields(header_start)
+            raw_headers = _LazyRawParsedHttpHeaders(ctx, fields)
+
+            # 6. Build normalized headers, holding value spans
+            for f in fields:
+                if isinstance(f, _HttpHeaderSpan):
+                    headers._add_lazy(f.name, f, ctx.decode_lazy_header_value)  # noqa
+                else:
+                    headers._add(ctx.normalize_header_name(f.name), f.value.decode('latin-1'))  # noqa
+
+        else:
+            raw_headers = ctx.parse_header_fields(header_start)
+
+            # 6. Build normalized headers
+            for rh in raw_headers:
+                name_str = ctx.normalize_header_name(rh.name)
+                value_str = rh.value.decode('latin-1')
+                headers._add(name_str, value_str)  # noqa
 
         # 7. Build prepared headers
         prepared = ctx.prepare_headers(headers, kind, http_version)
@@ -470,7 +590,7 @@ class HttpParser:
         # Build normalized headers
         headers = ParsedHttpHeaders()
         for rh in raw_headers:
-            name_str = rh.name.decode('ascii').lower()
+            name_str = ctx.normalize_header_name(rh.name)
             value_str = rh.value.decode('latin-1')
             headers._add(name_str, value_str)  # noqa
 
@@ -538,6 +658,87 @@ class _HttpParseContext:
     _TCHAR_BYTES = bytes(sorted(_TCHAR))
     _VCHAR_BYTES = bytes(range(0x21, 0x7F))
 
+    # Well-known field-names, normalized, and their conventional spellings. Being valid tokens these need no validation,
+    # and are normalized by a single dict lookup rather than a decode and lower.
+    _WELL_KNOWN_HEADER_NAME_SPELLINGS: ta.ClassVar[ta.Mapping[str, ta.Sequence[str]]] = {
+        n: sorted({n, n.upper(), '-'.join(p.capitalize() for p in n.split('-')), *ss})
+        for n, ss in {
+            'accept': (),
+            'accept-charset': (),
+            'accept-encoding': (),
+            'accept-language': (),
+            'accept-ranges': (),
+            'access-control-request-headers': (),
+            'access-control-request-method': (),
+            'age': (),
+            'authorization': (),
+            'cache-control': (),
+            'connection': (),
+            'content-disposition': (),
+            'content-encoding': (),
+            'content-language': (),
+            'content-length': (),
+            'content-range': (),
+            'content-type': (),
+            'cookie': (),
+            'date': (),
+            'dnt': (),
+            'etag': ('ETag',),
+            'expect': (),
+            'expires': (),
+            'forwarded': (),
+            'host': (),
+            'if-match': (),
+            'if-modified-since': (),
+            'if-none-match': (),
+            'if-range': (),
+            'if-unmodified-since': (),
+            'keep-alive': (),
+            'last-modified': (),
+            'location': (),
+            'origin': (),
+            'pragma': (),
+            'priority': (),
+            'proxy-authorization': (),
+            'range': (),
+            'referer': (),
+            'sec-ch-ua': ('Sec-CH-UA',),
+            'sec-ch-ua-mobile': ('Sec-CH-UA-Mobile',),
+            'sec-ch-ua-platform': ('Sec-CH-UA-Platform',),
+            'sec-fetch-dest': (),
+            'sec-fetch-mode': (),
+            'sec-fetch-site': (),
+            'sec-fetch-user': (),
+            'server': (),
+            'set-cookie': (),
+            'te': (),
+            'trailer': (),
+            'transfer-encoding': (),
+            'upgrade': (),
+            'upgrade-insecure-requests': (),
+            'user-agent': (),
+            'vary': (),
+            'via': (),
+            'www-authenticate': ('WWW-Authenticate',),
+            'x-forwarded-for': ('X-Forwarded-For',),
+            'x-forwarded-host': (),
+            'x-forwarded-proto': (),
+            'x-real-ip': ('X-Real-IP',),
+            'x-request-id': ('X-Request-ID',),
+            'x-requested-with': (),
+        }.items()
+    }
+
+    _WELL_KNOWN_HEADER_NAMES: ta.ClassVar[ta.Mapping[bytes, str]] = {
+        s.encode('ascii'): n
+        for n, ss in _WELL_KNOWN_HEADER_NAME_SPELLINGS.items()
+        for s in ss
+    }
+
+    @classmethod
+    def normalize_header_name(cls, name: Bytes) -> str:
+        return cls._WELL_KNOWN_HEADER_NAMES.get(name) or name.decode('ascii').lower()  # type: ignore[call-overload]
+
     # Terminator verification
 
     def verify_terminator(self) -> None:
@@ -665,6 +866,13 @@ class _HttpParseContext:
             offset=length,
         )
 
+    def _is_plain_crlf(self, start: int) -> bool:
+        """Whether the data from *start* holds no NUL and no CR or LF other than as CRLF pairs."""
+
+        data = self.data
+        n = data.count(self._CRLF, start)
+        return data.count(b'\r', start) == n and data.count(b'\n', start) == n and data.find(b'\x00', start) < 0
+
     def line_ending_len(self, line_end_pos: int) -> int:
         """Return the length of the line ending at *line_end_pos* (1 for LF, 2 for CRLF)."""
 
@@ -910,11 +1118,31 @@ class _HttpParseContext:
     def parse_header_fields(self, start: int) -> ta.List[RawParsedHttpHeader]:
         """Parse all header fields from *start* until the empty-line terminator."""
 
-        headers: ta.List[RawParsedHttpHeader] = []
+        return self._parse_header_lines(start, lazy=False)  # type: ignore[return-value]
+
+    def scan_header_fields(self, start: int) -> ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]]:
+        """
+        Like ``parse_header_fields`` but, for the lazy path, only validates field-names and line structure - returning
+        spans of fields whose values are left to ``lazy_header_value``. Folded fields, having no single span in the
+        data, are still parsed eagerly.
+        """
+
+        return self._parse_header_lines(start, lazy=True)
+
+    def _parse_header_lines(
+            self,
+            start: int,
+            lazy: bool,
+    ) -> ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]]:
+        headers: ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]] = []
         pos = start
         data = self.data
         self.current_line = 1  # line 0 is the start-line
 
+        # When every line ends in a plain CRLF, lines are found by a single find() each. Otherwise find_line_end scans
+        # them, and raises the precise error for whatever is wrong.
+        plain_crlf = self._is_plain_crlf(start)
+
         while pos < len(data):
             # Check for the empty line that terminates headers. Whichever empty-line form we stop at, nothing may
             # follow it: this is the authoritative trailing-data check. verify_terminator only gates existence and in
@@ -950,11 +1178,10 @@ class _HttpParseContext:
                 )
 
             # Find end of this header line
-            line_end = self.find_line_end(pos)
-            line_data = data[pos:line_end]
+            line_end = data.find(self._CRLF, pos) if plain_crlf else self.find_line_end(pos)
             next_pos = line_end + self.line_ending_len(line_end)
 
-            if self.config.max_header_length is not None and len(line_data) > self.config.max_header_length:
+            if self.config.max_header_length is not None and line_end - pos > self.config.max_header_length:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                     message='Header line exceeds maximum length',
@@ -978,13 +1205,13 @@ class _HttpParseContext:
                         )
 
                     # Unfold: find the end of the continuation line
-                    cont_line_end = self.find_line_end(next_pos)
+                    cont_line_end = data.find(self._CRLF, next_pos) if plain_crlf else self.find_line_end(next_pos)
                     cont_data = data[next_pos:cont_line_end]
 
                     # Replace fold with single SP
                     if obs_buf is None:
                         obs_buf = io.BytesIO()
-                        obs_buf.write(line_data)
+                        obs_buf.write(data[pos:line_end])
                     obs_buf.write(b' ')
                     obs_buf.write(cont_data.lstrip(b' \t'))
 
@@ -1001,11 +1228,14 @@ class _HttpParseContext:
                 else:
                     break
 
-            if obs_buf is not None:
-                line_data = obs_buf.getvalue()
-
             # Parse field-name : field-value
-            header = self._parse_one_header(line_data, pos)
+            header: ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]
+            if obs_buf is not None:
+                header = self._parse_one_header(obs_buf.getvalue(), pos)
+            elif lazy:
+                header = self._scan_one_header(pos, line_end)
+            else:
+                header = self._parse_one_header(data[pos:line_end], pos)
             headers.append(header)
 
             pos = next_pos
@@ -1056,16 +1286,27 @@ class _HttpParseContext:
             )
 
         name_bytes = line_data[:colon_idx]
-        value_bytes = line_data[colon_idx + 1:]
+        if name_bytes not in self._WELL_KNOWN_HEADER_NAMES:
+            name_bytes = self._check_field_name(name_bytes, line_start_offset, self.current_line)
 
-        # Validate field-name
+        return RawParsedHttpHeader(
+            name=name_bytes,
+            value=self._check_field_value(
+                line_data[colon_idx + 1:],
+                line_start_offset + colon_idx + 1,
+                self.current_line,
+            ),
+        )
+
+    def _check_field_name(self, name_bytes: Bytes, offset: int, line: int) -> Bytes:
+        """Validate a field-name, returning it stripped of any allowed trailing whitespace."""
 
         if not name_bytes:
             raise HeaderFieldHttpParseError(
                 code=HeaderFieldHttpParseErrorCode.EMPTY_FIELD_NAME,
                 message='Empty field-name before colon',
-                line=self.current_line,
-                offset=line_start_offset,
+                line=line,
+                offset=offset,
             )
 
         # Check for space before colon
@@ -1074,8 +1315,8 @@ class _HttpParseContext:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.SPACE_BEFORE_COLON,
                     message='Whitespace between field-name and colon',
-                    line=self.current_line,
-                    offset=line_start_offset + len(name_bytes) - 1,
+                    line=line,
+                    offset=offset + len(name_bytes) - 1,
                 )
 
             # Strip trailing whitespace from name if allowed
@@ -1084,8 +1325,8 @@ class _HttpParseContext:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.EMPTY_FIELD_NAME,
                     message='Field-name is only whitespace before colon',
-                    line=self.current_line,
-                    offset=line_start_offset,
+                    line=line,
+                    offset=offset,
                 )
 
         # Validate name characters (regex fast-path; fallback scan on failure)
@@ -1095,27 +1336,30 @@ class _HttpParseContext:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.NUL_IN_HEADER,
                         message='NUL byte in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b >= 0x80:
                     raise EncodingHttpParseError(
                         code=EncodingHttpParseErrorCode.NON_ASCII_IN_FIELD_NAME,
                         message=f'Non-ASCII byte 0x{b:02x} in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b not in self._TCHAR:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_NAME,
                         message=f'Invalid character 0x{b:02x} in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
-        # Process field-value
+        return name_bytes
+
+    def _check_field_value(self, value_bytes: Bytes, offset: int, line: int) -> Bytes:
+        """Validate a field-value, returning it stripped of OWS."""
 
         # Strip OWS
         value_stripped = self._strip_ows_bytes(value_bytes)
@@ -1125,8 +1369,8 @@ class _HttpParseContext:
             raise HeaderFieldHttpParseError(
                 code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                 message='Empty header field value not allowed',
-                line=self.current_line,
-                offset=line_start_offset + colon_idx + 1,
+                line=line,
+                offset=offset,
             )
 
         # Validate value characters (Translation fast-path)
@@ -1140,7 +1384,6 @@ class _HttpParseContext:
         invalid_chars = value_stripped.translate(None, allowed_bytes)
 
         if invalid_chars:
-            value_base_offset = line_start_offset + colon_idx + 1
             # We only enter this Python loop if we ALREADY found an error.
             # This keeps the "happy path" fast while maintaining detailed error reporting.
             for i, b in enumerate(value_stripped):
@@ -1148,8 +1391,8 @@ class _HttpParseContext:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.NUL_IN_HEADER,
                         message='NUL byte in field-value',
-                        line=self.current_line,
-                        offset=value_base_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b == self._CR:
@@ -1157,8 +1400,8 @@ class _HttpParseContext:
                         raise HeaderFieldHttpParseError(
                             code=HeaderFieldHttpParseErrorCode.BARE_CARRIAGE_RETURN,
                             message='Bare CR in field-value',
-                            line=self.current_line,
-                            offset=value_base_offset + i,
+                            line=line,
+                            offset=offset + i,
                         )
                     continue
 
@@ -1168,21 +1411,61 @@ class _HttpParseContext:
                         raise EncodingHttpParseError(
                             code=EncodingHttpParseErrorCode.OBS_TEXT_IN_FIELD_VALUE,
                             message=f'obs-text byte 0x{b:02x} rejected by config',
-                            line=self.current_line,
-                            offset=value_base_offset + i,
+                            line=line,
+                            offset=offset + i,
                         )
 
                     # General character error
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                         message=f'Invalid character 0x{b:02x} in field-value',
-                        line=self.current_line,
-                        offset=value_base_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
+        return value_stripped
+
+    def _scan_one_header(self, line_start_offset: int, line_end: int) -> _HttpHeaderSpan:
+        """Validate the field-name of an unfolded line, recording the span of its field-value."""
+
+        colon_idx = self.data.find(b':', line_start_offset, line_end)
+        if colon_idx < 0:
+            raise HeaderFieldHttpParseError(
+                code=HeaderFieldHttpParseErrorCode.MISSING_COLON,
+                message='Header line has no colon separator',
+                line=self.current_line,
+                offset=line_start_offset,
+            )
+
+        name_bytes = self.data[line_start_offset:colon_idx]
+        name = self._WELL_KNOWN_HEADER_NAMES.get(name_bytes)
+        if name is None:
+            name_bytes = self._check_field_name(name_bytes, line_start_offset, self.current_line)
+            name = name_bytes.decode('ascii').lower()
+
+        return _HttpHeaderSpan(
+            name,
+            line_start_offset,
+            line_start_offset + len(name_bytes),
+            colon_idx + 1,
+            line_end,
+            self.current_line,
+        )
+
+    # Lazy header access
+
+    def lazy_header_value(self, span: _HttpHeaderSpan) -> Bytes:
+        _, _, _, vs, ve, line = span
+        return self._check_field_value(self.data[vs:ve], vs, line)
+
+    def decode_lazy_header_value(self, span: _HttpHeaderSpan) -> str:
+        _, _, _, vs, ve, line = span
+        return self._check_field_value(self.data[vs:ve], vs, line).decode('latin-1')
+
+    def lazy_raw_header(self, span: _HttpHeaderSpan) -> RawParsedHttpHeader:
         return RawParsedHttpHeader(
-            name=name_bytes,
-            value=value_stripped,
+            name=self.data[span.name_start:span.name_end],
+            value=self.lazy_header_value(span),
         )
 
     # Prepared header construction
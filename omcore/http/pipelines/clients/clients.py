@@ -1,5 +1,6 @@
 # ruff: noqa: UP006 UP007 UP037 UP045
 # @om-lite
+import collections
 import dataclasses as dc
 import typing as ta
 
@@ -15,6 +16,7 @@ from ..responses import FullIoPipelineHttpResponse
 from ..responses import IoPipelineHttpResponseEnd
 from ..responses import IoPipelineHttpResponseObject
 from .responses import IoPipelineHttpResponseAggregatorDecoder
+from .responses import IoPipelineHttpResponseDecoder
 
 
 ##
@@ -46,17 +48,42 @@ class IoPipelineHttpClientMessages(NamespaceClass):
 
 
 class IoPipelineHttpClientHandler(IoPipelineHandler):
-    _request: ta.Optional[IoPipelineHttpClientMessages.Request] = None
+    """
+    Sends requests and feeds out the responses to them. With `max_pipelined` above 1, up to that many requests may be
+    sent before the responses to the first of them - HTTP/1.1 pipelining - and responses are matched to requests in the
+    order they were sent.
+    """
+
+    def __init__(self, *, max_pipelined: int = 1) -> None:
+        super().__init__()
+
+        check.arg(max_pipelined > 0, 'max_pipelined must be positive')
+        self._max_pipelined = max_pipelined
+
+        self._requests: ta.Deque[IoPipelineHttpClientMessages.Request] = collections.deque()
+
+    @property
+    def _request(self) -> ta.Optional[IoPipelineHttpClientMessages.Request]:
+        return self._requests[0] if self._requests else None
 
     def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
         if isinstance(msg, IoPipelineHttpClientMessages.Request):
-            check.none(self._request)
-            self._request = msg
+            check.state(len(self._requests) < self._max_pipelined, 'Too many requests in flight')
 
             if (ag := msg.aggregate) is not None:
+                # The aggregator sees the head of a response before the one ahead of it is matched to its request, so
+                # it can't be switched per request while any are in flight.
+                check.state(not self._requests, 'Cannot set aggregation of pipelined requests')
+
                 rad = check.not_none(ctx.pipeline.find_single_handler_of_type(IoPipelineHttpResponseAggregatorDecoder))
                 rad.handler.set_enabled(ag)
 
+            # The decoder delimits responses, but can't know on its own which answer a HEAD and so have no body.
+            if (rd := ctx.pipeline.find_single_handler_of_type(IoPipelineHttpResponseDecoder)) is not None:
+                rd.handler.expect_response(bodiless=msg.request.head.method.upper() == 'HEAD')
+
+            self._requests.append(msg)
+
             ctx.feed_out(msg.request)
 
             IoPipelineFlow.maybe_flush_output(ctx)
@@ -71,19 +98,19 @@ class IoPipelineHttpClientHandler(IoPipelineHandler):
 
             ctx.feed_out(IoPipelineHttpClientMessages.Output(msg, request=self._request))
 
-            if isinstance(msg, (FullIoPipelineHttpResponse, IoPipelineHttpResponseEnd)):
-                self._request = None
+            if isinstance(msg, (FullIoPipelineHttpResponse, IoPipelineHttpResponseEnd)) and self._requests:
+                self._requests.popleft()
 
             return
 
         if isinstance(msg, IoPipelineFlowMessages.FlushInput):
-            if self._request is not None:
+            if self._requests:
                 ctx.defer(IoPipelineFlow.maybe_ready_for_input)
 
         if isinstance(msg, (IoPipelineMessages.FinalInput, IoPipelineHttpClientMessages.Close)):
             ctx.feed_out(IoPipelineHttpClientMessages.Output(msg, request=self._request))
 
-            self._request = None
+            self._requests.clear()
 
             if isinstance(msg, IoPipelineMessages.FinalInput):
                 ctx.feed_in(msg)
@@ -1,12 +1,17 @@
 # ruff: noqa: UP006 UP045
 # @om-lite
+import collections
 import typing as ta
 
+from ....lite.check import check
 from ...parsing import HttpParser
 from ..aggregators import IoPipelineHttpObjectAggregatorDecoder
 from ..chunking import IoPipelineHttpObjectDechunker
 from ..compression.decompressors import IoPipelineHttpObjectDecompressor
+from ..decoders import IoPipelineHttpDecodingConfig
 from ..decoders import IoPipelineHttpObjectDecoder
+from ..objects import IoPipelineHttpMessageHead
+from ..responses import IoPipelineHttpResponseHead
 from ..responses import IoPipelineHttpResponseObjects
 
 
@@ -14,9 +19,38 @@ from ..responses import IoPipelineHttpResponseObjects
 
 
 class IoPipelineHttpResponseDecoder(IoPipelineHttpResponseObjects, IoPipelineHttpObjectDecoder):
+    """
+    Responses with 1xx, 204 or 304 statuses have no body, and nor do responses to HEAD requests - which, as only the
+    sender knows which those are, must be announced with `expect_response` for each request in the order they are sent.
+    """
+
     _parse_mode: ta.Final = HttpParser.Mode.RESPONSE
     _if_content_length_missing: ta.Final = 'eof'
 
+    def __init__(
+            self,
+            *,
+            config: IoPipelineHttpDecodingConfig = IoPipelineHttpDecodingConfig.DEFAULT,
+    ) -> None:
+        super().__init__(config=config)
+
+        self._expected_bodiless: ta.Deque[bool] = collections.deque()
+
+    def expect_response(self, *, bodiless: bool = False) -> None:
+        self._expected_bodiless.append(bodiless)
+
+    _BODILESS_STATUSES: ta.ClassVar[ta.FrozenSet[int]] = frozenset([204, 304])
+
+    def _has_body(self, head: IoPipelineHttpMessageHead) -> bool:
+        status = check.isinstance(head, IoPipelineHttpResponseHead).status
+
+        # Informational responses precede the response to a request rather than answering it.
+        if status < 200:
+            return False
+
+        bodiless = self._expected_bodiless.popleft() if self._expected_bodiless else False
+        return not (bodiless or status in self._BODILESS_STATUSES)
+
 
 ##
 
@@ -0,0 +1,101 @@
+# ruff: noqa: UP006 UP007 UP045
+# @om-lite
+import unittest
+
+from .....io.pipelines.core import IoPipeline
+from .....io.streambufs.utils import ByteStreamBuffers
+from ...requests import FullIoPipelineHttpRequest
+from ...responses import IoPipelineHttpResponseBodyData
+from ...responses import IoPipelineHttpResponseEnd
+from ...responses import IoPipelineHttpResponseHead
+from ..clients import IoPipelineHttpClientHandler
+from ..clients import IoPipelineHttpClientMessages
+from ..requests import IoPipelineHttpRequestEncoder
+from ..responses import IoPipelineHttpResponseDecoder
+
+
+class TestPipelineHttpClientHandler(unittest.TestCase):
+    def _new_pipeline(self, **kwargs):
+        return IoPipeline.new(
+            [
+                IoPipelineHttpResponseDecoder(),
+                IoPipelineHttpRequestEncoder(),
+                IoPipelineHttpClientHandler(**kwargs),
+            ],
+            IoPipeline.Config(raise_immediately=True),
+        )
+
+    def _request(self, path: str, method: str = 'GET') -> IoPipelineHttpClientMessages.Request:
+        return IoPipelineHttpClientMessages.Request(FullIoPipelineHttpRequest.simple(
+            'example.com',
+            path,
+            method=method,
+            connection='keep-alive',
+        ))
+
+    def test_pipelined(self) -> None:
+        channel = self._new_pipeline(max_pipelined=2)
+
+        r1, r2 = self._request('/a'), self._request('/b')
+        channel.feed_in(r1, r2)
+
+        sent = b''.join(ByteStreamBuffers.to_bytes(m) for m in channel.output.drain() if ByteStreamBuffers.can_bytes(m))
+        self.assertEqual(sent.count(b'GET /'), 2)
+        self.assertLess(sent.index(b'GET /a'), sent.index(b'GET /b'))
+
+        with self.assertRaises(Exception):  # noqa
+            channel.feed_in(self._request('/c'))
+
+        channel.feed_in(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\na'
+            b'HTTP/1.1 201 Created\r\nContent-Length: 1\r\n\r\nb',
+        )
+
+        outs = [m for m in channel.output.drain() if isinstance(m, IoPipelineHttpClientMessages.Output)]
+        self.assertEqual(
+            [(type(o.msg), o.request) for o in outs],
+            [
+                (IoPipelineHttpResponseHead, r1),
+                (IoPipelineHttpResponseBodyData, r1),
+                (IoPipelineHttpResponseEnd, r1),
+                (IoPipelineHttpResponseHead, r2),
+                (IoPipelineHttpResponseBodyData, r2),
+                (IoPipelineHttpResponseEnd, r2),
+            ],
+        )
+        self.assertEqual([o.msg.status for o in outs if isinstance(o.msg, IoPipelineHttpResponseHead)], [200, 201])
+
+        # Both answered, so another may be sent.
+        channel.feed_in(self._request('/c'))
+
+    def test_pipelined_head(self) -> None:
+        channel = self._new_pipeline(max_pipelined=2)
+
+        r1, r2 = self._request('/a', 'HEAD'), self._request('/b')
+        channel.feed_in(r1, r2)
+        channel.output.drain()
+
+        # The response to the HEAD describes a body it doesn't have.
+        channel.feed_in(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n'
+            b'HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\nb',
+        )
+
+        outs = [m for m in channel.output.drain() if isinstance(m, IoPipelineHttpClientMessages.Output)]
+        self.assertEqual(
+            [(type(o.msg), o.request) for o in outs],
+            [
+                (IoPipelineHttpResponseHead, r1),
+                (IoPipelineHttpResponseEnd, r1),
+                (IoPipelineHttpResponseHead, r2),
+                (IoPipelineHttpResponseBodyData, r2),
+                (IoPipelineHttpResponseEnd, r2),
+            ],
+        )
+
+    def test_not_pipelined_by_default(self) -> None:
+        channel = self._new_pipeline()
+
+        channel.feed_in(self._request('/a'))
+        with self.assertRaises(Exception):  # noqa
+            channel.feed_in(self._request('/b'))
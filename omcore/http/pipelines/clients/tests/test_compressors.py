@@ -7,6 +7,11 @@ from .....io.pipelines.core import IoPipeline
 from .....io.pipelines.handlers.feedback import FeedbackInboundIoPipelineHandler
 from .....lite.check import check
 from ....headers import HttpHeaders
+from ...compression.codings import IoPiplineHttpCompressorCoding
+from ...compression.codings import IoPiplineHttpCompressorCodingPool
+from ...compression.codings import ZstdIoPiplineHttpCompressorCoding
+from ...compression.codings import ZstdIoPiplineHttpDecompressorCoding
+from ...requests import FullIoPipelineHttpRequest
 from ...requests import IoPipelineHttpRequestBodyData
 from ...requests import IoPipelineHttpRequestEnd
 from ...requests import IoPipelineHttpRequestHead
@@ -129,3 +134,190 @@ class TestGzipCompressorSimple(unittest.TestCase):
         self.assertEqual(decompressed, raw_data)
 
         self.assertIsInstance(results[-1], IoPipelineHttpRequestEnd)
+
+
+class _CountingCoding(IoPiplineHttpCompressorCoding):
+    num_created = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        _CountingCoding.num_created += 1
+        self._z = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        self.finished = False
+
+    def compress(self, data, /):
+        return self._z.compress(data)
+
+    def finish(self):
+        self.finished = True
+        return self._z.flush()
+
+    def reset(self) -> bool:
+        if not self.finished:
+            return False
+        self._z = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        self.finished = False
+        return True
+
+
+def _has_zstd() -> bool:
+    try:
+        import compression.zstd  # noqa
+    except ImportError:
+        return False
+    return True
+
+
+def _gunzip(data: bytes) -> bytes:
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+class TestCompressorFull(unittest.TestCase):
+    def test_full_compressed_in_one_shot(self):
+        channel = IoPipeline.new([
+            IoPipelineHttpRequestCompressor(),
+            fbi := FeedbackInboundIoPipelineHandler(),
+        ])
+
+        raw_data = b'Hello, World! ' * 100
+        full = FullIoPipelineHttpRequest(
+            head=IoPipelineHttpRequestHead(
+                method='POST',
+                target='/api/data',
+                headers=HttpHeaders({'content-encoding': 'gzip', 'content-length': str(len(raw_data))}),
+            ),
+            body=raw_data,
+        )
+
+        channel.feed_in(fbi.wrap(full))
+
+        results = channel.output.drain()
+        self.assertEqual(len(results), 1)
+        out = check.isinstance(results[0], FullIoPipelineHttpRequest)
+        self.assertLess(len(out.body), len(raw_data))
+        self.assertEqual(out.head.headers.single['content-length'], str(len(out.body)))
+        self.assertEqual(_gunzip(out.body), raw_data)
+
+    def test_full_empty_body_untouched(self):
+        channel = IoPipeline.new([
+            IoPipelineHttpRequestCompressor(),
+            fbi := FeedbackInboundIoPipelineHandler(),
+        ])
+
+        full = FullIoPipelineHttpRequest(
+            head=IoPipelineHttpRequestHead(
+                method='POST',
+                target='/api/data',
+                headers=HttpHeaders({'content-encoding': 'gzip', 'content-length': '0'}),
+            ),
+            body=b'',
+        )
+
+        channel.feed_in(fbi.wrap(full))
+
+        self.assertEqual(channel.output.drain(), [full])
+
+
+class TestCompressorPool(unittest.TestCase):
+    def _compress(self, channel, fbi, raw_data: bytes) -> bytes:
+        channel.feed_in(fbi.wrap(IoPipelineHttpRequestHead(
+            method='POST',
+            target='/api/data',
+            headers=HttpHeaders({'content-encoding': 'gzip'}),
+        )))
+        channel.feed_in(fbi.wrap(IoPipelineHttpRequestBodyData(raw_data)))
+        channel.feed_in(fbi.wrap(IoPipelineHttpRequestEnd()))
+
+        return b''.join(
+            r.data
+            for r in channel.output.drain()
+            if isinstance(r, IoPipelineHttpRequestBodyData)
+        )
+
+    def test_pool_reuses_codings(self):
+        _CountingCoding.num_created = 0
+        pool = IoPiplineHttpCompressorCodingPool(_CountingCoding)
+
+        channel = IoPipeline.new([
+            IoPipelineHttpRequestCompressor({'gzip': pool}),
+            fbi := FeedbackInboundIoPipelineHandler(),
+        ])
+
+        for i in range(3):
+            raw_data = f'message {i} '.encode() * 50
+            self.assertEqual(_gunzip(self._compress(channel, fbi, raw_data)), raw_data)
+            self.assertEqual(len(pool), 1)
+
+        self.assertEqual(_CountingCoding.num_created, 1)
+
+    def test_pool_drops_unfinished_codings(self):
+        pool = IoPiplineHttpCompressorCodingPool(_CountingCoding)
+
+        c = pool()
+        pool.release(c)
+        self.assertEqual(len(pool), 0)
+
+        c.finish()
+        pool.release(c)
+        self.assertEqual(len(pool), 1)
+        self.assertIs(pool(), c)
+
+    def test_pool_max_size(self):
+        pool = IoPiplineHttpCompressorCodingPool(_CountingCoding, max_size=1)
+
+        cs = [pool(), pool()]
+        for c in cs:
+            c.finish()
+            pool.release(c)
+
+        self.assertEqual(len(pool), 1)
+
+
+@unittest.skipUnless(_has_zstd(), 'requires compression.zstd')
+class TestZstdCodings(unittest.TestCase):
+    def test_roundtrip_with_dict(self):
+        from compression import zstd  # noqa
+
+        samples = [f'{{"id": {i}, "name": "item {i}", "tags": ["alpha", "beta"]}}'.encode() for i in range(1000)]
+        zd = zstd.train_dict(samples, 4096)
+
+        pool = IoPiplineHttpCompressorCodingPool(lambda: ZstdIoPiplineHttpCompressorCoding(zstd_dict=zd))
+
+        for i in range(3):
+            c = pool()
+            out = c.compress_full(samples[i]) if i % 2 else b''.join([
+                c.compress(samples[i]) or b'',
+                c.flush() or b'',
+                c.finish() or b'',
+            ])
+            pool.release(c)
+            self.assertEqual(len(pool), 1)
+
+            d = ZstdIoPiplineHttpDecompressorCoding(zstd_dict=zd)
+            self.assertEqual(bytes(d.decompress(out) or b'') + bytes(d.finish() or b''), samples[i])
+
+    def test_decompress_concatenated_frames(self):
+        from compression import zstd  # noqa
+
+        data = zstd.compress(b'abc') + zstd.compress(b'def')
+
+        d = ZstdIoPiplineHttpDecompressorCoding()
+        out = d.decompress(data) or b''
+        tail = d.unconsumed_tail()
+        self.assertEqual(out, b'abc')
+        self.assertEqual(tail, zstd.compress(b'def'))
+        self.assertEqual((d.decompress(check.not_none(tail)) or b'') + (d.finish() or b''), b'def')
+
+    def test_finish_concatenated_frame_held_back(self):
+        from compression import zstd  # noqa
+
+        data = zstd.compress(b'a' * 1000) + zstd.compress(b'def') + zstd.compress(b'ghi')
+
+        # Limiting output holds back the rest of the input, second and third frames included, inside the decompressor.
+        d = ZstdIoPiplineHttpDecompressorCoding()
+        out = d.decompress(data, 10) or b''
+        self.assertEqual(out, b'a' * 10)
+        self.assertIsNone(d.unconsumed_tail())
+        self.assertEqual(d.finish(), b'a' * 990 + b'defghi')
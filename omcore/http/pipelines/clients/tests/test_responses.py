@@ -9,6 +9,7 @@ from .....io.streambufs.utils import ByteStreamBuffers
 from ...responses import IoPipelineHttpResponseAborted
 from ...responses import IoPipelineHttpResponseBodyData
 from ...responses import IoPipelineHttpResponseEnd
+from ...responses import IoPipelineHttpResponseHead
 from ..responses import IoPipelineHttpResponseDecoder
 
 
@@ -99,3 +100,39 @@ class TestPipelineHttpResponseDecoder(unittest.TestCase):
         aborted, eof = out
         self.assertIsInstance(aborted, IoPipelineHttpResponseAborted)
         self.assertIsInstance(eof, IoPipelineMessages.FinalInput)
+
+    def test_bodiless_responses(self) -> None:
+        """Test informational, 204 and 304 responses, and responses to HEADs, end with their heads."""
+
+        decoder = IoPipelineHttpResponseDecoder()
+        channel = IoPipeline.new([
+            decoder,
+            ibq := InboundQueueIoPipelineHandler(),
+        ])
+
+        decoder.expect_response(bodiless=True)
+        decoder.expect_response()
+        decoder.expect_response()
+
+        channel.feed_in(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n'
+            b'HTTP/1.1 100 Continue\r\n\r\n'
+            b'HTTP/1.1 304 Not Modified\r\nContent-Length: 5\r\n\r\n'
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello',
+        )
+
+        out = ibq.drain()
+        self.assertEqual(
+            [(type(m), getattr(m, 'status', None)) for m in out],
+            [
+                (IoPipelineHttpResponseHead, 200),
+                (IoPipelineHttpResponseEnd, None),
+                (IoPipelineHttpResponseHead, 100),
+                (IoPipelineHttpResponseEnd, None),
+                (IoPipelineHttpResponseHead, 304),
+                (IoPipelineHttpResponseEnd, None),
+                (IoPipelineHttpResponseHead, 200),
+                (IoPipelineHttpResponseBodyData, None),
+                (IoPipelineHttpResponseEnd, None),
+            ],
+        )
@@ -1,6 +1,7 @@
 # ruff: noqa: UP006 UP045
 # @om-lite
 import abc
+import sys
 import typing as ta
 import zlib
 
@@ -28,6 +29,20 @@ class IoPiplineHttpCompressorCoding(Abstract):
     def finish(self) -> ta.Optional[BytesLike]:
         raise NotImplementedError
 
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        """
+        Compresses an entire stream at once, on a fresh or reset coding - equivalent to, but potentially much cheaper
+        than, `compress` followed by `finish`.
+        """
+
+        out = [o for o in (self.compress(data), self.finish()) if o]
+        return out[0] if len(out) == 1 else b''.join(out)
+
+    def reset(self) -> bool:
+        """Readies a finished coding to compress a new stream, returning whether it can be."""
+
+        return False
+
 
 IoPiplineHttpCompressorCodings = ta.Mapping[  # ta.TypeAlias  # om-amalg-typing-no-move
     str,
@@ -67,23 +82,44 @@ IoPiplineHttpDecompressorCodings = ta.Mapping[  # ta.TypeAlias  # om-amalg-typin
 
 
 class ZlibIoPiplineHttpCompressorCoding(IoPiplineHttpCompressorCoding):
-    def __init__(self, wbits: int = 16 + zlib.MAX_WBITS) -> None:
+    def __init__(
+            self,
+            wbits: int = 16 + zlib.MAX_WBITS,
+            *,
+            level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> None:
         super().__init__()
 
-        self._z = zlib.compressobj(wbits=wbits)
+        self._wbits = wbits
+        self._level = level
+
+        # Created on first use, as whole bodies are compressed without one.
+        self._z: ta.Any = None
+
+    def _get_z(self) -> ta.Any:
+        if (z := self._z) is None:
+            z = self._z = zlib.compressobj(self._level, wbits=self._wbits)
+        return z
 
     def compress(
             self,
             data: BytesLike,
             /,
     ) -> ta.Optional[BytesLike]:
-        return self._z.compress(data)
+        return self._get_z().compress(data)
 
     def flush(self) -> ta.Optional[BytesLike]:
-        return self._z.flush(zlib.Z_SYNC_FLUSH) or None
+        return self._get_z().flush(zlib.Z_SYNC_FLUSH) or None
 
     def finish(self) -> ta.Optional[BytesLike]:
-        return self._z.flush()
+        return self._get_z().flush()
+
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        # Setting up a stream costs several times as much as compressing a typical api response in one shot.
+        if self._z is None and sys.version_info >= (3, 11):
+            return zlib.compress(data, self._level, self._wbits)
+
+        return super().compress_full(data)
 
 
 class ZlibIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
@@ -107,6 +143,150 @@ class ZlibIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
         return self._z.flush()
 
 
+#
+
+
+class ZstdIoPiplineHttpCompressorCoding(IoPiplineHttpCompressorCoding):
+    """
+    Requires `compression.zstd` (python 3.14+). A `zstd_dict` - a `compression.zstd.ZstdDict`, as returned by its
+    `train_dict` - must be known to the peer, as by out-of-band agreement. Compressors are reusable across streams, and
+    one loaded with a dictionary is costly to set up, so are best handed out by an `IoPiplineHttpCompressorCodingPool`.
+    """
+
+    def __init__(
+            self,
+            *,
+            level: ta.Optional[int] = None,
+            zstd_dict: ta.Any = None,
+    ) -> None:
+        super().__init__()
+
+        from compression import zstd  # noqa
+
+        self._c = zstd.ZstdCompressor(level=level, zstd_dict=zstd_dict)
+
+    def compress(
+            self,
+            data: BytesLike,
+            /,
+    ) -> ta.Optional[BytesLike]:
+        return self._c.compress(data)
+
+    def flush(self) -> ta.Optional[BytesLike]:
+        return self._c.flush(self._c.FLUSH_BLOCK) or None
+
+    def finish(self) -> ta.Optional[BytesLike]:
+        return self._c.flush(self._c.FLUSH_FRAME)
+
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        return self._c.compress(data, self._c.FLUSH_FRAME)
+
+    def reset(self) -> bool:
+        # Each frame is independent, so one fully flushed leaves the compressor ready for the next.
+        return self._c.last_mode == self._c.FLUSH_FRAME
+
+
+class ZstdIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
+    """Requires `compression.zstd` (python 3.14+). Accepts concatenated frames, as the content coding permits."""
+
+    def __init__(
+            self,
+            *,
+            zstd_dict: ta.Any = None,
+    ) -> None:
+        super().__init__()
+
+        from compression import zstd  # noqa
+
+        self._zstd = zstd
+        self._zstd_dict = zstd_dict
+
+        self._d = zstd.ZstdDecompressor(zstd_dict=zstd_dict)
+
+    def decompress(
+            self,
+            data: BytesLike,
+            max_bytes: ta.Optional[int] = None,
+            /,
+    ) -> ta.Optional[BytesLike]:
+        if (d := self._d).eof:
+            d = self._d = self._zstd.ZstdDecompressor(zstd_dict=self._zstd_dict)
+
+        return d.decompress(data, max_bytes or -1)
+
+    def unconsumed_tail(self) -> ta.Optional[BytesLike]:
+        # Input held back by `max_bytes` is retained internally, and worked through by subsequent calls - only that
+        # following the end of a frame is handed back, to start the next.
+        if (d := self._d).eof:
+            return d.unused_data
+        return None
+
+    def finish(self) -> ta.Optional[BytesLike]:
+        d = self._d
+        out: ta.List[bytes] = []
+        while True:
+            while not d.eof and not d.needs_input:
+                if not (o := d.decompress(b'')):
+                    break
+                out.append(o)
+
+            # Input held back by `max_bytes` may run past the end of the frame into the start of another, which only
+            # turns up as unused data once the frame is finished here - so it is worked through by fresh decompressors.
+            if not (d.eof and (ud := d.unused_data)):
+                break
+
+            d = self._d = self._zstd.ZstdDecompressor(zstd_dict=self._zstd_dict)
+            if o := d.decompress(ud):
+                out.append(o)
+
+        return b''.join(out) or None
+
+
+##
+
+
+class IoPiplineHttpCompressorCodingPool:
+    """
+    A compressor coding factory which hands out codings from a free-list of finished ones which could be `reset`, so
+    that codings which are costly to set up - zstd ones loaded with a dictionary, say - are set up once per concurrently
+    compressed stream rather than once per message. Handlers given one in their codings `release` their codings back to
+    it. Safe to share between threads.
+    """
+
+    def __init__(
+            self,
+            factory: ta.Callable[[], IoPiplineHttpCompressorCoding],
+            *,
+            max_size: int = 64,
+    ) -> None:
+        super().__init__()
+
+        self._factory = factory
+        self._max_size = max_size
+
+        self._free: ta.List[IoPiplineHttpCompressorCoding] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<{self._factory!r}, free={len(self._free)}>'
+
+    def __len__(self) -> int:
+        """The number of codings free to be handed out."""
+
+        return len(self._free)
+
+    def __call__(self) -> IoPiplineHttpCompressorCoding:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return self._factory()
+
+    def release(self, coding: IoPiplineHttpCompressorCoding) -> None:
+        """Returns a finished coding to the pool, if it can be reset and the pool is not full."""
+
+        if len(self._free) < self._max_size and coding.reset():
+            self._free.append(coding)
+
+
 ##
 
 
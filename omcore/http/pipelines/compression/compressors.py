@@ -9,12 +9,15 @@ from ....io.pipelines.core import IoPipelineMessages
 from ....io.pipelines.flow.types import IoPipelineFlowMessages
 from ....io.streambufs.utils import ByteStreamBuffers
 from ....lite.abstract import Abstract
+from ....lite.bytes import BytesLike
+from ..objects import FullIoPipelineHttpMessage
 from ..objects import IoPipelineHttpMessageBodyData
 from ..objects import IoPipelineHttpMessageEnd
 from ..objects import IoPipelineHttpMessageHead
 from ..objects import IoPipelineHttpMessageObjects
 from .codings import DefaultIoPiplineHttpCompressionCodings
 from .codings import IoPiplineHttpCompressorCoding
+from .codings import IoPiplineHttpCompressorCodingPool
 from .codings import IoPiplineHttpCompressorCodings
 
 
@@ -37,6 +40,12 @@ class IoPipelineHttpObjectCompressor(
     IoPipelineHandler,
     Abstract,
 ):
+    """
+    Compresses the bodies of outbound messages whose head's content-encoding names one of its codings. Full messages are
+    compressed in one shot, with any content-length adjusted, and the output of each body data message is emitted as a
+    single message. Codings handed out by an `IoPiplineHttpCompressorCodingPool` are released back to it once finished.
+    """
+
     def __init__(
             self,
             codings: ta.Optional[IoPiplineHttpCompressorCodings] = None,
@@ -50,11 +59,25 @@ class IoPipelineHttpObjectCompressor(
         self._codings = codings
 
         self._compressor: ta.Optional[IoPiplineHttpCompressorCoding] = None
+        self._compressor_pool: ta.Optional[IoPiplineHttpCompressorCodingPool] = None
 
     #
 
     def _reset(self) -> None:
         self._compressor = None
+        self._compressor_pool = None
+
+    def _select_coding(
+            self,
+            head: IoPipelineHttpMessageHead,
+    ) -> ta.Optional[ta.Callable[[], IoPiplineHttpCompressorCoding]]:
+        enc = head.headers.lower.get('content-encoding', ())
+
+        for coding_name, coding in self._codings.items():
+            if coding_name.lower() in enc:
+                return coding
+
+        return None
 
     #
 
@@ -73,24 +96,47 @@ class IoPipelineHttpObjectCompressor(
             ctx.feed_out(self._make_aborted('unexpected message sequence'))
             return
 
-        enc = msg.headers.lower.get('content-encoding', ())
-
-        for coding_name, coding in self._codings.items():
-            if coding_name.lower() in enc:
-                self._compressor = coding()
-                break
+        if (coding := self._select_coding(msg)) is not None:
+            self._compressor = coding()
+            if isinstance(coding, IoPiplineHttpCompressorCodingPool):
+                self._compressor_pool = coding
 
         ctx.feed_out(msg)
 
+    def _on_outbound_full(self, ctx: IoPipelineHandlerContext, msg: FullIoPipelineHttpMessage) -> None:
+        # Bodiless responses, as to HEAD requests, may still carry the content-length their body would have had.
+        if self._compressor is not None or not len(msg.body) or (coding := self._select_coding(msg.head)) is None:
+            ctx.feed_out(msg)
+            return
+
+        z = coding()
+        out = z.compress_full(msg.body)
+        if isinstance(coding, IoPiplineHttpCompressorCodingPool):
+            coding.release(z)
+
+        head = msg.head
+        if 'content-length' in head.headers:
+            head = dc.replace(  # type: ignore[type-var]
+                head,
+                headers=head.headers.update(('content-length', str(len(out))), if_present='override'),
+            )
+
+        ctx.feed_out(dc.replace(msg, head=head, body=out))  # type: ignore[type-var]
+
     def _on_outbound_body_data(self, ctx: IoPipelineHandlerContext, msg: IoPipelineHttpMessageBodyData) -> None:
         if (z := self._compressor) is None:
             ctx.feed_out(msg)
             return
 
+        # Each input segment mostly only feeds the compressor's window, so outputs are gathered rather than each sent on
+        # as its own message.
+        outs: ta.List[BytesLike] = []
         for mv in ByteStreamBuffers.iter_segments(msg.data):
-            out = z.compress(mv)
-            if out:
-                ctx.feed_out(self._make_body_data(out))
+            if out := z.compress(mv):
+                outs.append(out)
+
+        if outs:
+            ctx.feed_out(self._make_body_data(outs[0] if len(outs) == 1 else b''.join(outs)))
 
     def _on_outbound_flush_output(self, ctx: IoPipelineHandlerContext, msg: IoPipelineFlowMessages.FlushOutput) -> None:
         if (z := self._compressor) is None:
@@ -111,6 +157,9 @@ class IoPipelineHttpObjectCompressor(
         if out:
             ctx.feed_out(self._make_body_data(out))
 
+        if (pool := self._compressor_pool) is not None:
+            pool.release(z)
+
         self._reset()
         ctx.feed_out(msg)
 
@@ -121,6 +170,9 @@ class IoPipelineHttpObjectCompressor(
         elif isinstance(msg, self._head_type):
             self._on_outbound_head(ctx, msg)
 
+        elif isinstance(msg, self._full_type):
+            self._on_outbound_full(ctx, msg)
+
         elif isinstance(msg, self._body_data_type):
             self._on_outbound_body_data(ctx, msg)
 
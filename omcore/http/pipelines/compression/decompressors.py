@@ -194,18 +194,26 @@ class IoPipelineHttpObjectDecompressor(
                 self._defer_resume(ctx)
                 return False
 
-            out = z.finish()
-            if out:
-                ol = len(out)
-                self._out_total_bytes += ol
-                self._out_pending.append(out)
-                self._out_pending_bytes += ol
-                self._check_budgets()
-                self._emit_out_pending(ctx)
+            # A message with no body has nothing to finish.
+            if self._in_total_bytes:
+                out = z.finish()
+                if out:
+                    ol = len(out)
+                    self._out_total_bytes += ol
+                    self._out_pending.append(out)
+                    self._out_pending_bytes += ol
+                    self._check_budgets()
+                    self._emit_out_pending(ctx)
 
             msg = self._pending_end
             self._pending_end = None
             self._read_requested = False
+
+            # Ready for the next message on the connection - which may be encoded differently, or not at all.
+            self._decompressor = None
+            self._in_total_bytes = 0
+            self._out_total_bytes = 0
+
             ctx.feed_in(msg)
             return True  # FinalInput counts as satisfying the last read
 
@@ -91,6 +91,11 @@ class IoPipelineHttpObjectDecoder(
     def _if_content_length_missing(self) -> ta.Literal['empty', 'eof']:
         raise NotImplementedError
 
+    def _has_body(self, head: IoPipelineHttpMessageHead) -> bool:
+        """Called once per message head. If false the message ends with its head, whatever its headers describe."""
+
+        return True
+
     #
 
     def _decode(
@@ -246,6 +251,10 @@ class IoPipelineHttpObjectDecoder(
                 *,
                 final: bool = False,
         ) -> ta.Optional[ta.Tuple['IoPipelineHttpObjectDecoder._State', ta.Optional[CanByteStreamBuffer]]]:
+            if not self._d._has_body(self._head):  # noqa
+                out.append(self._d._make_end())  # noqa
+                return (self._d._DoneState(self._d, self._head), data)  # noqa
+
             try:
                 te = IoPipelineHttpBodyMode.select(
                     self._head.headers,
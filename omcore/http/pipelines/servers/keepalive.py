@@ -5,6 +5,7 @@ import typing as ta
 from ....io.pipelines.core import IoPipelineHandler
 from ....io.pipelines.core import IoPipelineHandlerContext
 from ....io.pipelines.core import IoPipelineMessages
+from ....io.pipelines.sched.types import IoPipelineScheduling
 from ...headers import HttpHeaders
 from ...versions import HttpVersions
 from ..requests import FullIoPipelineHttpRequest
@@ -26,14 +27,25 @@ class IoPipelineHttpServerKeepAliveHandler(IoPipelineHandler):
     themselves when this handler is present.
 
     HTTP/1.1 defaults to keep-alive; HTTP/1.0 defaults to close.
+
+    With an `idle_timeout_s`, also closes connections which sit idle between requests - including before the first -
+    for that long, timed by the pipeline's `IoPipelineScheduling` service.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            *,
+            idle_timeout_s: ta.Optional[float] = None,
+    ) -> None:
         super().__init__()
 
+        self._idle_timeout_s = idle_timeout_s
+
         self._keep_alive = True
         self._idle = True
 
+        self._idle_handle: ta.Optional[IoPipelineScheduling.Handle] = None
+
     #
 
     @staticmethod
@@ -74,19 +86,50 @@ class IoPipelineHttpServerKeepAliveHandler(IoPipelineHandler):
 
     #
 
+    def _set_idle(self, ctx: IoPipelineHandlerContext, idle: bool) -> None:
+        self._idle = idle
+
+        if self._idle_timeout_s is None:
+            return
+
+        if (h := self._idle_handle) is not None:
+            self._idle_handle = None
+            h.cancel()
+
+        if idle and self._keep_alive:
+            self._idle_handle = ctx.services[IoPipelineScheduling].schedule(
+                ctx.ref,
+                self._idle_timeout_s,
+                lambda: self._on_idle_timeout(ctx),
+            )
+
+    def _on_idle_timeout(self, ctx: IoPipelineHandlerContext) -> None:
+        self._idle_handle = None
+
+        if self._idle and not ctx.pipeline.saw_final_output:
+            self._keep_alive = False
+            ctx.feed_final_output()
+
+    #
+
     def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
         if isinstance(msg, FullIoPipelineHttpRequest):
-            self._idle = False
+            self._set_idle(ctx, False)
             self._keep_alive = self.is_request_keep_alive(msg.head)
             ctx.feed_in(msg)
             return
 
         if isinstance(msg, IoPipelineHttpRequestHead):
-            self._idle = False
+            self._set_idle(ctx, False)
             self._keep_alive = self.is_request_keep_alive(msg)
             ctx.feed_in(msg)
             return
 
+        if isinstance(msg, IoPipelineMessages.InitialInput):
+            self._set_idle(ctx, True)
+            ctx.feed_in(msg)
+            return
+
         if isinstance(msg, IoPipelineMessages.FinalInput):
             if self._idle:
                 ctx.feed_in(msg)
@@ -106,7 +149,7 @@ class IoPipelineHttpServerKeepAliveHandler(IoPipelineHandler):
                 body=msg.body,
             )
             ctx.feed_out(msg)
-            self._idle = True
+            self._set_idle(ctx, True)
             if not self._keep_alive:
                 ctx.feed_final_output()
             return
@@ -118,7 +161,7 @@ class IoPipelineHttpServerKeepAliveHandler(IoPipelineHandler):
 
         if isinstance(msg, IoPipelineHttpResponseEnd):
             ctx.feed_out(msg)
-            self._idle = True
+            self._set_idle(ctx, True)
             if not self._keep_alive:
                 ctx.feed_final_output()
             return
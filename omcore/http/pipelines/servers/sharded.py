@@ -0,0 +1,355 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+# @om-lite
+"""
+TODO:
+ - unix sockets
+ - worker restart on crash
+ - fdio worker loops
+"""
+import asyncio
+import dataclasses as dc
+import multiprocessing as mp
+import os
+import signal
+import socket
+import threading
+import time
+import typing as ta
+
+from ....io.pipelines.core import IoPipeline
+from ....io.pipelines.drivers.asyncio import PollAsyncioStreamIoPipelineDriver
+from ....lite.check import check
+from ....logs.modules import get_module_logger
+
+
+ShardedIoPipelineServerT = ta.TypeVar('ShardedIoPipelineServerT', bound='ShardedIoPipelineServer')
+
+
+log = get_module_logger(globals())  # noqa
+
+
+##
+
+
+class ShardedIoPipelineServer:
+    """
+    Serves connections through pipelines on `num_workers` workers - threads or processes - each running its own asyncio
+    event loop over its own share of the accepted connections, so a server is no longer bound to a single core.
+
+    Connections are distributed by the kernel, either across per-worker listening sockets bound with `SO_REUSEPORT`, or
+    across workers all accepting from a single listening socket passed to each of them. With processes, `spec_builder`
+    must be picklable - a module-level function, say.
+
+    Shutdown is graceful and shared: every worker stops accepting, waits up to `shutdown_timeout_s` for its open
+    connections to finish, then cancels the rest. Each worker keeps counters, readable from the parent as `stats()`.
+    """
+
+    @dc.dataclass(frozen=True)
+    class Config:
+        DEFAULT: ta.ClassVar['ShardedIoPipelineServer.Config']
+
+        host: str = '127.0.0.1'
+        port: int = 0
+
+        # Defaults to the number of cpus.
+        num_workers: ta.Optional[int] = None
+        mode: ta.Literal['thread', 'process'] = 'process'
+
+        # Defaults to 'reuseport' where the platform supports it, otherwise 'shared'.
+        distribution: ta.Optional[ta.Literal['reuseport', 'shared']] = None
+
+        # The multiprocessing start method, for process mode. Defaults to the platform's default.
+        mp_start_method: ta.Optional[str] = None
+
+        listen_backlog: int = 1024
+
+        start_timeout_s: float = 10.
+        shutdown_timeout_s: float = 10.
+
+        driver_config: ta.Optional[PollAsyncioStreamIoPipelineDriver.Config] = None
+
+    Config.DEFAULT = Config()
+
+    def __init__(
+            self,
+            spec_builder: ta.Callable[[], IoPipeline.Spec],
+            config: ta.Optional[Config] = None,
+    ) -> None:
+        super().__init__()
+
+        self._spec_builder = spec_builder
+        if config is None:
+            config = self.Config.DEFAULT
+        self._config = config
+
+        self._num_workers = config.num_workers or os.cpu_count() or 1
+        check.arg(self._num_workers > 0, 'num_workers must be positive')
+
+        if (dist := config.distribution) is None:
+            dist = 'reuseport' if hasattr(socket, 'SO_REUSEPORT') else 'shared'
+        self._distribution = dist
+
+        self._mp_ctx = mp.get_context(config.mp_start_method) if config.mode == 'process' else None
+
+        self._port: ta.Optional[int] = None
+        self._workers: ta.List[ta.Any] = []
+        self._shutdown_event: ta.Any = None
+        self._stats: ta.Any = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<{self._config.mode}x{self._num_workers}, port={self._port}>'
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @property
+    def port(self) -> int:
+        return check.not_none(self._port)
+
+    #
+
+    @ta.final
+    @dc.dataclass(frozen=True)
+    class WorkerStats:
+        worker: int
+
+        listening: bool
+
+        # Connections accepted in total, currently open, and which ended in an error.
+        accepted: int
+        active: int
+        errors: int
+
+    _STATS_FIELDS: ta.ClassVar[ta.Sequence[str]] = ('listening', 'accepted', 'active', 'errors')
+
+    def stats(self) -> ta.List[WorkerStats]:
+        if (arr := self._stats) is None:
+            return []
+
+        nf = len(self._STATS_FIELDS)
+        return [
+            ShardedIoPipelineServer.WorkerStats(
+                i,
+                bool(arr[i * nf]),
+                *arr[i * nf + 1:(i + 1) * nf],
+            )
+            for i in range(self._num_workers)
+        ]
+
+    #
+
+    def start(self) -> None:
+        check.state(not self._workers)
+
+        cfg = self._config
+        nf = len(self._STATS_FIELDS)
+
+        if (mp_ctx := self._mp_ctx) is not None:
+            self._shutdown_event = mp_ctx.Event()
+            self._stats = mp_ctx.RawArray('q', self._num_workers * nf)
+        else:
+            self._shutdown_event = threading.Event()
+            self._stats = [0] * (self._num_workers * nf)
+
+        # With reuseport, a bound but not listening socket reserves the port without ever being handed connections.
+        lsock = _bind_server_socket(cfg.host, cfg.port, reuse_port=self._distribution == 'reuseport')
+        try:
+            self._port = lsock.getsockname()[1]
+
+            if self._distribution == 'shared':
+                lsock.listen(cfg.listen_backlog)
+                lsock.setblocking(False)
+
+            for i in range(self._num_workers):
+                wa = _ShardedServerWorkerArgs(
+                    index=i,
+                    spec_builder=self._spec_builder,
+                    config=cfg,
+                    port=self._port,
+                    sock=(
+                        # Each thread gets its own descriptor to close. Processes get their own copies anyway.
+                        (lsock.dup() if mp_ctx is None else lsock) if self._distribution == 'shared'
+                        else None
+                    ),
+                    stats=self._stats,
+                    shutdown_event=self._shutdown_event,
+                )
+
+                w: ta.Any
+                if mp_ctx is not None:
+                    w = mp_ctx.Process(  # type: ignore[attr-defined]
+                        target=_run_sharded_server_worker,
+                        args=(wa,),
+                        daemon=True,
+                    )
+                else:
+                    w = threading.Thread(target=_run_sharded_server_worker, args=(wa,), daemon=True)
+                w.start()
+                self._workers.append(w)
+
+            deadline = time.monotonic() + cfg.start_timeout_s
+            while not all(s.listening for s in self.stats()):
+                if not all(w.is_alive() for w in self._workers):
+                    raise RuntimeError('Sharded server worker failed to start')
+                if time.monotonic() > deadline:
+                    raise RuntimeError('Timed out starting sharded server workers')
+                time.sleep(.01)
+
+        except BaseException:
+            self.shutdown()
+            raise
+
+        finally:
+            # Workers hold their own references to a shared socket - in process mode, their own copies.
+            lsock.close()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stops all workers gracefully. Idempotent."""
+
+        if (ev := self._shutdown_event) is not None:
+            ev.set()
+
+        if not wait:
+            return
+
+        deadline = time.monotonic() + self._config.shutdown_timeout_s + 1.
+        for w in self._workers:
+            w.join(max(deadline - time.monotonic(), 0.))
+
+        for w in self._workers:
+            if w.is_alive() and self._mp_ctx is not None:
+                w.terminate()
+                w.join()
+
+    def serve_forever(self) -> None:
+        if not self._workers:
+            self.start()
+
+        try:
+            for w in self._workers:
+                w.join()
+
+        finally:
+            self.shutdown()
+
+    def __enter__(self: ShardedIoPipelineServerT) -> ShardedIoPipelineServerT:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+
+##
+
+
+def _bind_server_socket(host: str, port: int, *, reuse_port: bool) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ':' in host else socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)  # type: ignore[attr-defined]
+        sock.bind((host, port))
+
+    except BaseException:
+        sock.close()
+        raise
+
+    return sock
+
+
+@dc.dataclass(frozen=True)
+class _ShardedServerWorkerArgs:
+    index: int
+
+    spec_builder: ta.Callable[[], IoPipeline.Spec]
+    config: ShardedIoPipelineServer.Config
+
+    port: int
+    sock: ta.Optional[socket.socket]
+
+    stats: ta.Any
+    shutdown_event: ta.Any
+
+
+def _run_sharded_server_worker(wa: _ShardedServerWorkerArgs) -> None:
+    if wa.config.mode == 'process':
+        # The parent coordinates shutdown.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_ShardedServerWorker(wa).run())
+    finally:
+        loop.close()
+
+
+class _ShardedServerWorker:
+    def __init__(self, wa: _ShardedServerWorkerArgs) -> None:
+        super().__init__()
+
+        self._wa = wa
+
+        self._stats_base = wa.index * len(ShardedIoPipelineServer._STATS_FIELDS)  # noqa
+        self._conn_tasks: ta.Set[asyncio.Task] = set()
+
+    def _set_stat(self, field: str, v: int) -> None:
+        # Each worker writes only its own slots, so no locking is needed.
+        self._wa.stats[self._stats_base + ShardedIoPipelineServer._STATS_FIELDS.index(field)] = v  # noqa
+
+    def _incr_stat(self, field: str, n: int = 1) -> None:
+        self._wa.stats[self._stats_base + ShardedIoPipelineServer._STATS_FIELDS.index(field)] += n  # noqa
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = check.not_none(asyncio.current_task())
+        self._conn_tasks.add(task)
+        self._incr_stat('accepted')
+        self._incr_stat('active')
+
+        try:
+            drv = PollAsyncioStreamIoPipelineDriver(
+                self._wa.spec_builder(),
+                reader,
+                writer,
+                self._wa.config.driver_config,
+            )
+
+            await drv.loop_until_done()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception:  # noqa
+            self._incr_stat('errors')
+            log.exception('Error in sharded server connection')
+
+        finally:
+            self._incr_stat('active', -1)
+            self._conn_tasks.discard(task)
+
+    async def run(self) -> None:
+        wa = self._wa
+        cfg = wa.config
+
+        if (sock := wa.sock) is None:
+            sock = _bind_server_socket(cfg.host, wa.port, reuse_port=True)
+            sock.listen(cfg.listen_backlog)
+            sock.setblocking(False)
+
+        server = await asyncio.start_server(self._handle_client, sock=sock)
+        self._set_stat('listening', 1)
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, wa.shutdown_event.wait)
+
+        finally:
+            self._set_stat('listening', 0)
+            server.close()
+
+            if self._conn_tasks:
+                _, pending = await asyncio.wait(list(self._conn_tasks), timeout=cfg.shutdown_timeout_s)
+                for t in pending:
+                    t.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,66 @@
+# ruff: noqa: UP006 UP007 UP045
+# @om-lite
+import unittest
+
+from .....io.pipelines.core import IoPipeline
+from .....io.pipelines.core import IoPipelineMessages
+from .....io.pipelines.handlers.queues import InboundQueueIoPipelineHandler
+from .....io.pipelines.sched.wheel import HashedTimingWheel
+from .....io.pipelines.sched.wheel import WheelIoPipelineScheduling
+from ...responses import FullIoPipelineHttpResponse
+from ..keepalive import IoPipelineHttpServerKeepAliveHandler
+from ..requests import IoPipelineHttpRequestDecoder
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestKeepAliveIdleTimeout(unittest.TestCase):
+    def test_idle_timeout(self) -> None:
+        c = FakeClock()
+        wheel = HashedTimingWheel(clock=c)
+
+        def run(fn):
+            with channel.enter():
+                fn()
+
+        channel = IoPipeline.new(
+            [
+                IoPipelineHttpRequestDecoder(),
+                IoPipelineHttpServerKeepAliveHandler(idle_timeout_s=5.),
+                ibq := InboundQueueIoPipelineHandler(),
+            ],
+            services=[WheelIoPipelineScheduling(wheel, run)],
+        )
+
+        channel.feed_in(IoPipelineMessages.InitialInput())
+        self.assertEqual(len(wheel), 1)
+
+        # Not idle while a request is in flight.
+        c.now += 4.
+        wheel.advance()
+        channel.feed_in(b'GET / HTTP/1.1\r\nHost: x\r\n\r\n')
+        self.assertEqual(len(wheel), 0)
+        c.now += 10.
+        wheel.advance()
+        self.assertIsNone(channel.output.poll())
+        ibq.drain()
+
+        # Idle again once the response is complete.
+        with channel.enter():
+            channel.handlers()[-1]._context.feed_out(FullIoPipelineHttpResponse.simple(connection='keep-alive'))  # noqa
+        self.assertIsInstance(channel.output.poll(), FullIoPipelineHttpResponse)
+        self.assertEqual(len(wheel), 1)
+
+        c.now += 4.
+        wheel.advance()
+        self.assertIsNone(channel.output.poll())
+
+        c.now += 2.
+        wheel.advance()
+        self.assertIsInstance(channel.output.poll(), IoPipelineMessages.FinalOutput)
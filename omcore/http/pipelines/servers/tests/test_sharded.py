@@ -0,0 +1,73 @@
+# ruff: noqa: UP006 UP007 UP045
+# @om-lite
+import socket
+import typing as ta
+import unittest
+
+from .....io.pipelines.core import IoPipeline
+from .....io.pipelines.core import IoPipelineHandler
+from .....io.pipelines.core import IoPipelineHandlerContext
+from ...requests import IoPipelineHttpRequestHead
+from ...requests import IoPipelineHttpRequestObject
+from ...responses import FullIoPipelineHttpResponse
+from ..requests import IoPipelineHttpRequestDecoder
+from ..responses import IoPipelineHttpResponseEncoder
+from ..sharded import ShardedIoPipelineServer
+
+
+class _PingHandler(IoPipelineHandler):
+    def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
+        if not isinstance(msg, IoPipelineHttpRequestHead):
+            if not isinstance(msg, IoPipelineHttpRequestObject):
+                ctx.feed_in(msg)
+            return
+
+        ctx.feed_out(FullIoPipelineHttpResponse.simple(body=b'pong'))
+        ctx.feed_final_output()
+
+
+def build_ping_spec() -> IoPipeline.Spec:
+    return IoPipeline.Spec([
+        IoPipelineHttpRequestDecoder(),
+        IoPipelineHttpResponseEncoder(),
+        _PingHandler(),
+    ])
+
+
+def _ping(port: int) -> bytes:
+    with socket.create_connection(('127.0.0.1', port), timeout=5.) as s:
+        s.sendall(b'GET /ping HTTP/1.1\r\nHost: x\r\n\r\n')
+        out = b''
+        while b := s.recv(1024):
+            out += b
+    return out
+
+
+class TestShardedServer(unittest.TestCase):
+    def _test_server(self, **kwargs: ta.Any) -> None:
+        srv = ShardedIoPipelineServer(
+            build_ping_spec,
+            ShardedIoPipelineServer.Config(num_workers=2, shutdown_timeout_s=2., **kwargs),
+        )
+
+        with srv:
+            self.assertTrue(all(s.listening for s in srv.stats()))
+
+            for _ in range(20):
+                resp = _ping(srv.port)
+                self.assertTrue(resp.startswith(b'HTTP/1.1 200'))
+                self.assertTrue(resp.endswith(b'pong'))
+
+        st = srv.stats()
+        self.assertEqual(len(st), 2)
+        self.assertEqual(sum(s.accepted for s in st), 20)
+        self.assertFalse(any(s.listening or s.active or s.errors for s in st))
+
+    def test_threads_reuseport(self):
+        self._test_server(mode='thread', distribution='reuseport')
+
+    def test_threads_shared(self):
+        self._test_server(mode='thread', distribution='shared')
+
+    def test_processes(self):
+        self._test_server(mode='process', mp_start_method='spawn')
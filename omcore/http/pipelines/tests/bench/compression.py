@@ -0,0 +1,112 @@
+"""
+Response bodies compressed per second, and input throughput, through `IoPipelineHttpResponseCompressor` for each
+coding and level - whole bodies as full messages, and streamed ones as a head, a few body data messages, and an end -
+plus zstd with and without a trained dictionary, and with codings set up per message versus handed out by a pool.
+"""
+import functools
+import json
+import time
+import typing as ta
+
+from .....io.pipelines.core import IoPipeline
+from .....io.pipelines.handlers.feedback import FeedbackInboundIoPipelineHandler
+from ....headers import HttpHeaders
+from ...compression.codings import IoPiplineHttpCompressorCoding
+from ...compression.codings import IoPiplineHttpCompressorCodingPool
+from ...compression.codings import ZlibIoPiplineHttpCompressorCoding
+from ...compression.codings import ZstdIoPiplineHttpCompressorCoding
+from ...responses import FullIoPipelineHttpResponse
+from ...responses import IoPipelineHttpResponseBodyData
+from ...responses import IoPipelineHttpResponseEnd
+from ...responses import IoPipelineHttpResponseHead
+from ...servers.responses import IoPipelineHttpResponseCompressor
+
+
+def _body(i: int, n: int) -> bytes:
+    return json.dumps([
+        {'id': i * n + j, 'name': f'item {i * n + j}', 'tags': ['alpha', 'beta'], 'score': (i * 31 + j) % 97 / 7}
+        for j in range(n)
+    ]).encode()
+
+
+def _bench(
+        coding: ta.Callable[[], IoPiplineHttpCompressorCoding],
+        bodies: ta.Sequence[bytes],
+        n: int,
+        *,
+        full: bool,
+        num_chunks: int = 4,
+) -> tuple[float, float]:
+    p = IoPipeline.new([
+        IoPipelineHttpResponseCompressor({'gz': coding}),
+        fbi := FeedbackInboundIoPipelineHandler(),
+    ])
+    headers = HttpHeaders({'content-encoding': 'gz', 'content-length': '0'})
+
+    msgs: list[list[ta.Any]] = []
+    for b in bodies:
+        head = IoPipelineHttpResponseHead(status=200, reason='OK', headers=headers)
+        if full:
+            msgs.append([fbi.wrap(FullIoPipelineHttpResponse(head, b))])
+        else:
+            cl = -(-len(b) // num_chunks)
+            msgs.append([
+                fbi.wrap(m)
+                for m in [
+                    head,
+                    *[IoPipelineHttpResponseBodyData(b[i:i + cl]) for i in range(0, len(b), cl)],
+                    IoPipelineHttpResponseEnd(),
+                ]
+            ])
+
+    num_bytes = 0
+    start = time.perf_counter()
+    for _ in range(n):
+        for ms, b in zip(msgs, bodies):
+            for m in ms:
+                p.feed_in(m)
+            p.output.drain()
+            num_bytes += len(b)
+    el = time.perf_counter() - start
+    return n * len(bodies) / el, num_bytes / el / 1e6
+
+
+def _zstd_available() -> bool:
+    try:
+        import compression.zstd  # noqa
+    except ImportError:
+        return False
+    return True
+
+
+def _main() -> None:
+    n = 20
+
+    for size_name, sz in [('2KiB', 20), ('20KiB', 200), ('200KiB', 2_000)]:
+        bodies = [_body(i, sz) for i in range(max(2_000 // sz, 4))]
+
+        codings: list[tuple[str, ta.Callable[[], IoPiplineHttpCompressorCoding]]] = [
+            (f'gzip-{lvl}', functools.partial(ZlibIoPiplineHttpCompressorCoding, level=lvl))
+            for lvl in [1, 6, 9]
+        ]
+
+        if _zstd_available():
+            from compression import zstd  # noqa
+
+            zd = zstd.train_dict([_body(i, 1) for i in range(2_000)], 8 * 1024)
+
+            for lvl in [1, 3, 9]:
+                for dn, d in [('', None), ('+dict', zd)]:
+                    factory = functools.partial(ZstdIoPiplineHttpCompressorCoding, level=lvl, zstd_dict=d)
+                    codings.append((f'zstd-{lvl}{dn}', factory))
+                    codings.append((f'zstd-{lvl}{dn} pooled', IoPiplineHttpCompressorCodingPool(factory)))
+
+        for name, coding in codings:
+            for full in [True, False]:
+                _bench(coding, bodies, max(n // 10, 1), full=full)
+                mps, mbps = _bench(coding, bodies, n, full=full)
+                print(f'{size_name} {"full" if full else "streamed"} {name}: {mps:_.0f} msgs/s, {mbps:_.1f} MB/s')
+
+
+if __name__ == '__main__':
+    _main()
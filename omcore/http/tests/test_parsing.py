@@ -23,6 +23,7 @@ Test suite for http_trailer_parser:
   - Case-insensitive normalization and comma-combining
   - TypeError on non-bytes input
 """
+import dataclasses as dc
 import datetime
 import typing as ta
 import unittest
@@ -2546,5 +2547,69 @@ class TestReviewFixes(unittest.TestCase):
         self.assertEqual(cm.exception.code, hp.HeaderFieldHttpParseErrorCode.NUL_IN_HEADER)
 
 
+LAZY = hp.HttpParser.Config(lazy_headers=True)
+
+
+class TestLazyHeaders(unittest.TestCase):
+    def test_matches_eager(self) -> None:
+        for data, config in [
+            (_req(headers=[
+                ('Host', 'example.com'),
+                ('User-Agent', 'Mozilla/5.0'),
+                ('accept-encoding', 'gzip, br'),
+                ('X-Custom', ' padded\tvalue '),
+                ('X-CUSTOM', 'two'),
+                ('Cookie', 'a=1; b=\xe9'),
+            ]), STRICT),
+            (_resp(headers=[('Set-Cookie', 'a=1'), ('set-cookie', 'b=2'), ('Content-Length', '3')]), STRICT),
+            (
+                b'GET / HTTP/1.1\r\nHost: x\r\nX-Fold: a\r\n  b\r\nX-B: c\r\n\r\n',
+                hp.HttpParser.Config(allow_obs_fold=True),
+            ),
+        ]:
+            eager = hp.parse_http_message(data, config=config)
+            lazy = hp.parse_http_message(data, config=dc.replace(config, lazy_headers=True))
+            self.assertEqual(lazy.headers.keys(), eager.headers.keys())
+            self.assertEqual(lazy.headers.items(), eager.headers.items())
+            self.assertEqual(lazy.headers.entries, eager.headers.entries)
+            self.assertEqual(list(lazy.raw_headers), list(eager.raw_headers))
+            self.assertEqual(lazy.prepared, eager.prepared)
+
+    def test_invalid_value_raises_on_access(self) -> None:
+        data = b'GET / HTTP/1.1\r\nHost: x\r\nFoo: bar\x01baz\r\n\r\n'
+        msg = hp.parse_http_message(data, config=LAZY)
+        self.assertIn('foo', msg.headers)
+        self.assertEqual(msg.headers['host'], 'x')
+
+        with self.assertRaises(hp.HeaderFieldHttpParseError) as cm:
+            msg.headers.get('foo')
+        self.assertEqual(cm.exception.line, 2)
+
+        with self.assertRaises(hp.HeaderFieldHttpParseError):
+            list(msg.raw_headers)
+
+    def test_structure_still_checked(self) -> None:
+        for data in [
+            b'GET / HTTP/1.1\r\nHost: x\r\nFoo : bar\r\n\r\n',
+            b'GET / HTTP/1.1\r\nHost: x\r\nFoo: b\x00r\r\n\r\n',
+            b'GET / HTTP/1.1\r\nHost: x\r\nFoo: b\rr\r\n\r\n',
+            b'GET / HTTP/1.1\r\nHost: x\r\nFoo\r\n\r\n',
+        ]:
+            with self.assertRaises(hp.HeaderFieldHttpParseError):
+                hp.parse_http_message(data, config=LAZY)
+
+    def test_prepared_fields_validated(self) -> None:
+        data = b'GET / HTTP/1.1\r\nHost: x\r\nContent-Length: 1\x7f\r\n\r\n'
+        with self.assertRaises(hp.HeaderFieldHttpParseError):
+            hp.parse_http_message(data, config=LAZY)
+
+    def test_well_known_names(self) -> None:
+        for name in ['content-length', 'Content-Length', 'CONTENT-LENGTH', 'ETag', 'X-Request-ID', 'TE']:
+            data = _resp(headers=[(name, '0')])
+            msg = hp.parse_http_message(data, config=LAZY)
+            self.assertEqual(msg.headers.keys(), [name.lower()])
+            self.assertEqual(msg.raw_headers[0].name, name.encode())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+import errno
+import select
+import typing as ta
+
+from .pollers import FdioPoller
+
+
+##
+
+
+EpollFdioPoller: ta.Optional[ta.Type[FdioPoller]]
+if hasattr(select, 'epoll'):
+
+    class _EpollFdioPoller(FdioPoller):
+        """
+        Registrations persist in the kernel between polls, so a poll costs in proportion to the number of ready fds
+        rather than registered ones.
+
+        With ``edge_triggered`` an fd is only reported when it becomes ready, not for as long as it stays ready - so its
+        handler must read or write until the operation would block, or it will not be reported again.
+        """
+
+        DEFAULT_MAX_EVENTS = 1000
+
+        def __init__(
+                self,
+                *,
+                max_events: int = DEFAULT_MAX_EVENTS,
+                edge_triggered: bool = False,
+        ) -> None:
+            super().__init__()
+
+            self._max_events = max_events
+            self._edge_triggered = edge_triggered
+
+            self._epoll: ta.Optional[ta.Any] = None
+
+            # fd -> event mask currently registered with the epoll
+            self._masks: ta.Dict[int, int] = {}
+
+        #
+
+        def _get_epoll(self) -> 'select.epoll':
+            if (ep := self._epoll) is not None:
+                return ep
+            ep = select.epoll()
+            self._epoll = ep
+            return ep
+
+        def close(self) -> None:
+            if self._epoll is not None:
+                self._epoll.close()
+                self._epoll = None
+            self._masks.clear()
+
+        def reopen(self) -> None:
+            self._masks.clear()
+            for fd in self._readable | self._writable:
+                self._update_registration(fd, r=fd in self._readable, w=fd in self._writable)
+
+        #
+
+        def _register_readable(self, fd: int) -> None:
+            self._update_registration(fd, r=True, w=fd in self._writable)
+
+        def _register_writable(self, fd: int) -> None:
+            self._update_registration(fd, r=fd in self._readable, w=True)
+
+        def _unregister_readable(self, fd: int) -> None:
+            self._update_registration(fd, r=False, w=fd in self._writable)
+
+        def _unregister_writable(self, fd: int) -> None:
+            self._update_registration(fd, r=fd in self._readable, w=False)
+
+        #
+
+        _READ = select.EPOLLIN | select.EPOLLPRI
+        _WRITE = select.EPOLLOUT
+
+        # Always reported, whatever the registered mask, and passed on to whichever of reading or writing is registered
+        # so the handler's next operation surfaces the condition.
+        _ERROR = select.EPOLLERR | select.EPOLLHUP
+
+        def _update_registration(self, fd: int, *, r: bool, w: bool) -> None:
+            mask = (self._READ if r else 0) | (self._WRITE if w else 0)
+            old = self._masks.get(fd)
+            if mask == (old or 0):
+                return
+
+            ep = self._get_epoll()
+            flags = mask | (select.EPOLLET if self._edge_triggered else 0)
+
+            if not mask:
+                del self._masks[fd]
+                try:
+                    ep.unregister(fd)
+
+                except OSError as exc:
+                    # The kernel drops closed fds from the epoll itself, so these are expected when removing one.
+                    if exc.errno not in (errno.EBADF, errno.ENOENT):
+                        raise
+
+                return
+
+            if old is None:
+                try:
+                    ep.register(fd, flags)
+                except FileExistsError:
+                    # A closed fd's number was reused while a duplicate kept the old file registered.
+                    ep.modify(fd, flags)
+
+            else:
+                try:
+                    ep.modify(fd, flags)
+                except FileNotFoundError:
+                    # The fd was closed, dropping its registration, and its number reused.
+                    ep.register(fd, flags)
+
+            self._masks[fd] = mask
+
+        #
+
+        def poll(self, timeout: ta.Optional[float]) -> FdioPoller.PollResult:
+            ep = self._get_epoll()
+            try:
+                evs = ep.poll(timeout if timeout is not None else -1, self._max_events)
+
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    return FdioPoller.PollResult(msg='EINTR encountered in poll', exc=exc)
+                else:
+                    raise
+
+            r: ta.List[int] = []
+            w: ta.List[int] = []
+            for fd, ev in evs:
+                if ev & (self._READ | self._ERROR) and fd in self._readable:
+                    r.append(fd)
+                if ev & (self._WRITE | self._ERROR) and fd in self._writable:
+                    w.append(fd)
+
+            return FdioPoller.PollResult(r, w)
+
+    EpollFdioPoller = _EpollFdioPoller
+else:
+    EpollFdioPoller = None
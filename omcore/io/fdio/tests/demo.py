@@ -8,6 +8,8 @@ from ....http.simple.types import SimpleHttpHandlerResponseStreamedData
 from ....lite.check import check
 from ....sockets.addresses import SocketAddress
 from ...pipelines.drivers.fdio import IoPipelineDriverSocketFdioHandler
+from ...pipelines.sched.wheel import HashedTimingWheel
+from ..epoll import EpollFdioPoller  # noqa
 from ..handlers import ServerSocketFdioHandler
 from ..kqueue import KqueueFdioPoller  # noqa
 from ..manager import FdioManager
@@ -57,6 +59,7 @@ def say_hi_handler(req: SimpleHttpHandlerRequest) -> SimpleHttpHandlerResponse:
 
 def _main() -> None:
     poller: FdioPoller = next(filter(None, [
+        EpollFdioPoller,
         KqueueFdioPoller,
         PollFdioPoller,
         SelectFdioPoller,
@@ -64,6 +67,8 @@ def _main() -> None:
 
     man = FdioManager(poller)
 
+    wheel = HashedTimingWheel()
+
     def on_connect(sock: socket.socket, addr: SocketAddress) -> None:
         try:
             conn = IoPipelineDriverSocketFdioHandler(
@@ -74,6 +79,7 @@ def _main() -> None:
                     addr,
                     say_hi_handler,
                 ),
+                wheel=wheel,
             )
 
             check.none(conn.next())
@@ -94,7 +100,10 @@ def _main() -> None:
     man.register(server)
 
     while True:
-        man.poll()
+        if (dl := wheel.next_delay()) is None or dl > 1.:
+            dl = 1.
+        man.poll(timeout=dl)
+        wheel.advance()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+import socket
+
+import pytest
+
+from ..epoll import EpollFdioPoller
+from ..pollers import FdioPoller
+
+
+@pytest.mark.skipif(EpollFdioPoller is None, reason='requires epoll')
+@pytest.mark.parametrize('edge_triggered', [False, True])
+def test_epoll(edge_triggered):
+    a, b = socket.socketpair()
+    c, d = socket.socketpair()
+    try:
+        p: FdioPoller = EpollFdioPoller(edge_triggered=edge_triggered)  # type: ignore[misc]
+
+        p.update({a.fileno(), c.fileno()}, {b.fileno()})
+        pr = p.poll(0)
+        assert (list(pr.r), list(pr.w)) == ([], [b.fileno()])
+
+        b.send(b'x')
+        pr = p.poll(1)
+        assert (list(pr.r), list(pr.w)) == ([a.fileno()], [] if edge_triggered else [b.fileno()])
+
+        # Level-triggered keeps reporting the unread byte, edge-triggered only reports it once.
+        pr = p.poll(0)
+        assert list(pr.r) == ([] if edge_triggered else [a.fileno()])
+        assert a.recv(1) == b'x'
+
+        p.update({c.fileno()}, set())
+        b.send(b'y')
+        d.close()
+        pr = p.poll(1)
+        assert (list(pr.r), list(pr.w)) == ([c.fileno()], [])
+        assert c.recv(1) == b''
+
+        # Registrations survive closing and reopening the epoll.
+        p.close()
+        p.reopen()
+        pr = p.poll(0)
+        assert (list(pr.r), list(pr.w)) == ([c.fileno()], [])
+
+        # A closed fd is dropped from the epoll by the kernel, which unregistering it tolerates.
+        c.close()
+        p.update(set(), set())
+        assert not p.readable and not p.writable
+        assert not list(p.poll(0).r)
+
+    finally:
+        for s in (a, b, c, d):
+            s.close()
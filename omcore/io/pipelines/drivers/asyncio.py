@@ -2,8 +2,8 @@
 # @om-lite
 import asyncio
 import dataclasses as dc
-import functools
 import typing as ta
+import weakref
 
 from ....lite.abstract import Abstract
 from ....lite.check import check
@@ -12,13 +12,12 @@ from ....logs.utils import async_exception_logging
 from ...streambufs.utils import ByteStreamBuffers
 from ..asyncs import AsyncIoPipelineMessages
 from ..core import IoPipeline
-from ..core import IoPipelineHandlerRef
 from ..core import IoPipelineMessages
-from ..core import IoPipelineService
 from ..core import IoPipelineServices
 from ..flow.types import IoPipelineFlow
 from ..flow.types import IoPipelineFlowMessages
-from ..sched.types import IoPipelineScheduling
+from ..sched.wheel import HashedTimingWheel
+from ..sched.wheel import WheelIoPipelineScheduling
 from .metadata import DriverIoPipelineMetadata
 
 
@@ -28,6 +27,63 @@ log, alog = get_module_loggers(globals())  # noqa
 ##
 
 
+class _AsyncioLoopTimingWheel:
+    """
+    The `HashedTimingWheel` shared by all the drivers running on an event loop, driven by a single loop timer armed for
+    its next tick. Holds no reference to its loop, so as not to keep it alive as a weak key.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._wheel = HashedTimingWheel()
+
+        self._timer: ta.Optional[asyncio.TimerHandle] = None
+        self._timer_deadline = 0.
+
+    @property
+    def wheel(self) -> HashedTimingWheel:
+        return self._wheel
+
+    def rearm(self) -> None:
+        if (dl := self._wheel.next_delay()) is None:
+            return
+
+        deadline = self._wheel.clock() + dl
+        if (t := self._timer) is not None:
+            if self._timer_deadline <= deadline:
+                return
+            t.cancel()
+
+        self._timer = asyncio.get_running_loop().call_later(dl, self._fire)
+        self._timer_deadline = deadline
+
+    def _fire(self) -> None:
+        self._timer = None
+        try:
+            self._wheel.advance()
+        finally:
+            self.rearm()
+
+
+_ASYNCIO_LOOP_TIMING_WHEELS: ta.MutableMapping[asyncio.AbstractEventLoop, _AsyncioLoopTimingWheel] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_asyncio_loop_timing_wheel() -> _AsyncioLoopTimingWheel:
+    loop = asyncio.get_running_loop()
+    try:
+        return _ASYNCIO_LOOP_TIMING_WHEELS[loop]
+    except KeyError:
+        pass
+    ret = _ASYNCIO_LOOP_TIMING_WHEELS[loop] = _AsyncioLoopTimingWheel()
+    return ret
+
+
+##
+
+
 class PollAsyncioStreamIoPipelineDriver:
     """
     An asyncio pipeline driver with a poll-based interface mirroring the sync driver's API. Unlike
@@ -104,7 +160,8 @@ class PollAsyncioStreamIoPipelineDriver:
 
     _has_init = False
 
-    _sched: 'PollAsyncioStreamIoPipelineDriver._SchedulingService'
+    _loop_wheel: _AsyncioLoopTimingWheel
+    _sched: WheelIoPipelineScheduling
 
     _pipeline: IoPipeline
 
@@ -120,7 +177,8 @@ class PollAsyncioStreamIoPipelineDriver:
 
         self._pending_awaits = set()
 
-        self._sched = self._SchedulingService(self)
+        self._loop_wheel = _get_asyncio_loop_timing_wheel()
+        self._sched = WheelIoPipelineScheduling(self._loop_wheel.wheel, self._run_scheduled)
 
         services = IoPipelineServices.of(self._spec.services)
         self._flow = services.find(IoPipelineFlow)
@@ -335,52 +393,17 @@ class PollAsyncioStreamIoPipelineDriver:
     ##
     # scheduling
 
-    class _SchedulingService(IoPipelineScheduling, IoPipelineService):
-        def __init__(self, d: 'PollAsyncioStreamIoPipelineDriver') -> None:
-            super().__init__()
-
-            self._d = d
-
-            self._pending: ta.List[ta.Tuple[float, ta.Callable[[], None]]] = []
-            self._tasks: ta.Set[asyncio.Task] = set()
-
-        class _Handle(IoPipelineScheduling.Handle):
-            def cancel(self) -> None:
-                raise NotImplementedError
-
-        def schedule(
-                self,
-                handler_ref: IoPipelineHandlerRef,
-                delay_s: float,
-                fn: ta.Callable[[], None],
-        ) -> IoPipelineScheduling.Handle:
-            self._pending.append((delay_s, fn))
-            return self._Handle()
-
-        def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
-            raise NotImplementedError
-
-        async def _task_body(self, delay: float, fn: ta.Callable[[], None]) -> None:
-            await asyncio.sleep(delay)
-
-            self._d._command_queue.put_nowait(PollAsyncioStreamIoPipelineDriver._ScheduledCommand(fn))  # noqa
-
-        async def _flush_pending(self) -> None:
-            if not (lst := self._pending):
-                return
-
-            for delay, fn in lst:
-                task = asyncio.create_task(functools.partial(self._task_body, delay, fn)())
-                self._tasks.add(task)
-                task.add_done_callback(self._tasks.discard)
-
-            self._pending = []
+    def _run_scheduled(self, fn: ta.Callable[[], None]) -> None:
+        self._command_queue.put_nowait(PollAsyncioStreamIoPipelineDriver._ScheduledCommand(fn))
 
     @dc.dataclass(frozen=True)
     class _ScheduledCommand(_Command):
         fn: ta.Callable[[], None]
 
     async def _handle_command_scheduled(self, cmd: _ScheduledCommand) -> None:
+        if not self._pipeline.is_ready:
+            return
+
         with self._pipeline.enter():
             cmd.fn()
 
@@ -507,9 +530,11 @@ class PollAsyncioStreamIoPipelineDriver:
         return None
 
     async def _handle_output_bytes(self, msg: ta.Any) -> None:
-        for mv in ByteStreamBuffers.iter_segments(msg):
-            if self._writer is not None and mv:
-                self._writer.write(mv)
+        if self._writer is None:
+            return
+        # Handed over together so the transport can gather them into a single send where it supports it.
+        if mvs := [mv for mv in ByteStreamBuffers.iter_segments(msg) if mv]:
+            self._writer.writelines(mvs)
 
     async def _handle_output_flush_output(self, msg: IoPipelineFlowMessages.FlushOutput) -> ta.Optional[str]:
         if self._writer is not None:
@@ -558,7 +583,7 @@ class PollAsyncioStreamIoPipelineDriver:
         if self._read_task is not None and not self._read_task.done():
             return True
 
-        if hasattr(self, '_sched') and self._sched._tasks:  # noqa
+        if hasattr(self, '_sched') and len(self._sched):
             return True
 
         return False
@@ -600,6 +625,8 @@ class PollAsyncioStreamIoPipelineDriver:
                 if raise_on_stall and not self._has_pending_work():
                     raise RuntimeError('Pipeline stalled') from None
 
+                self._loop_wheel.rearm()
+
                 cmd = await self._command_queue.get()
 
             if isinstance(cmd, PollAsyncioStreamIoPipelineDriver._ShutdownCommand):
@@ -607,8 +634,6 @@ class PollAsyncioStreamIoPipelineDriver:
 
             await self._handle_command(cmd)
 
-            await self._sched._flush_pending()  # noqa
-
         pipeline.destroy()
         return None
 
@@ -640,11 +665,7 @@ class PollAsyncioStreamIoPipelineDriver:
         await self._close_writer()
 
         if hasattr(self, '_sched'):
-            for t in list(self._sched._tasks):  # noqa
-                if not t.done():
-                    t.cancel()
-            if self._sched._tasks:  # noqa
-                await asyncio.gather(*self._sched._tasks, return_exceptions=True)  # noqa
+            self._sched.cancel_all()
 
         if self._has_init:
             try:
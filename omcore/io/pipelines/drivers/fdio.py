@@ -2,7 +2,6 @@
 # @om-lite
 """
 TODO:
- - can implement sched w/ settimeout
  - sanity / upper bound read/write timeouts
  - sendall? blocks prob
  - self._sock.shutdown(socket.SHUT_WR) ?
@@ -17,13 +16,17 @@ from ....lite.check import check
 from ....logs.modules import get_module_logger
 from ....sockets.addresses import SocketAddress
 from ...fdio.handlers import SocketFdioHandler
-from ...streambufs.types import BytesLike
 from ...streambufs.utils import ByteStreamBuffers
 from ..core import IoPipeline
 from ..core import IoPipelineMessages
 from ..flow.types import IoPipelineFlow
 from ..flow.types import IoPipelineFlowMessages
+from ..flow.watermarks import IoPipelineWatermarks
+from ..sched.wheel import HashedTimingWheel
+from ..sched.wheel import WheelIoPipelineScheduling
 from .metadata import DriverIoPipelineMetadata
+from .sockets import SocketRecvBuffer
+from .sockets import SocketSendQueue
 
 
 log = get_module_logger(globals())  # noqa
@@ -33,6 +36,12 @@ log = get_module_logger(globals())  # noqa
 
 
 class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
+    """
+    Given a `wheel`, which should be shared by all the handlers registered with a manager, provides its pipeline with
+    `IoPipelineScheduling`. Whatever polls the manager then also drives the wheel, bounding its poll timeout by
+    `wheel.next_delay()` and calling `wheel.advance()` after each poll.
+    """
+
     @dc.dataclass(frozen=True)
     class Config:
         DEFAULT: ta.ClassVar['IoPipelineDriverSocketFdioHandler.Config']
@@ -52,6 +61,8 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
             addr: SocketAddress,
             spec: IoPipeline.Spec,
             config: ta.Optional[Config] = None,
+            *,
+            wheel: ta.Optional[HashedTimingWheel] = None,
     ) -> None:
         super().__init__(sock, addr)
 
@@ -59,11 +70,13 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
         if config is None:
             config = self.Config.DEFAULT
         self._config = config
+        self._wheel = wheel
 
         self._input_q: collections.deque[ta.Any] = collections.deque()
         self._input_q.append(IoPipelineMessages.InitialInput())
 
-        self._write_q: collections.deque[BytesLike] = collections.deque()
+        self._recv_buf = SocketRecvBuffer(config.read_chunk_size)
+        self._send_q = SocketSendQueue()
 
     def __repr__(self) -> str:
         return f'{type(self).__name__}@{id(self):x}<{self._state.name}>'
@@ -108,6 +121,8 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
 
     _flow: ta.Optional[IoPipelineFlow]
 
+    _watermarks: ta.Optional[IoPipelineWatermarks]
+
     def _opt_pipeline(self) -> ta.Optional[IoPipeline]:
         try:
             return self._pipeline
@@ -129,6 +144,8 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
             if flow is None:
                 self._want_read = True
 
+            self._watermarks = pipeline.services.find(IoPipelineWatermarks)
+
             check.state(pipeline.is_ready)
 
             self._state = self.state.RUNNING
@@ -147,8 +164,22 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
                 *self._spec.metadata,
                 DriverIoPipelineMetadata(self),
             ],
+
+            services=[
+                *self._spec.services,
+                *([WheelIoPipelineScheduling(self._wheel, self._run_scheduled)] if self._wheel is not None else []),
+            ],
         ))
 
+    def _run_scheduled(self, fn: ta.Callable[[], None]) -> None:
+        if self._state is not self.State.RUNNING:
+            return
+
+        with self._pipeline.enter():
+            fn()
+
+        check.none(self.next(read=False, raise_on_stall=False))
+
     #
 
     def close(self) -> None:
@@ -183,11 +214,11 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
         out: ta.List[ta.Any] = []
 
         try:
-            b = check.not_none(self._sock).recv(self._config.read_chunk_size)
+            b = self._recv_buf.recv(check.not_none(self._sock))
         except BlockingIOError:
             return out
         except ConnectionResetError:
-            b = b''
+            b = memoryview(b'')
 
         if not b:
             out.append(IoPipelineMessages.FinalInput())
@@ -203,48 +234,45 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
 
     #
 
-    def _try_flush_write_q(self) -> None:
-        while self._write_q:
-            b = self._write_q.popleft()
-            p = 0
-            while True:
-                pb = b[p:] if p else b
-                try:
-                    sr = check.not_none(self._sock).send(pb)
-                except ConnectionResetError:
-                    self.close()
-                    return
-                except BlockingIOError:
-                    self._write_q.appendleft(pb)
-                    return
-                p += sr
-                if p >= len(b):
-                    break
+    def _flush_send_q(self) -> None:
+        # Output is queued as the pipeline emits it and sent here, once it has been drained, in as few calls as the
+        # socket allows.
+        try:
+            self._send_q.flush(check.not_none(self._sock))
+        except BlockingIOError:
+            pass
 
-    def _do_write_or_q(self, bls: ta.Iterable[BytesLike]) -> None:
-        queuing = False
-        for bl in bls:
-            if queuing:
-                self._write_q.append(bl)
-                continue
-            p = 0
-            while True:
-                pbl = bl[p:] if p else bl
-                try:
-                    sr = check.not_none(self._sock).send(pbl)
-                except BlockingIOError:
-                    queuing = True
-                    self._write_q.append(pbl)
-                    break
-                p += sr
-                if p >= len(bl):
-                    break
+        self._update_outbound_watermark()
+
+    #
+
+    def _update_outbound_watermark(self) -> None:
+        if (wm := self._watermarks) is None:
+            return
+
+        if (
+                wm.outbound.update(len(self._send_q)) and
+                self._flow is not None and
+                self._state is self.State.RUNNING
+        ):
+            self._input_q.append(
+                IoPipelineFlowMessages.PauseOutput() if wm.outbound.paused
+                else IoPipelineFlowMessages.ReadyForOutput(),
+            )
+
+    def _is_inbound_paused(self) -> bool:
+        if (wm := self._watermarks) is None or wm.inbound.high is None:
+            return False
+
+        wm.inbound.update(wm.inbound_buffered_bytes(self._pipeline))
+        return wm.inbound.paused
 
     #
 
     def _handle_output(self, msg: ta.Any) -> ta.Literal['handled', 'unhandled', 'stop']:
         if ByteStreamBuffers.can_bytes(msg):
-            self._do_write_or_q(ByteStreamBuffers.iter_segments(msg))
+            for mv in ByteStreamBuffers.iter_segments(msg):
+                self._send_q.append(mv)
             return 'handled'
 
         elif isinstance(msg, IoPipelineFlowMessages.FlushOutput):
@@ -290,14 +318,21 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
                     continue
 
                 elif handled == 'unhandled':
+                    if self._send_q:
+                        self._flush_send_q()
                     return ('unhandled', out_msg)
 
                 elif handled == 'stop':
+                    if self._send_q:
+                        self._flush_send_q()
                     return 'stop'
 
                 else:
                     raise RuntimeError(f'Unknown handled value: {handled!r}')
 
+            if self._send_q:
+                self._flush_send_q()
+
             if self._input_q:
                 pipeline.feed_in(self._input_q.popleft())
                 continue
@@ -328,7 +363,7 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
                     raise RuntimeError(f'Unknown output: {ok!r}')
 
             elif out == 'read':
-                if read:
+                if read and not self._is_inbound_paused():
                     if not (in_ := self._do_read()):
                         return None
 
@@ -338,7 +373,7 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
                     return None
 
             elif out == 'stop':
-                if self._write_q:
+                if self._send_q:
                     self._state = self.State.DRAINING
                 else:
                     self.close()
@@ -372,10 +407,14 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
     ##
 
     def readable(self) -> bool:
-        return self._state is self.State.RUNNING and self._want_read
+        return (
+            self._state is self.State.RUNNING and
+            self._want_read and
+            not self._is_inbound_paused()
+        )
 
     def writable(self) -> bool:
-        return self.is_active and bool(self._write_q)
+        return self.is_active and bool(self._send_q)
 
     #
 
@@ -383,9 +422,17 @@ class IoPipelineDriverSocketFdioHandler(SocketFdioHandler):
         check.none(self.next())
 
     def on_writable(self) -> None:
-        check.not_empty(self._write_q)
+        check.state(bool(self._send_q))
 
-        self._try_flush_write_q()
+        try:
+            self._flush_send_q()
+        except ConnectionResetError:
+            self.close()
+            return
 
-        if self._state is self.State.DRAINING and not self._write_q:
+        if self._state is self.State.DRAINING and not self._send_q:
             self.close()
+
+        elif self._input_q:
+            # Deliver any writability change.
+            check.none(self.next(read=False, raise_on_stall=False))
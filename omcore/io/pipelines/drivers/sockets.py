@@ -0,0 +1,132 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+# @om-lite
+import collections
+import itertools
+import os
+import typing as ta
+
+from ...streambufs.segmented import SegmentedByteStreamBuffer
+from ...streambufs.types import BytesLike
+
+
+##
+
+
+def _get_iov_max() -> int:
+    try:
+        if (n := os.sysconf('SC_IOV_MAX')) > 0:
+            return n
+    except (AttributeError, ValueError, OSError):
+        pass
+    return 1024
+
+
+IOV_MAX = _get_iov_max()
+
+
+##
+
+
+class SocketRecvBuffer:
+    """
+    Receives with `recv_into` straight into memory reserved from a `SegmentedByteStreamBuffer`, rather than allocating a
+    fresh bytes object per read. Received data is returned as a memoryview over the chunk it was read into - the chunk
+    is only ever appended to, never overwritten, so these views remain valid for as long as they are held, at the cost
+    of pinning the chunk.
+    """
+
+    def __init__(
+            self,
+            read_chunk_size: int,
+            *,
+            chunk_size: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        self._read_chunk_size = read_chunk_size
+        if chunk_size is None:
+            chunk_size = read_chunk_size * 4
+        self._buf = SegmentedByteStreamBuffer(chunk_size=chunk_size)
+
+    def recv(self, sock: ta.Any) -> memoryview:
+        """Returns an empty view on EOF. Raises whatever the socket raises, including BlockingIOError."""
+
+        if (recv_into := getattr(sock, 'recv_into', None)) is None:
+            return memoryview(sock.recv(self._read_chunk_size))
+
+        buf = self._buf
+        mv = buf.reserve(self._read_chunk_size)
+        try:
+            n = recv_into(mv)
+        except BaseException:
+            buf.commit(0)
+            raise
+
+        buf.commit(n)
+        buf.advance(n)
+        return mv[:n]
+
+
+##
+
+
+class SocketSendQueue:
+    """
+    Queues outbound data and sends as much of it as the socket will take in a single `sendmsg` call per attempt, rather
+    than one `send` per buffer. Sockets without a working `sendmsg` - notably ssl sockets - fall back to `send`.
+
+    Its length is the number of bytes pending.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_iov: int = IOV_MAX,
+    ) -> None:
+        super().__init__()
+
+        self._max_iov = max_iov
+
+        self._q: collections.deque[memoryview] = collections.deque()
+        self._len = 0
+
+        self._no_sendmsg = False
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, data: BytesLike) -> None:
+        if not data:
+            return
+        mv = data if isinstance(data, memoryview) else memoryview(data)
+        self._q.append(mv)
+        self._len += mv.nbytes
+
+    def _send(self, sock: ta.Any) -> int:
+        q = self._q
+        if len(q) > 1 and not self._no_sendmsg:
+            try:
+                return sock.sendmsg(list(itertools.islice(q, self._max_iov)))
+            except (AttributeError, NotImplementedError):
+                self._no_sendmsg = True
+        return sock.send(q[0])
+
+    def flush(self, sock: ta.Any) -> None:
+        """
+        Sends until the queue is empty. On a non-blocking socket this raises BlockingIOError once the socket stops
+        taking data, leaving the remainder queued.
+        """
+
+        q = self._q
+        while q:
+            n = self._send(sock)
+            self._len -= n
+
+            while n:
+                h = q[0]
+                if n >= (hl := h.nbytes):
+                    q.popleft()
+                    n -= hl
+                else:
+                    q[0] = h[n:]
+                    n = 0
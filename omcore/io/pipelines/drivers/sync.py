@@ -1,13 +1,12 @@
-# ruff: noqa: UP006 UP007 UP037 UP045
+# ruff: noqa: UP006 UP007 UP037 UP041 UP045
 # @om-lite
 """
 TODO:
- - can implement sched w/ settimeout
  - sanity / upper bound read/write timeouts
 """
 import collections
 import dataclasses as dc
-import heapq
+import socket
 import time
 import typing as ta
 
@@ -15,13 +14,14 @@ from ....lite.check import check
 from ....logs.modules import get_module_logger
 from ...streambufs.utils import ByteStreamBuffers
 from ..core import IoPipeline
-from ..core import IoPipelineHandlerRef
 from ..core import IoPipelineMessages
-from ..core import IoPipelineService
 from ..flow.types import IoPipelineFlow
 from ..flow.types import IoPipelineFlowMessages
-from ..sched.types import IoPipelineScheduling
+from ..sched.wheel import HashedTimingWheel
+from ..sched.wheel import WheelIoPipelineScheduling
 from .metadata import DriverIoPipelineMetadata
+from .sockets import SocketRecvBuffer
+from .sockets import SocketSendQueue
 
 
 log = get_module_logger(globals())  # noqa
@@ -49,6 +49,8 @@ class SyncSocketIoPipelineDriver:
             spec: IoPipeline.Spec,
             sock: ta.Any,
             config: ta.Optional[Config] = None,
+            *,
+            wheel: ta.Optional[HashedTimingWheel] = None,
     ) -> None:
         super().__init__()
 
@@ -57,10 +59,16 @@ class SyncSocketIoPipelineDriver:
         if config is None:
             config = self.Config.DEFAULT
         self._config = config
+        if wheel is None:
+            wheel = HashedTimingWheel(tick_s=.01, num_buckets=64)
+        self._wheel = wheel
 
         self._input_q: collections.deque[ta.Any] = collections.deque()
         self._input_q.append(IoPipelineMessages.InitialInput())
 
+        self._recv_buf = SocketRecvBuffer(config.read_chunk_size)
+        self._send_q = SocketSendQueue()
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}@{id(self):x}'
 
@@ -90,7 +98,7 @@ class SyncSocketIoPipelineDriver:
         except AttributeError:
             pass
 
-        self._sched = self._SchedulingService(self)
+        self._sched = WheelIoPipelineScheduling(self._wheel, self._run_scheduled)
 
         self._pipeline = pipeline = self._make_pipeline()
 
@@ -140,12 +148,25 @@ class SyncSocketIoPipelineDriver:
     def _do_read(self) -> ta.List[ta.Any]:
         out: ta.List[ta.Any] = []
 
-        # if (dl := self._sched.next_delay()) is not None:
-        #     self._sock.settimeout(dl)
-        # else:
-        #     self._sock.settimeout(None)
+        if self._wheel.advance():
+            return out
+
+        if (dl := self._wheel.next_delay()) is not None:
+            # Bound the read by the next timer, without extending any timeout the socket already has.
+            prev = self._sock.gettimeout()
+            self._sock.settimeout(dl if prev is None else min(dl, prev))
+            try:
+                b = self._recv_buf.recv(self._sock)
+            except socket.timeout:
+                if prev is not None and dl >= prev:
+                    raise
+                self._wheel.advance()
+                return out
+            finally:
+                self._sock.settimeout(prev)
 
-        b = self._sock.recv(self._config.read_chunk_size)
+        else:
+            b = self._recv_buf.recv(self._sock)
 
         if not b:
             out.append(IoPipelineMessages.FinalInput())
@@ -161,72 +182,26 @@ class SyncSocketIoPipelineDriver:
 
     #
 
-    class _SchedulingService(IoPipelineScheduling, IoPipelineService):
-        def __init__(self, d: 'SyncSocketIoPipelineDriver') -> None:
-            super().__init__()
-
-            self._d = d
-
-            self._seq = 0
-            self._pending: ta.List[ta.Tuple[float, int, SyncSocketIoPipelineDriver._SchedulingService._Handle]] = []
+    _sched: WheelIoPipelineScheduling
 
-        def _clear_cancelled(self) -> None:
-            while self._pending and self._pending[0][2]._cancelled:  # noqa
-                heapq.heappop(self._pending)
-
-        def next_delay(self) -> ta.Optional[float]:
-            self._clear_cancelled()
-            if not self._pending:
-                return None
-            return time.time() - self._pending[0][0]
-
-        @ta.final
-        class _Handle(IoPipelineScheduling.Handle):
-            def __init__(
-                    self,
-                    handler_ref: IoPipelineHandlerRef,
-                    fn: ta.Callable[[], None],
-                    deadline: float,
-                    seq: int,
-            ) -> None:
-                self._deadline = deadline
-                self._seq = seq
-                self._handler_ref = handler_ref
-                self._fn = fn
-
-                self._cancelled = False
-
-            def cancel(self) -> None:
-                self._cancelled = True
-
-        def schedule(
-                self,
-                handler_ref: IoPipelineHandlerRef,
-                delay_s: float,
-                fn: ta.Callable[[], None],
-        ) -> IoPipelineScheduling.Handle:
-            h = self._Handle(
-                handler_ref,
-                fn,
-                time.time() + delay_s,
-                self._seq,
-            )
-            self._seq += 1
-            heapq.heappush(self._pending, (h._deadline, h._seq, h))  # noqa
-            return h
-
-        def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
-            raise NotImplementedError
-
-    _sched: _SchedulingService
+    def _run_scheduled(self, fn: ta.Callable[[], None]) -> None:
+        # Whatever fn produces is left in the pipeline's output, which the loop goes on to drain.
+        with self._pipeline.enter():
+            fn()
 
     #
 
+    def _flush_send_q(self) -> None:
+        # Output is queued as the pipeline emits it and sent here, once it has been drained, gathering what has
+        # accumulated into as few calls as possible.
+        if self._send_q:
+            # self._sock.settimeout(None)
+            self._send_q.flush(self._sock)
+
     def _handle_output(self, msg: ta.Any) -> ta.Literal['handled', 'unhandled', 'stop']:
         if ByteStreamBuffers.can_bytes(msg):
             for mv in ByteStreamBuffers.iter_segments(msg):
-                # self._sock.settimeout(None)
-                self._sock.sendall(mv)
+                self._send_q.append(mv)
             return 'handled'
 
         elif isinstance(msg, IoPipelineFlowMessages.FlushOutput):
@@ -271,14 +246,18 @@ class SyncSocketIoPipelineDriver:
                     continue
 
                 elif handled == 'unhandled':
+                    self._flush_send_q()
                     return ('unhandled', out_msg)
 
                 elif handled == 'stop':
+                    self._flush_send_q()
                     return 'stop'
 
                 else:
                     raise RuntimeError(f'Unknown handled value: {handled!r}')
 
+            self._flush_send_q()
+
             if self._input_q:
                 pipeline.feed_in(self._input_q.popleft())
                 continue
@@ -321,7 +300,12 @@ class SyncSocketIoPipelineDriver:
                 return None
 
             elif out is None:
-                if raise_on_stall:
+                if read and len(self._sched) and (dl := self._wheel.next_delay()) is not None:
+                    # Nothing to do but wait for a timer.
+                    time.sleep(dl)
+                    self._wheel.advance()
+
+                elif raise_on_stall:
                     raise RuntimeError('Pipeline stalled')
 
                 else:
@@ -0,0 +1,138 @@
+# ruff: noqa: UP006
+# @om-lite
+import socket
+import time
+import typing as ta
+import unittest
+
+from ...bytes.queues import InboundBytesBufferingQueueIoPipelineHandler
+from ...core import IoPipeline
+from ...core import IoPipelineHandler
+from ...core import IoPipelineHandlerContext
+from ...core import IoPipelineMessages
+from ...flow.stub import StubIoPipelineFlowService
+from ...flow.types import IoPipelineFlowMessages
+from ...flow.watermarks import IoPipelineWatermarks
+from ...handlers.idle import ReadTimeoutIoPipelineHandler
+from ...sched.wheel import HashedTimingWheel
+from ..fdio import IoPipelineDriverSocketFdioHandler
+
+
+class _WritingHandler(IoPipelineHandler):
+    def __init__(self, n: int) -> None:
+        super().__init__()
+
+        self._n = n
+        self.writability: ta.List[ta.Any] = []
+
+    def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
+        if isinstance(msg, IoPipelineMessages.InitialInput):
+            ctx.feed_out(b'x' * self._n)
+
+        elif isinstance(msg, (IoPipelineFlowMessages.PauseOutput, IoPipelineFlowMessages.ReadyForOutput)):
+            self.writability.append(msg)
+
+        ctx.feed_in(msg)
+
+
+class TestFdioWatermarks(unittest.TestCase):
+    def test_outbound(self):
+        a, b = socket.socketpair()
+        try:
+            a.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 16 * 1024)
+            a.setblocking(False)
+            b.setblocking(False)
+
+            wh = _WritingHandler(1024 * 1024)
+            wm = IoPipelineWatermarks()
+            h = IoPipelineDriverSocketFdioHandler(
+                a,
+                None,  # type: ignore[arg-type]
+                IoPipeline.Spec([wh], services=[StubIoPipelineFlowService(), wm]),
+            )
+
+            self.assertIsNone(h.next(read=False, raise_on_stall=False))
+            self.assertEqual([type(m) for m in wh.writability], [IoPipelineFlowMessages.PauseOutput])
+            self.assertTrue(wm.outbound.paused)
+
+            got = 0
+            while h.writable():
+                try:
+                    while d := b.recv(256 * 1024):
+                        got += len(d)
+                except BlockingIOError:
+                    pass
+                h.on_writable()
+
+            self.assertEqual(
+                [type(m) for m in wh.writability],
+                [IoPipelineFlowMessages.PauseOutput, IoPipelineFlowMessages.ReadyForOutput],
+            )
+            self.assertFalse(wm.outbound.paused)
+            self.assertEqual(wm.outbound.bytes, 0)
+            self.assertGreater(wm.outbound.peak_bytes, wm.config.outbound_high)
+            self.assertEqual(wm.outbound.num_pauses, 1)
+
+        finally:
+            a.close()
+            b.close()
+
+    def test_inbound(self):
+        a, b = socket.socketpair()
+        try:
+            a.setblocking(False)
+
+            qh = InboundBytesBufferingQueueIoPipelineHandler(filter=True)
+            wm = IoPipelineWatermarks(IoPipelineWatermarks.Config(outbound_high=None, inbound_high=10))
+            h = IoPipelineDriverSocketFdioHandler(
+                a,
+                None,  # type: ignore[arg-type]
+                IoPipeline.Spec([qh], services=[wm]),
+            )
+
+            self.assertIsNone(h.next(read=False, raise_on_stall=False))
+            self.assertTrue(h.readable())
+
+            b.send(b'x' * 20)
+            h.on_readable()
+            self.assertEqual(qh.inbound_buffered_bytes(), 20)
+            self.assertFalse(h.readable())
+            self.assertTrue(wm.inbound.paused)
+
+            qh.drain()
+            self.assertTrue(h.readable())
+            self.assertFalse(wm.inbound.paused)
+
+        finally:
+            a.close()
+            b.close()
+
+
+class TestFdioScheduling(unittest.TestCase):
+    def test_read_timeout(self):
+        a, b = socket.socketpair()
+        try:
+            a.setblocking(False)
+
+            wheel = HashedTimingWheel(tick_s=.01)
+            h = IoPipelineDriverSocketFdioHandler(
+                a,
+                None,  # type: ignore[arg-type]
+                IoPipeline.Spec([ReadTimeoutIoPipelineHandler(.05)]),
+                wheel=wheel,
+            )
+
+            self.assertIsNone(h.next(read=False, raise_on_stall=False))
+            self.assertTrue(h.is_active)
+            self.assertEqual(len(wheel), 1)
+
+            while (dl := wheel.next_delay()) is not None:
+                time.sleep(dl)
+                wheel.advance()
+
+            self.assertFalse(h.is_active)
+            self.assertEqual(b.recv(1), b'')
+
+        finally:
+            a.close()
+            b.close()
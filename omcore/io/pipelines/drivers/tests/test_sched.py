@@ -0,0 +1,71 @@
+# @om-lite
+import asyncio
+import socket
+import typing as ta
+import unittest
+
+from ...core import IoPipeline
+from ...core import IoPipelineHandler
+from ...core import IoPipelineHandlerContext
+from ...core import IoPipelineMessages
+from ...sched.types import IoPipelineScheduling
+from ..asyncio import PollAsyncioStreamIoPipelineDriver
+from ..sync import SyncSocketIoPipelineDriver
+
+
+class _DelayedWriteHandler(IoPipelineHandler):
+    def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
+        if isinstance(msg, IoPipelineMessages.InitialInput):
+            sched = ctx.services[IoPipelineScheduling]
+
+            def write(n: int) -> None:
+                ctx.feed_out(f'{n}\n'.encode())
+                if n < 2:
+                    sched.schedule(ctx.ref, .02, lambda: write(n + 1))
+                else:
+                    ctx.feed_final_output()
+
+            sched.schedule(ctx.ref, .02, lambda: write(0))
+
+            # Never fires, but must not keep anything alive.
+            sched.schedule(ctx.ref, 60., lambda: None)
+
+        ctx.feed_in(msg)
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    out = b''
+    while b := sock.recv(1024):
+        out += b
+    return out
+
+
+class TestScheduling(unittest.TestCase):
+    def test_sync(self):
+        a, b = socket.socketpair()
+        try:
+            drv = SyncSocketIoPipelineDriver(IoPipeline.Spec([_DelayedWriteHandler()]), a)
+            drv.loop_until_done()
+            a.close()
+            self.assertEqual(_recv_all(b), b'0\n1\n2\n')
+            self.assertEqual(len(drv._wheel), 0)  # noqa
+
+        finally:
+            a.close()
+            b.close()
+
+    def test_asyncio(self):
+        a, b = socket.socketpair()
+        try:
+            async def inner():
+                reader, writer = await asyncio.open_connection(sock=a)
+                drv = PollAsyncioStreamIoPipelineDriver(IoPipeline.Spec([_DelayedWriteHandler()]), reader, writer)
+                await drv.loop_until_done()
+                self.assertEqual(len(drv._sched), 0)  # noqa
+
+            asyncio.run(inner())
+            self.assertEqual(_recv_all(b), b'0\n1\n2\n')
+
+        finally:
+            a.close()
+            b.close()
@@ -0,0 +1,96 @@
+# @om-lite
+import socket
+import unittest
+
+from ..sockets import SocketRecvBuffer
+from ..sockets import SocketSendQueue
+
+
+class _NoSendmsgSocket:
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+
+    def sendmsg(self, buffers):
+        raise NotImplementedError
+
+    def send(self, data):
+        return self._sock.send(data)
+
+
+class TestSockets(unittest.TestCase):
+    def test_recv(self) -> None:
+        a, b = socket.socketpair()
+        try:
+            rb = SocketRecvBuffer(4, chunk_size=8)
+
+            b.send(b'abcdef')
+            v0 = rb.recv(a)
+            v1 = rb.recv(a)
+            self.assertEqual([bytes(v0), bytes(v1)], [b'abcd', b'ef'])
+
+            # Later reads go to fresh memory, leaving earlier views intact.
+            b.send(b'ghij')
+            v2 = rb.recv(a)
+            self.assertEqual([bytes(v0), bytes(v1), bytes(v2)], [b'abcd', b'ef', b'ghij'])
+
+            b.close()
+            self.assertEqual(len(rb.recv(a)), 0)
+
+        finally:
+            a.close()
+            b.close()
+
+    def test_send(self) -> None:
+        a, b = socket.socketpair()
+        try:
+            a.setblocking(False)
+
+            sq = SocketSendQueue(max_iov=2)
+            for d in [b'ab', memoryview(b'cde'), bytearray(b'f'), b'']:
+                sq.append(d)
+            self.assertEqual(len(sq), 6)
+            sq.flush(a)
+            self.assertEqual(len(sq), 0)
+            self.assertEqual(b.recv(16), b'abcdef')
+
+            # Fill the socket until it stops taking data, leaving the remainder queued.
+            big = b'x' * (1024 * 1024)
+            sq.append(big)
+            sq.append(b'y')
+            with self.assertRaises(BlockingIOError):
+                sq.flush(a)
+            self.assertTrue(0 < len(sq) <= len(big) + 1)
+
+            got = 0
+            b.setblocking(False)
+            while sq:
+                try:
+                    got += len(b.recv(1024 * 1024))
+                except BlockingIOError:
+                    pass
+                try:
+                    sq.flush(a)
+                except BlockingIOError:
+                    pass
+            a.close()
+            b.setblocking(True)
+            while d := b.recv(1024 * 1024):
+                got += len(d)
+            self.assertEqual(got, len(big) + 1)
+
+        finally:
+            a.close()
+            b.close()
+
+    def test_send_without_sendmsg(self) -> None:
+        a, b = socket.socketpair()
+        try:
+            sq = SocketSendQueue()
+            sq.append(b'ab')
+            sq.append(b'cd')
+            sq.flush(_NoSendmsgSocket(a))
+            self.assertEqual(b.recv(16), b'abcd')
+
+        finally:
+            a.close()
+            b.close()
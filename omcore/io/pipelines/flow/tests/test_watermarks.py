@@ -0,0 +1,46 @@
+# @om-lite
+import unittest
+
+from ...bytes.queues import InboundBytesBufferingQueueIoPipelineHandler
+from ...core import IoPipeline
+from ..watermarks import IoPipelineWatermarks
+
+
+class TestWatermarks(unittest.TestCase):
+    def test_level(self):
+        lv = IoPipelineWatermarks.Level(100, None)
+        self.assertEqual(lv.low, 25)
+
+        self.assertFalse(lv.update(100))
+        self.assertFalse(lv.paused)
+        self.assertTrue(lv.update(101))
+        self.assertTrue(lv.paused)
+        self.assertFalse(lv.update(200))
+        self.assertFalse(lv.update(26))
+        self.assertTrue(lv.paused)
+        self.assertTrue(lv.update(25))
+        self.assertFalse(lv.paused)
+
+        self.assertEqual((lv.bytes, lv.peak_bytes, lv.num_pauses), (25, 200, 1))
+
+    def test_disabled_level(self):
+        lv = IoPipelineWatermarks.Level(None, None)
+        self.assertFalse(lv.update(1 << 30))
+        self.assertFalse(lv.paused)
+        self.assertEqual(lv.peak_bytes, 1 << 30)
+
+        with self.assertRaises(RuntimeError):
+            IoPipelineWatermarks.Level(10, 20)
+
+    def test_inbound_buffered_bytes(self):
+        ch = IoPipeline.new([
+            h0 := InboundBytesBufferingQueueIoPipelineHandler(filter=True, passthrough=True),
+            h1 := InboundBytesBufferingQueueIoPipelineHandler(filter=True),
+        ])
+
+        ch.feed_in(b'abc')
+        self.assertEqual(IoPipelineWatermarks.inbound_buffered_bytes(ch), 6)
+        h0.drain()
+        self.assertEqual(IoPipelineWatermarks.inbound_buffered_bytes(ch), 3)
+        h1.drain()
+        self.assertEqual(IoPipelineWatermarks.inbound_buffered_bytes(ch), 0)
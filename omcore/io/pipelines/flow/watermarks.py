@@ -0,0 +1,154 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+# @om-lite
+import dataclasses as dc
+import typing as ta
+
+from ....lite.check import check
+from ..bytes.buffering import InboundBytesBufferingIoPipelineHandler
+from ..core import IoPipeline
+from ..core import IoPipelineService
+
+
+##
+
+
+class IoPipelineWatermarks(IoPipelineService):
+    """
+    Byte-count high / low watermarks for a pipeline, tracked separately for outbound bytes - written by the pipeline but
+    not yet taken by the transport - and inbound bytes - received but still buffered by the pipeline's handlers. Each
+    direction is hysteretic: it pauses once its level goes over its high watermark, and resumes once it falls back to or
+    under its low watermark.
+
+    Drivers which find this service among a pipeline's services report both levels to it, stop reading while inbound
+    is paused, and announce outbound transitions inbound as `ReadyForOutput` / `PauseOutput` (when an `IoPipelineFlow`
+    service is also present). The levels and their counters double as the pipeline's flow metrics.
+    """
+
+    @dc.dataclass(frozen=True)
+    class Config:
+        DEFAULT: ta.ClassVar['IoPipelineWatermarks.Config']
+
+        # A `None` high watermark disables that direction. A `None` low watermark defaults to a quarter of the high.
+        outbound_high: ta.Optional[int] = 64 * 1024
+        outbound_low: ta.Optional[int] = None
+
+        # Off by default: reads stop while inbound is paused, so a handler which must buffer more than the high
+        # watermark to make any progress - a message aggregator, say - would stall its connection.
+        inbound_high: ta.Optional[int] = None
+        inbound_low: ta.Optional[int] = None
+
+    Config.DEFAULT = Config()
+
+    def __init__(self, config: ta.Optional[Config] = None) -> None:
+        super().__init__()
+
+        if config is None:
+            config = self.Config.DEFAULT
+        self._config = config
+
+        self._outbound = IoPipelineWatermarks.Level(config.outbound_high, config.outbound_low)
+        self._inbound = IoPipelineWatermarks.Level(config.inbound_high, config.inbound_low)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<outbound={self._outbound!r}, inbound={self._inbound!r}>'
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @property
+    def outbound(self) -> 'IoPipelineWatermarks.Level':
+        return self._outbound
+
+    @property
+    def inbound(self) -> 'IoPipelineWatermarks.Level':
+        return self._inbound
+
+    #
+
+    @ta.final
+    class Level:
+        def __init__(self, high: ta.Optional[int], low: ta.Optional[int]) -> None:
+            if high is not None:
+                if low is None:
+                    low = high // 4
+                check.arg(0 <= low <= high, 'watermarks must satisfy 0 <= low <= high')
+            else:
+                check.none(low)
+
+            self._high = high
+            self._low = low
+
+            self._bytes = 0
+            self._peak_bytes = 0
+
+            self._paused = False
+            self._num_pauses = 0
+
+        def __repr__(self) -> str:
+            return (
+                f'{type(self).__name__}('
+                f'bytes={self._bytes}, '
+                f'peak_bytes={self._peak_bytes}, '
+                f'paused={self._paused}, '
+                f'num_pauses={self._num_pauses})'
+            )
+
+        @property
+        def high(self) -> ta.Optional[int]:
+            return self._high
+
+        @property
+        def low(self) -> ta.Optional[int]:
+            return self._low
+
+        @property
+        def bytes(self) -> int:
+            return self._bytes
+
+        @property
+        def peak_bytes(self) -> int:
+            return self._peak_bytes
+
+        @property
+        def paused(self) -> bool:
+            return self._paused
+
+        @property
+        def num_pauses(self) -> int:
+            return self._num_pauses
+
+        def update(self, n: int) -> bool:
+            """Records the current level, returning whether doing so paused or resumed it."""
+
+            self._bytes = n
+            if n > self._peak_bytes:
+                self._peak_bytes = n
+
+            if (high := self._high) is None:
+                return False
+
+            if self._paused:
+                if n <= ta.cast(int, self._low):
+                    self._paused = False
+                    return True
+
+            elif n > high:
+                self._paused = True
+                self._num_pauses += 1
+                return True
+
+            return False
+
+    #
+
+    @staticmethod
+    def inbound_buffered_bytes(pipeline: IoPipeline) -> int:
+        """Sums what the pipeline's inbound buffering handlers report, treating unanswerable as empty."""
+
+        n = 0
+        ty = IoPipeline._HandlerType(InboundBytesBufferingIoPipelineHandler)  # noqa
+        for hr in pipeline.find_handlers_of_type(ty):
+            if (hn := hr.handler.inbound_buffered_bytes()) is not None:
+                n += hn
+        return n
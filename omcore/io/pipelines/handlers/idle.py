@@ -0,0 +1,200 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+# @om-lite
+import dataclasses as dc
+import functools
+import time
+import typing as ta
+
+from ....lite.namespaces import NamespaceClass
+from ..core import IoPipelineHandler
+from ..core import IoPipelineHandlerContext
+from ..core import IoPipelineMessages
+from ..errors import IoPipelineError
+from ..sched.types import IoPipelineScheduling
+
+
+IdleStateKind = ta.Literal[  # ta.TypeAlias  # om-amalg-typing-no-move
+    'reader',
+    'writer',
+    'all',
+]
+
+
+##
+
+
+class IoPipelineIdleMessages(NamespaceClass):
+    @ta.final
+    @dc.dataclass(frozen=True)
+    class IdleState(  # ~ Netty `IdleStateEvent`
+        IoPipelineMessages.MayPropagate,
+        IoPipelineMessages.NeverOutbound,
+    ):
+        """
+        Signals that nothing has been read (`reader`), written (`writer`), or either (`all`) for the configured time.
+        Repeats for as long as the idleness lasts, with `first` set only on the first of each spell.
+        """
+
+        kind: IdleStateKind
+        first: bool
+
+
+class ReadTimeoutIoPipelineError(IoPipelineError):
+    pass
+
+
+##
+
+
+class IdleStateIoPipelineHandler(IoPipelineHandler):  # ~ Netty `IdleStateHandler`
+    """
+    Duplex handler feeding `IdleState` messages inbound when its pipeline goes idle, timed by the pipeline's
+    `IoPipelineScheduling` service. Any inbound message other than the final one counts as a read, and any outbound
+    message as a write. Timers run from `InitialInput` until `FinalInput` or `FinalOutput`.
+
+    Rather than being rescheduled on every read and write, each timer fires once per period and, if there was activity
+    in the meantime, reschedules itself for the remainder - so busy connections cost one timer event per period.
+    """
+
+    def __init__(
+            self,
+            *,
+            reader_idle_s: ta.Optional[float] = None,
+            writer_idle_s: ta.Optional[float] = None,
+            all_idle_s: ta.Optional[float] = None,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+
+        self._timeouts: ta.Dict[IdleStateKind, float] = {
+            k: t
+            for k, t in [
+                ('reader', reader_idle_s),
+                ('writer', writer_idle_s),
+                ('all', all_idle_s),
+            ]
+            if t is not None and t > 0
+        }
+        self._clock = clock
+
+        self._running = False
+        self._last_read = 0.
+        self._last_write = 0.
+        self._first: ta.Dict[IdleStateKind, bool] = {}
+        self._handles: ta.Dict[IdleStateKind, IoPipelineScheduling.Handle] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<{", ".join(f"{k}={t}" for k, t in self._timeouts.items())}>'
+
+    #
+
+    def _start(self, ctx: IoPipelineHandlerContext) -> None:
+        if self._running:
+            return
+        self._running = True
+
+        self._last_read = self._last_write = self._clock()
+        for k, t in self._timeouts.items():
+            self._first[k] = True
+            self._schedule(ctx, k, t)
+
+    def _stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+
+        for h in self._handles.values():
+            h.cancel()
+        self._handles.clear()
+
+    def _schedule(self, ctx: IoPipelineHandlerContext, kind: IdleStateKind, delay_s: float) -> None:
+        self._handles[kind] = ctx.services[IoPipelineScheduling].schedule(
+            ctx.ref,
+            delay_s,
+            functools.partial(self._on_timer, ctx, kind),
+        )
+
+    def _last_activity(self, kind: IdleStateKind) -> float:
+        if kind == 'reader':
+            return self._last_read
+        elif kind == 'writer':
+            return self._last_write
+        else:
+            return max(self._last_read, self._last_write)
+
+    def _on_timer(self, ctx: IoPipelineHandlerContext, kind: IdleStateKind) -> None:
+        if not self._running:
+            return
+
+        timeout = self._timeouts[kind]
+        if (rem := timeout - (self._clock() - self._last_activity(kind))) > 0:
+            self._schedule(ctx, kind, rem)
+            return
+
+        self._schedule(ctx, kind, timeout)
+
+        first = self._first[kind]
+        self._first[kind] = False
+
+        self._on_idle(ctx, IoPipelineIdleMessages.IdleState(kind, first))
+
+    def _on_idle(self, ctx: IoPipelineHandlerContext, msg: IoPipelineIdleMessages.IdleState) -> None:
+        ctx.feed_in(msg)
+
+    #
+
+    def inbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
+        if isinstance(msg, IoPipelineMessages.InitialInput):
+            self._start(ctx)
+
+        elif isinstance(msg, IoPipelineMessages.FinalInput):
+            self._stop()
+
+        elif self._running:
+            self._last_read = self._clock()
+            self._first['reader'] = self._first['all'] = True
+
+        ctx.feed_in(msg)
+
+    def outbound(self, ctx: IoPipelineHandlerContext, msg: ta.Any) -> None:
+        if isinstance(msg, IoPipelineMessages.FinalOutput):
+            self._stop()
+
+        elif self._running:
+            self._last_write = self._clock()
+            self._first['writer'] = self._first['all'] = True
+
+        ctx.feed_out(msg)
+
+
+##
+
+
+class ReadTimeoutIoPipelineHandler(IdleStateIoPipelineHandler):  # ~ Netty `ReadTimeoutHandler`
+    """
+    Closes its pipeline, by emitting `FinalOutput`, once nothing has been read for `timeout_s`. If `error` is set, first
+    feeds inbound an `Error` carrying a `ReadTimeoutIoPipelineError`.
+    """
+
+    def __init__(
+            self,
+            timeout_s: float,
+            *,
+            error: bool = False,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(
+            reader_idle_s=timeout_s,
+            clock=clock,
+        )
+
+        self._error = error
+
+    def _on_idle(self, ctx: IoPipelineHandlerContext, msg: IoPipelineIdleMessages.IdleState) -> None:
+        self._stop()
+
+        if self._error:
+            ctx.feed_in(IoPipelineMessages.Error(ReadTimeoutIoPipelineError(), 'inbound', ctx.ref))
+
+        if not ctx.pipeline.saw_final_output:
+            ctx.feed_final_output()
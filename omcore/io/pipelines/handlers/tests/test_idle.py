@@ -0,0 +1,96 @@
+# @om-lite
+import typing as ta
+import unittest
+
+from ...core import IoPipeline
+from ...core import IoPipelineMessages
+from ...sched.wheel import HashedTimingWheel
+from ...sched.wheel import WheelIoPipelineScheduling
+from ..idle import IdleStateIoPipelineHandler
+from ..idle import IoPipelineIdleMessages
+from ..idle import ReadTimeoutIoPipelineHandler
+from ..queues import InboundQueueIoPipelineHandler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Harness:
+    def __init__(self, clock: FakeClock, *handlers: ta.Any) -> None:
+        self.clock = clock
+        self.wheel = HashedTimingWheel(tick_s=.1, num_buckets=16, clock=self.clock)
+
+        def run(fn):
+            with self.pipeline.enter():
+                fn()
+
+        self.pipeline = IoPipeline.new(
+            list(handlers),
+            IoPipeline.Config(inbound_terminal='drop'),
+            services=[WheelIoPipelineScheduling(self.wheel, run)],
+        )
+
+    def sleep(self, s: float) -> None:
+        self.clock.now += s
+        self.wheel.advance()
+
+
+class TestIdle(unittest.TestCase):
+    def test_idle_state(self):
+        c = FakeClock()
+        h = _Harness(
+            c,
+            IdleStateIoPipelineHandler(reader_idle_s=1., writer_idle_s=2., clock=c),
+            q := InboundQueueIoPipelineHandler(filter_type=IoPipelineIdleMessages.IdleState),
+        )
+
+        h.pipeline.feed_in(IoPipelineMessages.InitialInput())
+        self.assertEqual(len(h.wheel), 2)
+
+        h.sleep(.6)
+        h.pipeline.feed_in('x')
+        h.sleep(.6)
+        self.assertEqual(q.drain(), [])
+
+        h.sleep(.6)
+        self.assertEqual(q.drain(), [IoPipelineIdleMessages.IdleState('reader', True)])
+
+        h.sleep(1.1)
+        self.assertEqual(q.drain(), [
+            IoPipelineIdleMessages.IdleState('writer', True),
+            IoPipelineIdleMessages.IdleState('reader', False),
+        ])
+
+        with h.pipeline.enter():
+            h.pipeline.handlers()[-1]._context.feed_out(b'y')  # noqa
+        self.assertEqual(h.pipeline.output.poll(), b'y')
+        h.sleep(1.1)
+        self.assertEqual(q.drain(), [IoPipelineIdleMessages.IdleState('reader', False)])
+
+        h.sleep(1.15)
+        self.assertEqual(q.drain(), [
+            IoPipelineIdleMessages.IdleState('writer', True),
+            IoPipelineIdleMessages.IdleState('reader', False),
+        ])
+
+        h.pipeline.feed_in(IoPipelineMessages.FinalInput())
+        self.assertEqual(len(h.wheel), 0)
+
+    def test_read_timeout(self):
+        c = FakeClock()
+        h = _Harness(c, ReadTimeoutIoPipelineHandler(1., clock=c))
+
+        h.pipeline.feed_in(IoPipelineMessages.InitialInput())
+        h.sleep(.9)
+        h.pipeline.feed_in('x')
+        h.sleep(.9)
+        self.assertIsNone(h.pipeline.output.poll())
+
+        h.sleep(.2)
+        self.assertIsInstance(h.pipeline.output.poll(), IoPipelineMessages.FinalOutput)
+        self.assertEqual(len(h.wheel), 0)
@@ -0,0 +1,147 @@
+# ruff: noqa: UP006
+# @om-lite
+import functools
+import random
+import typing as ta
+import unittest
+
+from ...core import IoPipeline
+from ...core import IoPipelineHandler
+from ..wheel import HashedTimingWheel
+from ..wheel import WheelIoPipelineScheduling
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class NopHandler(IoPipelineHandler):
+    pass
+
+
+class TestHashedTimingWheel(unittest.TestCase):
+    def test_fires_in_order(self):
+        c = FakeClock()
+        w = HashedTimingWheel(tick_s=.1, num_buckets=8, clock=c)
+
+        fired: ta.List[int] = []
+        w.schedule(.35, lambda: fired.append(2))
+        w.schedule(.05, lambda: fired.append(0))
+        w.schedule(.25, lambda: fired.append(1))
+        w.schedule(5., lambda: fired.append(3))  # several rotations out
+        self.assertEqual(len(w), 4)
+        self.assertAlmostEqual(w.next_delay(), .1)  # type: ignore[arg-type]
+
+        c.now += .05
+        self.assertEqual(w.advance(), 0)
+
+        c.now += 1.
+        self.assertEqual(w.advance(), 3)
+        self.assertEqual(fired, [0, 1, 2])
+        self.assertEqual(len(w), 1)
+
+        c.now += 3.8
+        self.assertEqual(w.advance(), 0)
+        c.now += .2
+        self.assertEqual(w.advance(), 1)
+        self.assertEqual(fired, [0, 1, 2, 3])
+        self.assertIsNone(w.next_delay())
+
+    def test_cancel(self):
+        c = FakeClock()
+        w = HashedTimingWheel(tick_s=.1, num_buckets=8, clock=c)
+
+        fired: ta.List[int] = []
+        t0 = w.schedule(.2, lambda: fired.append(0))
+        t1 = w.schedule(.2, lambda: t0.cancel() or fired.append(1))  # type: ignore[func-returns-value]
+        w.schedule(.2, lambda: fired.append(2))
+        t0.cancel()
+        t0.cancel()
+        self.assertFalse(t0.active)
+        self.assertEqual(len(w), 2)
+
+        c.now += 1.
+        self.assertEqual(w.advance(), 2)
+        self.assertEqual(fired, [1, 2])
+        self.assertFalse(t1.active)
+        t1.cancel()
+        self.assertEqual(len(w), 0)
+
+    def test_raising_fn(self):
+        c = FakeClock()
+        w = HashedTimingWheel(tick_s=.1, clock=c)
+
+        fired: ta.List[int] = []
+
+        def boom():
+            raise RuntimeError
+
+        w.schedule(.1, boom)
+        w.schedule(.2, lambda: fired.append(1))
+        c.now += 1.
+        with self.assertRaises(RuntimeError):
+            w.advance()
+        self.assertEqual(w.next_delay(), 0.)
+        self.assertEqual(w.advance(), 1)
+        self.assertEqual(fired, [1])
+
+    def test_random(self):
+        c = FakeClock()
+        w = HashedTimingWheel(tick_s=.01, num_buckets=16, clock=c)
+        rnd = random.Random(42)
+
+        fired: ta.List[ta.Tuple[float, float]] = []
+        live: ta.Dict[int, HashedTimingWheel.Timer] = {}
+
+        def fire(i: int, dl: float) -> None:
+            fired.append((dl, c.now))
+            del live[i]
+
+        for i in range(2000):
+            op = rnd.random()
+            if op < .5:
+                d = rnd.random() * .5
+                live[i] = w.schedule(d, functools.partial(fire, i, c.now + d))
+            elif op < .6 and live:
+                live.pop(rnd.choice(list(live))).cancel()
+            else:
+                c.now += rnd.random() * .05
+                w.advance()
+            self.assertEqual(len(w), len(live))
+
+        c.now += 1.
+        w.advance()
+        self.assertFalse(live)
+        for dl, at in fired:
+            self.assertLessEqual(dl, at)
+
+
+class TestWheelIoPipelineScheduling(unittest.TestCase):
+    def test_cancellation(self):
+        c = FakeClock()
+        w = HashedTimingWheel(tick_s=.1, clock=c)
+
+        fired: ta.List[str] = []
+        svc = WheelIoPipelineScheduling(w, lambda fn: fn())
+        p = IoPipeline.new([NopHandler(), NopHandler()], services=[svc])
+        r0, r1 = p.handlers()
+
+        svc.schedule(r0, 1., lambda: fired.append('a'))
+        svc.schedule(r1, 1., lambda: fired.append('b'))
+        svc.schedule(r1, 1., lambda: fired.append('c')).cancel()
+        self.assertEqual((len(svc), len(w)), (2, 2))
+
+        p.remove(r0)
+        self.assertEqual((len(svc), len(w)), (1, 1))
+
+        c.now += 2.
+        w.advance()
+        self.assertEqual(fired, ['b'])
+
+        svc.schedule(r1, 1., lambda: fired.append('d'))
+        p.destroy()
+        self.assertEqual((len(svc), len(w)), (0, 0))
@@ -0,0 +1,296 @@
+# ruff: noqa: UP006 UP007 UP037 UP045
+# @om-lite
+import math
+import time
+import typing as ta
+
+from ....lite.check import check
+from ..core import IoPipeline
+from ..core import IoPipelineHandlerRef
+from ..core import IoPipelineHandlerUpdate
+from ..core import IoPipelineService
+from ..core import IoPipelineUpdate
+from .types import IoPipelineScheduling
+
+
+##
+
+
+class HashedTimingWheel:
+    """
+    A single-threaded hashed timing wheel (Varghese & Lauck), intended to be shared by all the pipelines driven by a
+    single loop. Scheduling and cancelling are O(1) regardless of the number of timers, at the cost of firing with a
+    granularity of `tick_s` - timers never fire early, but may fire up to a tick late.
+
+    Nothing runs on its own: the owning loop calls `advance` - typically after waking from a poll bounded by
+    `next_delay` - which fires everything due, in deadline order.
+    """
+
+    def __init__(
+            self,
+            *,
+            tick_s: float = .1,
+            num_buckets: int = 512,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+
+        check.arg(tick_s > 0, 'tick_s must be positive')
+        check.arg(num_buckets > 0, 'num_buckets must be positive')
+
+        self._tick_s = tick_s
+        self._num_buckets = num_buckets
+        self._clock = clock
+
+        self._start = clock()
+        self._tick = 0
+
+        self._buckets: ta.List[ta.Dict[int, HashedTimingWheel.Timer]] = [{} for _ in range(num_buckets)]
+        self._len = 0
+        self._seq = 0
+
+        self._due: ta.List[HashedTimingWheel.Timer] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={self._len}, tick={self._tick}>'
+
+    @property
+    def tick_s(self) -> float:
+        return self._tick_s
+
+    @property
+    def clock(self) -> ta.Callable[[], float]:
+        return self._clock
+
+    def __len__(self) -> int:
+        """The number of timers scheduled and neither fired nor cancelled."""
+
+        return self._len
+
+    #
+
+    @ta.final
+    class Timer:
+        def __init__(
+                self,
+                wheel: 'HashedTimingWheel',
+                deadline_tick: int,
+                seq: int,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._wheel: ta.Optional[HashedTimingWheel] = wheel
+            self._deadline_tick = deadline_tick
+            self._seq = seq
+            self._fn = fn
+
+        def __repr__(self) -> str:
+            return f'{type(self).__name__}@{id(self):x}<deadline_tick={self._deadline_tick}, active={self.active}>'
+
+        @property
+        def active(self) -> bool:
+            return self._wheel is not None
+
+        def cancel(self) -> None:
+            """Idempotent, and a no-op once fired."""
+
+            if (w := self._wheel) is None:
+                return
+            self._wheel = None
+
+            # Timers already collected by an interrupted `advance` are no longer in their bucket.
+            if w._buckets[self._deadline_tick % w._num_buckets].pop(self._seq, None) is not None:  # noqa
+                w._len -= 1  # noqa
+
+    #
+
+    def _now_tick(self, now: float) -> int:
+        return int((now - self._start) / self._tick_s)
+
+    def schedule(self, delay_s: float, fn: ta.Callable[[], None]) -> Timer:
+        now = self._clock()
+        now_tick = self._now_tick(now)
+
+        if not self._len and now_tick > self._tick:
+            # Nothing is pending, so there is nothing for `advance` to catch up on.
+            self._tick = now_tick
+
+        deadline_tick = math.ceil((now + max(delay_s, 0.) - self._start) / self._tick_s)
+        if deadline_tick <= now_tick:
+            deadline_tick = now_tick + 1
+
+        self._seq += 1
+        t = HashedTimingWheel.Timer(self, deadline_tick, self._seq, fn)
+        self._buckets[deadline_tick % self._num_buckets][t._seq] = t  # noqa
+        self._len += 1
+        return t
+
+    def next_delay(self) -> ta.Optional[float]:
+        """
+        Returns how long until the next tick which may have timers due - possibly early, when the first occupied bucket
+        holds only timers due in later rotations - or None if no timers are pending.
+        """
+
+        if self._due:
+            return 0.
+
+        if not self._len:
+            return None
+
+        n = self._num_buckets
+        buckets = self._buckets
+        base = self._tick + 1
+        i = 0
+        while not buckets[(base + i) % n]:
+            i += 1
+
+        return max(self._start + (base + i) * self._tick_s - self._clock(), 0.)
+
+    def advance(self) -> int:
+        """
+        Fires all timers due as of now, returning how many were fired. Should a timer's fn raise, the timers remaining
+        due are fired by the next call.
+        """
+
+        if not self._due:
+            now_tick = self._now_tick(self._clock())
+            if now_tick <= self._tick:
+                return 0
+
+            n = self._num_buckets
+            buckets = self._buckets
+
+            due: ta.List[HashedTimingWheel.Timer] = []
+            if now_tick - self._tick >= n:
+                ks: ta.Iterable[int] = range(n)
+            else:
+                ks = range(self._tick + 1, now_tick + 1)
+
+            for k in ks:
+                if not (b := buckets[k % n]):
+                    continue
+                for s, t in list(b.items()):
+                    if t._deadline_tick <= now_tick:  # noqa
+                        del b[s]
+                        due.append(t)
+
+            self._tick = now_tick
+
+            if not due:
+                return 0
+
+            self._len -= len(due)
+            due.sort(key=lambda t: (t._deadline_tick, t._seq), reverse=True)  # noqa
+            self._due = due
+
+        due = self._due
+        c = 0
+        while due:
+            t = due.pop()
+            if t._wheel is None:  # noqa
+                continue
+            t._wheel = None  # noqa
+            c += 1
+            t._fn()  # noqa
+
+        return c
+
+
+##
+
+
+class WheelIoPipelineScheduling(IoPipelineScheduling, IoPipelineService):
+    """
+    Schedules a pipeline's timers on a (possibly shared) `HashedTimingWheel`. When a timer fires its fn is handed to
+    `runner`, supplied by the pipeline's driver, which must run it within the pipeline - as by `pipeline.enter()` - and
+    then process whatever it produced.
+
+    Timers are cancelled along with the handler which scheduled them, and all of them when the pipeline is destroyed.
+    """
+
+    def __init__(
+            self,
+            wheel: HashedTimingWheel,
+            runner: ta.Callable[[ta.Callable[[], None]], None],
+    ) -> None:
+        super().__init__()
+
+        self._wheel = wheel
+        self._runner = runner
+
+        self._by_ref: ta.Dict[IoPipelineHandlerRef, ta.Dict[WheelIoPipelineScheduling._Handle, None]] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={len(self)}>'
+
+    @property
+    def wheel(self) -> HashedTimingWheel:
+        return self._wheel
+
+    def __len__(self) -> int:
+        return sum(len(hs) for hs in self._by_ref.values())
+
+    #
+
+    @ta.final
+    class _Handle(IoPipelineScheduling.Handle):
+        def __init__(
+                self,
+                svc: 'WheelIoPipelineScheduling',
+                handler_ref: IoPipelineHandlerRef,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._svc = svc
+            self._handler_ref = handler_ref
+            self._fn = fn
+
+            self._timer: ta.Optional[HashedTimingWheel.Timer] = None
+
+        def cancel(self) -> None:
+            if (t := self._timer) is None:
+                return
+            self._timer = None
+            t.cancel()
+            self._svc._untrack(self)  # noqa
+
+        def _fire(self) -> None:
+            self._timer = None
+            self._svc._untrack(self)  # noqa
+            self._svc._runner(self._fn)  # noqa
+
+    def _untrack(self, h: _Handle) -> None:
+        if (hs := self._by_ref.get(h._handler_ref)) is None:  # noqa
+            return
+        hs.pop(h, None)
+        if not hs:
+            del self._by_ref[h._handler_ref]  # noqa
+
+    def schedule(
+            self,
+            handler_ref: IoPipelineHandlerRef,
+            delay_s: float,
+            fn: ta.Callable[[], None],
+    ) -> IoPipelineScheduling.Handle:
+        h = WheelIoPipelineScheduling._Handle(self, handler_ref, fn)
+        h._timer = self._wheel.schedule(delay_s, h._fire)  # noqa
+        self._by_ref.setdefault(handler_ref, {})[h] = None
+        return h
+
+    def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
+        if handler_ref is not None:
+            hs_lst = [hs] if (hs := self._by_ref.get(handler_ref)) is not None else []
+        else:
+            hs_lst = list(self._by_ref.values())
+
+        for hs in hs_lst:
+            for h in list(hs):
+                h.cancel()
+
+    #
+
+    def handler_update(self, handler_ref: IoPipelineHandlerRef, kind: IoPipelineHandlerUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all(handler_ref)
+
+    def pipeline_update(self, pipeline: IoPipeline, kind: IoPipelineUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all()
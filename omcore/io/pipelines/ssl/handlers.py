@@ -151,6 +151,21 @@ class SslIoPipelineHandler(
     _out_bio: ssl.MemoryBIO
     _ssl_obj: ssl.SSLObject
 
+    @property
+    def ssl_session(self) -> ta.Optional[ssl.SSLSession]:
+        """
+        The session negotiated once the handshake has completed, which a later connection to the same server through
+        the same `ssl_ctx` may offer to resume - otherwise None.
+        """
+
+        if self.state not in (self.State.ESTABLISHED, self.State.SHUTTING_DOWN):
+            return None
+        return self._ssl_obj.session
+
+    @property
+    def session_reused(self) -> bool:
+        return self.state is not None and self.state is not self.State.NEW and self._ssl_obj.session_reused
+
     # Plaintext accepted from the app but not yet accepted by the SSL engine, flattened into individual memoryview
     # segments. Flattening matters: after SSL_write raises WANT_READ, OpenSSL requires the retry to present the same
     # buffer, so we must always retry exactly the head segment and never re-aggregate or skip ahead.
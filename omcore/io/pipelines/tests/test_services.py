@@ -4,6 +4,7 @@ import unittest
 
 from ....lite.abstract import Abstract
 from ..core import IoPipeline
+from ..core import IoPipelineHandler
 from ..core import IoPipelineService
 
 
@@ -24,3 +25,39 @@ class TestServices(unittest.TestCase):
         foo = ch.services[FooService]
         assert isinstance(foo, FooServiceImpl)
         assert foo.frob() == 'foo!'
+
+
+class NopHandler(IoPipelineHandler):
+    pass
+
+
+class RecordingService(IoPipelineService):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.updates: list = []
+
+    def pipeline_update(self, pipeline, kind):
+        self.updates.append(('pipeline', kind))
+
+    def handler_update(self, handler_ref, kind):
+        self.updates.append(('handler', kind))
+
+
+class TestServiceUpdates(unittest.TestCase):
+    def test_updates(self):
+        svc = RecordingService()
+        ch = IoPipeline.new([NopHandler()], services=[svc])
+        assert svc.updates == [
+            ('pipeline', 'added'),
+            ('handler', 'adding'),
+            ('handler', 'added'),
+        ]
+
+        svc.updates.clear()
+        ch.destroy()
+        assert svc.updates == [
+            ('handler', 'removing'),
+            ('handler', 'removed'),
+            ('pipeline', 'removed'),
+        ]
@@ -0,0 +1,425 @@
+// @om-cext
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+#include <cassert>
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+//
+
+#define _MODULE_NAME "_scanning"
+#define _PACKAGE_NAME "omcore.io.streambufs"
+#define _MODULE_FULL_NAME _PACKAGE_NAME "." _MODULE_NAME
+
+typedef struct scanning_state {
+} scanning_state;
+
+static scanning_state * get_scanning_state(PyObject *module)
+{
+    void *state = PyModule_GetState(module);
+    assert(state != nullptr);
+    return (scanning_state *)state;
+}
+
+//
+
+// Buffers acquired from the items of a sequence, lazily and at most once each, and all released on destruction.
+class AcquiredBuffers {
+public:
+    AcquiredBuffers(PyObject **items, Py_ssize_t n)
+        : items_(items), views_((size_t)n), acquired_((size_t)n, false)
+    {
+    }
+
+    ~AcquiredBuffers()
+    {
+        for (size_t i = 0; i < views_.size(); i++) {
+            if (acquired_[i]) {
+                PyBuffer_Release(&views_[i]);
+            }
+        }
+    }
+
+    AcquiredBuffers(const AcquiredBuffers &) = delete;
+    AcquiredBuffers &operator=(const AcquiredBuffers &) = delete;
+
+    Py_ssize_t size() const
+    {
+        return (Py_ssize_t)views_.size();
+    }
+
+    Py_buffer * get(Py_ssize_t i)
+    {
+        if (!acquired_[(size_t)i]) {
+            if (PyObject_GetBuffer(items_[i], &views_[(size_t)i], PyBUF_SIMPLE) < 0) {
+                return nullptr;
+            }
+            acquired_[(size_t)i] = true;
+        }
+        return &views_[(size_t)i];
+    }
+
+private:
+    PyObject **items_;
+    std::vector<Py_buffer> views_;
+    std::vector<bool> acquired_;
+};
+
+//
+
+// Returns 1 if `sub` occurs in the stream formed by `segs` at offset `off` of segment `i`, 0 if it does not, and -1 on
+// error.
+static int match_at(AcquiredBuffers &segs, Py_ssize_t i, Py_ssize_t off, const char *sub, Py_ssize_t sub_len)
+{
+    Py_ssize_t k = 0;
+    while (k < sub_len) {
+        if (i >= segs.size()) {
+            return 0;
+        }
+
+        Py_buffer *view = segs.get(i);
+        if (view == nullptr) {
+            return -1;
+        }
+
+        Py_ssize_t n = view->len - off;
+        if (n > sub_len - k) {
+            n = sub_len - k;
+        }
+        if (n > 0) {
+            if (memcmp((const char *)view->buf + off, sub + k, (size_t)n) != 0) {
+                return 0;
+            }
+            k += n;
+        }
+
+        i++;
+        off = 0;
+    }
+    return 1;
+}
+
+PyDoc_STRVAR(scanning_find_longest_doc, "find_longest(segs, subs, start=0)");
+
+static PyObject * scanning_find_longest(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs < 2 || nargs > 3) {
+        PyErr_Format(
+            PyExc_TypeError,
+            "find_longest() takes 2 or 3 positional arguments (%zd given)",
+            nargs
+        );
+        return nullptr;
+    }
+
+    Py_ssize_t start = 0;
+    if (nargs == 3) {
+        start = PyLong_AsSsize_t(args[2]);
+        if (start == -1 && PyErr_Occurred()) {
+            return nullptr;
+        }
+        if (start < 0) {
+            start = 0;
+        }
+    }
+
+    PyObject *segs_seq = PySequence_Fast(args[0], "find_longest() segs must be a sequence");
+    if (segs_seq == nullptr) {
+        return nullptr;
+    }
+
+    PyObject *subs_seq = PySequence_Fast(args[1], "find_longest() subs must be a sequence");
+    if (subs_seq == nullptr) {
+        Py_DECREF(segs_seq);
+        return nullptr;
+    }
+
+    PyObject *ret = nullptr;
+
+    {
+        AcquiredBuffers segs(PySequence_Fast_ITEMS(segs_seq), PySequence_Fast_GET_SIZE(segs_seq));
+
+        Py_ssize_t n_subs = PySequence_Fast_GET_SIZE(subs_seq);
+        AcquiredBuffers subs(PySequence_Fast_ITEMS(subs_seq), n_subs);
+
+        bool first[256] = {};
+        int n_first = 0;
+        unsigned char only_first = 0;
+
+        Py_ssize_t pos = -1;
+        Py_ssize_t found = -1;
+
+        Py_ssize_t i = 0;
+        Py_ssize_t base = 0;
+        Py_ssize_t lo = 0;
+
+        if (n_subs < 1) {
+            PyErr_SetString(PyExc_ValueError, "no subs");
+            goto done;
+        }
+
+        for (Py_ssize_t k = 0; k < n_subs; k++) {
+            Py_buffer *sv = subs.get(k);
+            if (sv == nullptr) {
+                goto done;
+            }
+            if (sv->len < 1) {
+                PyErr_SetString(PyExc_ValueError, "empty sub");
+                goto done;
+            }
+            unsigned char c = *(const unsigned char *)sv->buf;
+            if (!first[c]) {
+                first[c] = true;
+                only_first = c;
+                n_first++;
+            }
+        }
+
+        for (; i < segs.size(); i++) {
+            Py_buffer *view = segs.get(i);
+            if (view == nullptr) {
+                goto done;
+            }
+            if (base + view->len > start) {
+                break;
+            }
+            base += view->len;
+        }
+        lo = start - base;
+
+        for (; i < segs.size(); i++, lo = 0) {
+            Py_buffer *view = segs.get(i);
+            if (view == nullptr) {
+                goto done;
+            }
+
+            const unsigned char *p = (const unsigned char *)view->buf;
+            Py_ssize_t len = view->len;
+
+            for (Py_ssize_t j = lo; j < len; j++) {
+                if (n_first == 1) {
+                    const void *q = memchr(p + j, only_first, (size_t)(len - j));
+                    if (q == nullptr) {
+                        break;
+                    }
+                    j = (const unsigned char *)q - p;
+                } else {
+                    while (j < len && !first[p[j]]) {
+                        j++;
+                    }
+                    if (j >= len) {
+                        break;
+                    }
+                }
+
+                for (Py_ssize_t k = 0; k < n_subs; k++) {
+                    Py_buffer *sv = subs.get(k);
+                    if (*(const unsigned char *)sv->buf != p[j]) {
+                        continue;
+                    }
+                    int r = match_at(segs, i, j, (const char *)sv->buf, sv->len);
+                    if (r < 0) {
+                        goto done;
+                    }
+                    if (r) {
+                        pos = base + j;
+                        found = k;
+                        goto hit;
+                    }
+                }
+            }
+
+            base += len;
+        }
+
+    hit:
+        ret = Py_BuildValue("(nn)", pos, found);
+
+    done:;
+    }
+
+    Py_DECREF(subs_seq);
+    Py_DECREF(segs_seq);
+    return ret;
+}
+
+//
+
+PyDoc_STRVAR(
+    scanning_scan_length_fields_doc,
+    "scan_length_fields(buf, offset, length, byteorder, adjustment, limit)"
+);
+
+static PyObject * scanning_scan_length_fields(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 6) {
+        PyErr_Format(
+            PyExc_TypeError,
+            "scan_length_fields() takes exactly 6 positional arguments (%zd given)",
+            nargs
+        );
+        return nullptr;
+    }
+
+    Py_ssize_t offset = PyLong_AsSsize_t(args[1]);
+    if (offset == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+    if (offset < 0) {
+        PyErr_SetObject(PyExc_ValueError, args[1]);
+        return nullptr;
+    }
+
+    Py_ssize_t length = PyLong_AsSsize_t(args[2]);
+    if (length == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+    if (length != 1 && length != 2 && length != 4 && length != 8) {
+        PyErr_SetObject(PyExc_ValueError, args[2]);
+        return nullptr;
+    }
+
+    bool little;
+    if (PyUnicode_Check(args[3]) && PyUnicode_CompareWithASCIIString(args[3], "big") == 0) {
+        little = false;
+    } else if (PyUnicode_Check(args[3]) && PyUnicode_CompareWithASCIIString(args[3], "little") == 0) {
+        little = true;
+    } else {
+        PyErr_SetObject(PyExc_ValueError, args[3]);
+        return nullptr;
+    }
+
+    long long adjustment = PyLong_AsLongLong(args[4]);
+    if (adjustment == -1 && PyErr_Occurred()) {
+        return nullptr;
+    }
+
+    bool has_limit = args[5] != Py_None;
+    long long limit = 0;
+    if (has_limit) {
+        limit = PyLong_AsLongLong(args[5]);
+        if (limit == -1 && PyErr_Occurred()) {
+            return nullptr;
+        }
+    }
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(args[0], &view, PyBUF_SIMPLE) < 0) {
+        return nullptr;
+    }
+
+    PyObject *out = PyList_New(0);
+    if (out == nullptr) {
+        PyBuffer_Release(&view);
+        return nullptr;
+    }
+
+    const unsigned char *p = (const unsigned char *)view.buf;
+    long long n = (long long)view.len;
+    long long end_off = (long long)offset + (long long)length;
+
+    long long pos = 0;
+    while (n - pos >= end_off) {
+        const unsigned char *f = p + pos + offset;
+        uint64_t v = 0;
+        if (little) {
+            for (Py_ssize_t k = length - 1; k >= 0; k--) {
+                v = (v << 8) | f[k];
+            }
+        } else {
+            for (Py_ssize_t k = 0; k < length; k++) {
+                v = (v << 8) | f[k];
+            }
+        }
+
+        // Anything which overflows is necessarily longer than the buffer.
+        long long t;
+        if (
+            v > (uint64_t)PY_SSIZE_T_MAX ||
+            __builtin_add_overflow((long long)v, adjustment, &t) ||
+            __builtin_add_overflow(t, end_off, &t)
+        ) {
+            break;
+        }
+        if (t < end_off || t > n - pos || (has_limit && t > limit)) {
+            break;
+        }
+
+        PyObject *o = PyLong_FromLongLong(t);
+        if (o == nullptr || PyList_Append(out, o) < 0) {
+            Py_XDECREF(o);
+            Py_DECREF(out);
+            PyBuffer_Release(&view);
+            return nullptr;
+        }
+        Py_DECREF(o);
+
+        pos += t;
+    }
+
+    PyBuffer_Release(&view);
+    return out;
+}
+
+//
+
+PyDoc_STRVAR(scanning_doc, "Native C++ implementations for omcore.io.streambufs.scanning");
+
+static int scanning_exec(PyObject *module)
+{
+    get_scanning_state(module);
+    return 0;
+}
+
+static int scanning_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    get_scanning_state(module);
+    return 0;
+}
+
+static int scanning_clear(PyObject *module)
+{
+    get_scanning_state(module);
+    return 0;
+}
+
+static void scanning_free(void *module)
+{
+    scanning_clear((PyObject *)module);
+}
+
+static PyMethodDef scanning_methods[] = {
+    {"find_longest", (PyCFunction)scanning_find_longest, METH_FASTCALL, scanning_find_longest_doc},
+    {"scan_length_fields", (PyCFunction)scanning_scan_length_fields, METH_FASTCALL, scanning_scan_length_fields_doc},
+    {nullptr, nullptr, 0, nullptr}
+};
+
+static struct PyModuleDef_Slot scanning_slots[] = {
+    {Py_mod_exec, (void *)scanning_exec},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {0, nullptr}
+};
+
+static struct PyModuleDef scanning_module = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = _MODULE_NAME,
+    .m_doc = scanning_doc,
+    .m_size = sizeof(scanning_state),
+    .m_methods = scanning_methods,
+    .m_slots = scanning_slots,
+    .m_traverse = scanning_traverse,
+    .m_clear = scanning_clear,
+    .m_free = scanning_free,
+};
+
+extern "C" {
+
+PyMODINIT_FUNC PyInit__scanning(void)
+{
+    return PyModuleDef_Init(&scanning_module);
+}
+
+}
@@ -0,0 +1,135 @@
+# ruff: noqa: UP006 UP007 UP045
+# @om-lite
+"""
+Pure-Python reference implementations of the functions of the optional `_scanning` extension, which must behave
+identically. `scanning` exports the extension's versions when it is available, and these otherwise.
+"""
+import re
+import typing as ta
+
+
+##
+
+
+_FIND_LONGEST_PATS: ta.Dict[ta.Tuple[bytes, ...], ta.Tuple[ta.Any, ta.Any, int]] = {}
+
+
+def _find_longest_pats(subs: ta.Tuple[bytes, ...]) -> ta.Tuple[ta.Any, ta.Any, int]:
+    try:
+        return _FIND_LONGEST_PATS[subs]
+    except KeyError:
+        pass
+
+    if not subs:
+        raise ValueError('no subs')
+    if any(not s for s in subs):
+        raise ValueError('empty sub')
+
+    # Alternation tries its branches in order, so at the leftmost position matched the first sub to match wins. One
+    # group per sub lets `lastindex` name it.
+    pat = re.compile(b'|'.join(b'(' + re.escape(s) + b')' for s in subs))
+    first_pat = re.compile(b'[' + b''.join(re.escape(s[:1]) for s in subs) + b']')
+
+    if len(_FIND_LONGEST_PATS) >= 256:
+        _FIND_LONGEST_PATS.clear()
+    ret = _FIND_LONGEST_PATS[subs] = (pat, first_pat, max(len(s) for s in subs) - 1)
+    return ret
+
+
+def find_longest(segs: ta.Sequence[ta.Any], subs: ta.Sequence[bytes], start: int = 0) -> ta.Tuple[int, int]:
+    """
+    Searches the stream formed by concatenating the bytes-like `segs` for the earliest occurrence of any of `subs` at or
+    after `start`, returning its position and the index of the first of `subs` which occurs there - so ordering `subs`
+    longest first picks the longest match. Returns (-1, -1) if none occurs.
+    """
+
+    pat, first_pat, ov = _find_longest_pats(tuple(subs))
+
+    if start < 0:
+        start = 0
+
+    n = len(segs)
+    i = 0
+    base = 0
+    while i < n:
+        sl = len(segs[i])
+        if base + sl > start:
+            break
+        base += sl
+        i += 1
+
+    lo = start - base
+    while i < n:
+        s = segs[i]
+        sl = len(s)
+
+        # Matches starting within the last `ov` bytes may be cut short - or missed - by the end of the segment, so only
+        # earlier ones are final.
+        tail = sl - ov
+        m = pat.search(s, lo)
+        if m is not None and m.start() < tail:
+            return base + m.start(), m.lastindex - 1
+
+        wlo = lo if lo > tail else tail
+        if ov and i + 1 < n and (m is not None or first_pat.search(s, wlo) is not None):
+            parts = [s[wlo:]]
+            need = ov
+            j = i + 1
+            while need and j < n:
+                p = segs[j][:need]
+                parts.append(p)
+                need -= len(p)
+                j += 1
+
+            # Matches starting after the boundary would be cut short by the end of the window - they're found from the
+            # next segment instead.
+            wm = pat.search(b''.join(parts))
+            if wm is not None and wm.start() < sl - wlo:
+                return base + wlo + wm.start(), wm.lastindex - 1
+
+        elif m is not None:
+            return base + m.start(), m.lastindex - 1
+
+        base += sl
+        lo = 0
+        i += 1
+
+    return -1, -1
+
+
+def scan_length_fields(
+        buf: ta.Any,
+        offset: int,
+        length: int,
+        byteorder: str,
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    """
+    Returns the total lengths of the consecutive length-field-prefixed frames laid out wholly within the bytes-like
+    `buf` from its start, where each frame's total length is its unsigned length field's value plus `adjustment` plus
+    `offset + length`. Stops at the first frame which is incomplete, whose total length is shorter than its header, or
+    which is longer than `limit`.
+    """
+
+    if offset < 0:
+        raise ValueError(offset)
+    if length not in (1, 2, 4, 8):
+        raise ValueError(length)
+    if byteorder not in ('big', 'little'):
+        raise ValueError(byteorder)
+
+    mv = memoryview(buf)
+    n = len(mv)
+    end_off = offset + length
+
+    out: ta.List[int] = []
+    p = 0
+    while n - p >= end_off:
+        t = int.from_bytes(mv[p + offset:p + end_off], byteorder) + adjustment + end_off  # type: ignore[arg-type]
+        if t < end_off or t > n - p or (limit is not None and t > limit):
+            break
+        out.append(t)
+        p += t
+
+    return out
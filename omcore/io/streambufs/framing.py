@@ -4,6 +4,9 @@ import typing as ta
 
 from .errors import BufferTooLargeByteStreamBufferError
 from .errors import FrameTooLargeByteStreamBufferError
+from .scanning import ScanningByteStreamBuffer
+from .scanning import find_longest
+from .scanning import scan_length_fields
 from .types import ByteStreamBuffer
 from .types import ByteStreamBufferView
 
@@ -23,9 +26,9 @@ class LongestMatchDelimiterByteStreamFrameDecoder:
       it can prove the next byte is not '\\n' (or the stream is finalized).
 
     Implementation note:
-      This codec relies on `ByteStreamBuffer.find(...)` being stream-correct and C-accelerated over the buffer's
-      underlying contiguous segments. In pure Python it is usually better to keep searching near the storage layer than
-      to re-implement scanning byte-by-byte in higher-level codecs.
+      This codec searches for all delimiters at once over the buffer's `segments()`, with `scanning.find_longest` -
+      natively when the `_scanning` extension is available. Given a `ScanningByteStreamBuffer` it resumes each search
+      where the last unsuccessful one left off.
 
     Pairs well with `ScanningByteStreamBuffer`.
     """
@@ -69,6 +72,9 @@ class LongestMatchDelimiterByteStreamFrameDecoder:
 
         self._max_delim_len = max(len(d) for d in self._delims)
 
+        # A lone delimiter is simply searched for with the buffer's own `find`.
+        self._single_delim: ta.Optional[bytes] = self._delims[0] if len(set(self._delims)) == 1 else None
+
     @ta.overload
     def decode(
             self,
@@ -149,41 +155,23 @@ class LongestMatchDelimiterByteStreamFrameDecoder:
         choose the longest matching delimiter.
         """
 
-        ln = len(buf)
-        if not ln:
+        if not len(buf):
             return None
 
-        best_pos = None  # type: ta.Optional[int]
-        best_delim = None  # type: ta.Optional[bytes]
+        if self._single_delim is not None:
+            if (pos := buf.find(self._single_delim)) < 0:
+                return None
+            return pos, self._single_delim
 
-        # First pass: find the earliest position of any delimiter (cheap, uses buf.find).
-        for d in self._delims:
-            i = buf.find(d, 0, None)
-            if i == -1:
-                continue
-            if best_pos is None or i < best_pos:
-                best_pos = i
-                best_delim = d
-                if not best_pos:
-                    # Can't beat position 0; still need to choose longest at this position.
-                    pass
-            elif i == best_pos and best_delim is not None and len(d) > len(best_delim):
-                best_delim = d
-
-        if best_pos is None or best_delim is None:
-            return None
+        if isinstance(buf, ScanningByteStreamBuffer):
+            pos, i = buf.find_longest(self._delims_by_len)
+        else:
+            pos, i = find_longest(buf.segments(), self._delims_by_len)
 
-        # Second pass: at that position, choose the longest delimiter that actually matches there. (We can't just rely
-        # on "which delimiter found it first" when overlaps exist.)
-        pos = best_pos
-        for d in self._delims_by_len:
-            if pos + len(d) > ln:
-                continue
-            if buf.find(d, pos, pos + len(d)) == pos:
-                return pos, d
+        if pos < 0:
+            return None
 
-        # Shouldn't happen: best_pos came from some delimiter occurrence.
-        return pos, best_delim
+        return pos, self._delims_by_len[i]
 
     def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
         """
@@ -242,7 +230,9 @@ class LengthFieldByteStreamFrameDecoder:
 
     Notes:
       - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
-      - It relies on `buf.coalesce(n)` for efficient header parsing in pure Python.
+      - Every complete frame laid out in the buffer's first contiguous segment is found in a single pass with
+        `scanning.scan_length_fields` - natively when the `_scanning` extension is available. It only relies on
+        `buf.coalesce(n)` for headers which span segments.
       - It does not require async/await and is suitable for pipeline-style codecs.
     """
 
@@ -300,16 +290,11 @@ class LengthFieldByteStreamFrameDecoder:
 
             # Read header up through the length field contiguously.
             # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
-            mv = buf.coalesce(self._end_off)
+            mv = buf.peek()
             if len(mv) < self._end_off:
-                # Defensive: coalesce contract.
-                return out
-
-            # Copy just the length field bytes (1/2/4/8) so we can safely mutate the buffer afterward.
-            lf_bytes = bytes(mv[self._off:self._end_off])
-            # del mv
+                mv = buf.coalesce(self._end_off)
 
-            length_val = int.from_bytes(lf_bytes, self._byteorder, signed=False)
+            length_val = int.from_bytes(mv[self._off:self._end_off], self._byteorder, signed=False)
 
             total_len = length_val + self._adj + self._end_off
             if total_len < 0:
@@ -327,13 +312,28 @@ class LengthFieldByteStreamFrameDecoder:
                     )
                 return out
 
-            # We have a complete frame available.
-            if self._strip:
-                if self._strip > total_len:
-                    raise ValueError('initial_bytes_to_strip > frame length')
-                buf.advance(self._strip)
-                total_len -= self._strip
-
-            out.append(buf.split_to(total_len))
+            # If the segment holds more than this frame, pick up every complete frame laid out in it in one pass.
+            if len(mv) - total_len >= self._end_off:
+                lens = scan_length_fields(
+                    mv,
+                    self._off,
+                    self._llen,
+                    self._byteorder,
+                    self._adj,
+                    self._max,
+                ) or [total_len]
+            else:
+                lens = [total_len]
+            del mv
+
+            # We have complete frames available.
+            for total_len in lens:
+                if self._strip:
+                    if self._strip > total_len:
+                        raise ValueError('initial_bytes_to_strip > frame length')
+                    buf.advance(self._strip)
+                    total_len -= self._strip
+
+                out.append(buf.split_to(total_len))
 
             # Loop for additional frames
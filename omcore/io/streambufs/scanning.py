@@ -1,13 +1,29 @@
-# ruff: noqa: UP045
+# ruff: noqa: UP006 UP007 UP045
 # @om-lite
 import typing as ta
 
 from ...lite.bytes import BytesLike
+from ._scanning_py import find_longest
+from ._scanning_py import scan_length_fields  # noqa
 from .base import BaseByteStreamBufferLike
 from .types import ByteStreamBufferView
 from .types import MutableByteStreamBuffer
 
 
+_scanning: ta.Any
+try:
+    from . import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
+if _scanning is not None:
+    globals().update({a: getattr(_scanning, a) for a in [
+        'find_longest',
+        'scan_length_fields',
+    ]})
+
+
 ##
 
 
@@ -32,7 +48,7 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
         super().__init__()
 
         self._buf = buf
-        self._scan_from_by_sub: dict[bytes, int] = {}
+        self._scan_from_by_sub: ta.Dict[ta.Union[bytes, ta.Tuple[bytes, ...]], int] = {}
 
     @property
     def max_size(self) -> ta.Optional[int]:
@@ -85,6 +101,28 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
 
         return i
 
+    def find_longest(self, subs: ta.Sequence[bytes]) -> ta.Tuple[int, int]:
+        """
+        Returns the position of the earliest occurrence of any of `subs`, and the index of the first of `subs` which
+        occurs there - so ordering `subs` longest first picks the longest match - or (-1, -1). Searches all of the
+        buffer's segments in a single pass, natively when the `_scanning` extension is available, and caches negative
+        progress per `subs` just as `find` does per `sub`.
+        """
+
+        key = tuple(subs)
+        scan_from = self._scan_from_by_sub.get(key, 0)
+
+        # Allow overlap so a match spanning old/new boundary is discoverable.
+        eff_start = scan_from - (max(map(len, key), default=1) - 1)
+        if eff_start < 0:
+            eff_start = 0
+
+        ret = find_longest(self._buf.segments(), key, eff_start)
+        if ret[0] < 0:
+            self._scan_from_by_sub[key] = len(self._buf)
+
+        return ret
+
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         # rfind isn't the typical trickle hot-path; delegate.
         return self._buf.rfind(sub, start, end)
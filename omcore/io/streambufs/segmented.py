@@ -1,5 +1,7 @@
 # ruff: noqa: UP006 UP007 UP037 UP045
 # @om-lite
+import bisect
+import collections
 import typing as ta
 
 from ...lite.bytes import Bytes
@@ -74,9 +76,13 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     """
     A segmented, consumption-oriented bytes buffer.
 
-    Internally stores a list of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
+    Internally stores a deque of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
     segments without copying.
 
+    Alongside the segments it keeps a parallel deque of their cumulative end offsets, in an 'absolute' coordinate space
+    which only ever shifts by whole prepends - so consuming from the head is a `popleft` of each, and locating the
+    segment holding any position is a bisect rather than a walk.
+
     Optional "chunked writes":
       - If chunk_size > 0, small writes are accumulated into a lazily-allocated active bytearray "chunk" up to
         chunk_size.
@@ -108,7 +114,11 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     ) -> None:
         super().__init__()
 
-        self._segs: ta.List[Bytes] = []
+        self._segs: collections.deque[Bytes] = collections.deque()
+
+        # Absolute offset of the end of each segment's readable bytes. The active chunk, always last when present, ends
+        # at its used bytes.
+        self._ends: collections.deque[int] = collections.deque()
 
         self._max_size = None if max_size is None else int(max_size)
 
@@ -127,6 +137,9 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def max_size(self) -> ta.Optional[int]:
         return self._max_size
 
+    # Absolute offset of the first segment's first byte - or, with no segments, of the next byte to be written.
+    _base = 0
+
     _head_off = 0
     _len = 0
 
@@ -139,34 +152,61 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def __len__(self) -> int:
         return self._len
 
-    def _active_readable_len(self) -> int:
-        if self._active is None:
-            return 0
-        if self._reserved_in_active and self._reserved is not None:
-            tail = self._reserved_len
-        else:
-            tail = 0
-        rl = self._active_used - tail
-        return rl if rl > 0 else 0
+    def _append_seg(self, s: Bytes, n: int) -> None:
+        self._ends.append((self._ends[-1] if self._ends else self._base) + n)
+        self._segs.append(s)
+
+    def _popleft_seg(self) -> Bytes:
+        s = self._segs.popleft()
+        self._base = self._ends.popleft()
+        self._head_off = 0
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
+        return s
+
+    def _seg_start(self, i: int) -> int:
+        """Absolute offset of segment `i`'s first byte, whether or not it is still readable."""
+
+        return self._ends[i - 1] if i else self._base
+
+    def _seg_index(self, a: int) -> int:
+        """Index of the segment holding absolute offset `a`, which must be readable."""
+
+        return bisect.bisect_right(self._ends, a)
+
+    def _gather(self, i: int, a: int, n: int, stop: int) -> Bytes:
+        """Copies up to `n` bytes from absolute offset `a` - in segment `i` - onward, stopping before `stop`."""
+
+        if (e := a + n) > stop:
+            e = stop
+        if a >= e:
+            return b''
+
+        segs = self._segs
+        ends = self._ends
+        s0 = self._seg_start(i)
+        if e <= ends[i]:
+            return segs[i][a - s0:e - s0]
+
+        parts: ta.List[Bytes] = []
+        while a < e:
+            se = ends[i]
+            parts.append(segs[i][a - s0:(se if se < e else e) - s0])
+            a = s0 = se
+            i += 1
+        return b''.join(parts)
+
+    #
 
     def peek(self) -> memoryview:
         if not self._segs:
             return memoryview(b'')
 
-        s0 = self._segs[0]
-        mv = memoryview(s0)
-        if self._head_off:
-            mv = mv[self._head_off:]
-
-        if s0 is self._active:
-            # Active is only meaningful by _active_used, not len(bytearray).
-            rl = self._active_readable_len()
-            if self._head_off >= rl:
-                return memoryview(b'')
-            mv = memoryview(self._active)[self._head_off:rl]
-            return mv
-
-        return mv
+        off = self._head_off
+        if off >= (e := self._ends[0] - self._base):
+            return memoryview(b'')
+        return memoryview(self._segs[0])[off:e]
 
     def segments(self) -> ta.Sequence[memoryview]:
         if not self._segs:
@@ -174,28 +214,14 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         out: ta.List[memoryview] = []
 
-        last_i = len(self._segs) - 1
-        for i, s in enumerate(self._segs):
-            if s is self._active and i == last_i:
-                # Active chunk: create fresh view with readable length.
-                rl = self._active_readable_len()
-                if not i:
-                    # Active is also first segment; apply head_off.
-                    if self._head_off >= rl:
-                        continue
-                    mv = memoryview(self._active)[self._head_off:rl]
-                else:
-                    if rl <= 0:
-                        continue
-                    mv = memoryview(self._active)[:rl]
-            else:
-                # Non-active segment.
-                mv = memoryview(s)
-                if not i and self._head_off:
-                    mv = mv[self._head_off:]
-
-            if len(mv):
-                out.append(mv)
+        s0 = self._base
+        off = self._head_off
+        for s, e in zip(self._segs, self._ends):
+            rl = e - s0
+            if off < rl:
+                out.append(memoryview(s)[off:rl] if off or rl != len(s) else memoryview(s))
+            s0 = e
+            off = 0
 
         return out
 
@@ -208,7 +234,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         a = self._active
         if a is None:
             a = bytearray(self._chunk_size)  # fixed capacity
-            self._segs.append(a)
+            self._append_seg(a, 0)
             self._active = a
             self._active_used = 0
 
@@ -221,9 +247,15 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._reserved_in_active:
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
-        if (used := self._active_used) <= 0:
+        if (used := self._active_used) <= 0 or (len(self._segs) == 1 and self._segs[0] is a and self._head_off >= used):
+            # Nothing readable is left in it - including when everything written to it has since been consumed, in
+            # which case it is simply dropped rather than compacted.
             if self._segs and self._segs[-1] is a:
                 self._segs.pop()
+                e = self._ends.pop()
+                if not self._segs:
+                    self._base = e
+                    self._head_off = 0
             self._active = None
             self._active_used = 0
             return
@@ -250,19 +282,19 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def write(self, data: BytesLike, /) -> None:
         if not data:
             return
-        if isinstance(data, memoryview):
-            data = memoryview_to_bytes(data)  # noqa
-        # elif isinstance(data, bytearray):
-        #     pass
-        # else:
-        #     pass
 
+        # Memoryviews are only materialized when kept as their own segment - those small enough to be copied into the
+        # active chunk are copied straight from the view.
         dl = len(data)
 
         if self._max_size is not None and self._len + dl > self._max_size:
             raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size')
 
         if self._chunk_size <= 0:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
+            ends = self._ends
+            ends.append((ends[-1] if ends else self._base) + dl)
             self._segs.append(data)
             self._len += dl
             return
@@ -271,8 +303,10 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
         if dl >= self._chunk_size:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
             self._flush_active()
-            self._segs.append(data)
+            self._append_seg(data, dl)
             self._len += dl
             return
 
@@ -284,6 +318,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         # Copy into fixed-capacity buffer; do not resize.
         memoryview(a)[self._active_used:self._active_used + dl] = data
         self._active_used += dl
+        self._ends[-1] += dl
         self._len += dl
 
     def prepend(self, data: BytesLike, /) -> None:
@@ -300,20 +335,25 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._head_off:
             s0 = self._segs[0]
             if s0 is self._active:
+                # The active chunk is always last, so here it is also the only segment.
                 if self._reserved_in_active:
                     raise OutstandingReserveByteStreamBufferError('outstanding reserve')
-                rl = self._active_readable_len()
-                if self._head_off < rl:
-                    self._segs[0] = memoryview_to_bytes(memoryview(self._active)[self._head_off:rl])
+                if self._head_off < self._active_used:
+                    self._segs[0] = memoryview_to_bytes(memoryview(s0)[self._head_off:self._active_used])
+                    self._base += self._head_off
+                    self._head_off = 0
                 else:
-                    self._segs.pop(0)
+                    self._popleft_seg()
                 self._active = None
                 self._active_used = 0
             else:
                 self._segs[0] = s0[self._head_off:]
-            self._head_off = 0
+                self._base += self._head_off
+                self._head_off = 0
 
-        self._segs.insert(0, data)
+        self._segs.appendleft(data)
+        self._ends.appendleft(self._base)
+        self._base -= dl
         self._len += dl
 
     def reserve(self, n: int, /) -> memoryview:
@@ -367,6 +407,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
             if n:
                 self._active_used += n
+                self._ends[-1] += n
                 self._len += n
 
             # Keep active for reuse.
@@ -385,15 +426,32 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             return
 
         if n == len(b):
-            self._segs.append(b)
+            self._append_seg(b, n)
             self._len += n
         else:
             bb = memoryview_to_bytes(memoryview(b)[:n])
-            self._segs.append(bb)
+            self._append_seg(bb, n)
             self._len += n
 
     #
 
+    def _keep_consumed_active(self) -> bool:
+        """
+        Called when the first segment has just been fully consumed. If it is the active chunk and has spare capacity it
+        is kept, with the head offset past its used bytes, so further writes and reserves keep filling it rather than
+        allocating a new chunk. Consumed bytes are never overwritten, so views of them previously handed out stay valid.
+        It is always kept while a reservation is outstanding in it.
+        """
+
+        if self._segs[0] is not self._active or (
+                not self._reserved_in_active and
+                self._active_used >= self._chunk_size
+        ):
+            return False
+
+        self._head_off = self._active_used
+        return True
+
     def advance(self, n: int, /) -> None:
         if n < 0 or n > self._len:
             raise ValueError(n)
@@ -402,35 +460,20 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         self._len -= n
 
-        while n and self._segs:
-            s0 = self._segs[0]
-
-            if s0 is self._active:
-                avail0 = self._active_readable_len() - self._head_off
-            else:
-                avail0 = len(s0) - self._head_off
-
-            if avail0 <= 0:
-                popped = self._segs.pop(0)
-                if popped is self._active:
-                    self._active = None
-                    self._active_used = 0
-                self._head_off = 0
-                continue
-
-            if n < avail0:
-                self._head_off += n
-                return
-
-            n -= avail0
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        # Pop every segment ending at or before the new head, then land the head offset in the one after.
+        a = self._base + self._head_off + n
+        segs = self._segs
+        ends = self._ends
+        while ends and ends[0] <= a:
+            if segs[0] is self._active:
+                if self._keep_consumed_active():
+                    return
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            self._base = ends.popleft()
 
-        if n:
-            raise RuntimeError(n)
+        self._head_off = a - self._base
 
     def split_to(self, n: int, /) -> ByteStreamBufferView:
         if n < 0 or n > self._len:
@@ -438,40 +481,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if not n:
             return _EMPTY_DIRECT_BYTE_STREAM_BUFFER_VIEW
 
-        out: ta.List[memoryview] = []
-        rem = n
+        self._len -= n
 
-        while rem:
-            if not self._segs:
-                raise RuntimeError(rem)
+        b0 = self._base
+        a = b0 + self._head_off
+        e = a + n
+        segs = self._segs
+        ends = self._ends
 
-            s0 = self._segs[0]
+        # Fast path: entirely within a first segment which is not exhausted.
+        if e < ends[0]:
+            self._head_off += n
+            return DirectByteStreamBufferView(memoryview(segs[0])[a - b0:e - b0])
 
-            if s0 is self._active:
-                rl = self._active_readable_len()
-                if self._head_off >= rl:
-                    raise RuntimeError(rem)
-                mv0 = memoryview(s0)[self._head_off:rl]
-            else:
-                mv0 = memoryview(s0)
-                if self._head_off:
-                    mv0 = mv0[self._head_off:]
-
-            if rem < len(mv0):
-                out.append(mv0[:rem])
-                self._head_off += rem
-                self._len -= n
-                return byte_stream_buffer_view_from_segments(out)
-
-            out.append(mv0)
-            rem -= len(mv0)
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        out: ta.List[memoryview] = []
+        active = self._active
+        while ends and (se := ends[0]) <= e:
+            s = segs[0]
+            if a < se:
+                out.append(memoryview(s)[a - b0:se - b0])
+            a = se
+            if s is active:
+                self._base = b0
+                if self._keep_consumed_active():
+                    return byte_stream_buffer_view_from_segments(out)
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            b0 = ends.popleft()
+
+        self._base = b0
+        if a < e:
+            out.append(memoryview(segs[0])[:e - b0])
+        self._head_off = e - b0
 
-        self._len -= n
         return byte_stream_buffer_view_from_segments(out)
 
     def coalesce(self, n: int, /) -> memoryview:
@@ -489,114 +532,41 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if len(mv0) >= n:
             return mv0[:n]
 
-        out = bytearray(n)
-        w = 0
-
-        new_segs: ta.List[Bytes] = []
-
-        seg_i = 0
-        while w < n and seg_i < len(self._segs):
-            s = self._segs[seg_i]
-            off = self._head_off if not seg_i else 0
-
-            seg_len = len(s) - off
-            if s is self._active and seg_i == (len(self._segs) - 1):
-                seg_len = self._active_readable_len() - off
-
-            if seg_len <= 0:
-                seg_i += 1
-                continue
-
-            take = n - w
-            if take > seg_len:
-                take = seg_len
-
-            out[w:w + take] = memoryview(s)[off:off + take]
-            w += take
-
-            if take < seg_len:
-                rem = s[off + take:off + seg_len]
-                if rem:
-                    new_segs.append(rem)
-                seg_i += 1
-                break
-
-            seg_i += 1
-
-        if seg_i < len(self._segs):
-            new_segs.extend(self._segs[seg_i:])
+        # Copy the first n readable bytes into a single new segment replacing those they span, keeping what remains of
+        # the last of them as its own segment. The active chunk is always last, so only that one can be it.
+        segs = self._segs
+        ends = self._ends
+        b0 = self._base
+        a0 = a = b0 + self._head_off
+        e = a + n
+
+        parts: ta.List[Bytes] = []
+        while (se := ends[0]) < e:
+            parts.append(segs.popleft()[a - b0:se - b0])
+            ends.popleft()
+            a = b0 = se
+
+        s = segs[0]
+        parts.append(s[a - b0:e - b0])
+        out = b''.join(parts)
+
+        if e < se:
+            segs[0] = memoryview_to_bytes(memoryview(s)[e - b0:se - b0]) if s is self._active else s[e - b0:se - b0]
+        else:
+            segs.popleft()
+            ends.popleft()
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
 
-        self._segs = [bytes(out), *new_segs]
+        segs.appendleft(out)
+        ends.appendleft(e)
+        self._base = a0
         self._head_off = 0
 
-        self._active = None
-        self._active_used = 0
-
-        return memoryview(self._segs[0])[:n]
-
-    def _seg_readable_slice(
-            self,
-            si: int,
-            s: Bytes,
-            last_i: int,
-    ) -> ta.Tuple[int, int]:
-        """
-        Compute the readable offset and length for segment at index si.
-
-        Returns (offset, readable_len) where:
-          - offset: byte offset into segment (head_off for si==0, else 0)
-          - readable_len: number of readable bytes from offset (0 if segment empty/consumed)
-
-        Handles head offset for first segment and active chunk readable length for last segment.
-        """
-
-        off = self._head_off if not si else 0
-        seg_len = len(s) - off
-        if s is self._active and si == last_i:
-            seg_len = self._active_readable_len() - off
-        return off, max(0, seg_len)
-
-    def _seg_search_range(
-            self,
-            start: int,
-            limit: int,
-            m: int,
-            seg_gs: int,
-            seg_ge: int,
-            seg_len: int,
-    ) -> ta.Optional[ta.Tuple[int, int]]:
-        """
-        Compute local search range within a segment.
-
-        Args:
-            start: global start position (user-provided)
-            limit: global limit (end - m, last valid position where match can start)
-            m: pattern length
-            seg_gs: segment global start position
-            seg_ge: segment global end position
-            seg_len: segment readable length
-
-        Returns (local_start, local_end) if segment overlaps search range, else None.
-          - local_start: offset within segment to start searching
-          - local_end: offset within segment to end searching (exclusive)
-        """
-
-        # Check if segment overlaps search range
-        if limit < seg_gs or start >= seg_ge:
-            return None
-
-        # Compute local start within segment
-        ls = max(0, start - seg_gs)
-
-        # Compute local end: can start match anywhere up to limit, need m bytes
-        max_start_in_seg = limit - seg_gs
-        end_search = min(max_start_in_seg + m, seg_len)
+        return memoryview(out)
 
-        # Validate range
-        if ls >= end_search:
-            return None
-
-        return ls, end_search
+    #
 
     def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -607,57 +577,42 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        tail: Bytes = b''
-        tail_gstart = 0
-
-        gpos = 0
-
-        last_i = len(self._segs) - 1
-
-        for si, s in enumerate(self._segs):
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = gpos
-            seg_ge = gpos + seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.find(sub, off + ls, off + end_search)
-                if idx != -1:
-                    return seg_gs + (idx - off)
-
-            if m > 1 and tail:
-                head_need = m - 1
-                # Only read as many bytes as are actually available in this segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, seg_len)
-                if head_avail > 0:
-                    head = s[off:off + head_avail]
-                    comb = tail + head
-                    j = comb.find(sub)
-                    if j != -1 and j < len(tail) < j + m:
-                        cand = tail_gstart + j
-                        if start <= cand <= limit:
-                            return cand
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-            if m > 1:
-                take = m - 1
-                if seg_len >= take:
-                    tail = s[off + seg_len - take:off + seg_len]
-                    tail_gstart = seg_ge - take
-                else:
-                    tail = (tail + s[off:off + seg_len])[-(m - 1):]
-                    tail_gstart = seg_ge - len(tail)
+        # Everything below is in absolute offsets: o is that of position 0, and a match must lie within [a, e).
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
+
+        i = self._seg_index(a)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
 
-            gpos = seg_ge
+            # Matches lying wholly within this segment.
+            hi = se if se < e else e
+            if hi - a >= m and (j := s.find(sub, a - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-        return -1
+            if se >= e:
+                return -1
+
+            # Matches starting within this segment's last m - 1 bytes and running on into the following ones - only
+            # those bytes and the next m - 1 need be searched, and only if the former hold the first byte of sub.
+            if m > 1:
+                t = se - m + 1
+                if t < a:
+                    t = a
+                if s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.find(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
+
+            a = s0 = se
+            i += 1
 
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -668,89 +623,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        if not self._segs:
-            return -1
-
-        best = -1
-
-        seg_ge = self._len
-        prev_s: ta.Optional[Bytes] = None
-        prev_off = 0
-        prev_seg_len = 0
-
-        last_i = len(self._segs) - 1
-
-        for si in range(len(self._segs) - 1, -1, -1):
-            s = self._segs[si]
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = seg_ge - seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.rfind(sub, off + ls, off + end_search)
-                if idx != -1:
-                    cand = seg_gs + (idx - off)
-                    if cand > best:
-                        best = cand
-
-            if m > 1 and prev_s is not None:
-                tail_need = m - 1
-                if seg_len >= tail_need:
-                    tail = s[off + seg_len - tail_need:off + seg_len]
-                    tail_gstart = seg_ge - tail_need
-
-                else:
-                    tail_parts = [s[off:off + seg_len]]
-                    tail_len = seg_len
-                    for sj in range(si - 1, -1, -1):
-                        if tail_len >= tail_need:
-                            break
-
-                        sj_s = self._segs[sj]
-                        sj_off, sj_len = self._seg_readable_slice(sj, sj_s, last_i)
-                        if sj_len <= 0:
-                            continue
-
-                        take = min(tail_need - tail_len, sj_len)
-                        tail_parts.insert(0, sj_s[sj_off + sj_len - take:sj_off + sj_len])
-                        tail_len += take
-
-                    tail_combined = b''.join(tail_parts)
-                    tail = tail_combined[-(m - 1):] if len(tail_combined) >= m - 1 else tail_combined
-                    tail_gstart = seg_ge - len(tail)
-
-                head_need = m - 1
-                # Only read as many bytes as are actually available in prev segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, prev_seg_len)
-                if head_avail > 0:
-                    head = prev_s[prev_off:prev_off + head_avail]
-                else:
-                    head = b''
-
-                comb = tail + head
-                j = comb.rfind(sub)
-                if j != -1 and j < len(tail) < j + m:
-                    cand = tail_gstart + j
-                    if start <= cand <= limit and cand > best:
-                        best = cand
-
-            if best >= seg_gs:
-                return best
-
-            prev_s = s
-            prev_off = off
-            prev_seg_len = seg_len
-            seg_ge = seg_gs
-
-        return best
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
+
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
+
+        i = self._seg_index(e - 1)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
+            lo = a if a > s0 else s0
+
+            # Matches running on past this segment start later than any lying wholly within it, so are searched first.
+            if m > 1 and se < e:
+                t = se - m + 1
+                if t < lo:
+                    t = lo
+                if t < se and s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.rfind(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
+
+            hi = se if se < e else e
+            if hi - lo >= m and (j := s.rfind(sub, lo - s0, hi - s0)) >= 0:
+                return s0 + j - o
+
+            if s0 <= a or not i:
+                return -1
+
+            i -= 1
+            s0 = self._seg_start(i)
 
 
 ##
@@ -0,0 +1,116 @@
+"""
+Frames decoded per second by the framing decoders over `SegmentedByteStreamBuffer`s fed in many small writes - which is
+what keepalive HTTP traffic trickling in off of sockets looks like - plus the raw searches and consumption they sit on.
+"""
+import struct
+import time
+import typing as ta
+
+from ...framing import LengthFieldByteStreamFrameDecoder
+from ...framing import LongestMatchDelimiterByteStreamFrameDecoder
+from ...scanning import ScanningByteStreamBuffer
+from ...segmented import SegmentedByteStreamBuffer
+
+
+_REQUEST = (
+    b'GET /api/v1/items?limit=10 HTTP/1.1\r\n'
+    b'Host: api.example.com\r\n'
+    b'User-Agent: curl/8.5.0\r\n'
+    b'Accept: */*\r\n'
+    b'Connection: keep-alive\r\n'
+    b'\r\n'
+)
+
+
+def _pieces(data: bytes, n: int) -> list[bytes]:
+    return [data[i:i + n] for i in range(0, len(data), n)]
+
+
+def _bench_lines(
+        pieces: ta.Sequence[bytes],
+        delims: ta.Sequence[bytes],
+        new_buf: ta.Callable[[], ta.Any],
+        n: int,
+) -> float:
+    dec = LongestMatchDelimiterByteStreamFrameDecoder(delims)
+    buf = new_buf()
+    num = 0
+    start = time.perf_counter()
+    for _ in range(n):
+        for p in pieces:
+            buf.write(p)
+            num += len(dec.decode(buf))
+    return num / (time.perf_counter() - start)
+
+
+def _bench_length(pieces: ta.Sequence[bytes], n: int) -> float:
+    dec = LengthFieldByteStreamFrameDecoder()
+    buf = SegmentedByteStreamBuffer()
+    num = 0
+    start = time.perf_counter()
+    for _ in range(n):
+        for p in pieces:
+            buf.write(p)
+            num += len(dec.decode(buf))
+    return num / (time.perf_counter() - start)
+
+
+def _bench_search(num_segs: int, n: int) -> float:
+    buf = SegmentedByteStreamBuffer()
+    for _ in range(num_segs):
+        buf.write(b'abcdefgh')
+    buf.write(b'\r\n')
+    half = len(buf) // 2
+    start = time.perf_counter()
+    for _ in range(n):
+        buf.find(b'\r\n', half)
+        buf.rfind(b'ab', 0, half)
+    return n / (time.perf_counter() - start)
+
+
+def _bench_consume(num_segs: int, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        buf = SegmentedByteStreamBuffer()
+        for _ in range(num_segs):
+            buf.write(b'abcdefgh')
+        while len(buf) > 12:
+            buf.split_to(12)
+    return n * num_segs / (time.perf_counter() - start)
+
+
+def _main() -> None:
+    n = 2_000
+
+    for dn, delims in [
+        ('crlf', [b'\r\n']),
+        ('any eol', [b'\r', b'\n', b'\r\n']),
+    ]:
+        for sz in [8, 64]:
+            pieces = _pieces(_REQUEST * 4, sz)
+            for name, new_buf in [
+                ('segmented', SegmentedByteStreamBuffer),
+                ('segmented+chunked', lambda: SegmentedByteStreamBuffer(chunk_size=4096)),
+                ('scanning', lambda: ScanningByteStreamBuffer(SegmentedByteStreamBuffer())),
+            ]:
+                _bench_lines(pieces, delims, new_buf, n // 10)
+                fps = _bench_lines(pieces, delims, new_buf, n)
+                print(f'lines ({dn}) {sz}b writes {name}: {fps:_.0f} frames/s')
+
+    frames = b''.join(struct.pack('>I', len(p)) + p for p in _pieces(_REQUEST, 20))
+    for sz in [3, 16]:
+        pieces = _pieces(frames, sz)
+        _bench_length(pieces, n // 10)
+        fps = _bench_length(pieces, n)
+        print(f'length-field {sz}b writes: {fps:_.0f} frames/s')
+
+    for num_segs in [16, 1024]:
+        ops = _bench_search(num_segs, n * 5)
+        print(f'find+rfind over {num_segs} segments: {ops:_.0f} ops/s')
+
+        sps = _bench_consume(num_segs, max(n * 16 // num_segs, 1))
+        print(f'split_to over {num_segs} segments: {sps:_.0f} segments/s')
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,5 +1,7 @@
-# ruff: noqa: PT009 PT027
+# ruff: noqa: PT009 PT027 UP006
 # @om-lite
+import random
+import re
 import typing as ta
 import unittest
 
@@ -8,6 +10,7 @@ from ..errors import FrameTooLargeByteStreamBufferError
 from ..framing import LengthFieldByteStreamFrameDecoder
 from ..framing import LongestMatchDelimiterByteStreamFrameDecoder
 from ..linear import LinearByteStreamBuffer
+from ..scanning import ScanningByteStreamBuffer
 from ..segmented import SegmentedByteStreamBuffer
 
 
@@ -91,6 +94,26 @@ class TestLongestMatchDelimiterByteStreamFramer(unittest.TestCase):
         with self.assertRaises(FrameTooLargeByteStreamBufferError):
             f.decode(b2)
 
+    def test_random_writes(self) -> None:
+        rnd = random.Random(0)
+        for _ in range(200):
+            data = bytes(rnd.choice(b'ab\r\n') for _ in range(rnd.randrange(300)))
+            expected = re.split(rb'\r\n|\r|\n', data)[:-1]
+
+            f = LongestMatchDelimiterByteStreamFrameDecoder([b'\r', b'\n', b'\r\n'])
+            b = ScanningByteStreamBuffer(SegmentedByteStreamBuffer(chunk_size=rnd.choice([0, 16, 4096])))
+
+            out: ta.List[bytes] = []
+            i = 0
+            while i < len(data):
+                n = rnd.randrange(1, 10)
+                b.write(data[i:i + n])
+                i += n
+                out.extend(_view_bytes(v) for v in f.decode(b))
+            out.extend(_view_bytes(v) for v in f.decode(b, final=True))
+
+            self.assertEqual(out, expected)
+
 
 class TestLengthFieldFrameDecoder(unittest.TestCase):
     def test_basic_u32_be_two_frames_segmented(self) -> None:
@@ -218,3 +241,28 @@ class TestLengthFieldFrameDecoder(unittest.TestCase):
         v = out[0]
         self.assertEqual(v.to_bytes() if hasattr(v, 'to_bytes') else v.tobytes(), b'data')
         self.assertEqual(len(b), 0)
+
+    def test_random_writes(self) -> None:
+        rnd = random.Random(0)
+        for _ in range(200):
+            payloads = [bytes(rnd.randrange(256) for _ in range(rnd.randrange(20))) for _ in range(rnd.randrange(20))]
+            data = b''.join(len(p).to_bytes(2, 'little') + b'h' + p for p in payloads)
+
+            dec = LengthFieldByteStreamFrameDecoder(
+                length_field_length=2,
+                byteorder='little',
+                length_adjustment=1,
+                initial_bytes_to_strip=3,
+            )
+            b = SegmentedByteStreamBuffer(chunk_size=rnd.choice([0, 16, 4096]))
+
+            out: ta.List[bytes] = []
+            i = 0
+            while i < len(data):
+                n = rnd.randrange(1, 40)
+                b.write(data[i:i + n])
+                i += n
+                out.extend(_view_bytes(v) for v in dec.decode(b))
+
+            self.assertEqual(out, payloads)
+            self.assertEqual(len(b), 0)
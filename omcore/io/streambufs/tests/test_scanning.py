@@ -1,12 +1,20 @@
-# ruff: noqa: PT009 PT027 RUF007 UP045
+# ruff: noqa: PT009 PT027 RUF007 UP006 UP045
 # @om-lite
+import random
 import typing as ta
 import unittest
 
+from .. import _scanning_py
 from ..scanning import ScanningByteStreamBuffer
 from ..segmented import SegmentedByteStreamBuffer
 
 
+try:
+    from .. import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
 class _SpyFindSegmentedByteStreamBuffer:
     """Test helper: wraps a SegmentedByteStreamBuffer and records find() calls."""
 
@@ -115,3 +123,145 @@ class TestScanningByteStreamBuffer(unittest.TestCase):
         fb.write(b'abcabcabc')
         self.assertEqual(fb.find(b'abc', 3, None), 3)
         self.assertEqual(fb.find(b'abc', 4, None), 6)
+
+    def test_find_longest_resumes(self) -> None:
+        spy = _SpyFindSegmentedByteStreamBuffer()
+        fb = ScanningByteStreamBuffer(spy)
+
+        delims = (b'\r\n', b'\r', b'\n')
+        for _ in range(20):
+            fb.write(b'a')
+            self.assertEqual(fb.find_longest(delims), (-1, -1))
+        self.assertEqual(fb._scan_from_by_sub[delims], 20)  # noqa
+
+        fb.write(b'\r')
+        self.assertEqual(fb.find_longest(delims), (20, 1))
+        fb.write(b'\n')
+        self.assertEqual(fb.find_longest(delims), (20, 0))
+
+        fb.advance(22)
+        self.assertNotIn(delims, fb._scan_from_by_sub)  # noqa
+        fb.write(b'bb\n')
+        self.assertEqual(fb.find_longest(delims), (2, 2))
+
+
+##
+
+
+def _naive_find_longest(data: bytes, subs: ta.Sequence[bytes], start: int) -> ta.Tuple[int, int]:
+    for p in range(max(start, 0), len(data)):
+        for i, s in enumerate(subs):
+            if data.startswith(s, p):
+                return p, i
+    return -1, -1
+
+
+def _naive_scan_length_fields(
+        data: bytes,
+        offset: int,
+        length: int,
+        byteorder: ta.Literal['big', 'little'],
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    out: ta.List[int] = []
+    while len(data) >= offset + length:
+        t = int.from_bytes(data[offset:offset + length], byteorder) + adjustment + offset + length
+        if t < offset + length or t > len(data) or (limit is not None and t > limit):
+            break
+        out.append(t)
+        data = data[t:]
+    return out
+
+
+def _random_segments(rnd: random.Random, data: bytes) -> ta.List[memoryview]:
+    segs: ta.List[memoryview] = []
+    i = 0
+    while i < len(data):
+        n = rnd.choice([0, 1, 1, 2, 3, 5, 8, 64])
+        segs.append(memoryview(data[i:i + n]))
+        i += n
+    return segs
+
+
+class _BaseScanningImplTests:
+    impl: ta.Any
+
+    def test_find_longest(self) -> None:
+        rnd = random.Random(1)
+        for _ in range(2000):
+            alpha = rnd.choice([b'ab', b'abc\r\n', b'\r\n', b'\x00\xff'])
+            data = bytes(rnd.choice(alpha) for _ in range(rnd.randrange(40)))
+            subs = sorted(
+                {bytes(rnd.choice(alpha) for _ in range(rnd.randrange(1, 5))) for _ in range(rnd.randrange(1, 4))},
+                key=len,
+                reverse=True,
+            )
+            start = rnd.randrange(-2, len(data) + 3)
+
+            self.assertEqual(  # type: ignore[attr-defined]
+                self.impl.find_longest(_random_segments(rnd, data), subs, start),
+                _naive_find_longest(data, subs, start),
+            )
+
+    def test_find_longest_args(self) -> None:
+        self.assertEqual(self.impl.find_longest([b'ab', bytearray(b'c\n')], [b'\n']), (3, 0))  # type: ignore
+        self.assertEqual(self.impl.find_longest([], [b'\n']), (-1, -1))  # type: ignore[attr-defined]
+        for subs in ([], [b'\n', b'']):
+            with self.assertRaises(ValueError):  # type: ignore[attr-defined]
+                self.impl.find_longest([b'a\n'], subs)
+
+    def test_scan_length_fields(self) -> None:
+        rnd = random.Random(2)
+        for _ in range(2000):
+            offset = rnd.randrange(3)
+            length = rnd.choice([1, 2, 4, 8])
+            byteorder: ta.Literal['big', 'little'] = rnd.choice(['big', 'little'])
+            adjustment = rnd.randrange(-4, 4)
+            limit = rnd.choice([None, 0, 8, 16])
+
+            data = b''
+            for _ in range(rnd.randrange(6)):
+                n = rnd.randrange(12)
+                if rnd.random() < .1:
+                    n = rnd.randrange(1 << (length * 8))
+                hdr = bytes(rnd.randrange(256) for _ in range(offset)) + n.to_bytes(length, byteorder)
+                data += hdr + bytes(rnd.randrange(256) for _ in range(min(n + adjustment, 16)))
+            data = data[:rnd.randrange(len(data) + 1)]
+
+            self.assertEqual(  # type: ignore[attr-defined]
+                self.impl.scan_length_fields(memoryview(data), offset, length, byteorder, adjustment, limit),
+                _naive_scan_length_fields(data, offset, length, byteorder, adjustment, limit),
+            )
+
+    def test_scan_length_fields_args(self) -> None:
+        for args in [(-1, 4, 'big'), (0, 3, 'big'), (0, 4, 'middle')]:
+            with self.assertRaises(ValueError):  # type: ignore[attr-defined]
+                self.impl.scan_length_fields(b'', *args, 0, None)
+
+
+class TestPyScanning(_BaseScanningImplTests, unittest.TestCase):
+    impl = _scanning_py
+
+
+@unittest.skipIf(_scanning is None, 'requires the _scanning extension')
+class TestCScanning(_BaseScanningImplTests, unittest.TestCase):
+    impl = _scanning
+
+    def test_cross_check_py(self) -> None:
+        rnd = random.Random(3)
+        for _ in range(2000):
+            data = bytes(rnd.choice(b'\r\n\x00a') for _ in range(rnd.randrange(200)))
+            subs = [b'\r\n\r\n', b'\r\n', b'\n\x00', b'\r']
+            segs = _random_segments(rnd, data)
+            start = rnd.randrange(len(data) + 1)
+            self.assertEqual(
+                _scanning.find_longest(segs, subs, start),
+                _scanning_py.find_longest(segs, subs, start),
+            )
+
+            args = (rnd.randrange(2), rnd.choice([1, 2]), rnd.choice(['big', 'little']), rnd.randrange(-2, 2), None)
+            self.assertEqual(
+                _scanning.scan_length_fields(data, *args),
+                _scanning_py.scan_length_fields(data, *args),
+            )
@@ -1,5 +1,6 @@
 # ruff: noqa: PT009 PT027
 # @om-lite
+import random
 import unittest
 
 from ..errors import BufferTooLargeByteStreamBufferError
@@ -856,3 +857,75 @@ class TestSegmentedByteStreamBufferPrepend(unittest.TestCase):
         b.write(b'world')
         b.prepend(memoryview(b'hello '))
         self.assertEqual(b''.join(bytes(mv) for mv in b.segments()), b'hello world')
+
+    def test_consumed_active_chunk_reused(self) -> None:
+        b = SegmentedByteStreamBuffer(chunk_size=16)
+        b.write(b'abcd')
+        a = b._active  # noqa: SLF001
+        v = b.split_to(4)
+        self.assertEqual(len(b), 0)
+        self.assertEqual(list(b.segments()), [])
+
+        # Further reserves keep filling the same chunk, leaving views of consumed bytes intact.
+        mv = b.reserve(4)
+        mv[:3] = b'efg'
+        b.commit(3)
+        self.assertIs(b._active, a)  # noqa: SLF001
+        self.assertEqual(b''.join(bytes(s) for s in b.segments()), b'efg')
+        self.assertEqual(v.tobytes(), b'abcd')
+
+        b.advance(3)
+        b.write(memoryview(b'hij'))
+        self.assertIs(b._active, a)  # noqa: SLF001
+        self.assertEqual(b.find(b'j'), 2)
+        self.assertEqual(b.split_to(3).tobytes(), b'hij')
+
+    def test_consumed_full_active_chunk_dropped(self) -> None:
+        b = SegmentedByteStreamBuffer(chunk_size=4)
+        b.write(b'abcd')
+        b.advance(4)
+        self.assertIsNone(b._active)  # noqa: SLF001
+        self.assertEqual(len(b._segs), 0)  # noqa: SLF001
+
+    def test_consumed_active_chunk_dropped_on_large_write(self) -> None:
+        b = SegmentedByteStreamBuffer(chunk_size=8)
+        b.write(b'abc')
+        b.advance(3)
+        b.write(b'0123456789')
+        self.assertEqual(len(b), 10)
+        self.assertEqual([bytes(s) for s in b.segments()], [b'0123456789'])
+
+
+class TestSegmentedByteStreamBufferCrossCheck(unittest.TestCase):
+    def test_random_ops_against_bytearray(self) -> None:
+        for seed in range(50):
+            rnd = random.Random(seed)
+            b = SegmentedByteStreamBuffer(chunk_size=rnd.choice([0, 4, 16]))
+            ref = bytearray()
+
+            for _ in range(100):
+                op = rnd.random()
+                if op < .4:
+                    d = bytes(rnd.choice(b'ab\r\n') for _ in range(rnd.randint(1, 12)))
+                    b.write(d)
+                    ref += d
+                elif op < .5:
+                    mv = b.reserve(n := rnd.randint(0, 12))
+                    k = rnd.randint(0, n)
+                    mv[:k] = b'a' * k
+                    b.commit(k)
+                    ref += b'a' * k
+                elif op < .7:
+                    b.advance(n := rnd.randint(0, len(ref)))
+                    del ref[:n]
+                elif op < .9:
+                    self.assertEqual(b.split_to(n := rnd.randint(0, len(ref))).tobytes(), bytes(ref[:n]))
+                    del ref[:n]
+                else:
+                    self.assertEqual(bytes(b.coalesce(n := rnd.randint(0, len(ref)))), bytes(ref[:n]))
+
+                self.assertEqual(b''.join(bytes(mv) for mv in b.segments()), bytes(ref))
+                for sub in [b'\r\n', b'a\r\na', b'\r\n\r\n', b'b']:
+                    start = rnd.randint(0, len(ref))
+                    self.assertEqual(b.find(sub, start), ref.find(sub, start))
+                    self.assertEqual(b.rfind(sub, 0, start), ref.rfind(sub, 0, start))
@@ -26,6 +26,7 @@ from .api import (  # noqa
     flush,
     refresh,
     refresh_one,
+    preload,
 
     make_query,
     as_query,
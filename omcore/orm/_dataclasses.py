@@ -592,140 +592,6 @@ def _process_dataclass__90fe5172beb2792e8eb451a4d9902225b057118d():
     return _process_dataclass
 
 
-@_register(
-    plan_repr=(
-        "Plans(tup=(CopyPlan(fields=('index', 'index_set', 'index_key', 'unindexed_where')), EqPlan(fields=('index', 'i"
-        "ndex_set', 'index_key', 'unindexed_where')), FrozenPlan(fields=('index', 'index_set', 'index_key', 'unindexed_"
-        "where'), allow_dynamic_dunder_attrs=False), HashPlan(action='add', fields=('index', 'index_set', 'index_key', "
-        "'unindexed_where'), cache=False), InitPlan(fields=(InitPlan.Field(name='index', annotation=OpRef(name='init.fi"
-        "elds.0.annotation'), default=None, default_factory=None, init=True, override=False, field_type=FieldType.INSTA"
-        "NCE, coerce=None, validate=None, check_type=None), InitPlan.Field(name='index_set', annotation=OpRef(name='ini"
-        "t.fields.1.annotation'), default=None, default_factory=None, init=True, override=False, field_type=FieldType.I"
-        "NSTANCE, coerce=None, validate=None, check_type=None), InitPlan.Field(name='index_key', annotation=OpRef(name="
-        "'init.fields.2.annotation'), default=None, default_factory=None, init=True, override=False, field_type=FieldTy"
-        "pe.INSTANCE, coerce=None, validate=None, check_type=None), InitPlan.Field(name='unindexed_where', annotation=O"
-        "pRef(name='init.fields.3.annotation'), default=None, default_factory=None, init=True, override=False, field_ty"
-        "pe=FieldType.INSTANCE, coerce=None, validate=None, check_type=None)), self_param='self', std_params=(), kw_onl"
-        "y_params=('index', 'index_set', 'index_key', 'unindexed_where'), frozen=True, slots=False, post_init_params=No"
-        "ne, init_fns=(), validate_fns=()), ReprPlan(fields=(ReprPlan.Field(name='index', kw_only=True, fn=None), ReprP"
-        "lan.Field(name='index_set', kw_only=True, fn=None), ReprPlan.Field(name='index_key', kw_only=True, fn=None), R"
-        "eprPlan.Field(name='unindexed_where', kw_only=True, fn=None)), id=False, terse=False, default_fn=None)))"
-    ),
-    plan_repr_sha1='e32ed881cda9d66068780e9cb7cd9bcf13572aaa',
-    cls_names=(
-        ('omcore.orm.inmemory', 'InMemoryStore._SelectedIndex'),
-    ),
-)
-def _process_dataclass__e32ed881cda9d66068780e9cb7cd9bcf13572aaa():
-    def _process_dataclass(
-        *,
-        __class__,
-        __dataclass__init__fields__0__annotation,
-        __dataclass__init__fields__1__annotation,
-        __dataclass__init__fields__2__annotation,
-        __dataclass__init__fields__3__annotation,
-        __dataclass__FrozenInstanceError=dataclasses.FrozenInstanceError,  # noqa
-        __dataclass__None=None,  # noqa
-        __dataclass___recursive_repr=reprlib.recursive_repr,  # noqa
-        __dataclass__object_setattr=object.__setattr__,  # noqa
-        __dataclass__set_cls_attr,
-    ):
-        def __copy__(self):
-            if self.__class__ is not __class__:
-                raise TypeError(self)
-            return __class__(  # noqa
-                index=self.index,
-                index_set=self.index_set,
-                index_key=self.index_key,
-                unindexed_where=self.unindexed_where,
-            )
-
-        __dataclass__set_cls_attr(__class__, '__copy__', __copy__, 'raise', set_qualname=True)
-
-        def __eq__(self, other):
-            if self is other:
-                return True
-            if self.__class__ is not other.__class__:
-                return NotImplemented
-            return (
-                self.index == other.index and
-                self.index_set == other.index_set and
-                self.index_key == other.index_key and
-                self.unindexed_where == other.unindexed_where
-            )
-
-        __dataclass__set_cls_attr(__class__, '__eq__', __eq__, 'raise', set_qualname=True)
-
-        __dataclass___frozen_fields = {
-            'index',
-            'index_set',
-            'index_key',
-            'unindexed_where',
-        }
-
-        def __setattr__(self, name, value):
-            if (
-                type(self) is __class__
-                or name in __dataclass___frozen_fields
-            ):
-                raise __dataclass__FrozenInstanceError(f"cannot assign to field {name!r}")
-            super(__class__, self).__setattr__(name, value)
-
-        __dataclass__set_cls_attr(__class__, '__setattr__', __setattr__, 'raise', set_qualname=True)
-
-        def __delattr__(self, name):
-            if (
-                type(self) is __class__
-                or name in __dataclass___frozen_fields
-            ):
-                raise __dataclass__FrozenInstanceError(f"cannot delete field {name!r}")
-            super(__class__, self).__delattr__(name)
-
-        __dataclass__set_cls_attr(__class__, '__delattr__', __delattr__, 'raise', set_qualname=True)
-
-        def __hash__(self):
-            return hash((
-                self.index,
-                self.index_set,
-                self.index_key,
-                self.unindexed_where,
-            ))
-
-        __dataclass__set_cls_attr(__class__, '__hash__', __hash__, 'replace', set_qualname=True)
-
-        def __init__(
-            self,
-            *,
-            index: __dataclass__init__fields__0__annotation,
-            index_set: __dataclass__init__fields__1__annotation,
-            index_key: __dataclass__init__fields__2__annotation,
-            unindexed_where: __dataclass__init__fields__3__annotation,
-        ) -> __dataclass__None:
-            __dataclass__object_setattr(self, 'index', index)
-            __dataclass__object_setattr(self, 'index_set', index_set)
-            __dataclass__object_setattr(self, 'index_key', index_key)
-            __dataclass__object_setattr(self, 'unindexed_where', unindexed_where)
-
-        __dataclass__set_cls_attr(__class__, '__init__', __init__, 'raise', set_qualname=True)
-
-        @__dataclass___recursive_repr()
-        def __repr__(self):
-            parts = []
-            parts.append(f"index={self.index!r}")
-            parts.append(f"index_set={self.index_set!r}")
-            parts.append(f"index_key={self.index_key!r}")
-            parts.append(f"unindexed_where={self.unindexed_where!r}")
-            return (
-                f"{self.__class__.__qualname__}("
-                f"{', '.join(parts)}"
-                f")"
-            )
-
-        __dataclass__set_cls_attr(__class__, '__repr__', __repr__, 'raise', set_qualname=True)
-
-    return _process_dataclass
-
-
 @_register(
     plan_repr=(
         "Plans(tup=(CopyPlan(fields=('tables',)), EqPlan(fields=('tables',)), FrozenPlan(fields=('tables',), allow_dyna"
@@ -232,6 +232,7 @@ def session(
         store: Store,
         *,
         no_auto_flush: bool = False,
+        batch_fetch_size: int | None = None,
 ) -> ta.AsyncContextManager[Session]:
     @contextlib.asynccontextmanager
     async def inner():
@@ -239,6 +240,7 @@ def session(
             registry,
             store,
             no_auto_flush=no_auto_flush,
+            batch_fetch_size=batch_fetch_size,
         ) as sess:
             async with sess.activate():
                 yield sess
@@ -288,6 +290,10 @@ async def refresh_one(obj: T) -> T:
     return obj
 
 
+async def preload(objs: ta.Iterable[ta.Any], *paths: str) -> None:
+    await active_session().preload(objs, *paths)
+
+
 #
 
 
@@ -11,6 +11,7 @@ from .indexes import Index
 from .mappers import Mapper
 from .snaps import Snap
 from .stores import Store
+from .wheres import WhereItem
 from .wheres import WhereOp
 from .wrappers import WRAPPER_TYPES
 
@@ -18,6 +19,41 @@ from .wrappers import WRAPPER_TYPES
 ##
 
 
+@ta.final
+class _MaxKey(lang.Final):
+    """Compares greater than any other value, for seeking to the end of a key prefix in a sorted index."""
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}()'
+
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+    def __hash__(self):
+        return id(self)
+
+    def __lt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return self is other
+
+    def __gt__(self, other):
+        return self is not other
+
+    def __ge__(self, other):
+        return True
+
+
+_MAX_KEY = _MaxKey()
+
+
+##
+
+
 class InMemoryStore(Store):
     def __init__(self) -> None:
         super().__init__()
@@ -86,50 +122,6 @@ class InMemoryStore(Store):
 
     #
 
-    @dc.dataclass(frozen=True, kw_only=True)
-    class _SelectedIndex:
-        index: Index
-        index_set: frozenset[str]
-        index_key: tuple[ta.Any, ...]
-        unindexed_where: ta.Sequence[tuple[str, ta.Any]]
-
-    def _select_index(self, t: _Table, where: ta.Mapping[str, ta.Any]) -> _SelectedIndex | None:
-        where_set = frozenset(where)
-
-        best_idx: Index | None = None
-        best_set: frozenset[str] | None = None
-        best_width: int | None = None
-
-        for cur_set, cur_idx in t.index_lookup.items():
-            if cur_set - where_set:
-                continue
-            cur_width = len(cur_set)
-            if not cur_width:
-                continue
-            if best_width is not None and best_width > cur_width:
-                continue
-            best_idx = cur_idx
-            best_set = cur_set
-            best_width = cur_width
-
-        if best_idx is None:
-            return None
-        best_set = check.not_none(best_set)
-
-        idx_key: ta.Any = tuple(where[k] for k in best_idx._field_store_names)
-        if len(idx_key) == 1:
-            [idx_key] = idx_key
-        un_idx_where = [(k, where[k]) for k in where_set - best_set]
-
-        return self._SelectedIndex(
-            index=best_idx,
-            index_set=best_set,
-            index_key=idx_key,
-            unindexed_where=un_idx_where,
-        )
-
-    #
-
     async def _fetch(self, st: _State, m: Mapper, k: ta.Any) -> Snap | None:
         check.not_in(k.__class__, WRAPPER_TYPES)
 
@@ -145,64 +137,290 @@ class InMemoryStore(Store):
 
         return ts.snaps.get(k)
 
-    async def _lookup_candidates(self, st: _State, lu: Store.Lookup) -> list[Snap]:
-        t = self._table_for_mapper(lu.m)
+    #
 
-        try:
-            ts = st.tables[t.m._store_name]
-        except KeyError:
-            return []
+    # The textbook (System R) default selectivities assumed for an equality and a range predicate, used to estimate the
+    # rows a sorted index scan will visit. Exact index lookups need no estimate, their row counts being known.
+    _EQ_SELECTIVITY: ta.ClassVar[float] = .1
+    _RANGE_SELECTIVITY: ta.ClassVar[float] = 1 / 3
+
+    _LOWER_BOUND_OPS: ta.ClassVar[frozenset[WhereOp]] = frozenset([WhereOp.GT, WhereOp.GE])
+    _UPPER_BOUND_OPS: ta.ClassVar[frozenset[WhereOp]] = frozenset([WhereOp.LT, WhereOp.LE])
+
+    class _LookupPlan:
+        """
+        A way of producing lookup candidates: by a set of keys, by scanning a range of a sorted index, or by scanning
+        the whole table. An ordered plan produces candidates already in the lookup's requested order.
+        """
+
+        def __init__(
+                self,
+                cost: float,
+                *,
+                keys: ta.Iterable[ta.Any] | None = None,
+                index: Index | None = None,
+                prefix: tuple[ta.Any, ...] = (),
+                range_item: WhereItem | None = None,
+                consumed: ta.AbstractSet[str] = frozenset(),
+                ordered: bool = False,
+                desc: bool = False,
+        ) -> None:
+            super().__init__()
+
+            self.cost = cost
+            self.keys = keys
+            self.index = index
+            self.prefix = prefix
+            self.range_item = range_item
+            self.consumed = consumed
+            self.ordered = ordered
+            self.desc = desc
+
+        def __repr__(self) -> str:
+            return (
+                f'{self.__class__.__qualname__}('
+                f'cost={self.cost!r}, '
+                f'index={self.index!r}, '
+                f'prefix={self.prefix!r}, '
+                f'range_item={self.range_item!r}, '
+                f'ordered={self.ordered!r}, '
+                f'desc={self.desc!r})'
+            )
+
+    def _estimate_scan_cost(
+            self,
+            rows: float,
+            lu: Store.Lookup,
+            consumed: ta.AbstractSet[str],
+            ordered: bool,
+    ) -> float:
+        if not ordered or lu.limit is None:
+            return float(rows)
+
+        # An ordered scan stops as soon as it has produced enough rows satisfying the remaining predicates.
+        sel = 1.
+        for wi in (lu.where or ()):
+            if wi.name not in consumed:
+                sel *= self._EQ_SELECTIVITY if wi.op is WhereOp.EQ else self._RANGE_SELECTIVITY
+        return min(float(rows), lu.limit / sel)
+
+    def _plan_lookup(self, t: _Table, ts: _TableState, lu: Store.Lookup) -> _LookupPlan:
+        luw = lu.where
+        eqs: ta.Mapping[str, ta.Any] = luw.eqs if luw else {}
+
+        kf_sn = t.m._key_field_store_name
+        if kf_sn in eqs:
+            k = eqs[kf_sn]
+            check.not_in(k.__class__, WRAPPER_TYPES)
+            return self._LookupPlan(
+                1.,
+                keys=[k] if k in ts.snaps else [],
+                consumed=frozenset([kf_sn]),
+                ordered=True,
+            )
+
+        if luw and (kf_wis := luw.by_name.get(kf_sn)) and (kf_wi := kf_wis[0]).op is WhereOp.IN:
+            ks = [k for k in dict.fromkeys(kf_wi.value) if k in ts.snaps]
+            return self._LookupPlan(
+                float(len(ks)),
+                keys=ks,
+                consumed=frozenset([kf_sn]),
+                ordered=not lu.order_by or len(ks) < 2,
+            )
+
+        # The fields candidates must be ordered by, less any constrained to a single value, if all in one direction.
+        order_names: tuple[str, ...] | None = ()
+        order_desc = False
+        if lu.order_by:
+            obis = [obi for obi in lu.order_by if obi.name not in eqs]
+            if len({obi.dir for obi in obis}) > 1:
+                order_names = None
+            elif obis:
+                order_names = tuple(obi.name for obi in obis)
+                order_desc = obis[0].dir == 'desc'
+
+        best = self._LookupPlan(
+            self._estimate_scan_cost(len(ts.snaps), lu, frozenset(), order_names == ()),
+            ordered=order_names == (),
+        )
+
+        for idx in t.index_lookup.values():
+            fns = idx._field_store_names
+
+            p = 0
+            while p < len(fns) and fns[p] in eqs:
+                p += 1
+            prefix = tuple(eqs[fn] for fn in fns[:p])
+
+            plan: InMemoryStore._LookupPlan
+
+            if p == len(fns):
+                try:
+                    idx_keys = ts.indexes[idx._store_name].keys
+                except KeyError:
+                    return self._LookupPlan(0., keys=[], ordered=True)
+
+                try:
+                    xs = idx_keys[prefix[0] if p == 1 else prefix]
+                except KeyError:
+                    return self._LookupPlan(0., keys=[], ordered=True)
+
+                if idx._is_unique:
+                    xs = [xs]
 
-        # FIXME: actually use sorted indexes lol
-        if not (luw := lu.where) or not (where := luw.eqs):
-            return list(ts.snaps.values())
+                plan = self._LookupPlan(
+                    float(len(xs)),
+                    keys=xs,
+                    consumed=frozenset(fns),
+                    ordered=order_names == () or len(xs) < 2,
+                )
+
+            elif (
+                    len(fns) == 1 and
+                    luw and
+                    (in_wis := luw.by_name.get(fns[0])) and
+                    (in_wi := in_wis[0]).op is WhereOp.IN
+            ):
+                try:
+                    idx_keys = ts.indexes[idx._store_name].keys
+                except KeyError:
+                    return self._LookupPlan(0., keys=[], ordered=True)
+
+                in_xs: list[ta.Any] = []
+                for v in dict.fromkeys(in_wi.value):
+                    try:
+                        xs = idx_keys[v]
+                    except KeyError:
+                        continue
+                    if idx._is_unique:
+                        in_xs.append(xs)
+                    else:
+                        in_xs.extend(xs)
+
+                plan = self._LookupPlan(
+                    float(len(in_xs)),
+                    keys=in_xs,
+                    consumed=frozenset(fns),
+                    ordered=order_names == () or len(in_xs) < 2,
+                )
+
+            elif idx._is_sorted:
+                range_item: WhereItem | None = None
+                if luw and (wis := luw.by_name.get(fns[p])):
+                    [wi] = wis
+                    if wi.op in self._LOWER_BOUND_OPS or wi.op in self._UPPER_BOUND_OPS:
+                        range_item = wi
+
+                ordered = order_names is not None and fns[p:p + len(order_names)] == order_names
+                if not (p or range_item is not None or (ordered and order_names)):
+                    continue
+
+                rows = len(ts.snaps) * self._EQ_SELECTIVITY ** p
+                if range_item is not None:
+                    rows *= self._RANGE_SELECTIVITY
+
+                consumed = frozenset([*fns[:p], *([range_item.name] if range_item is not None else [])])
+
+                plan = self._LookupPlan(
+                    self._estimate_scan_cost(rows, lu, consumed, ordered),
+                    index=idx,
+                    prefix=prefix,
+                    range_item=range_item,
+                    consumed=consumed,
+                    ordered=ordered,
+                    desc=order_desc if ordered else False,
+                )
 
-        if t.m.key_field.store_name in where:
-            if (ks := await self._fetch(st, lu.m, where[t.m.key_field.store_name])) is not None:
-                return [ks]
             else:
-                return []
+                continue
 
-        si = self._select_index(t, where)
+            if plan.cost < best.cost or (plan.cost == best.cost and plan.ordered and not best.ordered):
+                best = plan
 
-        if si is None:
-            lst: list[Snap] = []
+        return best
 
-            for v in ts.snaps.values():
-                for fk, fv in where.items():
-                    if v[fk] != fv:
-                        break
-                else:
-                    lst.append(v)
+    def _scan_sorted_index(
+            self,
+            idx_keys: col.PersistentSortedMapping[ta.Any, ta.Any],
+            width: int,
+            prefix: tuple[ta.Any, ...],
+            range_item: WhereItem | None,
+            desc: bool,
+    ) -> ta.Iterator[ta.Any]:
+        p = len(prefix)
+
+        lower = upper = None
+        if range_item is not None:
+            if range_item.op in self._LOWER_BOUND_OPS:
+                lower = range_item
+            else:
+                upper = range_item
 
-            return lst
+        # Single field index keys are stored unwrapped, and as then there can be no prefix, only a range bound seeks.
+        it: ta.Iterator[tuple[ta.Any, ta.Any]]
+        if width == 1:
+            if not desc:
+                it = idx_keys.items_from(lower.value) if lower is not None else idx_keys.iteritems()
+            else:
+                it = idx_keys.items_from_desc(upper.value) if upper is not None else idx_keys.items_desc()
 
-        try:
-            ix = ts.indexes[si.index._store_name]
-        except KeyError:
-            return []
-        try:
-            xs = ix.keys[si.index_key]
-        except KeyError:
-            return []
+        elif not desc:
+            # A shorter tuple sorts before all those it is a prefix of.
+            it = idx_keys.items_from((*prefix, lower.value) if lower is not None else prefix)
+
+        elif upper is None:
+            it = idx_keys.items_from_desc((*prefix, _MAX_KEY))
+
+        elif upper.op is WhereOp.LE:
+            it = idx_keys.items_from_desc((*prefix, upper.value, _MAX_KEY))
 
-        if si.index._is_unique:
-            xs = [xs]
+        else:
+            it = idx_keys.items_from_desc((*prefix, upper.value))
+
+        if range_item is not None:
+            range_fn = self._OP_FN_BY_OP[range_item.op]
+            # Failing the bound approached last ends the scan, failing the one started from just skips past the edge.
+            range_ends = (upper is not None) != desc
 
-        if not si.unindexed_where:
-            return [ts.snaps[xk] for xk in xs]
+        for xk, xs in it:
+            kt = (xk,) if width == 1 else xk
 
-        lst = []
+            if p and kt[:p] != prefix:
+                break
 
-        for xk in xs:
-            x = ts.snaps[xk]
-            for fk, fv in si.unindexed_where:
-                if x[fk] != fv:
+            if range_item is not None and not range_fn(kt[p], range_item.value):
+                if range_ends:
                     break
-            else:
-                lst.append(x)
+                continue
 
-        return lst
+            yield xs
+
+    def _iter_lookup_candidates(self, ts: _TableState, plan: _LookupPlan) -> ta.Iterator[Snap]:
+        if plan.keys is not None:
+            for k in plan.keys:
+                yield ts.snaps[k]
+
+        elif (idx := plan.index) is not None:
+            try:
+                idx_keys = ts.indexes[idx._store_name].keys
+            except KeyError:
+                return
+
+            for xs in self._scan_sorted_index(
+                    ta.cast(col.PersistentSortedMapping, idx_keys),
+                    len(idx._field_store_names),
+                    plan.prefix,
+                    plan.range_item,
+                    plan.desc,
+            ):
+                if idx._is_unique:
+                    yield ts.snaps[xs]
+                else:
+                    for xk in xs:
+                        yield ts.snaps[xk]
+
+        else:
+            yield from ts.snaps.values()
 
     _OP_FN_BY_OP: ta.Final[ta.Mapping[WhereOp, ta.Callable[[ta.Any, ta.Any], bool]]] = {
         WhereOp.EQ: operator.eq,
@@ -211,21 +429,37 @@ class InMemoryStore(Store):
         WhereOp.GE: operator.ge,
         WhereOp.LT: operator.lt,
         WhereOp.LE: operator.le,
+        WhereOp.IN: lambda v, vs: v in vs,
     }
 
-    def _postprocess_lookup_candidates(self, st: _State, lu: Store.Lookup, lst: list[Snap]) -> list[Snap]:
+    def _postprocess_lookup_candidates(
+            self,
+            st: _State,
+            lu: Store.Lookup,
+            snaps: ta.Iterable[Snap],
+            *,
+            consumed: ta.AbstractSet[str] = frozenset(),
+            ordered: bool = False,
+    ) -> list[Snap]:
+        op_tups: list[tuple[str, ta.Callable[[ta.Any, ta.Any], bool], ta.Any]] = []
         if luw := lu.where:
-            op_tups: list[tuple[str, ta.Callable[[ta.Any, ta.Any], bool], ta.Any]] = [
+            op_tups = [
                 (wi.name, self._OP_FN_BY_OP[wi.op], wi.value)
                 for wi in luw._items
+                if wi.name not in consumed
             ]
-            lst2: list[Snap] = []
-            for snap in lst:
-                if all(fn(snap[k], v) for k, fn, v in op_tups):
-                    lst2.append(snap)
-            lst = lst2
 
-        if lu.order_by:
+        # Candidates already in order can stop being consumed once the limit is reached.
+        early_limit = lu.limit if ordered else None
+
+        lst: list[Snap] = []
+        for snap in snaps:
+            if early_limit is not None and len(lst) >= early_limit:
+                break
+            if all(fn(snap[k], v) for k, fn, v in op_tups):
+                lst.append(snap)
+
+        if lu.order_by and not ordered:
             for obi in reversed(lu.order_by):
                 lst.sort(
                     key=operator.itemgetter(obi.name),
@@ -238,8 +472,22 @@ class InMemoryStore(Store):
         return lst
 
     async def _lookup(self, st: _State, lu: Store.Lookup) -> ta.Sequence[Snap]:
-        lst = await self._lookup_candidates(st, lu)
-        return self._postprocess_lookup_candidates(st, lu, lst)
+        t = self._table_for_mapper(lu.m)
+
+        try:
+            ts = st.tables[t.m._store_name]
+        except KeyError:
+            return []
+
+        plan = self._plan_lookup(t, ts, lu)
+
+        return self._postprocess_lookup_candidates(
+            st,
+            lu,
+            self._iter_lookup_candidates(ts, plan),
+            consumed=plan.consumed,
+            ordered=plan.ordered,
+        )
 
     #
 
@@ -1,10 +1,12 @@
 # ruff: noqa: SLF001
 import contextvars
 import enum
+import itertools
 import typing as ta
 
 from .. import check
 from .. import lang
+from .backrefs import _Backref
 from .backrefs import _BoundBackref
 from .fields import RefField
 from .flushing import _SessionFlusher
@@ -23,6 +25,7 @@ from .snaps import Snap
 from .stores import Store
 from .wheres import Where
 from .wheres import WhereItem
+from .wheres import WhereOp
 
 
 K = ta.TypeVar('K')
@@ -37,6 +40,8 @@ class _NOT_SET(lang.Marker):  # noqa
 
 
 class Session:
+    DEFAULT_BATCH_FETCH_SIZE: ta.ClassVar[int] = 100
+
     def __init__(
             self,
             registry: Registry,
@@ -44,19 +49,27 @@ class Session:
             *,
             transaction: bool | ta.Literal['default'] = 'default',
             no_auto_flush: bool = True,
+            batch_fetch_size: int | None = None,
     ) -> None:
         super().__init__()
 
+        check.arg(batch_fetch_size is None or batch_fetch_size > 0)
+
         self._registry = registry
         self._store = store
 
         self._transaction = transaction
         self._no_auto_flush = no_auto_flush
+        self._batch_fetch_size = batch_fetch_size
 
         self._entities_by_key_by_cls: dict[type, dict[Key, Session._Entity]] = {m._cls: {} for m in registry._mappers}
         self._entities_by_obj_id: dict[int, Session._Entity] = {}
         self._entities_by_auto_key: dict[_AutoKey, Session._Entity] = {}
 
+        self._ref_fields_by_mapper: dict[Mapper, ta.Sequence[RefField]] = {}
+        self._pending_ref_keys_by_cls: dict[type, dict[ta.Any, None]] = {}
+        self._preloaded_backrefs: dict[RefField, dict[Key, list[Session._Entity]]] = {}
+
     _store_cm: ta.AsyncContextManager[Store.Context]
     _store_ctx: Store.Context
 
@@ -289,6 +302,9 @@ class Session:
         if obj is not None:
             self._entities_by_obj_id[id(obj)] = e
 
+        if self._batch_fetch_size is not None:
+            self._track_pending_refs(e)
+
         if k.__class__ is _AutoKey:
             self._entities_by_auto_key[k] = e  # noqa
 
@@ -366,6 +382,9 @@ class Session:
             ov = m.snap_value_to_field_value(f, v)
             setattr(e.obj, f._name, ov)
 
+        if self._batch_fetch_size is not None:
+            self._track_pending_refs(e)
+
     async def flush(self) -> None:
         check.state(self.is_alive)
 
@@ -380,9 +399,17 @@ class Session:
                 e.k = _ValKey(wb_k)
                 ed[e.k] = e
 
+                if (pd := self._pending_ref_keys_by_cls.get(m._cls)) is not None:
+                    pd.pop(wb_k, None)
+
             self._writeback_snap(e, wb_snap)
 
+        if res.ent_writeback:
+            self._invalidate_preloaded_backrefs({e.m for e in res.ent_writeback})
+
     async def refresh(self, *objs: ta.Any) -> None:
+        ms: set[Mapper] = set()
+
         for obj in objs:
             e = self._entities_by_obj_id[id(obj)]
             m = e.m
@@ -390,6 +417,9 @@ class Session:
             snap = await self._store_ctx.fetch(m, e.k.k)
 
             self._writeback_snap(e, snap)
+            ms.add(m)
+
+        self._invalidate_preloaded_backrefs(ms)
 
     #
 
@@ -399,10 +429,22 @@ class Session:
 
     async def _get_key_ref_obj(self, lr: _KeyRef) -> ta.Any:
         # TODO: writeback?
-        return check.not_none(await self.get(lr._cls, lr._k))
+        cls, k = lr._cls, lr._k
 
-    async def _get_bound_backref_objs(self, bbr: _BoundBackref) -> ta.Sequence[ta.Any]:
-        binder = bbr._br._binder
+        if (
+                (bs := self._batch_fetch_size) is not None and
+                k.__class__ is _ValKey and
+                k not in self._entities_by_key_by_cls.setdefault(cls, {})
+        ):
+            # Rather than fetching only this object, fetch a batch of those the session's objects refer to, which are
+            # likely to be resolved in turn - as when iterating over query results resolving each one's ref.
+            ks = [k.k, *[pk for pk in self._pending_ref_keys(cls, bs) if pk != k.k]]
+            await self._fetch_many(self._registry.mapper_for_cls(cls), ks[:bs])
+
+        return check.not_none(await self.get(cls, k))
+
+    def _backref_field(self, br: _Backref) -> RefField:
+        binder = br._binder
 
         brd = self._registry._fields_by_backref_binding
         try:
@@ -415,12 +457,176 @@ class Session:
         if len(brf_lst) > 1:
             raise RuntimeError(f'Ambiguous backref binding: {binder} -> {brf_lst}')
         [brf] = brf_lst
-        rf = check.isinstance(brf, RefField)
+        return check.isinstance(brf, RefField)
+
+    async def _get_bound_backref_objs(self, bbr: _BoundBackref) -> ta.Sequence[ta.Any]:
+        rf = self._backref_field(bbr._br)
+
+        if rf in self._preloaded_backrefs and (e := self._entities_by_obj_id.get(id(bbr._obj))) is not None:
+            if not self._no_auto_flush:
+                await self.flush()
+
+            if (ents := self._preloaded_backrefs.get(rf, {}).get(e.k)) is not None:
+                return [ce.obj for ce in ents if ce.obj is not None]
 
         return await self.query(Query(rf._mapper._cls, Where.of_eq(**{rf._name: _ObjRef(bbr._obj)})))
 
     #
 
+    def _invalidate_preloaded_backrefs(self, ms: ta.AbstractSet[Mapper]) -> None:
+        if not self._preloaded_backrefs:
+            return
+
+        for rf in [rf for rf in self._preloaded_backrefs if rf._mapper in ms]:
+            del self._preloaded_backrefs[rf]
+
+    def _ref_fields_of(self, m: Mapper) -> ta.Sequence[RefField]:
+        try:
+            return self._ref_fields_by_mapper[m]
+        except KeyError:
+            pass
+
+        rfs = self._ref_fields_by_mapper[m] = [f for f in m._fields if isinstance(f, RefField)]
+        return rfs
+
+    def _track_pending_refs(self, e: _Entity) -> None:
+        # Notes the keys of not yet loaded objects an entity's object refers to, for `_pending_ref_keys`. Keys are
+        # dropped once loaded or fetched, but refs reassigned by hand aren't tracked - costing only batching.
+        if (obj := e.obj) is None:
+            return
+
+        pkd = self._pending_ref_keys_by_cls
+        for rf in self._ref_fields_of(e.m):
+            r = getattr(obj, rf._name)
+            if r.__class__ is not _KeyRef or (k := r._k).__class__ is not _ValKey:
+                continue
+
+            cls = rf.ref_obj_cls
+            if k not in self._entities_by_key_by_cls.setdefault(cls, {}):
+                pkd.setdefault(cls, {})[k.k] = None
+
+        if e.k.__class__ is _ValKey and (pd := pkd.get(e.m._cls)) is not None:
+            pd.pop(e.k.k, None)
+
+    def _pending_ref_keys(self, cls: type, limit: int) -> list[ta.Any]:
+        # The keys of up to `limit` objects of the given class referred to by the session's objects but not yet loaded.
+        if not (pd := self._pending_ref_keys_by_cls.get(cls)):
+            return []
+
+        return list(itertools.islice(pd, limit))
+
+    async def _lookup_in(self, m: Mapper, store_name: str, vs: ta.Sequence[ta.Any]) -> list[_Entity]:
+        # Attaches and returns the entities whose given field has any of the given values, looked up in batches.
+        bs = self._batch_fetch_size or self.DEFAULT_BATCH_FETCH_SIZE
+
+        ents: list[Session._Entity] = []
+
+        for i in range(0, len(vs), bs):
+            snaps = await self._store_ctx.lookup(Store.Lookup(
+                m,
+                Where(WhereItem(store_name, WhereOp.IN, tuple(vs[i:i + bs]))),
+            ))
+
+            for snap in snaps:
+                ents.append(self._attach(m._cls, snap=snap))
+
+        return ents
+
+    async def _fetch_many(self, m: Mapper, ks: ta.Sequence[ta.Any]) -> None:
+        cd = self._entities_by_key_by_cls.setdefault(m._cls, {})
+
+        if (ks := [k for k in ks if _ValKey(k) not in cd]):
+            await self._lookup_in(m, m._key_field_store_name, ks)
+
+            # Those found were dropped as they were attached - those not found won't be looked for again.
+            if (pd := self._pending_ref_keys_by_cls.get(m._cls)):
+                for k in ks:
+                    pd.pop(k, None)
+
+    #
+
+    async def _preload_refs(self, objs: ta.Sequence[ta.Any], rf: RefField) -> list[ta.Any]:
+        ref_m = self._registry.mapper_for_cls(rf.ref_obj_cls)
+
+        await self._fetch_many(ref_m, list(dict.fromkeys(
+            r._k.k
+            for obj in objs
+            if (r := getattr(obj, rf._name)).__class__ is _KeyRef and r._k.__class__ is _ValKey
+        )))
+
+        cd = self._entities_by_key_by_cls[ref_m._cls]
+
+        out: list[ta.Any] = []
+        for obj in objs:
+            if (r := getattr(obj, rf._name)).__class__ is _ObjRef:
+                out.append(r._obj)
+            elif r.__class__ is _KeyRef and (e := cd.get(r._k)) is not None and e.obj is not None:
+                out.append(e.obj)
+
+        return out
+
+    async def _preload_backrefs(self, objs: ta.Sequence[ta.Any], br: _Backref) -> list[ta.Any]:
+        rf = self._backref_field(br)
+
+        if not self._no_auto_flush:
+            await self.flush()
+
+        pks: list[Key] = []
+        for obj in objs:
+            # Objects not yet flushed have no key the store could know them by.
+            if (pk := self._entities_by_obj_id[id(obj)].k).__class__ is _ValKey:
+                pks.append(pk)
+
+        pre = self._preloaded_backrefs.setdefault(rf, {})
+
+        if (todo := [pk for pk in dict.fromkeys(pks) if pk not in pre]):
+            for pk in todo:
+                pre[pk] = []
+
+            for ce in await self._lookup_in(rf._mapper, rf._store_name, [pk.k for pk in todo]):
+                pre[_ValKey(check.not_none(ce.snap)[rf._store_name])].append(ce)
+
+        return [ce.obj for pk in pks for ce in pre[pk] if ce.obj is not None]
+
+    async def preload(self, objs: ta.Iterable[ta.Any], *paths: str) -> None:
+        """
+        Loads the objects the given ones refer to through the named ref fields and backrefs with one lookup per mapper
+        (per batch_fetch_size objects, or DEFAULT_BATCH_FETCH_SIZE without one) rather than one per object. Paths may be
+        dotted to preload further through the objects so loaded. Preloaded backrefs are then served from the session
+        rather than the store, until a flush or refresh writes to their referring mapper.
+        """
+
+        check.state(self.is_alive)
+
+        tails_by_head: dict[str, list[str]] = {}
+        for p in paths:
+            h, _, t = p.partition('.')
+            tails = tails_by_head.setdefault(check.non_empty_str(h), [])
+            if t:
+                tails.append(t)
+
+        objs_by_cls: dict[type, list[ta.Any]] = {}
+        for obj in objs:
+            objs_by_cls.setdefault(type(obj), []).append(obj)
+
+        for h, tails in tails_by_head.items():
+            loaded: list[ta.Any] = []
+
+            for cls, cls_objs in objs_by_cls.items():
+                m = self._registry.mapper_for_cls(cls)
+
+                if (f := m._fields_by_name.get(h)) is not None:
+                    loaded.extend(await self._preload_refs(cls_objs, check.isinstance(f, RefField)))
+                elif isinstance(br := getattr(cls, h, None), _Backref):
+                    loaded.extend(await self._preload_backrefs(cls_objs, br))
+                else:
+                    raise AttributeError(f'{cls.__name__} has no ref field or backref {h!r}')
+
+            if tails:
+                await self.preload(loaded, *tails)
+
+    #
+
     async def query(self, q: Query[T]) -> list[T]:
         check.state(self.is_alive)
 
@@ -435,10 +641,14 @@ class Session:
             wis: list[WhereItem] = []
             for qwi in qwh:
                 f = m._fields_by_name[qwi.name]
+                if qwi.op is WhereOp.IN:
+                    wv: ta.Any = tuple(m.field_value_to_snap_value(f, v) for v in qwi.value)
+                else:
+                    wv = m.field_value_to_snap_value(f, qwi.value)
                 wis.append(WhereItem(
                     f._store_name,
                     qwi.op,
-                    m.field_value_to_snap_value(f, qwi.value),
+                    wv,
                 ))
             wh = Where(*wis)
 
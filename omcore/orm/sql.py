@@ -65,6 +65,7 @@ from .timestamps import CreatedAt
 from .timestamps import Timestamp
 from .timestamps import UpdatedAt
 from .wheres import Where
+from .wheres import WhereOp
 from .wrappers import WRAPPER_TYPES
 
 
@@ -79,12 +80,15 @@ class FieldSqlType(tv.UniqueScalarTypedValue[sql.td.Dtype], FieldOption, lang.Fi
 
 
 class SqlStore(Store):
+    DEFAULT_MAX_PARAMS: ta.ClassVar[int] = 999
+
     def __init__(
             self,
             registry: Registry,
             db: sql.AsyncDb | sql.AsyncConn,
             *,
             param_style: sql.ParamStyle | None = None,
+            max_params: int | None = None,
             tabledef_renderer: sql.td.Renderer,
             tabledef_create_options: sql.td.Renderer.CreateOptions | None = None,
     ) -> None:
@@ -103,6 +107,14 @@ class SqlStore(Store):
         self._supports_returning = db.adapter.supports_returning
         self._last_insert_id_query = db.adapter.last_insert_id_query
 
+        # Multi-row inserts and deletes are split into statements binding at most this many parameters.
+        if max_params is None:
+            max_params = db.adapter.max_params
+        if max_params is None:
+            max_params = self.DEFAULT_MAX_PARAMS
+        check.arg(max_params > 0)
+        self._max_params = max_params
+
         self._tabledef_renderer = tabledef_renderer
         if tabledef_create_options is None:
             tabledef_create_options = sql.td.Renderer.CreateOptions(
@@ -367,8 +379,24 @@ class SqlStore(Store):
                 fes = sm.field_encoders
                 for wi in luw:
                     fk = wi.name
+                    fe = fes.get(fk)
+
+                    if wi.op is WhereOp.IN:
+                        if not wi.value:
+                            clauses.append('1 = 0')
+                            continue
+                        phs: list[str] = []
+                        for fv in wi.value:
+                            if fe is not None:
+                                fv = fe(fv)
+                            check.not_in(fv.__class__, WRAPPER_TYPES)
+                            phs.append(pp.add(len(params)))
+                            params.append(fv)
+                        clauses.append(f'{fk} in ({", ".join(phs)})')
+                        continue
+
                     fv = wi.value
-                    if (fe := fes.get(fk)) is not None:
+                    if fe is not None:
                         fv = fe(fv)
                     check.not_in(fv.__class__, WRAPPER_TYPES)
                     clauses.append(f'{fk} {wi.op.value} {pp.add(len(params))}')
@@ -405,7 +433,10 @@ class SqlStore(Store):
                 pp: sql.ParamsPreparer,
                 *,
                 auto_key: bool = False,
+                num_rows: int = 1,
         ) -> str:
+            num_cols = len(m._fields) - (1 if auto_key else 0) - len(m._auto_value_fields)
+
             return ' '.join([
                 'insert into',
                 m._store_name,
@@ -419,13 +450,16 @@ class SqlStore(Store):
                     ')',
                 ]),
                 'values',
-                ''.join([
-                    '(',
-                    ', '.join([
-                        pp.add(i)
-                        for i in range(len(m._fields) - (1 if auto_key else 0) - len(m._auto_value_fields))
-                    ]),
-                    ')',
+                ', '.join([
+                    ''.join([
+                        '(',
+                        ', '.join([
+                            pp.add(r * num_cols + i)
+                            for i in range(num_cols)
+                        ]),
+                        ')',
+                    ])
+                    for r in range(num_rows)
                 ]),
                 *(['returning id'] if auto_key and self._o._supports_returning else []),
             ])
@@ -464,22 +498,36 @@ class SqlStore(Store):
 
             return iak
 
+        def _rows_per_stmt(self, params_per_row: int) -> int:
+            return max(1, self._o._max_params // max(1, params_per_row))
+
         async def insert(self, m: Mapper, snaps: ta.Sequence[Snap]) -> None:
             await self._o._maybe_create_schema()
 
             sm = self._o._mappers[m]
 
-            pp = sql.make_params_preparer(self._o._param_style)
-            stmt = self._build_insert_stmt(m, pp)
-            px = pp.prepare()
+            ins_fs = [f for f in m._fields if f not in m._auto_value_fields]
+            batch_size = self._rows_per_stmt(len(ins_fs))
+
+            # Statements are keyed by row count - there are at most two, the full batch and the remainder.
+            stmts: dict[int, tuple[str, sql.params.PreparedParams]] = {}
+
+            for i in range(0, len(snaps), batch_size):
+                batch = snaps[i:i + batch_size]
+
+                try:
+                    stmt, px = stmts[len(batch)]
+                except KeyError:
+                    pp = sql.make_params_preparer(self._o._param_style)
+                    stmt = self._build_insert_stmt(m, pp, num_rows=len(batch))
+                    px = pp.prepare()
+                    stmts[len(batch)] = (stmt, px)
+
+                params: list[ta.Any] = []
+                for snap in batch:
+                    enc_snap = sm.encode(snap)
+                    params.extend(enc_snap[f._store_name] for f in ins_fs)
 
-            for snap in snaps:
-                enc_snap = sm.encode(snap)
-                params = [
-                    enc_snap[f._store_name]
-                    for f in m._fields
-                    if f not in m._auto_value_fields
-                ]
                 qp = sql.params.substitute_params(px, dict(enumerate(params)), strict=True)  # type: ignore
                 await sql.exec(check.not_none(self._q), stmt, qp)
 
@@ -488,49 +536,73 @@ class SqlStore(Store):
 
             sm = self._o._mappers[m]
 
+            # Diffs setting the same columns share a statement, executed once over all of their rows.
+            rows_by_cols: dict[tuple[str, ...], list[list[ta.Any]]] = {}
             for vk, ud_diff in diffs:
-                pp = sql.make_params_preparer(self._o._param_style)
-                params: list = []
-
-                def add_param(v):
-                    i = len(params)
-                    params.append(v)
-                    return pp.add(i)
-
                 check.not_in(m._key_field_store_name, ud_diff)
                 enc_ud_diff = sm.encode(ud_diff)
+                rows_by_cols.setdefault(tuple(enc_ud_diff), []).append([
+                    *enc_ud_diff.values(),
+                    sm.encode_key(vk),
+                ])
+
+            for cols, rows in rows_by_cols.items():
+                pp = sql.make_params_preparer(self._o._param_style)
                 stmt = ' '.join([
                     'update',
                     m._store_name,
                     'set',
-                    ', '.join([f'{k} = {add_param(v)}' for k, v in enc_ud_diff.items()]),
+                    ', '.join([f'{k} = {pp.add(i)}' for i, k in enumerate(cols)]),
                     'where',
                     m._key_field_store_name,
                     '= ',
-                    add_param(sm.encode_key(vk)),
+                    pp.add(len(cols)),
                 ])
                 px = pp.prepare()
-                qp = sql.params.substitute_params(px, dict(enumerate(params)), strict=True)  # type: ignore
-                await sql.exec(check.not_none(self._q), stmt, qp)
+
+                qps = [
+                    sql.params.substitute_params(px, dict(enumerate(params)), strict=True)  # type: ignore
+                    for params in rows
+                ]
+
+                if len(qps) == 1:
+                    [qp] = qps
+                    await sql.exec(check.not_none(self._q), stmt, qp)
+                else:
+                    await sql.exec_many(check.not_none(self._q), stmt, qps)
 
         async def delete(self, m: Mapper, keys: ta.Sequence[ta.Any]) -> None:
             await self._o._maybe_create_schema()
 
             sm = self._o._mappers[m]
 
-            pp = sql.make_params_preparer(self._o._param_style)
-            stmt = ' '.join([
-                'delete from',
-                m._store_name,
-                'where',
-                m._key_field_store_name,
-                '= ',
-                pp.add(0),
-            ])
-            px = pp.prepare()
-
-            for k in keys:
-                qp = sql.params.substitute_params(px, {0: sm.encode_key(k)}, strict=True)  # type: ignore
+            batch_size = self._rows_per_stmt(1)
+
+            stmts: dict[int, tuple[str, sql.params.PreparedParams]] = {}
+
+            for i in range(0, len(keys), batch_size):
+                batch = keys[i:i + batch_size]
+
+                try:
+                    stmt, px = stmts[len(batch)]
+                except KeyError:
+                    pp = sql.make_params_preparer(self._o._param_style)
+                    stmt = ' '.join([
+                        'delete from',
+                        m._store_name,
+                        'where',
+                        m._key_field_store_name,
+                        'in',
+                        ''.join([
+                            '(',
+                            ', '.join([pp.add(j) for j in range(len(batch))]),
+                            ')',
+                        ]),
+                    ])
+                    px = pp.prepare()
+                    stmts[len(batch)] = (stmt, px)
+
+                qp = sql.params.substitute_params(px, {j: sm.encode_key(k) for j, k in enumerate(batch)}, strict=True)  # type: ignore  # noqa
                 await sql.exec(check.not_none(self._q), stmt, qp)
 
     #
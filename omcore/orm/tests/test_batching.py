@@ -0,0 +1,105 @@
+import os.path
+import sqlite3
+import tempfile
+
+from ... import dataclasses as dc
+from ... import lang
+from ... import orm
+from ... import sql
+
+
+@dc.dataclass(kw_only=True)
+@dc.extra_class_params(install_class_field_attrs='instance')
+class Kv:
+    id: orm.Key[int]
+
+    key: str
+    value: str
+
+
+@lang.cached_function
+def registry() -> orm.Registry:
+    return orm.registry(Kv)
+
+
+class _RecordingCursor(sqlite3.Cursor):
+    # Records each statement executed with the number of parameter sets it was executed over.
+
+    def execute(self, sql, parameters=(), /):
+        self.connection.calls.append((sql.lower(), 1))  # type: ignore[attr-defined]
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        seq = list(seq_of_parameters)
+        self.connection.calls.append((sql.lower(), len(seq)))  # type: ignore[attr-defined]
+        return super().executemany(sql, seq)
+
+
+class _RecordingConnection(sqlite3.Connection):
+    calls: list[tuple[str, int]]
+
+    def cursor(self, factory=_RecordingCursor):  # type: ignore[override]
+        return super().cursor(factory)
+
+
+def _stmts(calls: list[tuple[str, int]], verb: str) -> list[tuple[int, int]]:
+    # The number of parameters bound by, and of parameter sets executed over, each statement beginning with `verb`.
+    return [(sql.count('?'), n) for sql, n in calls if sql.startswith(verb)]
+
+
+async def _test_batching(store: orm.Store, calls: list[tuple[str, int]]) -> None:
+    async with orm.session(registry(), store):
+        await orm.add(*[Kv(id=orm.key(i), key=f'k{i}', value=f'v{i}') for i in range(25)])
+
+    # At most 7 parameters per statement at 3 per row is 2 rows per statement, the last holding the 1 left over.
+    assert _stmts(calls, 'insert') == [(6, 1)] * 12 + [(3, 1)]
+
+    async with orm.session(registry(), store):
+        for i in range(25):
+            kv = await orm.get(Kv, i)
+            if i % 3 == 0:
+                kv.value = f'w{i}'
+            elif i % 3 == 1:
+                kv.key = f'j{i}'
+                kv.value = f'w{i}'
+
+        await orm.delete(*[await orm.get(Kv, i) for i in range(0, 25, 2)])
+
+    # The 4 rows setting only value and the 4 setting key and value each share one executemany - the deleted rows'
+    # changes are never written.
+    assert sorted(_stmts(calls, 'update')) == [(2, 4), (3, 4)]
+
+    # The 13 deleted keys are split 7 and 6.
+    assert _stmts(calls, 'delete') == [(7, 1), (6, 1)]
+
+    async with orm.session(registry(), store):
+        kvs = sorted(await orm.query(Kv), key=lambda kv: kv.id.k)
+
+    assert [(kv.id.k, kv.key, kv.value) for kv in kvs] == [
+        (i, f'j{i}' if i % 3 == 1 else f'k{i}', f'w{i}' if i % 3 != 2 else f'v{i}')
+        for i in range(1, 25, 2)
+    ]
+
+
+def test_sql_batching():
+    db_path = os.path.join(tempfile.mkdtemp(), 'orm.db')
+
+    calls: list[tuple[str, int]] = []
+
+    def connect():
+        conn = sqlite3.connect(db_path, factory=_RecordingConnection)
+        conn.calls = calls
+        return conn
+
+    db = sql.api.DbapiDb(
+        sql.api.ClosingDbapiConnector(connect),
+        adapter=sql.be.sqlite.adapters.sqlite_adapter(),
+    )
+    adb = sql.api.SyncToAsyncDb(sql.api.ImmediateSyncToAsyncRunner, db)
+    store = orm.SqlStore(
+        registry(),
+        adb,
+        max_params=7,
+        tabledef_renderer=sql.be.sqlite.td.SqliteTabledefRenderer(),
+    )
+    lang.sync_await(_test_batching(store, calls))
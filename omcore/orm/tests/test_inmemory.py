@@ -0,0 +1,92 @@
+import operator
+import random
+
+import pytest
+
+from ... import dataclasses as dc
+from ... import orm
+
+
+##
+
+
+@dc.dataclass(kw_only=True)
+@dc.extra_class_params(install_class_field_attrs='instance')
+class Reading:
+    id: orm.Key[int] = dc.field(default_factory=orm.auto_key[int])
+
+    sensor: str
+    ts: int
+    value: int
+
+
+def build_registry() -> orm.Registry:
+    return orm.registry(
+        orm.dataclass_mapper(
+            Reading,
+            indexes=[
+                orm.index(['sensor', 'ts'], options=[orm.SortedIndexOption()]),
+                orm.index('ts', options=[orm.SortedIndexOption()]),
+                orm.index('value'),
+            ],
+        ),
+    )
+
+
+_OPS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '>': operator.gt,
+}
+
+
+@pytest.mark.asyncs('asyncio')
+async def test_indexed_lookups():
+    rnd = random.Random(0)
+    registry = build_registry()
+    store = orm.InMemoryStore()
+
+    rows: list[tuple[str, int, int]] = []
+    async with orm.session(registry, store):
+        for _ in range(200):
+            r = (rnd.choice('abc'), rnd.randrange(50), rnd.randrange(10))
+            rows.append(r)
+            await orm.add(Reading(sensor=r[0], ts=r[1], value=r[2]))
+
+    for _ in range(200):
+        wis: list[orm.WhereItem] = []
+        for name in rnd.sample(['sensor', 'ts', 'value'], rnd.randrange(1, 4)):
+            op = rnd.choice(list(_OPS)) if name != 'sensor' else '='
+            v = rnd.choice('abcd') if name == 'sensor' else rnd.randrange(-1, 51)
+            wis.append(orm.WhereItem.of(name, op, v))
+
+        obis = [orm.OrderByItem(wi.name, rnd.choice(['asc', 'desc'])) for wi in rnd.sample(wis, rnd.randrange(len(wis) + 1))]  # noqa
+        limit = rnd.choice([None, 1, 5])
+
+        ex = [
+            r
+            for r in rows
+            if all(_OPS[wi.op.value](r[('sensor', 'ts', 'value').index(wi.name)], wi.value) for wi in wis)
+        ]
+
+        def order_key(r):
+            return tuple(
+                (-1 if obi.dir == 'desc' else 1) * (ord(x) if isinstance(x := r[('sensor', 'ts', 'value').index(obi.name)], str) else x)  # noqa
+                for obi in obis
+            )
+
+        async with orm.session(registry, store):
+            got = [
+                (o.sensor, o.ts, o.value)
+                for o in await orm.query(orm.Query(Reading, orm.Where(*wis), order_by=obis, limit=limit))
+            ]
+
+        assert all(r in ex for r in got)
+        assert sorted(got, key=order_key) == got
+        if limit is None:
+            assert sorted(got) == sorted(ex)
+        else:
+            assert [order_key(r) for r in got] == [order_key(r) for r in sorted(ex, key=order_key)[:limit]]
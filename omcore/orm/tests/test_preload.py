@@ -0,0 +1,74 @@
+import pytest
+
+from ... import orm
+from .models import Business
+from .models import Review
+from .models import User
+from .models import build_registry
+
+
+class _CountingStore(orm.InMemoryStore):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.num_reads = 0
+
+    async def _fetch(self, st, m, k):
+        self.num_reads += 1
+        return await super()._fetch(st, m, k)
+
+    async def _lookup(self, st, lu):
+        self.num_reads += 1
+        return await super()._lookup(st, lu)
+
+
+@pytest.mark.asyncs('asyncio')
+async def test_preload():
+    registry = build_registry()
+    store = _CountingStore()
+
+    async with orm.session(registry, store):
+        bs = [Business(name=f'b{i}') for i in range(10)]
+        us = [User(name=f'u{i}') for i in range(10)]
+        await orm.add(*bs, *us)
+        await orm.add(*[
+            Review(business=orm.ref(bs[i % 10]), user=orm.ref(us[i % 7]), text=f'r{i}')
+            for i in range(30)
+        ])
+
+    # Resolving each of many refs fetches a batch of them at once.
+    for bs, num_reads in [(100, 1), (3, 4)]:
+        async with orm.session(registry, store, batch_fetch_size=bs):
+            reviews = await orm.query(Review)
+
+            store.num_reads = 0
+            names = [(await r.business()).name for r in reviews]
+            assert store.num_reads == num_reads
+            assert sorted(names) == sorted(f'b{i % 10}' for i in range(30))
+
+    async with orm.session(registry, store):
+        businesses = await orm.query(Business)
+
+        store.num_reads = 0
+        await orm.preload(businesses, 'reviews.user')
+        assert store.num_reads == 2
+
+        for b in businesses:
+            for r in await b.reviews():
+                assert (await r.business()) is b
+                assert (await r.user()).name == f'u{int(r.text[1:]) % 7}'
+        assert store.num_reads == 2
+
+        # Writes to the referring mapper invalidate preloaded backrefs.
+        await orm.add(Review(business=orm.ref(businesses[0]), user=orm.ref(User, 1), text='new'))
+        assert len(await businesses[0].reviews()) == 4
+        assert store.num_reads == 3
+
+    # Refs are resolved one at a time by default.
+    async with orm.session(registry, store):
+        reviews = await orm.query(Review)
+
+        store.num_reads = 0
+        for r in reviews:
+            await r.business()
+        assert store.num_reads == 10
@@ -16,6 +16,7 @@ class WhereOp(enum.Enum):
     LE = '<='
     GE = '>='
     GT = '>'
+    IN = 'in'  # Against a collection of values.
 
 
 WhereOpGlyph: ta.TypeAlias = ta.Literal[
@@ -25,6 +26,7 @@ WhereOpGlyph: ta.TypeAlias = ta.Literal[
     '<=',
     '>=',
     '>',
+    'in',
 ]
 
 
@@ -44,6 +44,7 @@ from .asyncs import (  # noqa
     SyncToAsyncRows,
     SyncToAsyncTxn,
     SyncToAsyncConn,
+    SyncToAsyncConnectingDb,
     SyncToAsyncDb,
 )
 
@@ -89,6 +90,15 @@ from .errors import (  # noqa
     MismatchedColumnCountError,
 
     QueryError,
+
+    PoolError,
+    PoolTimeoutError,
+)
+
+from .pools import (  # noqa
+    DbapiConnectionPoolMetrics,
+    DbapiConnectionPool,
+    PooledDbapiDb,
 )
 
 from .queriers import (  # noqa
@@ -153,6 +163,8 @@ from .queries import (  # noqa
 
 from .rows import (  # noqa
     Row,
+
+    values_to_columns,
 )
 
 
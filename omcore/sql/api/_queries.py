@@ -13,6 +13,7 @@ from ..queries import Adapter as QueriesAdapter
 from ..queries import Stmt
 from ..queries.params import Param
 from ..queries.rendering import RenderedQuery
+from ..queries.rendering import RenderedQueryCache
 from ..queries.rendering import StdRenderer
 from .asquery import AsQueryContext
 from .asquery import as_query_
@@ -29,6 +30,10 @@ from .queries import RowParams
 ##
 
 
+# Stmts of the same structure - as repeatedly built by an ORM - render to the same text, and only need rebinding.
+_RENDERED_QUERY_CACHE = RenderedQueryCache()
+
+
 def _render_stmt(stmt: Stmt, ctx: AsQueryContext) -> RenderedQuery:
     a = ctx.adapter
     if a is not None:
@@ -41,7 +46,7 @@ def _render_stmt(stmt: Stmt, ctx: AsQueryContext) -> RenderedQuery:
         qa = QueriesAdapter()
         renderer_cls = StdRenderer
 
-    return renderer_cls.render_query(stmt, qa)
+    return renderer_cls.render_query(stmt, qa, cache=_RENDERED_QUERY_CACHE)
 
 
 def _bind_row(rq: RenderedQuery, param_values: ta.Mapping[Param, ta.Any] | None) -> ta.Any | None:
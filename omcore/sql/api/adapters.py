@@ -42,6 +42,10 @@ class Adapter(lang.Abstract):
     def last_insert_id_query(self) -> str | None:
         return self.dialect.last_insert_id_query
 
+    @property
+    def max_params(self) -> int | None:
+        return self.dialect.max_params
+
     @abc.abstractmethod
     def scan_type(self, c: Column) -> type:
         raise NotImplementedError
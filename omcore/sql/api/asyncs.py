@@ -1,4 +1,5 @@
 # ruff: noqa: RUF013 UP037 UP045
+import abc
 import contextlib
 import functools
 import typing as ta
@@ -129,6 +130,9 @@ class SyncToAsyncRows(AsyncRows):
 
         return v
 
+    async def to_columns(self) -> dict[str, ta.Sequence[ta.Any]]:
+        return await self._runner(self._rows.to_columns)
+
 
 class SyncToAsyncTxn(AsyncTxn):
     def __init__(self, runner: SyncToAsyncRunner, txn: Txn) -> None:
@@ -169,6 +173,19 @@ class SyncToAsyncConn(AsyncConn):
         return _SyncToAsyncRunnerContextManager(self._runner, lambda: self._conn.query(query), SyncToAsyncRows)
 
 
+class SyncToAsyncConnectingDb(Db, lang.Abstract):
+    """
+    A `Db` which connects on behalf of a `SyncToAsyncDb` without blocking its runner while it waits - as one waiting for
+    connections released by others, themselves running on that same runner, must.
+    """
+
+    @abc.abstractmethod
+    def sync_to_async_connect(self, runner: SyncToAsyncRunner, aes: contextlib.AsyncExitStack) -> ta.Awaitable[Conn]:
+        """Returns a connection for use on `runner`, registering its release with `aes`."""
+
+        raise NotImplementedError
+
+
 class SyncToAsyncDb(AsyncDb):
     def __init__(
             self,
@@ -187,6 +204,9 @@ class SyncToAsyncDb(AsyncDb):
     async def _connect(self, aes: contextlib.AsyncExitStack) -> AsyncConn:
         runner = await aes.enter_async_context(self._runner_factory())
 
+        if isinstance(self._db, SyncToAsyncConnectingDb):
+            return SyncToAsyncConn(runner, await self._db.sync_to_async_connect(runner, aes))
+
         rcm = _SyncToAsyncRunnerContextManager(runner, self._db.connect, SyncToAsyncConn)
         return await aes.enter_async_context(rcm)
 
@@ -8,6 +8,7 @@ from .queriers import AnyQuerier
 from .queriers import AsyncQuerier
 from .queriers import Querier
 from .rows import Row
+from .rows import values_to_columns
 
 
 ##
@@ -29,6 +30,11 @@ class Rows(AnyRows, ta.Iterator[Row], lang.Abstract):
     def __next__(self) -> Row:
         raise NotImplementedError
 
+    def to_columns(self) -> dict[str, ta.Sequence[ta.Any]]:
+        """Consumes the remaining rows, returning their values column-wise, keyed by column name."""
+
+        return values_to_columns(self.columns, [r.values for r in self])
+
 
 class AsyncRows(AnyRows, ta.AsyncIterator[Row], lang.Abstract):
     @ta.final
@@ -39,6 +45,11 @@ class AsyncRows(AnyRows, ta.AsyncIterator[Row], lang.Abstract):
     def __anext__(self) -> ta.Awaitable[Row]:
         raise NotImplementedError
 
+    async def to_columns(self) -> dict[str, ta.Sequence[ta.Any]]:
+        """Consumes the remaining rows, returning their values column-wise, keyed by column name."""
+
+        return values_to_columns(self.columns, [r.values async for r in self])
+
 
 ##
 
@@ -16,12 +16,14 @@ from .core import Rows
 from .core import Txn
 from .dialects import STANDARD_DIALECT
 from .dialects import Dialect
+from .errors import MismatchedColumnCountError
 from .queries import ManyParams
 from .queries import NoParams
 from .queries import Query
 from .queries import Queryable
 from .queries import RowParams
 from .rows import Row
+from .rows import values_to_columns
 
 
 T = ta.TypeVar('T')
@@ -89,25 +91,53 @@ def execute_dbapi_query(cursor: dbapi_abc.DbapiCursor, query: Query) -> None:
 
 
 class DbapiRows(Rows):
+    """
+    Fetches rows `arraysize` at a time with `fetchmany`, checking only the first of each batch against the columns.
+    """
+
+    DEFAULT_ARRAYSIZE: ta.ClassVar[int] = 256
+
     def __init__(
             self,
             cursor: dbapi_abc.DbapiCursor,
             columns: Columns,
+            *,
+            arraysize: int | None = None,
     ) -> None:
         super().__init__()
 
         self._cursor = cursor
         self._columns = columns
+        if arraysize is None:
+            arraysize = self.DEFAULT_ARRAYSIZE
+        check.arg(arraysize > 0, 'arraysize must be positive')
+        self._arraysize = arraysize
+
+        self._batch: ta.Iterator[ta.Sequence[ta.Any]] = iter(())
 
     @property
     def columns(self) -> Columns:
         return self._columns
 
+    def _check_values(self, values: ta.Sequence[ta.Sequence[ta.Any]]) -> ta.Sequence[ta.Sequence[ta.Any]]:
+        if values and len(values[0]) != len(self._columns):
+            raise MismatchedColumnCountError(self._columns, values[0])
+        return values
+
     def __next__(self) -> Row:
-        values = self._cursor.fetchone()
-        if values is None:
-            raise StopIteration
-        return Row(self._columns, values)
+        if (values := next(self._batch, None)) is None:
+            if not (batch := self._check_values(self._cursor.fetchmany(self._arraysize))):
+                raise StopIteration
+            self._batch = it = iter(batch)
+            values = next(it)
+
+        return Row.unchecked(self._columns, values)
+
+    def to_columns(self) -> dict[str, ta.Sequence[ta.Any]]:
+        values = list(self._batch)
+        self._batch = iter(())
+        values.extend(self._check_values(self._cursor.fetchall()))
+        return values_to_columns(self._columns, values)
 
 
 #
@@ -172,6 +202,7 @@ class DbapiConn(Conn):
             conn: dbapi_abc.DbapiConnection,
             *,
             adapter: DbapiAdapter | None = None,
+            arraysize: int | None = None,
     ) -> None:
         super().__init__()
 
@@ -179,6 +210,7 @@ class DbapiConn(Conn):
         if adapter is None:
             adapter = DbapiAdapter()
         self._adapter = adapter
+        self._arraysize = arraysize
 
         if not self._conn.autocommit:
             self._conn.autocommit = True
@@ -197,7 +229,7 @@ class DbapiConn(Conn):
         execute_dbapi_query(cursor, query)
         columns = build_dbapi_columns(cursor.description)
 
-        return DbapiRows(cursor, columns)
+        return DbapiRows(cursor, columns, arraysize=self._arraysize)
 
     def query(self, query: Queryable) -> ta.ContextManager[Rows]:
         @contextlib.contextmanager
@@ -221,6 +253,7 @@ class DbapiDb(Db):
             *,
             adapter: DbapiAdapter | None = None,
             param_style: ParamStyle | None = None,
+            arraysize: int | None = None,
     ) -> None:
         super().__init__()
 
@@ -232,13 +265,18 @@ class DbapiDb(Db):
         else:
             check.none(param_style)
         self._adapter = adapter
+        self._arraysize = arraysize
 
     @property
     def adapter(self) -> Adapter:
         return self._adapter
 
     def _connect(self, es: contextlib.ExitStack) -> DbapiConn:
-        return DbapiConn(es.enter_context(self._connector()), adapter=self._adapter)
+        return DbapiConn(
+            es.enter_context(self._connector()),
+            adapter=self._adapter,
+            arraysize=self._arraysize,
+        )
 
     def connect(self) -> ta.ContextManager[Conn]:
         @contextlib.contextmanager
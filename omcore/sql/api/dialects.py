@@ -36,6 +36,11 @@ class Dialect(lang.Abstract):
         # A self-contained query returning the connection's last auto-generated id, for backends without RETURNING.
         return None
 
+    @property
+    def max_params(self) -> int | None:
+        # The most bound parameters a single statement may carry, if known - bounding multi-row statements.
+        return None
+
 
 class StandardDialect(Dialect, lang.Final):
     pass
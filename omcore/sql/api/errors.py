@@ -22,3 +22,14 @@ class MismatchedColumnCountError(ColumnError):
 
 class QueryError(Error):
     pass
+
+
+##
+
+
+class PoolError(Error):
+    pass
+
+
+class PoolTimeoutError(PoolError, TimeoutError):
+    pass
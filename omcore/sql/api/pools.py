@@ -0,0 +1,588 @@
+"""
+Pooled dbapi connections. Prepared statements are left to drivers' own per-connection statement caches - sqlite3's
+`cached_statements`, psycopg's `prepare_threshold` and the like - which pooling keeps warm across checkouts, with
+`Config.on_connect` to configure them per connection.
+
+Async use is via `SyncToAsyncDb`, which waits for pooled connections on the event loop rather than on its runner's
+threads - which the connections already checked out need in order to be released.
+"""
+import collections
+import contextlib
+import functools
+import threading
+import time
+import typing as ta
+
+from ... import check
+from ... import dataclasses as dc
+from ... import lang
+from ...resources import SimpleResource
+from ..dbapi import abc as dbapi_abc
+from ..params import ParamStyle
+from .asyncs import SyncToAsyncConnectingDb
+from .asyncs import SyncToAsyncRunner
+from .dbapi import DbapiAdapter
+from .dbapi import DbapiConn
+from .dbapi import DbapiConnector
+from .dbapi import DbapiDb
+from .errors import PoolTimeoutError
+
+
+with lang.auto_proxy_import(globals()):
+    import asyncio
+
+
+##
+
+
+@dc.dataclass(frozen=True, kw_only=True)
+class DbapiConnectionPoolMetrics:
+    num_open: int
+    num_idle: int
+    num_in_use: int
+    num_overflow: int
+
+    num_created: int
+    num_closed: int
+    num_acquired: int
+    num_waited: int
+    num_timeouts: int
+    num_ping_failures: int
+    num_reset_failures: int
+    num_expired: int
+
+    total_wait_s: float
+
+
+@ta.final
+class _DbapiPoolEntry:
+    __slots__ = ('conn', 'es', 'created_at')
+
+    def __init__(self, conn: dbapi_abc.DbapiConnection, es: contextlib.ExitStack, created_at: float) -> None:
+        self.conn = conn
+        self.es = es
+        self.created_at = created_at
+
+
+class _NoneAvailable(lang.Marker):
+    pass
+
+
+def _set_future_result(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class DbapiConnectionPool(SimpleResource):
+    """
+    A thread-safe pool of up to `max_size` idle connections, plus up to `max_overflow` more opened under load and closed
+    once released with the pool's idle connections full. Idle connections are reused most recently released first, and
+    `min_size` are opened on entry.
+
+    Released connections are rolled back if they were left in a transaction, and closed if that fails.
+    """
+
+    @dc.dataclass(frozen=True, kw_only=True)
+    class Config:
+        min_size: int = 0
+        max_size: int = 5
+        max_overflow: int = 10
+
+        acquire_timeout_s: float | None = 30.
+
+        pre_ping: bool = False
+        ping_query: str = 'select 1'
+
+        reset_on_release: bool = True
+
+        max_lifetime_s: float | None = None
+
+        on_connect: ta.Callable[[dbapi_abc.DbapiConnection], None] | None = None
+
+        def __post_init__(self) -> None:
+            check.arg(0 <= self.min_size <= self.max_size, 'min_size must be between 0 and max_size')
+            check.arg(self.max_size > 0, 'max_size must be positive')
+            check.arg(self.max_overflow >= 0, 'max_overflow must not be negative')
+
+    def __init__(
+            self,
+            connector: DbapiConnector,
+            config: Config | None = None,
+            *,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """`clock` times connection lifetimes - waits for connections are always in real time."""
+
+        super().__init__()
+
+        self._connector = connector
+        self._config = config if config is not None else DbapiConnectionPool.Config()
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        self._async_waiters: collections.deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = collections.deque()
+        self._detached: set[asyncio.Future] = set()
+        self._idle: collections.deque[_DbapiPoolEntry] = collections.deque()
+        self._in_use: dict[int, _DbapiPoolEntry] = {}
+        self._num_open = 0  # Including those being opened.
+        self._closing = False
+
+        self._num_created = 0
+        self._num_closed = 0
+        self._num_acquired = 0
+        self._num_waited = 0
+        self._num_timeouts = 0
+        self._num_ping_failures = 0
+        self._num_reset_failures = 0
+        self._num_expired = 0
+        self._total_wait_s = 0.
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    def metrics(self) -> DbapiConnectionPoolMetrics:
+        with self._cond:
+            return DbapiConnectionPoolMetrics(
+                num_open=self._num_open,
+                num_idle=len(self._idle),
+                num_in_use=len(self._in_use),
+                num_overflow=max(0, self._num_open - self._config.max_size),
+
+                num_created=self._num_created,
+                num_closed=self._num_closed,
+                num_acquired=self._num_acquired,
+                num_waited=self._num_waited,
+                num_timeouts=self._num_timeouts,
+                num_ping_failures=self._num_ping_failures,
+                num_reset_failures=self._num_reset_failures,
+                num_expired=self._num_expired,
+
+                total_wait_s=self._total_wait_s,
+            )
+
+    #
+
+    def _notify(self, *, every: bool = False) -> None:
+        """With the lock held, wakes a waiter of each kind - thread and event loop - or every one of them."""
+
+        if every:
+            self._cond.notify_all()
+        else:
+            self._cond.notify()
+
+        while self._async_waiters:
+            loop, fut = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_set_future_result, fut)
+            except RuntimeError:  # Its loop is closed.
+                continue
+            if not every:
+                break
+
+    def _is_expired(self, ent: _DbapiPoolEntry) -> bool:
+        return (ml := self._config.max_lifetime_s) is not None and self._clock() - ent.created_at >= ml
+
+    def _close_entries(self, ents: ta.Iterable[_DbapiPoolEntry]) -> None:
+        n = 0
+        for ent in ents:
+            with contextlib.suppress(Exception):
+                ent.es.close()
+            n += 1
+
+        if n:
+            with self._cond:
+                self._num_closed += n
+
+    def _open_reserved(self) -> _DbapiPoolEntry:
+        es = contextlib.ExitStack()
+        try:
+            conn = es.enter_context(self._connector())
+            if (oc := self._config.on_connect) is not None:
+                oc(conn)
+
+        except BaseException:
+            es.close()
+            with self._cond:
+                self._num_open -= 1
+                self._notify()
+            raise
+
+        with self._cond:
+            self._num_created += 1
+
+        return _DbapiPoolEntry(conn, es, self._clock())
+
+    def _ping(self, ent: _DbapiPoolEntry) -> bool:
+        try:
+            cursor = ent.conn.cursor()
+            try:
+                cursor.execute(self._config.ping_query)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+
+        except Exception:  # noqa
+            return False
+
+        return True
+
+    def _reset(self, ent: _DbapiPoolEntry) -> bool:
+        """Rolls back any transaction left open on a connection, returning whether it can be reused."""
+
+        conn: ta.Any = ent.conn
+        try:
+            # Drivers which don't say whether a transaction is open are always rolled back.
+            if getattr(conn, 'in_transaction', True):
+                # In autocommit mode - as `DbapiConn` runs its connections - transactions are begun by statement, and
+                # the driver's rollback is a no-op.
+                if getattr(conn, 'autocommit', False):
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute('rollback')
+                    finally:
+                        cursor.close()
+                else:
+                    conn.rollback()
+
+        except Exception:  # noqa
+            return False
+
+        return True
+
+    def _try_take(self, expired: list[_DbapiPoolEntry]) -> _DbapiPoolEntry | type[_NoneAvailable] | None:
+        """
+        With the lock held, returns an idle connection, None having reserved a slot for a new one, or `_NoneAvailable`.
+        Expired idle connections are added to `expired` for the caller to close.
+        """
+
+        check.state(not self._closing, 'Pool is closed')
+
+        while self._idle:
+            ent = self._idle.pop()
+            if not self._is_expired(ent):
+                return ent
+            self._num_open -= 1
+            self._num_expired += 1
+            expired.append(ent)
+
+        if self._num_open < self._config.max_size + self._config.max_overflow:
+            self._num_open += 1
+            return None
+
+        return _NoneAvailable
+
+    def _begin_wait(self, now: float) -> float | None:
+        """With the lock held, counts a wait begun at `now`, returning its deadline."""
+
+        self._num_waited += 1
+        if (t := self._config.acquire_timeout_s) is not None:
+            return now + t
+        return None
+
+    def _take(self) -> _DbapiPoolEntry | None:
+        """Returns an idle connection, or None having reserved a slot for a new one."""
+
+        expired: list[_DbapiPoolEntry] = []
+        try:
+            with self._cond:
+                deadline: float | None = None
+                waited_since: float | None = None
+                try:
+                    while True:
+                        if (ent := self._try_take(expired)) is not _NoneAvailable:
+                            return ta.cast(_DbapiPoolEntry | None, ent)
+
+                        now = time.monotonic()
+                        if waited_since is None:
+                            waited_since = now
+                            deadline = self._begin_wait(now)
+
+                        if deadline is not None and now >= deadline:
+                            self._num_timeouts += 1
+                            raise PoolTimeoutError
+
+                        self._cond.wait(deadline - now if deadline is not None else None)
+
+                finally:
+                    if waited_since is not None:
+                        self._total_wait_s += time.monotonic() - waited_since
+
+        finally:
+            self._close_entries(expired)
+
+    async def _take_async(
+            self,
+            runner: SyncToAsyncRunner,
+    ) -> tuple[_DbapiPoolEntry | None, list[_DbapiPoolEntry]]:
+        """
+        Like `_take`, but waits on the running event loop, and returns the expired idle connections it took for the
+        caller to close rather than closing them itself.
+        """
+
+        loop = asyncio.get_running_loop()
+        expired: list[_DbapiPoolEntry] = []
+        deadline: float | None = None
+        waited_since: float | None = None
+        try:
+            while True:
+                with self._cond:
+                    if (ent := self._try_take(expired)) is not _NoneAvailable:
+                        return ta.cast(_DbapiPoolEntry | None, ent), expired
+
+                    now = time.monotonic()
+                    if waited_since is None:
+                        waited_since = now
+                        deadline = self._begin_wait(now)
+
+                    if deadline is not None and now >= deadline:
+                        self._num_timeouts += 1
+                        raise PoolTimeoutError
+
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+
+                leaving = True
+                try:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(waiter[1], deadline - now if deadline is not None else None)
+                    leaving = False
+
+                finally:
+                    with self._cond:
+                        if waiter in self._async_waiters:
+                            self._async_waiters.remove(waiter)
+                        elif leaving:
+                            # Woken but leaving without another try - hand the wakeup on.
+                            self._notify()
+
+        except BaseException:
+            if expired:
+                self._run_detached(runner, self._close_entries, expired)
+            raise
+
+        finally:
+            if waited_since is not None:
+                with self._cond:
+                    self._total_wait_s += time.monotonic() - waited_since
+
+    def _run_detached(self, runner: SyncToAsyncRunner, fn: ta.Callable, *args: ta.Any) -> asyncio.Future:
+        """Runs `fn` on `runner` to completion whether or not anything awaits it."""
+
+        fut = asyncio.ensure_future(runner(fn, *args))
+        self._detached.add(fut)
+        fut.add_done_callback(self._detached.discard)
+        return fut
+
+    def _ready(
+            self,
+            ent: _DbapiPoolEntry | None,
+            expired: ta.Sequence[_DbapiPoolEntry] = (),
+    ) -> dbapi_abc.DbapiConnection | None:
+        """
+        Opens a connection for a reserved slot, or pings a taken one if configured to, and checks it out - returning
+        None if its ping failed. Expired connections passed in are closed first.
+        """
+
+        self._close_entries(expired)
+
+        if ent is None:
+            ent = self._open_reserved()
+
+        elif self._config.pre_ping and not self._ping(ent):
+            with self._cond:
+                self._num_open -= 1
+                self._num_ping_failures += 1
+                self._notify()
+            self._close_entries([ent])
+            return None
+
+        with self._cond:
+            self._in_use[id(ent.conn)] = ent
+            self._num_acquired += 1
+
+        return ent.conn
+
+    def _release_abandoned(self, runner: SyncToAsyncRunner, fut: asyncio.Future) -> None:
+        if not fut.cancelled() and fut.exception() is None and (conn := fut.result()) is not None:
+            self._run_detached(runner, self.release, conn)
+
+    #
+
+    def _enter(self) -> None:
+        self.fill()
+
+    def _close(self, reason: BaseException | None) -> None:
+        with self._cond:
+            self._closing = True
+            ents = list(self._idle)
+            self._idle.clear()
+            self._num_open -= len(ents)
+            self._notify(every=True)
+
+        self._close_entries(ents)
+
+        super()._close(reason)
+
+    #
+
+    def fill(self) -> None:
+        """Opens connections until `min_size` are open."""
+
+        while True:
+            with self._cond:
+                if self._closing or self._num_open >= self._config.min_size:
+                    return
+                self._num_open += 1
+
+            ent = self._open_reserved()
+
+            with self._cond:
+                self._idle.appendleft(ent)
+                self._notify()
+
+    def evict_expired(self) -> None:
+        """Closes idle connections past `max_lifetime_s`, and refills to `min_size`."""
+
+        with self._cond:
+            expired = [ent for ent in self._idle if self._is_expired(ent)]
+            for ent in expired:
+                self._idle.remove(ent)
+            self._num_open -= len(expired)
+            self._num_expired += len(expired)
+            self._notify(every=True)
+
+        self._close_entries(expired)
+
+        self.fill()
+
+    def acquire(self) -> dbapi_abc.DbapiConnection:
+        """Raises `PoolTimeoutError` if none can be had within `acquire_timeout_s`."""
+
+        self._check_entered()
+
+        while True:
+            if (conn := self._ready(self._take())) is not None:
+                return conn
+
+    async def acquire_async(self, runner: SyncToAsyncRunner) -> dbapi_abc.DbapiConnection:
+        """
+        Like `acquire`, but waits on the running event loop rather than blocking a thread, running what does block -
+        opening, pinging, and closing connections - on `runner`.
+        """
+
+        self._check_entered()
+
+        while True:
+            ent, expired = await self._take_async(runner)
+
+            # Run detached so that a connection taken or reserved here is not lost if this is cancelled meanwhile.
+            fut = self._run_detached(runner, self._ready, ent, expired)
+            try:
+                conn = await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                fut.add_done_callback(functools.partial(self._release_abandoned, runner))
+                raise
+
+            if conn is not None:
+                return conn
+
+    def release(self, conn: dbapi_abc.DbapiConnection, *, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool - closing it if `discard` is set, if it can't be reset, if `max_size`
+        connections are already idle, or if it is past `max_lifetime_s`.
+        """
+
+        with self._cond:
+            ent = check.not_none(self._in_use.pop(id(conn), None))
+
+        if not discard and self._config.reset_on_release and not self._reset(ent):
+            discard = True
+            with self._cond:
+                self._num_reset_failures += 1
+
+        with self._cond:
+            if not (
+                    discard or
+                    self._closing or
+                    len(self._idle) >= self._config.max_size
+            ):
+                if not self._is_expired(ent):
+                    self._idle.append(ent)
+                    self._notify()
+                    return
+
+                self._num_expired += 1
+
+            self._num_open -= 1
+            self._notify()
+
+        self._close_entries([ent])
+
+##
+
+
+class PooledDbapiDb(DbapiDb, SyncToAsyncConnectingDb, SimpleResource):
+    """A `DbapiDb` checking its connections out of a `DbapiConnectionPool` which it owns, open while it is entered."""
+
+    def __init__(
+            self,
+            connector: DbapiConnector,
+            *,
+            pool_config: DbapiConnectionPool.Config | None = None,
+            adapter: DbapiAdapter | None = None,
+            param_style: ParamStyle | None = None,
+            arraysize: int | None = None,
+    ) -> None:
+        super().__init__(
+            connector,
+            adapter=adapter,
+            param_style=param_style,
+            arraysize=arraysize,
+        )
+
+        self._pool = DbapiConnectionPool(connector, pool_config)
+
+    @property
+    def pool(self) -> DbapiConnectionPool:
+        return self._pool
+
+    def _enter(self) -> None:
+        self._pool.__enter__()
+
+    def _close(self, reason: BaseException | None) -> None:
+        self._pool.close()
+
+        super()._close(reason)
+
+    def _release(self, conn: dbapi_abc.DbapiConnection, et, e, tb) -> None:
+        # Anything but an Exception - a cancellation, say - may have interrupted the connection mid-query.
+        self._pool.release(conn, discard=e is not None and not isinstance(e, Exception))
+
+    def _new_conn(self, conn: dbapi_abc.DbapiConnection) -> DbapiConn:
+        return DbapiConn(
+            conn,
+            adapter=self._adapter,
+            arraysize=self._arraysize,
+        )
+
+    def _connect(self, es: contextlib.ExitStack) -> DbapiConn:
+        self._check_entered()
+
+        conn = self._pool.acquire()
+        es.push(functools.partial(self._release, conn))
+
+        return self._new_conn(conn)
+
+    #
+
+    async def _release_async(self, runner: SyncToAsyncRunner, conn: dbapi_abc.DbapiConnection, et, e, tb) -> None:
+        await runner(self._release, conn, et, e, tb)
+
+    async def sync_to_async_connect(self, runner: SyncToAsyncRunner, aes: contextlib.AsyncExitStack) -> DbapiConn:
+        self._check_entered()
+
+        conn = await self._pool.acquire_async(runner)
+        aes.push_async_exit(functools.partial(self._release_async, runner, conn))
+
+        return await runner(self._new_conn, conn)
@@ -1,6 +1,6 @@
+import dataclasses as dc
 import typing as ta
 
-from ... import dataclasses as dc
 from ... import lang
 from .columns import Column
 from .columns import Columns
@@ -10,6 +10,9 @@ from .errors import MismatchedColumnCountError
 T = ta.TypeVar('T')
 
 
+_object_setattr = object.__setattr__
+
+
 ##
 
 
@@ -22,37 +25,77 @@ class ColumnAccessor(lang.Final, ta.Generic[T]):
         return self.__row[name]
 
 
-@dc.dataclass(frozen=True)
 class Row(lang.Final, ta.Generic[T]):
-    columns: Columns
-    values: ta.Sequence[T]
+    """
+    A slotted, immutable row. Rows of a result share its `Columns`, and with them its precomputed name-to-index map, so
+    they carry nothing but their values.
+    """
+
+    __slots__ = ('_columns', '_values')
+
+    def __init__(self, columns: Columns, values: ta.Sequence[T]) -> None:
+        if len(columns) != len(values):
+            raise MismatchedColumnCountError(columns, values)
+
+        _object_setattr(self, '_columns', columns)
+        _object_setattr(self, '_values', values)
+
+    @classmethod
+    def unchecked(cls, columns: Columns, values: ta.Sequence[T]) -> Row[T]:
+        """Skips the column count check, for callers which have already checked their values' shape."""
 
-    def __post_init__(self) -> None:
-        if len(self.columns) != len(self.values):
-            raise MismatchedColumnCountError(self.columns, self.values)
+        row = object.__new__(cls)
+        _object_setattr(row, '_columns', columns)
+        _object_setattr(row, '_values', values)
+        return row
+
+    def __setattr__(self, name: str, value: ta.Any) -> ta.NoReturn:
+        raise dc.FrozenInstanceError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name: str) -> ta.NoReturn:
+        raise dc.FrozenInstanceError(f'cannot delete field {name!r}')
+
+    @property
+    def columns(self) -> Columns:
+        return self._columns
+
+    @property
+    def values(self) -> ta.Sequence[T]:
+        return self._values
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__qualname__}(columns={self._columns!r}, values={self._values!r})'
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._columns == other._columns and self._values == other._values  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash((self._columns, self._values))
 
     #
 
     def __iter__(self) -> ta.Iterator[tuple[Column, T]]:
-        return iter(zip(self.columns, self.values))
+        return iter(zip(self._columns, self._values))
 
     def __len__(self) -> int:
-        return len(self.values)
+        return len(self._values)
 
     def __contains__(self, item: str | int) -> bool:
         raise TypeError('Row.__contains__ is ambiguous - use .columns.__contains__ or .values.__contains__')
 
     def __getitem__(self, item: str | int) -> T:
         if isinstance(item, str):
-            return self.values[self.columns.index(item)]
+            return self._values[self._columns.index(item)]
         elif isinstance(item, int):
-            return self.values[item]
+            return self._values[item]
         else:
             raise TypeError(item)
 
     def get(self, name: str) -> T | None:
-        if (idx := self.columns.get_index(name)) is not None:
-            return self.values[idx]
+        if (idx := self._columns.get_index(name)) is not None:
+            return self._values[idx]
         else:
             return None
 
@@ -62,3 +105,18 @@ class Row(lang.Final, ta.Generic[T]):
 
     def to_dict(self) -> dict[str, ta.Any]:
         return {c.name: v for c, v in self}
+
+
+##
+
+
+def values_to_columns(columns: Columns, values: ta.Iterable[ta.Sequence[T]]) -> dict[str, ta.Sequence[T]]:
+    """Transposes row-wise values to column-wise, keyed by column name."""
+
+    if not (cvs := list(zip(*values))):
+        return {c.name: () for c in columns}
+
+    if len(cvs) != len(columns):
+        raise MismatchedColumnCountError(columns, cvs)
+
+    return {c.name: cv for c, cv in zip(columns, cvs)}
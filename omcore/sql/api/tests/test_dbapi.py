@@ -0,0 +1,75 @@
+import contextlib
+import sqlite3
+
+import pytest
+
+from .... import lang
+from .. import querierfuncs as qf
+from ..asyncs import ImmediateSyncToAsyncRunner
+from ..asyncs import SyncToAsyncDb
+from ..dbapi import DbapiDb
+from ..errors import MismatchedColumnCountError
+from ..rows import Row
+
+
+def _sqlite_db(**kwargs) -> DbapiDb:
+    return DbapiDb(lambda: contextlib.closing(sqlite3.connect(':memory:', autocommit=True)), **kwargs)
+
+
+@pytest.mark.parametrize('arraysize', [None, 1, 7, 1000])
+def test_batched_rows(exit_stack, arraysize):
+    conn = exit_stack.enter_context(_sqlite_db(arraysize=arraysize).connect())
+    qf.exec(conn, 'create table t (a integer, b text)')
+    qf.exec_many(conn, 'insert into t values (?, ?)', [(i, str(i)) for i in range(100)])
+
+    with qf.query(conn, 'select a, b from t order by a') as rows:
+        out = list(rows)
+
+    assert [(r['a'], r.c.b) for r in out] == [(i, str(i)) for i in range(100)]
+    assert all(r.columns is out[0].columns for r in out)
+
+    with qf.query(conn, 'select a, b from t order by a') as rows:
+        first = [next(rows) for _ in range(10)]
+        cols = rows.to_columns()
+
+    assert [r[0] for r in first] == list(range(10))
+    assert list(cols) == ['a', 'b']
+    assert list(cols['a']) == list(range(10, 100))
+    assert list(cols['b']) == [str(i) for i in range(10, 100)]
+
+    with qf.query(conn, 'select a, b from t where a < 0') as rows:
+        assert rows.to_columns() == {'a': (), 'b': ()}
+
+
+def test_row():
+    with qf.query(_sqlite_db(), 'select 1 as a, 2 as b') as rows:
+        row = next(rows)
+
+    assert row.values == (1, 2)
+    assert row.get('b') == 2
+    assert row.get('c') is None
+    assert row.to_dict() == {'a': 1, 'b': 2}
+    assert row == Row(row.columns, (1, 2))
+    assert hash(row) == hash(Row(row.columns, (1, 2)))
+
+    with pytest.raises(AttributeError):
+        row.values = (3, 4)  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        row._values = (3, 4)  # noqa
+    with pytest.raises(AttributeError):
+        del row._columns  # noqa
+    assert row.values == (1, 2)
+
+    with pytest.raises(MismatchedColumnCountError):
+        Row(row.columns, (1,))
+
+
+def test_async_to_columns():
+    adb = SyncToAsyncDb(ImmediateSyncToAsyncRunner, _sqlite_db())
+
+    async def inner():
+        async with adb.connect() as conn:
+            async with qf.query(conn, 'select 1 as a union all select 2') as rows:
+                return await rows.to_columns()
+
+    assert lang.sync_await(inner()) == {'a': (1, 2)}
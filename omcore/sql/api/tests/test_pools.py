@@ -0,0 +1,153 @@
+import asyncio
+import concurrent.futures as cf
+import contextlib
+import sqlite3
+import threading
+
+import pytest
+
+from .. import querierfuncs as qf
+from ..asyncs import AsyncioToExecutorSyncToAsyncRunner
+from ..asyncs import SyncToAsyncDb
+from ..errors import PoolTimeoutError
+from ..pools import DbapiConnectionPool
+from ..pools import PooledDbapiDb
+
+
+def _sqlite_connector(conns: list | None = None):
+    def inner():
+        conn = sqlite3.connect(':memory:', autocommit=True, check_same_thread=False)
+        if conns is not None:
+            conns.append(conn)
+        return contextlib.closing(conn)
+
+    return inner
+
+
+def test_reuse():
+    with PooledDbapiDb(_sqlite_connector()) as db:
+        for i in range(3):
+            with db.connect() as conn:
+                assert qf.query_scalar(conn, 'select ?', (i,)) == i
+
+        m = db.pool.metrics()
+        assert (m.num_created, m.num_acquired, m.num_idle, m.num_in_use) == (1, 3, 1, 0)
+
+    assert db.pool.metrics().num_open == 0
+
+
+def test_min_size():
+    with DbapiConnectionPool(_sqlite_connector(), DbapiConnectionPool.Config(min_size=2)) as pool:
+        m = pool.metrics()
+        assert (m.num_open, m.num_idle) == (2, 2)
+
+
+def test_overflow():
+    cfg = DbapiConnectionPool.Config(max_size=1, max_overflow=1, acquire_timeout_s=.05)
+    with DbapiConnectionPool(_sqlite_connector(), cfg) as pool:
+        c1, c2 = pool.acquire(), pool.acquire()
+        assert pool.metrics().num_overflow == 1
+
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+
+        pool.release(c1)
+        pool.release(c2)
+
+        m = pool.metrics()
+        assert (m.num_open, m.num_idle, m.num_closed, m.num_timeouts) == (1, 1, 1, 1)
+
+
+def test_wait_for_release():
+    with DbapiConnectionPool(_sqlite_connector(), DbapiConnectionPool.Config(max_size=1, max_overflow=0)) as pool:
+        c = pool.acquire()
+        threading.Timer(.05, pool.release, (c,)).start()
+
+        assert pool.acquire() is c
+        assert pool.metrics().num_waited == 1
+
+
+def test_pre_ping():
+    conns: list = []
+    with DbapiConnectionPool(_sqlite_connector(conns), DbapiConnectionPool.Config(pre_ping=True)) as pool:
+        pool.release(pool.acquire())
+        conns[0].close()
+
+        c = pool.acquire()
+        assert c is conns[1]
+
+        m = pool.metrics()
+        assert (m.num_created, m.num_ping_failures, m.num_open) == (2, 1, 1)
+
+
+def test_max_lifetime():
+    now = [0.]
+    with DbapiConnectionPool(
+            _sqlite_connector(),
+            DbapiConnectionPool.Config(min_size=1, max_lifetime_s=10.),
+            clock=lambda: now[0],
+    ) as pool:
+        c1 = pool.acquire()
+        pool.release(c1)
+
+        now[0] = 5.
+        assert pool.acquire() is c1
+        now[0] = 15.
+        pool.release(c1)
+        assert pool.metrics().num_expired == 1
+
+        pool.evict_expired()
+        assert pool.acquire() is not c1
+
+        m = pool.metrics()
+        assert (m.num_created, m.num_closed) == (2, 1)
+
+
+def test_reset():
+    with PooledDbapiDb(_sqlite_connector(), pool_config=DbapiConnectionPool.Config(max_size=1)) as db:
+        with db.connect() as conn:
+            qf.exec(conn, 'begin')
+            qf.exec(conn, 'create table t (x int)')
+
+        with db.connect() as conn:
+            assert not qf.query_all(conn, "select * from sqlite_master where name = 't'")
+
+        m = db.pool.metrics()
+        assert (m.num_created, m.num_reset_failures) == (1, 0)
+
+
+def test_reset_failure():
+    conns: list = []
+    with DbapiConnectionPool(_sqlite_connector(conns), DbapiConnectionPool.Config(max_size=1)) as pool:
+        c = pool.acquire()
+        c.execute('begin')
+        c.close()
+        pool.release(c)
+
+        assert pool.acquire() is conns[1]
+
+        m = pool.metrics()
+        assert (m.num_created, m.num_closed, m.num_reset_failures) == (2, 1, 1)
+
+
+def test_async():
+    # More connections than runner threads - waiting on the runner's threads for one to be released would deadlock.
+    cfg = DbapiConnectionPool.Config(max_size=2, max_overflow=0, acquire_timeout_s=5.)
+
+    async def inner(db, exe):
+        adb = SyncToAsyncDb(AsyncioToExecutorSyncToAsyncRunner.factory(exe), db)
+
+        async def query(i):
+            async with adb.connect() as conn:
+                return await qf.query_scalar(conn, 'select ?', (i,))
+
+        return await asyncio.gather(*[query(i) for i in range(8)])
+
+    with cf.ThreadPoolExecutor(1) as exe:
+        with PooledDbapiDb(_sqlite_connector(), pool_config=cfg) as db:
+            assert asyncio.run(inner(db, exe)) == list(range(8))
+
+            m = db.pool.metrics()
+            assert m.num_created <= 2
+            assert m.num_timeouts == 0
+            assert m.num_in_use == 0
@@ -27,3 +27,7 @@ class MysqlDialect(Dialect):
     @property
     def last_insert_id_query(self) -> str | None:
         return 'select last_insert_id()'
+
+    @property
+    def max_params(self) -> int | None:
+        return 65535
@@ -8,3 +8,8 @@ class PostgresDialect(Dialect):
     @property
     def supports_returning(self) -> bool:
         return True
+
+    @property
+    def max_params(self) -> int | None:
+        # The wire protocol counts parameters in an int16, which some drivers (asyncpg) treat as signed.
+        return 32767
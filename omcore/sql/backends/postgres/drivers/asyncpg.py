@@ -46,8 +46,8 @@ def build_asyncpg_columns(
 
 
 class _NullAsyncpgCursor:
-    async def fetchrow(self) -> None:
-        return None
+    async def fetch(self, n: int) -> list:
+        return []
 
 
 _NULL_ASYNCPG_CURSOR = _NullAsyncpgCursor()
@@ -57,25 +57,35 @@ _NULL_ASYNCPG_CURSOR = _NullAsyncpgCursor()
 
 
 class AsyncpgRows(AsyncRows):
+    DEFAULT_PREFETCH: ta.ClassVar[int] = 256
+
     def __init__(
             self,
             cursor: ta.Any,
             columns: Columns,
+            *,
+            prefetch: int | None = None,
     ) -> None:
         super().__init__()
 
         self._cursor = cursor
         self._columns = columns
+        self._prefetch = prefetch if prefetch is not None else self.DEFAULT_PREFETCH
+
+        self._batch: ta.Iterator[ta.Any] = iter(())
 
     @property
     def columns(self) -> Columns:
         return self._columns
 
     async def __anext__(self) -> Row:
-        rec = await self._cursor.fetchrow()
-        if rec is None:
-            raise StopAsyncIteration
-        return Row(self._columns, tuple(rec))
+        if (rec := next(self._batch, None)) is None:
+            if not (recs := await self._cursor.fetch(self._prefetch)):
+                raise StopAsyncIteration
+            self._batch = it = iter(recs)
+            rec = next(it)
+
+        return Row.unchecked(self._columns, tuple(rec))
 
 
 #
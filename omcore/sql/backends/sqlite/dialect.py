@@ -8,3 +8,8 @@ class SqliteDialect(Dialect):
     @property
     def supports_returning(self) -> bool:
         return True
+
+    @property
+    def max_params(self) -> int | None:
+        # SQLITE_MAX_VARIABLE_NUMBER defaults to 32766 since 3.32, but to 999 before it.
+        return 999
@@ -108,6 +108,7 @@ from .relations import (  # noqa
 
 from .rendering import (  # noqa
     RenderedQuery,
+    RenderedQueryCache,
     RenderedQueryParams,
     RenderedQueryParts,
     Renderer,
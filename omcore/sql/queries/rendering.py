@@ -3,6 +3,8 @@ TODO:
  - quote mode lol
   - general 'modes' dc
 """
+import collections
+import threading
 import typing as ta
 
 from ... import check
@@ -71,6 +73,108 @@ class RenderedQuery(lang.Final):
     literals: ta.Mapping[Param, ta.Any] | None = None
 
 
+##
+
+
+class _LiteralParamMarker(lang.Marker):
+    pass
+
+
+class _UnnamedParamMarker(lang.Marker):
+    pass
+
+
+@ta.final
+class _RenderedQueryTemplate:
+    """
+    A rendered query stripped of its query's identity - unnamed params and parameterized literals are positional slots
+    in the order the structural walk met them, rebound to each structurally identical query's own.
+    """
+
+    __slots__ = ('s', 'params', 'unnamed_params', 'literal_params')
+
+    def __init__(
+            self,
+            s: str,
+            params: RenderedQueryParams | None,
+            unnamed_params: ta.Sequence[Param],
+            literal_params: ta.Sequence[Param],
+    ) -> None:
+        self.s = s
+        self.params = params
+        self.unnamed_params = unnamed_params
+        self.literal_params = literal_params
+
+    def bind(self, unnamed_params: ta.Sequence[Param], literals: ta.Sequence[Literal]) -> RenderedQuery:
+        params = self.params
+        if params is not None and unnamed_params:
+            m = dict(zip(self.unnamed_params, unnamed_params))
+            if isinstance(params, ta.Mapping):
+                params = {k: m.get(p, p) for k, p in params.items()}
+            else:
+                params = [m.get(p, p) for p in params]
+
+        return RenderedQuery(
+            self.s,
+            params,
+            {p: l.v for p, l in zip(self.literal_params, literals)} or None,
+        )
+
+
+class RenderedQueryCache(lang.Final):
+    """
+    A thread-safe LRU cache of rendered queries keyed by renderer, renderer args, and query structure - the node tree
+    with its parameterized literal values and unnamed param identities factored out. Structurally identical queries skip
+    rendering and go straight to parameter binding.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+
+        check.arg(max_size > 0, 'max_size must be positive')
+        self._max_size = max_size
+
+        self._lock = threading.Lock()
+        self._dct: collections.OrderedDict[ta.Any, _RenderedQueryTemplate] = collections.OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}<size={len(self._dct)}, hits={self._hits}, misses={self._misses}>'
+
+    def __len__(self) -> int:
+        return len(self._dct)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dct.clear()
+
+    def _get(self, key: ta.Any) -> _RenderedQueryTemplate | None:
+        with self._lock:
+            if (tmpl := self._dct.get(key)) is not None:
+                self._dct.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+            return tmpl
+
+    def _put(self, key: ta.Any, tmpl: _RenderedQueryTemplate) -> None:
+        with self._lock:
+            self._dct[key] = tmpl
+            self._dct.move_to_end(key)
+            while len(self._dct) > self._max_size:
+                self._dct.popitem(last=False)
+
+
 class Renderer(lang.Abstract):
     def __init__(self, adapter: Adapter | None = None) -> None:
         super().__init__()
@@ -81,6 +185,7 @@ class Renderer(lang.Abstract):
 
         self._seen_params: dict[Param, int] = {}
         self._literal_params: dict[Param, ta.Any] = {}
+        self._literal_param_nodes: list[tuple[Literal, Param]] = []
 
     #
 
@@ -116,11 +221,15 @@ class Renderer(lang.Abstract):
     def literal_params(self) -> ta.Mapping[Param, ta.Any] | None:
         return self._literal_params or None
 
-    def _make_literal_param(self, o: ta.Any) -> Param:
+    def _make_literal_param(self, o: Literal) -> Param:
         p = Param()
-        self._literal_params[p] = o
+        self._literal_params[p] = o.v
+        self._literal_param_nodes.append((o, p))
         return p
 
+    def _is_literal_inlined(self, o: Literal) -> bool:
+        return False
+
     #
 
     @dispatch.method(
@@ -140,15 +249,110 @@ class Renderer(lang.Abstract):
             r.literal_params(),
         )
 
-    @classmethod
-    def render_query(cls, o: ta.Any, *args: ta.Any, **kwargs: ta.Any) -> RenderedQuery:
-        rqp = cls.render_query_parts(o, *args, **kwargs)
+    def _render_query(self, o: ta.Any) -> RenderedQuery:
         return RenderedQuery(
-            tp.render(rqp.p),
-            rqp.params,
-            rqp.literals,
+            tp.render(self.render(o)),
+            self.rendered_params(),
+            self.literal_params(),
         )
 
+    @classmethod
+    def render_query(
+            cls,
+            o: ta.Any,
+            *args: ta.Any,
+            cache: RenderedQueryCache | None = None,
+            **kwargs: ta.Any,
+    ) -> RenderedQuery:
+        r = cls(*args, **kwargs)
+        if cache is None:
+            return r._render_query(o)  # noqa
+
+        sk, unnamed_params, literals = r._structure_key(o)  # noqa
+        key = (cls, args, tuple(sorted(kwargs.items())), sk)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable values in the tree - render uncached.
+            return r._render_query(o)  # noqa
+
+        if (tmpl := cache._get(key)) is not None:  # noqa
+            return tmpl.bind(unnamed_params, literals)
+
+        rq = r._render_query(o)  # noqa
+
+        if (literal_params := r._match_literal_params(literals)) is not None:  # noqa
+            cache._put(key, _RenderedQueryTemplate(rq.s, rq.params, unnamed_params, literal_params))  # noqa
+
+        return rq
+
+    #
+
+    def _structure_key(self, o: ta.Any) -> tuple[tuple[ta.Any, ...], list[Param], list[Literal]]:
+        """
+        Flattens a node tree to a hashable key of everything which affects its rendering. Parameterized literals and
+        unnamed params are replaced by markers, and returned in the order they were met.
+        """
+
+        out: list[ta.Any] = []
+        unnamed_params: dict[Param, int] = {}
+        literals: list[Literal] = []
+
+        def rec(v: ta.Any) -> None:
+            if isinstance(v, Node):
+                cls = v.__class__
+                out.append(cls)
+                if cls is Literal:
+                    if self._is_literal_inlined(v):
+                        out.append(v.v.__class__)
+                        out.append(v.v)
+                    else:
+                        out.append(_LiteralParamMarker)
+                        literals.append(v)
+                else:
+                    for f in cls._fields().cmp_fields:  # noqa
+                        rec(getattr(v, f))
+
+            elif isinstance(v, Param):
+                if v.n is not None:
+                    out.append(v)
+                else:
+                    out.append(_UnnamedParamMarker)
+                    out.append(unnamed_params.setdefault(v, len(unnamed_params)))
+
+            elif isinstance(v, tuple):
+                out.append(tuple)
+                out.append(len(v))
+                for e in v:
+                    rec(e)
+
+            else:
+                out.append(v)
+
+        rec(o)
+        return tuple(out), list(unnamed_params), literals
+
+    def _match_literal_params(self, literals: ta.Sequence[Literal]) -> list[Param] | None:
+        """
+        Matches the params made for literals while rendering to the structural walk's literals, or returns None if the
+        two disagree - as when a renderer renders a literal more or less than once - making the query uncacheable.
+        """
+
+        by_node: dict[int, collections.deque[Param]] = {}
+        for n, p in self._literal_param_nodes:
+            by_node.setdefault(id(n), collections.deque()).append(p)
+
+        out: list[Param] = []
+        for l in literals:
+            if not (ps := by_node.get(id(l))):
+                return None
+            out.append(ps.popleft())
+
+        if any(by_node.values()):
+            return None
+
+        return out
+
 
 class StdRenderer(Renderer):
     # parens
@@ -208,19 +412,22 @@ class StdRenderer(Renderer):
         int,
     )
 
-    @Renderer.render.register
-    def render_literal(self, o: Literal) -> tp.Part:
+    def _is_literal_inlined(self, o: Literal) -> bool:
         if self._adapter.literal_style == 'param_all':
-            pass
+            return False
 
         elif self._adapter.literal_style == 'safe_only':
-            if isinstance(o.v, self.SAFE_LITERAL_TYPES):
-                return str(o.v)
+            return isinstance(o.v, self.SAFE_LITERAL_TYPES)
 
         else:
             raise ValueError(self._adapter.literal_style)
 
-        return self.render(self._make_literal_param(o.v))
+    @Renderer.render.register
+    def render_literal(self, o: Literal) -> tp.Part:
+        if self._is_literal_inlined(o):
+            return str(o.v)
+
+        return self.render(self._make_literal_param(o))
 
     @Renderer.render.register
     def render_name_expr(self, o: NameExpr) -> tp.Part:
@@ -431,9 +638,15 @@ def render_parts(n: Node, *, adapter: Adapter | None = None, **kwargs: ta.Any) -
     return StdRenderer.render_query_parts(n, adapter)
 
 
-def render(n: Node, *, adapter: Adapter | None = None, **kwargs: ta.Any) -> RenderedQuery:
+def render(
+        n: Node,
+        *,
+        adapter: Adapter | None = None,
+        cache: RenderedQueryCache | None = None,
+        **kwargs: ta.Any,
+) -> RenderedQuery:
     if adapter is None:
         adapter = Adapter(**kwargs)
     elif kwargs:
         raise TypeError('Provide adapter or individual config kwargs, not both')
-    return StdRenderer.render_query(n, adapter)
+    return StdRenderer.render_query(n, adapter, cache=cache)
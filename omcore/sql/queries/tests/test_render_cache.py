@@ -0,0 +1,75 @@
+from ...params import ParamStyle
+from ...params import substitute_params
+from .. import Adapter
+from .. import Q
+from ..rendering import RenderedQueryCache
+from ..rendering import render
+
+
+def _bound(rq, param_values=None):
+    return substitute_params(rq.params, {**(param_values or {}), **(rq.literals or {})}, strict=True)
+
+
+def test_cache_hits_same_structure():
+    cache = RenderedQueryCache()
+    a = Adapter(param_style=ParamStyle.QMARK, literal_style='param_all')
+
+    for i in range(3):
+        q = Q.select([Q.i.x], Q.n.t, Q.and_(Q.eq(Q.i.x, Q.p.x), Q.eq(Q.i.y, f'y{i}')))
+        rq = render(q, adapter=a, cache=cache)
+        assert rq.s == render(q, adapter=a).s == 'select "x" from "t" where ("x" = ? and "y" = ?)'
+        assert _bound(rq, {Q.p.x: i}) == [i, f'y{i}']
+
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_inlined_literals_are_structure():
+    cache = RenderedQueryCache()
+    a = Adapter(param_style=ParamStyle.QMARK)
+
+    for v in [1, 2, 1, True]:
+        rq = render(Q.select([Q.i.x], Q.n.t, Q.eq(Q.i.x, v)), adapter=a, cache=cache)
+        assert rq.s == f'select "x" from "t" where "x" = {v}'  # noqa  # expected rendering, never executed
+
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_cache_unnamed_params_rebound():
+    cache = RenderedQueryCache()
+    a = Adapter(param_style=ParamStyle.NUMERIC)
+
+    for _ in range(2):
+        p0, p1 = Q.p(), Q.p()
+        rq = render(Q.select([p0, p1, p0]), adapter=a, cache=cache)
+        assert rq.s == 'select :1, :2, :1'
+        assert _bound(rq, {p0: 'a', p1: 'b'}) == ['a', 'b']
+
+    p = Q.p()
+    rq = render(Q.select([p, p, p]), adapter=a, cache=cache)
+    assert rq.s == 'select :1, :1, :1'
+    assert _bound(rq, {p: 'c'}) == ['c']
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_keyed_by_adapter():
+    cache = RenderedQueryCache()
+    q = Q.select([Q.i.x], Q.n.t, Q.eq(Q.i.x, Q.p.x))
+
+    assert render(q, param_style=ParamStyle.QMARK, cache=cache).s == 'select "x" from "t" where "x" = ?'
+    assert render(q, param_style=ParamStyle.PYFORMAT, cache=cache).s == 'select "x" from "t" where "x" = %(x)s'
+    assert render(q, param_style=ParamStyle.QMARK, cache=cache).s == 'select "x" from "t" where "x" = ?'
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_max_size():
+    cache = RenderedQueryCache(max_size=2)
+    a = Adapter(param_style=ParamStyle.QMARK)
+
+    for n in ['a', 'b', 'a', 'c', 'b']:
+        render(Q.select([Q.i.x], Q.n(n)), adapter=a, cache=cache)
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 4)
@@ -5,7 +5,7 @@
 # @om-generated
 # @om-amalg-output ../ci/cli.py
 # @om-git-diff-omit
-# ruff: noqa: FURB188 N802 PYI034 TC003 UP006 UP007 UP036 UP037 UP043 UP045 UP046
+# ruff: noqa: FURB188 N802 PYI034 TC003 UP006 UP007 UP036 UP037 UP041 UP043 UP045 UP046
 """
 Inputs:
  - requirements.txt
@@ -27,6 +27,7 @@ import asyncio
 import asyncio.base_subprocess
 import asyncio.subprocess
 import base64
+import bisect
 import collections
 import collections.abc
 import concurrent.futures as cf
@@ -99,6 +100,7 @@ def __om_amalg__():  # noqa
             dict(path='../../omcore/http/urllib.py', sha1='fc273565255546f42152ab2dfc264feb8c8b8dc6'),
             dict(path='../../omcore/http/versions.py', sha1='b903c3bec4fdbe699ff0536c89c0f9c40b6ee890'),
             dict(path='../../omcore/io/pipelines/errors.py', sha1='42c3991496edf534c7a09d30cff8c6b919f80c50'),
+            dict(path='../../omcore/io/streambufs/_scanning_py.py', sha1='50bc68f17ad51947ad68b986d449307ab05b8509'),
             dict(path='../../omcore/io/streambufs/errors.py', sha1='6b04cc2e4ba5461692128938a2bd5c261486746b'),
             dict(path='../../omcore/lite/abstract.py', sha1='a2fc3f3697fa8de5247761e9d554e70176f37aac'),
             dict(path='../../omcore/lite/asyncs.py', sha1='6bd4b8ecc310ac1df19bafaf6eb85a1a284f65d5'),
@@ -131,9 +133,9 @@ def __om_amalg__():  # noqa
             dict(path='../../omcore/argparse/parsers.py', sha1='46321356fbfd17d94eeb0347e86eb042a9333d37'),
             dict(path='../../omcore/formats/yaml/goyaml/errors.py', sha1='298b4d892d840ce98afb520143da35c56b98fb39'),
             dict(path='../../omcore/http/headers.py', sha1='0486a9e31f4ed77163e6b388bb15fc864b1a01ef'),
-            dict(path='../../omcore/http/parsing.py', sha1='24bdc721ed0005175f5ed371f4222b116a552d63'),
-            dict(path='../../omcore/http/pipelines/compression/codings.py', sha1='18baac5a24e320417b94316439bf873302c2dc32'),  # noqa
-            dict(path='../../omcore/io/pipelines/core.py', sha1='629ab14961ca7b35893b7e5f1e781dcafb0beacb'),
+            dict(path='../../omcore/http/parsing.py', sha1='0c6df9997cd1e429b124d96005cc8807d02d1aea'),
+            dict(path='../../omcore/http/pipelines/compression/codings.py', sha1='4431108f21a84479a801936681e8e423293d3751'),  # noqa
+            dict(path='../../omcore/io/pipelines/core.py', sha1='3bb2aad1972ff9e42bafbc5d21a6137d4657960e'),
             dict(path='../../omcore/io/streambufs/types.py', sha1='3edeaaa038f975595ba3eeea10f7e313d84723bb'),
             dict(path='../../omcore/lite/json.py', sha1='01124e62093ebd4078602f16df0ec04cb724a612'),
             dict(path='../../omcore/lite/marshal.py', sha1='9b3f4ff802344313147f412f8f028922afc52b2f'),
@@ -164,7 +166,6 @@ def __om_amalg__():  # noqa
             dict(path='../../omcore/io/pipelines/flow/types.py', sha1='81ead96b6a9487fbda313e858d75701ebe2d5518'),
             dict(path='../../omcore/io/pipelines/sched/types.py', sha1='ff77ef20dd7750c25af4ab4826de06afe3b53bac'),
             dict(path='../../omcore/io/streambufs/base.py', sha1='0f0cea0fe05f9d7b4669a7b3871bc78e12af98f6'),
-            dict(path='../../omcore/io/streambufs/framing.py', sha1='de1f818064576e855f20b005ea7855a1fd5f3f56'),
             dict(path='../../omcore/io/streambufs/utils.py', sha1='62d7fce79bae738c199627668bdee8bb389efa1e'),
             dict(path='../../omcore/lite/inject.py', sha1='7dd6067b626c4c6a371b7a0e50eac54e320fcf3a'),
             dict(path='../../omcore/logs/contexts.py', sha1='529adb527492309bf8cde342271ac6ea2ebbf8a1'),
@@ -183,15 +184,16 @@ def __om_amalg__():  # noqa
             dict(path='../../omcore/formats/yaml/goyaml/ast.py', sha1='e06a0e8a88ef896e4194e4f053dc7e2e14bbe631'),
             dict(path='../../omcore/formats/yaml/goyaml/scanning.py', sha1='58956f9159780d5532d2d61fb6f11c8ac946003d'),
             dict(path='../../omcore/http/pipelines/chunking.py', sha1='613ff1e7cc183872f73f89bc962376257925f534'),
-            dict(path='../../omcore/http/pipelines/compression/compressors.py', sha1='560abca3f4989ddb7c8c121a4ce862f87dea71a1'),  # noqa
-            dict(path='../../omcore/http/pipelines/compression/decompressors.py', sha1='70cdf7b80791f7d230afdadba498520f56c04a20'),  # noqa
+            dict(path='../../omcore/http/pipelines/compression/compressors.py', sha1='b491287ae0a7df31120f48b77b7c03f318bbccd6'),  # noqa
+            dict(path='../../omcore/http/pipelines/compression/decompressors.py', sha1='a6a912287b32d4ae042571851aaf4d92621d6792'),  # noqa
             dict(path='../../omcore/http/pipelines/encoders.py', sha1='2d36c841643c792ffacf0b8377ff06db244ffe42'),
             dict(path='../../omcore/http/pipelines/requests.py', sha1='b825e91750b19e96176fd0e872eb8bdded965f01'),
             dict(path='../../omcore/http/pipelines/responses.py', sha1='3145565e89891902ecd2ce193fac1609d3a26fe6'),
             dict(path='../../omcore/http/simple/handlers.py', sha1='43502a58069673135882066ba939c99ea2f8dfc1'),
             dict(path='../../omcore/io/pipelines/handlers/decoders.py', sha1='79e73945acbb2eb6c19543950f572bcb51387d72'),  # noqa
+            dict(path='../../omcore/io/pipelines/sched/wheel.py', sha1='1908214ee8ca66b900520273aa2eda1f7a91b5d4'),
             dict(path='../../omcore/io/streambufs/direct.py', sha1='5a629d79aa7f618dce40e11c2609bc0dcd008599'),
-            dict(path='../../omcore/io/streambufs/scanning.py', sha1='36411208b4e6515528f0310c7052b3faf2572b24'),
+            dict(path='../../omcore/io/streambufs/scanning.py', sha1='9cee14466174532dfde8f5c96d8f4d487fdcfa97'),
             dict(path='../../omcore/logs/base.py', sha1='4195705c64f3ec1c4263c2c76c63351d9dacdd5c'),
             dict(path='../../omcore/logs/std/records.py', sha1='fb1e2d887248cc24b0463156836d9965a06c8ab6'),
             dict(path='../../omcore/logs/std/standard.py', sha1='223e3cba0f2854c5093fb60d6cef2f27b80c193c'),
@@ -203,7 +205,8 @@ def __om_amalg__():  # noqa
             dict(path='../specs/oci/pack/packing.py', sha1='8f343e23dbd144c77e9dcdeb6d5e37c7649402ad'),
             dict(path='../../omcore/formats/yaml/goyaml/parsing.py', sha1='46c0a4008cdbce7493f2358eb9541a48adacf64e'),
             dict(path='../../omcore/http/pipelines/servers/responses.py', sha1='2c0be02c7a0510348e93cea96c4376d531b6a19c'),  # noqa
-            dict(path='../../omcore/io/streambufs/segmented.py', sha1='ad3c91e91d7b91396c51549fc7578419b1c3d336'),
+            dict(path='../../omcore/io/streambufs/framing.py', sha1='3f1ea224a36e5afc287d318e2b8d4cb92acf4128'),
+            dict(path='../../omcore/io/streambufs/segmented.py', sha1='5dd5ba71c2d8716eea38210099c569a6e2e03b65'),
             dict(path='../../omcore/logs/asyncs.py', sha1='6b444494a0512f7b7ea2c93be5c4a9868deb7251'),
             dict(path='../../omcore/logs/std/loggers.py', sha1='144a96b3b190a5641f3b7cc2656d6ffa4e45b5a9'),
             dict(path='../../omcore/subprocesses/asyncs.py', sha1='8d428af73220f793d2c0e93f5c9966fac9474246'),
@@ -216,11 +219,12 @@ def __om_amalg__():  # noqa
             dict(path='../../omcore/formats/yaml/goyaml/decoding.py', sha1='73e387af353d56ed6c3f817e490038aa1ba940c8'),
             dict(path='../../omcore/http/pipelines/aggregators.py', sha1='2788fff67d15aff9648521dd04e8dec3463e6d96'),
             dict(path='../../omcore/io/pipelines/bytes/decoders.py', sha1='4f0df234d6fba71e485378de06fa6c1f9276e6ef'),
+            dict(path='../../omcore/io/pipelines/drivers/sockets.py', sha1='69ea02f3a09425e9d5a9e9f81daa092b6aff524d'),
             dict(path='../../omcore/logs/modules.py', sha1='b51c2d4396854b515d29cee17f906d5cc47eb7f2'),
             dict(path='../dataserver/http.py', sha1='e39f673cc82c78cd806b44a37a19902a01321c49'),
             dict(path='../specs/oci/dataserver.py', sha1='b5469f2a1e797e7e04c468d8243a877910136e80'),
-            dict(path='../../omcore/http/pipelines/decoders.py', sha1='26ad861596fd85d8bc68b3d9612217fb9a098b7e'),
-            dict(path='../../omcore/io/pipelines/drivers/sync.py', sha1='e0ab886dbe7d62834e3f7a0eb01acd983bc66894'),
+            dict(path='../../omcore/http/pipelines/decoders.py', sha1='a4b2772957bb91188333b1d1b43d815c3e04fa09'),
+            dict(path='../../omcore/io/pipelines/drivers/sync.py', sha1='8140278348ea344acb9dddac93be03da41595f8f'),
             dict(path='../../omcore/lite/timing.py', sha1='af5022f5a508939f1b433ed0514ede340fd0d672'),
             dict(path='cache.py', sha1='f448ea9fe7384e6d2bcf398abfc6d53673d70c98'),
             dict(path='docker/cmds.py', sha1='8c7d8c21691403d9e4bbd613fca23bd910f67e4d'),
@@ -1211,6 +1215,141 @@ class FlowControlValidationIoPipelineError(IoPipelineError):
     pass
 
 
+########################################
+# ../../../omcore/io/streambufs/_scanning_py.py
+"""
+Pure-Python reference implementations of the functions of the optional `_scanning` extension, which must behave
+identically. `scanning` exports the extension's versions when it is available, and these otherwise.
+"""
+
+
+##
+
+
+_FIND_LONGEST_PATS: ta.Dict[ta.Tuple[bytes, ...], ta.Tuple[ta.Any, ta.Any, int]] = {}
+
+
+def _find_longest_pats(subs: ta.Tuple[bytes, ...]) -> ta.Tuple[ta.Any, ta.Any, int]:
+    try:
+        return _FIND_LONGEST_PATS[subs]
+    except KeyError:
+        pass
+
+    if not subs:
+        raise ValueError('no subs')
+    if any(not s for s in subs):
+        raise ValueError('empty sub')
+
+    # Alternation tries its branches in order, so at the leftmost position matched the first sub to match wins. One
+    # group per sub lets `lastindex` name it.
+    pat = re.compile(b'|'.join(b'(' + re.escape(s) + b')' for s in subs))
+    first_pat = re.compile(b'[' + b''.join(re.escape(s[:1]) for s in subs) + b']')
+
+    if len(_FIND_LONGEST_PATS) >= 256:
+        _FIND_LONGEST_PATS.clear()
+    ret = _FIND_LONGEST_PATS[subs] = (pat, first_pat, max(len(s) for s in subs) - 1)
+    return ret
+
+
+def find_longest(segs: ta.Sequence[ta.Any], subs: ta.Sequence[bytes], start: int = 0) -> ta.Tuple[int, int]:
+    """
+    Searches the stream formed by concatenating the bytes-like `segs` for the earliest occurrence of any of `subs` at or
+    after `start`, returning its position and the index of the first of `subs` which occurs there - so ordering `subs`
+    longest first picks the longest match. Returns (-1, -1) if none occurs.
+    """
+
+    pat, first_pat, ov = _find_longest_pats(tuple(subs))
+
+    if start < 0:
+        start = 0
+
+    n = len(segs)
+    i = 0
+    base = 0
+    while i < n:
+        sl = len(segs[i])
+        if base + sl > start:
+            break
+        base += sl
+        i += 1
+
+    lo = start - base
+    while i < n:
+        s = segs[i]
+        sl = len(s)
+
+        # Matches starting within the last `ov` bytes may be cut short - or missed - by the end of the segment, so only
+        # earlier ones are final.
+        tail = sl - ov
+        m = pat.search(s, lo)
+        if m is not None and m.start() < tail:
+            return base + m.start(), m.lastindex - 1
+
+        wlo = lo if lo > tail else tail
+        if ov and i + 1 < n and (m is not None or first_pat.search(s, wlo) is not None):
+            parts = [s[wlo:]]
+            need = ov
+            j = i + 1
+            while need and j < n:
+                p = segs[j][:need]
+                parts.append(p)
+                need -= len(p)
+                j += 1
+
+            # Matches starting after the boundary would be cut short by the end of the window - they're found from the
+            # next segment instead.
+            wm = pat.search(b''.join(parts))
+            if wm is not None and wm.start() < sl - wlo:
+                return base + wlo + wm.start(), wm.lastindex - 1
+
+        elif m is not None:
+            return base + m.start(), m.lastindex - 1
+
+        base += sl
+        lo = 0
+        i += 1
+
+    return -1, -1
+
+
+def scan_length_fields(
+        buf: ta.Any,
+        offset: int,
+        length: int,
+        byteorder: str,
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    """
+    Returns the total lengths of the consecutive length-field-prefixed frames laid out wholly within the bytes-like
+    `buf` from its start, where each frame's total length is its unsigned length field's value plus `adjustment` plus
+    `offset + length`. Stops at the first frame which is incomplete, whose total length is shorter than its header, or
+    which is longer than `limit`.
+    """
+
+    if offset < 0:
+        raise ValueError(offset)
+    if length not in (1, 2, 4, 8):
+        raise ValueError(length)
+    if byteorder not in ('big', 'little'):
+        raise ValueError(byteorder)
+
+    mv = memoryview(buf)
+    n = len(mv)
+    end_off = offset + length
+
+    out: ta.List[int] = []
+    p = 0
+    while n - p >= end_off:
+        t = int.from_bytes(mv[p + offset:p + end_off], byteorder) + adjustment + end_off  # type: ignore[arg-type]
+        if t < end_off or t > n - p or (limit is not None and t > limit):
+            break
+        out.append(t)
+        p += t
+
+    return out
+
+
 ########################################
 # ../../../omcore/io/streambufs/errors.py
 
@@ -4786,23 +4925,52 @@ class ParsedHttpHeaders:
 
     Field names are stored in lowercase. Values are decoded as Latin-1. Multiple values for the same field-name are
     stored individually and combined with ``", "`` on access (except Set-Cookie, which is never combined).
+
+    When parsed with ``lazy_headers`` values are held as offsets into the message and only validated and decoded when
+    their field is first accessed, so a malformed value raises from that access rather than from parsing.
     """
 
     def __init__(self) -> None:
-        # normalized name -> list of individual values
-        self._entries: ta.Dict[str, ta.List[str]] = {}
+        # normalized name -> list of individual values - or, for lazily parsed values not yet accessed, their spans
+        self._entries: ta.Dict[str, ta.List[ta.Any]] = {}
 
         # insertion-ordered unique names
         self._order: ta.List[str] = []
 
+        # names with values still held as spans, and the callable validating and decoding a span - both left None when
+        # eagerly parsed, so the accessors below only pay a single attribute check for laziness
+        self._lazy_names: ta.Optional[ta.Set[str]] = None
+        self._lazy_decoder: ta.Optional[ta.Callable[[ta.Any], str]] = None
+
     def _add(self, name: str, value: str) -> None:
         if name not in self._entries:
             self._entries[name] = []
             self._order.append(name)
         self._entries[name].append(value)
 
+    def _add_lazy(self, name: str, span: ta.Any, decoder: ta.Callable[[ta.Any], str]) -> None:
+        self._lazy_decoder = decoder
+        if (lazy_names := self._lazy_names) is None:
+            lazy_names = self._lazy_names = set()
+        lazy_names.add(name)
+        if (values := self._entries.get(name)) is None:
+            self._entries[name] = [span]
+            self._order.append(name)
+        else:
+            values.append(span)
+
+    def _decode_lazy(self, key: str) -> ta.List[str]:
+        values = self._entries[key]
+        decoder = self._lazy_decoder
+        values[:] = [v if isinstance(v, str) else decoder(v) for v in values]  # type: ignore[misc]
+        self._lazy_names.discard(key)  # type: ignore[union-attr]
+        return values
+
     @property
     def entries(self) -> ta.Mapping[str, ta.Sequence[str]]:
+        if self._lazy_names:
+            for name in list(self._lazy_names):
+                self._decode_lazy(name)
         return self._entries
 
     def __contains__(self, name: ta.Any) -> bool:
@@ -4817,14 +4985,18 @@ class ParsedHttpHeaders:
 
     def __getitem__(self, name: str) -> str:
         key = name.lower()
-        values = self._entries[key]
-        if key in self._NO_COMBINE_HEADERS:
+        if key in self._NO_COMBINE_HEADERS and key in self._entries:
             raise NoCombineHeaderHttpParseError(name)
-        return ', '.join(values)
+        if self._lazy_names and key in self._lazy_names:
+            return ', '.join(self._decode_lazy(key))
+        return ', '.join(self._entries[key])
 
     def get(self, name: str, default: ta.Optional[str] = None) -> ta.Optional[str]:
         key = name.lower()
-        values = self._entries.get(key)
+        if self._lazy_names and key in self._lazy_names:
+            values = self._decode_lazy(key)
+        else:
+            values = self._entries.get(key)
         if not values:
             return default
 
@@ -4836,12 +5008,18 @@ class ParsedHttpHeaders:
         return ', '.join(values)
 
     def get_all(self, name: str) -> ta.List[str]:
-        return list(self._entries.get(name.lower(), []))
+        key = name.lower()
+        if self._lazy_names and key in self._lazy_names:
+            return list(self._decode_lazy(key))
+        return list(self._entries.get(key, []))
 
     def items(self) -> ta.List[ta.Tuple[str, str]]:
         result: ta.List[ta.Tuple[str, str]] = []
         for name in self._order:
-            values = self._entries[name]
+            if self._lazy_names and name in self._lazy_names:
+                values = self._decode_lazy(name)
+            else:
+                values = self._entries[name]
             if name in self._NO_COMBINE_HEADERS:
                 for v in values:
                     result.append((name, v))
@@ -4940,6 +5118,68 @@ class RawParsedHttpHeader:
         return f'{self.__class__.__name__}({self.name!r}, {self.value!r})'
 
 
+class _HttpHeaderSpan(ta.NamedTuple):
+    """Offsets into the message of a lazily parsed field, with its already validated and normalized name."""
+
+    name: str
+    name_start: int
+    name_end: int
+    value_start: int
+    value_end: int
+    line: int
+
+
+class _LazyRawParsedHttpHeaders(ta.Sequence[RawParsedHttpHeader]):
+    """The raw headers of a lazily parsed message, validating all field-values on first access to any."""
+
+    def __init__(
+            self,
+            ctx: '_HttpParseContext',
+            fields: ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]],
+    ) -> None:
+        super().__init__()
+
+        self._ctx = ctx
+        self._fields = fields
+
+        self._headers: ta.Optional[ta.List[RawParsedHttpHeader]] = None
+
+    def _materialize(self) -> ta.List[RawParsedHttpHeader]:
+        if (hs := self._headers) is None:
+            hs = self._headers = [
+                self._ctx.lazy_raw_header(f) if isinstance(f, _HttpHeaderSpan) else f
+                for f in self._fields
+            ]
+        return hs
+
+    @ta.overload
+    def __getitem__(self, i: int) -> RawParsedHttpHeader:
+        ...
+
+    @ta.overload
+    def __getitem__(self, i: slice) -> ta.Sequence[RawParsedHttpHeader]:
+        ...
+
+    def __getitem__(self, i):
+        return self._materialize()[i]
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __iter__(self) -> ta.Iterator[RawParsedHttpHeader]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyRawParsedHttpHeaders):
+            other = other._materialize()  # noqa
+        return self._materialize() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
 @dc.dataclass()
 class ParsedHttpMessage:
     class Kind(enum.Enum):
@@ -4964,7 +5204,7 @@ class ParsedHttpMessage:
 
     status_line: ta.Optional[StatusLine]
 
-    raw_headers: ta.List[RawParsedHttpHeader]
+    raw_headers: ta.Sequence[RawParsedHttpHeader]
     headers: ParsedHttpHeaders
 
     prepared: PreparedParsedHttpHeaders
@@ -5007,6 +5247,11 @@ class HttpParser:
         max_header_length: ta.Optional[int] = 8192
         max_content_length_str_len: ta.Optional[int] = 20
 
+        # Defers validating and decoding field-values until accessed. Line structure and field-names are always
+        # checked up front, as are the fields consulted to build the prepared headers. Applies only to messages, not
+        # trailers.
+        lazy_headers: bool = False
+
     def __init__(self, config: Config = Config()) -> None:
         super().__init__()
 
@@ -5057,14 +5302,28 @@ class HttpParser:
         # 5. Parse header fields
         # Position after start-line CRLF (or LF if bare LF allowed)
         header_start = start_line_end + ctx.line_ending_len(start_line_end)
-        raw_headers = ctx.parse_header_fields(header_start)
-
-        # 6. Build normalized headers
+        raw_headers: ta.Sequence[RawParsedHttpHeader]
         headers = ParsedHttpHeaders()
-        for rh in raw_headers:
-            name_str = rh.name.decode('ascii').lower()
-            value_str = rh.value.decode('latin-1')
-            headers._add(name_str, value_str)  # noqa
+
+        if self._config.lazy_headers:
+            fields = ctx.scan_header_fields(header_start)
+            raw_headers = _LazyRawParsedHttpHeaders(ctx, fields)
+
+            # 6. Build normalized headers, holding value spans
+            for f in fields:
+                if isinstance(f, _HttpHeaderSpan):
+                    headers._add_lazy(f.name, f, ctx.decode_lazy_header_value)  # noqa
+                else:
+                    headers._add(ctx.normalize_header_name(f.name), f.value.decode('latin-1'))  # noqa
+
+        else:
+            raw_headers = ctx.parse_header_fields(header_start)
+
+            # 6. Build normalized headers
+            for rh in raw_headers:
+                name_str = ctx.normalize_header_name(rh.name)
+                value_str = rh.value.decode('latin-1')
+                headers._add(name_str, value_str)  # noqa
 
         # 7. Build prepared headers
         prepared = ctx.prepare_headers(headers, kind, http_version)
@@ -5107,7 +5366,7 @@ class HttpParser:
         # Build normalized headers
         headers = ParsedHttpHeaders()
         for rh in raw_headers:
-            name_str = rh.name.decode('ascii').lower()
+            name_str = ctx.normalize_header_name(rh.name)
             value_str = rh.value.decode('latin-1')
             headers._add(name_str, value_str)  # noqa
 
@@ -5175,6 +5434,87 @@ class _HttpParseContext:
     _TCHAR_BYTES = bytes(sorted(_TCHAR))
     _VCHAR_BYTES = bytes(range(0x21, 0x7F))
 
+    # Well-known field-names, normalized, and their conventional spellings. Being valid tokens these need no validation,
+    # and are normalized by a single dict lookup rather than a decode and lower.
+    _WELL_KNOWN_HEADER_NAME_SPELLINGS: ta.ClassVar[ta.Mapping[str, ta.Sequence[str]]] = {
+        n: sorted({n, n.upper(), '-'.join(p.capitalize() for p in n.split('-')), *ss})
+        for n, ss in {
+            'accept': (),
+            'accept-charset': (),
+            'accept-encoding': (),
+            'accept-language': (),
+            'accept-ranges': (),
+            'access-control-request-headers': (),
+            'access-control-request-method': (),
+            'age': (),
+            'authorization': (),
+            'cache-control': (),
+            'connection': (),
+            'content-disposition': (),
+            'content-encoding': (),
+            'content-language': (),
+            'content-length': (),
+            'content-range': (),
+            'content-type': (),
+            'cookie': (),
+            'date': (),
+            'dnt': (),
+            'etag': ('ETag',),
+            'expect': (),
+            'expires': (),
+            'forwarded': (),
+            'host': (),
+            'if-match': (),
+            'if-modified-since': (),
+            'if-none-match': (),
+            'if-range': (),
+            'if-unmodified-since': (),
+            'keep-alive': (),
+            'last-modified': (),
+            'location': (),
+            'origin': (),
+            'pragma': (),
+            'priority': (),
+            'proxy-authorization': (),
+            'range': (),
+            'referer': (),
+            'sec-ch-ua': ('Sec-CH-UA',),
+            'sec-ch-ua-mobile': ('Sec-CH-UA-Mobile',),
+            'sec-ch-ua-platform': ('Sec-CH-UA-Platform',),
+            'sec-fetch-dest': (),
+            'sec-fetch-mode': (),
+            'sec-fetch-site': (),
+            'sec-fetch-user': (),
+            'server': (),
+            'set-cookie': (),
+            'te': (),
+            'trailer': (),
+            'transfer-encoding': (),
+            'upgrade': (),
+            'upgrade-insecure-requests': (),
+            'user-agent': (),
+            'vary': (),
+            'via': (),
+            'www-authenticate': ('WWW-Authenticate',),
+            'x-forwarded-for': ('X-Forwarded-For',),
+            'x-forwarded-host': (),
+            'x-forwarded-proto': (),
+            'x-real-ip': ('X-Real-IP',),
+            'x-request-id': ('X-Request-ID',),
+            'x-requested-with': (),
+        }.items()
+    }
+
+    _WELL_KNOWN_HEADER_NAMES: ta.ClassVar[ta.Mapping[bytes, str]] = {
+        s.encode('ascii'): n
+        for n, ss in _WELL_KNOWN_HEADER_NAME_SPELLINGS.items()
+        for s in ss
+    }
+
+    @classmethod
+    def normalize_header_name(cls, name: Bytes) -> str:
+        return cls._WELL_KNOWN_HEADER_NAMES.get(name) or name.decode('ascii').lower()  # type: ignore[call-overload]
+
     # Terminator verification
 
     def verify_terminator(self) -> None:
@@ -5302,6 +5642,13 @@ class _HttpParseContext:
             offset=length,
         )
 
+    def _is_plain_crlf(self, start: int) -> bool:
+        """Whether the data from *start* holds no NUL and no CR or LF other than as CRLF pairs."""
+
+        data = self.data
+        n = data.count(self._CRLF, start)
+        return data.count(b'\r', start) == n and data.count(b'\n', start) == n and data.find(b'\x00', start) < 0
+
     def line_ending_len(self, line_end_pos: int) -> int:
         """Return the length of the line ending at *line_end_pos* (1 for LF, 2 for CRLF)."""
 
@@ -5547,11 +5894,31 @@ class _HttpParseContext:
     def parse_header_fields(self, start: int) -> ta.List[RawParsedHttpHeader]:
         """Parse all header fields from *start* until the empty-line terminator."""
 
-        headers: ta.List[RawParsedHttpHeader] = []
+        return self._parse_header_lines(start, lazy=False)  # type: ignore[return-value]
+
+    def scan_header_fields(self, start: int) -> ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]]:
+        """
+        Like ``parse_header_fields`` but, for the lazy path, only validates field-names and line structure - returning
+        spans of fields whose values are left to ``lazy_header_value``. Folded fields, having no single span in the
+        data, are still parsed eagerly.
+        """
+
+        return self._parse_header_lines(start, lazy=True)
+
+    def _parse_header_lines(
+            self,
+            start: int,
+            lazy: bool,
+    ) -> ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]]:
+        headers: ta.List[ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]] = []
         pos = start
         data = self.data
         self.current_line = 1  # line 0 is the start-line
 
+        # When every line ends in a plain CRLF, lines are found by a single find() each. Otherwise find_line_end scans
+        # them, and raises the precise error for whatever is wrong.
+        plain_crlf = self._is_plain_crlf(start)
+
         while pos < len(data):
             # Check for the empty line that terminates headers. Whichever empty-line form we stop at, nothing may
             # follow it: this is the authoritative trailing-data check. verify_terminator only gates existence and in
@@ -5587,11 +5954,10 @@ class _HttpParseContext:
                 )
 
             # Find end of this header line
-            line_end = self.find_line_end(pos)
-            line_data = data[pos:line_end]
+            line_end = data.find(self._CRLF, pos) if plain_crlf else self.find_line_end(pos)
             next_pos = line_end + self.line_ending_len(line_end)
 
-            if self.config.max_header_length is not None and len(line_data) > self.config.max_header_length:
+            if self.config.max_header_length is not None and line_end - pos > self.config.max_header_length:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                     message='Header line exceeds maximum length',
@@ -5615,13 +5981,13 @@ class _HttpParseContext:
                         )
 
                     # Unfold: find the end of the continuation line
-                    cont_line_end = self.find_line_end(next_pos)
+                    cont_line_end = data.find(self._CRLF, next_pos) if plain_crlf else self.find_line_end(next_pos)
                     cont_data = data[next_pos:cont_line_end]
 
                     # Replace fold with single SP
                     if obs_buf is None:
                         obs_buf = io.BytesIO()
-                        obs_buf.write(line_data)
+                        obs_buf.write(data[pos:line_end])
                     obs_buf.write(b' ')
                     obs_buf.write(cont_data.lstrip(b' \t'))
 
@@ -5638,11 +6004,14 @@ class _HttpParseContext:
                 else:
                     break
 
-            if obs_buf is not None:
-                line_data = obs_buf.getvalue()
-
             # Parse field-name : field-value
-            header = self._parse_one_header(line_data, pos)
+            header: ta.Union[RawParsedHttpHeader, _HttpHeaderSpan]
+            if obs_buf is not None:
+                header = self._parse_one_header(obs_buf.getvalue(), pos)
+            elif lazy:
+                header = self._scan_one_header(pos, line_end)
+            else:
+                header = self._parse_one_header(data[pos:line_end], pos)
             headers.append(header)
 
             pos = next_pos
@@ -5693,16 +6062,27 @@ class _HttpParseContext:
             )
 
         name_bytes = line_data[:colon_idx]
-        value_bytes = line_data[colon_idx + 1:]
+        if name_bytes not in self._WELL_KNOWN_HEADER_NAMES:
+            name_bytes = self._check_field_name(name_bytes, line_start_offset, self.current_line)
+
+        return RawParsedHttpHeader(
+            name=name_bytes,
+            value=self._check_field_value(
+                line_data[colon_idx + 1:],
+                line_start_offset + colon_idx + 1,
+                self.current_line,
+            ),
+        )
 
-        # Validate field-name
+    def _check_field_name(self, name_bytes: Bytes, offset: int, line: int) -> Bytes:
+        """Validate a field-name, returning it stripped of any allowed trailing whitespace."""
 
         if not name_bytes:
             raise HeaderFieldHttpParseError(
                 code=HeaderFieldHttpParseErrorCode.EMPTY_FIELD_NAME,
                 message='Empty field-name before colon',
-                line=self.current_line,
-                offset=line_start_offset,
+                line=line,
+                offset=offset,
             )
 
         # Check for space before colon
@@ -5711,8 +6091,8 @@ class _HttpParseContext:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.SPACE_BEFORE_COLON,
                     message='Whitespace between field-name and colon',
-                    line=self.current_line,
-                    offset=line_start_offset + len(name_bytes) - 1,
+                    line=line,
+                    offset=offset + len(name_bytes) - 1,
                 )
 
             # Strip trailing whitespace from name if allowed
@@ -5721,8 +6101,8 @@ class _HttpParseContext:
                 raise HeaderFieldHttpParseError(
                     code=HeaderFieldHttpParseErrorCode.EMPTY_FIELD_NAME,
                     message='Field-name is only whitespace before colon',
-                    line=self.current_line,
-                    offset=line_start_offset,
+                    line=line,
+                    offset=offset,
                 )
 
         # Validate name characters (regex fast-path; fallback scan on failure)
@@ -5732,27 +6112,30 @@ class _HttpParseContext:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.NUL_IN_HEADER,
                         message='NUL byte in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b >= 0x80:
                     raise EncodingHttpParseError(
                         code=EncodingHttpParseErrorCode.NON_ASCII_IN_FIELD_NAME,
                         message=f'Non-ASCII byte 0x{b:02x} in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b not in self._TCHAR:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_NAME,
                         message=f'Invalid character 0x{b:02x} in field-name',
-                        line=self.current_line,
-                        offset=line_start_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
-        # Process field-value
+        return name_bytes
+
+    def _check_field_value(self, value_bytes: Bytes, offset: int, line: int) -> Bytes:
+        """Validate a field-value, returning it stripped of OWS."""
 
         # Strip OWS
         value_stripped = self._strip_ows_bytes(value_bytes)
@@ -5762,8 +6145,8 @@ class _HttpParseContext:
             raise HeaderFieldHttpParseError(
                 code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                 message='Empty header field value not allowed',
-                line=self.current_line,
-                offset=line_start_offset + colon_idx + 1,
+                line=line,
+                offset=offset,
             )
 
         # Validate value characters (Translation fast-path)
@@ -5777,7 +6160,6 @@ class _HttpParseContext:
         invalid_chars = value_stripped.translate(None, allowed_bytes)
 
         if invalid_chars:
-            value_base_offset = line_start_offset + colon_idx + 1
             # We only enter this Python loop if we ALREADY found an error.
             # This keeps the "happy path" fast while maintaining detailed error reporting.
             for i, b in enumerate(value_stripped):
@@ -5785,8 +6167,8 @@ class _HttpParseContext:
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.NUL_IN_HEADER,
                         message='NUL byte in field-value',
-                        line=self.current_line,
-                        offset=value_base_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
                 if b == self._CR:
@@ -5794,8 +6176,8 @@ class _HttpParseContext:
                         raise HeaderFieldHttpParseError(
                             code=HeaderFieldHttpParseErrorCode.BARE_CARRIAGE_RETURN,
                             message='Bare CR in field-value',
-                            line=self.current_line,
-                            offset=value_base_offset + i,
+                            line=line,
+                            offset=offset + i,
                         )
                     continue
 
@@ -5805,21 +6187,61 @@ class _HttpParseContext:
                         raise EncodingHttpParseError(
                             code=EncodingHttpParseErrorCode.OBS_TEXT_IN_FIELD_VALUE,
                             message=f'obs-text byte 0x{b:02x} rejected by config',
-                            line=self.current_line,
-                            offset=value_base_offset + i,
+                            line=line,
+                            offset=offset + i,
                         )
 
                     # General character error
                     raise HeaderFieldHttpParseError(
                         code=HeaderFieldHttpParseErrorCode.INVALID_FIELD_VALUE,
                         message=f'Invalid character 0x{b:02x} in field-value',
-                        line=self.current_line,
-                        offset=value_base_offset + i,
+                        line=line,
+                        offset=offset + i,
                     )
 
+        return value_stripped
+
+    def _scan_one_header(self, line_start_offset: int, line_end: int) -> _HttpHeaderSpan:
+        """Validate the field-name of an unfolded line, recording the span of its field-value."""
+
+        colon_idx = self.data.find(b':', line_start_offset, line_end)
+        if colon_idx < 0:
+            raise HeaderFieldHttpParseError(
+                code=HeaderFieldHttpParseErrorCode.MISSING_COLON,
+                message='Header line has no colon separator',
+                line=self.current_line,
+                offset=line_start_offset,
+            )
+
+        name_bytes = self.data[line_start_offset:colon_idx]
+        name = self._WELL_KNOWN_HEADER_NAMES.get(name_bytes)
+        if name is None:
+            name_bytes = self._check_field_name(name_bytes, line_start_offset, self.current_line)
+            name = name_bytes.decode('ascii').lower()
+
+        return _HttpHeaderSpan(
+            name,
+            line_start_offset,
+            line_start_offset + len(name_bytes),
+            colon_idx + 1,
+            line_end,
+            self.current_line,
+        )
+
+    # Lazy header access
+
+    def lazy_header_value(self, span: _HttpHeaderSpan) -> Bytes:
+        _, _, _, vs, ve, line = span
+        return self._check_field_value(self.data[vs:ve], vs, line)
+
+    def decode_lazy_header_value(self, span: _HttpHeaderSpan) -> str:
+        _, _, _, vs, ve, line = span
+        return self._check_field_value(self.data[vs:ve], vs, line).decode('latin-1')
+
+    def lazy_raw_header(self, span: _HttpHeaderSpan) -> RawParsedHttpHeader:
         return RawParsedHttpHeader(
-            name=name_bytes,
-            value=value_stripped,
+            name=self.data[span.name_start:span.name_end],
+            value=self.lazy_header_value(span),
         )
 
     # Prepared header construction
@@ -6590,6 +7012,20 @@ class IoPiplineHttpCompressorCoding(Abstract):
     def finish(self) -> ta.Optional[BytesLike]:
         raise NotImplementedError
 
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        """
+        Compresses an entire stream at once, on a fresh or reset coding - equivalent to, but potentially much cheaper
+        than, `compress` followed by `finish`.
+        """
+
+        out = [o for o in (self.compress(data), self.finish()) if o]
+        return out[0] if len(out) == 1 else b''.join(out)
+
+    def reset(self) -> bool:
+        """Readies a finished coding to compress a new stream, returning whether it can be."""
+
+        return False
+
 
 IoPiplineHttpCompressorCodings = ta.Mapping[  # ta.TypeAlias  # om-amalg-typing-no-move
     str,
@@ -6629,23 +7065,44 @@ IoPiplineHttpDecompressorCodings = ta.Mapping[  # ta.TypeAlias  # om-amalg-typin
 
 
 class ZlibIoPiplineHttpCompressorCoding(IoPiplineHttpCompressorCoding):
-    def __init__(self, wbits: int = 16 + zlib.MAX_WBITS) -> None:
+    def __init__(
+            self,
+            wbits: int = 16 + zlib.MAX_WBITS,
+            *,
+            level: int = zlib.Z_DEFAULT_COMPRESSION,
+    ) -> None:
         super().__init__()
 
-        self._z = zlib.compressobj(wbits=wbits)
+        self._wbits = wbits
+        self._level = level
+
+        # Created on first use, as whole bodies are compressed without one.
+        self._z: ta.Any = None
+
+    def _get_z(self) -> ta.Any:
+        if (z := self._z) is None:
+            z = self._z = zlib.compressobj(self._level, wbits=self._wbits)
+        return z
 
     def compress(
             self,
             data: BytesLike,
             /,
     ) -> ta.Optional[BytesLike]:
-        return self._z.compress(data)
+        return self._get_z().compress(data)
 
     def flush(self) -> ta.Optional[BytesLike]:
-        return self._z.flush(zlib.Z_SYNC_FLUSH) or None
+        return self._get_z().flush(zlib.Z_SYNC_FLUSH) or None
 
     def finish(self) -> ta.Optional[BytesLike]:
-        return self._z.flush()
+        return self._get_z().flush()
+
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        # Setting up a stream costs several times as much as compressing a typical api response in one shot.
+        if self._z is None and sys.version_info >= (3, 11):
+            return zlib.compress(data, self._level, self._wbits)
+
+        return super().compress_full(data)
 
 
 class ZlibIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
@@ -6669,6 +7126,150 @@ class ZlibIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
         return self._z.flush()
 
 
+#
+
+
+class ZstdIoPiplineHttpCompressorCoding(IoPiplineHttpCompressorCoding):
+    """
+    Requires `compression.zstd` (python 3.14+). A `zstd_dict` - a `compression.zstd.ZstdDict`, as returned by its
+    `train_dict` - must be known to the peer, as by out-of-band agreement. Compressors are reusable across streams, and
+    one loaded with a dictionary is costly to set up, so are best handed out by an `IoPiplineHttpCompressorCodingPool`.
+    """
+
+    def __init__(
+            self,
+            *,
+            level: ta.Optional[int] = None,
+            zstd_dict: ta.Any = None,
+    ) -> None:
+        super().__init__()
+
+        from compression import zstd  # noqa
+
+        self._c = zstd.ZstdCompressor(level=level, zstd_dict=zstd_dict)
+
+    def compress(
+            self,
+            data: BytesLike,
+            /,
+    ) -> ta.Optional[BytesLike]:
+        return self._c.compress(data)
+
+    def flush(self) -> ta.Optional[BytesLike]:
+        return self._c.flush(self._c.FLUSH_BLOCK) or None
+
+    def finish(self) -> ta.Optional[BytesLike]:
+        return self._c.flush(self._c.FLUSH_FRAME)
+
+    def compress_full(self, data: BytesLike, /) -> BytesLike:
+        return self._c.compress(data, self._c.FLUSH_FRAME)
+
+    def reset(self) -> bool:
+        # Each frame is independent, so one fully flushed leaves the compressor ready for the next.
+        return self._c.last_mode == self._c.FLUSH_FRAME
+
+
+class ZstdIoPiplineHttpDecompressorCoding(IoPiplineHttpDecompressorCoding):
+    """Requires `compression.zstd` (python 3.14+). Accepts concatenated frames, as the content coding permits."""
+
+    def __init__(
+            self,
+            *,
+            zstd_dict: ta.Any = None,
+    ) -> None:
+        super().__init__()
+
+        from compression import zstd  # noqa
+
+        self._zstd = zstd
+        self._zstd_dict = zstd_dict
+
+        self._d = zstd.ZstdDecompressor(zstd_dict=zstd_dict)
+
+    def decompress(
+            self,
+            data: BytesLike,
+            max_bytes: ta.Optional[int] = None,
+            /,
+    ) -> ta.Optional[BytesLike]:
+        if (d := self._d).eof:
+            d = self._d = self._zstd.ZstdDecompressor(zstd_dict=self._zstd_dict)
+
+        return d.decompress(data, max_bytes or -1)
+
+    def unconsumed_tail(self) -> ta.Optional[BytesLike]:
+        # Input held back by `max_bytes` is retained internally, and worked through by subsequent calls - only that
+        # following the end of a frame is handed back, to start the next.
+        if (d := self._d).eof:
+            return d.unused_data
+        return None
+
+    def finish(self) -> ta.Optional[BytesLike]:
+        d = self._d
+        out: ta.List[bytes] = []
+        while True:
+            while not d.eof and not d.needs_input:
+                if not (o := d.decompress(b'')):
+                    break
+                out.append(o)
+
+            # Input held back by `max_bytes` may run past the end of the frame into the start of another, which only
+            # turns up as unused data once the frame is finished here - so it is worked through by fresh decompressors.
+            if not (d.eof and (ud := d.unused_data)):
+                break
+
+            d = self._d = self._zstd.ZstdDecompressor(zstd_dict=self._zstd_dict)
+            if o := d.decompress(ud):
+                out.append(o)
+
+        return b''.join(out) or None
+
+
+##
+
+
+class IoPiplineHttpCompressorCodingPool:
+    """
+    A compressor coding factory which hands out codings from a free-list of finished ones which could be `reset`, so
+    that codings which are costly to set up - zstd ones loaded with a dictionary, say - are set up once per concurrently
+    compressed stream rather than once per message. Handlers given one in their codings `release` their codings back to
+    it. Safe to share between threads.
+    """
+
+    def __init__(
+            self,
+            factory: ta.Callable[[], IoPiplineHttpCompressorCoding],
+            *,
+            max_size: int = 64,
+    ) -> None:
+        super().__init__()
+
+        self._factory = factory
+        self._max_size = max_size
+
+        self._free: ta.List[IoPiplineHttpCompressorCoding] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<{self._factory!r}, free={len(self._free)}>'
+
+    def __len__(self) -> int:
+        """The number of codings free to be handed out."""
+
+        return len(self._free)
+
+    def __call__(self) -> IoPiplineHttpCompressorCoding:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return self._factory()
+
+    def release(self, coding: IoPiplineHttpCompressorCoding) -> None:
+        """Returns a finished coding to the pool, if it can be reset and the pool is not full."""
+
+        if len(self._free) < self._max_size and coding.reset():
+            self._free.append(coding)
+
+
 ##
 
 
@@ -7394,13 +7995,13 @@ class IoPipelineServices:
         for svc in lst:
             sty = type(svc)
             if sty.pipeline_update is not IoPipelineService.pipeline_update:
-                handles_pipeline_update.append(sty)
+                handles_pipeline_update.append(svc)
             if sty.handler_update is not IoPipelineService.handler_update:
-                handles_handler_update.append(sty)
+                handles_handler_update.append(svc)
             if sty.pipeline_enter is not IoPipelineService.pipeline_enter:
-                handles_pipeline_enter.append(sty)
+                handles_pipeline_enter.append(svc)
             if sty.pipeline_exit is not IoPipelineService.pipeline_exit:
-                handles_pipeline_exit.append(sty)
+                handles_pipeline_exit.append(svc)
 
     _handles_pipeline_update: ta.Sequence[IoPipelineService]
     _handles_handler_update: ta.Sequence[IoPipelineService]
@@ -13645,637 +14246,302 @@ class BaseByteStreamBufferLike(ByteStreamBufferLike, Abstract):
 
 
 ########################################
-# ../../../omcore/io/streambufs/framing.py
+# ../../../omcore/io/streambufs/utils.py
 
 
 ##
 
 
-class LongestMatchDelimiterByteStreamFrameDecoder:
-    """
-    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
-
-    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
-    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
-
-    Key property:
-      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
-      it can prove the next byte is not '\\n' (or the stream is finalized).
-
-    Implementation note:
-      This codec relies on `ByteStreamBuffer.find(...)` being stream-correct and C-accelerated over the buffer's
-      underlying contiguous segments. In pure Python it is usually better to keep searching near the storage layer than
-      to re-implement scanning byte-by-byte in higher-level codecs.
-
-    Pairs well with `ScanningByteStreamBuffer`.
-    """
-
-    def __init__(
-            self,
-            delims: ta.Sequence[bytes],
-            *,
-            keep_ends: bool = False,
-            max_size: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
+class ByteStreamBuffers(NamespaceClass):
+    _CAN_CONVERT_TYPES: ta.ClassVar[ta.Tuple[type, ...]] = (
+        *BYTES_LIKE_TYPES,
+        ByteStreamBufferLike,
+    )
 
-        dl = list(delims)
-        if not dl:
-            raise ValueError('no delimiters')
-        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
-            raise TypeError(delims)
-        if any(not d for d in dl):
-            raise ValueError('empty delimiter')
+    #
 
-        self._delims = tuple(bytes(d) for d in dl)
-        self._keep_ends = keep_ends
-        self._max_size = max_size
+    @classmethod
+    def can_bytes(cls, obj: ta.Any, /) -> bool:
+        return type(obj) in (cts := cls._CAN_CONVERT_TYPES) or isinstance(obj, cts)
 
-        # Sort by length descending for "choose longest at same start".
-        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+    #
 
-        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
-        # with it.
-        pref: ta.Dict[bytes, ta.List[bytes]] = {}
-        for d in self._delims:
-            for e in self._delims:
-                if d is e:
-                    continue
-                if len(e) > len(d) and e.startswith(d):
-                    pref.setdefault(d, []).append(e)
-        for k, vs in list(pref.items()):
-            pref[k] = sorted(vs, key=len, reverse=True)
-        self._prefix_longer = pref
+    @classmethod
+    @ta.overload
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[True],
+            or_none: ta.Literal[True],
+    ) -> ta.Optional[bytes]:
+        ...
 
-        self._max_delim_len = max(len(d) for d in self._delims)
+    @classmethod
+    @ta.overload
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[True],
+            or_none: ta.Literal[False] = False,
+    ) -> bytes:
+        ...
 
+    @classmethod
     @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[True],
-    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[False] = False,
+            or_none: ta.Literal[True],
+    ) -> ta.Optional[Bytes]:
         ...
 
+    @classmethod
     @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[False] = False,
-    ) -> ta.List[ByteStreamBufferView]:
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[False] = False,
+            or_none: ta.Literal[False] = False,
+    ) -> Bytes:
         ...
 
-    def decode(
-            self,
-            buf,
-            *,
-            final=False,
-            include_delims=False,
+    @classmethod
+    def to_bytes(
+            cls,
+            obj,
+            /, *,
+            strict=False,
+            or_none=False,
     ):
         """
-        Consume as many complete frames as possible from `buf` and return them as views.
-
-        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
-        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
-        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+        Returns a non-shared version of the given object. If a possibly shared memoryview is acceptable, use
+        `iter_segments`.
+        """
 
-        Raises:
-          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
-          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+        if strict:
+            if (ot := type(obj)) is bytes or isinstance(obj, bytes):
+                return obj
 
-        Note on `max_size`:
-          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
-          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
-          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
-          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
-          remaining bytes buffered.
-        """
+            elif ot is bytearray:
+                return bytes(obj)
 
-        out: ta.List[ta.Any] = []
+            elif isinstance(obj, memoryview):
+                return memoryview_to_bytes_strict(obj)
 
-        while True:
-            hit = self._find_next_delim(buf)
-            if hit is None:
-                if self._max_size is not None and len(buf) > self._max_size and not out:
-                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
-                return out
+        else:
+            if (ot := type(obj)) is bytes or ot is bytearray or isinstance(obj, BYTES_TYPES):
+                return obj
 
-            pos, delim = hit
+            elif isinstance(obj, memoryview):
+                return memoryview_to_bytes(obj)
 
-            if self._max_size is not None and pos > self._max_size:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+        if isinstance(obj, ByteStreamBufferView):
+            return obj.tobytes()
 
-            if not final and self._should_defer(buf, pos, delim):
-                return out
+        elif isinstance(obj, ByteStreamBufferLike):
+            return b''.join(bytes(mv) for mv in obj.segments())
 
-            if self._keep_ends:
-                frame = buf.split_to(pos + len(delim))
-            else:
-                frame = buf.split_to(pos)
-                buf.advance(len(delim))
+        elif or_none:
+            return None
 
-            if include_delims:
-                out.append((frame, delim))
-            else:
-                out.append(frame)
+        else:
+            raise TypeError(obj)
 
-    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
-        """
-        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
-        choose the longest matching delimiter.
-        """
+    #
 
-        ln = len(buf)
-        if not ln:
-            return None
+    @classmethod
+    @ta.overload
+    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[True], /) -> ta.Optional[int]: ...
 
-        best_pos = None  # type: ta.Optional[int]
-        best_delim = None  # type: ta.Optional[bytes]
+    @classmethod
+    @ta.overload
+    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[False] = False, /) -> int: ...
 
-        # First pass: find the earliest position of any delimiter (cheap, uses buf.find).
-        for d in self._delims:
-            i = buf.find(d, 0, None)
-            if i == -1:
-                continue
-            if best_pos is None or i < best_pos:
-                best_pos = i
-                best_delim = d
-                if not best_pos:
-                    # Can't beat position 0; still need to choose longest at this position.
-                    pass
-            elif i == best_pos and best_delim is not None and len(d) > len(best_delim):
-                best_delim = d
+    @classmethod
+    def bytes_len(cls, obj, or_none=False):
+        if cls.can_bytes(obj):
+            return len(obj)
 
-        if best_pos is None or best_delim is None:
+        elif or_none:
             return None
 
-        # Second pass: at that position, choose the longest delimiter that actually matches there. (We can't just rely
-        # on "which delimiter found it first" when overlaps exist.)
-        pos = best_pos
-        for d in self._delims_by_len:
-            if pos + len(d) > ln:
-                continue
-            if buf.find(d, pos, pos + len(d)) == pos:
-                return pos, d
+        else:
+            raise TypeError(obj)
 
-        # Shouldn't happen: best_pos came from some delimiter occurrence.
-        return pos, best_delim
+    #
 
-    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
-        """
-        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
-        have enough bytes to decide.
+    @staticmethod
+    def iter_segments(obj: ta.Any, /) -> ta.Iterator[memoryview]:
+        if (ot := type(obj)) is memoryview:
+            yield obj
+        elif ot is bytes or ot is bytearray:
+            yield memoryview(obj)
 
-        We only defer when:
-          - the current match ends at the end of the currently buffered bytes, and
-          - there exists some longer delimiter that has `matched` as a prefix, and
-          - the buffered bytes from pos match the available prefix of that longer delimiter.
-        """
+        elif isinstance(obj, memoryview):
+            yield obj
+        elif isinstance(obj, (bytes, bytearray)):
+            yield memoryview(obj)
 
-        ln = len(buf)
-        endpos = pos + len(matched)
-        if endpos != ln:
-            return False
+        elif isinstance(obj, ByteStreamBufferLike):
+            yield from obj.segments()
 
-        longer = self._prefix_longer.get(matched)
-        if not longer:
-            return False
+        else:
+            raise TypeError(obj)
 
-        avail = ln - pos
-        for d2 in longer:
-            if avail >= len(d2):
-                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
-                continue
-            # Check whether buffered bytes match the prefix of d2 that we have available.
-            # Use stream-correct find on the prefix.
-            prefix = d2[:avail]
-            if buf.find(prefix, pos, pos + avail) == pos:
-                return True
+    #
 
-        return False
+    @staticmethod
+    def split(buf: ByteStreamBuffer, sep: bytes, /, *, final: bool = False) -> ta.List[ByteStreamBufferView]:
+        out: ta.List[ByteStreamBufferView] = []
+        while (i := buf.find(sep)) >= 0:
+            out.append(buf.split_to(i + 1))
+        if final and len(buf):
+            out.append(buf.split_to(len(buf)))
+        return out
 
 
-##
+########################################
+# ../../../omcore/lite/inject.py
 
 
-class LengthFieldByteStreamFrameDecoder:
-    """
-    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
+###
+# types
 
-    This is modeled after the common Netty pattern:
-      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
-    where:
-      length_field_end_offset = length_field_offset + length_field_length
 
-    Parameters:
-      - length_field_offset: byte offset of the length field from the start of the frame
-      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
-      - byteorder: 'big' or 'little'
-      - length_adjustment: adjustment added to computed frame length (may be negative)
-      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
-        length field and/or header from the delivered payload)
-      - max_frame_length: maximum allowed total frame length (before stripping)
+@dc.dataclass(frozen=True)
+class InjectorKey(ta.Generic[T]):
+    # Before PEP-560 typing.Generic was a metaclass with a __new__ that takes a 'cls' arg, so instantiating a dataclass
+    # with kwargs (such as through dc.replace) causes `TypeError: __new__() got multiple values for argument 'cls'`.
+    # See:
+    #  - https://github.com/python/cpython/commit/d911e40e788fb679723d78b6ea11cabf46caed5a
+    #  - https://gist.github.com/wrmsr/4468b86efe9f373b6b114bfe85b98fd3
+    cls_: InjectorKeyCls
 
-    Notes:
-      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
-      - It relies on `buf.coalesce(n)` for efficient header parsing in pure Python.
-      - It does not require async/await and is suitable for pipeline-style codecs.
-    """
+    tag: ta.Any = None
+    array: bool = False
 
-    def __init__(
-            self,
-            *,
-            length_field_offset: int = 0,
-            length_field_length: int = 4,
-            byteorder: ta.Literal['little', 'big'] = 'big',
-            length_adjustment: int = 0,
-            initial_bytes_to_strip: int = 0,
-            max_frame_length: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
 
-        if length_field_offset < 0:
-            raise ValueError(length_field_offset)
-        if length_field_length not in (1, 2, 4, 8):
-            raise ValueError(length_field_length)
-        if byteorder not in ('big', 'little'):
-            raise ValueError(byteorder)
-        if initial_bytes_to_strip < 0:
-            raise ValueError(initial_bytes_to_strip)
-        if max_frame_length is not None and max_frame_length < 0:
-            raise ValueError(max_frame_length)
+def is_valid_injector_key_cls(cls: ta.Any) -> bool:
+    return isinstance(cls, type) or is_new_type(cls)
 
-        self._off = int(length_field_offset)
-        self._llen = int(length_field_length)
-        self._byteorder = byteorder
-        self._adj = int(length_adjustment)
-        self._strip = int(initial_bytes_to_strip)
-        self._max = None if max_frame_length is None else int(max_frame_length)
 
-        self._end_off = self._off + self._llen
+def check_valid_injector_key_cls(cls: T) -> T:
+    if not is_valid_injector_key_cls(cls):
+        raise TypeError(cls)
+    return cls
 
-    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
-        """
-        Consume as many complete frames as possible from `buf` and return them as views.
 
-        Returns:
-          - list of BytesView-like objects (from `split_to`) representing each decoded frame
+##
 
-        Raises:
-          - FrameTooLarge if a frame exceeds max_frame_length
-          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
-            progress (defensive; rarely hit if upstream caps buffer growth)
-        """
 
-        out: ta.List[ta.Any] = []
+class InjectorProvider(Abstract):
+    @abc.abstractmethod
+    def provider_fn(self) -> InjectorProviderFn:
+        raise NotImplementedError
 
-        while True:
-            # Need at least enough bytes to read the length field.
-            if len(buf) < self._end_off:
-                return out
 
-            # Read header up through the length field contiguously.
-            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
-            mv = buf.coalesce(self._end_off)
-            if len(mv) < self._end_off:
-                # Defensive: coalesce contract.
-                return out
+##
 
-            # Copy just the length field bytes (1/2/4/8) so we can safely mutate the buffer afterward.
-            lf_bytes = bytes(mv[self._off:self._end_off])
-            # del mv
 
-            length_val = int.from_bytes(lf_bytes, self._byteorder, signed=False)
+@dc.dataclass(frozen=True)
+class InjectorBinding:
+    key: InjectorKey
+    provider: InjectorProvider
 
-            total_len = length_val + self._adj + self._end_off
-            if total_len < 0:
-                raise ValueError('negative frame length')
+    def __post_init__(self) -> None:
+        check.isinstance(self.key, InjectorKey)
+        check.isinstance(self.provider, InjectorProvider)
 
-            if self._max is not None and total_len > self._max:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
 
-            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
-            # control.
-            if len(buf) < total_len:
-                if self._max is not None and len(buf) > self._max:
-                    raise BufferTooLargeByteStreamBufferError(
-                        'buffer exceeded max_frame_length without completing a frame',
-                    )
-                return out
+class InjectorBindings(Abstract):
+    @abc.abstractmethod
+    def bindings(self) -> ta.Iterator[InjectorBinding]:
+        raise NotImplementedError
 
-            # We have a complete frame available.
-            if self._strip:
-                if self._strip > total_len:
-                    raise ValueError('initial_bytes_to_strip > frame length')
-                buf.advance(self._strip)
-                total_len -= self._strip
+##
 
-            out.append(buf.split_to(total_len))
 
-            # Loop for additional frames
+class Injector(Abstract):
+    @abc.abstractmethod
+    def try_provide(self, key: ta.Any) -> Maybe[ta.Any]:
+        raise NotImplementedError
 
+    @abc.abstractmethod
+    def provide(self, key: ta.Any) -> ta.Any:
+        raise NotImplementedError
 
-########################################
-# ../../../omcore/io/streambufs/utils.py
+    @abc.abstractmethod
+    def provide_kwargs(
+            self,
+            obj: ta.Any,
+            *,
+            skip_args: int = 0,
+            skip_kwargs: ta.Optional[ta.Iterable[ta.Any]] = None,
+    ) -> ta.Mapping[str, ta.Any]:
+        raise NotImplementedError
 
+    @abc.abstractmethod
+    def inject(
+            self,
+            obj: ta.Any,
+            *,
+            args: ta.Optional[ta.Sequence[ta.Any]] = None,
+            kwargs: ta.Optional[ta.Mapping[str, ta.Any]] = None,
+    ) -> ta.Any:
+        raise NotImplementedError
 
-##
+    def __getitem__(
+            self,
+            target: ta.Union[InjectorKey[T], ta.Type[T]],
+    ) -> T:
+        return self.provide(target)
 
 
-class ByteStreamBuffers(NamespaceClass):
-    _CAN_CONVERT_TYPES: ta.ClassVar[ta.Tuple[type, ...]] = (
-        *BYTES_LIKE_TYPES,
-        ByteStreamBufferLike,
-    )
+###
+# exceptions
 
-    #
 
-    @classmethod
-    def can_bytes(cls, obj: ta.Any, /) -> bool:
-        return type(obj) in (cts := cls._CAN_CONVERT_TYPES) or isinstance(obj, cts)
+class InjectorError(Exception):
+    pass
 
-    #
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[bytes]:
-        ...
+@dc.dataclass()
+class InjectorKeyError(InjectorError):
+    key: InjectorKey
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[False] = False,
-    ) -> bytes:
-        ...
+    source: ta.Any = None
+    name: ta.Optional[str] = None
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[Bytes]:
-        ...
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[False] = False,
-    ) -> Bytes:
-        ...
+class UnboundInjectorKeyError(InjectorKeyError):
+    pass
 
-    @classmethod
-    def to_bytes(
-            cls,
-            obj,
-            /, *,
-            strict=False,
-            or_none=False,
-    ):
-        """
-        Returns a non-shared version of the given object. If a possibly shared memoryview is acceptable, use
-        `iter_segments`.
-        """
 
-        if strict:
-            if (ot := type(obj)) is bytes or isinstance(obj, bytes):
-                return obj
+class DuplicateInjectorKeyError(InjectorKeyError):
+    pass
 
-            elif ot is bytearray:
-                return bytes(obj)
 
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes_strict(obj)
+class CyclicDependencyInjectorKeyError(InjectorKeyError):
+    pass
 
-        else:
-            if (ot := type(obj)) is bytes or ot is bytearray or isinstance(obj, BYTES_TYPES):
-                return obj
 
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes(obj)
+###
+# keys
 
-        if isinstance(obj, ByteStreamBufferView):
-            return obj.tobytes()
 
-        elif isinstance(obj, ByteStreamBufferLike):
-            return b''.join(bytes(mv) for mv in obj.segments())
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[True], /) -> ta.Optional[int]: ...
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[False] = False, /) -> int: ...
-
-    @classmethod
-    def bytes_len(cls, obj, or_none=False):
-        if cls.can_bytes(obj):
-            return len(obj)
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def iter_segments(obj: ta.Any, /) -> ta.Iterator[memoryview]:
-        if (ot := type(obj)) is memoryview:
-            yield obj
-        elif ot is bytes or ot is bytearray:
-            yield memoryview(obj)
-
-        elif isinstance(obj, memoryview):
-            yield obj
-        elif isinstance(obj, (bytes, bytearray)):
-            yield memoryview(obj)
-
-        elif isinstance(obj, ByteStreamBufferLike):
-            yield from obj.segments()
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def split(buf: ByteStreamBuffer, sep: bytes, /, *, final: bool = False) -> ta.List[ByteStreamBufferView]:
-        out: ta.List[ByteStreamBufferView] = []
-        while (i := buf.find(sep)) >= 0:
-            out.append(buf.split_to(i + 1))
-        if final and len(buf):
-            out.append(buf.split_to(len(buf)))
-        return out
-
-
-########################################
-# ../../../omcore/lite/inject.py
-
-
-###
-# types
-
-
-@dc.dataclass(frozen=True)
-class InjectorKey(ta.Generic[T]):
-    # Before PEP-560 typing.Generic was a metaclass with a __new__ that takes a 'cls' arg, so instantiating a dataclass
-    # with kwargs (such as through dc.replace) causes `TypeError: __new__() got multiple values for argument 'cls'`.
-    # See:
-    #  - https://github.com/python/cpython/commit/d911e40e788fb679723d78b6ea11cabf46caed5a
-    #  - https://gist.github.com/wrmsr/4468b86efe9f373b6b114bfe85b98fd3
-    cls_: InjectorKeyCls
-
-    tag: ta.Any = None
-    array: bool = False
-
-
-def is_valid_injector_key_cls(cls: ta.Any) -> bool:
-    return isinstance(cls, type) or is_new_type(cls)
-
-
-def check_valid_injector_key_cls(cls: T) -> T:
-    if not is_valid_injector_key_cls(cls):
-        raise TypeError(cls)
-    return cls
-
-
-##
-
-
-class InjectorProvider(Abstract):
-    @abc.abstractmethod
-    def provider_fn(self) -> InjectorProviderFn:
-        raise NotImplementedError
-
-
-##
-
-
-@dc.dataclass(frozen=True)
-class InjectorBinding:
-    key: InjectorKey
-    provider: InjectorProvider
-
-    def __post_init__(self) -> None:
-        check.isinstance(self.key, InjectorKey)
-        check.isinstance(self.provider, InjectorProvider)
-
-
-class InjectorBindings(Abstract):
-    @abc.abstractmethod
-    def bindings(self) -> ta.Iterator[InjectorBinding]:
-        raise NotImplementedError
-
-##
-
-
-class Injector(Abstract):
-    @abc.abstractmethod
-    def try_provide(self, key: ta.Any) -> Maybe[ta.Any]:
-        raise NotImplementedError
-
-    @abc.abstractmethod
-    def provide(self, key: ta.Any) -> ta.Any:
-        raise NotImplementedError
-
-    @abc.abstractmethod
-    def provide_kwargs(
-            self,
-            obj: ta.Any,
-            *,
-            skip_args: int = 0,
-            skip_kwargs: ta.Optional[ta.Iterable[ta.Any]] = None,
-    ) -> ta.Mapping[str, ta.Any]:
-        raise NotImplementedError
-
-    @abc.abstractmethod
-    def inject(
-            self,
-            obj: ta.Any,
-            *,
-            args: ta.Optional[ta.Sequence[ta.Any]] = None,
-            kwargs: ta.Optional[ta.Mapping[str, ta.Any]] = None,
-    ) -> ta.Any:
-        raise NotImplementedError
-
-    def __getitem__(
-            self,
-            target: ta.Union[InjectorKey[T], ta.Type[T]],
-    ) -> T:
-        return self.provide(target)
-
-
-###
-# exceptions
-
-
-class InjectorError(Exception):
-    pass
-
-
-@dc.dataclass()
-class InjectorKeyError(InjectorError):
-    key: InjectorKey
-
-    source: ta.Any = None
-    name: ta.Optional[str] = None
-
-
-class UnboundInjectorKeyError(InjectorKeyError):
-    pass
-
-
-class DuplicateInjectorKeyError(InjectorKeyError):
-    pass
-
-
-class CyclicDependencyInjectorKeyError(InjectorKeyError):
-    pass
-
-
-###
-# keys
-
-
-def as_injector_key(o: ta.Any) -> InjectorKey:
-    if o is inspect.Parameter.empty:
-        raise TypeError(o)
-    if isinstance(o, InjectorKey):
-        return o
-    if is_valid_injector_key_cls(o):
-        return InjectorKey(o)
-    raise TypeError(o)
+def as_injector_key(o: ta.Any) -> InjectorKey:
+    if o is inspect.Parameter.empty:
+        raise TypeError(o)
+    if isinstance(o, InjectorKey):
+        return o
+    if is_valid_injector_key_cls(o):
+        return InjectorKey(o)
+    raise TypeError(o)
 
 
 ###
@@ -21008,6 +21274,12 @@ class IoPipelineHttpObjectCompressor(
     IoPipelineHandler,
     Abstract,
 ):
+    """
+    Compresses the bodies of outbound messages whose head's content-encoding names one of its codings. Full messages are
+    compressed in one shot, with any content-length adjusted, and the output of each body data message is emitted as a
+    single message. Codings handed out by an `IoPiplineHttpCompressorCodingPool` are released back to it once finished.
+    """
+
     def __init__(
             self,
             codings: ta.Optional[IoPiplineHttpCompressorCodings] = None,
@@ -21021,11 +21293,25 @@ class IoPipelineHttpObjectCompressor(
         self._codings = codings
 
         self._compressor: ta.Optional[IoPiplineHttpCompressorCoding] = None
+        self._compressor_pool: ta.Optional[IoPiplineHttpCompressorCodingPool] = None
 
     #
 
     def _reset(self) -> None:
         self._compressor = None
+        self._compressor_pool = None
+
+    def _select_coding(
+            self,
+            head: IoPipelineHttpMessageHead,
+    ) -> ta.Optional[ta.Callable[[], IoPiplineHttpCompressorCoding]]:
+        enc = head.headers.lower.get('content-encoding', ())
+
+        for coding_name, coding in self._codings.items():
+            if coding_name.lower() in enc:
+                return coding
+
+        return None
 
     #
 
@@ -21044,24 +21330,47 @@ class IoPipelineHttpObjectCompressor(
             ctx.feed_out(self._make_aborted('unexpected message sequence'))
             return
 
-        enc = msg.headers.lower.get('content-encoding', ())
-
-        for coding_name, coding in self._codings.items():
-            if coding_name.lower() in enc:
-                self._compressor = coding()
-                break
+        if (coding := self._select_coding(msg)) is not None:
+            self._compressor = coding()
+            if isinstance(coding, IoPiplineHttpCompressorCodingPool):
+                self._compressor_pool = coding
 
         ctx.feed_out(msg)
 
+    def _on_outbound_full(self, ctx: IoPipelineHandlerContext, msg: FullIoPipelineHttpMessage) -> None:
+        # Bodiless responses, as to HEAD requests, may still carry the content-length their body would have had.
+        if self._compressor is not None or not len(msg.body) or (coding := self._select_coding(msg.head)) is None:
+            ctx.feed_out(msg)
+            return
+
+        z = coding()
+        out = z.compress_full(msg.body)
+        if isinstance(coding, IoPiplineHttpCompressorCodingPool):
+            coding.release(z)
+
+        head = msg.head
+        if 'content-length' in head.headers:
+            head = dc.replace(  # type: ignore[type-var]
+                head,
+                headers=head.headers.update(('content-length', str(len(out))), if_present='override'),
+            )
+
+        ctx.feed_out(dc.replace(msg, head=head, body=out))  # type: ignore[type-var]
+
     def _on_outbound_body_data(self, ctx: IoPipelineHandlerContext, msg: IoPipelineHttpMessageBodyData) -> None:
         if (z := self._compressor) is None:
             ctx.feed_out(msg)
             return
 
+        # Each input segment mostly only feeds the compressor's window, so outputs are gathered rather than each sent on
+        # as its own message.
+        outs: ta.List[BytesLike] = []
         for mv in ByteStreamBuffers.iter_segments(msg.data):
-            out = z.compress(mv)
-            if out:
-                ctx.feed_out(self._make_body_data(out))
+            if out := z.compress(mv):
+                outs.append(out)
+
+        if outs:
+            ctx.feed_out(self._make_body_data(outs[0] if len(outs) == 1 else b''.join(outs)))
 
     def _on_outbound_flush_output(self, ctx: IoPipelineHandlerContext, msg: IoPipelineFlowMessages.FlushOutput) -> None:
         if (z := self._compressor) is None:
@@ -21082,6 +21391,9 @@ class IoPipelineHttpObjectCompressor(
         if out:
             ctx.feed_out(self._make_body_data(out))
 
+        if (pool := self._compressor_pool) is not None:
+            pool.release(z)
+
         self._reset()
         ctx.feed_out(msg)
 
@@ -21092,6 +21404,9 @@ class IoPipelineHttpObjectCompressor(
         elif isinstance(msg, self._head_type):
             self._on_outbound_head(ctx, msg)
 
+        elif isinstance(msg, self._full_type):
+            self._on_outbound_full(ctx, msg)
+
         elif isinstance(msg, self._body_data_type):
             self._on_outbound_body_data(ctx, msg)
 
@@ -21282,18 +21597,26 @@ class IoPipelineHttpObjectDecompressor(
                 self._defer_resume(ctx)
                 return False
 
-            out = z.finish()
-            if out:
-                ol = len(out)
-                self._out_total_bytes += ol
-                self._out_pending.append(out)
-                self._out_pending_bytes += ol
-                self._check_budgets()
-                self._emit_out_pending(ctx)
+            # A message with no body has nothing to finish.
+            if self._in_total_bytes:
+                out = z.finish()
+                if out:
+                    ol = len(out)
+                    self._out_total_bytes += ol
+                    self._out_pending.append(out)
+                    self._out_pending_bytes += ol
+                    self._check_budgets()
+                    self._emit_out_pending(ctx)
 
             msg = self._pending_end
             self._pending_end = None
             self._read_requested = False
+
+            # Ready for the next message on the connection - which may be encoded differently, or not at all.
+            self._decompressor = None
+            self._in_total_bytes = 0
+            self._out_total_bytes = 0
+
             ctx.feed_in(msg)
             return True  # FinalInput counts as satisfying the last read
 
@@ -22119,35 +22442,322 @@ class FnMessageToMessageDecoderIoPipelineHandler(MessageToMessageDecoderIoPipeli
 
 
 ########################################
-# ../../../omcore/io/streambufs/direct.py
+# ../../../omcore/io/pipelines/sched/wheel.py
 
 
 ##
 
 
-class BaseDirectByteStreamBufferLike(BaseByteStreamBufferLike, Abstract):
-    def __init__(self, data: BytesLike) -> None:
+class HashedTimingWheel:
+    """
+    A single-threaded hashed timing wheel (Varghese & Lauck), intended to be shared by all the pipelines driven by a
+    single loop. Scheduling and cancelling are O(1) regardless of the number of timers, at the cost of firing with a
+    granularity of `tick_s` - timers never fire early, but may fire up to a tick late.
+
+    Nothing runs on its own: the owning loop calls `advance` - typically after waking from a poll bounded by
+    `next_delay` - which fires everything due, in deadline order.
+    """
+
+    def __init__(
+            self,
+            *,
+            tick_s: float = .1,
+            num_buckets: int = 512,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
         super().__init__()
 
-        self._data = data
-        if isinstance(data, memoryview):
-            self._mv_ = data
-        else:
-            self._b_ = data
+        check.arg(tick_s > 0, 'tick_s must be positive')
+        check.arg(num_buckets > 0, 'num_buckets must be positive')
 
-    _mv_: memoryview
-    _b_: ta.Union[bytes, bytearray]
+        self._tick_s = tick_s
+        self._num_buckets = num_buckets
+        self._clock = clock
 
-    def _mv(self) -> memoryview:
-        try:
-            return self._mv_
-        except AttributeError:
-            pass
+        self._start = clock()
+        self._tick = 0
 
-        self._mv_ = mv = memoryview(self._b_)
-        return mv
+        self._buckets: ta.List[ta.Dict[int, HashedTimingWheel.Timer]] = [{} for _ in range(num_buckets)]
+        self._len = 0
+        self._seq = 0
 
-    def _b(self) -> ta.Union[bytes, bytearray]:
+        self._due: ta.List[HashedTimingWheel.Timer] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={self._len}, tick={self._tick}>'
+
+    @property
+    def tick_s(self) -> float:
+        return self._tick_s
+
+    @property
+    def clock(self) -> ta.Callable[[], float]:
+        return self._clock
+
+    def __len__(self) -> int:
+        """The number of timers scheduled and neither fired nor cancelled."""
+
+        return self._len
+
+    #
+
+    @ta.final
+    class Timer:
+        def __init__(
+                self,
+                wheel: 'HashedTimingWheel',
+                deadline_tick: int,
+                seq: int,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._wheel: ta.Optional[HashedTimingWheel] = wheel
+            self._deadline_tick = deadline_tick
+            self._seq = seq
+            self._fn = fn
+
+        def __repr__(self) -> str:
+            return f'{type(self).__name__}@{id(self):x}<deadline_tick={self._deadline_tick}, active={self.active}>'
+
+        @property
+        def active(self) -> bool:
+            return self._wheel is not None
+
+        def cancel(self) -> None:
+            """Idempotent, and a no-op once fired."""
+
+            if (w := self._wheel) is None:
+                return
+            self._wheel = None
+
+            # Timers already collected by an interrupted `advance` are no longer in their bucket.
+            if w._buckets[self._deadline_tick % w._num_buckets].pop(self._seq, None) is not None:  # noqa
+                w._len -= 1  # noqa
+
+    #
+
+    def _now_tick(self, now: float) -> int:
+        return int((now - self._start) / self._tick_s)
+
+    def schedule(self, delay_s: float, fn: ta.Callable[[], None]) -> Timer:
+        now = self._clock()
+        now_tick = self._now_tick(now)
+
+        if not self._len and now_tick > self._tick:
+            # Nothing is pending, so there is nothing for `advance` to catch up on.
+            self._tick = now_tick
+
+        deadline_tick = math.ceil((now + max(delay_s, 0.) - self._start) / self._tick_s)
+        if deadline_tick <= now_tick:
+            deadline_tick = now_tick + 1
+
+        self._seq += 1
+        t = HashedTimingWheel.Timer(self, deadline_tick, self._seq, fn)
+        self._buckets[deadline_tick % self._num_buckets][t._seq] = t  # noqa
+        self._len += 1
+        return t
+
+    def next_delay(self) -> ta.Optional[float]:
+        """
+        Returns how long until the next tick which may have timers due - possibly early, when the first occupied bucket
+        holds only timers due in later rotations - or None if no timers are pending.
+        """
+
+        if self._due:
+            return 0.
+
+        if not self._len:
+            return None
+
+        n = self._num_buckets
+        buckets = self._buckets
+        base = self._tick + 1
+        i = 0
+        while not buckets[(base + i) % n]:
+            i += 1
+
+        return max(self._start + (base + i) * self._tick_s - self._clock(), 0.)
+
+    def advance(self) -> int:
+        """
+        Fires all timers due as of now, returning how many were fired. Should a timer's fn raise, the timers remaining
+        due are fired by the next call.
+        """
+
+        if not self._due:
+            now_tick = self._now_tick(self._clock())
+            if now_tick <= self._tick:
+                return 0
+
+            n = self._num_buckets
+            buckets = self._buckets
+
+            due: ta.List[HashedTimingWheel.Timer] = []
+            if now_tick - self._tick >= n:
+                ks: ta.Iterable[int] = range(n)
+            else:
+                ks = range(self._tick + 1, now_tick + 1)
+
+            for k in ks:
+                if not (b := buckets[k % n]):
+                    continue
+                for s, t in list(b.items()):
+                    if t._deadline_tick <= now_tick:  # noqa
+                        del b[s]
+                        due.append(t)
+
+            self._tick = now_tick
+
+            if not due:
+                return 0
+
+            self._len -= len(due)
+            due.sort(key=lambda t: (t._deadline_tick, t._seq), reverse=True)  # noqa
+            self._due = due
+
+        due = self._due
+        c = 0
+        while due:
+            t = due.pop()
+            if t._wheel is None:  # noqa
+                continue
+            t._wheel = None  # noqa
+            c += 1
+            t._fn()  # noqa
+
+        return c
+
+
+##
+
+
+class WheelIoPipelineScheduling(IoPipelineScheduling, IoPipelineService):
+    """
+    Schedules a pipeline's timers on a (possibly shared) `HashedTimingWheel`. When a timer fires its fn is handed to
+    `runner`, supplied by the pipeline's driver, which must run it within the pipeline - as by `pipeline.enter()` - and
+    then process whatever it produced.
+
+    Timers are cancelled along with the handler which scheduled them, and all of them when the pipeline is destroyed.
+    """
+
+    def __init__(
+            self,
+            wheel: HashedTimingWheel,
+            runner: ta.Callable[[ta.Callable[[], None]], None],
+    ) -> None:
+        super().__init__()
+
+        self._wheel = wheel
+        self._runner = runner
+
+        self._by_ref: ta.Dict[IoPipelineHandlerRef, ta.Dict[WheelIoPipelineScheduling._Handle, None]] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={len(self)}>'
+
+    @property
+    def wheel(self) -> HashedTimingWheel:
+        return self._wheel
+
+    def __len__(self) -> int:
+        return sum(len(hs) for hs in self._by_ref.values())
+
+    #
+
+    @ta.final
+    class _Handle(IoPipelineScheduling.Handle):
+        def __init__(
+                self,
+                svc: 'WheelIoPipelineScheduling',
+                handler_ref: IoPipelineHandlerRef,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._svc = svc
+            self._handler_ref = handler_ref
+            self._fn = fn
+
+            self._timer: ta.Optional[HashedTimingWheel.Timer] = None
+
+        def cancel(self) -> None:
+            if (t := self._timer) is None:
+                return
+            self._timer = None
+            t.cancel()
+            self._svc._untrack(self)  # noqa
+
+        def _fire(self) -> None:
+            self._timer = None
+            self._svc._untrack(self)  # noqa
+            self._svc._runner(self._fn)  # noqa
+
+    def _untrack(self, h: _Handle) -> None:
+        if (hs := self._by_ref.get(h._handler_ref)) is None:  # noqa
+            return
+        hs.pop(h, None)
+        if not hs:
+            del self._by_ref[h._handler_ref]  # noqa
+
+    def schedule(
+            self,
+            handler_ref: IoPipelineHandlerRef,
+            delay_s: float,
+            fn: ta.Callable[[], None],
+    ) -> IoPipelineScheduling.Handle:
+        h = WheelIoPipelineScheduling._Handle(self, handler_ref, fn)
+        h._timer = self._wheel.schedule(delay_s, h._fire)  # noqa
+        self._by_ref.setdefault(handler_ref, {})[h] = None
+        return h
+
+    def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
+        if handler_ref is not None:
+            hs_lst = [hs] if (hs := self._by_ref.get(handler_ref)) is not None else []
+        else:
+            hs_lst = list(self._by_ref.values())
+
+        for hs in hs_lst:
+            for h in list(hs):
+                h.cancel()
+
+    #
+
+    def handler_update(self, handler_ref: IoPipelineHandlerRef, kind: IoPipelineHandlerUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all(handler_ref)
+
+    def pipeline_update(self, pipeline: IoPipeline, kind: IoPipelineUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all()
+
+
+########################################
+# ../../../omcore/io/streambufs/direct.py
+
+
+##
+
+
+class BaseDirectByteStreamBufferLike(BaseByteStreamBufferLike, Abstract):
+    def __init__(self, data: BytesLike) -> None:
+        super().__init__()
+
+        self._data = data
+        if isinstance(data, memoryview):
+            self._mv_ = data
+        else:
+            self._b_ = data
+
+    _mv_: memoryview
+    _b_: ta.Union[bytes, bytearray]
+
+    def _mv(self) -> memoryview:
+        try:
+            return self._mv_
+        except AttributeError:
+            pass
+
+        self._mv_ = mv = memoryview(self._b_)
+        return mv
+
+    def _b(self) -> ta.Union[bytes, bytearray]:
         try:
             return self._b_
         except AttributeError:
@@ -22289,6 +22899,20 @@ def empty_byte_stream_buffer_view() -> ByteStreamBufferView:
 # ../../../omcore/io/streambufs/scanning.py
 
 
+_scanning: ta.Any
+try:
+    from . import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
+if _scanning is not None:
+    globals().update({a: getattr(_scanning, a) for a in [
+        'find_longest',
+        'scan_length_fields',
+    ]})
+
+
 ##
 
 
@@ -22313,7 +22937,7 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
         super().__init__()
 
         self._buf = buf
-        self._scan_from_by_sub: dict[bytes, int] = {}
+        self._scan_from_by_sub: ta.Dict[ta.Union[bytes, ta.Tuple[bytes, ...]], int] = {}
 
     @property
     def max_size(self) -> ta.Optional[int]:
@@ -22366,6 +22990,28 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
 
         return i
 
+    def find_longest(self, subs: ta.Sequence[bytes]) -> ta.Tuple[int, int]:
+        """
+        Returns the position of the earliest occurrence of any of `subs`, and the index of the first of `subs` which
+        occurs there - so ordering `subs` longest first picks the longest match - or (-1, -1). Searches all of the
+        buffer's segments in a single pass, natively when the `_scanning` extension is available, and caches negative
+        progress per `subs` just as `find` does per `sub`.
+        """
+
+        key = tuple(subs)
+        scan_from = self._scan_from_by_sub.get(key, 0)
+
+        # Allow overlap so a match spanning old/new boundary is discoverable.
+        eff_start = scan_from - (max(map(len, key), default=1) - 1)
+        if eff_start < 0:
+            eff_start = 0
+
+        ret = find_longest(self._buf.segments(), key, eff_start)
+        if ret[0] < 0:
+            self._scan_from_by_sub[key] = len(self._buf)
+
+        return ret
+
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         # rfind isn't the typical trickle hot-path; delegate.
         return self._buf.rfind(sub, start, end)
@@ -26733,28 +27379,360 @@ class YamlParser:
 # ../../../omcore/http/pipelines/servers/responses.py
 
 
-##
+##
+
+
+class IoPipelineHttpResponseEncoder(IoPipelineHttpResponseObjects, IoPipelineHttpObjectEncoder):
+    def _encode_head_line(self, head: IoPipelineHttpMessageHead) -> bytes:
+        head = check.isinstance(head, IoPipelineHttpResponseHead)
+        version_str = f'HTTP/{head.version.major}.{head.version.minor}'
+        return f'{version_str} {head.status} {head.reason}\r\n'.encode('ascii')
+
+
+##
+
+
+class IoPipelineHttpResponseChunker(IoPipelineHttpResponseObjects, IoPipelineHttpObjectChunker):
+    pass
+
+
+##
+
+
+class IoPipelineHttpResponseCompressor(IoPipelineHttpResponseObjects, IoPipelineHttpObjectCompressor):
+    pass
+
+
+########################################
+# ../../../omcore/io/streambufs/framing.py
+
+
+##
+
+
+class LongestMatchDelimiterByteStreamFrameDecoder:
+    """
+    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
+
+    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
+    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
+
+    Key property:
+      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
+      it can prove the next byte is not '\\n' (or the stream is finalized).
+
+    Implementation note:
+      This codec searches for all delimiters at once over the buffer's `segments()`, with `scanning.find_longest` -
+      natively when the `_scanning` extension is available. Given a `ScanningByteStreamBuffer` it resumes each search
+      where the last unsuccessful one left off.
+
+    Pairs well with `ScanningByteStreamBuffer`.
+    """
+
+    def __init__(
+            self,
+            delims: ta.Sequence[bytes],
+            *,
+            keep_ends: bool = False,
+            max_size: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        dl = list(delims)
+        if not dl:
+            raise ValueError('no delimiters')
+        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
+            raise TypeError(delims)
+        if any(not d for d in dl):
+            raise ValueError('empty delimiter')
+
+        self._delims = tuple(bytes(d) for d in dl)
+        self._keep_ends = keep_ends
+        self._max_size = max_size
+
+        # Sort by length descending for "choose longest at same start".
+        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+
+        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
+        # with it.
+        pref: ta.Dict[bytes, ta.List[bytes]] = {}
+        for d in self._delims:
+            for e in self._delims:
+                if d is e:
+                    continue
+                if len(e) > len(d) and e.startswith(d):
+                    pref.setdefault(d, []).append(e)
+        for k, vs in list(pref.items()):
+            pref[k] = sorted(vs, key=len, reverse=True)
+        self._prefix_longer = pref
+
+        self._max_delim_len = max(len(d) for d in self._delims)
+
+        # A lone delimiter is simply searched for with the buffer's own `find`.
+        self._single_delim: ta.Optional[bytes] = self._delims[0] if len(set(self._delims)) == 1 else None
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[True],
+    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
+        ...
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[False] = False,
+    ) -> ta.List[ByteStreamBufferView]:
+        ...
+
+    def decode(
+            self,
+            buf,
+            *,
+            final=False,
+            include_delims=False,
+    ):
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
+
+        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
+        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
+        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+
+        Raises:
+          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
+          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+
+        Note on `max_size`:
+          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
+          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
+          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
+          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
+          remaining bytes buffered.
+        """
+
+        out: ta.List[ta.Any] = []
+
+        while True:
+            hit = self._find_next_delim(buf)
+            if hit is None:
+                if self._max_size is not None and len(buf) > self._max_size and not out:
+                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
+                return out
+
+            pos, delim = hit
+
+            if self._max_size is not None and pos > self._max_size:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+
+            if not final and self._should_defer(buf, pos, delim):
+                return out
+
+            if self._keep_ends:
+                frame = buf.split_to(pos + len(delim))
+            else:
+                frame = buf.split_to(pos)
+                buf.advance(len(delim))
+
+            if include_delims:
+                out.append((frame, delim))
+            else:
+                out.append(frame)
+
+    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
+        """
+        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
+        choose the longest matching delimiter.
+        """
+
+        if not len(buf):
+            return None
+
+        if self._single_delim is not None:
+            if (pos := buf.find(self._single_delim)) < 0:
+                return None
+            return pos, self._single_delim
+
+        if isinstance(buf, ScanningByteStreamBuffer):
+            pos, i = buf.find_longest(self._delims_by_len)
+        else:
+            pos, i = find_longest(buf.segments(), self._delims_by_len)
+
+        if pos < 0:
+            return None
+
+        return pos, self._delims_by_len[i]
+
+    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
+        """
+        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
+        have enough bytes to decide.
+
+        We only defer when:
+          - the current match ends at the end of the currently buffered bytes, and
+          - there exists some longer delimiter that has `matched` as a prefix, and
+          - the buffered bytes from pos match the available prefix of that longer delimiter.
+        """
+
+        ln = len(buf)
+        endpos = pos + len(matched)
+        if endpos != ln:
+            return False
+
+        longer = self._prefix_longer.get(matched)
+        if not longer:
+            return False
+
+        avail = ln - pos
+        for d2 in longer:
+            if avail >= len(d2):
+                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
+                continue
+            # Check whether buffered bytes match the prefix of d2 that we have available.
+            # Use stream-correct find on the prefix.
+            prefix = d2[:avail]
+            if buf.find(prefix, pos, pos + avail) == pos:
+                return True
+
+        return False
+
+
+##
+
+
+class LengthFieldByteStreamFrameDecoder:
+    """
+    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
+
+    This is modeled after the common Netty pattern:
+      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
+    where:
+      length_field_end_offset = length_field_offset + length_field_length
+
+    Parameters:
+      - length_field_offset: byte offset of the length field from the start of the frame
+      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
+      - byteorder: 'big' or 'little'
+      - length_adjustment: adjustment added to computed frame length (may be negative)
+      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
+        length field and/or header from the delivered payload)
+      - max_frame_length: maximum allowed total frame length (before stripping)
+
+    Notes:
+      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
+      - Every complete frame laid out in the buffer's first contiguous segment is found in a single pass with
+        `scanning.scan_length_fields` - natively when the `_scanning` extension is available. It only relies on
+        `buf.coalesce(n)` for headers which span segments.
+      - It does not require async/await and is suitable for pipeline-style codecs.
+    """
+
+    def __init__(
+            self,
+            *,
+            length_field_offset: int = 0,
+            length_field_length: int = 4,
+            byteorder: ta.Literal['little', 'big'] = 'big',
+            length_adjustment: int = 0,
+            initial_bytes_to_strip: int = 0,
+            max_frame_length: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        if length_field_offset < 0:
+            raise ValueError(length_field_offset)
+        if length_field_length not in (1, 2, 4, 8):
+            raise ValueError(length_field_length)
+        if byteorder not in ('big', 'little'):
+            raise ValueError(byteorder)
+        if initial_bytes_to_strip < 0:
+            raise ValueError(initial_bytes_to_strip)
+        if max_frame_length is not None and max_frame_length < 0:
+            raise ValueError(max_frame_length)
+
+        self._off = int(length_field_offset)
+        self._llen = int(length_field_length)
+        self._byteorder = byteorder
+        self._adj = int(length_adjustment)
+        self._strip = int(initial_bytes_to_strip)
+        self._max = None if max_frame_length is None else int(max_frame_length)
+
+        self._end_off = self._off + self._llen
+
+    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
+
+        Returns:
+          - list of BytesView-like objects (from `split_to`) representing each decoded frame
+
+        Raises:
+          - FrameTooLarge if a frame exceeds max_frame_length
+          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
+            progress (defensive; rarely hit if upstream caps buffer growth)
+        """
+
+        out: ta.List[ta.Any] = []
 
+        while True:
+            # Need at least enough bytes to read the length field.
+            if len(buf) < self._end_off:
+                return out
 
-class IoPipelineHttpResponseEncoder(IoPipelineHttpResponseObjects, IoPipelineHttpObjectEncoder):
-    def _encode_head_line(self, head: IoPipelineHttpMessageHead) -> bytes:
-        head = check.isinstance(head, IoPipelineHttpResponseHead)
-        version_str = f'HTTP/{head.version.major}.{head.version.minor}'
-        return f'{version_str} {head.status} {head.reason}\r\n'.encode('ascii')
+            # Read header up through the length field contiguously.
+            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
+            mv = buf.peek()
+            if len(mv) < self._end_off:
+                mv = buf.coalesce(self._end_off)
 
+            length_val = int.from_bytes(mv[self._off:self._end_off], self._byteorder, signed=False)
 
-##
+            total_len = length_val + self._adj + self._end_off
+            if total_len < 0:
+                raise ValueError('negative frame length')
 
+            if self._max is not None and total_len > self._max:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
 
-class IoPipelineHttpResponseChunker(IoPipelineHttpResponseObjects, IoPipelineHttpObjectChunker):
-    pass
+            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
+            # control.
+            if len(buf) < total_len:
+                if self._max is not None and len(buf) > self._max:
+                    raise BufferTooLargeByteStreamBufferError(
+                        'buffer exceeded max_frame_length without completing a frame',
+                    )
+                return out
 
+            # If the segment holds more than this frame, pick up every complete frame laid out in it in one pass.
+            if len(mv) - total_len >= self._end_off:
+                lens = scan_length_fields(
+                    mv,
+                    self._off,
+                    self._llen,
+                    self._byteorder,
+                    self._adj,
+                    self._max,
+                ) or [total_len]
+            else:
+                lens = [total_len]
+            del mv
 
-##
+            # We have complete frames available.
+            for total_len in lens:
+                if self._strip:
+                    if self._strip > total_len:
+                        raise ValueError('initial_bytes_to_strip > frame length')
+                    buf.advance(self._strip)
+                    total_len -= self._strip
 
+                out.append(buf.split_to(total_len))
 
-class IoPipelineHttpResponseCompressor(IoPipelineHttpResponseObjects, IoPipelineHttpObjectCompressor):
-    pass
+            # Loop for additional frames
 
 
 ########################################
@@ -26817,9 +27795,13 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     """
     A segmented, consumption-oriented bytes buffer.
 
-    Internally stores a list of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
+    Internally stores a deque of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
     segments without copying.
 
+    Alongside the segments it keeps a parallel deque of their cumulative end offsets, in an 'absolute' coordinate space
+    which only ever shifts by whole prepends - so consuming from the head is a `popleft` of each, and locating the
+    segment holding any position is a bisect rather than a walk.
+
     Optional "chunked writes":
       - If chunk_size > 0, small writes are accumulated into a lazily-allocated active bytearray "chunk" up to
         chunk_size.
@@ -26851,7 +27833,11 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     ) -> None:
         super().__init__()
 
-        self._segs: ta.List[Bytes] = []
+        self._segs: collections.deque[Bytes] = collections.deque()
+
+        # Absolute offset of the end of each segment's readable bytes. The active chunk, always last when present, ends
+        # at its used bytes.
+        self._ends: collections.deque[int] = collections.deque()
 
         self._max_size = None if max_size is None else int(max_size)
 
@@ -26870,6 +27856,9 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def max_size(self) -> ta.Optional[int]:
         return self._max_size
 
+    # Absolute offset of the first segment's first byte - or, with no segments, of the next byte to be written.
+    _base = 0
+
     _head_off = 0
     _len = 0
 
@@ -26882,34 +27871,61 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def __len__(self) -> int:
         return self._len
 
-    def _active_readable_len(self) -> int:
-        if self._active is None:
-            return 0
-        if self._reserved_in_active and self._reserved is not None:
-            tail = self._reserved_len
-        else:
-            tail = 0
-        rl = self._active_used - tail
-        return rl if rl > 0 else 0
+    def _append_seg(self, s: Bytes, n: int) -> None:
+        self._ends.append((self._ends[-1] if self._ends else self._base) + n)
+        self._segs.append(s)
+
+    def _popleft_seg(self) -> Bytes:
+        s = self._segs.popleft()
+        self._base = self._ends.popleft()
+        self._head_off = 0
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
+        return s
+
+    def _seg_start(self, i: int) -> int:
+        """Absolute offset of segment `i`'s first byte, whether or not it is still readable."""
+
+        return self._ends[i - 1] if i else self._base
+
+    def _seg_index(self, a: int) -> int:
+        """Index of the segment holding absolute offset `a`, which must be readable."""
+
+        return bisect.bisect_right(self._ends, a)
+
+    def _gather(self, i: int, a: int, n: int, stop: int) -> Bytes:
+        """Copies up to `n` bytes from absolute offset `a` - in segment `i` - onward, stopping before `stop`."""
+
+        if (e := a + n) > stop:
+            e = stop
+        if a >= e:
+            return b''
+
+        segs = self._segs
+        ends = self._ends
+        s0 = self._seg_start(i)
+        if e <= ends[i]:
+            return segs[i][a - s0:e - s0]
+
+        parts: ta.List[Bytes] = []
+        while a < e:
+            se = ends[i]
+            parts.append(segs[i][a - s0:(se if se < e else e) - s0])
+            a = s0 = se
+            i += 1
+        return b''.join(parts)
+
+    #
 
     def peek(self) -> memoryview:
         if not self._segs:
             return memoryview(b'')
 
-        s0 = self._segs[0]
-        mv = memoryview(s0)
-        if self._head_off:
-            mv = mv[self._head_off:]
-
-        if s0 is self._active:
-            # Active is only meaningful by _active_used, not len(bytearray).
-            rl = self._active_readable_len()
-            if self._head_off >= rl:
-                return memoryview(b'')
-            mv = memoryview(self._active)[self._head_off:rl]
-            return mv
-
-        return mv
+        off = self._head_off
+        if off >= (e := self._ends[0] - self._base):
+            return memoryview(b'')
+        return memoryview(self._segs[0])[off:e]
 
     def segments(self) -> ta.Sequence[memoryview]:
         if not self._segs:
@@ -26917,28 +27933,14 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         out: ta.List[memoryview] = []
 
-        last_i = len(self._segs) - 1
-        for i, s in enumerate(self._segs):
-            if s is self._active and i == last_i:
-                # Active chunk: create fresh view with readable length.
-                rl = self._active_readable_len()
-                if not i:
-                    # Active is also first segment; apply head_off.
-                    if self._head_off >= rl:
-                        continue
-                    mv = memoryview(self._active)[self._head_off:rl]
-                else:
-                    if rl <= 0:
-                        continue
-                    mv = memoryview(self._active)[:rl]
-            else:
-                # Non-active segment.
-                mv = memoryview(s)
-                if not i and self._head_off:
-                    mv = mv[self._head_off:]
-
-            if len(mv):
-                out.append(mv)
+        s0 = self._base
+        off = self._head_off
+        for s, e in zip(self._segs, self._ends):
+            rl = e - s0
+            if off < rl:
+                out.append(memoryview(s)[off:rl] if off or rl != len(s) else memoryview(s))
+            s0 = e
+            off = 0
 
         return out
 
@@ -26951,7 +27953,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         a = self._active
         if a is None:
             a = bytearray(self._chunk_size)  # fixed capacity
-            self._segs.append(a)
+            self._append_seg(a, 0)
             self._active = a
             self._active_used = 0
 
@@ -26964,9 +27966,15 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._reserved_in_active:
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
-        if (used := self._active_used) <= 0:
+        if (used := self._active_used) <= 0 or (len(self._segs) == 1 and self._segs[0] is a and self._head_off >= used):
+            # Nothing readable is left in it - including when everything written to it has since been consumed, in
+            # which case it is simply dropped rather than compacted.
             if self._segs and self._segs[-1] is a:
                 self._segs.pop()
+                e = self._ends.pop()
+                if not self._segs:
+                    self._base = e
+                    self._head_off = 0
             self._active = None
             self._active_used = 0
             return
@@ -26993,19 +28001,19 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def write(self, data: BytesLike, /) -> None:
         if not data:
             return
-        if isinstance(data, memoryview):
-            data = memoryview_to_bytes(data)  # noqa
-        # elif isinstance(data, bytearray):
-        #     pass
-        # else:
-        #     pass
 
+        # Memoryviews are only materialized when kept as their own segment - those small enough to be copied into the
+        # active chunk are copied straight from the view.
         dl = len(data)
 
         if self._max_size is not None and self._len + dl > self._max_size:
             raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size')
 
         if self._chunk_size <= 0:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
+            ends = self._ends
+            ends.append((ends[-1] if ends else self._base) + dl)
             self._segs.append(data)
             self._len += dl
             return
@@ -27014,8 +28022,10 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
         if dl >= self._chunk_size:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
             self._flush_active()
-            self._segs.append(data)
+            self._append_seg(data, dl)
             self._len += dl
             return
 
@@ -27027,6 +28037,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         # Copy into fixed-capacity buffer; do not resize.
         memoryview(a)[self._active_used:self._active_used + dl] = data
         self._active_used += dl
+        self._ends[-1] += dl
         self._len += dl
 
     def prepend(self, data: BytesLike, /) -> None:
@@ -27043,20 +28054,25 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._head_off:
             s0 = self._segs[0]
             if s0 is self._active:
+                # The active chunk is always last, so here it is also the only segment.
                 if self._reserved_in_active:
                     raise OutstandingReserveByteStreamBufferError('outstanding reserve')
-                rl = self._active_readable_len()
-                if self._head_off < rl:
-                    self._segs[0] = memoryview_to_bytes(memoryview(self._active)[self._head_off:rl])
+                if self._head_off < self._active_used:
+                    self._segs[0] = memoryview_to_bytes(memoryview(s0)[self._head_off:self._active_used])
+                    self._base += self._head_off
+                    self._head_off = 0
                 else:
-                    self._segs.pop(0)
+                    self._popleft_seg()
                 self._active = None
                 self._active_used = 0
             else:
                 self._segs[0] = s0[self._head_off:]
-            self._head_off = 0
+                self._base += self._head_off
+                self._head_off = 0
 
-        self._segs.insert(0, data)
+        self._segs.appendleft(data)
+        self._ends.appendleft(self._base)
+        self._base -= dl
         self._len += dl
 
     def reserve(self, n: int, /) -> memoryview:
@@ -27110,6 +28126,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
             if n:
                 self._active_used += n
+                self._ends[-1] += n
                 self._len += n
 
             # Keep active for reuse.
@@ -27128,15 +28145,32 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             return
 
         if n == len(b):
-            self._segs.append(b)
+            self._append_seg(b, n)
             self._len += n
         else:
             bb = memoryview_to_bytes(memoryview(b)[:n])
-            self._segs.append(bb)
+            self._append_seg(bb, n)
             self._len += n
 
     #
 
+    def _keep_consumed_active(self) -> bool:
+        """
+        Called when the first segment has just been fully consumed. If it is the active chunk and has spare capacity it
+        is kept, with the head offset past its used bytes, so further writes and reserves keep filling it rather than
+        allocating a new chunk. Consumed bytes are never overwritten, so views of them previously handed out stay valid.
+        It is always kept while a reservation is outstanding in it.
+        """
+
+        if self._segs[0] is not self._active or (
+                not self._reserved_in_active and
+                self._active_used >= self._chunk_size
+        ):
+            return False
+
+        self._head_off = self._active_used
+        return True
+
     def advance(self, n: int, /) -> None:
         if n < 0 or n > self._len:
             raise ValueError(n)
@@ -27145,35 +28179,20 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         self._len -= n
 
-        while n and self._segs:
-            s0 = self._segs[0]
-
-            if s0 is self._active:
-                avail0 = self._active_readable_len() - self._head_off
-            else:
-                avail0 = len(s0) - self._head_off
-
-            if avail0 <= 0:
-                popped = self._segs.pop(0)
-                if popped is self._active:
-                    self._active = None
-                    self._active_used = 0
-                self._head_off = 0
-                continue
-
-            if n < avail0:
-                self._head_off += n
-                return
-
-            n -= avail0
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        # Pop every segment ending at or before the new head, then land the head offset in the one after.
+        a = self._base + self._head_off + n
+        segs = self._segs
+        ends = self._ends
+        while ends and ends[0] <= a:
+            if segs[0] is self._active:
+                if self._keep_consumed_active():
+                    return
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            self._base = ends.popleft()
 
-        if n:
-            raise RuntimeError(n)
+        self._head_off = a - self._base
 
     def split_to(self, n: int, /) -> ByteStreamBufferView:
         if n < 0 or n > self._len:
@@ -27181,40 +28200,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if not n:
             return _EMPTY_DIRECT_BYTE_STREAM_BUFFER_VIEW
 
-        out: ta.List[memoryview] = []
-        rem = n
+        self._len -= n
 
-        while rem:
-            if not self._segs:
-                raise RuntimeError(rem)
+        b0 = self._base
+        a = b0 + self._head_off
+        e = a + n
+        segs = self._segs
+        ends = self._ends
 
-            s0 = self._segs[0]
+        # Fast path: entirely within a first segment which is not exhausted.
+        if e < ends[0]:
+            self._head_off += n
+            return DirectByteStreamBufferView(memoryview(segs[0])[a - b0:e - b0])
 
-            if s0 is self._active:
-                rl = self._active_readable_len()
-                if self._head_off >= rl:
-                    raise RuntimeError(rem)
-                mv0 = memoryview(s0)[self._head_off:rl]
-            else:
-                mv0 = memoryview(s0)
-                if self._head_off:
-                    mv0 = mv0[self._head_off:]
-
-            if rem < len(mv0):
-                out.append(mv0[:rem])
-                self._head_off += rem
-                self._len -= n
-                return byte_stream_buffer_view_from_segments(out)
-
-            out.append(mv0)
-            rem -= len(mv0)
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        out: ta.List[memoryview] = []
+        active = self._active
+        while ends and (se := ends[0]) <= e:
+            s = segs[0]
+            if a < se:
+                out.append(memoryview(s)[a - b0:se - b0])
+            a = se
+            if s is active:
+                self._base = b0
+                if self._keep_consumed_active():
+                    return byte_stream_buffer_view_from_segments(out)
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            b0 = ends.popleft()
+
+        self._base = b0
+        if a < e:
+            out.append(memoryview(segs[0])[:e - b0])
+        self._head_off = e - b0
 
-        self._len -= n
         return byte_stream_buffer_view_from_segments(out)
 
     def coalesce(self, n: int, /) -> memoryview:
@@ -27232,114 +28251,41 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if len(mv0) >= n:
             return mv0[:n]
 
-        out = bytearray(n)
-        w = 0
-
-        new_segs: ta.List[Bytes] = []
-
-        seg_i = 0
-        while w < n and seg_i < len(self._segs):
-            s = self._segs[seg_i]
-            off = self._head_off if not seg_i else 0
-
-            seg_len = len(s) - off
-            if s is self._active and seg_i == (len(self._segs) - 1):
-                seg_len = self._active_readable_len() - off
-
-            if seg_len <= 0:
-                seg_i += 1
-                continue
-
-            take = n - w
-            if take > seg_len:
-                take = seg_len
-
-            out[w:w + take] = memoryview(s)[off:off + take]
-            w += take
-
-            if take < seg_len:
-                rem = s[off + take:off + seg_len]
-                if rem:
-                    new_segs.append(rem)
-                seg_i += 1
-                break
-
-            seg_i += 1
-
-        if seg_i < len(self._segs):
-            new_segs.extend(self._segs[seg_i:])
+        # Copy the first n readable bytes into a single new segment replacing those they span, keeping what remains of
+        # the last of them as its own segment. The active chunk is always last, so only that one can be it.
+        segs = self._segs
+        ends = self._ends
+        b0 = self._base
+        a0 = a = b0 + self._head_off
+        e = a + n
+
+        parts: ta.List[Bytes] = []
+        while (se := ends[0]) < e:
+            parts.append(segs.popleft()[a - b0:se - b0])
+            ends.popleft()
+            a = b0 = se
+
+        s = segs[0]
+        parts.append(s[a - b0:e - b0])
+        out = b''.join(parts)
+
+        if e < se:
+            segs[0] = memoryview_to_bytes(memoryview(s)[e - b0:se - b0]) if s is self._active else s[e - b0:se - b0]
+        else:
+            segs.popleft()
+            ends.popleft()
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
 
-        self._segs = [bytes(out), *new_segs]
+        segs.appendleft(out)
+        ends.appendleft(e)
+        self._base = a0
         self._head_off = 0
 
-        self._active = None
-        self._active_used = 0
-
-        return memoryview(self._segs[0])[:n]
-
-    def _seg_readable_slice(
-            self,
-            si: int,
-            s: Bytes,
-            last_i: int,
-    ) -> ta.Tuple[int, int]:
-        """
-        Compute the readable offset and length for segment at index si.
-
-        Returns (offset, readable_len) where:
-          - offset: byte offset into segment (head_off for si==0, else 0)
-          - readable_len: number of readable bytes from offset (0 if segment empty/consumed)
-
-        Handles head offset for first segment and active chunk readable length for last segment.
-        """
-
-        off = self._head_off if not si else 0
-        seg_len = len(s) - off
-        if s is self._active and si == last_i:
-            seg_len = self._active_readable_len() - off
-        return off, max(0, seg_len)
-
-    def _seg_search_range(
-            self,
-            start: int,
-            limit: int,
-            m: int,
-            seg_gs: int,
-            seg_ge: int,
-            seg_len: int,
-    ) -> ta.Optional[ta.Tuple[int, int]]:
-        """
-        Compute local search range within a segment.
-
-        Args:
-            start: global start position (user-provided)
-            limit: global limit (end - m, last valid position where match can start)
-            m: pattern length
-            seg_gs: segment global start position
-            seg_ge: segment global end position
-            seg_len: segment readable length
-
-        Returns (local_start, local_end) if segment overlaps search range, else None.
-          - local_start: offset within segment to start searching
-          - local_end: offset within segment to end searching (exclusive)
-        """
-
-        # Check if segment overlaps search range
-        if limit < seg_gs or start >= seg_ge:
-            return None
-
-        # Compute local start within segment
-        ls = max(0, start - seg_gs)
-
-        # Compute local end: can start match anywhere up to limit, need m bytes
-        max_start_in_seg = limit - seg_gs
-        end_search = min(max_start_in_seg + m, seg_len)
-
-        # Validate range
-        if ls >= end_search:
-            return None
+        return memoryview(out)
 
-        return ls, end_search
+    #
 
     def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -27350,57 +28296,42 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        tail: Bytes = b''
-        tail_gstart = 0
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        gpos = 0
+        # Everything below is in absolute offsets: o is that of position 0, and a match must lie within [a, e).
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-        last_i = len(self._segs) - 1
+        i = self._seg_index(a)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
 
-        for si, s in enumerate(self._segs):
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
+            # Matches lying wholly within this segment.
+            hi = se if se < e else e
+            if hi - a >= m and (j := s.find(sub, a - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            seg_gs = gpos
-            seg_ge = gpos + seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.find(sub, off + ls, off + end_search)
-                if idx != -1:
-                    return seg_gs + (idx - off)
-
-            if m > 1 and tail:
-                head_need = m - 1
-                # Only read as many bytes as are actually available in this segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, seg_len)
-                if head_avail > 0:
-                    head = s[off:off + head_avail]
-                    comb = tail + head
-                    j = comb.find(sub)
-                    if j != -1 and j < len(tail) < j + m:
-                        cand = tail_gstart + j
-                        if start <= cand <= limit:
-                            return cand
+            if se >= e:
+                return -1
 
+            # Matches starting within this segment's last m - 1 bytes and running on into the following ones - only
+            # those bytes and the next m - 1 need be searched, and only if the former hold the first byte of sub.
             if m > 1:
-                take = m - 1
-                if seg_len >= take:
-                    tail = s[off + seg_len - take:off + seg_len]
-                    tail_gstart = seg_ge - take
-                else:
-                    tail = (tail + s[off:off + seg_len])[-(m - 1):]
-                    tail_gstart = seg_ge - len(tail)
-
-            gpos = seg_ge
-
-        return -1
+                t = se - m + 1
+                if t < a:
+                    t = a
+                if s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.find(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
+
+            a = s0 = se
+            i += 1
 
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -27411,89 +28342,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        if not self._segs:
-            return -1
-
-        best = -1
-
-        seg_ge = self._len
-        prev_s: ta.Optional[Bytes] = None
-        prev_off = 0
-        prev_seg_len = 0
-
-        last_i = len(self._segs) - 1
-
-        for si in range(len(self._segs) - 1, -1, -1):
-            s = self._segs[si]
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = seg_ge - seg_len
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.rfind(sub, off + ls, off + end_search)
-                if idx != -1:
-                    cand = seg_gs + (idx - off)
-                    if cand > best:
-                        best = cand
-
-            if m > 1 and prev_s is not None:
-                tail_need = m - 1
-                if seg_len >= tail_need:
-                    tail = s[off + seg_len - tail_need:off + seg_len]
-                    tail_gstart = seg_ge - tail_need
-
-                else:
-                    tail_parts = [s[off:off + seg_len]]
-                    tail_len = seg_len
-                    for sj in range(si - 1, -1, -1):
-                        if tail_len >= tail_need:
-                            break
-
-                        sj_s = self._segs[sj]
-                        sj_off, sj_len = self._seg_readable_slice(sj, sj_s, last_i)
-                        if sj_len <= 0:
-                            continue
-
-                        take = min(tail_need - tail_len, sj_len)
-                        tail_parts.insert(0, sj_s[sj_off + sj_len - take:sj_off + sj_len])
-                        tail_len += take
-
-                    tail_combined = b''.join(tail_parts)
-                    tail = tail_combined[-(m - 1):] if len(tail_combined) >= m - 1 else tail_combined
-                    tail_gstart = seg_ge - len(tail)
-
-                head_need = m - 1
-                # Only read as many bytes as are actually available in prev segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, prev_seg_len)
-                if head_avail > 0:
-                    head = prev_s[prev_off:prev_off + head_avail]
-                else:
-                    head = b''
+        i = self._seg_index(e - 1)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
+            lo = a if a > s0 else s0
 
-                comb = tail + head
-                j = comb.rfind(sub)
-                if j != -1 and j < len(tail) < j + m:
-                    cand = tail_gstart + j
-                    if start <= cand <= limit and cand > best:
-                        best = cand
+            # Matches running on past this segment start later than any lying wholly within it, so are searched first.
+            if m > 1 and se < e:
+                t = se - m + 1
+                if t < lo:
+                    t = lo
+                if t < se and s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.rfind(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-            if best >= seg_gs:
-                return best
+            hi = se if se < e else e
+            if hi - lo >= m and (j := s.rfind(sub, lo - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            prev_s = s
-            prev_off = off
-            prev_seg_len = seg_len
-            seg_ge = seg_gs
+            if s0 <= a or not i:
+                return -1
 
-        return best
+            i -= 1
+            s0 = self._seg_start(i)
 
 
 ##
@@ -30355,6 +31237,133 @@ class BufferedBytesToMessageDecoderIoPipelineHandler(
         raise NotImplementedError
 
 
+########################################
+# ../../../omcore/io/pipelines/drivers/sockets.py
+
+
+##
+
+
+def _get_iov_max() -> int:
+    try:
+        if (n := os.sysconf('SC_IOV_MAX')) > 0:
+            return n
+    except (AttributeError, ValueError, OSError):
+        pass
+    return 1024
+
+
+IOV_MAX = _get_iov_max()
+
+
+##
+
+
+class SocketRecvBuffer:
+    """
+    Receives with `recv_into` straight into memory reserved from a `SegmentedByteStreamBuffer`, rather than allocating a
+    fresh bytes object per read. Received data is returned as a memoryview over the chunk it was read into - the chunk
+    is only ever appended to, never overwritten, so these views remain valid for as long as they are held, at the cost
+    of pinning the chunk.
+    """
+
+    def __init__(
+            self,
+            read_chunk_size: int,
+            *,
+            chunk_size: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        self._read_chunk_size = read_chunk_size
+        if chunk_size is None:
+            chunk_size = read_chunk_size * 4
+        self._buf = SegmentedByteStreamBuffer(chunk_size=chunk_size)
+
+    def recv(self, sock: ta.Any) -> memoryview:
+        """Returns an empty view on EOF. Raises whatever the socket raises, including BlockingIOError."""
+
+        if (recv_into := getattr(sock, 'recv_into', None)) is None:
+            return memoryview(sock.recv(self._read_chunk_size))
+
+        buf = self._buf
+        mv = buf.reserve(self._read_chunk_size)
+        try:
+            n = recv_into(mv)
+        except BaseException:
+            buf.commit(0)
+            raise
+
+        buf.commit(n)
+        buf.advance(n)
+        return mv[:n]
+
+
+##
+
+
+class SocketSendQueue:
+    """
+    Queues outbound data and sends as much of it as the socket will take in a single `sendmsg` call per attempt, rather
+    than one `send` per buffer. Sockets without a working `sendmsg` - notably ssl sockets - fall back to `send`.
+
+    Its length is the number of bytes pending.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_iov: int = IOV_MAX,
+    ) -> None:
+        super().__init__()
+
+        self._max_iov = max_iov
+
+        self._q: collections.deque[memoryview] = collections.deque()
+        self._len = 0
+
+        self._no_sendmsg = False
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, data: BytesLike) -> None:
+        if not data:
+            return
+        mv = data if isinstance(data, memoryview) else memoryview(data)
+        self._q.append(mv)
+        self._len += mv.nbytes
+
+    def _send(self, sock: ta.Any) -> int:
+        q = self._q
+        if len(q) > 1 and not self._no_sendmsg:
+            try:
+                return sock.sendmsg(list(itertools.islice(q, self._max_iov)))
+            except (AttributeError, NotImplementedError):
+                self._no_sendmsg = True
+        return sock.send(q[0])
+
+    def flush(self, sock: ta.Any) -> None:
+        """
+        Sends until the queue is empty. On a non-blocking socket this raises BlockingIOError once the socket stops
+        taking data, leaving the remainder queued.
+        """
+
+        q = self._q
+        while q:
+            n = self._send(sock)
+            self._len -= n
+
+            while n:
+                h = q[0]
+                if n >= (hl := h.nbytes):
+                    q.popleft()
+                    n -= hl
+                else:
+                    q[0] = h[n:]
+                    n = 0
+
+
 ########################################
 # ../../../omcore/logs/modules.py
 
@@ -30572,6 +31581,11 @@ class IoPipelineHttpObjectDecoder(
     def _if_content_length_missing(self) -> ta.Literal['empty', 'eof']:
         raise NotImplementedError
 
+    def _has_body(self, head: IoPipelineHttpMessageHead) -> bool:
+        """Called once per message head. If false the message ends with its head, whatever its headers describe."""
+
+        return True
+
     #
 
     def _decode(
@@ -30727,6 +31741,10 @@ class IoPipelineHttpObjectDecoder(
                 *,
                 final: bool = False,
         ) -> ta.Optional[ta.Tuple['IoPipelineHttpObjectDecoder._State', ta.Optional[CanByteStreamBuffer]]]:
+            if not self._d._has_body(self._head):  # noqa
+                out.append(self._d._make_end())  # noqa
+                return (self._d._DoneState(self._d, self._head), data)  # noqa
+
             try:
                 te = IoPipelineHttpBodyMode.select(
                     self._head.headers,
@@ -31123,7 +32141,6 @@ class IoPipelineHttpObjectDecoder(
 # ../../../omcore/io/pipelines/drivers/sync.py
 """
 TODO:
- - can implement sched w/ settimeout
  - sanity / upper bound read/write timeouts
 """
 
@@ -31153,6 +32170,8 @@ class SyncSocketIoPipelineDriver:
             spec: IoPipeline.Spec,
             sock: ta.Any,
             config: ta.Optional[Config] = None,
+            *,
+            wheel: ta.Optional[HashedTimingWheel] = None,
     ) -> None:
         super().__init__()
 
@@ -31161,10 +32180,16 @@ class SyncSocketIoPipelineDriver:
         if config is None:
             config = self.Config.DEFAULT
         self._config = config
+        if wheel is None:
+            wheel = HashedTimingWheel(tick_s=.01, num_buckets=64)
+        self._wheel = wheel
 
         self._input_q: collections.deque[ta.Any] = collections.deque()
         self._input_q.append(IoPipelineMessages.InitialInput())
 
+        self._recv_buf = SocketRecvBuffer(config.read_chunk_size)
+        self._send_q = SocketSendQueue()
+
     def __repr__(self) -> str:
         return f'{type(self).__name__}@{id(self):x}'
 
@@ -31194,7 +32219,7 @@ class SyncSocketIoPipelineDriver:
         except AttributeError:
             pass
 
-        self._sched = self._SchedulingService(self)
+        self._sched = WheelIoPipelineScheduling(self._wheel, self._run_scheduled)
 
         self._pipeline = pipeline = self._make_pipeline()
 
@@ -31244,12 +32269,25 @@ class SyncSocketIoPipelineDriver:
     def _do_read(self) -> ta.List[ta.Any]:
         out: ta.List[ta.Any] = []
 
-        # if (dl := self._sched.next_delay()) is not None:
-        #     self._sock.settimeout(dl)
-        # else:
-        #     self._sock.settimeout(None)
+        if self._wheel.advance():
+            return out
+
+        if (dl := self._wheel.next_delay()) is not None:
+            # Bound the read by the next timer, without extending any timeout the socket already has.
+            prev = self._sock.gettimeout()
+            self._sock.settimeout(dl if prev is None else min(dl, prev))
+            try:
+                b = self._recv_buf.recv(self._sock)
+            except socket.timeout:
+                if prev is not None and dl >= prev:
+                    raise
+                self._wheel.advance()
+                return out
+            finally:
+                self._sock.settimeout(prev)
 
-        b = self._sock.recv(self._config.read_chunk_size)
+        else:
+            b = self._recv_buf.recv(self._sock)
 
         if not b:
             out.append(IoPipelineMessages.FinalInput())
@@ -31265,72 +32303,26 @@ class SyncSocketIoPipelineDriver:
 
     #
 
-    class _SchedulingService(IoPipelineScheduling, IoPipelineService):
-        def __init__(self, d: 'SyncSocketIoPipelineDriver') -> None:
-            super().__init__()
-
-            self._d = d
-
-            self._seq = 0
-            self._pending: ta.List[ta.Tuple[float, int, SyncSocketIoPipelineDriver._SchedulingService._Handle]] = []
-
-        def _clear_cancelled(self) -> None:
-            while self._pending and self._pending[0][2]._cancelled:  # noqa
-                heapq.heappop(self._pending)
-
-        def next_delay(self) -> ta.Optional[float]:
-            self._clear_cancelled()
-            if not self._pending:
-                return None
-            return time.time() - self._pending[0][0]
-
-        @ta.final
-        class _Handle(IoPipelineScheduling.Handle):
-            def __init__(
-                    self,
-                    handler_ref: IoPipelineHandlerRef,
-                    fn: ta.Callable[[], None],
-                    deadline: float,
-                    seq: int,
-            ) -> None:
-                self._deadline = deadline
-                self._seq = seq
-                self._handler_ref = handler_ref
-                self._fn = fn
-
-                self._cancelled = False
-
-            def cancel(self) -> None:
-                self._cancelled = True
-
-        def schedule(
-                self,
-                handler_ref: IoPipelineHandlerRef,
-                delay_s: float,
-                fn: ta.Callable[[], None],
-        ) -> IoPipelineScheduling.Handle:
-            h = self._Handle(
-                handler_ref,
-                fn,
-                time.time() + delay_s,
-                self._seq,
-            )
-            self._seq += 1
-            heapq.heappush(self._pending, (h._deadline, h._seq, h))  # noqa
-            return h
-
-        def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
-            raise NotImplementedError
+    _sched: WheelIoPipelineScheduling
 
-    _sched: _SchedulingService
+    def _run_scheduled(self, fn: ta.Callable[[], None]) -> None:
+        # Whatever fn produces is left in the pipeline's output, which the loop goes on to drain.
+        with self._pipeline.enter():
+            fn()
 
     #
 
+    def _flush_send_q(self) -> None:
+        # Output is queued as the pipeline emits it and sent here, once it has been drained, gathering what has
+        # accumulated into as few calls as possible.
+        if self._send_q:
+            # self._sock.settimeout(None)
+            self._send_q.flush(self._sock)
+
     def _handle_output(self, msg: ta.Any) -> ta.Literal['handled', 'unhandled', 'stop']:
         if ByteStreamBuffers.can_bytes(msg):
             for mv in ByteStreamBuffers.iter_segments(msg):
-                # self._sock.settimeout(None)
-                self._sock.sendall(mv)
+                self._send_q.append(mv)
             return 'handled'
 
         elif isinstance(msg, IoPipelineFlowMessages.FlushOutput):
@@ -31375,14 +32367,18 @@ class SyncSocketIoPipelineDriver:
                     continue
 
                 elif handled == 'unhandled':
+                    self._flush_send_q()
                     return ('unhandled', out_msg)
 
                 elif handled == 'stop':
+                    self._flush_send_q()
                     return 'stop'
 
                 else:
                     raise RuntimeError(f'Unknown handled value: {handled!r}')
 
+            self._flush_send_q()
+
             if self._input_q:
                 pipeline.feed_in(self._input_q.popleft())
                 continue
@@ -31425,7 +32421,12 @@ class SyncSocketIoPipelineDriver:
                 return None
 
             elif out is None:
-                if raise_on_stall:
+                if read and len(self._sched) and (dl := self._wheel.next_delay()) is not None:
+                    # Nothing to do but wait for a timer.
+                    time.sleep(dl)
+                    self._wheel.advance()
+
+                elif raise_on_stall:
                     raise RuntimeError('Pipeline stalled')
 
                 else:
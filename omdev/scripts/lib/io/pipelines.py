@@ -8,6 +8,7 @@
 # ruff: noqa: FURB188 PYI034 UP006 UP007 UP036 UP037 UP045 UP046
 import abc
 import asyncio
+import bisect
 import collections
 import collections.abc
 import dataclasses as dc
@@ -16,13 +17,16 @@ import functools
 import inspect
 import io
 import logging
+import math
 import os.path
+import re
 import sys
 import threading
 import time
 import traceback
 import types
 import typing as ta
+import weakref
 
 
 ########################################
@@ -36,6 +40,7 @@ def __om_amalg__():  # noqa
     return dict(
         src_files=[
             dict(path='errors.py', sha1='42c3991496edf534c7a09d30cff8c6b919f80c50'),
+            dict(path='../streambufs/_scanning_py.py', sha1='50bc68f17ad51947ad68b986d449307ab05b8509'),
             dict(path='../streambufs/errors.py', sha1='6b04cc2e4ba5461692128938a2bd5c261486746b'),
             dict(path='../../lite/abstract.py', sha1='a2fc3f3697fa8de5247761e9d554e70176f37aac'),
             dict(path='../../lite/asyncs.py', sha1='6bd4b8ecc310ac1df19bafaf6eb85a1a284f65d5'),
@@ -44,7 +49,7 @@ def __om_amalg__():  # noqa
             dict(path='../../lite/namespaces.py', sha1='27b12b6592403c010fb8b2a0af7c24238490d3a1'),
             dict(path='../../logs/levels.py', sha1='bd87ff6a281e361cbab4f205802187b2080044e6'),
             dict(path='../../logs/warnings.py', sha1='03e6c5d0c4c25b51cdd225c029e652cdf741a51a'),
-            dict(path='core.py', sha1='629ab14961ca7b35893b7e5f1e781dcafb0beacb'),
+            dict(path='core.py', sha1='3bb2aad1972ff9e42bafbc5d21a6137d4657960e'),
             dict(path='../streambufs/types.py', sha1='3edeaaa038f975595ba3eeea10f7e313d84723bb'),
             dict(path='../../logs/infos.py', sha1='c6a4599ad727fbee7c3d8eb1bce80846f8106079'),
             dict(path='../../logs/metrics/base.py', sha1='38429b7e804533da9a1dd356cf563ac4cff82aa2'),
@@ -57,22 +62,23 @@ def __om_amalg__():  # noqa
             dict(path='handlers/queues.py', sha1='0672c722e377d67369da3cb4a082b4816eb84875'),
             dict(path='sched/types.py', sha1='ff77ef20dd7750c25af4ab4826de06afe3b53bac'),
             dict(path='../streambufs/base.py', sha1='0f0cea0fe05f9d7b4669a7b3871bc78e12af98f6'),
-            dict(path='../streambufs/framing.py', sha1='de1f818064576e855f20b005ea7855a1fd5f3f56'),
             dict(path='../streambufs/utils.py', sha1='62d7fce79bae738c199627668bdee8bb389efa1e'),
             dict(path='../../logs/contexts.py', sha1='529adb527492309bf8cde342271ac6ea2ebbf8a1'),
             dict(path='../../logs/utils.py', sha1='7dd07873ddd48f99bda0cf3837e01c4c7c4cc96c'),
             dict(path='bytes/queues.py', sha1='0b6e9de9fc1ec723fd66c59a9e1d2bf510a2f719'),
             dict(path='handlers/flatmap.py', sha1='221fb097b9f93fcff167a8aed30a909c9ca45b01'),
+            dict(path='sched/wheel.py', sha1='1908214ee8ca66b900520273aa2eda1f7a91b5d4'),
             dict(path='../streambufs/direct.py', sha1='5a629d79aa7f618dce40e11c2609bc0dcd008599'),
-            dict(path='../streambufs/scanning.py', sha1='36411208b4e6515528f0310c7052b3faf2572b24'),
+            dict(path='../streambufs/scanning.py', sha1='9cee14466174532dfde8f5c96d8f4d487fdcfa97'),
             dict(path='../../logs/base.py', sha1='4195705c64f3ec1c4263c2c76c63351d9dacdd5c'),
             dict(path='../../logs/std/records.py', sha1='fb1e2d887248cc24b0463156836d9965a06c8ab6'),
-            dict(path='../streambufs/segmented.py', sha1='ad3c91e91d7b91396c51549fc7578419b1c3d336'),
+            dict(path='../streambufs/framing.py', sha1='3f1ea224a36e5afc287d318e2b8d4cb92acf4128'),
+            dict(path='../streambufs/segmented.py', sha1='5dd5ba71c2d8716eea38210099c569a6e2e03b65'),
             dict(path='../../logs/asyncs.py', sha1='6b444494a0512f7b7ea2c93be5c4a9868deb7251'),
             dict(path='../../logs/std/loggers.py', sha1='144a96b3b190a5641f3b7cc2656d6ffa4e45b5a9'),
             dict(path='bytes/decoders.py', sha1='4f0df234d6fba71e485378de06fa6c1f9276e6ef'),
             dict(path='../../logs/modules.py', sha1='b51c2d4396854b515d29cee17f906d5cc47eb7f2'),
-            dict(path='drivers/asyncio.py', sha1='7c62aa82f0b3f8125c44b11f6424ca81d7ada46d'),
+            dict(path='drivers/asyncio.py', sha1='a8709f91e4701efd0cb2ede13056eca358dcc472'),
             dict(path='_amalg.py', sha1='41c208295c50c3d65bc0576ff49203cedf4e3773'),
         ],
     )
@@ -255,6 +261,141 @@ class FlowControlValidationIoPipelineError(IoPipelineError):
     pass
 
 
+########################################
+# ../../streambufs/_scanning_py.py
+"""
+Pure-Python reference implementations of the functions of the optional `_scanning` extension, which must behave
+identically. `scanning` exports the extension's versions when it is available, and these otherwise.
+"""
+
+
+##
+
+
+_FIND_LONGEST_PATS: ta.Dict[ta.Tuple[bytes, ...], ta.Tuple[ta.Any, ta.Any, int]] = {}
+
+
+def _find_longest_pats(subs: ta.Tuple[bytes, ...]) -> ta.Tuple[ta.Any, ta.Any, int]:
+    try:
+        return _FIND_LONGEST_PATS[subs]
+    except KeyError:
+        pass
+
+    if not subs:
+        raise ValueError('no subs')
+    if any(not s for s in subs):
+        raise ValueError('empty sub')
+
+    # Alternation tries its branches in order, so at the leftmost position matched the first sub to match wins. One
+    # group per sub lets `lastindex` name it.
+    pat = re.compile(b'|'.join(b'(' + re.escape(s) + b')' for s in subs))
+    first_pat = re.compile(b'[' + b''.join(re.escape(s[:1]) for s in subs) + b']')
+
+    if len(_FIND_LONGEST_PATS) >= 256:
+        _FIND_LONGEST_PATS.clear()
+    ret = _FIND_LONGEST_PATS[subs] = (pat, first_pat, max(len(s) for s in subs) - 1)
+    return ret
+
+
+def find_longest(segs: ta.Sequence[ta.Any], subs: ta.Sequence[bytes], start: int = 0) -> ta.Tuple[int, int]:
+    """
+    Searches the stream formed by concatenating the bytes-like `segs` for the earliest occurrence of any of `subs` at or
+    after `start`, returning its position and the index of the first of `subs` which occurs there - so ordering `subs`
+    longest first picks the longest match. Returns (-1, -1) if none occurs.
+    """
+
+    pat, first_pat, ov = _find_longest_pats(tuple(subs))
+
+    if start < 0:
+        start = 0
+
+    n = len(segs)
+    i = 0
+    base = 0
+    while i < n:
+        sl = len(segs[i])
+        if base + sl > start:
+            break
+        base += sl
+        i += 1
+
+    lo = start - base
+    while i < n:
+        s = segs[i]
+        sl = len(s)
+
+        # Matches starting within the last `ov` bytes may be cut short - or missed - by the end of the segment, so only
+        # earlier ones are final.
+        tail = sl - ov
+        m = pat.search(s, lo)
+        if m is not None and m.start() < tail:
+            return base + m.start(), m.lastindex - 1
+
+        wlo = lo if lo > tail else tail
+        if ov and i + 1 < n and (m is not None or first_pat.search(s, wlo) is not None):
+            parts = [s[wlo:]]
+            need = ov
+            j = i + 1
+            while need and j < n:
+                p = segs[j][:need]
+                parts.append(p)
+                need -= len(p)
+                j += 1
+
+            # Matches starting after the boundary would be cut short by the end of the window - they're found from the
+            # next segment instead.
+            wm = pat.search(b''.join(parts))
+            if wm is not None and wm.start() < sl - wlo:
+                return base + wlo + wm.start(), wm.lastindex - 1
+
+        elif m is not None:
+            return base + m.start(), m.lastindex - 1
+
+        base += sl
+        lo = 0
+        i += 1
+
+    return -1, -1
+
+
+def scan_length_fields(
+        buf: ta.Any,
+        offset: int,
+        length: int,
+        byteorder: str,
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    """
+    Returns the total lengths of the consecutive length-field-prefixed frames laid out wholly within the bytes-like
+    `buf` from its start, where each frame's total length is its unsigned length field's value plus `adjustment` plus
+    `offset + length`. Stops at the first frame which is incomplete, whose total length is shorter than its header, or
+    which is longer than `limit`.
+    """
+
+    if offset < 0:
+        raise ValueError(offset)
+    if length not in (1, 2, 4, 8):
+        raise ValueError(length)
+    if byteorder not in ('big', 'little'):
+        raise ValueError(byteorder)
+
+    mv = memoryview(buf)
+    n = len(mv)
+    end_off = offset + length
+
+    out: ta.List[int] = []
+    p = 0
+    while n - p >= end_off:
+        t = int.from_bytes(mv[p + offset:p + end_off], byteorder) + adjustment + end_off  # type: ignore[arg-type]
+        if t < end_off or t > n - p or (limit is not None and t > limit):
+            break
+        out.append(t)
+        p += t
+
+    return out
+
+
 ########################################
 # ../../streambufs/errors.py
 
@@ -2082,13 +2223,13 @@ class IoPipelineServices:
         for svc in lst:
             sty = type(svc)
             if sty.pipeline_update is not IoPipelineService.pipeline_update:
-                handles_pipeline_update.append(sty)
+                handles_pipeline_update.append(svc)
             if sty.handler_update is not IoPipelineService.handler_update:
-                handles_handler_update.append(sty)
+                handles_handler_update.append(svc)
             if sty.pipeline_enter is not IoPipelineService.pipeline_enter:
-                handles_pipeline_enter.append(sty)
+                handles_pipeline_enter.append(svc)
             if sty.pipeline_exit is not IoPipelineService.pipeline_exit:
-                handles_pipeline_exit.append(sty)
+                handles_pipeline_exit.append(svc)
 
     _handles_pipeline_update: ta.Sequence[IoPipelineService]
     _handles_handler_update: ta.Sequence[IoPipelineService]
@@ -4551,628 +4692,293 @@ class BaseByteStreamBufferLike(ByteStreamBufferLike, Abstract):
 
 
 ########################################
-# ../../streambufs/framing.py
+# ../../streambufs/utils.py
 
 
 ##
 
 
-class LongestMatchDelimiterByteStreamFrameDecoder:
-    """
-    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
-
-    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
-    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
-
-    Key property:
-      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
-      it can prove the next byte is not '\\n' (or the stream is finalized).
-
-    Implementation note:
-      This codec relies on `ByteStreamBuffer.find(...)` being stream-correct and C-accelerated over the buffer's
-      underlying contiguous segments. In pure Python it is usually better to keep searching near the storage layer than
-      to re-implement scanning byte-by-byte in higher-level codecs.
-
-    Pairs well with `ScanningByteStreamBuffer`.
-    """
-
-    def __init__(
-            self,
-            delims: ta.Sequence[bytes],
-            *,
-            keep_ends: bool = False,
-            max_size: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
+class ByteStreamBuffers(NamespaceClass):
+    _CAN_CONVERT_TYPES: ta.ClassVar[ta.Tuple[type, ...]] = (
+        *BYTES_LIKE_TYPES,
+        ByteStreamBufferLike,
+    )
 
-        dl = list(delims)
-        if not dl:
-            raise ValueError('no delimiters')
-        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
-            raise TypeError(delims)
-        if any(not d for d in dl):
-            raise ValueError('empty delimiter')
+    #
 
-        self._delims = tuple(bytes(d) for d in dl)
-        self._keep_ends = keep_ends
-        self._max_size = max_size
+    @classmethod
+    def can_bytes(cls, obj: ta.Any, /) -> bool:
+        return type(obj) in (cts := cls._CAN_CONVERT_TYPES) or isinstance(obj, cts)
 
-        # Sort by length descending for "choose longest at same start".
-        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+    #
 
-        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
-        # with it.
-        pref: ta.Dict[bytes, ta.List[bytes]] = {}
-        for d in self._delims:
-            for e in self._delims:
-                if d is e:
-                    continue
-                if len(e) > len(d) and e.startswith(d):
-                    pref.setdefault(d, []).append(e)
-        for k, vs in list(pref.items()):
-            pref[k] = sorted(vs, key=len, reverse=True)
-        self._prefix_longer = pref
+    @classmethod
+    @ta.overload
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[True],
+            or_none: ta.Literal[True],
+    ) -> ta.Optional[bytes]:
+        ...
 
-        self._max_delim_len = max(len(d) for d in self._delims)
+    @classmethod
+    @ta.overload
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[True],
+            or_none: ta.Literal[False] = False,
+    ) -> bytes:
+        ...
 
+    @classmethod
     @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[True],
-    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[False] = False,
+            or_none: ta.Literal[True],
+    ) -> ta.Optional[Bytes]:
         ...
 
+    @classmethod
     @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[False] = False,
-    ) -> ta.List[ByteStreamBufferView]:
+    def to_bytes(
+            cls,
+            obj: ta.Any,
+            /, *,
+            strict: ta.Literal[False] = False,
+            or_none: ta.Literal[False] = False,
+    ) -> Bytes:
         ...
 
-    def decode(
-            self,
-            buf,
-            *,
-            final=False,
-            include_delims=False,
+    @classmethod
+    def to_bytes(
+            cls,
+            obj,
+            /, *,
+            strict=False,
+            or_none=False,
     ):
         """
-        Consume as many complete frames as possible from `buf` and return them as views.
+        Returns a non-shared version of the given object. If a possibly shared memoryview is acceptable, use
+        `iter_segments`.
+        """
 
-        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
-        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
-        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+        if strict:
+            if (ot := type(obj)) is bytes or isinstance(obj, bytes):
+                return obj
 
-        Raises:
-          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
-          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+            elif ot is bytearray:
+                return bytes(obj)
 
-        Note on `max_size`:
-          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
-          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
-          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
-          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
-          remaining bytes buffered.
-        """
+            elif isinstance(obj, memoryview):
+                return memoryview_to_bytes_strict(obj)
 
-        out: ta.List[ta.Any] = []
+        else:
+            if (ot := type(obj)) is bytes or ot is bytearray or isinstance(obj, BYTES_TYPES):
+                return obj
 
-        while True:
-            hit = self._find_next_delim(buf)
-            if hit is None:
-                if self._max_size is not None and len(buf) > self._max_size and not out:
-                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
-                return out
+            elif isinstance(obj, memoryview):
+                return memoryview_to_bytes(obj)
 
-            pos, delim = hit
+        if isinstance(obj, ByteStreamBufferView):
+            return obj.tobytes()
 
-            if self._max_size is not None and pos > self._max_size:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+        elif isinstance(obj, ByteStreamBufferLike):
+            return b''.join(bytes(mv) for mv in obj.segments())
 
-            if not final and self._should_defer(buf, pos, delim):
-                return out
+        elif or_none:
+            return None
 
-            if self._keep_ends:
-                frame = buf.split_to(pos + len(delim))
-            else:
-                frame = buf.split_to(pos)
-                buf.advance(len(delim))
+        else:
+            raise TypeError(obj)
 
-            if include_delims:
-                out.append((frame, delim))
-            else:
-                out.append(frame)
+    #
 
-    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
-        """
-        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
-        choose the longest matching delimiter.
-        """
+    @classmethod
+    @ta.overload
+    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[True], /) -> ta.Optional[int]: ...
 
-        ln = len(buf)
-        if not ln:
-            return None
+    @classmethod
+    @ta.overload
+    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[False] = False, /) -> int: ...
 
-        best_pos = None  # type: ta.Optional[int]
-        best_delim = None  # type: ta.Optional[bytes]
+    @classmethod
+    def bytes_len(cls, obj, or_none=False):
+        if cls.can_bytes(obj):
+            return len(obj)
 
-        # First pass: find the earliest position of any delimiter (cheap, uses buf.find).
-        for d in self._delims:
-            i = buf.find(d, 0, None)
-            if i == -1:
-                continue
-            if best_pos is None or i < best_pos:
-                best_pos = i
-                best_delim = d
-                if not best_pos:
-                    # Can't beat position 0; still need to choose longest at this position.
-                    pass
-            elif i == best_pos and best_delim is not None and len(d) > len(best_delim):
-                best_delim = d
-
-        if best_pos is None or best_delim is None:
+        elif or_none:
             return None
 
-        # Second pass: at that position, choose the longest delimiter that actually matches there. (We can't just rely
-        # on "which delimiter found it first" when overlaps exist.)
-        pos = best_pos
-        for d in self._delims_by_len:
-            if pos + len(d) > ln:
-                continue
-            if buf.find(d, pos, pos + len(d)) == pos:
-                return pos, d
+        else:
+            raise TypeError(obj)
 
-        # Shouldn't happen: best_pos came from some delimiter occurrence.
-        return pos, best_delim
+    #
 
-    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
-        """
-        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
-        have enough bytes to decide.
+    @staticmethod
+    def iter_segments(obj: ta.Any, /) -> ta.Iterator[memoryview]:
+        if (ot := type(obj)) is memoryview:
+            yield obj
+        elif ot is bytes or ot is bytearray:
+            yield memoryview(obj)
 
-        We only defer when:
-          - the current match ends at the end of the currently buffered bytes, and
-          - there exists some longer delimiter that has `matched` as a prefix, and
-          - the buffered bytes from pos match the available prefix of that longer delimiter.
-        """
+        elif isinstance(obj, memoryview):
+            yield obj
+        elif isinstance(obj, (bytes, bytearray)):
+            yield memoryview(obj)
 
-        ln = len(buf)
-        endpos = pos + len(matched)
-        if endpos != ln:
-            return False
+        elif isinstance(obj, ByteStreamBufferLike):
+            yield from obj.segments()
 
-        longer = self._prefix_longer.get(matched)
-        if not longer:
-            return False
+        else:
+            raise TypeError(obj)
 
-        avail = ln - pos
-        for d2 in longer:
-            if avail >= len(d2):
-                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
-                continue
-            # Check whether buffered bytes match the prefix of d2 that we have available.
-            # Use stream-correct find on the prefix.
-            prefix = d2[:avail]
-            if buf.find(prefix, pos, pos + avail) == pos:
-                return True
+    #
 
-        return False
+    @staticmethod
+    def split(buf: ByteStreamBuffer, sep: bytes, /, *, final: bool = False) -> ta.List[ByteStreamBufferView]:
+        out: ta.List[ByteStreamBufferView] = []
+        while (i := buf.find(sep)) >= 0:
+            out.append(buf.split_to(i + 1))
+        if final and len(buf):
+            out.append(buf.split_to(len(buf)))
+        return out
 
 
-##
+########################################
+# ../../../logs/contexts.py
 
 
-class LengthFieldByteStreamFrameDecoder:
-    """
-    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
+##
 
-    This is modeled after the common Netty pattern:
-      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
-    where:
-      length_field_end_offset = length_field_offset + length_field_length
 
-    Parameters:
-      - length_field_offset: byte offset of the length field from the start of the frame
-      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
-      - byteorder: 'big' or 'little'
-      - length_adjustment: adjustment added to computed frame length (may be negative)
-      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
-        length field and/or header from the delivered payload)
-      - max_frame_length: maximum allowed total frame length (before stripping)
+class LoggingContext(Abstract):
+    @abc.abstractmethod
+    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
+        raise NotImplementedError
 
-    Notes:
-      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
-      - It relies on `buf.coalesce(n)` for efficient header parsing in pure Python.
-      - It does not require async/await and is suitable for pipeline-style codecs.
-    """
+    @ta.final
+    def __getitem__(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
+        return self.get_info(ty)
 
-    def __init__(
-            self,
-            *,
-            length_field_offset: int = 0,
-            length_field_length: int = 4,
-            byteorder: ta.Literal['little', 'big'] = 'big',
-            length_adjustment: int = 0,
-            initial_bytes_to_strip: int = 0,
-            max_frame_length: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
+    @ta.final
+    def must_get_info(self, ty: ta.Type[LoggingContextInfoT]) -> LoggingContextInfoT:
+        if (info := self.get_info(ty)) is None:
+            raise TypeError(f'LoggingContextInfo absent: {ty}')
+        return info
 
-        if length_field_offset < 0:
-            raise ValueError(length_field_offset)
-        if length_field_length not in (1, 2, 4, 8):
-            raise ValueError(length_field_length)
-        if byteorder not in ('big', 'little'):
-            raise ValueError(byteorder)
-        if initial_bytes_to_strip < 0:
-            raise ValueError(initial_bytes_to_strip)
-        if max_frame_length is not None and max_frame_length < 0:
-            raise ValueError(max_frame_length)
 
-        self._off = int(length_field_offset)
-        self._llen = int(length_field_length)
-        self._byteorder = byteorder
-        self._adj = int(length_adjustment)
-        self._strip = int(initial_bytes_to_strip)
-        self._max = None if max_frame_length is None else int(max_frame_length)
+@ta.final
+class SimpleLoggingContext(LoggingContext):
+    def __init__(self, *infos: LoggingContextInfo) -> None:
+        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {type(i): i for i in infos}
 
-        self._end_off = self._off + self._llen
+    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
+        return self._infos.get(ty)
 
-    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
-        """
-        Consume as many complete frames as possible from `buf` and return them as views.
 
-        Returns:
-          - list of BytesView-like objects (from `split_to`) representing each decoded frame
+##
 
-        Raises:
-          - FrameTooLarge if a frame exceeds max_frame_length
-          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
-            progress (defensive; rarely hit if upstream caps buffer growth)
-        """
 
-        out: ta.List[ta.Any] = []
+class CaptureLoggingContext(LoggingContext, Abstract):
+    @abc.abstractmethod
+    def set_basic(
+            self,
+            name: str,
 
-        while True:
-            # Need at least enough bytes to read the length field.
-            if len(buf) < self._end_off:
-                return out
+            msg: ta.Union[str, tuple, LoggingMsgFn],
+            args: tuple,
+    ) -> 'CaptureLoggingContext':
+        raise NotImplementedError
 
-            # Read header up through the length field contiguously.
-            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
-            mv = buf.coalesce(self._end_off)
-            if len(mv) < self._end_off:
-                # Defensive: coalesce contract.
-                return out
+    #
 
-            # Copy just the length field bytes (1/2/4/8) so we can safely mutate the buffer afterward.
-            lf_bytes = bytes(mv[self._off:self._end_off])
-            # del mv
+    class AlreadyCapturedError(Exception):
+        pass
 
-            length_val = int.from_bytes(lf_bytes, self._byteorder, signed=False)
+    class NotCapturedError(Exception):
+        pass
 
-            total_len = length_val + self._adj + self._end_off
-            if total_len < 0:
-                raise ValueError('negative frame length')
+    @abc.abstractmethod
+    def capture(self) -> None:
+        """Must be cooperatively called only from the expected locations."""
 
-            if self._max is not None and total_len > self._max:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
+        raise NotImplementedError
 
-            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
-            # control.
-            if len(buf) < total_len:
-                if self._max is not None and len(buf) > self._max:
-                    raise BufferTooLargeByteStreamBufferError(
-                        'buffer exceeded max_frame_length without completing a frame',
-                    )
-                return out
 
-            # We have a complete frame available.
-            if self._strip:
-                if self._strip > total_len:
-                    raise ValueError('initial_bytes_to_strip > frame length')
-                buf.advance(self._strip)
-                total_len -= self._strip
+@ta.final
+class CaptureLoggingContextImpl(CaptureLoggingContext):
+    @ta.final
+    class NOT_SET:  # noqa
+        def __new__(cls, *args, **kwargs):  # noqa
+            raise TypeError
 
-            out.append(buf.split_to(total_len))
+    #
 
-            # Loop for additional frames
+    def __init__(
+            self,
+            level: LogLevel,
+            *,
+            time_ns: ta.Optional[int] = None,
 
+            exc_info: LoggingExcInfoArg = False,
 
-########################################
-# ../../streambufs/utils.py
+            caller: ta.Union[LoggingContextInfos.Caller, ta.Type[NOT_SET], None] = NOT_SET,
+            stack_offset: int = 0,
+            stack_info: bool = False,
+    ) -> None:
+        if time_ns is None:
+            time_ns = time.time_ns()
 
+        # Done early to not trample on sys.exc_info()
+        exc = LoggingContextInfos.Exc.build(exc_info)
 
-##
+        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {}
+        self._set_info(
+            LoggingContextInfos.Level.build(level),
+            exc,
+            LoggingContextInfos.Time.build(time_ns),
+        )
 
+        if caller is not CaptureLoggingContextImpl.NOT_SET:
+            self._infos[LoggingContextInfos.Caller] = caller
+        else:
+            self._stack_offset = stack_offset
+            self._stack_info = stack_info
 
-class ByteStreamBuffers(NamespaceClass):
-    _CAN_CONVERT_TYPES: ta.ClassVar[ta.Tuple[type, ...]] = (
-        *BYTES_LIKE_TYPES,
-        ByteStreamBufferLike,
-    )
+    def _set_info(self, *infos: ta.Optional[LoggingContextInfo]) -> 'CaptureLoggingContextImpl':
+        for info in infos:
+            if info is not None:
+                self._infos[type(info)] = info
+        return self
 
-    #
+    def get_infos(self) -> ta.Mapping[ta.Type[LoggingContextInfo], LoggingContextInfo]:
+        return self._infos
 
-    @classmethod
-    def can_bytes(cls, obj: ta.Any, /) -> bool:
-        return type(obj) in (cts := cls._CAN_CONVERT_TYPES) or isinstance(obj, cts)
+    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
+        return self._infos.get(ty)
 
-    #
+    ##
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[bytes]:
-        ...
+    def set_basic(
+            self,
+            name: str,
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[False] = False,
-    ) -> bytes:
-        ...
+            msg: ta.Union[str, tuple, LoggingMsgFn],
+            args: tuple,
+    ) -> 'CaptureLoggingContextImpl':
+        return self._set_info(
+            LoggingContextInfos.Name(name),
+            LoggingContextInfos.Msg.build(msg, *args),
+        )
 
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[Bytes]:
-        ...
-
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[False] = False,
-    ) -> Bytes:
-        ...
-
-    @classmethod
-    def to_bytes(
-            cls,
-            obj,
-            /, *,
-            strict=False,
-            or_none=False,
-    ):
-        """
-        Returns a non-shared version of the given object. If a possibly shared memoryview is acceptable, use
-        `iter_segments`.
-        """
-
-        if strict:
-            if (ot := type(obj)) is bytes or isinstance(obj, bytes):
-                return obj
-
-            elif ot is bytearray:
-                return bytes(obj)
-
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes_strict(obj)
-
-        else:
-            if (ot := type(obj)) is bytes or ot is bytearray or isinstance(obj, BYTES_TYPES):
-                return obj
-
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes(obj)
-
-        if isinstance(obj, ByteStreamBufferView):
-            return obj.tobytes()
-
-        elif isinstance(obj, ByteStreamBufferLike):
-            return b''.join(bytes(mv) for mv in obj.segments())
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[True], /) -> ta.Optional[int]: ...
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[False] = False, /) -> int: ...
-
-    @classmethod
-    def bytes_len(cls, obj, or_none=False):
-        if cls.can_bytes(obj):
-            return len(obj)
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def iter_segments(obj: ta.Any, /) -> ta.Iterator[memoryview]:
-        if (ot := type(obj)) is memoryview:
-            yield obj
-        elif ot is bytes or ot is bytearray:
-            yield memoryview(obj)
-
-        elif isinstance(obj, memoryview):
-            yield obj
-        elif isinstance(obj, (bytes, bytearray)):
-            yield memoryview(obj)
-
-        elif isinstance(obj, ByteStreamBufferLike):
-            yield from obj.segments()
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def split(buf: ByteStreamBuffer, sep: bytes, /, *, final: bool = False) -> ta.List[ByteStreamBufferView]:
-        out: ta.List[ByteStreamBufferView] = []
-        while (i := buf.find(sep)) >= 0:
-            out.append(buf.split_to(i + 1))
-        if final and len(buf):
-            out.append(buf.split_to(len(buf)))
-        return out
-
-
-########################################
-# ../../../logs/contexts.py
-
-
-##
-
-
-class LoggingContext(Abstract):
-    @abc.abstractmethod
-    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
-        raise NotImplementedError
-
-    @ta.final
-    def __getitem__(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
-        return self.get_info(ty)
-
-    @ta.final
-    def must_get_info(self, ty: ta.Type[LoggingContextInfoT]) -> LoggingContextInfoT:
-        if (info := self.get_info(ty)) is None:
-            raise TypeError(f'LoggingContextInfo absent: {ty}')
-        return info
-
-
-@ta.final
-class SimpleLoggingContext(LoggingContext):
-    def __init__(self, *infos: LoggingContextInfo) -> None:
-        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {type(i): i for i in infos}
-
-    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
-        return self._infos.get(ty)
-
-
-##
-
-
-class CaptureLoggingContext(LoggingContext, Abstract):
-    @abc.abstractmethod
-    def set_basic(
-            self,
-            name: str,
-
-            msg: ta.Union[str, tuple, LoggingMsgFn],
-            args: tuple,
-    ) -> 'CaptureLoggingContext':
-        raise NotImplementedError
-
-    #
-
-    class AlreadyCapturedError(Exception):
-        pass
-
-    class NotCapturedError(Exception):
-        pass
-
-    @abc.abstractmethod
-    def capture(self) -> None:
-        """Must be cooperatively called only from the expected locations."""
-
-        raise NotImplementedError
-
-
-@ta.final
-class CaptureLoggingContextImpl(CaptureLoggingContext):
-    @ta.final
-    class NOT_SET:  # noqa
-        def __new__(cls, *args, **kwargs):  # noqa
-            raise TypeError
-
-    #
-
-    def __init__(
-            self,
-            level: LogLevel,
-            *,
-            time_ns: ta.Optional[int] = None,
-
-            exc_info: LoggingExcInfoArg = False,
-
-            caller: ta.Union[LoggingContextInfos.Caller, ta.Type[NOT_SET], None] = NOT_SET,
-            stack_offset: int = 0,
-            stack_info: bool = False,
-    ) -> None:
-        if time_ns is None:
-            time_ns = time.time_ns()
-
-        # Done early to not trample on sys.exc_info()
-        exc = LoggingContextInfos.Exc.build(exc_info)
-
-        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {}
-        self._set_info(
-            LoggingContextInfos.Level.build(level),
-            exc,
-            LoggingContextInfos.Time.build(time_ns),
-        )
-
-        if caller is not CaptureLoggingContextImpl.NOT_SET:
-            self._infos[LoggingContextInfos.Caller] = caller
-        else:
-            self._stack_offset = stack_offset
-            self._stack_info = stack_info
-
-    def _set_info(self, *infos: ta.Optional[LoggingContextInfo]) -> 'CaptureLoggingContextImpl':
-        for info in infos:
-            if info is not None:
-                self._infos[type(info)] = info
-        return self
-
-    def get_infos(self) -> ta.Mapping[ta.Type[LoggingContextInfo], LoggingContextInfo]:
-        return self._infos
-
-    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
-        return self._infos.get(ty)
-
-    ##
-
-    def set_basic(
-            self,
-            name: str,
-
-            msg: ta.Union[str, tuple, LoggingMsgFn],
-            args: tuple,
-    ) -> 'CaptureLoggingContextImpl':
-        return self._set_info(
-            LoggingContextInfos.Name(name),
-            LoggingContextInfos.Msg.build(msg, *args),
-        )
-
-    ##
+    ##
 
     _stack_offset: int
     _stack_info: bool
@@ -5726,29 +5532,316 @@ class FlatMapIoPipelineHandlers(NamespaceClass):
 
 
 ########################################
-# ../../streambufs/direct.py
+# ../sched/wheel.py
 
 
 ##
 
 
-class BaseDirectByteStreamBufferLike(BaseByteStreamBufferLike, Abstract):
-    def __init__(self, data: BytesLike) -> None:
+class HashedTimingWheel:
+    """
+    A single-threaded hashed timing wheel (Varghese & Lauck), intended to be shared by all the pipelines driven by a
+    single loop. Scheduling and cancelling are O(1) regardless of the number of timers, at the cost of firing with a
+    granularity of `tick_s` - timers never fire early, but may fire up to a tick late.
+
+    Nothing runs on its own: the owning loop calls `advance` - typically after waking from a poll bounded by
+    `next_delay` - which fires everything due, in deadline order.
+    """
+
+    def __init__(
+            self,
+            *,
+            tick_s: float = .1,
+            num_buckets: int = 512,
+            clock: ta.Callable[[], float] = time.monotonic,
+    ) -> None:
         super().__init__()
 
-        self._data = data
-        if isinstance(data, memoryview):
-            self._mv_ = data
-        else:
-            self._b_ = data
+        check.arg(tick_s > 0, 'tick_s must be positive')
+        check.arg(num_buckets > 0, 'num_buckets must be positive')
 
-    _mv_: memoryview
-    _b_: ta.Union[bytes, bytearray]
+        self._tick_s = tick_s
+        self._num_buckets = num_buckets
+        self._clock = clock
 
-    def _mv(self) -> memoryview:
-        try:
-            return self._mv_
-        except AttributeError:
+        self._start = clock()
+        self._tick = 0
+
+        self._buckets: ta.List[ta.Dict[int, HashedTimingWheel.Timer]] = [{} for _ in range(num_buckets)]
+        self._len = 0
+        self._seq = 0
+
+        self._due: ta.List[HashedTimingWheel.Timer] = []
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={self._len}, tick={self._tick}>'
+
+    @property
+    def tick_s(self) -> float:
+        return self._tick_s
+
+    @property
+    def clock(self) -> ta.Callable[[], float]:
+        return self._clock
+
+    def __len__(self) -> int:
+        """The number of timers scheduled and neither fired nor cancelled."""
+
+        return self._len
+
+    #
+
+    @ta.final
+    class Timer:
+        def __init__(
+                self,
+                wheel: 'HashedTimingWheel',
+                deadline_tick: int,
+                seq: int,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._wheel: ta.Optional[HashedTimingWheel] = wheel
+            self._deadline_tick = deadline_tick
+            self._seq = seq
+            self._fn = fn
+
+        def __repr__(self) -> str:
+            return f'{type(self).__name__}@{id(self):x}<deadline_tick={self._deadline_tick}, active={self.active}>'
+
+        @property
+        def active(self) -> bool:
+            return self._wheel is not None
+
+        def cancel(self) -> None:
+            """Idempotent, and a no-op once fired."""
+
+            if (w := self._wheel) is None:
+                return
+            self._wheel = None
+
+            # Timers already collected by an interrupted `advance` are no longer in their bucket.
+            if w._buckets[self._deadline_tick % w._num_buckets].pop(self._seq, None) is not None:  # noqa
+                w._len -= 1  # noqa
+
+    #
+
+    def _now_tick(self, now: float) -> int:
+        return int((now - self._start) / self._tick_s)
+
+    def schedule(self, delay_s: float, fn: ta.Callable[[], None]) -> Timer:
+        now = self._clock()
+        now_tick = self._now_tick(now)
+
+        if not self._len and now_tick > self._tick:
+            # Nothing is pending, so there is nothing for `advance` to catch up on.
+            self._tick = now_tick
+
+        deadline_tick = math.ceil((now + max(delay_s, 0.) - self._start) / self._tick_s)
+        if deadline_tick <= now_tick:
+            deadline_tick = now_tick + 1
+
+        self._seq += 1
+        t = HashedTimingWheel.Timer(self, deadline_tick, self._seq, fn)
+        self._buckets[deadline_tick % self._num_buckets][t._seq] = t  # noqa
+        self._len += 1
+        return t
+
+    def next_delay(self) -> ta.Optional[float]:
+        """
+        Returns how long until the next tick which may have timers due - possibly early, when the first occupied bucket
+        holds only timers due in later rotations - or None if no timers are pending.
+        """
+
+        if self._due:
+            return 0.
+
+        if not self._len:
+            return None
+
+        n = self._num_buckets
+        buckets = self._buckets
+        base = self._tick + 1
+        i = 0
+        while not buckets[(base + i) % n]:
+            i += 1
+
+        return max(self._start + (base + i) * self._tick_s - self._clock(), 0.)
+
+    def advance(self) -> int:
+        """
+        Fires all timers due as of now, returning how many were fired. Should a timer's fn raise, the timers remaining
+        due are fired by the next call.
+        """
+
+        if not self._due:
+            now_tick = self._now_tick(self._clock())
+            if now_tick <= self._tick:
+                return 0
+
+            n = self._num_buckets
+            buckets = self._buckets
+
+            due: ta.List[HashedTimingWheel.Timer] = []
+            if now_tick - self._tick >= n:
+                ks: ta.Iterable[int] = range(n)
+            else:
+                ks = range(self._tick + 1, now_tick + 1)
+
+            for k in ks:
+                if not (b := buckets[k % n]):
+                    continue
+                for s, t in list(b.items()):
+                    if t._deadline_tick <= now_tick:  # noqa
+                        del b[s]
+                        due.append(t)
+
+            self._tick = now_tick
+
+            if not due:
+                return 0
+
+            self._len -= len(due)
+            due.sort(key=lambda t: (t._deadline_tick, t._seq), reverse=True)  # noqa
+            self._due = due
+
+        due = self._due
+        c = 0
+        while due:
+            t = due.pop()
+            if t._wheel is None:  # noqa
+                continue
+            t._wheel = None  # noqa
+            c += 1
+            t._fn()  # noqa
+
+        return c
+
+
+##
+
+
+class WheelIoPipelineScheduling(IoPipelineScheduling, IoPipelineService):
+    """
+    Schedules a pipeline's timers on a (possibly shared) `HashedTimingWheel`. When a timer fires its fn is handed to
+    `runner`, supplied by the pipeline's driver, which must run it within the pipeline - as by `pipeline.enter()` - and
+    then process whatever it produced.
+
+    Timers are cancelled along with the handler which scheduled them, and all of them when the pipeline is destroyed.
+    """
+
+    def __init__(
+            self,
+            wheel: HashedTimingWheel,
+            runner: ta.Callable[[ta.Callable[[], None]], None],
+    ) -> None:
+        super().__init__()
+
+        self._wheel = wheel
+        self._runner = runner
+
+        self._by_ref: ta.Dict[IoPipelineHandlerRef, ta.Dict[WheelIoPipelineScheduling._Handle, None]] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<len={len(self)}>'
+
+    @property
+    def wheel(self) -> HashedTimingWheel:
+        return self._wheel
+
+    def __len__(self) -> int:
+        return sum(len(hs) for hs in self._by_ref.values())
+
+    #
+
+    @ta.final
+    class _Handle(IoPipelineScheduling.Handle):
+        def __init__(
+                self,
+                svc: 'WheelIoPipelineScheduling',
+                handler_ref: IoPipelineHandlerRef,
+                fn: ta.Callable[[], None],
+        ) -> None:
+            self._svc = svc
+            self._handler_ref = handler_ref
+            self._fn = fn
+
+            self._timer: ta.Optional[HashedTimingWheel.Timer] = None
+
+        def cancel(self) -> None:
+            if (t := self._timer) is None:
+                return
+            self._timer = None
+            t.cancel()
+            self._svc._untrack(self)  # noqa
+
+        def _fire(self) -> None:
+            self._timer = None
+            self._svc._untrack(self)  # noqa
+            self._svc._runner(self._fn)  # noqa
+
+    def _untrack(self, h: _Handle) -> None:
+        if (hs := self._by_ref.get(h._handler_ref)) is None:  # noqa
+            return
+        hs.pop(h, None)
+        if not hs:
+            del self._by_ref[h._handler_ref]  # noqa
+
+    def schedule(
+            self,
+            handler_ref: IoPipelineHandlerRef,
+            delay_s: float,
+            fn: ta.Callable[[], None],
+    ) -> IoPipelineScheduling.Handle:
+        h = WheelIoPipelineScheduling._Handle(self, handler_ref, fn)
+        h._timer = self._wheel.schedule(delay_s, h._fire)  # noqa
+        self._by_ref.setdefault(handler_ref, {})[h] = None
+        return h
+
+    def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
+        if handler_ref is not None:
+            hs_lst = [hs] if (hs := self._by_ref.get(handler_ref)) is not None else []
+        else:
+            hs_lst = list(self._by_ref.values())
+
+        for hs in hs_lst:
+            for h in list(hs):
+                h.cancel()
+
+    #
+
+    def handler_update(self, handler_ref: IoPipelineHandlerRef, kind: IoPipelineHandlerUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all(handler_ref)
+
+    def pipeline_update(self, pipeline: IoPipeline, kind: IoPipelineUpdate) -> None:
+        if kind == 'removed':
+            self.cancel_all()
+
+
+########################################
+# ../../streambufs/direct.py
+
+
+##
+
+
+class BaseDirectByteStreamBufferLike(BaseByteStreamBufferLike, Abstract):
+    def __init__(self, data: BytesLike) -> None:
+        super().__init__()
+
+        self._data = data
+        if isinstance(data, memoryview):
+            self._mv_ = data
+        else:
+            self._b_ = data
+
+    _mv_: memoryview
+    _b_: ta.Union[bytes, bytearray]
+
+    def _mv(self) -> memoryview:
+        try:
+            return self._mv_
+        except AttributeError:
             pass
 
         self._mv_ = mv = memoryview(self._b_)
@@ -5896,6 +5989,20 @@ def empty_byte_stream_buffer_view() -> ByteStreamBufferView:
 # ../../streambufs/scanning.py
 
 
+_scanning: ta.Any
+try:
+    from . import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
+if _scanning is not None:
+    globals().update({a: getattr(_scanning, a) for a in [
+        'find_longest',
+        'scan_length_fields',
+    ]})
+
+
 ##
 
 
@@ -5920,7 +6027,7 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
         super().__init__()
 
         self._buf = buf
-        self._scan_from_by_sub: dict[bytes, int] = {}
+        self._scan_from_by_sub: ta.Dict[ta.Union[bytes, ta.Tuple[bytes, ...]], int] = {}
 
     @property
     def max_size(self) -> ta.Optional[int]:
@@ -5973,6 +6080,28 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
 
         return i
 
+    def find_longest(self, subs: ta.Sequence[bytes]) -> ta.Tuple[int, int]:
+        """
+        Returns the position of the earliest occurrence of any of `subs`, and the index of the first of `subs` which
+        occurs there - so ordering `subs` longest first picks the longest match - or (-1, -1). Searches all of the
+        buffer's segments in a single pass, natively when the `_scanning` extension is available, and caches negative
+        progress per `subs` just as `find` does per `sub`.
+        """
+
+        key = tuple(subs)
+        scan_from = self._scan_from_by_sub.get(key, 0)
+
+        # Allow overlap so a match spanning old/new boundary is discoverable.
+        eff_start = scan_from - (max(map(len, key), default=1) - 1)
+        if eff_start < 0:
+            eff_start = 0
+
+        ret = find_longest(self._buf.segments(), key, eff_start)
+        if ret[0] < 0:
+            self._scan_from_by_sub[key] = len(self._buf)
+
+        return ret
+
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         # rfind isn't the typical trickle hot-path; delegate.
         return self._buf.rfind(sub, start, end)
@@ -6885,70 +7014,402 @@ _check_std_logging_record_attrs()
 ##
 
 
-class LoggingContextLogRecord(logging.LogRecord):
-    # LogRecord.__init__ args:
-    #  - name: str
-    #  - level: int
-    #  - pathname: str - Confusingly referred to as `fn` before the LogRecord ctor. May be empty or "(unknown file)".
-    #  - lineno: int - May be 0.
-    #  - msg: str
-    #  - args: tuple | dict | 1-tuple[dict]
-    #  - exc_info: LoggingExcInfoTuple | None
-    #  - func: str | None = None -> funcName
-    #  - sinfo: str | None = None -> stack_info
-    #
+class LoggingContextLogRecord(logging.LogRecord):
+    # LogRecord.__init__ args:
+    #  - name: str
+    #  - level: int
+    #  - pathname: str - Confusingly referred to as `fn` before the LogRecord ctor. May be empty or "(unknown file)".
+    #  - lineno: int - May be 0.
+    #  - msg: str
+    #  - args: tuple | dict | 1-tuple[dict]
+    #  - exc_info: LoggingExcInfoTuple | None
+    #  - func: str | None = None -> funcName
+    #  - sinfo: str | None = None -> stack_info
+    #
+
+    def __init__(self, *, _logging_context: LoggingContext) -> None:  # noqa
+        self.__dict__.update(_logging_context=_logging_context)
+
+        for ad in _LOGGING_CONTEXT_INFO_RECORD_ADAPTERS_:
+            self.__dict__.update(ad.context_to_record(_logging_context))
+
+    _logging_context: LoggingContext
+
+    # FIXME: track extra
+    # def __setattr__(self, key, value):
+    #     super().__setattr__(key, value)
+
+
+##
+
+
+@ta.final
+class LogRecordLoggingContext(LoggingContext):
+    def __init__(self, rec: logging.LogRecord) -> None:
+        if isinstance(rec, LoggingContextLogRecord):
+            raise TypeError(rec)
+
+        self._rec = rec
+
+        infos: ta.List[LoggingContextInfo] = [
+            info
+            for ad in _LOGGING_CONTEXT_INFO_RECORD_ADAPTERS_
+            if (info := ad.record_to_info(rec)) is not None
+        ]
+
+        # FIXME:
+        # if extra is not None:
+        #     for key in extra:
+        #         if (key in ["message", "asctime"]) or (key in rv.__dict__):
+        #             raise KeyError("Attempt to overwrite %r in LogRecord" % key)
+        #         rv.__dict__[key] = extra[key]
+
+        if (extra := {
+            a: v
+            for a, v in rec.__dict__.items()
+            if a not in _KNOWN_STD_LOGGING_RECORD_ATTR_SET
+        }):
+            infos.append(LoggingContextInfos.Extra(extra))
+
+        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {
+            type(info): info
+            for info in infos
+        }
+
+    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
+        return self._infos.get(ty)
+
+
+########################################
+# ../../streambufs/framing.py
+
+
+##
+
+
+class LongestMatchDelimiterByteStreamFrameDecoder:
+    """
+    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
+
+    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
+    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
+
+    Key property:
+      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
+      it can prove the next byte is not '\\n' (or the stream is finalized).
+
+    Implementation note:
+      This codec searches for all delimiters at once over the buffer's `segments()`, with `scanning.find_longest` -
+      natively when the `_scanning` extension is available. Given a `ScanningByteStreamBuffer` it resumes each search
+      where the last unsuccessful one left off.
+
+    Pairs well with `ScanningByteStreamBuffer`.
+    """
+
+    def __init__(
+            self,
+            delims: ta.Sequence[bytes],
+            *,
+            keep_ends: bool = False,
+            max_size: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        dl = list(delims)
+        if not dl:
+            raise ValueError('no delimiters')
+        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
+            raise TypeError(delims)
+        if any(not d for d in dl):
+            raise ValueError('empty delimiter')
+
+        self._delims = tuple(bytes(d) for d in dl)
+        self._keep_ends = keep_ends
+        self._max_size = max_size
+
+        # Sort by length descending for "choose longest at same start".
+        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+
+        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
+        # with it.
+        pref: ta.Dict[bytes, ta.List[bytes]] = {}
+        for d in self._delims:
+            for e in self._delims:
+                if d is e:
+                    continue
+                if len(e) > len(d) and e.startswith(d):
+                    pref.setdefault(d, []).append(e)
+        for k, vs in list(pref.items()):
+            pref[k] = sorted(vs, key=len, reverse=True)
+        self._prefix_longer = pref
+
+        self._max_delim_len = max(len(d) for d in self._delims)
+
+        # A lone delimiter is simply searched for with the buffer's own `find`.
+        self._single_delim: ta.Optional[bytes] = self._delims[0] if len(set(self._delims)) == 1 else None
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[True],
+    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
+        ...
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[False] = False,
+    ) -> ta.List[ByteStreamBufferView]:
+        ...
+
+    def decode(
+            self,
+            buf,
+            *,
+            final=False,
+            include_delims=False,
+    ):
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
+
+        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
+        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
+        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+
+        Raises:
+          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
+          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+
+        Note on `max_size`:
+          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
+          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
+          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
+          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
+          remaining bytes buffered.
+        """
+
+        out: ta.List[ta.Any] = []
+
+        while True:
+            hit = self._find_next_delim(buf)
+            if hit is None:
+                if self._max_size is not None and len(buf) > self._max_size and not out:
+                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
+                return out
+
+            pos, delim = hit
+
+            if self._max_size is not None and pos > self._max_size:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+
+            if not final and self._should_defer(buf, pos, delim):
+                return out
+
+            if self._keep_ends:
+                frame = buf.split_to(pos + len(delim))
+            else:
+                frame = buf.split_to(pos)
+                buf.advance(len(delim))
+
+            if include_delims:
+                out.append((frame, delim))
+            else:
+                out.append(frame)
+
+    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
+        """
+        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
+        choose the longest matching delimiter.
+        """
+
+        if not len(buf):
+            return None
+
+        if self._single_delim is not None:
+            if (pos := buf.find(self._single_delim)) < 0:
+                return None
+            return pos, self._single_delim
+
+        if isinstance(buf, ScanningByteStreamBuffer):
+            pos, i = buf.find_longest(self._delims_by_len)
+        else:
+            pos, i = find_longest(buf.segments(), self._delims_by_len)
+
+        if pos < 0:
+            return None
+
+        return pos, self._delims_by_len[i]
+
+    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
+        """
+        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
+        have enough bytes to decide.
+
+        We only defer when:
+          - the current match ends at the end of the currently buffered bytes, and
+          - there exists some longer delimiter that has `matched` as a prefix, and
+          - the buffered bytes from pos match the available prefix of that longer delimiter.
+        """
+
+        ln = len(buf)
+        endpos = pos + len(matched)
+        if endpos != ln:
+            return False
+
+        longer = self._prefix_longer.get(matched)
+        if not longer:
+            return False
+
+        avail = ln - pos
+        for d2 in longer:
+            if avail >= len(d2):
+                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
+                continue
+            # Check whether buffered bytes match the prefix of d2 that we have available.
+            # Use stream-correct find on the prefix.
+            prefix = d2[:avail]
+            if buf.find(prefix, pos, pos + avail) == pos:
+                return True
+
+        return False
+
+
+##
+
+
+class LengthFieldByteStreamFrameDecoder:
+    """
+    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
+
+    This is modeled after the common Netty pattern:
+      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
+    where:
+      length_field_end_offset = length_field_offset + length_field_length
+
+    Parameters:
+      - length_field_offset: byte offset of the length field from the start of the frame
+      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
+      - byteorder: 'big' or 'little'
+      - length_adjustment: adjustment added to computed frame length (may be negative)
+      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
+        length field and/or header from the delivered payload)
+      - max_frame_length: maximum allowed total frame length (before stripping)
+
+    Notes:
+      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
+      - Every complete frame laid out in the buffer's first contiguous segment is found in a single pass with
+        `scanning.scan_length_fields` - natively when the `_scanning` extension is available. It only relies on
+        `buf.coalesce(n)` for headers which span segments.
+      - It does not require async/await and is suitable for pipeline-style codecs.
+    """
+
+    def __init__(
+            self,
+            *,
+            length_field_offset: int = 0,
+            length_field_length: int = 4,
+            byteorder: ta.Literal['little', 'big'] = 'big',
+            length_adjustment: int = 0,
+            initial_bytes_to_strip: int = 0,
+            max_frame_length: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        if length_field_offset < 0:
+            raise ValueError(length_field_offset)
+        if length_field_length not in (1, 2, 4, 8):
+            raise ValueError(length_field_length)
+        if byteorder not in ('big', 'little'):
+            raise ValueError(byteorder)
+        if initial_bytes_to_strip < 0:
+            raise ValueError(initial_bytes_to_strip)
+        if max_frame_length is not None and max_frame_length < 0:
+            raise ValueError(max_frame_length)
+
+        self._off = int(length_field_offset)
+        self._llen = int(length_field_length)
+        self._byteorder = byteorder
+        self._adj = int(length_adjustment)
+        self._strip = int(initial_bytes_to_strip)
+        self._max = None if max_frame_length is None else int(max_frame_length)
+
+        self._end_off = self._off + self._llen
 
-    def __init__(self, *, _logging_context: LoggingContext) -> None:  # noqa
-        self.__dict__.update(_logging_context=_logging_context)
+    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
 
-        for ad in _LOGGING_CONTEXT_INFO_RECORD_ADAPTERS_:
-            self.__dict__.update(ad.context_to_record(_logging_context))
+        Returns:
+          - list of BytesView-like objects (from `split_to`) representing each decoded frame
 
-    _logging_context: LoggingContext
+        Raises:
+          - FrameTooLarge if a frame exceeds max_frame_length
+          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
+            progress (defensive; rarely hit if upstream caps buffer growth)
+        """
 
-    # FIXME: track extra
-    # def __setattr__(self, key, value):
-    #     super().__setattr__(key, value)
+        out: ta.List[ta.Any] = []
 
+        while True:
+            # Need at least enough bytes to read the length field.
+            if len(buf) < self._end_off:
+                return out
 
-##
+            # Read header up through the length field contiguously.
+            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
+            mv = buf.peek()
+            if len(mv) < self._end_off:
+                mv = buf.coalesce(self._end_off)
 
+            length_val = int.from_bytes(mv[self._off:self._end_off], self._byteorder, signed=False)
 
-@ta.final
-class LogRecordLoggingContext(LoggingContext):
-    def __init__(self, rec: logging.LogRecord) -> None:
-        if isinstance(rec, LoggingContextLogRecord):
-            raise TypeError(rec)
+            total_len = length_val + self._adj + self._end_off
+            if total_len < 0:
+                raise ValueError('negative frame length')
 
-        self._rec = rec
+            if self._max is not None and total_len > self._max:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
 
-        infos: ta.List[LoggingContextInfo] = [
-            info
-            for ad in _LOGGING_CONTEXT_INFO_RECORD_ADAPTERS_
-            if (info := ad.record_to_info(rec)) is not None
-        ]
+            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
+            # control.
+            if len(buf) < total_len:
+                if self._max is not None and len(buf) > self._max:
+                    raise BufferTooLargeByteStreamBufferError(
+                        'buffer exceeded max_frame_length without completing a frame',
+                    )
+                return out
 
-        # FIXME:
-        # if extra is not None:
-        #     for key in extra:
-        #         if (key in ["message", "asctime"]) or (key in rv.__dict__):
-        #             raise KeyError("Attempt to overwrite %r in LogRecord" % key)
-        #         rv.__dict__[key] = extra[key]
+            # If the segment holds more than this frame, pick up every complete frame laid out in it in one pass.
+            if len(mv) - total_len >= self._end_off:
+                lens = scan_length_fields(
+                    mv,
+                    self._off,
+                    self._llen,
+                    self._byteorder,
+                    self._adj,
+                    self._max,
+                ) or [total_len]
+            else:
+                lens = [total_len]
+            del mv
 
-        if (extra := {
-            a: v
-            for a, v in rec.__dict__.items()
-            if a not in _KNOWN_STD_LOGGING_RECORD_ATTR_SET
-        }):
-            infos.append(LoggingContextInfos.Extra(extra))
+            # We have complete frames available.
+            for total_len in lens:
+                if self._strip:
+                    if self._strip > total_len:
+                        raise ValueError('initial_bytes_to_strip > frame length')
+                    buf.advance(self._strip)
+                    total_len -= self._strip
 
-        self._infos: ta.Dict[ta.Type[LoggingContextInfo], LoggingContextInfo] = {
-            type(info): info
-            for info in infos
-        }
+                out.append(buf.split_to(total_len))
 
-    def get_info(self, ty: ta.Type[LoggingContextInfoT]) -> ta.Optional[LoggingContextInfoT]:
-        return self._infos.get(ty)
+            # Loop for additional frames
 
 
 ########################################
@@ -7011,9 +7472,13 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     """
     A segmented, consumption-oriented bytes buffer.
 
-    Internally stores a list of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
+    Internally stores a deque of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
     segments without copying.
 
+    Alongside the segments it keeps a parallel deque of their cumulative end offsets, in an 'absolute' coordinate space
+    which only ever shifts by whole prepends - so consuming from the head is a `popleft` of each, and locating the
+    segment holding any position is a bisect rather than a walk.
+
     Optional "chunked writes":
       - If chunk_size > 0, small writes are accumulated into a lazily-allocated active bytearray "chunk" up to
         chunk_size.
@@ -7045,7 +7510,11 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     ) -> None:
         super().__init__()
 
-        self._segs: ta.List[Bytes] = []
+        self._segs: collections.deque[Bytes] = collections.deque()
+
+        # Absolute offset of the end of each segment's readable bytes. The active chunk, always last when present, ends
+        # at its used bytes.
+        self._ends: collections.deque[int] = collections.deque()
 
         self._max_size = None if max_size is None else int(max_size)
 
@@ -7064,6 +7533,9 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def max_size(self) -> ta.Optional[int]:
         return self._max_size
 
+    # Absolute offset of the first segment's first byte - or, with no segments, of the next byte to be written.
+    _base = 0
+
     _head_off = 0
     _len = 0
 
@@ -7076,34 +7548,61 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def __len__(self) -> int:
         return self._len
 
-    def _active_readable_len(self) -> int:
-        if self._active is None:
-            return 0
-        if self._reserved_in_active and self._reserved is not None:
-            tail = self._reserved_len
-        else:
-            tail = 0
-        rl = self._active_used - tail
-        return rl if rl > 0 else 0
+    def _append_seg(self, s: Bytes, n: int) -> None:
+        self._ends.append((self._ends[-1] if self._ends else self._base) + n)
+        self._segs.append(s)
+
+    def _popleft_seg(self) -> Bytes:
+        s = self._segs.popleft()
+        self._base = self._ends.popleft()
+        self._head_off = 0
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
+        return s
+
+    def _seg_start(self, i: int) -> int:
+        """Absolute offset of segment `i`'s first byte, whether or not it is still readable."""
+
+        return self._ends[i - 1] if i else self._base
+
+    def _seg_index(self, a: int) -> int:
+        """Index of the segment holding absolute offset `a`, which must be readable."""
+
+        return bisect.bisect_right(self._ends, a)
+
+    def _gather(self, i: int, a: int, n: int, stop: int) -> Bytes:
+        """Copies up to `n` bytes from absolute offset `a` - in segment `i` - onward, stopping before `stop`."""
+
+        if (e := a + n) > stop:
+            e = stop
+        if a >= e:
+            return b''
+
+        segs = self._segs
+        ends = self._ends
+        s0 = self._seg_start(i)
+        if e <= ends[i]:
+            return segs[i][a - s0:e - s0]
+
+        parts: ta.List[Bytes] = []
+        while a < e:
+            se = ends[i]
+            parts.append(segs[i][a - s0:(se if se < e else e) - s0])
+            a = s0 = se
+            i += 1
+        return b''.join(parts)
+
+    #
 
     def peek(self) -> memoryview:
         if not self._segs:
             return memoryview(b'')
 
-        s0 = self._segs[0]
-        mv = memoryview(s0)
-        if self._head_off:
-            mv = mv[self._head_off:]
-
-        if s0 is self._active:
-            # Active is only meaningful by _active_used, not len(bytearray).
-            rl = self._active_readable_len()
-            if self._head_off >= rl:
-                return memoryview(b'')
-            mv = memoryview(self._active)[self._head_off:rl]
-            return mv
-
-        return mv
+        off = self._head_off
+        if off >= (e := self._ends[0] - self._base):
+            return memoryview(b'')
+        return memoryview(self._segs[0])[off:e]
 
     def segments(self) -> ta.Sequence[memoryview]:
         if not self._segs:
@@ -7111,28 +7610,14 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         out: ta.List[memoryview] = []
 
-        last_i = len(self._segs) - 1
-        for i, s in enumerate(self._segs):
-            if s is self._active and i == last_i:
-                # Active chunk: create fresh view with readable length.
-                rl = self._active_readable_len()
-                if not i:
-                    # Active is also first segment; apply head_off.
-                    if self._head_off >= rl:
-                        continue
-                    mv = memoryview(self._active)[self._head_off:rl]
-                else:
-                    if rl <= 0:
-                        continue
-                    mv = memoryview(self._active)[:rl]
-            else:
-                # Non-active segment.
-                mv = memoryview(s)
-                if not i and self._head_off:
-                    mv = mv[self._head_off:]
-
-            if len(mv):
-                out.append(mv)
+        s0 = self._base
+        off = self._head_off
+        for s, e in zip(self._segs, self._ends):
+            rl = e - s0
+            if off < rl:
+                out.append(memoryview(s)[off:rl] if off or rl != len(s) else memoryview(s))
+            s0 = e
+            off = 0
 
         return out
 
@@ -7145,7 +7630,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         a = self._active
         if a is None:
             a = bytearray(self._chunk_size)  # fixed capacity
-            self._segs.append(a)
+            self._append_seg(a, 0)
             self._active = a
             self._active_used = 0
 
@@ -7158,9 +7643,15 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._reserved_in_active:
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
-        if (used := self._active_used) <= 0:
+        if (used := self._active_used) <= 0 or (len(self._segs) == 1 and self._segs[0] is a and self._head_off >= used):
+            # Nothing readable is left in it - including when everything written to it has since been consumed, in
+            # which case it is simply dropped rather than compacted.
             if self._segs and self._segs[-1] is a:
                 self._segs.pop()
+                e = self._ends.pop()
+                if not self._segs:
+                    self._base = e
+                    self._head_off = 0
             self._active = None
             self._active_used = 0
             return
@@ -7187,19 +7678,19 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def write(self, data: BytesLike, /) -> None:
         if not data:
             return
-        if isinstance(data, memoryview):
-            data = memoryview_to_bytes(data)  # noqa
-        # elif isinstance(data, bytearray):
-        #     pass
-        # else:
-        #     pass
 
+        # Memoryviews are only materialized when kept as their own segment - those small enough to be copied into the
+        # active chunk are copied straight from the view.
         dl = len(data)
 
         if self._max_size is not None and self._len + dl > self._max_size:
             raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size')
 
         if self._chunk_size <= 0:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
+            ends = self._ends
+            ends.append((ends[-1] if ends else self._base) + dl)
             self._segs.append(data)
             self._len += dl
             return
@@ -7208,8 +7699,10 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
         if dl >= self._chunk_size:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
             self._flush_active()
-            self._segs.append(data)
+            self._append_seg(data, dl)
             self._len += dl
             return
 
@@ -7221,6 +7714,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         # Copy into fixed-capacity buffer; do not resize.
         memoryview(a)[self._active_used:self._active_used + dl] = data
         self._active_used += dl
+        self._ends[-1] += dl
         self._len += dl
 
     def prepend(self, data: BytesLike, /) -> None:
@@ -7237,20 +7731,25 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._head_off:
             s0 = self._segs[0]
             if s0 is self._active:
+                # The active chunk is always last, so here it is also the only segment.
                 if self._reserved_in_active:
                     raise OutstandingReserveByteStreamBufferError('outstanding reserve')
-                rl = self._active_readable_len()
-                if self._head_off < rl:
-                    self._segs[0] = memoryview_to_bytes(memoryview(self._active)[self._head_off:rl])
+                if self._head_off < self._active_used:
+                    self._segs[0] = memoryview_to_bytes(memoryview(s0)[self._head_off:self._active_used])
+                    self._base += self._head_off
+                    self._head_off = 0
                 else:
-                    self._segs.pop(0)
+                    self._popleft_seg()
                 self._active = None
                 self._active_used = 0
             else:
                 self._segs[0] = s0[self._head_off:]
-            self._head_off = 0
+                self._base += self._head_off
+                self._head_off = 0
 
-        self._segs.insert(0, data)
+        self._segs.appendleft(data)
+        self._ends.appendleft(self._base)
+        self._base -= dl
         self._len += dl
 
     def reserve(self, n: int, /) -> memoryview:
@@ -7304,6 +7803,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
             if n:
                 self._active_used += n
+                self._ends[-1] += n
                 self._len += n
 
             # Keep active for reuse.
@@ -7322,15 +7822,32 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             return
 
         if n == len(b):
-            self._segs.append(b)
+            self._append_seg(b, n)
             self._len += n
         else:
             bb = memoryview_to_bytes(memoryview(b)[:n])
-            self._segs.append(bb)
+            self._append_seg(bb, n)
             self._len += n
 
     #
 
+    def _keep_consumed_active(self) -> bool:
+        """
+        Called when the first segment has just been fully consumed. If it is the active chunk and has spare capacity it
+        is kept, with the head offset past its used bytes, so further writes and reserves keep filling it rather than
+        allocating a new chunk. Consumed bytes are never overwritten, so views of them previously handed out stay valid.
+        It is always kept while a reservation is outstanding in it.
+        """
+
+        if self._segs[0] is not self._active or (
+                not self._reserved_in_active and
+                self._active_used >= self._chunk_size
+        ):
+            return False
+
+        self._head_off = self._active_used
+        return True
+
     def advance(self, n: int, /) -> None:
         if n < 0 or n > self._len:
             raise ValueError(n)
@@ -7339,35 +7856,20 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         self._len -= n
 
-        while n and self._segs:
-            s0 = self._segs[0]
-
-            if s0 is self._active:
-                avail0 = self._active_readable_len() - self._head_off
-            else:
-                avail0 = len(s0) - self._head_off
-
-            if avail0 <= 0:
-                popped = self._segs.pop(0)
-                if popped is self._active:
-                    self._active = None
-                    self._active_used = 0
-                self._head_off = 0
-                continue
-
-            if n < avail0:
-                self._head_off += n
-                return
-
-            n -= avail0
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        # Pop every segment ending at or before the new head, then land the head offset in the one after.
+        a = self._base + self._head_off + n
+        segs = self._segs
+        ends = self._ends
+        while ends and ends[0] <= a:
+            if segs[0] is self._active:
+                if self._keep_consumed_active():
+                    return
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            self._base = ends.popleft()
 
-        if n:
-            raise RuntimeError(n)
+        self._head_off = a - self._base
 
     def split_to(self, n: int, /) -> ByteStreamBufferView:
         if n < 0 or n > self._len:
@@ -7375,40 +7877,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if not n:
             return _EMPTY_DIRECT_BYTE_STREAM_BUFFER_VIEW
 
-        out: ta.List[memoryview] = []
-        rem = n
+        self._len -= n
 
-        while rem:
-            if not self._segs:
-                raise RuntimeError(rem)
+        b0 = self._base
+        a = b0 + self._head_off
+        e = a + n
+        segs = self._segs
+        ends = self._ends
 
-            s0 = self._segs[0]
+        # Fast path: entirely within a first segment which is not exhausted.
+        if e < ends[0]:
+            self._head_off += n
+            return DirectByteStreamBufferView(memoryview(segs[0])[a - b0:e - b0])
 
-            if s0 is self._active:
-                rl = self._active_readable_len()
-                if self._head_off >= rl:
-                    raise RuntimeError(rem)
-                mv0 = memoryview(s0)[self._head_off:rl]
-            else:
-                mv0 = memoryview(s0)
-                if self._head_off:
-                    mv0 = mv0[self._head_off:]
-
-            if rem < len(mv0):
-                out.append(mv0[:rem])
-                self._head_off += rem
-                self._len -= n
-                return byte_stream_buffer_view_from_segments(out)
-
-            out.append(mv0)
-            rem -= len(mv0)
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        out: ta.List[memoryview] = []
+        active = self._active
+        while ends and (se := ends[0]) <= e:
+            s = segs[0]
+            if a < se:
+                out.append(memoryview(s)[a - b0:se - b0])
+            a = se
+            if s is active:
+                self._base = b0
+                if self._keep_consumed_active():
+                    return byte_stream_buffer_view_from_segments(out)
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            b0 = ends.popleft()
+
+        self._base = b0
+        if a < e:
+            out.append(memoryview(segs[0])[:e - b0])
+        self._head_off = e - b0
 
-        self._len -= n
         return byte_stream_buffer_view_from_segments(out)
 
     def coalesce(self, n: int, /) -> memoryview:
@@ -7426,114 +7928,41 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if len(mv0) >= n:
             return mv0[:n]
 
-        out = bytearray(n)
-        w = 0
-
-        new_segs: ta.List[Bytes] = []
-
-        seg_i = 0
-        while w < n and seg_i < len(self._segs):
-            s = self._segs[seg_i]
-            off = self._head_off if not seg_i else 0
-
-            seg_len = len(s) - off
-            if s is self._active and seg_i == (len(self._segs) - 1):
-                seg_len = self._active_readable_len() - off
-
-            if seg_len <= 0:
-                seg_i += 1
-                continue
-
-            take = n - w
-            if take > seg_len:
-                take = seg_len
-
-            out[w:w + take] = memoryview(s)[off:off + take]
-            w += take
-
-            if take < seg_len:
-                rem = s[off + take:off + seg_len]
-                if rem:
-                    new_segs.append(rem)
-                seg_i += 1
-                break
-
-            seg_i += 1
-
-        if seg_i < len(self._segs):
-            new_segs.extend(self._segs[seg_i:])
+        # Copy the first n readable bytes into a single new segment replacing those they span, keeping what remains of
+        # the last of them as its own segment. The active chunk is always last, so only that one can be it.
+        segs = self._segs
+        ends = self._ends
+        b0 = self._base
+        a0 = a = b0 + self._head_off
+        e = a + n
+
+        parts: ta.List[Bytes] = []
+        while (se := ends[0]) < e:
+            parts.append(segs.popleft()[a - b0:se - b0])
+            ends.popleft()
+            a = b0 = se
+
+        s = segs[0]
+        parts.append(s[a - b0:e - b0])
+        out = b''.join(parts)
+
+        if e < se:
+            segs[0] = memoryview_to_bytes(memoryview(s)[e - b0:se - b0]) if s is self._active else s[e - b0:se - b0]
+        else:
+            segs.popleft()
+            ends.popleft()
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
 
-        self._segs = [bytes(out), *new_segs]
+        segs.appendleft(out)
+        ends.appendleft(e)
+        self._base = a0
         self._head_off = 0
 
-        self._active = None
-        self._active_used = 0
-
-        return memoryview(self._segs[0])[:n]
-
-    def _seg_readable_slice(
-            self,
-            si: int,
-            s: Bytes,
-            last_i: int,
-    ) -> ta.Tuple[int, int]:
-        """
-        Compute the readable offset and length for segment at index si.
-
-        Returns (offset, readable_len) where:
-          - offset: byte offset into segment (head_off for si==0, else 0)
-          - readable_len: number of readable bytes from offset (0 if segment empty/consumed)
-
-        Handles head offset for first segment and active chunk readable length for last segment.
-        """
-
-        off = self._head_off if not si else 0
-        seg_len = len(s) - off
-        if s is self._active and si == last_i:
-            seg_len = self._active_readable_len() - off
-        return off, max(0, seg_len)
+        return memoryview(out)
 
-    def _seg_search_range(
-            self,
-            start: int,
-            limit: int,
-            m: int,
-            seg_gs: int,
-            seg_ge: int,
-            seg_len: int,
-    ) -> ta.Optional[ta.Tuple[int, int]]:
-        """
-        Compute local search range within a segment.
-
-        Args:
-            start: global start position (user-provided)
-            limit: global limit (end - m, last valid position where match can start)
-            m: pattern length
-            seg_gs: segment global start position
-            seg_ge: segment global end position
-            seg_len: segment readable length
-
-        Returns (local_start, local_end) if segment overlaps search range, else None.
-          - local_start: offset within segment to start searching
-          - local_end: offset within segment to end searching (exclusive)
-        """
-
-        # Check if segment overlaps search range
-        if limit < seg_gs or start >= seg_ge:
-            return None
-
-        # Compute local start within segment
-        ls = max(0, start - seg_gs)
-
-        # Compute local end: can start match anywhere up to limit, need m bytes
-        max_start_in_seg = limit - seg_gs
-        end_search = min(max_start_in_seg + m, seg_len)
-
-        # Validate range
-        if ls >= end_search:
-            return None
-
-        return ls, end_search
+    #
 
     def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -7544,57 +7973,42 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        tail: Bytes = b''
-        tail_gstart = 0
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        gpos = 0
+        # Everything below is in absolute offsets: o is that of position 0, and a match must lie within [a, e).
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-        last_i = len(self._segs) - 1
+        i = self._seg_index(a)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
 
-        for si, s in enumerate(self._segs):
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
+            # Matches lying wholly within this segment.
+            hi = se if se < e else e
+            if hi - a >= m and (j := s.find(sub, a - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            seg_gs = gpos
-            seg_ge = gpos + seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.find(sub, off + ls, off + end_search)
-                if idx != -1:
-                    return seg_gs + (idx - off)
-
-            if m > 1 and tail:
-                head_need = m - 1
-                # Only read as many bytes as are actually available in this segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, seg_len)
-                if head_avail > 0:
-                    head = s[off:off + head_avail]
-                    comb = tail + head
-                    j = comb.find(sub)
-                    if j != -1 and j < len(tail) < j + m:
-                        cand = tail_gstart + j
-                        if start <= cand <= limit:
-                            return cand
+            if se >= e:
+                return -1
 
+            # Matches starting within this segment's last m - 1 bytes and running on into the following ones - only
+            # those bytes and the next m - 1 need be searched, and only if the former hold the first byte of sub.
             if m > 1:
-                take = m - 1
-                if seg_len >= take:
-                    tail = s[off + seg_len - take:off + seg_len]
-                    tail_gstart = seg_ge - take
-                else:
-                    tail = (tail + s[off:off + seg_len])[-(m - 1):]
-                    tail_gstart = seg_ge - len(tail)
-
-            gpos = seg_ge
+                t = se - m + 1
+                if t < a:
+                    t = a
+                if s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.find(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-        return -1
+            a = s0 = se
+            i += 1
 
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -7605,89 +8019,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        if not self._segs:
-            return -1
-
-        best = -1
-
-        seg_ge = self._len
-        prev_s: ta.Optional[Bytes] = None
-        prev_off = 0
-        prev_seg_len = 0
-
-        last_i = len(self._segs) - 1
-
-        for si in range(len(self._segs) - 1, -1, -1):
-            s = self._segs[si]
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = seg_ge - seg_len
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.rfind(sub, off + ls, off + end_search)
-                if idx != -1:
-                    cand = seg_gs + (idx - off)
-                    if cand > best:
-                        best = cand
-
-            if m > 1 and prev_s is not None:
-                tail_need = m - 1
-                if seg_len >= tail_need:
-                    tail = s[off + seg_len - tail_need:off + seg_len]
-                    tail_gstart = seg_ge - tail_need
-
-                else:
-                    tail_parts = [s[off:off + seg_len]]
-                    tail_len = seg_len
-                    for sj in range(si - 1, -1, -1):
-                        if tail_len >= tail_need:
-                            break
-
-                        sj_s = self._segs[sj]
-                        sj_off, sj_len = self._seg_readable_slice(sj, sj_s, last_i)
-                        if sj_len <= 0:
-                            continue
-
-                        take = min(tail_need - tail_len, sj_len)
-                        tail_parts.insert(0, sj_s[sj_off + sj_len - take:sj_off + sj_len])
-                        tail_len += take
-
-                    tail_combined = b''.join(tail_parts)
-                    tail = tail_combined[-(m - 1):] if len(tail_combined) >= m - 1 else tail_combined
-                    tail_gstart = seg_ge - len(tail)
-
-                head_need = m - 1
-                # Only read as many bytes as are actually available in prev segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, prev_seg_len)
-                if head_avail > 0:
-                    head = prev_s[prev_off:prev_off + head_avail]
-                else:
-                    head = b''
+        i = self._seg_index(e - 1)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
+            lo = a if a > s0 else s0
 
-                comb = tail + head
-                j = comb.rfind(sub)
-                if j != -1 and j < len(tail) < j + m:
-                    cand = tail_gstart + j
-                    if start <= cand <= limit and cand > best:
-                        best = cand
+            # Matches running on past this segment start later than any lying wholly within it, so are searched first.
+            if m > 1 and se < e:
+                t = se - m + 1
+                if t < lo:
+                    t = lo
+                if t < se and s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.rfind(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-            if best >= seg_gs:
-                return best
+            hi = se if se < e else e
+            if hi - lo >= m and (j := s.rfind(sub, lo - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            prev_s = s
-            prev_off = off
-            prev_seg_len = seg_len
-            seg_ge = seg_gs
+            if s0 <= a or not i:
+                return -1
 
-        return best
+            i -= 1
+            s0 = self._seg_start(i)
 
 
 ##
@@ -8209,6 +8574,63 @@ log, alog = get_module_loggers(globals())  # noqa
 ##
 
 
+class _AsyncioLoopTimingWheel:
+    """
+    The `HashedTimingWheel` shared by all the drivers running on an event loop, driven by a single loop timer armed for
+    its next tick. Holds no reference to its loop, so as not to keep it alive as a weak key.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._wheel = HashedTimingWheel()
+
+        self._timer: ta.Optional[asyncio.TimerHandle] = None
+        self._timer_deadline = 0.
+
+    @property
+    def wheel(self) -> HashedTimingWheel:
+        return self._wheel
+
+    def rearm(self) -> None:
+        if (dl := self._wheel.next_delay()) is None:
+            return
+
+        deadline = self._wheel.clock() + dl
+        if (t := self._timer) is not None:
+            if self._timer_deadline <= deadline:
+                return
+            t.cancel()
+
+        self._timer = asyncio.get_running_loop().call_later(dl, self._fire)
+        self._timer_deadline = deadline
+
+    def _fire(self) -> None:
+        self._timer = None
+        try:
+            self._wheel.advance()
+        finally:
+            self.rearm()
+
+
+_ASYNCIO_LOOP_TIMING_WHEELS: ta.MutableMapping[asyncio.AbstractEventLoop, _AsyncioLoopTimingWheel] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_asyncio_loop_timing_wheel() -> _AsyncioLoopTimingWheel:
+    loop = asyncio.get_running_loop()
+    try:
+        return _ASYNCIO_LOOP_TIMING_WHEELS[loop]
+    except KeyError:
+        pass
+    ret = _ASYNCIO_LOOP_TIMING_WHEELS[loop] = _AsyncioLoopTimingWheel()
+    return ret
+
+
+##
+
+
 class PollAsyncioStreamIoPipelineDriver:
     """
     An asyncio pipeline driver with a poll-based interface mirroring the sync driver's API. Unlike
@@ -8285,7 +8707,8 @@ class PollAsyncioStreamIoPipelineDriver:
 
     _has_init = False
 
-    _sched: 'PollAsyncioStreamIoPipelineDriver._SchedulingService'
+    _loop_wheel: _AsyncioLoopTimingWheel
+    _sched: WheelIoPipelineScheduling
 
     _pipeline: IoPipeline
 
@@ -8301,7 +8724,8 @@ class PollAsyncioStreamIoPipelineDriver:
 
         self._pending_awaits = set()
 
-        self._sched = self._SchedulingService(self)
+        self._loop_wheel = _get_asyncio_loop_timing_wheel()
+        self._sched = WheelIoPipelineScheduling(self._loop_wheel.wheel, self._run_scheduled)
 
         services = IoPipelineServices.of(self._spec.services)
         self._flow = services.find(IoPipelineFlow)
@@ -8516,52 +8940,17 @@ class PollAsyncioStreamIoPipelineDriver:
     ##
     # scheduling
 
-    class _SchedulingService(IoPipelineScheduling, IoPipelineService):
-        def __init__(self, d: 'PollAsyncioStreamIoPipelineDriver') -> None:
-            super().__init__()
-
-            self._d = d
-
-            self._pending: ta.List[ta.Tuple[float, ta.Callable[[], None]]] = []
-            self._tasks: ta.Set[asyncio.Task] = set()
-
-        class _Handle(IoPipelineScheduling.Handle):
-            def cancel(self) -> None:
-                raise NotImplementedError
-
-        def schedule(
-                self,
-                handler_ref: IoPipelineHandlerRef,
-                delay_s: float,
-                fn: ta.Callable[[], None],
-        ) -> IoPipelineScheduling.Handle:
-            self._pending.append((delay_s, fn))
-            return self._Handle()
-
-        def cancel_all(self, handler_ref: ta.Optional[IoPipelineHandlerRef] = None) -> None:
-            raise NotImplementedError
-
-        async def _task_body(self, delay: float, fn: ta.Callable[[], None]) -> None:
-            await asyncio.sleep(delay)
-
-            self._d._command_queue.put_nowait(PollAsyncioStreamIoPipelineDriver._ScheduledCommand(fn))  # noqa
-
-        async def _flush_pending(self) -> None:
-            if not (lst := self._pending):
-                return
-
-            for delay, fn in lst:
-                task = asyncio.create_task(functools.partial(self._task_body, delay, fn)())
-                self._tasks.add(task)
-                task.add_done_callback(self._tasks.discard)
-
-            self._pending = []
+    def _run_scheduled(self, fn: ta.Callable[[], None]) -> None:
+        self._command_queue.put_nowait(PollAsyncioStreamIoPipelineDriver._ScheduledCommand(fn))
 
     @dc.dataclass(frozen=True)
     class _ScheduledCommand(_Command):
         fn: ta.Callable[[], None]
 
     async def _handle_command_scheduled(self, cmd: _ScheduledCommand) -> None:
+        if not self._pipeline.is_ready:
+            return
+
         with self._pipeline.enter():
             cmd.fn()
 
@@ -8688,9 +9077,11 @@ class PollAsyncioStreamIoPipelineDriver:
         return None
 
     async def _handle_output_bytes(self, msg: ta.Any) -> None:
-        for mv in ByteStreamBuffers.iter_segments(msg):
-            if self._writer is not None and mv:
-                self._writer.write(mv)
+        if self._writer is None:
+            return
+        # Handed over together so the transport can gather them into a single send where it supports it.
+        if mvs := [mv for mv in ByteStreamBuffers.iter_segments(msg) if mv]:
+            self._writer.writelines(mvs)
 
     async def _handle_output_flush_output(self, msg: IoPipelineFlowMessages.FlushOutput) -> ta.Optional[str]:
         if self._writer is not None:
@@ -8739,7 +9130,7 @@ class PollAsyncioStreamIoPipelineDriver:
         if self._read_task is not None and not self._read_task.done():
             return True
 
-        if hasattr(self, '_sched') and self._sched._tasks:  # noqa
+        if hasattr(self, '_sched') and len(self._sched):
             return True
 
         return False
@@ -8781,6 +9172,8 @@ class PollAsyncioStreamIoPipelineDriver:
                 if raise_on_stall and not self._has_pending_work():
                     raise RuntimeError('Pipeline stalled') from None
 
+                self._loop_wheel.rearm()
+
                 cmd = await self._command_queue.get()
 
             if isinstance(cmd, PollAsyncioStreamIoPipelineDriver._ShutdownCommand):
@@ -8788,8 +9181,6 @@ class PollAsyncioStreamIoPipelineDriver:
 
             await self._handle_command(cmd)
 
-            await self._sched._flush_pending()  # noqa
-
         pipeline.destroy()
         return None
 
@@ -8821,11 +9212,7 @@ class PollAsyncioStreamIoPipelineDriver:
         await self._close_writer()
 
         if hasattr(self, '_sched'):
-            for t in list(self._sched._tasks):  # noqa
-                if not t.done():
-                    t.cancel()
-            if self._sched._tasks:  # noqa
-                await asyncio.gather(*self._sched._tasks, return_exceptions=True)  # noqa
+            self._sched.cancel_all()
 
         if self._has_init:
             try:
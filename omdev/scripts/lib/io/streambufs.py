@@ -7,7 +7,10 @@
 # @om-git-diff-omit
 # ruff: noqa: UP006 UP007 UP036 UP037 UP045
 import abc
+import bisect
+import collections
 import io
+import re
 import sys
 import typing as ta
 
@@ -22,20 +25,21 @@ if sys.version_info < (3, 8):
 def __om_amalg__():  # noqa
     return dict(
         src_files=[
+            dict(path='_scanning_py.py', sha1='50bc68f17ad51947ad68b986d449307ab05b8509'),
             dict(path='errors.py', sha1='6b04cc2e4ba5461692128938a2bd5c261486746b'),
             dict(path='../../lite/abstract.py', sha1='a2fc3f3697fa8de5247761e9d554e70176f37aac'),
             dict(path='../../lite/bytes.py', sha1='8efb16035a9da52a70b346f603eac6e04b28dc8c'),
             dict(path='../../lite/namespaces.py', sha1='27b12b6592403c010fb8b2a0af7c24238490d3a1'),
             dict(path='types.py', sha1='3edeaaa038f975595ba3eeea10f7e313d84723bb'),
             dict(path='base.py', sha1='0f0cea0fe05f9d7b4669a7b3871bc78e12af98f6'),
-            dict(path='framing.py', sha1='de1f818064576e855f20b005ea7855a1fd5f3f56'),
             dict(path='reading.py', sha1='36ca4cdf831d8913088dc82a5a512ea7ad0aa66b'),
             dict(path='utils.py', sha1='62d7fce79bae738c199627668bdee8bb389efa1e'),
             dict(path='direct.py', sha1='5a629d79aa7f618dce40e11c2609bc0dcd008599'),
-            dict(path='scanning.py', sha1='36411208b4e6515528f0310c7052b3faf2572b24'),
+            dict(path='scanning.py', sha1='9cee14466174532dfde8f5c96d8f4d487fdcfa97'),
             dict(path='adapters.py', sha1='672207f8bdc5261c22cd7d9049d9f763523bf46e'),
+            dict(path='framing.py', sha1='3f1ea224a36e5afc287d318e2b8d4cb92acf4128'),
             dict(path='linear.py', sha1='1c3bbf4424c22d7d120a2f0735a6cc7d9d2cd3f4'),
-            dict(path='segmented.py', sha1='ad3c91e91d7b91396c51549fc7578419b1c3d336'),
+            dict(path='segmented.py', sha1='5dd5ba71c2d8716eea38210099c569a6e2e03b65'),
             dict(path='_amalg.py', sha1='795e3dc80a8acd501be0ff3fd579e9e4a5f74794'),
         ],
     )
@@ -61,6 +65,141 @@ BoolOrAwaitableBool = ta.TypeVar('BoolOrAwaitableBool', bound=ta.Union[bool, ta.
 BoolOrAwaitableBool_co = ta.TypeVar('BoolOrAwaitableBool_co', bound=ta.Union[bool, ta.Awaitable[bool]], covariant=True)
 
 
+########################################
+# ../_scanning_py.py
+"""
+Pure-Python reference implementations of the functions of the optional `_scanning` extension, which must behave
+identically. `scanning` exports the extension's versions when it is available, and these otherwise.
+"""
+
+
+##
+
+
+_FIND_LONGEST_PATS: ta.Dict[ta.Tuple[bytes, ...], ta.Tuple[ta.Any, ta.Any, int]] = {}
+
+
+def _find_longest_pats(subs: ta.Tuple[bytes, ...]) -> ta.Tuple[ta.Any, ta.Any, int]:
+    try:
+        return _FIND_LONGEST_PATS[subs]
+    except KeyError:
+        pass
+
+    if not subs:
+        raise ValueError('no subs')
+    if any(not s for s in subs):
+        raise ValueError('empty sub')
+
+    # Alternation tries its branches in order, so at the leftmost position matched the first sub to match wins. One
+    # group per sub lets `lastindex` name it.
+    pat = re.compile(b'|'.join(b'(' + re.escape(s) + b')' for s in subs))
+    first_pat = re.compile(b'[' + b''.join(re.escape(s[:1]) for s in subs) + b']')
+
+    if len(_FIND_LONGEST_PATS) >= 256:
+        _FIND_LONGEST_PATS.clear()
+    ret = _FIND_LONGEST_PATS[subs] = (pat, first_pat, max(len(s) for s in subs) - 1)
+    return ret
+
+
+def find_longest(segs: ta.Sequence[ta.Any], subs: ta.Sequence[bytes], start: int = 0) -> ta.Tuple[int, int]:
+    """
+    Searches the stream formed by concatenating the bytes-like `segs` for the earliest occurrence of any of `subs` at or
+    after `start`, returning its position and the index of the first of `subs` which occurs there - so ordering `subs`
+    longest first picks the longest match. Returns (-1, -1) if none occurs.
+    """
+
+    pat, first_pat, ov = _find_longest_pats(tuple(subs))
+
+    if start < 0:
+        start = 0
+
+    n = len(segs)
+    i = 0
+    base = 0
+    while i < n:
+        sl = len(segs[i])
+        if base + sl > start:
+            break
+        base += sl
+        i += 1
+
+    lo = start - base
+    while i < n:
+        s = segs[i]
+        sl = len(s)
+
+        # Matches starting within the last `ov` bytes may be cut short - or missed - by the end of the segment, so only
+        # earlier ones are final.
+        tail = sl - ov
+        m = pat.search(s, lo)
+        if m is not None and m.start() < tail:
+            return base + m.start(), m.lastindex - 1
+
+        wlo = lo if lo > tail else tail
+        if ov and i + 1 < n and (m is not None or first_pat.search(s, wlo) is not None):
+            parts = [s[wlo:]]
+            need = ov
+            j = i + 1
+            while need and j < n:
+                p = segs[j][:need]
+                parts.append(p)
+                need -= len(p)
+                j += 1
+
+            # Matches starting after the boundary would be cut short by the end of the window - they're found from the
+            # next segment instead.
+            wm = pat.search(b''.join(parts))
+            if wm is not None and wm.start() < sl - wlo:
+                return base + wlo + wm.start(), wm.lastindex - 1
+
+        elif m is not None:
+            return base + m.start(), m.lastindex - 1
+
+        base += sl
+        lo = 0
+        i += 1
+
+    return -1, -1
+
+
+def scan_length_fields(
+        buf: ta.Any,
+        offset: int,
+        length: int,
+        byteorder: str,
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    """
+    Returns the total lengths of the consecutive length-field-prefixed frames laid out wholly within the bytes-like
+    `buf` from its start, where each frame's total length is its unsigned length field's value plus `adjustment` plus
+    `offset + length`. Stops at the first frame which is incomplete, whose total length is shorter than its header, or
+    which is longer than `limit`.
+    """
+
+    if offset < 0:
+        raise ValueError(offset)
+    if length not in (1, 2, 4, 8):
+        raise ValueError(length)
+    if byteorder not in ('big', 'little'):
+        raise ValueError(byteorder)
+
+    mv = memoryview(buf)
+    n = len(mv)
+    end_off = offset + length
+
+    out: ta.List[int] = []
+    p = 0
+    while n - p >= end_off:
+        t = int.from_bytes(mv[p + offset:p + end_off], byteorder) + adjustment + end_off  # type: ignore[arg-type]
+        if t < end_off or t > n - p or (limit is not None and t > limit):
+            break
+        out.append(t)
+        p += t
+
+    return out
+
+
 ########################################
 # ../errors.py
 
@@ -624,473 +763,138 @@ class BaseByteStreamBufferLike(ByteStreamBufferLike, Abstract):
 
 
 ########################################
-# ../framing.py
+# ../reading.py
 
 
 ##
 
 
-class LongestMatchDelimiterByteStreamFrameDecoder:
-    """
-    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
+class ByteStreamBufferReader:
+    def __init__(self, buf: ByteStreamBuffer) -> None:
+        super().__init__()
 
-    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
-    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
+        self._buf = buf
 
-    Key property:
-      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
-      it can prove the next byte is not '\\n' (or the stream is finalized).
+    #
 
-    Implementation note:
-      This codec relies on `ByteStreamBuffer.find(...)` being stream-correct and C-accelerated over the buffer's
-      underlying contiguous segments. In pure Python it is usually better to keep searching near the storage layer than
-      to re-implement scanning byte-by-byte in higher-level codecs.
+    def _coalesce_exact(self, n: int) -> memoryview:
+        """
+        Return a contiguous view of exactly `n` readable bytes, or raise NeedMoreDataByteStreamBufferError.
 
-    Pairs well with `ScanningByteStreamBuffer`.
-    """
+        Uses `buf.coalesce(n)` to avoid per-byte Python work and to keep copying close to the buffer backend.
+        """
 
-    def __init__(
-            self,
-            delims: ta.Sequence[bytes],
-            *,
-            keep_ends: bool = False,
-            max_size: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
+        if n < 0:
+            raise ValueError(n)
+        if len(self._buf) < n:
+            raise NeedMoreDataByteStreamBufferError
+        mv = self._buf.coalesce(n)
+        if len(mv) < n:
+            # Defensive: coalesce contract should provide >= n when len(buf) >= n.
+            raise NeedMoreDataByteStreamBufferError
+        return mv[:n]
 
-        dl = list(delims)
-        if not dl:
-            raise ValueError('no delimiters')
-        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
-            raise TypeError(delims)
-        if any(not d for d in dl):
-            raise ValueError('empty delimiter')
+    #
 
-        self._delims = tuple(bytes(d) for d in dl)
-        self._keep_ends = keep_ends
-        self._max_size = max_size
+    def peek_u8(self) -> int:
+        """Peek an unsigned 8-bit integer without consuming."""
 
-        # Sort by length descending for "choose longest at same start".
-        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+        mv = self._coalesce_exact(1)
+        return mv[0]
 
-        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
-        # with it.
-        pref: ta.Dict[bytes, ta.List[bytes]] = {}
-        for d in self._delims:
-            for e in self._delims:
-                if d is e:
-                    continue
-                if len(e) > len(d) and e.startswith(d):
-                    pref.setdefault(d, []).append(e)
-        for k, vs in list(pref.items()):
-            pref[k] = sorted(vs, key=len, reverse=True)
-        self._prefix_longer = pref
+    def read_u8(self) -> int:
+        """Read and consume an unsigned 8-bit integer."""
 
-        self._max_delim_len = max(len(d) for d in self._delims)
+        v = self.peek_u8()
+        self._buf.advance(1)
+        return v
 
-    @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[True],
-    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
-        ...
+    def peek_u16_be(self) -> int:
+        """Peek an unsigned 16-bit big-endian integer without consuming."""
 
-    @ta.overload
-    def decode(
-            self,
-            buf: ByteStreamBuffer,
-            *,
-            final: bool = False,
-            include_delims: ta.Literal[False] = False,
-    ) -> ta.List[ByteStreamBufferView]:
-        ...
+        mv = self._coalesce_exact(2)
+        return int.from_bytes(mv, 'big', signed=False)
 
-    def decode(
-            self,
-            buf,
-            *,
-            final=False,
-            include_delims=False,
-    ):
-        """
-        Consume as many complete frames as possible from `buf` and return them as views.
+    def read_u16_be(self) -> int:
+        """Read and consume an unsigned 16-bit big-endian integer."""
 
-        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
-        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
-        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+        v = self.peek_u16_be()
+        self._buf.advance(2)
+        return v
 
-        Raises:
-          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
-          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+    def peek_u16_le(self) -> int:
+        """Peek an unsigned 16-bit little-endian integer without consuming."""
 
-        Note on `max_size`:
-          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
-          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
-          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
-          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
-          remaining bytes buffered.
-        """
+        mv = self._coalesce_exact(2)
+        return int.from_bytes(mv, 'little', signed=False)
 
-        out: ta.List[ta.Any] = []
+    def read_u16_le(self) -> int:
+        """Read and consume an unsigned 16-bit little-endian integer."""
 
-        while True:
-            hit = self._find_next_delim(buf)
-            if hit is None:
-                if self._max_size is not None and len(buf) > self._max_size and not out:
-                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
-                return out
+        v = self.peek_u16_le()
+        self._buf.advance(2)
+        return v
 
-            pos, delim = hit
+    def peek_u32_be(self) -> int:
+        """Peek an unsigned 32-bit big-endian integer without consuming."""
 
-            if self._max_size is not None and pos > self._max_size:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+        mv = self._coalesce_exact(4)
+        return int.from_bytes(mv, 'big', signed=False)
 
-            if not final and self._should_defer(buf, pos, delim):
-                return out
+    def read_u32_be(self) -> int:
+        """Read and consume an unsigned 32-bit big-endian integer."""
 
-            if self._keep_ends:
-                frame = buf.split_to(pos + len(delim))
-            else:
-                frame = buf.split_to(pos)
-                buf.advance(len(delim))
+        v = self.peek_u32_be()
+        self._buf.advance(4)
+        return v
 
-            if include_delims:
-                out.append((frame, delim))
-            else:
-                out.append(frame)
+    def peek_u32_le(self) -> int:
+        """Peek an unsigned 32-bit little-endian integer without consuming."""
 
-    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
-        """
-        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
-        choose the longest matching delimiter.
-        """
+        mv = self._coalesce_exact(4)
+        return int.from_bytes(mv, 'little', signed=False)
 
-        ln = len(buf)
-        if not ln:
-            return None
+    def read_u32_le(self) -> int:
+        """Read and consume an unsigned 32-bit little-endian integer."""
 
-        best_pos = None  # type: ta.Optional[int]
-        best_delim = None  # type: ta.Optional[bytes]
+        v = self.peek_u32_le()
+        self._buf.advance(4)
+        return v
 
-        # First pass: find the earliest position of any delimiter (cheap, uses buf.find).
-        for d in self._delims:
-            i = buf.find(d, 0, None)
-            if i == -1:
-                continue
-            if best_pos is None or i < best_pos:
-                best_pos = i
-                best_delim = d
-                if not best_pos:
-                    # Can't beat position 0; still need to choose longest at this position.
-                    pass
-            elif i == best_pos and best_delim is not None and len(d) > len(best_delim):
-                best_delim = d
+    #
 
-        if best_pos is None or best_delim is None:
-            return None
+    def peek_exact(self, n: int, /) -> memoryview:
+        """
+        Return a contiguous view of exactly `n` readable bytes without consuming.
 
-        # Second pass: at that position, choose the longest delimiter that actually matches there. (We can't just rely
-        # on "which delimiter found it first" when overlaps exist.)
-        pos = best_pos
-        for d in self._delims_by_len:
-            if pos + len(d) > ln:
-                continue
-            if buf.find(d, pos, pos + len(d)) == pos:
-                return pos, d
+        Raises NeedMoreDataByteStreamBufferError if fewer than `n` bytes are currently buffered.
+        """
 
-        # Shouldn't happen: best_pos came from some delimiter occurrence.
-        return pos, best_delim
+        if n < 0:
+            raise ValueError(n)
+        if len(self._buf) < n:
+            raise NeedMoreDataByteStreamBufferError
+        mv = self._buf.coalesce(n)
+        if len(mv) < n:
+            raise NeedMoreDataByteStreamBufferError
+        return mv[:n]
 
-    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
+    def take(self, n: int, /) -> ByteStreamBufferView:
         """
-        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
-        have enough bytes to decide.
+        Consume and return a `ByteStreamBufferView`-like object representing exactly `n` bytes.
 
-        We only defer when:
-          - the current match ends at the end of the currently buffered bytes, and
-          - there exists some longer delimiter that has `matched` as a prefix, and
-          - the buffered bytes from pos match the available prefix of that longer delimiter.
+        Raises NeedMoreDataByteStreamBufferError if fewer than `n` bytes are currently buffered.
         """
 
-        ln = len(buf)
-        endpos = pos + len(matched)
-        if endpos != ln:
-            return False
+        if n < 0:
+            raise ValueError(n)
+        if len(self._buf) < n:
+            raise NeedMoreDataByteStreamBufferError
+        return self._buf.split_to(n)
 
-        longer = self._prefix_longer.get(matched)
-        if not longer:
-            return False
-
-        avail = ln - pos
-        for d2 in longer:
-            if avail >= len(d2):
-                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
-                continue
-            # Check whether buffered bytes match the prefix of d2 that we have available.
-            # Use stream-correct find on the prefix.
-            prefix = d2[:avail]
-            if buf.find(prefix, pos, pos + avail) == pos:
-                return True
-
-        return False
-
-
-##
-
-
-class LengthFieldByteStreamFrameDecoder:
-    """
-    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
-
-    This is modeled after the common Netty pattern:
-      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
-    where:
-      length_field_end_offset = length_field_offset + length_field_length
-
-    Parameters:
-      - length_field_offset: byte offset of the length field from the start of the frame
-      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
-      - byteorder: 'big' or 'little'
-      - length_adjustment: adjustment added to computed frame length (may be negative)
-      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
-        length field and/or header from the delivered payload)
-      - max_frame_length: maximum allowed total frame length (before stripping)
-
-    Notes:
-      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
-      - It relies on `buf.coalesce(n)` for efficient header parsing in pure Python.
-      - It does not require async/await and is suitable for pipeline-style codecs.
-    """
-
-    def __init__(
-            self,
-            *,
-            length_field_offset: int = 0,
-            length_field_length: int = 4,
-            byteorder: ta.Literal['little', 'big'] = 'big',
-            length_adjustment: int = 0,
-            initial_bytes_to_strip: int = 0,
-            max_frame_length: ta.Optional[int] = None,
-    ) -> None:
-        super().__init__()
-
-        if length_field_offset < 0:
-            raise ValueError(length_field_offset)
-        if length_field_length not in (1, 2, 4, 8):
-            raise ValueError(length_field_length)
-        if byteorder not in ('big', 'little'):
-            raise ValueError(byteorder)
-        if initial_bytes_to_strip < 0:
-            raise ValueError(initial_bytes_to_strip)
-        if max_frame_length is not None and max_frame_length < 0:
-            raise ValueError(max_frame_length)
-
-        self._off = int(length_field_offset)
-        self._llen = int(length_field_length)
-        self._byteorder = byteorder
-        self._adj = int(length_adjustment)
-        self._strip = int(initial_bytes_to_strip)
-        self._max = None if max_frame_length is None else int(max_frame_length)
-
-        self._end_off = self._off + self._llen
-
-    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
-        """
-        Consume as many complete frames as possible from `buf` and return them as views.
-
-        Returns:
-          - list of BytesView-like objects (from `split_to`) representing each decoded frame
-
-        Raises:
-          - FrameTooLarge if a frame exceeds max_frame_length
-          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
-            progress (defensive; rarely hit if upstream caps buffer growth)
-        """
-
-        out: ta.List[ta.Any] = []
-
-        while True:
-            # Need at least enough bytes to read the length field.
-            if len(buf) < self._end_off:
-                return out
-
-            # Read header up through the length field contiguously.
-            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
-            mv = buf.coalesce(self._end_off)
-            if len(mv) < self._end_off:
-                # Defensive: coalesce contract.
-                return out
-
-            # Copy just the length field bytes (1/2/4/8) so we can safely mutate the buffer afterward.
-            lf_bytes = bytes(mv[self._off:self._end_off])
-            # del mv
-
-            length_val = int.from_bytes(lf_bytes, self._byteorder, signed=False)
-
-            total_len = length_val + self._adj + self._end_off
-            if total_len < 0:
-                raise ValueError('negative frame length')
-
-            if self._max is not None and total_len > self._max:
-                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
-
-            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
-            # control.
-            if len(buf) < total_len:
-                if self._max is not None and len(buf) > self._max:
-                    raise BufferTooLargeByteStreamBufferError(
-                        'buffer exceeded max_frame_length without completing a frame',
-                    )
-                return out
-
-            # We have a complete frame available.
-            if self._strip:
-                if self._strip > total_len:
-                    raise ValueError('initial_bytes_to_strip > frame length')
-                buf.advance(self._strip)
-                total_len -= self._strip
-
-            out.append(buf.split_to(total_len))
-
-            # Loop for additional frames
-
-
-########################################
-# ../reading.py
-
-
-##
-
-
-class ByteStreamBufferReader:
-    def __init__(self, buf: ByteStreamBuffer) -> None:
-        super().__init__()
-
-        self._buf = buf
-
-    #
-
-    def _coalesce_exact(self, n: int) -> memoryview:
-        """
-        Return a contiguous view of exactly `n` readable bytes, or raise NeedMoreDataByteStreamBufferError.
-
-        Uses `buf.coalesce(n)` to avoid per-byte Python work and to keep copying close to the buffer backend.
-        """
-
-        if n < 0:
-            raise ValueError(n)
-        if len(self._buf) < n:
-            raise NeedMoreDataByteStreamBufferError
-        mv = self._buf.coalesce(n)
-        if len(mv) < n:
-            # Defensive: coalesce contract should provide >= n when len(buf) >= n.
-            raise NeedMoreDataByteStreamBufferError
-        return mv[:n]
-
-    #
-
-    def peek_u8(self) -> int:
-        """Peek an unsigned 8-bit integer without consuming."""
-
-        mv = self._coalesce_exact(1)
-        return mv[0]
-
-    def read_u8(self) -> int:
-        """Read and consume an unsigned 8-bit integer."""
-
-        v = self.peek_u8()
-        self._buf.advance(1)
-        return v
-
-    def peek_u16_be(self) -> int:
-        """Peek an unsigned 16-bit big-endian integer without consuming."""
-
-        mv = self._coalesce_exact(2)
-        return int.from_bytes(mv, 'big', signed=False)
-
-    def read_u16_be(self) -> int:
-        """Read and consume an unsigned 16-bit big-endian integer."""
-
-        v = self.peek_u16_be()
-        self._buf.advance(2)
-        return v
-
-    def peek_u16_le(self) -> int:
-        """Peek an unsigned 16-bit little-endian integer without consuming."""
-
-        mv = self._coalesce_exact(2)
-        return int.from_bytes(mv, 'little', signed=False)
-
-    def read_u16_le(self) -> int:
-        """Read and consume an unsigned 16-bit little-endian integer."""
-
-        v = self.peek_u16_le()
-        self._buf.advance(2)
-        return v
-
-    def peek_u32_be(self) -> int:
-        """Peek an unsigned 32-bit big-endian integer without consuming."""
-
-        mv = self._coalesce_exact(4)
-        return int.from_bytes(mv, 'big', signed=False)
-
-    def read_u32_be(self) -> int:
-        """Read and consume an unsigned 32-bit big-endian integer."""
-
-        v = self.peek_u32_be()
-        self._buf.advance(4)
-        return v
-
-    def peek_u32_le(self) -> int:
-        """Peek an unsigned 32-bit little-endian integer without consuming."""
-
-        mv = self._coalesce_exact(4)
-        return int.from_bytes(mv, 'little', signed=False)
-
-    def read_u32_le(self) -> int:
-        """Read and consume an unsigned 32-bit little-endian integer."""
-
-        v = self.peek_u32_le()
-        self._buf.advance(4)
-        return v
-
-    #
-
-    def peek_exact(self, n: int, /) -> memoryview:
-        """
-        Return a contiguous view of exactly `n` readable bytes without consuming.
-
-        Raises NeedMoreDataByteStreamBufferError if fewer than `n` bytes are currently buffered.
-        """
-
-        if n < 0:
-            raise ValueError(n)
-        if len(self._buf) < n:
-            raise NeedMoreDataByteStreamBufferError
-        mv = self._buf.coalesce(n)
-        if len(mv) < n:
-            raise NeedMoreDataByteStreamBufferError
-        return mv[:n]
-
-    def take(self, n: int, /) -> ByteStreamBufferView:
-        """
-        Consume and return a `ByteStreamBufferView`-like object representing exactly `n` bytes.
-
-        Raises NeedMoreDataByteStreamBufferError if fewer than `n` bytes are currently buffered.
-        """
-
-        if n < 0:
-            raise ValueError(n)
-        if len(self._buf) < n:
-            raise NeedMoreDataByteStreamBufferError
-        return self._buf.split_to(n)
-
-    def read_bytes(self, n: int, /) -> Bytes:
-        """
-        Consume exactly `n` bytes and return them as a contiguous `bytes` object (copy boundary).
+    def read_bytes(self, n: int, /) -> Bytes:
+        """
+        Consume exactly `n` bytes and return them as a contiguous `bytes` object (copy boundary).
 
         Raises NeedMoreDataByteStreamBufferError if fewer than `n` bytes are currently buffered.
         """
@@ -1430,6 +1234,20 @@ def empty_byte_stream_buffer_view() -> ByteStreamBufferView:
 # ../scanning.py
 
 
+_scanning: ta.Any
+try:
+    from . import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
+if _scanning is not None:
+    globals().update({a: getattr(_scanning, a) for a in [
+        'find_longest',
+        'scan_length_fields',
+    ]})
+
+
 ##
 
 
@@ -1454,7 +1272,7 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
         super().__init__()
 
         self._buf = buf
-        self._scan_from_by_sub: dict[bytes, int] = {}
+        self._scan_from_by_sub: ta.Dict[ta.Union[bytes, ta.Tuple[bytes, ...]], int] = {}
 
     @property
     def max_size(self) -> ta.Optional[int]:
@@ -1507,11 +1325,33 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
 
         return i
 
-    def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
-        # rfind isn't the typical trickle hot-path; delegate.
-        return self._buf.rfind(sub, start, end)
+    def find_longest(self, subs: ta.Sequence[bytes]) -> ta.Tuple[int, int]:
+        """
+        Returns the position of the earliest occurrence of any of `subs`, and the index of the first of `subs` which
+        occurs there - so ordering `subs` longest first picks the longest match - or (-1, -1). Searches all of the
+        buffer's segments in a single pass, natively when the `_scanning` extension is available, and caches negative
+        progress per `subs` just as `find` does per `sub`.
+        """
 
-    #
+        key = tuple(subs)
+        scan_from = self._scan_from_by_sub.get(key, 0)
+
+        # Allow overlap so a match spanning old/new boundary is discoverable.
+        eff_start = scan_from - (max(map(len, key), default=1) - 1)
+        if eff_start < 0:
+            eff_start = 0
+
+        ret = find_longest(self._buf.segments(), key, eff_start)
+        if ret[0] < 0:
+            self._scan_from_by_sub[key] = len(self._buf)
+
+        return ret
+
+    def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
+        # rfind isn't the typical trickle hot-path; delegate.
+        return self._buf.rfind(sub, start, end)
+
+    #
 
     def write(self, data: BytesLike, /) -> None:
         self._buf.write(data)
@@ -1914,116 +1754,448 @@ class BytesIoByteStreamBuffer(MutableByteStreamBuffer):
         self._resv: ta.Optional[bytearray] = None
         self._resv_len = 0
 
-    @property
-    def max_size(self) -> ta.Optional[int]:
-        return None
+    @property
+    def max_size(self) -> ta.Optional[int]:
+        return None
+
+    def __len__(self) -> int:
+        return self._bio.getbuffer().nbytes - self._rpos
+
+    def peek(self) -> memoryview:
+        mv = self._bio.getbuffer()
+        return mv[self._rpos:]
+
+    def segments(self) -> ta.Sequence[memoryview]:
+        mv = self._bio.getbuffer()
+        seg = mv[self._rpos:]
+        return (seg,) if len(seg) else ()
+
+    def advance(self, n: int, /) -> None:
+        if n < 0 or n > len(self):
+            raise ValueError(n)
+        self._rpos += n
+        # Optional compaction heuristic: if we've consumed a lot, rebuild a smaller BytesIO.
+        # This may fail if someone holds a getbuffer() view (BufferError).
+        if (
+                self._rpos and
+                self._rpos >= self._compaction_threshold and
+                self._rpos >= (self._bio.getbuffer().nbytes // 2)
+        ):
+            try:
+                remaining = self._bio.getbuffer()[self._rpos:].tobytes()
+                self._bio = io.BytesIO(remaining)
+                self._rpos = 0
+            except BufferError as e:  # noqa
+                raise
+
+    def split_to(self, n: int, /) -> ByteStreamBufferView:
+        if n < 0 or n > len(self):
+            raise ValueError(n)
+        mv = self._bio.getbuffer()
+        out = mv[self._rpos:self._rpos + n]
+        self._rpos += n
+        return DirectByteStreamBufferView(out)
+
+    def write(self, data: BytesLike, /) -> None:
+        if not data:
+            return
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            self._bio.seek(0, io.SEEK_END)
+            self._bio.write(data)
+        except BufferError as e:  # noqa
+            raise
+
+    def reserve(self, n: int, /) -> memoryview:
+        if n < 0:
+            raise ValueError(n)
+        if self._resv is not None:
+            raise RuntimeError('outstanding reserve')
+        b = bytearray(n)
+        self._resv = b
+        self._resv_len = n
+        return memoryview(b)
+
+    def commit(self, n: int, /) -> None:
+        if self._resv is None:
+            raise RuntimeError('no outstanding reserve')
+        if n < 0 or n > self._resv_len:
+            raise ValueError(n)
+        b = self._resv
+        self._resv = None
+        self._resv_len = 0
+        if n:
+            self.write(memoryview(b)[:n])
+
+    def coalesce(self, n: int, /) -> memoryview:
+        if n < 0 or n > len(self):
+            raise ValueError(n)
+        if not n:
+            return memoryview(b'')
+        # BytesIO is always contiguous, just return the requested slice
+        mv = self._bio.getbuffer()
+        return mv[self._rpos:self._rpos + n]
+
+    def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
+        # Normalize start/end to valid range
+        s, e, _ = slice(start, end, 1).indices(len(self))
+        if e < s:
+            e = s
+
+        if not sub:
+            return s
+
+        # Convert to bytes for searching (memoryview doesn't have find method)
+        b = bytes(self._bio.getbuffer())
+        idx = b.find(sub, self._rpos + s, self._rpos + e)
+        return (idx - self._rpos) if idx >= 0 else -1
+
+    def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
+        # Normalize start/end to valid range
+        s, e, _ = slice(start, end, 1).indices(len(self))
+        if e < s:
+            e = s
+
+        if not sub:
+            return e
+
+        # Convert to bytes for searching (memoryview doesn't have rfind method)
+        b = bytes(self._bio.getbuffer())
+        idx = b.rfind(sub, self._rpos + s, self._rpos + e)
+        return (idx - self._rpos) if idx >= 0 else -1
+
+
+########################################
+# ../framing.py
+
+
+##
+
+
+class LongestMatchDelimiterByteStreamFrameDecoder:
+    """
+    A delimiter-based framing codec that supports *overlapping* delimiters with longest-match semantics.
+
+    This is intentionally decoupled from any I/O model: it operates purely on a `ByteStreamBuffer`-like object
+    (providing `__len__`, `find`, `split_to`, `advance`, and `segments`/`peek`).
+
+    Key property:
+      Given overlapping delimiters like [b'\\r', b'\\r\\n'], this codec will *not* emit a frame ending at '\\r' unless
+      it can prove the next byte is not '\\n' (or the stream is finalized).
+
+    Implementation note:
+      This codec searches for all delimiters at once over the buffer's `segments()`, with `scanning.find_longest` -
+      natively when the `_scanning` extension is available. Given a `ScanningByteStreamBuffer` it resumes each search
+      where the last unsuccessful one left off.
+
+    Pairs well with `ScanningByteStreamBuffer`.
+    """
+
+    def __init__(
+            self,
+            delims: ta.Sequence[bytes],
+            *,
+            keep_ends: bool = False,
+            max_size: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        dl = list(delims)
+        if not dl:
+            raise ValueError('no delimiters')
+        if any(not isinstance(d, (bytes, bytearray)) for d in dl):
+            raise TypeError(delims)
+        if any(not d for d in dl):
+            raise ValueError('empty delimiter')
+
+        self._delims = tuple(bytes(d) for d in dl)
+        self._keep_ends = keep_ends
+        self._max_size = max_size
+
+        # Sort by length descending for "choose longest at same start".
+        self._delims_by_len = tuple(sorted(self._delims, key=len, reverse=True))
+
+        # Build prefix relationships for overlap deferral. For each short delimiter, store longer delimiters that start
+        # with it.
+        pref: ta.Dict[bytes, ta.List[bytes]] = {}
+        for d in self._delims:
+            for e in self._delims:
+                if d is e:
+                    continue
+                if len(e) > len(d) and e.startswith(d):
+                    pref.setdefault(d, []).append(e)
+        for k, vs in list(pref.items()):
+            pref[k] = sorted(vs, key=len, reverse=True)
+        self._prefix_longer = pref
+
+        self._max_delim_len = max(len(d) for d in self._delims)
+
+        # A lone delimiter is simply searched for with the buffer's own `find`.
+        self._single_delim: ta.Optional[bytes] = self._delims[0] if len(set(self._delims)) == 1 else None
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[True],
+    ) -> ta.List[ta.Tuple[ByteStreamBufferView, bytes]]:
+        ...
+
+    @ta.overload
+    def decode(
+            self,
+            buf: ByteStreamBuffer,
+            *,
+            final: bool = False,
+            include_delims: ta.Literal[False] = False,
+    ) -> ta.List[ByteStreamBufferView]:
+        ...
+
+    def decode(
+            self,
+            buf,
+            *,
+            final=False,
+            include_delims=False,
+    ):
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
+
+        - Frames are produced without copying (via `buf.split_to(...)`) when possible.
+        - The delimiter is consumed from the buffer; it may be retained on the frame if `keep_ends=True`.
+        - If `final=True`, the codec will not defer on overlapping delimiter prefixes at the end of the buffer.
+
+        Raises:
+          - BufferTooLargeByteStreamBufferError if no delimiter is present and the buffered prefix exceeds max_size.
+          - FrameTooLargeByteStreamBufferError if the next frame payload (bytes before delimiter) exceeds max_size.
+
+        Note on `max_size`:
+          `max_size` is enforced as a limit on the *current* frame (bytes before the next delimiter). If the buffer
+          contains bytes for a subsequent frame that already exceed `max_size`, this codec will only raise when it would
+          otherwise need to make progress on that oversized frame. Concretely: if this call already emitted at least one
+          frame, it will return those frames rather than raising immediately on trailing oversized data, leaving the
+          remaining bytes buffered.
+        """
+
+        out: ta.List[ta.Any] = []
+
+        while True:
+            hit = self._find_next_delim(buf)
+            if hit is None:
+                if self._max_size is not None and len(buf) > self._max_size and not out:
+                    raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size without delimiter')
+                return out
+
+            pos, delim = hit
+
+            if self._max_size is not None and pos > self._max_size:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_size')
+
+            if not final and self._should_defer(buf, pos, delim):
+                return out
+
+            if self._keep_ends:
+                frame = buf.split_to(pos + len(delim))
+            else:
+                frame = buf.split_to(pos)
+                buf.advance(len(delim))
+
+            if include_delims:
+                out.append((frame, delim))
+            else:
+                out.append(frame)
+
+    def _find_next_delim(self, buf: ByteStreamBuffer) -> ta.Optional[ta.Tuple[int, bytes]]:
+        """
+        Return (pos, delim) for the earliest delimiter occurrence. If multiple delimiters occur at the same position,
+        choose the longest matching delimiter.
+        """
+
+        if not len(buf):
+            return None
+
+        if self._single_delim is not None:
+            if (pos := buf.find(self._single_delim)) < 0:
+                return None
+            return pos, self._single_delim
+
+        if isinstance(buf, ScanningByteStreamBuffer):
+            pos, i = buf.find_longest(self._delims_by_len)
+        else:
+            pos, i = find_longest(buf.segments(), self._delims_by_len)
+
+        if pos < 0:
+            return None
+
+        return pos, self._delims_by_len[i]
+
+    def _should_defer(self, buf: ByteStreamBuffer, pos: int, matched: bytes) -> bool:
+        """
+        Return True if we must defer because a longer delimiter could still match starting at `pos` but we don't yet
+        have enough bytes to decide.
+
+        We only defer when:
+          - the current match ends at the end of the currently buffered bytes, and
+          - there exists some longer delimiter that has `matched` as a prefix, and
+          - the buffered bytes from pos match the available prefix of that longer delimiter.
+        """
+
+        ln = len(buf)
+        endpos = pos + len(matched)
+        if endpos != ln:
+            return False
+
+        longer = self._prefix_longer.get(matched)
+        if not longer:
+            return False
+
+        avail = ln - pos
+        for d2 in longer:
+            if avail >= len(d2):
+                # If we had enough bytes, we'd have matched d2 in _find_next_delim.
+                continue
+            # Check whether buffered bytes match the prefix of d2 that we have available.
+            # Use stream-correct find on the prefix.
+            prefix = d2[:avail]
+            if buf.find(prefix, pos, pos + avail) == pos:
+                return True
+
+        return False
+
+
+##
+
+
+class LengthFieldByteStreamFrameDecoder:
+    """
+    Decode length-prefixed frames from a BytesBuffer/MutableBytesBuffer.
+
+    This is modeled after the common Netty pattern:
+      total_frame_length = length_field_value + length_adjustment + length_field_end_offset
+    where:
+      length_field_end_offset = length_field_offset + length_field_length
+
+    Parameters:
+      - length_field_offset: byte offset of the length field from the start of the frame
+      - length_field_length: length of the length field in bytes (1, 2, 4, or 8)
+      - byteorder: 'big' or 'little'
+      - length_adjustment: adjustment added to computed frame length (may be negative)
+      - initial_bytes_to_strip: number of leading bytes to drop from the emitted frame (typically used to strip the
+        length field and/or header from the delivered payload)
+      - max_frame_length: maximum allowed total frame length (before stripping)
+
+    Notes:
+      - This decoder operates directly on the provided buffer and consumes bytes as frames are produced.
+      - Every complete frame laid out in the buffer's first contiguous segment is found in a single pass with
+        `scanning.scan_length_fields` - natively when the `_scanning` extension is available. It only relies on
+        `buf.coalesce(n)` for headers which span segments.
+      - It does not require async/await and is suitable for pipeline-style codecs.
+    """
+
+    def __init__(
+            self,
+            *,
+            length_field_offset: int = 0,
+            length_field_length: int = 4,
+            byteorder: ta.Literal['little', 'big'] = 'big',
+            length_adjustment: int = 0,
+            initial_bytes_to_strip: int = 0,
+            max_frame_length: ta.Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        if length_field_offset < 0:
+            raise ValueError(length_field_offset)
+        if length_field_length not in (1, 2, 4, 8):
+            raise ValueError(length_field_length)
+        if byteorder not in ('big', 'little'):
+            raise ValueError(byteorder)
+        if initial_bytes_to_strip < 0:
+            raise ValueError(initial_bytes_to_strip)
+        if max_frame_length is not None and max_frame_length < 0:
+            raise ValueError(max_frame_length)
+
+        self._off = int(length_field_offset)
+        self._llen = int(length_field_length)
+        self._byteorder = byteorder
+        self._adj = int(length_adjustment)
+        self._strip = int(initial_bytes_to_strip)
+        self._max = None if max_frame_length is None else int(max_frame_length)
 
-    def __len__(self) -> int:
-        return self._bio.getbuffer().nbytes - self._rpos
+        self._end_off = self._off + self._llen
 
-    def peek(self) -> memoryview:
-        mv = self._bio.getbuffer()
-        return mv[self._rpos:]
+    def decode(self, buf: ByteStreamBuffer) -> ta.List[ByteStreamBufferView]:
+        """
+        Consume as many complete frames as possible from `buf` and return them as views.
 
-    def segments(self) -> ta.Sequence[memoryview]:
-        mv = self._bio.getbuffer()
-        seg = mv[self._rpos:]
-        return (seg,) if len(seg) else ()
+        Returns:
+          - list of BytesView-like objects (from `split_to`) representing each decoded frame
 
-    def advance(self, n: int, /) -> None:
-        if n < 0 or n > len(self):
-            raise ValueError(n)
-        self._rpos += n
-        # Optional compaction heuristic: if we've consumed a lot, rebuild a smaller BytesIO.
-        # This may fail if someone holds a getbuffer() view (BufferError).
-        if (
-                self._rpos and
-                self._rpos >= self._compaction_threshold and
-                self._rpos >= (self._bio.getbuffer().nbytes // 2)
-        ):
-            try:
-                remaining = self._bio.getbuffer()[self._rpos:].tobytes()
-                self._bio = io.BytesIO(remaining)
-                self._rpos = 0
-            except BufferError as e:  # noqa
-                raise
+        Raises:
+          - FrameTooLarge if a frame exceeds max_frame_length
+          - BufferTooLarge if max_frame_length is set and the buffered unread prefix grows beyond it without making
+            progress (defensive; rarely hit if upstream caps buffer growth)
+        """
 
-    def split_to(self, n: int, /) -> ByteStreamBufferView:
-        if n < 0 or n > len(self):
-            raise ValueError(n)
-        mv = self._bio.getbuffer()
-        out = mv[self._rpos:self._rpos + n]
-        self._rpos += n
-        return DirectByteStreamBufferView(out)
+        out: ta.List[ta.Any] = []
 
-    def write(self, data: BytesLike, /) -> None:
-        if not data:
-            return
-        if isinstance(data, memoryview):
-            data = data.tobytes()
-        try:
-            self._bio.seek(0, io.SEEK_END)
-            self._bio.write(data)
-        except BufferError as e:  # noqa
-            raise
+        while True:
+            # Need at least enough bytes to read the length field.
+            if len(buf) < self._end_off:
+                return out
 
-    def reserve(self, n: int, /) -> memoryview:
-        if n < 0:
-            raise ValueError(n)
-        if self._resv is not None:
-            raise RuntimeError('outstanding reserve')
-        b = bytearray(n)
-        self._resv = b
-        self._resv_len = n
-        return memoryview(b)
+            # Read header up through the length field contiguously.
+            # IMPORTANT: don't keep exported memoryviews alive across buffer mutation.
+            mv = buf.peek()
+            if len(mv) < self._end_off:
+                mv = buf.coalesce(self._end_off)
 
-    def commit(self, n: int, /) -> None:
-        if self._resv is None:
-            raise RuntimeError('no outstanding reserve')
-        if n < 0 or n > self._resv_len:
-            raise ValueError(n)
-        b = self._resv
-        self._resv = None
-        self._resv_len = 0
-        if n:
-            self.write(memoryview(b)[:n])
+            length_val = int.from_bytes(mv[self._off:self._end_off], self._byteorder, signed=False)
 
-    def coalesce(self, n: int, /) -> memoryview:
-        if n < 0 or n > len(self):
-            raise ValueError(n)
-        if not n:
-            return memoryview(b'')
-        # BytesIO is always contiguous, just return the requested slice
-        mv = self._bio.getbuffer()
-        return mv[self._rpos:self._rpos + n]
+            total_len = length_val + self._adj + self._end_off
+            if total_len < 0:
+                raise ValueError('negative frame length')
 
-    def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
-        # Normalize start/end to valid range
-        s, e, _ = slice(start, end, 1).indices(len(self))
-        if e < s:
-            e = s
+            if self._max is not None and total_len > self._max:
+                raise FrameTooLargeByteStreamBufferError('frame exceeded max_frame_length')
 
-        if not sub:
-            return s
+            # If we don't have the full frame yet, either wait or (optionally) fail fast if buffering is clearly out of
+            # control.
+            if len(buf) < total_len:
+                if self._max is not None and len(buf) > self._max:
+                    raise BufferTooLargeByteStreamBufferError(
+                        'buffer exceeded max_frame_length without completing a frame',
+                    )
+                return out
 
-        # Convert to bytes for searching (memoryview doesn't have find method)
-        b = bytes(self._bio.getbuffer())
-        idx = b.find(sub, self._rpos + s, self._rpos + e)
-        return (idx - self._rpos) if idx >= 0 else -1
+            # If the segment holds more than this frame, pick up every complete frame laid out in it in one pass.
+            if len(mv) - total_len >= self._end_off:
+                lens = scan_length_fields(
+                    mv,
+                    self._off,
+                    self._llen,
+                    self._byteorder,
+                    self._adj,
+                    self._max,
+                ) or [total_len]
+            else:
+                lens = [total_len]
+            del mv
 
-    def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
-        # Normalize start/end to valid range
-        s, e, _ = slice(start, end, 1).indices(len(self))
-        if e < s:
-            e = s
+            # We have complete frames available.
+            for total_len in lens:
+                if self._strip:
+                    if self._strip > total_len:
+                        raise ValueError('initial_bytes_to_strip > frame length')
+                    buf.advance(self._strip)
+                    total_len -= self._strip
 
-        if not sub:
-            return e
+                out.append(buf.split_to(total_len))
 
-        # Convert to bytes for searching (memoryview doesn't have rfind method)
-        b = bytes(self._bio.getbuffer())
-        idx = b.rfind(sub, self._rpos + s, self._rpos + e)
-        return (idx - self._rpos) if idx >= 0 else -1
+            # Loop for additional frames
 
 
 ########################################
@@ -2374,9 +2546,13 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     """
     A segmented, consumption-oriented bytes buffer.
 
-    Internally stores a list of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
+    Internally stores a deque of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
     segments without copying.
 
+    Alongside the segments it keeps a parallel deque of their cumulative end offsets, in an 'absolute' coordinate space
+    which only ever shifts by whole prepends - so consuming from the head is a `popleft` of each, and locating the
+    segment holding any position is a bisect rather than a walk.
+
     Optional "chunked writes":
       - If chunk_size > 0, small writes are accumulated into a lazily-allocated active bytearray "chunk" up to
         chunk_size.
@@ -2408,7 +2584,11 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     ) -> None:
         super().__init__()
 
-        self._segs: ta.List[Bytes] = []
+        self._segs: collections.deque[Bytes] = collections.deque()
+
+        # Absolute offset of the end of each segment's readable bytes. The active chunk, always last when present, ends
+        # at its used bytes.
+        self._ends: collections.deque[int] = collections.deque()
 
         self._max_size = None if max_size is None else int(max_size)
 
@@ -2427,6 +2607,9 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def max_size(self) -> ta.Optional[int]:
         return self._max_size
 
+    # Absolute offset of the first segment's first byte - or, with no segments, of the next byte to be written.
+    _base = 0
+
     _head_off = 0
     _len = 0
 
@@ -2439,34 +2622,61 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def __len__(self) -> int:
         return self._len
 
-    def _active_readable_len(self) -> int:
-        if self._active is None:
-            return 0
-        if self._reserved_in_active and self._reserved is not None:
-            tail = self._reserved_len
-        else:
-            tail = 0
-        rl = self._active_used - tail
-        return rl if rl > 0 else 0
+    def _append_seg(self, s: Bytes, n: int) -> None:
+        self._ends.append((self._ends[-1] if self._ends else self._base) + n)
+        self._segs.append(s)
+
+    def _popleft_seg(self) -> Bytes:
+        s = self._segs.popleft()
+        self._base = self._ends.popleft()
+        self._head_off = 0
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
+        return s
+
+    def _seg_start(self, i: int) -> int:
+        """Absolute offset of segment `i`'s first byte, whether or not it is still readable."""
+
+        return self._ends[i - 1] if i else self._base
+
+    def _seg_index(self, a: int) -> int:
+        """Index of the segment holding absolute offset `a`, which must be readable."""
+
+        return bisect.bisect_right(self._ends, a)
+
+    def _gather(self, i: int, a: int, n: int, stop: int) -> Bytes:
+        """Copies up to `n` bytes from absolute offset `a` - in segment `i` - onward, stopping before `stop`."""
+
+        if (e := a + n) > stop:
+            e = stop
+        if a >= e:
+            return b''
+
+        segs = self._segs
+        ends = self._ends
+        s0 = self._seg_start(i)
+        if e <= ends[i]:
+            return segs[i][a - s0:e - s0]
+
+        parts: ta.List[Bytes] = []
+        while a < e:
+            se = ends[i]
+            parts.append(segs[i][a - s0:(se if se < e else e) - s0])
+            a = s0 = se
+            i += 1
+        return b''.join(parts)
+
+    #
 
     def peek(self) -> memoryview:
         if not self._segs:
             return memoryview(b'')
 
-        s0 = self._segs[0]
-        mv = memoryview(s0)
-        if self._head_off:
-            mv = mv[self._head_off:]
-
-        if s0 is self._active:
-            # Active is only meaningful by _active_used, not len(bytearray).
-            rl = self._active_readable_len()
-            if self._head_off >= rl:
-                return memoryview(b'')
-            mv = memoryview(self._active)[self._head_off:rl]
-            return mv
-
-        return mv
+        off = self._head_off
+        if off >= (e := self._ends[0] - self._base):
+            return memoryview(b'')
+        return memoryview(self._segs[0])[off:e]
 
     def segments(self) -> ta.Sequence[memoryview]:
         if not self._segs:
@@ -2474,28 +2684,14 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         out: ta.List[memoryview] = []
 
-        last_i = len(self._segs) - 1
-        for i, s in enumerate(self._segs):
-            if s is self._active and i == last_i:
-                # Active chunk: create fresh view with readable length.
-                rl = self._active_readable_len()
-                if not i:
-                    # Active is also first segment; apply head_off.
-                    if self._head_off >= rl:
-                        continue
-                    mv = memoryview(self._active)[self._head_off:rl]
-                else:
-                    if rl <= 0:
-                        continue
-                    mv = memoryview(self._active)[:rl]
-            else:
-                # Non-active segment.
-                mv = memoryview(s)
-                if not i and self._head_off:
-                    mv = mv[self._head_off:]
-
-            if len(mv):
-                out.append(mv)
+        s0 = self._base
+        off = self._head_off
+        for s, e in zip(self._segs, self._ends):
+            rl = e - s0
+            if off < rl:
+                out.append(memoryview(s)[off:rl] if off or rl != len(s) else memoryview(s))
+            s0 = e
+            off = 0
 
         return out
 
@@ -2508,7 +2704,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         a = self._active
         if a is None:
             a = bytearray(self._chunk_size)  # fixed capacity
-            self._segs.append(a)
+            self._append_seg(a, 0)
             self._active = a
             self._active_used = 0
 
@@ -2521,9 +2717,15 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._reserved_in_active:
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
-        if (used := self._active_used) <= 0:
+        if (used := self._active_used) <= 0 or (len(self._segs) == 1 and self._segs[0] is a and self._head_off >= used):
+            # Nothing readable is left in it - including when everything written to it has since been consumed, in
+            # which case it is simply dropped rather than compacted.
             if self._segs and self._segs[-1] is a:
                 self._segs.pop()
+                e = self._ends.pop()
+                if not self._segs:
+                    self._base = e
+                    self._head_off = 0
             self._active = None
             self._active_used = 0
             return
@@ -2550,19 +2752,19 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def write(self, data: BytesLike, /) -> None:
         if not data:
             return
-        if isinstance(data, memoryview):
-            data = memoryview_to_bytes(data)  # noqa
-        # elif isinstance(data, bytearray):
-        #     pass
-        # else:
-        #     pass
 
+        # Memoryviews are only materialized when kept as their own segment - those small enough to be copied into the
+        # active chunk are copied straight from the view.
         dl = len(data)
 
         if self._max_size is not None and self._len + dl > self._max_size:
             raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size')
 
         if self._chunk_size <= 0:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
+            ends = self._ends
+            ends.append((ends[-1] if ends else self._base) + dl)
             self._segs.append(data)
             self._len += dl
             return
@@ -2571,8 +2773,10 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
         if dl >= self._chunk_size:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
             self._flush_active()
-            self._segs.append(data)
+            self._append_seg(data, dl)
             self._len += dl
             return
 
@@ -2584,6 +2788,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         # Copy into fixed-capacity buffer; do not resize.
         memoryview(a)[self._active_used:self._active_used + dl] = data
         self._active_used += dl
+        self._ends[-1] += dl
         self._len += dl
 
     def prepend(self, data: BytesLike, /) -> None:
@@ -2600,20 +2805,25 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._head_off:
             s0 = self._segs[0]
             if s0 is self._active:
+                # The active chunk is always last, so here it is also the only segment.
                 if self._reserved_in_active:
                     raise OutstandingReserveByteStreamBufferError('outstanding reserve')
-                rl = self._active_readable_len()
-                if self._head_off < rl:
-                    self._segs[0] = memoryview_to_bytes(memoryview(self._active)[self._head_off:rl])
+                if self._head_off < self._active_used:
+                    self._segs[0] = memoryview_to_bytes(memoryview(s0)[self._head_off:self._active_used])
+                    self._base += self._head_off
+                    self._head_off = 0
                 else:
-                    self._segs.pop(0)
+                    self._popleft_seg()
                 self._active = None
                 self._active_used = 0
             else:
                 self._segs[0] = s0[self._head_off:]
-            self._head_off = 0
+                self._base += self._head_off
+                self._head_off = 0
 
-        self._segs.insert(0, data)
+        self._segs.appendleft(data)
+        self._ends.appendleft(self._base)
+        self._base -= dl
         self._len += dl
 
     def reserve(self, n: int, /) -> memoryview:
@@ -2667,6 +2877,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
             if n:
                 self._active_used += n
+                self._ends[-1] += n
                 self._len += n
 
             # Keep active for reuse.
@@ -2685,15 +2896,32 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             return
 
         if n == len(b):
-            self._segs.append(b)
+            self._append_seg(b, n)
             self._len += n
         else:
             bb = memoryview_to_bytes(memoryview(b)[:n])
-            self._segs.append(bb)
+            self._append_seg(bb, n)
             self._len += n
 
     #
 
+    def _keep_consumed_active(self) -> bool:
+        """
+        Called when the first segment has just been fully consumed. If it is the active chunk and has spare capacity it
+        is kept, with the head offset past its used bytes, so further writes and reserves keep filling it rather than
+        allocating a new chunk. Consumed bytes are never overwritten, so views of them previously handed out stay valid.
+        It is always kept while a reservation is outstanding in it.
+        """
+
+        if self._segs[0] is not self._active or (
+                not self._reserved_in_active and
+                self._active_used >= self._chunk_size
+        ):
+            return False
+
+        self._head_off = self._active_used
+        return True
+
     def advance(self, n: int, /) -> None:
         if n < 0 or n > self._len:
             raise ValueError(n)
@@ -2702,35 +2930,20 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         self._len -= n
 
-        while n and self._segs:
-            s0 = self._segs[0]
-
-            if s0 is self._active:
-                avail0 = self._active_readable_len() - self._head_off
-            else:
-                avail0 = len(s0) - self._head_off
-
-            if avail0 <= 0:
-                popped = self._segs.pop(0)
-                if popped is self._active:
-                    self._active = None
-                    self._active_used = 0
-                self._head_off = 0
-                continue
-
-            if n < avail0:
-                self._head_off += n
-                return
-
-            n -= avail0
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        # Pop every segment ending at or before the new head, then land the head offset in the one after.
+        a = self._base + self._head_off + n
+        segs = self._segs
+        ends = self._ends
+        while ends and ends[0] <= a:
+            if segs[0] is self._active:
+                if self._keep_consumed_active():
+                    return
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            self._base = ends.popleft()
 
-        if n:
-            raise RuntimeError(n)
+        self._head_off = a - self._base
 
     def split_to(self, n: int, /) -> ByteStreamBufferView:
         if n < 0 or n > self._len:
@@ -2738,40 +2951,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if not n:
             return _EMPTY_DIRECT_BYTE_STREAM_BUFFER_VIEW
 
-        out: ta.List[memoryview] = []
-        rem = n
+        self._len -= n
 
-        while rem:
-            if not self._segs:
-                raise RuntimeError(rem)
+        b0 = self._base
+        a = b0 + self._head_off
+        e = a + n
+        segs = self._segs
+        ends = self._ends
 
-            s0 = self._segs[0]
+        # Fast path: entirely within a first segment which is not exhausted.
+        if e < ends[0]:
+            self._head_off += n
+            return DirectByteStreamBufferView(memoryview(segs[0])[a - b0:e - b0])
 
-            if s0 is self._active:
-                rl = self._active_readable_len()
-                if self._head_off >= rl:
-                    raise RuntimeError(rem)
-                mv0 = memoryview(s0)[self._head_off:rl]
-            else:
-                mv0 = memoryview(s0)
-                if self._head_off:
-                    mv0 = mv0[self._head_off:]
-
-            if rem < len(mv0):
-                out.append(mv0[:rem])
-                self._head_off += rem
-                self._len -= n
-                return byte_stream_buffer_view_from_segments(out)
-
-            out.append(mv0)
-            rem -= len(mv0)
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        out: ta.List[memoryview] = []
+        active = self._active
+        while ends and (se := ends[0]) <= e:
+            s = segs[0]
+            if a < se:
+                out.append(memoryview(s)[a - b0:se - b0])
+            a = se
+            if s is active:
+                self._base = b0
+                if self._keep_consumed_active():
+                    return byte_stream_buffer_view_from_segments(out)
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            b0 = ends.popleft()
+
+        self._base = b0
+        if a < e:
+            out.append(memoryview(segs[0])[:e - b0])
+        self._head_off = e - b0
 
-        self._len -= n
         return byte_stream_buffer_view_from_segments(out)
 
     def coalesce(self, n: int, /) -> memoryview:
@@ -2789,114 +3002,41 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if len(mv0) >= n:
             return mv0[:n]
 
-        out = bytearray(n)
-        w = 0
-
-        new_segs: ta.List[Bytes] = []
-
-        seg_i = 0
-        while w < n and seg_i < len(self._segs):
-            s = self._segs[seg_i]
-            off = self._head_off if not seg_i else 0
-
-            seg_len = len(s) - off
-            if s is self._active and seg_i == (len(self._segs) - 1):
-                seg_len = self._active_readable_len() - off
-
-            if seg_len <= 0:
-                seg_i += 1
-                continue
-
-            take = n - w
-            if take > seg_len:
-                take = seg_len
-
-            out[w:w + take] = memoryview(s)[off:off + take]
-            w += take
-
-            if take < seg_len:
-                rem = s[off + take:off + seg_len]
-                if rem:
-                    new_segs.append(rem)
-                seg_i += 1
-                break
-
-            seg_i += 1
-
-        if seg_i < len(self._segs):
-            new_segs.extend(self._segs[seg_i:])
+        # Copy the first n readable bytes into a single new segment replacing those they span, keeping what remains of
+        # the last of them as its own segment. The active chunk is always last, so only that one can be it.
+        segs = self._segs
+        ends = self._ends
+        b0 = self._base
+        a0 = a = b0 + self._head_off
+        e = a + n
+
+        parts: ta.List[Bytes] = []
+        while (se := ends[0]) < e:
+            parts.append(segs.popleft()[a - b0:se - b0])
+            ends.popleft()
+            a = b0 = se
+
+        s = segs[0]
+        parts.append(s[a - b0:e - b0])
+        out = b''.join(parts)
+
+        if e < se:
+            segs[0] = memoryview_to_bytes(memoryview(s)[e - b0:se - b0]) if s is self._active else s[e - b0:se - b0]
+        else:
+            segs.popleft()
+            ends.popleft()
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
 
-        self._segs = [bytes(out), *new_segs]
+        segs.appendleft(out)
+        ends.appendleft(e)
+        self._base = a0
         self._head_off = 0
 
-        self._active = None
-        self._active_used = 0
-
-        return memoryview(self._segs[0])[:n]
-
-    def _seg_readable_slice(
-            self,
-            si: int,
-            s: Bytes,
-            last_i: int,
-    ) -> ta.Tuple[int, int]:
-        """
-        Compute the readable offset and length for segment at index si.
-
-        Returns (offset, readable_len) where:
-          - offset: byte offset into segment (head_off for si==0, else 0)
-          - readable_len: number of readable bytes from offset (0 if segment empty/consumed)
-
-        Handles head offset for first segment and active chunk readable length for last segment.
-        """
-
-        off = self._head_off if not si else 0
-        seg_len = len(s) - off
-        if s is self._active and si == last_i:
-            seg_len = self._active_readable_len() - off
-        return off, max(0, seg_len)
-
-    def _seg_search_range(
-            self,
-            start: int,
-            limit: int,
-            m: int,
-            seg_gs: int,
-            seg_ge: int,
-            seg_len: int,
-    ) -> ta.Optional[ta.Tuple[int, int]]:
-        """
-        Compute local search range within a segment.
-
-        Args:
-            start: global start position (user-provided)
-            limit: global limit (end - m, last valid position where match can start)
-            m: pattern length
-            seg_gs: segment global start position
-            seg_ge: segment global end position
-            seg_len: segment readable length
-
-        Returns (local_start, local_end) if segment overlaps search range, else None.
-          - local_start: offset within segment to start searching
-          - local_end: offset within segment to end searching (exclusive)
-        """
-
-        # Check if segment overlaps search range
-        if limit < seg_gs or start >= seg_ge:
-            return None
-
-        # Compute local start within segment
-        ls = max(0, start - seg_gs)
-
-        # Compute local end: can start match anywhere up to limit, need m bytes
-        max_start_in_seg = limit - seg_gs
-        end_search = min(max_start_in_seg + m, seg_len)
-
-        # Validate range
-        if ls >= end_search:
-            return None
+        return memoryview(out)
 
-        return ls, end_search
+    #
 
     def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -2907,57 +3047,42 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        tail: Bytes = b''
-        tail_gstart = 0
+        # Everything below is in absolute offsets: o is that of position 0, and a match must lie within [a, e).
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-        gpos = 0
-
-        last_i = len(self._segs) - 1
+        i = self._seg_index(a)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
 
-        for si, s in enumerate(self._segs):
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
+            # Matches lying wholly within this segment.
+            hi = se if se < e else e
+            if hi - a >= m and (j := s.find(sub, a - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            seg_gs = gpos
-            seg_ge = gpos + seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.find(sub, off + ls, off + end_search)
-                if idx != -1:
-                    return seg_gs + (idx - off)
-
-            if m > 1 and tail:
-                head_need = m - 1
-                # Only read as many bytes as are actually available in this segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, seg_len)
-                if head_avail > 0:
-                    head = s[off:off + head_avail]
-                    comb = tail + head
-                    j = comb.find(sub)
-                    if j != -1 and j < len(tail) < j + m:
-                        cand = tail_gstart + j
-                        if start <= cand <= limit:
-                            return cand
+            if se >= e:
+                return -1
 
+            # Matches starting within this segment's last m - 1 bytes and running on into the following ones - only
+            # those bytes and the next m - 1 need be searched, and only if the former hold the first byte of sub.
             if m > 1:
-                take = m - 1
-                if seg_len >= take:
-                    tail = s[off + seg_len - take:off + seg_len]
-                    tail_gstart = seg_ge - take
-                else:
-                    tail = (tail + s[off:off + seg_len])[-(m - 1):]
-                    tail_gstart = seg_ge - len(tail)
+                t = se - m + 1
+                if t < a:
+                    t = a
+                if s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.find(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-            gpos = seg_ge
-
-        return -1
+            a = s0 = se
+            i += 1
 
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -2968,89 +3093,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        if not self._segs:
-            return -1
-
-        best = -1
-
-        seg_ge = self._len
-        prev_s: ta.Optional[Bytes] = None
-        prev_off = 0
-        prev_seg_len = 0
-
-        last_i = len(self._segs) - 1
-
-        for si in range(len(self._segs) - 1, -1, -1):
-            s = self._segs[si]
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = seg_ge - seg_len
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.rfind(sub, off + ls, off + end_search)
-                if idx != -1:
-                    cand = seg_gs + (idx - off)
-                    if cand > best:
-                        best = cand
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-            if m > 1 and prev_s is not None:
-                tail_need = m - 1
-                if seg_len >= tail_need:
-                    tail = s[off + seg_len - tail_need:off + seg_len]
-                    tail_gstart = seg_ge - tail_need
-
-                else:
-                    tail_parts = [s[off:off + seg_len]]
-                    tail_len = seg_len
-                    for sj in range(si - 1, -1, -1):
-                        if tail_len >= tail_need:
-                            break
-
-                        sj_s = self._segs[sj]
-                        sj_off, sj_len = self._seg_readable_slice(sj, sj_s, last_i)
-                        if sj_len <= 0:
-                            continue
-
-                        take = min(tail_need - tail_len, sj_len)
-                        tail_parts.insert(0, sj_s[sj_off + sj_len - take:sj_off + sj_len])
-                        tail_len += take
-
-                    tail_combined = b''.join(tail_parts)
-                    tail = tail_combined[-(m - 1):] if len(tail_combined) >= m - 1 else tail_combined
-                    tail_gstart = seg_ge - len(tail)
-
-                head_need = m - 1
-                # Only read as many bytes as are actually available in prev segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, prev_seg_len)
-                if head_avail > 0:
-                    head = prev_s[prev_off:prev_off + head_avail]
-                else:
-                    head = b''
-
-                comb = tail + head
-                j = comb.rfind(sub)
-                if j != -1 and j < len(tail) < j + m:
-                    cand = tail_gstart + j
-                    if start <= cand <= limit and cand > best:
-                        best = cand
-
-            if best >= seg_gs:
-                return best
-
-            prev_s = s
-            prev_off = off
-            prev_seg_len = seg_len
-            seg_ge = seg_gs
-
-        return best
+        i = self._seg_index(e - 1)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
+            lo = a if a > s0 else s0
+
+            # Matches running on past this segment start later than any lying wholly within it, so are searched first.
+            if m > 1 and se < e:
+                t = se - m + 1
+                if t < lo:
+                    t = lo
+                if t < se and s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.rfind(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
+
+            hi = se if se < e else e
+            if hi - lo >= m and (j := s.rfind(sub, lo - s0, hi - s0)) >= 0:
+                return s0 + j - o
+
+            if s0 <= a or not i:
+                return -1
+
+            i -= 1
+            s0 = self._seg_start(i)
 
 
 ##
@@ -45,12 +45,14 @@ from omcore.logs.modules import get_module_logger
 from omcore.os.pidfiles.pidfile import Pidfile
 
 from ....journald.messages import JournalctlMessage  # noqa
+from ....journald.messages import JournalctlMessageBuilder
 from ....journald.tailer import JournalctlTailerWorker
 from ....threadworkers import ThreadWorkerGroup
 from ..auth import AwsSigner
 from ..logs import AwsLogMessageBuilder
 from .cursor import JournalctlToAwsCursor
 from .poster import JournalctlToAwsPosterWorker
+from .uploader import AwsLogPostUploader
 
 
 log = get_module_logger(globals())  # noqa
@@ -81,6 +83,9 @@ class JournalctlToAwsDriver(ExitStacked):
 
         aws_dry_run: bool = False
 
+        # The most PutLogEvents requests uploading at once.
+        aws_max_in_flight: int = 4
+
         #
 
         journalctl_cmd: ta.Optional[ta.Sequence[str]] = None
@@ -88,6 +93,9 @@ class JournalctlToAwsDriver(ExitStacked):
         journalctl_after_cursor: ta.Optional[str] = None
         journalctl_since: ta.Optional[str] = None
 
+        # Posts messages as journalctl output them, rather than decoded and re-encoded with sorted keys.
+        journalctl_raw_messages: bool = True
+
     def __init__(self, config: Config) -> None:
         super().__init__()
 
@@ -177,6 +185,8 @@ class JournalctlToAwsDriver(ExitStacked):
             cmd=self._config.journalctl_cmd,
             shell_wrap=is_debugger_attached(),
 
+            builder=JournalctlMessageBuilder(decode_dicts=not self._config.journalctl_raw_messages),
+
             worker_groups=[self._worker_group()],
         )
 
@@ -191,6 +201,7 @@ class JournalctlToAwsDriver(ExitStacked):
 
             ensure_locked=self._ensure_locked,
             dry_run=self._config.aws_dry_run,
+            uploader=AwsLogPostUploader(max_in_flight=self._config.aws_max_in_flight),
 
             worker_groups=[self._worker_group()],
         )
@@ -1,21 +1,16 @@
 # ruff: noqa: UP007 UP045
-"""
-TODO:
- - retries
-"""
 import json
 import queue
 import time
 import typing as ta
-import urllib.request
 
 from omcore.logs.modules import get_module_logger
 
 from ....journald.messages import JournalctlMessage  # noqa
 from ....threadworkers import ThreadWorker
 from ..logs import AwsLogMessageBuilder
-from ..logs import AwsPutLogEventsResponse
 from .cursor import JournalctlToAwsCursor
+from .uploader import AwsLogPostUploader
 
 
 log = get_module_logger(globals())  # noqa
@@ -34,6 +29,7 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
             ensure_locked: ta.Optional[ta.Callable[[], None]] = None,
             dry_run: bool = False,
             queue_timeout_s: float = 1.,
+            uploader: ta.Optional[AwsLogPostUploader] = None,
             **kwargs: ta.Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -44,16 +40,44 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
         self._ensure_locked = ensure_locked
         self._dry_run = dry_run
         self._queue_timeout_s = queue_timeout_s
+
+        if uploader is None:
+            uploader = AwsLogPostUploader()
+        self._uploader = uploader
+
     #
 
+    def _message_text(self, m: JournalctlMessage) -> str:
+        # Undecoded messages are sent as journalctl wrote them rather than re-encoded.
+        if m.dct is None:
+            return m.raw.decode('utf-8', 'replace').rstrip('\n')
+
+        return json.dumps(m.dct, sort_keys=True)
+
+    def _commit_uploaded(self) -> None:
+        cur_cursor: ta.Optional[str] = None
+        for c in self._uploader.poll():
+            if c is not None:
+                cur_cursor = c
+
+        if cur_cursor is not None:
+            self._cursor.set(cur_cursor)
+
     def _run(self) -> None:
         if self._ensure_locked is not None:
             self._ensure_locked()
 
-        last_cursor: ta.Optional[str] = None  # noqa
+        try:
+            self._run_loop()
+        finally:
+            self._uploader.close(wait=False)
+
+    def _run_loop(self) -> None:
         while True:
             self._heartbeat()
 
+            self._commit_uploaded()
+
             try:
                 msgs: ta.Sequence[JournalctlMessage] = self._queue.get(timeout=self._queue_timeout_s)
             except queue.Empty:
@@ -74,23 +98,28 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
             feed_msgs = []
             for m in msgs:
                 feed_msgs.append(AwsLogMessageBuilder.Message(
-                    message=json.dumps(m.dct, sort_keys=True),
+                    message=self._message_text(m),
                     ts_ms=int((m.ts_us / 1000.) if m.ts_us is not None else (time.time() * 1000.)),
                 ))
 
-            for post in self._builder.feed(feed_msgs):
+            posts = self._builder.feed(feed_msgs)
+
+            if self._dry_run:
+                for post in posts:
+                    log.debug('%r', post)
+
+                if cur_cursor is not None:
+                    self._cursor.set(cur_cursor)
+
+                continue
+
+            # Posts may complete out of order, so the batch's cursor rides on its last post and is only committed once
+            # it and all before it have been uploaded.
+            for i, post in enumerate(posts):
                 log.debug('%r', post)
 
-                if not self._dry_run:
-                    with urllib.request.urlopen(urllib.request.Request(  # noqa
-                            post.url,
-                            method='POST',
-                            headers=dict(post.headers),
-                            data=post.data,
-                    )) as resp:
-                        response = AwsPutLogEventsResponse.from_aws(json.loads(resp.read().decode('utf-8')))
-                    log.debug('%r', response)
-
-            if cur_cursor is not None:
-                self._cursor.set(cur_cursor)
-                last_cursor = cur_cursor  # noqa
+                self._uploader.submit(
+                    post,
+                    cur_cursor if i == len(posts) - 1 else None,
+                    heartbeat=self._heartbeat,
+                )
@@ -0,0 +1,166 @@
+import http.server
+import json
+import threading
+import time
+import typing as ta
+
+import pytest
+
+from ...logs import AwsLogMessageBuilder
+from ..uploader import AwsLogPostUploader
+from ..uploader import AwsLogPostUploadError
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    def __init__(self, responses: ta.Callable[[int, dict], tuple[int, dict]]) -> None:
+        super().__init__(('127.0.0.1', 0), _Handler)
+
+        self.responses = responses
+        self.lock = threading.Lock()
+        self.num_requests = 0
+        self.num_connections = 0
+        self.num_open = 0
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.num_connections += 1
+            self.server.num_open += 1
+
+    def finish(self) -> None:
+        super().finish()
+        with self.server.lock:
+            self.server.num_open -= 1
+
+    def do_POST(self) -> None:  # noqa
+        req = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with self.server.lock:
+            n = self.server.num_requests
+            self.server.num_requests += 1
+
+        status, resp = self.server.responses(n, req)
+        body = json.dumps(resp).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: ta.Any) -> None:
+        pass
+
+
+def _serve(responses: ta.Callable[[int, dict], tuple[int, dict]]) -> _Server:
+    server = _Server(responses)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _post(server: _Server, i: int) -> AwsLogMessageBuilder.Post:
+    return AwsLogMessageBuilder.Post(
+        url=f'http://127.0.0.1:{server.server_address[1]}/',
+        headers={'Content-Type': 'application/x-amz-json-1.1'},
+        data=json.dumps({'i': i}).encode(),
+    )
+
+
+def _poll_all(uploader: AwsLogPostUploader, timeout_s: float = 10.) -> list[ta.Any]:
+    out: list[ta.Any] = []
+    deadline = time.monotonic() + timeout_s
+    while len(uploader):
+        assert time.monotonic() < deadline
+        out.extend(uploader.poll())
+        time.sleep(.01)
+    return out
+
+
+def test_ordered_tokens():
+    def responses(n, req):
+        # Earlier posts complete later.
+        time.sleep(.05 * (4 - req['i'] % 4))
+        return 200, {}
+
+    server = _serve(responses)
+    uploader = AwsLogPostUploader(max_in_flight=4)
+    try:
+        for i in range(12):
+            uploader.submit(_post(server, i), f'cursor:{i}')
+
+        assert _poll_all(uploader) == [f'cursor:{i}' for i in range(12)]
+        assert server.num_requests == 12
+        assert server.num_connections <= 4
+
+    finally:
+        uploader.close()
+        server.shutdown()
+
+
+def test_throttling_retried():
+    def responses(n, req):
+        if n < 3:
+            return 400, {'__type': 'com.amazonaws.logs#ThrottlingException', 'message': 'Rate exceeded'}
+        return 200, {}
+
+    server = _serve(responses)
+    uploader = AwsLogPostUploader(max_in_flight=1, backoff_base_s=.01)
+    try:
+        uploader.submit(_post(server, 0), 'cursor:0')
+
+        assert _poll_all(uploader) == ['cursor:0']
+        assert server.num_requests == 4
+
+    finally:
+        uploader.close()
+        server.shutdown()
+
+
+def test_error_raised():
+    def responses(n, req):
+        return 400, {'__type': 'InvalidParameterException', 'message': 'nope'}
+
+    server = _serve(responses)
+    uploader = AwsLogPostUploader(max_in_flight=1, backoff_base_s=.01)
+    try:
+        uploader.submit(_post(server, 0), 'cursor:0')
+
+        with pytest.raises(AwsLogPostUploadError) as e:
+            _poll_all(uploader)
+        assert e.value.status == 400
+        assert server.num_requests == 1
+
+    finally:
+        uploader.close()
+        server.shutdown()
+
+
+def test_close_without_wait_closes_connections():
+    def responses(n, req):
+        if req['i']:
+            time.sleep(.2)
+        return 200, {}
+
+    server = _serve(responses)
+    uploader = AwsLogPostUploader(max_in_flight=2)
+    try:
+        uploader.submit(_post(server, 0), 'cursor:0')
+        uploader.submit(_post(server, 1), 'cursor:1')
+
+        deadline = time.monotonic() + 10.
+        while not uploader.poll():
+            assert time.monotonic() < deadline
+            time.sleep(.01)
+
+        # One connection is idle, the other has an upload in progress.
+        uploader.close(wait=False)
+
+        while server.num_open:
+            assert time.monotonic() < deadline
+            time.sleep(.01)
+
+    finally:
+        server.shutdown()
@@ -0,0 +1,225 @@
+# ruff: noqa: UP006 UP007 UP045
+"""
+TODO:
+ - re-sign posts retried for longer than signatures remain valid
+"""
+import collections
+import concurrent.futures as cf
+import http.client
+import json
+import random
+import threading
+import typing as ta
+import urllib.parse
+
+from omcore.lite.check import check
+from omcore.logs.modules import get_module_logger
+
+from ..logs import AwsLogMessageBuilder
+from ..logs import AwsPutLogEventsResponse
+
+
+log = get_module_logger(globals())  # noqa
+
+
+##
+
+
+class AwsLogPostUploadError(Exception):
+    def __init__(self, status: ta.Optional[int], body: ta.Optional[bytes]) -> None:
+        super().__init__(status, body)
+
+        self.status = status
+        self.body = body
+
+
+class AwsLogPostUploader:
+    """
+    Uploads `AwsLogMessageBuilder.Post`s concurrently, with at most `max_in_flight` at once, each upload thread keeping
+    its own keepalive connection. Throttled and otherwise transiently failed posts are retried with jittered exponential
+    backoff.
+
+    Each post is submitted with an opaque token, and `poll` returns the tokens of completed posts strictly in submission
+    order - so a cursor handed in as a token is only committed once everything before it has landed, however the uploads
+    themselves complete.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_in_flight: int = 4,
+            timeout_s: float = 30.,
+            max_retries: ta.Optional[int] = 8,
+            backoff_base_s: float = .2,
+            backoff_max_s: float = 20.,
+    ) -> None:
+        super().__init__()
+
+        check.arg(max_in_flight > 0, 'max_in_flight must be positive')
+
+        self._max_in_flight = max_in_flight
+        self._timeout_s = timeout_s
+        self._max_retries = max_retries
+        self._backoff_base_s = backoff_base_s
+        self._backoff_max_s = backoff_max_s
+
+        self._executor = cf.ThreadPoolExecutor(max_in_flight, thread_name_prefix=type(self).__name__)
+        self._local = threading.local()
+        self._closed = threading.Event()
+
+        self._conns_lock = threading.Lock()
+        self._all_conns: ta.Set[http.client.HTTPConnection] = set()
+
+        self._pending: ta.Deque[ta.Tuple[cf.Future, ta.Any]] = collections.deque()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<in_flight={len(self._pending)}>'
+
+    def __len__(self) -> int:
+        """The number of posts submitted and not yet returned by `poll`."""
+
+        return len(self._pending)
+
+    #
+
+    _RETRYABLE_ERROR_TYPES: ta.ClassVar[ta.AbstractSet[str]] = frozenset([
+        'ThrottlingException',
+        'ServiceUnavailableException',
+        'LimitExceededException',
+    ])
+
+    def _is_retryable(self, status: int, body: bytes) -> bool:
+        if status == 429 or status >= 500:
+            return True
+
+        try:
+            err_type = json.loads(body.decode('utf-8', 'replace')).get('__type', '')
+        except Exception:  # noqa
+            return False
+
+        # Error types may be namespaced, as `com.amazonaws.logs#ThrottlingException`.
+        return err_type.rpartition('#')[2] in self._RETRYABLE_ERROR_TYPES
+
+    def _get_conn(self, url: str) -> http.client.HTTPConnection:
+        conns: ta.Dict[ta.Tuple[str, str], http.client.HTTPConnection]
+        try:
+            conns = self._local.conns
+        except AttributeError:
+            conns = self._local.conns = {}
+
+        pu = urllib.parse.urlsplit(url)
+        k = (pu.scheme, pu.netloc)
+        if (conn := conns.get(k)) is None:
+            cls = http.client.HTTPSConnection if pu.scheme == 'https' else http.client.HTTPConnection
+            conn = conns[k] = cls(pu.netloc, timeout=self._timeout_s)
+            with self._conns_lock:
+                self._all_conns.add(conn)
+        return conn
+
+    def _drop_conn(self, url: str) -> None:
+        pu = urllib.parse.urlsplit(url)
+        if (conn := getattr(self._local, 'conns', {}).pop((pu.scheme, pu.netloc), None)) is not None:
+            with self._conns_lock:
+                self._all_conns.discard(conn)
+            conn.close()
+
+    def _request(self, post: AwsLogMessageBuilder.Post) -> ta.Tuple[int, bytes]:
+        conn = self._get_conn(post.url)
+        try:
+            conn.request(
+                'POST',
+                urllib.parse.urlsplit(post.url).path or '/',
+                body=post.data,
+                headers=dict(post.headers),
+            )
+            resp = conn.getresponse()
+            body = resp.read()
+
+        except BaseException:
+            self._drop_conn(post.url)
+            raise
+
+        if resp.will_close or self._closed.is_set():
+            self._drop_conn(post.url)
+
+        return resp.status, body
+
+    def _upload(self, post: AwsLogMessageBuilder.Post) -> AwsPutLogEventsResponse:
+        attempt = 0
+        while True:
+            status: ta.Optional[int] = None
+            body: ta.Optional[bytes] = None
+            try:
+                status, body = self._request(post)
+
+            except (OSError, http.client.HTTPException):
+                # Includes keepalive connections closed by the server in the meantime.
+                log.exception('Error uploading post: attempt %d', attempt)
+
+            else:
+                if 200 <= status < 300:
+                    return AwsPutLogEventsResponse.from_aws(json.loads(body.decode('utf-8') or '{}'))
+
+                if not self._is_retryable(status, body):
+                    raise AwsLogPostUploadError(status, body)
+
+                log.warning('Retryable upload failure: attempt %d: %d %r', attempt, status, body)
+
+            if (mr := self._max_retries) is not None and attempt >= mr:
+                raise AwsLogPostUploadError(status, body)
+
+            delay = min(self._backoff_max_s, self._backoff_base_s * (2 ** attempt)) * random.uniform(.5, 1.)
+            if self._closed.wait(delay):
+                raise AwsLogPostUploadError(status, body)
+
+            attempt += 1
+
+    #
+
+    def submit(
+            self,
+            post: AwsLogMessageBuilder.Post,
+            token: ta.Any = None,
+            *,
+            heartbeat: ta.Optional[ta.Callable[[], None]] = None,
+            heartbeat_interval_s: float = 1.,
+    ) -> None:
+        """Blocks while `max_in_flight` posts are uploading, calling `heartbeat` periodically."""
+
+        check.state(not self._closed.is_set())
+
+        while len(fs := [f for f, _ in self._pending if not f.done()]) >= self._max_in_flight:
+            if heartbeat is not None:
+                heartbeat()
+            cf.wait(fs, timeout=heartbeat_interval_s, return_when=cf.FIRST_COMPLETED)
+
+        self._pending.append((self._executor.submit(self._upload, post), token))
+
+    def poll(self) -> ta.List[ta.Any]:
+        """
+        Returns the tokens of the posts completed since the last call, up to the first not yet completed. Raises the
+        error of the first which failed.
+        """
+
+        out: ta.List[ta.Any] = []
+        while self._pending and (f := self._pending[0][0]).done():
+            resp = f.result()
+            log.debug('%r', resp)
+
+            out.append(self._pending.popleft()[1])
+
+        return out
+
+    def close(self, *, wait: bool = True) -> None:
+        """
+        Abandons retries, closes keepalive connections, and waits for uploads in progress if `wait` is set. Without
+        `wait`, uploads in progress close their connections themselves as they finish.
+        """
+
+        self._closed.set()
+        self._executor.shutdown(wait=wait)
+
+        with self._conns_lock:
+            conns, self._all_conns = self._all_conns, set()
+        for conn in conns:
+            conn.close()
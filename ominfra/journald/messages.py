@@ -2,11 +2,11 @@
 # @om-lite
 import dataclasses as dc
 import json
+import re
 import typing as ta
 
 from omcore.io.streambufs.scanning import ScanningByteStreamBuffer
 from omcore.io.streambufs.segmented import SegmentedByteStreamBuffer
-from omcore.io.streambufs.utils import ByteStreamBuffers
 from omcore.lite.bytes import Bytes
 from omcore.logs.modules import get_module_logger
 
@@ -20,18 +20,43 @@ log = get_module_logger(globals())  # noqa
 @dc.dataclass(frozen=True)
 class JournalctlMessage:
     raw: Bytes
-    dct: ta.Optional[ta.Mapping[str, ta.Any]] = None
+    dct: ta.Optional[ta.Mapping[str, ta.Any]] = None  # None if not decoded, or undecodable
     cursor: ta.Optional[str] = None
     ts_us: ta.Optional[int] = None  # microseconds UTC
 
 
 class JournalctlMessageBuilder:
-    def __init__(self) -> None:
+    """
+    Splits journalctl's json output into messages, a read chunk at a time.
+
+    If `decode_dicts` is false the lines are not decoded, leaving `dct` None - their cursors and timestamps are instead
+    picked out of the raw bytes, falling back to decoding the line when that is not possible, as for escaped values.
+    Journalctl's output is flat, and quotes within values are always escaped, so a quoted field name followed by a
+    colon can only be a key.
+    """
+
+    def __init__(
+            self,
+            *,
+            decode_dicts: bool = True,
+    ) -> None:
         super().__init__()
 
+        self._decode_dicts = decode_dicts
+
         self._raw_buf = SegmentedByteStreamBuffer(chunk_size=0x4000)
         self._buf = ScanningByteStreamBuffer(self._raw_buf)
 
+        self._cursor_field_b = self._cursor_field.encode()
+        self._timestamp_fields_b = [f.encode() for f in self._timestamp_fields]
+
+        # Matches only unescaped string values - anything else is left to json.
+        self._scan_pat = re.compile(
+            rb'"(' +
+            b'|'.join(re.escape(f) for f in [self._cursor_field_b, *self._timestamp_fields_b]) +
+            rb')"\s*:\s*"([^"\\]*)"',
+        )
+
     _cursor_field = '__CURSOR'
 
     _timestamp_fields: ta.Sequence[str] = [
@@ -39,22 +64,28 @@ class JournalctlMessageBuilder:
         '__REALTIME_TIMESTAMP',
     ]
 
+    def _parse_timestamp(self, tsv: ta.Any) -> ta.Optional[int]:
+        if isinstance(tsv, str):
+            try:
+                return int(tsv)
+            except ValueError:
+                try:
+                    return int(float(tsv))
+                except ValueError:
+                    log.exception('Failed to parse timestamp: %r', tsv)
+
+        elif isinstance(tsv, (int, float)):
+            return int(tsv)
+
+        return None
+
     def _get_message_timestamp(self, dct: ta.Mapping[str, ta.Any]) -> ta.Optional[int]:
         for fld in self._timestamp_fields:
             if (tsv := dct.get(fld)) is None:
                 continue
 
-            if isinstance(tsv, str):
-                try:
-                    return int(tsv)
-                except ValueError:
-                    try:
-                        return int(float(tsv))
-                    except ValueError:
-                        log.exception('Failed to parse timestamp: %r', tsv)
-
-            elif isinstance(tsv, (int, float)):
-                return int(tsv)
+            if (ts := self._parse_timestamp(tsv)) is not None:
+                return ts
 
         log.error('Invalid timestamp: %r', dct)
         return None
@@ -80,9 +111,45 @@ class JournalctlMessageBuilder:
             ts_us=ts,
         )
 
+    def _scan_message(self, raw: Bytes) -> JournalctlMessage:
+        found = dict(self._scan_pat.findall(raw))
+
+        cursor: ta.Optional[str] = None
+        if (cv := found.get(self._cursor_field_b)) is not None:
+            cursor = cv.decode('utf-8', 'replace')
+        elif b'"' + self._cursor_field_b + b'"' in raw:
+            return dc.replace(self._make_message(raw), dct=None)
+
+        ts: ta.Optional[int] = None
+        for fld in self._timestamp_fields_b:
+            if (tsv := found.get(fld)) is None:
+                continue
+            if (ts := self._parse_timestamp(tsv.decode('utf-8', 'replace'))) is not None:
+                break
+        else:
+            return dc.replace(self._make_message(raw), dct=None)
+
+        return JournalctlMessage(
+            raw=raw,
+            cursor=cursor,
+            ts_us=ts,
+        )
+
     def feed(self, data: Bytes) -> ta.Sequence[JournalctlMessage]:
-        ret: ta.List[JournalctlMessage] = []
-        self._buf.write(data)
-        for line in ByteStreamBuffers.split(self._buf, b'\n', final=not data):
-            ret.append(self._make_message(line.tobytes()))
-        return ret
+        buf = self._buf
+        buf.write(data)
+
+        # Whole lines are taken out of the buffer at once and only then split, along with what remains of a final read.
+        if not data:
+            n = len(buf)
+        else:
+            n = buf.rfind(b'\n') + 1
+        if not n:
+            return []
+
+        lines = buf.split_to(n).tobytes().splitlines(keepends=True)
+
+        if self._decode_dicts:
+            return [self._make_message(line) for line in lines]
+        else:
+            return [self._scan_message(line) for line in lines]
@@ -440,6 +440,8 @@ class JournalctlTailerWorker(ThreadWorker):
             read_size: int = 0x4000,
             sleep_s: float = 1.,
 
+            builder: ta.Optional[JournalctlMessageBuilder] = None,
+
             **kwargs: ta.Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -455,7 +457,9 @@ class JournalctlTailerWorker(ThreadWorker):
         self._read_size = read_size
         self._sleep_s = sleep_s
 
-        self._builder = JournalctlMessageBuilder()
+        if builder is None:
+            builder = JournalctlMessageBuilder()
+        self._builder = builder
 
         self._proc: ta.Optional[subprocess.Popen] = None
 
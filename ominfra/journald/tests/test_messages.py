@@ -0,0 +1,57 @@
+import json
+
+from ..messages import JournalctlMessageBuilder
+
+
+def _line(i: int, **kw: str) -> bytes:
+    return json.dumps({
+        '__CURSOR': f's=abc;i={i:x}',
+        '__REALTIME_TIMESTAMP': str(1_700_000_000_000_000 + i),
+        'MESSAGE': f'message {i}',
+        **kw,
+    }).encode() + b'\n'
+
+
+def test_chunks():
+    data = b''.join(_line(i) for i in range(10))
+
+    for decode_dicts in [True, False]:
+        b = JournalctlMessageBuilder(decode_dicts=decode_dicts)
+        msgs = []
+        for i in range(0, len(data), 37):
+            msgs.extend(b.feed(data[i:i + 37]))
+        msgs.extend(b.feed(b''))
+
+        assert [m.raw for m in msgs] == [_line(i) for i in range(10)]
+        assert [m.cursor for m in msgs] == [f's=abc;i={i:x}' for i in range(10)]
+        assert [m.ts_us for m in msgs] == [1_700_000_000_000_000 + i for i in range(10)]
+        assert all((m.dct is not None) == decode_dicts for m in msgs)
+
+
+def test_scan():
+    b = JournalctlMessageBuilder(decode_dicts=False)
+
+    [m] = b.feed(_line(1, _SOURCE_REALTIME_TIMESTAMP='1234', MESSAGE='"__CURSOR": "x"'))
+    assert m.cursor == 's=abc;i=1'
+    assert m.ts_us == 1234
+    assert m.dct is None
+
+    [m] = b.feed(_line(2, __CURSOR='a"b'))
+    assert m.cursor == 'a"b'
+    assert m.dct is None
+
+    [m] = b.feed(b'{"__CURSOR": "c", "MESSAGE": "no timestamp"}\n')
+    assert m.cursor == 'c'
+    assert m.ts_us is None
+
+    [m] = b.feed(b'not json\n')
+    assert m.cursor is None
+    assert m.ts_us is None
+
+
+def test_final_partial_line():
+    b = JournalctlMessageBuilder(decode_dicts=False)
+
+    assert not b.feed(_line(1)[:-1])
+    [m] = b.feed(b'')
+    assert m.cursor == 's=abc;i=1'
@@ -9,8 +9,10 @@
 import abc
 import argparse
 import base64
+import bisect
 import collections
 import collections.abc
+import concurrent.futures as cf
 import configparser
 import contextlib
 import dataclasses as dc
@@ -23,6 +25,7 @@ import fractions
 import functools
 import hashlib
 import hmac
+import http.client
 import inspect
 import io
 import json
@@ -30,6 +33,7 @@ import logging
 import os
 import os.path
 import queue
+import random
 import re
 import shlex
 import signal
@@ -42,7 +46,6 @@ import traceback
 import types
 import typing as ta
 import urllib.parse
-import urllib.request
 import uuid
 import weakref
 
@@ -61,6 +64,7 @@ def __om_amalg__():  # noqa
             dict(path='../../../../omcore/formats/ini/sections.py', sha1='66a0b99ffe63766420ec18d25341699dabcfa55e'),
             dict(path='../../../../omcore/formats/toml/parser.py', sha1='e2562aaa4d8bf0a3bee0e96e38908bc2f060b41a'),
             dict(path='../../../../omcore/formats/toml/writer.py', sha1='0091ad73e098694861c006960c6b7b7bf07a7b69'),
+            dict(path='../../../../omcore/io/streambufs/_scanning_py.py', sha1='50bc68f17ad51947ad68b986d449307ab05b8509'),  # noqa
             dict(path='../../../../omcore/io/streambufs/errors.py', sha1='6b04cc2e4ba5461692128938a2bd5c261486746b'),
             dict(path='../../../../omcore/lite/abstract.py', sha1='a2fc3f3697fa8de5247761e9d554e70176f37aac'),
             dict(path='../../../../omcore/lite/asyncs.py', sha1='6bd4b8ecc310ac1df19bafaf6eb85a1a284f65d5'),
@@ -69,7 +73,6 @@ def __om_amalg__():  # noqa
             dict(path='../../../../omcore/lite/check.py', sha1='62b9ccea94c4f7bcef97e7adae8674b8cb11d4af'),
             dict(path='../../../../omcore/lite/contextmanagers.py', sha1='b3275ca829d21eb598092c1448bedd70b72dfd04'),
             dict(path='../../../../omcore/lite/io.py', sha1='a60d94f0bdbb2b1541d363c301314682d1686240'),
-            dict(path='../../../../omcore/lite/namespaces.py', sha1='27b12b6592403c010fb8b2a0af7c24238490d3a1'),
             dict(path='../../../../omcore/lite/objects.py', sha1='9566bbf3530fd71fcc56321485216b592fae21e9'),
             dict(path='../../../../omcore/lite/reflect.py', sha1='fab4ef6f45f278ce7bffcd811cd170b40db107a8'),
             dict(path='../../../../omcore/lite/strings.py', sha1='b31b8e4b0e4fec4562ea3fa602e4ef2475e5fe7c'),
@@ -90,27 +93,27 @@ def __om_amalg__():  # noqa
             dict(path='../dataclasses.py', sha1='fbfac5bf101339124567fda0baf23c233c576aaf'),
             dict(path='../../../../omcore/configs/formats.py', sha1='9263da888199b408e902490244e9d5caddc69821'),
             dict(path='../../../../omcore/io/streambufs/base.py', sha1='0f0cea0fe05f9d7b4669a7b3871bc78e12af98f6'),
-            dict(path='../../../../omcore/io/streambufs/utils.py', sha1='62d7fce79bae738c199627668bdee8bb389efa1e'),
             dict(path='../../../../omcore/logs/contexts.py', sha1='529adb527492309bf8cde342271ac6ea2ebbf8a1'),
             dict(path='../../../../omcore/logs/std/json.py', sha1='d1ff35ac871de63efec2b64ae5c63e63d295a8d5'),
             dict(path='../../../../omcore/subprocesses/wrap.py', sha1='12d94dc2357951cd0fed1c50a46817d30d628927'),
             dict(path='../logs.py', sha1='d6773b6e7b0b84e14d49dbe8c0ebc29a3ddab4a6'),
             dict(path='../../../../omcore/io/streambufs/direct.py', sha1='5a629d79aa7f618dce40e11c2609bc0dcd008599'),
-            dict(path='../../../../omcore/io/streambufs/scanning.py', sha1='36411208b4e6515528f0310c7052b3faf2572b24'),
+            dict(path='../../../../omcore/io/streambufs/scanning.py', sha1='9cee14466174532dfde8f5c96d8f4d487fdcfa97'),
             dict(path='../../../../omcore/lite/configs.py', sha1='c8602e0e197ef1133e7e8e248935ac745bfd46cb'),
             dict(path='../../../../omcore/logs/base.py', sha1='4195705c64f3ec1c4263c2c76c63351d9dacdd5c'),
             dict(path='../../../../omcore/logs/std/records.py', sha1='fb1e2d887248cc24b0463156836d9965a06c8ab6'),
             dict(path='../../../../omcore/logs/std/standard.py', sha1='223e3cba0f2854c5093fb60d6cef2f27b80c193c'),
-            dict(path='../../../../omcore/io/streambufs/segmented.py', sha1='ad3c91e91d7b91396c51549fc7578419b1c3d336'),  # noqa
+            dict(path='../../../../omcore/io/streambufs/segmented.py', sha1='5dd5ba71c2d8716eea38210099c569a6e2e03b65'),  # noqa
             dict(path='../../../../omcore/logs/asyncs.py', sha1='6b444494a0512f7b7ea2c93be5c4a9868deb7251'),
             dict(path='../../../../omcore/logs/std/loggers.py', sha1='144a96b3b190a5641f3b7cc2656d6ffa4e45b5a9'),
             dict(path='../../../../omcore/logs/modules.py', sha1='b51c2d4396854b515d29cee17f906d5cc47eb7f2'),
             dict(path='cursor.py', sha1='3f128d8774b4b1da27b9b4bb12f393ab106fc8dd'),
-            dict(path='../../../journald/messages.py', sha1='57450f800041551bf38a389de9b10aa90b28690f'),
+            dict(path='uploader.py', sha1='f86a3542fdec125272dcc94a88e83d6a4e7a605f'),
+            dict(path='../../../journald/messages.py', sha1='374652e7ebf6eb5ad27f42e0054964ec14abe4a3'),
             dict(path='../../../threadworkers.py', sha1='3ecad2a49598539a113d0ef2a97b632871ecb400'),
-            dict(path='poster.py', sha1='c08f413405f6e410bd060536b4a55d060bfa5080'),
-            dict(path='../../../journald/tailer.py', sha1='ece26cf4d19b819a87d1f3393f92c2f2da439dc2'),
-            dict(path='driver.py', sha1='456aec1a6b219acfc720b74800e27cf00999e294'),
+            dict(path='poster.py', sha1='44cb4da55f02e23bad2cee8df15f97d949926b95'),
+            dict(path='../../../journald/tailer.py', sha1='247d16bb0fe4921e121efe3dda156121f9cf4fe1'),
+            dict(path='driver.py', sha1='bbb4de0b2aac59d98533d44a80c444a01ed0ef27'),
             dict(path='main.py', sha1='a32f5780a5a399084020622fc444d8602c605293'),
         ],
     )
@@ -169,9 +172,6 @@ LoggingContextInfo = ta.Any  # ta.TypeAlias
 ConfigDataT = ta.TypeVar('ConfigDataT', bound='ConfigData')
 ObjConfigDataT = ta.TypeVar('ObjConfigDataT', bound='ObjConfigData')
 
-# ../../../../omcore/io/streambufs/utils.py
-CanByteStreamBuffer = ta.Union[BytesLike, 'ByteStreamBufferLike']  # ta.TypeAlias
-
 # ../../../../omcore/logs/contexts.py
 LoggingContextInfoT = ta.TypeVar('LoggingContextInfoT', bound=LoggingContextInfo)
 
@@ -1279,6 +1279,141 @@ class TomlWriter:
         return out.getvalue()
 
 
+########################################
+# ../../../../../omcore/io/streambufs/_scanning_py.py
+"""
+Pure-Python reference implementations of the functions of the optional `_scanning` extension, which must behave
+identically. `scanning` exports the extension's versions when it is available, and these otherwise.
+"""
+
+
+##
+
+
+_FIND_LONGEST_PATS: ta.Dict[ta.Tuple[bytes, ...], ta.Tuple[ta.Any, ta.Any, int]] = {}
+
+
+def _find_longest_pats(subs: ta.Tuple[bytes, ...]) -> ta.Tuple[ta.Any, ta.Any, int]:
+    try:
+        return _FIND_LONGEST_PATS[subs]
+    except KeyError:
+        pass
+
+    if not subs:
+        raise ValueError('no subs')
+    if any(not s for s in subs):
+        raise ValueError('empty sub')
+
+    # Alternation tries its branches in order, so at the leftmost position matched the first sub to match wins. One
+    # group per sub lets `lastindex` name it.
+    pat = re.compile(b'|'.join(b'(' + re.escape(s) + b')' for s in subs))
+    first_pat = re.compile(b'[' + b''.join(re.escape(s[:1]) for s in subs) + b']')
+
+    if len(_FIND_LONGEST_PATS) >= 256:
+        _FIND_LONGEST_PATS.clear()
+    ret = _FIND_LONGEST_PATS[subs] = (pat, first_pat, max(len(s) for s in subs) - 1)
+    return ret
+
+
+def find_longest(segs: ta.Sequence[ta.Any], subs: ta.Sequence[bytes], start: int = 0) -> ta.Tuple[int, int]:
+    """
+    Searches the stream formed by concatenating the bytes-like `segs` for the earliest occurrence of any of `subs` at or
+    after `start`, returning its position and the index of the first of `subs` which occurs there - so ordering `subs`
+    longest first picks the longest match. Returns (-1, -1) if none occurs.
+    """
+
+    pat, first_pat, ov = _find_longest_pats(tuple(subs))
+
+    if start < 0:
+        start = 0
+
+    n = len(segs)
+    i = 0
+    base = 0
+    while i < n:
+        sl = len(segs[i])
+        if base + sl > start:
+            break
+        base += sl
+        i += 1
+
+    lo = start - base
+    while i < n:
+        s = segs[i]
+        sl = len(s)
+
+        # Matches starting within the last `ov` bytes may be cut short - or missed - by the end of the segment, so only
+        # earlier ones are final.
+        tail = sl - ov
+        m = pat.search(s, lo)
+        if m is not None and m.start() < tail:
+            return base + m.start(), m.lastindex - 1
+
+        wlo = lo if lo > tail else tail
+        if ov and i + 1 < n and (m is not None or first_pat.search(s, wlo) is not None):
+            parts = [s[wlo:]]
+            need = ov
+            j = i + 1
+            while need and j < n:
+                p = segs[j][:need]
+                parts.append(p)
+                need -= len(p)
+                j += 1
+
+            # Matches starting after the boundary would be cut short by the end of the window - they're found from the
+            # next segment instead.
+            wm = pat.search(b''.join(parts))
+            if wm is not None and wm.start() < sl - wlo:
+                return base + wlo + wm.start(), wm.lastindex - 1
+
+        elif m is not None:
+            return base + m.start(), m.lastindex - 1
+
+        base += sl
+        lo = 0
+        i += 1
+
+    return -1, -1
+
+
+def scan_length_fields(
+        buf: ta.Any,
+        offset: int,
+        length: int,
+        byteorder: str,
+        adjustment: int,
+        limit: ta.Optional[int],
+) -> ta.List[int]:
+    """
+    Returns the total lengths of the consecutive length-field-prefixed frames laid out wholly within the bytes-like
+    `buf` from its start, where each frame's total length is its unsigned length field's value plus `adjustment` plus
+    `offset + length`. Stops at the first frame which is incomplete, whose total length is shorter than its header, or
+    which is longer than `limit`.
+    """
+
+    if offset < 0:
+        raise ValueError(offset)
+    if length not in (1, 2, 4, 8):
+        raise ValueError(length)
+    if byteorder not in ('big', 'little'):
+        raise ValueError(byteorder)
+
+    mv = memoryview(buf)
+    n = len(mv)
+    end_off = offset + length
+
+    out: ta.List[int] = []
+    p = 0
+    while n - p >= end_off:
+        t = int.from_bytes(mv[p + offset:p + end_off], byteorder) + adjustment + end_off  # type: ignore[arg-type]
+        if t < end_off or t > n - p or (limit is not None and t > limit):
+            break
+        out.append(t)
+        p += t
+
+    return out
+
+
 ########################################
 # ../../../../../omcore/io/streambufs/errors.py
 
@@ -2600,21 +2735,6 @@ class FnWriter:
         return self._fn(*args, **kwargs)
 
 
-########################################
-# ../../../../../omcore/lite/namespaces.py
-
-
-class NamespaceClass:
-    def __new__(cls, *args, **kwargs):  # noqa
-        raise TypeError
-
-    def __init_subclass__(cls, **kwargs):  # noqa
-        super().__init_subclass__(**kwargs)
-
-        if any(issubclass(b, NamespaceClass) and b is not NamespaceClass for b in cls.__bases__):
-            raise TypeError
-
-
 ########################################
 # ../../../../../omcore/lite/objects.py
 
@@ -5919,166 +6039,6 @@ class BaseByteStreamBufferLike(ByteStreamBufferLike, Abstract):
         return (s, s) if e < s else (s, e)
 
 
-########################################
-# ../../../../../omcore/io/streambufs/utils.py
-
-
-##
-
-
-class ByteStreamBuffers(NamespaceClass):
-    _CAN_CONVERT_TYPES: ta.ClassVar[ta.Tuple[type, ...]] = (
-        *BYTES_LIKE_TYPES,
-        ByteStreamBufferLike,
-    )
-
-    #
-
-    @classmethod
-    def can_bytes(cls, obj: ta.Any, /) -> bool:
-        return type(obj) in (cts := cls._CAN_CONVERT_TYPES) or isinstance(obj, cts)
-
-    #
-
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[bytes]:
-        ...
-
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[True],
-            or_none: ta.Literal[False] = False,
-    ) -> bytes:
-        ...
-
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[True],
-    ) -> ta.Optional[Bytes]:
-        ...
-
-    @classmethod
-    @ta.overload
-    def to_bytes(
-            cls,
-            obj: ta.Any,
-            /, *,
-            strict: ta.Literal[False] = False,
-            or_none: ta.Literal[False] = False,
-    ) -> Bytes:
-        ...
-
-    @classmethod
-    def to_bytes(
-            cls,
-            obj,
-            /, *,
-            strict=False,
-            or_none=False,
-    ):
-        """
-        Returns a non-shared version of the given object. If a possibly shared memoryview is acceptable, use
-        `iter_segments`.
-        """
-
-        if strict:
-            if (ot := type(obj)) is bytes or isinstance(obj, bytes):
-                return obj
-
-            elif ot is bytearray:
-                return bytes(obj)
-
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes_strict(obj)
-
-        else:
-            if (ot := type(obj)) is bytes or ot is bytearray or isinstance(obj, BYTES_TYPES):
-                return obj
-
-            elif isinstance(obj, memoryview):
-                return memoryview_to_bytes(obj)
-
-        if isinstance(obj, ByteStreamBufferView):
-            return obj.tobytes()
-
-        elif isinstance(obj, ByteStreamBufferLike):
-            return b''.join(bytes(mv) for mv in obj.segments())
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[True], /) -> ta.Optional[int]: ...
-
-    @classmethod
-    @ta.overload
-    def bytes_len(cls, obj: ta.Any, or_none: ta.Literal[False] = False, /) -> int: ...
-
-    @classmethod
-    def bytes_len(cls, obj, or_none=False):
-        if cls.can_bytes(obj):
-            return len(obj)
-
-        elif or_none:
-            return None
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def iter_segments(obj: ta.Any, /) -> ta.Iterator[memoryview]:
-        if (ot := type(obj)) is memoryview:
-            yield obj
-        elif ot is bytes or ot is bytearray:
-            yield memoryview(obj)
-
-        elif isinstance(obj, memoryview):
-            yield obj
-        elif isinstance(obj, (bytes, bytearray)):
-            yield memoryview(obj)
-
-        elif isinstance(obj, ByteStreamBufferLike):
-            yield from obj.segments()
-
-        else:
-            raise TypeError(obj)
-
-    #
-
-    @staticmethod
-    def split(buf: ByteStreamBuffer, sep: bytes, /, *, final: bool = False) -> ta.List[ByteStreamBufferView]:
-        out: ta.List[ByteStreamBufferView] = []
-        while (i := buf.find(sep)) >= 0:
-            out.append(buf.split_to(i + 1))
-        if final and len(buf):
-            out.append(buf.split_to(len(buf)))
-        return out
-
-
 ########################################
 # ../../../../../omcore/logs/contexts.py
 
@@ -6667,6 +6627,20 @@ def empty_byte_stream_buffer_view() -> ByteStreamBufferView:
 # ../../../../../omcore/io/streambufs/scanning.py
 
 
+_scanning: ta.Any
+try:
+    from . import _scanning  # type: ignore
+except ImportError:
+    _scanning = None
+
+
+if _scanning is not None:
+    globals().update({a: getattr(_scanning, a) for a in [
+        'find_longest',
+        'scan_length_fields',
+    ]})
+
+
 ##
 
 
@@ -6691,7 +6665,7 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
         super().__init__()
 
         self._buf = buf
-        self._scan_from_by_sub: dict[bytes, int] = {}
+        self._scan_from_by_sub: ta.Dict[ta.Union[bytes, ta.Tuple[bytes, ...]], int] = {}
 
     @property
     def max_size(self) -> ta.Optional[int]:
@@ -6744,6 +6718,28 @@ class ScanningByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffer
 
         return i
 
+    def find_longest(self, subs: ta.Sequence[bytes]) -> ta.Tuple[int, int]:
+        """
+        Returns the position of the earliest occurrence of any of `subs`, and the index of the first of `subs` which
+        occurs there - so ordering `subs` longest first picks the longest match - or (-1, -1). Searches all of the
+        buffer's segments in a single pass, natively when the `_scanning` extension is available, and caches negative
+        progress per `subs` just as `find` does per `sub`.
+        """
+
+        key = tuple(subs)
+        scan_from = self._scan_from_by_sub.get(key, 0)
+
+        # Allow overlap so a match spanning old/new boundary is discoverable.
+        eff_start = scan_from - (max(map(len, key), default=1) - 1)
+        if eff_start < 0:
+            eff_start = 0
+
+        ret = find_longest(self._buf.segments(), key, eff_start)
+        if ret[0] < 0:
+            self._scan_from_by_sub[key] = len(self._buf)
+
+        return ret
+
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         # rfind isn't the typical trickle hot-path; delegate.
         return self._buf.rfind(sub, start, end)
@@ -7940,9 +7936,13 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     """
     A segmented, consumption-oriented bytes buffer.
 
-    Internally stores a list of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
+    Internally stores a deque of `bytes`/`bytearray` segments plus a head offset. Exposes readable data as `memoryview`
     segments without copying.
 
+    Alongside the segments it keeps a parallel deque of their cumulative end offsets, in an 'absolute' coordinate space
+    which only ever shifts by whole prepends - so consuming from the head is a `popleft` of each, and locating the
+    segment holding any position is a bisect rather than a walk.
+
     Optional "chunked writes":
       - If chunk_size > 0, small writes are accumulated into a lazily-allocated active bytearray "chunk" up to
         chunk_size.
@@ -7974,7 +7974,11 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     ) -> None:
         super().__init__()
 
-        self._segs: ta.List[Bytes] = []
+        self._segs: collections.deque[Bytes] = collections.deque()
+
+        # Absolute offset of the end of each segment's readable bytes. The active chunk, always last when present, ends
+        # at its used bytes.
+        self._ends: collections.deque[int] = collections.deque()
 
         self._max_size = None if max_size is None else int(max_size)
 
@@ -7993,6 +7997,9 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def max_size(self) -> ta.Optional[int]:
         return self._max_size
 
+    # Absolute offset of the first segment's first byte - or, with no segments, of the next byte to be written.
+    _base = 0
+
     _head_off = 0
     _len = 0
 
@@ -8005,34 +8012,61 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def __len__(self) -> int:
         return self._len
 
-    def _active_readable_len(self) -> int:
-        if self._active is None:
-            return 0
-        if self._reserved_in_active and self._reserved is not None:
-            tail = self._reserved_len
-        else:
-            tail = 0
-        rl = self._active_used - tail
-        return rl if rl > 0 else 0
+    def _append_seg(self, s: Bytes, n: int) -> None:
+        self._ends.append((self._ends[-1] if self._ends else self._base) + n)
+        self._segs.append(s)
+
+    def _popleft_seg(self) -> Bytes:
+        s = self._segs.popleft()
+        self._base = self._ends.popleft()
+        self._head_off = 0
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
+        return s
+
+    def _seg_start(self, i: int) -> int:
+        """Absolute offset of segment `i`'s first byte, whether or not it is still readable."""
+
+        return self._ends[i - 1] if i else self._base
+
+    def _seg_index(self, a: int) -> int:
+        """Index of the segment holding absolute offset `a`, which must be readable."""
+
+        return bisect.bisect_right(self._ends, a)
+
+    def _gather(self, i: int, a: int, n: int, stop: int) -> Bytes:
+        """Copies up to `n` bytes from absolute offset `a` - in segment `i` - onward, stopping before `stop`."""
+
+        if (e := a + n) > stop:
+            e = stop
+        if a >= e:
+            return b''
+
+        segs = self._segs
+        ends = self._ends
+        s0 = self._seg_start(i)
+        if e <= ends[i]:
+            return segs[i][a - s0:e - s0]
+
+        parts: ta.List[Bytes] = []
+        while a < e:
+            se = ends[i]
+            parts.append(segs[i][a - s0:(se if se < e else e) - s0])
+            a = s0 = se
+            i += 1
+        return b''.join(parts)
+
+    #
 
     def peek(self) -> memoryview:
         if not self._segs:
             return memoryview(b'')
 
-        s0 = self._segs[0]
-        mv = memoryview(s0)
-        if self._head_off:
-            mv = mv[self._head_off:]
-
-        if s0 is self._active:
-            # Active is only meaningful by _active_used, not len(bytearray).
-            rl = self._active_readable_len()
-            if self._head_off >= rl:
-                return memoryview(b'')
-            mv = memoryview(self._active)[self._head_off:rl]
-            return mv
-
-        return mv
+        off = self._head_off
+        if off >= (e := self._ends[0] - self._base):
+            return memoryview(b'')
+        return memoryview(self._segs[0])[off:e]
 
     def segments(self) -> ta.Sequence[memoryview]:
         if not self._segs:
@@ -8040,28 +8074,14 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         out: ta.List[memoryview] = []
 
-        last_i = len(self._segs) - 1
-        for i, s in enumerate(self._segs):
-            if s is self._active and i == last_i:
-                # Active chunk: create fresh view with readable length.
-                rl = self._active_readable_len()
-                if not i:
-                    # Active is also first segment; apply head_off.
-                    if self._head_off >= rl:
-                        continue
-                    mv = memoryview(self._active)[self._head_off:rl]
-                else:
-                    if rl <= 0:
-                        continue
-                    mv = memoryview(self._active)[:rl]
-            else:
-                # Non-active segment.
-                mv = memoryview(s)
-                if not i and self._head_off:
-                    mv = mv[self._head_off:]
-
-            if len(mv):
-                out.append(mv)
+        s0 = self._base
+        off = self._head_off
+        for s, e in zip(self._segs, self._ends):
+            rl = e - s0
+            if off < rl:
+                out.append(memoryview(s)[off:rl] if off or rl != len(s) else memoryview(s))
+            s0 = e
+            off = 0
 
         return out
 
@@ -8074,7 +8094,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         a = self._active
         if a is None:
             a = bytearray(self._chunk_size)  # fixed capacity
-            self._segs.append(a)
+            self._append_seg(a, 0)
             self._active = a
             self._active_used = 0
 
@@ -8087,9 +8107,15 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._reserved_in_active:
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
-        if (used := self._active_used) <= 0:
+        if (used := self._active_used) <= 0 or (len(self._segs) == 1 and self._segs[0] is a and self._head_off >= used):
+            # Nothing readable is left in it - including when everything written to it has since been consumed, in
+            # which case it is simply dropped rather than compacted.
             if self._segs and self._segs[-1] is a:
                 self._segs.pop()
+                e = self._ends.pop()
+                if not self._segs:
+                    self._base = e
+                    self._head_off = 0
             self._active = None
             self._active_used = 0
             return
@@ -8116,19 +8142,19 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
     def write(self, data: BytesLike, /) -> None:
         if not data:
             return
-        if isinstance(data, memoryview):
-            data = memoryview_to_bytes(data)  # noqa
-        # elif isinstance(data, bytearray):
-        #     pass
-        # else:
-        #     pass
 
+        # Memoryviews are only materialized when kept as their own segment - those small enough to be copied into the
+        # active chunk are copied straight from the view.
         dl = len(data)
 
         if self._max_size is not None and self._len + dl > self._max_size:
             raise BufferTooLargeByteStreamBufferError('buffer exceeded max_size')
 
         if self._chunk_size <= 0:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
+            ends = self._ends
+            ends.append((ends[-1] if ends else self._base) + dl)
             self._segs.append(data)
             self._len += dl
             return
@@ -8137,8 +8163,10 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             raise OutstandingReserveByteStreamBufferError('outstanding reserve')
 
         if dl >= self._chunk_size:
+            if isinstance(data, memoryview):
+                data = memoryview_to_bytes(data)  # noqa
             self._flush_active()
-            self._segs.append(data)
+            self._append_seg(data, dl)
             self._len += dl
             return
 
@@ -8150,6 +8178,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         # Copy into fixed-capacity buffer; do not resize.
         memoryview(a)[self._active_used:self._active_used + dl] = data
         self._active_used += dl
+        self._ends[-1] += dl
         self._len += dl
 
     def prepend(self, data: BytesLike, /) -> None:
@@ -8166,20 +8195,25 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if self._head_off:
             s0 = self._segs[0]
             if s0 is self._active:
+                # The active chunk is always last, so here it is also the only segment.
                 if self._reserved_in_active:
                     raise OutstandingReserveByteStreamBufferError('outstanding reserve')
-                rl = self._active_readable_len()
-                if self._head_off < rl:
-                    self._segs[0] = memoryview_to_bytes(memoryview(self._active)[self._head_off:rl])
+                if self._head_off < self._active_used:
+                    self._segs[0] = memoryview_to_bytes(memoryview(s0)[self._head_off:self._active_used])
+                    self._base += self._head_off
+                    self._head_off = 0
                 else:
-                    self._segs.pop(0)
+                    self._popleft_seg()
                 self._active = None
                 self._active_used = 0
             else:
                 self._segs[0] = s0[self._head_off:]
-            self._head_off = 0
+                self._base += self._head_off
+                self._head_off = 0
 
-        self._segs.insert(0, data)
+        self._segs.appendleft(data)
+        self._ends.appendleft(self._base)
+        self._base -= dl
         self._len += dl
 
     def reserve(self, n: int, /) -> memoryview:
@@ -8233,6 +8267,7 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
             if n:
                 self._active_used += n
+                self._ends[-1] += n
                 self._len += n
 
             # Keep active for reuse.
@@ -8251,15 +8286,32 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
             return
 
         if n == len(b):
-            self._segs.append(b)
+            self._append_seg(b, n)
             self._len += n
         else:
             bb = memoryview_to_bytes(memoryview(b)[:n])
-            self._segs.append(bb)
+            self._append_seg(bb, n)
             self._len += n
 
     #
 
+    def _keep_consumed_active(self) -> bool:
+        """
+        Called when the first segment has just been fully consumed. If it is the active chunk and has spare capacity it
+        is kept, with the head offset past its used bytes, so further writes and reserves keep filling it rather than
+        allocating a new chunk. Consumed bytes are never overwritten, so views of them previously handed out stay valid.
+        It is always kept while a reservation is outstanding in it.
+        """
+
+        if self._segs[0] is not self._active or (
+                not self._reserved_in_active and
+                self._active_used >= self._chunk_size
+        ):
+            return False
+
+        self._head_off = self._active_used
+        return True
+
     def advance(self, n: int, /) -> None:
         if n < 0 or n > self._len:
             raise ValueError(n)
@@ -8268,35 +8320,20 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
 
         self._len -= n
 
-        while n and self._segs:
-            s0 = self._segs[0]
-
-            if s0 is self._active:
-                avail0 = self._active_readable_len() - self._head_off
-            else:
-                avail0 = len(s0) - self._head_off
-
-            if avail0 <= 0:
-                popped = self._segs.pop(0)
-                if popped is self._active:
-                    self._active = None
-                    self._active_used = 0
-                self._head_off = 0
-                continue
-
-            if n < avail0:
-                self._head_off += n
-                return
-
-            n -= avail0
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        # Pop every segment ending at or before the new head, then land the head offset in the one after.
+        a = self._base + self._head_off + n
+        segs = self._segs
+        ends = self._ends
+        while ends and ends[0] <= a:
+            if segs[0] is self._active:
+                if self._keep_consumed_active():
+                    return
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            self._base = ends.popleft()
 
-        if n:
-            raise RuntimeError(n)
+        self._head_off = a - self._base
 
     def split_to(self, n: int, /) -> ByteStreamBufferView:
         if n < 0 or n > self._len:
@@ -8304,40 +8341,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if not n:
             return _EMPTY_DIRECT_BYTE_STREAM_BUFFER_VIEW
 
-        out: ta.List[memoryview] = []
-        rem = n
+        self._len -= n
 
-        while rem:
-            if not self._segs:
-                raise RuntimeError(rem)
+        b0 = self._base
+        a = b0 + self._head_off
+        e = a + n
+        segs = self._segs
+        ends = self._ends
 
-            s0 = self._segs[0]
+        # Fast path: entirely within a first segment which is not exhausted.
+        if e < ends[0]:
+            self._head_off += n
+            return DirectByteStreamBufferView(memoryview(segs[0])[a - b0:e - b0])
 
-            if s0 is self._active:
-                rl = self._active_readable_len()
-                if self._head_off >= rl:
-                    raise RuntimeError(rem)
-                mv0 = memoryview(s0)[self._head_off:rl]
-            else:
-                mv0 = memoryview(s0)
-                if self._head_off:
-                    mv0 = mv0[self._head_off:]
-
-            if rem < len(mv0):
-                out.append(mv0[:rem])
-                self._head_off += rem
-                self._len -= n
-                return byte_stream_buffer_view_from_segments(out)
-
-            out.append(mv0)
-            rem -= len(mv0)
-            popped = self._segs.pop(0)
-            if popped is self._active:
+        out: ta.List[memoryview] = []
+        active = self._active
+        while ends and (se := ends[0]) <= e:
+            s = segs[0]
+            if a < se:
+                out.append(memoryview(s)[a - b0:se - b0])
+            a = se
+            if s is active:
+                self._base = b0
+                if self._keep_consumed_active():
+                    return byte_stream_buffer_view_from_segments(out)
                 self._active = None
                 self._active_used = 0
-            self._head_off = 0
+            segs.popleft()
+            b0 = ends.popleft()
+
+        self._base = b0
+        if a < e:
+            out.append(memoryview(segs[0])[:e - b0])
+        self._head_off = e - b0
 
-        self._len -= n
         return byte_stream_buffer_view_from_segments(out)
 
     def coalesce(self, n: int, /) -> memoryview:
@@ -8355,114 +8392,41 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if len(mv0) >= n:
             return mv0[:n]
 
-        out = bytearray(n)
-        w = 0
-
-        new_segs: ta.List[Bytes] = []
-
-        seg_i = 0
-        while w < n and seg_i < len(self._segs):
-            s = self._segs[seg_i]
-            off = self._head_off if not seg_i else 0
-
-            seg_len = len(s) - off
-            if s is self._active and seg_i == (len(self._segs) - 1):
-                seg_len = self._active_readable_len() - off
-
-            if seg_len <= 0:
-                seg_i += 1
-                continue
-
-            take = n - w
-            if take > seg_len:
-                take = seg_len
-
-            out[w:w + take] = memoryview(s)[off:off + take]
-            w += take
-
-            if take < seg_len:
-                rem = s[off + take:off + seg_len]
-                if rem:
-                    new_segs.append(rem)
-                seg_i += 1
-                break
-
-            seg_i += 1
-
-        if seg_i < len(self._segs):
-            new_segs.extend(self._segs[seg_i:])
+        # Copy the first n readable bytes into a single new segment replacing those they span, keeping what remains of
+        # the last of them as its own segment. The active chunk is always last, so only that one can be it.
+        segs = self._segs
+        ends = self._ends
+        b0 = self._base
+        a0 = a = b0 + self._head_off
+        e = a + n
+
+        parts: ta.List[Bytes] = []
+        while (se := ends[0]) < e:
+            parts.append(segs.popleft()[a - b0:se - b0])
+            ends.popleft()
+            a = b0 = se
+
+        s = segs[0]
+        parts.append(s[a - b0:e - b0])
+        out = b''.join(parts)
+
+        if e < se:
+            segs[0] = memoryview_to_bytes(memoryview(s)[e - b0:se - b0]) if s is self._active else s[e - b0:se - b0]
+        else:
+            segs.popleft()
+            ends.popleft()
+        if s is self._active:
+            self._active = None
+            self._active_used = 0
 
-        self._segs = [bytes(out), *new_segs]
+        segs.appendleft(out)
+        ends.appendleft(e)
+        self._base = a0
         self._head_off = 0
 
-        self._active = None
-        self._active_used = 0
-
-        return memoryview(self._segs[0])[:n]
-
-    def _seg_readable_slice(
-            self,
-            si: int,
-            s: Bytes,
-            last_i: int,
-    ) -> ta.Tuple[int, int]:
-        """
-        Compute the readable offset and length for segment at index si.
-
-        Returns (offset, readable_len) where:
-          - offset: byte offset into segment (head_off for si==0, else 0)
-          - readable_len: number of readable bytes from offset (0 if segment empty/consumed)
-
-        Handles head offset for first segment and active chunk readable length for last segment.
-        """
-
-        off = self._head_off if not si else 0
-        seg_len = len(s) - off
-        if s is self._active and si == last_i:
-            seg_len = self._active_readable_len() - off
-        return off, max(0, seg_len)
-
-    def _seg_search_range(
-            self,
-            start: int,
-            limit: int,
-            m: int,
-            seg_gs: int,
-            seg_ge: int,
-            seg_len: int,
-    ) -> ta.Optional[ta.Tuple[int, int]]:
-        """
-        Compute local search range within a segment.
-
-        Args:
-            start: global start position (user-provided)
-            limit: global limit (end - m, last valid position where match can start)
-            m: pattern length
-            seg_gs: segment global start position
-            seg_ge: segment global end position
-            seg_len: segment readable length
-
-        Returns (local_start, local_end) if segment overlaps search range, else None.
-          - local_start: offset within segment to start searching
-          - local_end: offset within segment to end searching (exclusive)
-        """
-
-        # Check if segment overlaps search range
-        if limit < seg_gs or start >= seg_ge:
-            return None
-
-        # Compute local start within segment
-        ls = max(0, start - seg_gs)
-
-        # Compute local end: can start match anywhere up to limit, need m bytes
-        max_start_in_seg = limit - seg_gs
-        end_search = min(max_start_in_seg + m, seg_len)
-
-        # Validate range
-        if ls >= end_search:
-            return None
+        return memoryview(out)
 
-        return ls, end_search
+    #
 
     def find(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -8473,57 +8437,42 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        tail: Bytes = b''
-        tail_gstart = 0
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-        gpos = 0
+        # Everything below is in absolute offsets: o is that of position 0, and a match must lie within [a, e).
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-        last_i = len(self._segs) - 1
+        i = self._seg_index(a)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
 
-        for si, s in enumerate(self._segs):
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
+            # Matches lying wholly within this segment.
+            hi = se if se < e else e
+            if hi - a >= m and (j := s.find(sub, a - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            seg_gs = gpos
-            seg_ge = gpos + seg_len
-
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.find(sub, off + ls, off + end_search)
-                if idx != -1:
-                    return seg_gs + (idx - off)
-
-            if m > 1 and tail:
-                head_need = m - 1
-                # Only read as many bytes as are actually available in this segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, seg_len)
-                if head_avail > 0:
-                    head = s[off:off + head_avail]
-                    comb = tail + head
-                    j = comb.find(sub)
-                    if j != -1 and j < len(tail) < j + m:
-                        cand = tail_gstart + j
-                        if start <= cand <= limit:
-                            return cand
+            if se >= e:
+                return -1
 
+            # Matches starting within this segment's last m - 1 bytes and running on into the following ones - only
+            # those bytes and the next m - 1 need be searched, and only if the former hold the first byte of sub.
             if m > 1:
-                take = m - 1
-                if seg_len >= take:
-                    tail = s[off + seg_len - take:off + seg_len]
-                    tail_gstart = seg_ge - take
-                else:
-                    tail = (tail + s[off:off + seg_len])[-(m - 1):]
-                    tail_gstart = seg_ge - len(tail)
-
-            gpos = seg_ge
+                t = se - m + 1
+                if t < a:
+                    t = a
+                if s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.find(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-        return -1
+            a = s0 = se
+            i += 1
 
     def rfind(self, sub: bytes, start: int = 0, end: ta.Optional[int] = None) -> int:
         start, end = self._norm_slice(start, end)
@@ -8534,89 +8483,40 @@ class SegmentedByteStreamBuffer(BaseByteStreamBufferLike, MutableByteStreamBuffe
         if end - start < m:
             return -1
 
-        limit = end - m
-
-        if not self._segs:
-            return -1
-
-        best = -1
-
-        seg_ge = self._len
-        prev_s: ta.Optional[Bytes] = None
-        prev_off = 0
-        prev_seg_len = 0
-
-        last_i = len(self._segs) - 1
-
-        for si in range(len(self._segs) - 1, -1, -1):
-            s = self._segs[si]
-            off, seg_len = self._seg_readable_slice(si, s, last_i)
-            if seg_len <= 0:
-                continue
-
-            seg_gs = seg_ge - seg_len
+        segs = self._segs
+        ends = self._ends
+        sub0 = sub[:1]
 
-            # Within-segment search
-            search_range = self._seg_search_range(start, limit, m, seg_gs, seg_ge, seg_len)
-            if search_range is not None:
-                ls, end_search = search_range
-                idx = s.rfind(sub, off + ls, off + end_search)
-                if idx != -1:
-                    cand = seg_gs + (idx - off)
-                    if cand > best:
-                        best = cand
+        o = self._base + self._head_off
+        a = o + start
+        e = o + end
 
-            if m > 1 and prev_s is not None:
-                tail_need = m - 1
-                if seg_len >= tail_need:
-                    tail = s[off + seg_len - tail_need:off + seg_len]
-                    tail_gstart = seg_ge - tail_need
-
-                else:
-                    tail_parts = [s[off:off + seg_len]]
-                    tail_len = seg_len
-                    for sj in range(si - 1, -1, -1):
-                        if tail_len >= tail_need:
-                            break
-
-                        sj_s = self._segs[sj]
-                        sj_off, sj_len = self._seg_readable_slice(sj, sj_s, last_i)
-                        if sj_len <= 0:
-                            continue
-
-                        take = min(tail_need - tail_len, sj_len)
-                        tail_parts.insert(0, sj_s[sj_off + sj_len - take:sj_off + sj_len])
-                        tail_len += take
-
-                    tail_combined = b''.join(tail_parts)
-                    tail = tail_combined[-(m - 1):] if len(tail_combined) >= m - 1 else tail_combined
-                    tail_gstart = seg_ge - len(tail)
-
-                head_need = m - 1
-                # Only read as many bytes as are actually available in prev segment to avoid reading uninitialized data
-                # from active chunks.
-                head_avail = min(head_need, prev_seg_len)
-                if head_avail > 0:
-                    head = prev_s[prev_off:prev_off + head_avail]
-                else:
-                    head = b''
+        i = self._seg_index(e - 1)
+        s0 = self._seg_start(i)
+        while True:
+            s = segs[i]
+            se = ends[i]
+            lo = a if a > s0 else s0
 
-                comb = tail + head
-                j = comb.rfind(sub)
-                if j != -1 and j < len(tail) < j + m:
-                    cand = tail_gstart + j
-                    if start <= cand <= limit and cand > best:
-                        best = cand
+            # Matches running on past this segment start later than any lying wholly within it, so are searched first.
+            if m > 1 and se < e:
+                t = se - m + 1
+                if t < lo:
+                    t = lo
+                if t < se and s.find(sub0, t - s0, se - s0) >= 0:
+                    win = s[t - s0:se - s0] + self._gather(i + 1, se, m - 1, e)
+                    if (j := win.rfind(sub, 0, se - t + m - 1)) >= 0:
+                        return t + j - o
 
-            if best >= seg_gs:
-                return best
+            hi = se if se < e else e
+            if hi - lo >= m and (j := s.rfind(sub, lo - s0, hi - s0)) >= 0:
+                return s0 + j - o
 
-            prev_s = s
-            prev_off = off
-            prev_seg_len = seg_len
-            seg_ge = seg_gs
+            if s0 <= a or not i:
+                return -1
 
-        return best
+            i -= 1
+            s0 = self._seg_start(i)
 
 
 ##
@@ -8829,6 +8729,220 @@ class JournalctlToAwsCursor:
         os.rename(ncf, cf)
 
 
+########################################
+# ../uploader.py
+"""
+TODO:
+ - re-sign posts retried for longer than signatures remain valid
+"""
+
+
+log = get_module_logger(globals())  # noqa
+
+
+##
+
+
+class AwsLogPostUploadError(Exception):
+    def __init__(self, status: ta.Optional[int], body: ta.Optional[bytes]) -> None:
+        super().__init__(status, body)
+
+        self.status = status
+        self.body = body
+
+
+class AwsLogPostUploader:
+    """
+    Uploads `AwsLogMessageBuilder.Post`s concurrently, with at most `max_in_flight` at once, each upload thread keeping
+    its own keepalive connection. Throttled and otherwise transiently failed posts are retried with jittered exponential
+    backoff.
+
+    Each post is submitted with an opaque token, and `poll` returns the tokens of completed posts strictly in submission
+    order - so a cursor handed in as a token is only committed once everything before it has landed, however the uploads
+    themselves complete.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_in_flight: int = 4,
+            timeout_s: float = 30.,
+            max_retries: ta.Optional[int] = 8,
+            backoff_base_s: float = .2,
+            backoff_max_s: float = 20.,
+    ) -> None:
+        super().__init__()
+
+        check.arg(max_in_flight > 0, 'max_in_flight must be positive')
+
+        self._max_in_flight = max_in_flight
+        self._timeout_s = timeout_s
+        self._max_retries = max_retries
+        self._backoff_base_s = backoff_base_s
+        self._backoff_max_s = backoff_max_s
+
+        self._executor = cf.ThreadPoolExecutor(max_in_flight, thread_name_prefix=type(self).__name__)
+        self._local = threading.local()
+        self._closed = threading.Event()
+
+        self._conns_lock = threading.Lock()
+        self._all_conns: ta.Set[http.client.HTTPConnection] = set()
+
+        self._pending: ta.Deque[ta.Tuple[cf.Future, ta.Any]] = collections.deque()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}@{id(self):x}<in_flight={len(self._pending)}>'
+
+    def __len__(self) -> int:
+        """The number of posts submitted and not yet returned by `poll`."""
+
+        return len(self._pending)
+
+    #
+
+    _RETRYABLE_ERROR_TYPES: ta.ClassVar[ta.AbstractSet[str]] = frozenset([
+        'ThrottlingException',
+        'ServiceUnavailableException',
+        'LimitExceededException',
+    ])
+
+    def _is_retryable(self, status: int, body: bytes) -> bool:
+        if status == 429 or status >= 500:
+            return True
+
+        try:
+            err_type = json.loads(body.decode('utf-8', 'replace')).get('__type', '')
+        except Exception:  # noqa
+            return False
+
+        # Error types may be namespaced, as `com.amazonaws.logs#ThrottlingException`.
+        return err_type.rpartition('#')[2] in self._RETRYABLE_ERROR_TYPES
+
+    def _get_conn(self, url: str) -> http.client.HTTPConnection:
+        conns: ta.Dict[ta.Tuple[str, str], http.client.HTTPConnection]
+        try:
+            conns = self._local.conns
+        except AttributeError:
+            conns = self._local.conns = {}
+
+        pu = urllib.parse.urlsplit(url)
+        k = (pu.scheme, pu.netloc)
+        if (conn := conns.get(k)) is None:
+            cls = http.client.HTTPSConnection if pu.scheme == 'https' else http.client.HTTPConnection
+            conn = conns[k] = cls(pu.netloc, timeout=self._timeout_s)
+            with self._conns_lock:
+                self._all_conns.add(conn)
+        return conn
+
+    def _drop_conn(self, url: str) -> None:
+        pu = urllib.parse.urlsplit(url)
+        if (conn := getattr(self._local, 'conns', {}).pop((pu.scheme, pu.netloc), None)) is not None:
+            with self._conns_lock:
+                self._all_conns.discard(conn)
+            conn.close()
+
+    def _request(self, post: AwsLogMessageBuilder.Post) -> ta.Tuple[int, bytes]:
+        conn = self._get_conn(post.url)
+        try:
+            conn.request(
+                'POST',
+                urllib.parse.urlsplit(post.url).path or '/',
+                body=post.data,
+                headers=dict(post.headers),
+            )
+            resp = conn.getresponse()
+            body = resp.read()
+
+        except BaseException:
+            self._drop_conn(post.url)
+            raise
+
+        if resp.will_close or self._closed.is_set():
+            self._drop_conn(post.url)
+
+        return resp.status, body
+
+    def _upload(self, post: AwsLogMessageBuilder.Post) -> AwsPutLogEventsResponse:
+        attempt = 0
+        while True:
+            status: ta.Optional[int] = None
+            body: ta.Optional[bytes] = None
+            try:
+                status, body = self._request(post)
+
+            except (OSError, http.client.HTTPException):
+                # Includes keepalive connections closed by the server in the meantime.
+                log.exception('Error uploading post: attempt %d', attempt)
+
+            else:
+                if 200 <= status < 300:
+                    return AwsPutLogEventsResponse.from_aws(json.loads(body.decode('utf-8') or '{}'))
+
+                if not self._is_retryable(status, body):
+                    raise AwsLogPostUploadError(status, body)
+
+                log.warning('Retryable upload failure: attempt %d: %d %r', attempt, status, body)
+
+            if (mr := self._max_retries) is not None and attempt >= mr:
+                raise AwsLogPostUploadError(status, body)
+
+            delay = min(self._backoff_max_s, self._backoff_base_s * (2 ** attempt)) * random.uniform(.5, 1.)
+            if self._closed.wait(delay):
+                raise AwsLogPostUploadError(status, body)
+
+            attempt += 1
+
+    #
+
+    def submit(
+            self,
+            post: AwsLogMessageBuilder.Post,
+            token: ta.Any = None,
+            *,
+            heartbeat: ta.Optional[ta.Callable[[], None]] = None,
+            heartbeat_interval_s: float = 1.,
+    ) -> None:
+        """Blocks while `max_in_flight` posts are uploading, calling `heartbeat` periodically."""
+
+        check.state(not self._closed.is_set())
+
+        while len(fs := [f for f, _ in self._pending if not f.done()]) >= self._max_in_flight:
+            if heartbeat is not None:
+                heartbeat()
+            cf.wait(fs, timeout=heartbeat_interval_s, return_when=cf.FIRST_COMPLETED)
+
+        self._pending.append((self._executor.submit(self._upload, post), token))
+
+    def poll(self) -> ta.List[ta.Any]:
+        """
+        Returns the tokens of the posts completed since the last call, up to the first not yet completed. Raises the
+        error of the first which failed.
+        """
+
+        out: ta.List[ta.Any] = []
+        while self._pending and (f := self._pending[0][0]).done():
+            resp = f.result()
+            log.debug('%r', resp)
+
+            out.append(self._pending.popleft()[1])
+
+        return out
+
+    def close(self, *, wait: bool = True) -> None:
+        """
+        Abandons retries, closes keepalive connections, and waits for uploads in progress if `wait` is set. Without
+        `wait`, uploads in progress close their connections themselves as they finish.
+        """
+
+        self._closed.set()
+        self._executor.shutdown(wait=wait)
+
+        with self._conns_lock:
+            conns, self._all_conns = self._all_conns, set()
+        for conn in conns:
+            conn.close()
+
+
 ########################################
 # ../../../../journald/messages.py
 
@@ -8842,18 +8956,43 @@ log = get_module_logger(globals())  # noqa
 @dc.dataclass(frozen=True)
 class JournalctlMessage:
     raw: Bytes
-    dct: ta.Optional[ta.Mapping[str, ta.Any]] = None
+    dct: ta.Optional[ta.Mapping[str, ta.Any]] = None  # None if not decoded, or undecodable
     cursor: ta.Optional[str] = None
     ts_us: ta.Optional[int] = None  # microseconds UTC
 
 
 class JournalctlMessageBuilder:
-    def __init__(self) -> None:
+    """
+    Splits journalctl's json output into messages, a read chunk at a time.
+
+    If `decode_dicts` is false the lines are not decoded, leaving `dct` None - their cursors and timestamps are instead
+    picked out of the raw bytes, falling back to decoding the line when that is not possible, as for escaped values.
+    Journalctl's output is flat, and quotes within values are always escaped, so a quoted field name followed by a
+    colon can only be a key.
+    """
+
+    def __init__(
+            self,
+            *,
+            decode_dicts: bool = True,
+    ) -> None:
         super().__init__()
 
+        self._decode_dicts = decode_dicts
+
         self._raw_buf = SegmentedByteStreamBuffer(chunk_size=0x4000)
         self._buf = ScanningByteStreamBuffer(self._raw_buf)
 
+        self._cursor_field_b = self._cursor_field.encode()
+        self._timestamp_fields_b = [f.encode() for f in self._timestamp_fields]
+
+        # Matches only unescaped string values - anything else is left to json.
+        self._scan_pat = re.compile(
+            rb'"(' +
+            b'|'.join(re.escape(f) for f in [self._cursor_field_b, *self._timestamp_fields_b]) +
+            rb')"\s*:\s*"([^"\\]*)"',
+        )
+
     _cursor_field = '__CURSOR'
 
     _timestamp_fields: ta.Sequence[str] = [
@@ -8861,22 +9000,28 @@ class JournalctlMessageBuilder:
         '__REALTIME_TIMESTAMP',
     ]
 
+    def _parse_timestamp(self, tsv: ta.Any) -> ta.Optional[int]:
+        if isinstance(tsv, str):
+            try:
+                return int(tsv)
+            except ValueError:
+                try:
+                    return int(float(tsv))
+                except ValueError:
+                    log.exception('Failed to parse timestamp: %r', tsv)
+
+        elif isinstance(tsv, (int, float)):
+            return int(tsv)
+
+        return None
+
     def _get_message_timestamp(self, dct: ta.Mapping[str, ta.Any]) -> ta.Optional[int]:
         for fld in self._timestamp_fields:
             if (tsv := dct.get(fld)) is None:
                 continue
 
-            if isinstance(tsv, str):
-                try:
-                    return int(tsv)
-                except ValueError:
-                    try:
-                        return int(float(tsv))
-                    except ValueError:
-                        log.exception('Failed to parse timestamp: %r', tsv)
-
-            elif isinstance(tsv, (int, float)):
-                return int(tsv)
+            if (ts := self._parse_timestamp(tsv)) is not None:
+                return ts
 
         log.error('Invalid timestamp: %r', dct)
         return None
@@ -8902,12 +9047,48 @@ class JournalctlMessageBuilder:
             ts_us=ts,
         )
 
+    def _scan_message(self, raw: Bytes) -> JournalctlMessage:
+        found = dict(self._scan_pat.findall(raw))
+
+        cursor: ta.Optional[str] = None
+        if (cv := found.get(self._cursor_field_b)) is not None:
+            cursor = cv.decode('utf-8', 'replace')
+        elif b'"' + self._cursor_field_b + b'"' in raw:
+            return dc.replace(self._make_message(raw), dct=None)
+
+        ts: ta.Optional[int] = None
+        for fld in self._timestamp_fields_b:
+            if (tsv := found.get(fld)) is None:
+                continue
+            if (ts := self._parse_timestamp(tsv.decode('utf-8', 'replace'))) is not None:
+                break
+        else:
+            return dc.replace(self._make_message(raw), dct=None)
+
+        return JournalctlMessage(
+            raw=raw,
+            cursor=cursor,
+            ts_us=ts,
+        )
+
     def feed(self, data: Bytes) -> ta.Sequence[JournalctlMessage]:
-        ret: ta.List[JournalctlMessage] = []
-        self._buf.write(data)
-        for line in ByteStreamBuffers.split(self._buf, b'\n', final=not data):
-            ret.append(self._make_message(line.tobytes()))
-        return ret
+        buf = self._buf
+        buf.write(data)
+
+        # Whole lines are taken out of the buffer at once and only then split, along with what remains of a final read.
+        if not data:
+            n = len(buf)
+        else:
+            n = buf.rfind(b'\n') + 1
+        if not n:
+            return []
+
+        lines = buf.split_to(n).tobytes().splitlines(keepends=True)
+
+        if self._decode_dicts:
+            return [self._make_message(line) for line in lines]
+        else:
+            return [self._scan_message(line) for line in lines]
 
 
 ########################################
@@ -9102,10 +9283,6 @@ class ThreadWorkerGroup:
 
 ########################################
 # ../poster.py
-"""
-TODO:
- - retries
-"""
 
 
 log = get_module_logger(globals())  # noqa
@@ -9124,6 +9301,7 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
             ensure_locked: ta.Optional[ta.Callable[[], None]] = None,
             dry_run: bool = False,
             queue_timeout_s: float = 1.,
+            uploader: ta.Optional[AwsLogPostUploader] = None,
             **kwargs: ta.Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -9134,16 +9312,44 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
         self._ensure_locked = ensure_locked
         self._dry_run = dry_run
         self._queue_timeout_s = queue_timeout_s
+
+        if uploader is None:
+            uploader = AwsLogPostUploader()
+        self._uploader = uploader
+
     #
 
+    def _message_text(self, m: JournalctlMessage) -> str:
+        # Undecoded messages are sent as journalctl wrote them rather than re-encoded.
+        if m.dct is None:
+            return m.raw.decode('utf-8', 'replace').rstrip('\n')
+
+        return json.dumps(m.dct, sort_keys=True)
+
+    def _commit_uploaded(self) -> None:
+        cur_cursor: ta.Optional[str] = None
+        for c in self._uploader.poll():
+            if c is not None:
+                cur_cursor = c
+
+        if cur_cursor is not None:
+            self._cursor.set(cur_cursor)
+
     def _run(self) -> None:
         if self._ensure_locked is not None:
             self._ensure_locked()
 
-        last_cursor: ta.Optional[str] = None  # noqa
+        try:
+            self._run_loop()
+        finally:
+            self._uploader.close(wait=False)
+
+    def _run_loop(self) -> None:
         while True:
             self._heartbeat()
 
+            self._commit_uploaded()
+
             try:
                 msgs: ta.Sequence[JournalctlMessage] = self._queue.get(timeout=self._queue_timeout_s)
             except queue.Empty:
@@ -9164,26 +9370,31 @@ class JournalctlToAwsPosterWorker(ThreadWorker):
             feed_msgs = []
             for m in msgs:
                 feed_msgs.append(AwsLogMessageBuilder.Message(
-                    message=json.dumps(m.dct, sort_keys=True),
+                    message=self._message_text(m),
                     ts_ms=int((m.ts_us / 1000.) if m.ts_us is not None else (time.time() * 1000.)),
                 ))
 
-            for post in self._builder.feed(feed_msgs):
-                log.debug('%r', post)
+            posts = self._builder.feed(feed_msgs)
+
+            if self._dry_run:
+                for post in posts:
+                    log.debug('%r', post)
+
+                if cur_cursor is not None:
+                    self._cursor.set(cur_cursor)
 
-                if not self._dry_run:
-                    with urllib.request.urlopen(urllib.request.Request(  # noqa
-                            post.url,
-                            method='POST',
-                            headers=dict(post.headers),
-                            data=post.data,
-                    )) as resp:
-                        response = AwsPutLogEventsResponse.from_aws(json.loads(resp.read().decode('utf-8')))
-                    log.debug('%r', response)
+                continue
+
+            # Posts may complete out of order, so the batch's cursor rides on its last post and is only committed once
+            # it and all before it have been uploaded.
+            for i, post in enumerate(posts):
+                log.debug('%r', post)
 
-            if cur_cursor is not None:
-                self._cursor.set(cur_cursor)
-                last_cursor = cur_cursor  # noqa
+                self._uploader.submit(
+                    post,
+                    cur_cursor if i == len(posts) - 1 else None,
+                    heartbeat=self._heartbeat,
+                )
 
 
 ########################################
@@ -9612,6 +9823,8 @@ class JournalctlTailerWorker(ThreadWorker):
             read_size: int = 0x4000,
             sleep_s: float = 1.,
 
+            builder: ta.Optional[JournalctlMessageBuilder] = None,
+
             **kwargs: ta.Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -9627,7 +9840,9 @@ class JournalctlTailerWorker(ThreadWorker):
         self._read_size = read_size
         self._sleep_s = sleep_s
 
-        self._builder = JournalctlMessageBuilder()
+        if builder is None:
+            builder = JournalctlMessageBuilder()
+        self._builder = builder
 
         self._proc: ta.Optional[subprocess.Popen] = None
 
@@ -9764,6 +9979,9 @@ class JournalctlToAwsDriver(ExitStacked):
 
         aws_dry_run: bool = False
 
+        # The most PutLogEvents requests uploading at once.
+        aws_max_in_flight: int = 4
+
         #
 
         journalctl_cmd: ta.Optional[ta.Sequence[str]] = None
@@ -9771,6 +9989,9 @@ class JournalctlToAwsDriver(ExitStacked):
         journalctl_after_cursor: ta.Optional[str] = None
         journalctl_since: ta.Optional[str] = None
 
+        # Posts messages as journalctl output them, rather than decoded and re-encoded with sorted keys.
+        journalctl_raw_messages: bool = True
+
     def __init__(self, config: Config) -> None:
         super().__init__()
 
@@ -9860,6 +10081,8 @@ class JournalctlToAwsDriver(ExitStacked):
             cmd=self._config.journalctl_cmd,
             shell_wrap=is_debugger_attached(),
 
+            builder=JournalctlMessageBuilder(decode_dicts=not self._config.journalctl_raw_messages),
+
             worker_groups=[self._worker_group()],
         )
 
@@ -9874,6 +10097,7 @@ class JournalctlToAwsDriver(ExitStacked):
 
             ensure_locked=self._ensure_locked,
             dry_run=self._config.aws_dry_run,
+            uploader=AwsLogPostUploader(max_in_flight=self._config.aws_max_in_flight),
 
             worker_groups=[self._worker_group()],
         )
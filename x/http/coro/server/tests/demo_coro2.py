@@ -4,6 +4,7 @@ import typing as ta
 from omcore.http.simple.handlers import SimpleHttpHandlerRequest
 from omcore.http.simple.handlers import SimpleHttpHandlerResponse
 from omcore.http.simple.handlers import SimpleHttpHandlerResponseStreamedData
+from omcore.io.fdio.epoll import EpollFdioPoller  # noqa
 from omcore.io.fdio.handlers import ServerSocketFdioHandler
 from omcore.io.fdio.kqueue import KqueueFdioPoller  # noqa
 from omcore.io.fdio.manager import FdioManager
@@ -56,6 +57,7 @@ def say_hi_handler(req: SimpleHttpHandlerRequest) -> SimpleHttpHandlerResponse:
 
 def _main() -> None:
     poller: FdioPoller = next(filter(None, [
+        EpollFdioPoller,
         KqueueFdioPoller,
         PollFdioPoller,
         SelectFdioPoller,
@@ -3,6 +3,7 @@ import contextlib
 import dataclasses as dc
 import typing as ta
 
+from omcore.io.fdio.epoll import EpollFdioPoller  # noqa
 from omcore.io.fdio.kqueue import KqueueFdioPoller  # noqa
 from omcore.io.fdio.pollers import FdioPoller
 from omcore.io.fdio.pollers import PollFdioPoller  # noqa
@@ -122,6 +123,7 @@ def bind_server(
     #
 
     poller_impl = next(filter(None, [
+        EpollFdioPoller,
         KqueueFdioPoller,
         PollFdioPoller,
         SelectFdioPoller,